@@ -9,25 +9,18 @@ DATA_FILE=~/Desktop/apples-to-apples/src/data.js
 echo "📊 Adding 73 new regions to Apples to Apples..."
 echo ""
 
-# Step 1: Insert new region data before the closing backtick of RAW
-# Find the line with `.trim();` and insert new data before it
+# Step 1: Merge the new regions into RAW (padded to the current field
+# layout; regions already there are updated, not duplicated)
+python3 "$SCRIPT_DIR/../pipeline/ingest.py" --data-file "$DATA_FILE" "$SCRIPT_DIR/new_regions.txt"
+
 python3 -c "
 import os
 
 data_file = os.path.expanduser('~/Desktop/apples-to-apples/src/data.js')
-new_regions_file = os.path.join('$SCRIPT_DIR', 'new_regions.txt')
 
 with open(data_file, 'r') as f:
     content = f.read()
 
-with open(new_regions_file, 'r') as f:
-    new_data = f.read().strip()
-
-# Insert before the closing backtick+.trim()
-old = '\`.trim();'
-new_insert = new_data + '\n\`.trim();'
-content = content.replace(old, new_insert)
-
 # Update SHOWCASE_GROUPS to include new regions
 old_showcase = '''export const SHOWCASE_GROUPS = [
   { title: 'Industrial Powerhouses', subtitle: 'Manufacturing giants', ids: ['de-by', 'cn-zj', 'us-tx'] },
@@ -6,7 +6,10 @@ This enables IndicatorBar to show a superscript year tag next to each indicator
 Usage: python3 add_indicator_years.py
 Then: npm run build
 """
-import os, re
+import os, sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pipeline'))
+from datajs import DataJsDocument
 
 DATA_FILE = os.path.expanduser('~/Desktop/apples-to-apples/src/data.js')
 
@@ -46,34 +49,27 @@ INDICATOR_YEARS = {
     'deathRate': '2022',
 }
 
-with open(DATA_FILE, 'r') as f:
-    content = f.read()
+def add_indicator_years(doc):
+    """Put year: '...' first in each dated INDICATORS entry (updating it if
+    already there); returns how many entries changed."""
+    changes = 0
+    for key, year in INDICATOR_YEARS.items():
+        if year is None or key not in doc.indicators:
+            continue
+        if doc.indicators[key].set('year', year, first=True):
+            changes += 1
+    return changes
 
-# For each indicator, add year property after the existing properties
-# Pattern: indicatorKey: { label: '...', ... },
-changes = 0
-for key, year in INDICATOR_YEARS.items():
-    if year is None:
-        continue
-    
-    # Find the indicator definition line and add year property
-    # Match pattern like: key: { label: '...', ... format: v => ... },
-    # We'll insert year: '2022', right after the opening {
-    pattern = rf"(\s+{key}:\s*\{{)"
-    replacement = rf"\1 year: '{year}',"
-    
-    new_content = re.sub(pattern, replacement, content, count=1)
-    if new_content != content:
-        changes += 1
-        content = new_content
 
-with open(DATA_FILE, 'w') as f:
-    f.write(content)
+if __name__ == '__main__':
+    doc = DataJsDocument.load(DATA_FILE)
+    changes = add_indicator_years(doc)
+    doc.save(DATA_FILE)
 
-print(f"✅ Added year tags to {changes} indicators in data.js")
-print(f"   Indicators with year: {sum(1 for v in INDICATOR_YEARS.values() if v)}")
-print(f"   Indicators without year (mixed sources): {sum(1 for v in INDICATOR_YEARS.values() if not v)}")
-print()
-print("Next steps:")
-print("1. Copy updated IndicatorBar.jsx to src/components/")
-print("2. Run: npm run build")
+    print(f"✅ Added year tags to {changes} indicators in data.js")
+    print(f"   Indicators with year: {sum(1 for v in INDICATOR_YEARS.values() if v)}")
+    print(f"   Indicators without year (mixed sources): {sum(1 for v in INDICATOR_YEARS.values() if not v)}")
+    print()
+    print("Next steps:")
+    print("1. Copy updated IndicatorBar.jsx to src/components/")
+    print("2. Run: npm run build")
@@ -28,21 +28,16 @@ if [ "$SAMPLE_FIELDS" -eq 27 ]; then
     exit 1
 fi
 
-# Insert city data before closing backtick
+# Merge the cities into RAW (cities already there are updated, not duplicated)
+python3 "$SCRIPT_DIR/../pipeline/ingest.py" --data-file "$DATA_FILE" "$SCRIPT_DIR/all_cn_cities.txt"
+
 python3 -c "
 import os
 data_file = os.path.expanduser('~/Desktop/apples-to-apples/src/data.js')
-cities_file = os.path.join('$SCRIPT_DIR', 'all_cn_cities.txt')
 
 with open(data_file, 'r') as f:
     content = f.read()
 
-with open(cities_file, 'r') as f:
-    cities = f.read().strip()
-
-# Insert before closing backtick
-content = content.replace('\`.trim();', cities + '\n\`.trim();')
-
 # Update region count comment
 import re
 content = re.sub(r'// \d+ regions', '// 520+ regions', content, count=1)
@@ -63,7 +58,7 @@ if 'China Deep Dive' not in content:
 with open(data_file, 'w') as f:
     f.write(content)
 
-print(f'  ✅ Added {len(cities.splitlines())} Chinese cities')
+print('  ✅ Showcase groups updated')
 "
 
 echo ""
@@ -3,10 +3,14 @@
 Apples to Apples - Major Data Expansion
 Adds 8 new indicators + 59 new regions
 """
-import os, re, random
+import os, sys
 
-DATA_FILE = os.path.expanduser('~/Desktop/apples-to-apples/src/data.js')
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, '..', 'pipeline'))
+from datajs import DataJsDocument
+from ingest import ingest, print_report
+
+DATA_FILE = os.path.expanduser('~/Desktop/apples-to-apples/src/data.js')
 
 # New indicator estimates for existing regions (unemployment%, inflation%, R&D%GDP, military%GDP, popDensity, medianAge, birthRate/1000, deathRate/1000)
 # Based on World Bank/UN 2023 data from training knowledge
@@ -241,56 +245,31 @@ EXISTING_EXTRA = {
 print("📊 Apples to Apples - Major Data Expansion")
 print("=" * 50)
 
-with open(DATA_FILE, 'r') as f:
-    content = f.read()
+doc = DataJsDocument.load(DATA_FILE)
 
 # Step 1: Add 8 new fields to every existing data line
 print("\n1️⃣  Adding 8 new indicators to all existing regions...")
 
-lines = content.split('\n')
-new_lines = []
 modified_count = 0
+for row in doc.rows:
+    if len(row.fields) == 27:
+        # Unknown regions get empty fields
+        row.text = row.text.rstrip() + ',' + EXISTING_EXTRA.get(row.id, ',,,,,,,')
+        modified_count += 1
 
-for line in lines:
-    # Check if this is a data line (inside the RAW template literal)
-    # Data lines start with a region id like 'us,' or 'cn-bj,'
-    stripped = line.strip()
-    if stripped and not stripped.startswith('//') and not stripped.startswith('const') and not stripped.startswith('`') and ',' in stripped:
-        # Try to extract the id
-        parts = stripped.split(',')
-        if len(parts) == 27:
-            region_id = parts[0]
-            if region_id in EXISTING_EXTRA:
-                line = line.rstrip() + ',' + EXISTING_EXTRA[region_id]
-                modified_count += 1
-            else:
-                # Unknown region - add reasonable defaults
-                line = line.rstrip() + ',,,,,,,,'
-                modified_count += 1
-    new_lines.append(line)
-
-content = '\n'.join(new_lines)
 print(f"   Modified {modified_count} existing regions")
 
-# Step 2: Add new regions before closing backtick
-print("\n2️⃣  Adding 59 new regions...")
-new_regions_file = os.path.join(SCRIPT_DIR, 'new_regions_v2.txt')
-with open(new_regions_file, 'r') as f:
-    new_data = f.read().strip()
-
-content = content.replace('`.trim();', new_data + '\n`.trim();')
-
-# Step 3: Update the field comment
-print("\n3️⃣  Updating field documentation...")
-content = content.replace(
+# Step 2: Update the field comment
+print("\n2️⃣  Updating field documentation...")
+doc.replace(
     '// Field order: id,name,type,parent,flag,pop(M),gdp(B$),gdpPC,area(k),urban%,gini,hdi,net%,lifeExp,co2PC,unis,lit%,pisa,docs,beds,health%,mfg%,exp(B),fdi(B),forest%,pm25,renew%',
     '// Field order: id,name,type,parent,flag,pop(M),gdp(B$),gdpPC,area(k),urban%,gini,hdi,net%,lifeExp,co2PC,unis,lit%,pisa,docs,beds,health%,mfg%,exp(B),fdi(B),forest%,pm25,renew%,unemp%,inflate%,rd%,mil%,popDens,medAge,birthR,deathR'
 )
-content = content.replace('// 320+ regions, 22 indicators', '// 380+ regions, 30 indicators')
-content = content.replace('// 250+ regions, 18 indicators', '// 380+ regions, 30 indicators')
+doc.replace('// 320+ regions, 22 indicators', '// 380+ regions, 30 indicators')
+doc.replace('// 250+ regions, 18 indicators', '// 380+ regions, 30 indicators')
 
-# Step 4: Update the parser to handle 35 fields
-print("\n4️⃣  Updating data parser...")
+# Step 3: Update the parser to handle 35 fields
+print("\n3️⃣  Updating data parser...")
 old_parser = """    const [id,name,type,parent,flag,pop,gdp,gdpPC,area,urban,gini,hdi,net,life,co2,uni,lit,pisa,doc,bed,health,mfg,exp,fdi,forest,pm25,renew] = line.split(',');
     return {
       id, name, type, parent: parent || null, flag,
@@ -353,13 +332,17 @@ new_parser = """    const [id,name,type,parent,flag,pop,gdp,gdpPC,area,urban,gin
       deathRate: parseFloat(deathR) || null,
     };"""
 
-content = content.replace(old_parser, new_parser)
+doc.replace(old_parser, new_parser)
+
+# Step 4: Add new regions (after the parser, so rows are checked against the
+# 35-field layout; re-running updates them instead of appending duplicates)
+print("\n4️⃣  Adding 59 new regions...")
+merger, report = ingest(doc, [os.path.join(SCRIPT_DIR, 'new_regions_v2.txt')])
+print_report(merger, report)
 
 # Step 5: Add new indicators to INDICATORS object
 print("\n5️⃣  Adding new indicator definitions...")
-old_renew_line = "  renewableEnergy: { label: 'Renewable %', unit: '%', color: '#059669', format: v => v ? v.toFixed(0)+'%' : 'N/A', category: 'environment' },"
-new_indicators = """  renewableEnergy: { label: 'Renewable %', unit: '%', color: '#059669', format: v => v ? v.toFixed(0)+'%' : 'N/A', category: 'environment' },
-  unemployment: { label: 'Unemployment %', unit: '%', color: '#dc2626', format: v => v ? v.toFixed(1)+'%' : 'N/A', category: 'economic' },
+new_indicators = """  unemployment: { label: 'Unemployment %', unit: '%', color: '#dc2626', format: v => v ? v.toFixed(1)+'%' : 'N/A', category: 'economic' },
   inflation: { label: 'Inflation %', unit: '%', color: '#b91c1c', format: v => v ? v.toFixed(1)+'%' : 'N/A', category: 'economic' },
   rdExpenditure: { label: 'R&D % GDP', unit: '%', color: '#7c3aed', format: v => v ? v.toFixed(1)+'%' : 'N/A', category: 'economic' },
   militarySpending: { label: 'Military % GDP', unit: '%', color: '#374151', format: v => v ? v.toFixed(1)+'%' : 'N/A', category: 'economic' },
@@ -368,34 +351,21 @@ new_indicators = """  renewableEnergy: { label: 'Renewable %', unit: '%', color:
   birthRate: { label: 'Birth Rate', unit: '‰', color: '#2563eb', format: v => v ? v.toFixed(1)+'‰' : 'N/A', category: 'demographic' },
   deathRate: { label: 'Death Rate', unit: '‰', color: '#475569', format: v => v ? v.toFixed(1)+'‰' : 'N/A', category: 'demographic' },"""
 
-content = content.replace(old_renew_line, new_indicators)
+after = 'renewableEnergy'
+for line in new_indicators.split('\n'):
+    after = doc.indicators.add_line(line, after=after).key
 
 # Step 6: Update INDICATOR_CATEGORIES
 print("\n6️⃣  Updating indicator categories...")
-old_categories = """export const INDICATOR_CATEGORIES = {
-  basic: { label: '📊 Basic', keys: ['population', 'gdp', 'gdpPerCapita', 'area', 'urbanization', 'hdi', 'internetPenetration'] },
-  economic: { label: '💰 Economic', keys: ['gdp', 'gdpPerCapita', 'gini', 'manufacturingPct', 'exports', 'fdiInflow'] },
-  education: { label: '🎓 Education', keys: ['universityCount', 'literacyRate', 'pisaScore'] },
-  health: { label: '🏥 Healthcare', keys: ['lifeExpectancy', 'doctorsPer1000', 'hospitalBeds', 'healthExpenditure'] },
-  environment: { label: '🌿 Environment', keys: ['co2PerCapita', 'forestCoverage', 'airQualityPM25', 'renewableEnergy'] },
-};"""
-
-new_categories = """export const INDICATOR_CATEGORIES = {
-  basic: { label: '📊 Basic', keys: ['population', 'gdp', 'gdpPerCapita', 'area', 'urbanization', 'hdi', 'internetPenetration', 'populationDensity'] },
-  economic: { label: '💰 Economic', keys: ['gdp', 'gdpPerCapita', 'gini', 'manufacturingPct', 'exports', 'fdiInflow', 'unemployment', 'inflation', 'rdExpenditure', 'militarySpending'] },
-  education: { label: '🎓 Education', keys: ['universityCount', 'literacyRate', 'pisaScore'] },
-  health: { label: '🏥 Healthcare', keys: ['lifeExpectancy', 'doctorsPer1000', 'hospitalBeds', 'healthExpenditure'] },
-  environment: { label: '🌿 Environment', keys: ['co2PerCapita', 'forestCoverage', 'airQualityPM25', 'renewableEnergy'] },
-  demographic: { label: '👥 Demographics', keys: ['populationDensity', 'medianAge', 'birthRate', 'deathRate', 'urbanization'] },
-};"""
-
-content = content.replace(old_categories, new_categories)
+doc.categories['basic'].set('keys', ['population', 'gdp', 'gdpPerCapita', 'area', 'urbanization', 'hdi', 'internetPenetration', 'populationDensity'])
+doc.categories['economic'].set('keys', ['gdp', 'gdpPerCapita', 'gini', 'manufacturingPct', 'exports', 'fdiInflow', 'unemployment', 'inflation', 'rdExpenditure', 'militarySpending'])
+doc.categories.add_line("  demographic: { label: '👥 Demographics', keys: ['populationDensity', 'medianAge', 'birthRate', 'deathRate', 'urbanization'] },")
 
 # Step 7: Update MATCH_PRESETS comprehensive weights
 print("\n7️⃣  Updating match presets...")
 old_comp = "  comprehensive: { label: '📊 All', weights: { population: 0.08, gdp: 0.08, gdpPerCapita: 0.1, area: 0.05, urbanization: 0.06, hdi: 0.1, lifeExpectancy: 0.08, universityCount: 0.05, doctorsPer1000: 0.05, manufacturingPct: 0.05, forestCoverage: 0.05, renewableEnergy: 0.05, literacyRate: 0.05, internetPenetration: 0.05, co2PerCapita: 0.05, gini: 0.05 } },"
 new_comp = "  comprehensive: { label: '📊 All', weights: { population: 0.06, gdp: 0.06, gdpPerCapita: 0.08, area: 0.04, urbanization: 0.04, hdi: 0.08, lifeExpectancy: 0.06, universityCount: 0.04, doctorsPer1000: 0.04, manufacturingPct: 0.04, forestCoverage: 0.04, renewableEnergy: 0.04, literacyRate: 0.04, internetPenetration: 0.04, co2PerCapita: 0.04, gini: 0.04, unemployment: 0.04, medianAge: 0.04, rdExpenditure: 0.04, populationDensity: 0.04, birthRate: 0.02, deathRate: 0.02, inflation: 0.02, militarySpending: 0.02 } },"
-content = content.replace(old_comp, new_comp)
+doc.replace(old_comp, new_comp)
 
 # Step 8: Update SHOWCASE_GROUPS
 print("\n8️⃣  Updating showcase groups...")
@@ -427,7 +397,7 @@ new_showcase = """export const SHOWCASE_GROUPS = [
   { title: 'Healthcare Excellence', subtitle: 'Best outcomes', ids: ['jp', 'ch', 'kr', 'es'] },
 ];"""
 
-content = content.replace(old_showcase, new_showcase)
+doc.replace(old_showcase, new_showcase)
 
 # Step 9: Update region count in Compare.jsx nav
 print("\n9️⃣  Updating region count display...")
@@ -447,8 +417,7 @@ compare = compare.replace(
 with open(compare_file, 'w') as f:
     f.write(compare)
 
-with open(DATA_FILE, 'w') as f:
-    f.write(content)
+doc.save(DATA_FILE)
 
 print("\n" + "=" * 50)
 print("✅ Expansion complete!")
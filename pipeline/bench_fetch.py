@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Apples to Apples — fetch-path benchmark
+
+Runs fetch_all_indicators against the offline replay server (wb_replay.py)
+sequentially and with each requested worker count, and reports wall time,
+request count and bytes. Every concurrent run is checked against the
+sequential result, so a regression in ordering or merging shows up as a
+MISMATCH rather than just a number.
+
+Usage:
+  python3 bench_fetch.py                             # workers 1 vs 4,8
+  python3 bench_fetch.py --workers 2,4,8,16 --latency 150 --jitter 50
+  python3 bench_fetch.py --page-size 100 --all-countries   # many pages per indicator
+  python3 bench_fetch.py --error-rate 0.05           # exercise retries
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+
+import fetch_data
+from wb_replay import FIXTURE_DIR, ReplayServer, load_fixtures, synth_fixtures
+
+
+def run_fetch(windows, workers, countries):
+    """One timed fetch with a fresh session; returns (seconds, data, session)."""
+    fetch_data.SESSION = fetch_data.WBSession(base_url=fetch_data.SESSION.base_url,
+                                              backoff_base=0.05, limiter=fetch_data.RATE_LIMITER)
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = fetch_data.fetch_all_indicators(windows, workers, countries)
+    elapsed = time.perf_counter() - started
+    fetch_data.SESSION.close()
+    return elapsed, data, fetch_data.SESSION
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the World Bank fetch path")
+    parser.add_argument("--fixtures", type=str, default=FIXTURE_DIR)
+    parser.add_argument("--api-base", type=str, default=None,
+                        help="Benchmark an already running server instead")
+    parser.add_argument("--workers", type=str, default="4,8",
+                        help="Comma-separated worker counts to compare with sequential")
+    parser.add_argument("--year", type=int, default=2022)
+    parser.add_argument("--fallback", type=int, default=2)
+    parser.add_argument("--all-countries", action="store_true")
+    parser.add_argument("--rate", type=float, default=200.0,
+                        help="Token-bucket rate for the benchmark (req/s)")
+    parser.add_argument("--latency", type=float, default=80, help="Replay latency (ms)")
+    parser.add_argument("--jitter", type=float, default=20, help="Replay jitter (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--page-size", type=int, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="wb_bench_") as workdir:
+        benchmark(args, workdir)
+
+
+def benchmark(args, workdir):
+    """Run the comparison with checkpoints and synthesized fixtures under
+    workdir (removed by the caller)."""
+    fetch_data.CHECKPOINT_DIR = os.path.join(workdir, "checkpoint")
+    fetch_data.RATE_LIMITER.rate = args.rate
+
+    server = None
+    if args.api_base:
+        fetch_data.SESSION.base_url = args.api_base.rstrip("/")
+    else:
+        fixtures = load_fixtures(args.fixtures)
+        if not fixtures:
+            print(f"  ℹ️  No fixtures in {args.fixtures}, synthesizing from cache...")
+            with contextlib.redirect_stdout(io.StringIO()):
+                synth_fixtures(os.path.join(workdir, "fixtures"))
+            fixtures = load_fixtures(os.path.join(workdir, "fixtures"))
+        server = ReplayServer(fixtures, latency_ms=args.latency, jitter_ms=args.jitter,
+                              error_rate=args.error_rate, page_size=args.page_size)
+        fetch_data.SESSION.base_url = server.start()
+
+    try:
+        countries = None if args.all_countries else fetch_data.target_iso3()
+        windows = {name: (args.year - args.fallback, args.year + args.fallback)
+                   for name in fetch_data.WB_FIELD_MAP}
+        worker_counts = [1] + [int(w) for w in args.workers.split(",") if int(w) > 1]
+
+        print(f"⏱️  Fetch benchmark: {len(windows)} indicators, "
+              f"{'country/all' if countries is None else f'{len(countries)} countries'}, "
+              f"rate {args.rate:.0f}/s")
+        if server:
+            print(f"   replay latency {args.latency:.0f}±{args.jitter:.0f} ms, "
+                  f"error rate {args.error_rate:.0%}, page size {args.page_size or 'client'}")
+        print()
+        print(f"  {'workers':>7} | {'wall (s)':>8} | {'speedup':>7} | {'requests':>8} | "
+              f"{'retries':>7} | {'KB':>6} | result")
+        print(f"  {'-' * 7}-+-{'-' * 8}-+-{'-' * 7}-+-{'-' * 8}-+-{'-' * 7}-+-{'-' * 6}-+-{'-' * 8}")
+
+        baseline_time, baseline = None, None
+        for workers in worker_counts:
+            elapsed, data, session = run_fetch(windows, workers, countries)
+            encoded = json.dumps(data)
+            if baseline is None:
+                baseline_time, baseline = elapsed, encoded
+                verdict = "baseline"
+            else:
+                verdict = "identical" if encoded == baseline else "MISMATCH"
+            kb = sum(s[3] for s in session.stats) / 1024
+            print(f"  {workers:>7} | {elapsed:>8.2f} | {baseline_time / elapsed:>6.1f}x | "
+                  f"{len(session.stats):>8} | {session.retries:>7} | {kb:>6.0f} | {verdict}")
+    finally:
+        if server:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Apples to Apples — precompiled region artifact
+
+Runs the RAW block of src/data.js through the same field mapping as its
+parseData() and writes src/regions.js, which data.js imports to build
+REGIONS. The browser then hydrates already-scaled columns instead of
+splitting CSV lines and calling parseFloat ~35 times per region on every
+page load.
+
+Only countries go into src/regions.js (the core bundle). Subnational rows
+are split into one shard per parent country, src/shards/<parent>.js,
+which data.js's loadShards() imports on demand, so the initial bundle
+does not grow with every province, state and city added to RAW. A
+subnational id is always <parent>-<code> (checked here), so the shard of
+any region id is its prefix and the manifest needs no id → shard table.
+
+The field list and scale factors are read from parseData() itself, so
+RAW + parseData stay the single source of truth (expand.py and friends
+keep editing them as before). Nothing in the app references either, so
+neither reaches the production bundle (bundle_report.py checks). Every
+module embeds its rows as JSON.parse('...') of:
+
+  {"count": n,
+   "positions": [...],                         # row indices in RAW
+   "strings": {"id": [...], "name": [...], "type": [...],
+               "parent": [...], "flag": [...]},
+   "columns": {"population": [...], ...}}     # already scaled, null = missing
+
+so loaded shards can be merged back into RAW order. Shards export just
+that object (default export); the core module exports it as CORE, the
+single hydrateRegions() that turns any of them into region objects, and
+MANIFEST:
+
+  {"count": n, "types": {"country": n, ...},
+   "shards": {"<parent>": {"count": n, "bytes": n, "hash": "<sha256[:16]>"}}}
+
+Usage:
+  python3 build_regions.py                       # ../src/data.js → ../src/regions.js + ../src/shards/
+  python3 build_regions.py <data.js> <regions.js> [<shards dir>]
+  (also runs as npm's prebuild/predev step)
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+
+from datajs import DataJsDocument
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DATA_FILE = os.path.join(SCRIPT_DIR, "..", "src", "data.js")
+DEFAULT_OUT_FILE = os.path.join(SCRIPT_DIR, "..", "src", "regions.js")
+DEFAULT_SHARD_DIR = os.path.join(SCRIPT_DIR, "..", "src", "shards")
+
+STRING_FIELDS = ["id", "name", "type", "parent", "flag"]
+
+_DESTRUCTURE = re.compile(r"const \[([\w,]+)\] = line\.split\(','\);")
+_NUMERIC_PROP = re.compile(
+    r"^\s*(\w+): parseFloat\((\w+)\)(?: \* ([\d.e+-]+))? \|\| null,$", re.MULTILINE)
+_JS_FLOAT = re.compile(r"\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)")
+
+
+# ============================================================
+# PARSER SPEC
+# ============================================================
+
+def parser_spec(code):
+    """[(key, field index, scale or None)] for parseData's numeric props."""
+    m = _DESTRUCTURE.search(code)
+    if not m:
+        raise ValueError("parseData destructuring line not found in data.js")
+    names = m.group(1).split(",")
+    if names[:len(STRING_FIELDS)] != STRING_FIELDS:
+        raise ValueError(f"parseData fields start {names[:5]}, expected {STRING_FIELDS}")
+    index = {name: i for i, name in enumerate(names)}
+
+    spec = []
+    for key, var, scale in _NUMERIC_PROP.findall(code[m.end():]):
+        if var not in index:
+            raise ValueError(f"parseData uses unknown field {var!r} for {key}")
+        spec.append((key, index[var], float(scale) if scale else None))
+    if len(spec) != len(names) - len(STRING_FIELDS):
+        raise ValueError(f"parseData maps {len(spec)} numeric props for "
+                         f"{len(names) - len(STRING_FIELDS)} fields")
+    return spec
+
+
+def js_number(text, scale):
+    """`parseFloat(text) * scale || null` as the browser evaluates it."""
+    m = _JS_FLOAT.match(text)
+    if not m:
+        return None
+    value = float(m.group(1))
+    if scale is not None:
+        value *= scale
+    if value == 0 or math.isnan(value):
+        return None
+    return value
+
+
+# ============================================================
+# BUILD
+# ============================================================
+
+def build_columns(doc):
+    """Column-oriented REGIONS, identical to parseData(RAW) row by row."""
+    spec = parser_spec(doc.text())
+    raw = doc.rows.render().strip()
+    lines = [line for line in raw.split("\n") if line.strip()]
+
+    strings = {name: [] for name in STRING_FIELDS}
+    columns = {key: [] for key, _, _ in spec}
+    for line in lines:
+        fields = line.split(",")
+        for i, name in enumerate(STRING_FIELDS):
+            value = fields[i] if i < len(fields) else None
+            if name == "parent":
+                value = value or None
+            strings[name].append(value)
+        for key, idx, scale in spec:
+            columns[key].append(js_number(fields[idx], scale) if idx < len(fields) else None)
+
+    return {
+        "count": len(lines),
+        "strings": strings,
+        "columns": columns,
+    }
+
+
+def select_rows(artifact, positions):
+    """The artifact restricted to the given RAW rows (in that order)."""
+    return {
+        "count": len(positions),
+        "positions": positions,
+        "strings": {k: [col[i] for i in positions] for k, col in artifact["strings"].items()},
+        "columns": {k: [col[i] for i in positions] for k, col in artifact["columns"].items()},
+    }
+
+
+GENERATED = "// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.\n"
+
+
+def render_shard(part):
+    """A shard module: just the rows, as a JSON.parse('...') literal (parsed
+    much faster than an equivalent JS object literal)."""
+    return GENERATED + f"export default {js_json_literal(part)};\n"
+
+
+def render_core(part, manifest):
+    """regions.js: MANIFEST, the country rows as CORE, and hydrateRegions()
+    with every key spelled out, so each region is one fixed-shape object
+    literal whichever module its rows came from."""
+    props = [f"{name}: s.{name}[i]" for name in STRING_FIELDS]
+    props += [f"{key}: c.{key}[i]" for key in part["columns"]]
+    body = ",\n      ".join(props)
+    return (
+        GENERATED
+        + f"export const MANIFEST = {js_json_literal(manifest)};\n\n"
+        f"export const CORE = {js_json_literal(part)};\n\n"
+        "export function hydrateRegions({ count, strings: s, columns: c }) {\n"
+        "  const regions = new Array(count);\n"
+        "  for (let i = 0; i < count; i++) {\n"
+        "    regions[i] = {\n"
+        f"      {body},\n"
+        "    };\n"
+        "  }\n"
+        "  return regions;\n"
+        "}\n"
+    )
+
+
+def shard_of(region_id):
+    """The shard a region id belongs to: the part before its first '-'
+    (subnational ids are <parent>-<code>), or None for a country."""
+    return region_id.split("-", 1)[0] if "-" in region_id else None
+
+
+def render_bundle(artifact):
+    """{"core": regions.js source, "shards": {parent: shard source}, "manifest": {...}}.
+
+    Rows without a parent are the core; every other row goes to its
+    parent's shard. Raises ValueError if a row's id does not name its
+    shard, since data.js finds shards from the id alone."""
+    groups = {}
+    core = []
+    for i, (region_id, parent) in enumerate(zip(artifact["strings"]["id"],
+                                                artifact["strings"]["parent"])):
+        if shard_of(region_id) != parent:
+            raise ValueError(f"region {region_id!r} has parent {parent!r}: subnational ids "
+                             f"must start with '<parent>-', country ids must not contain '-'")
+        if parent is None:
+            core.append(i)
+        else:
+            groups.setdefault(parent, []).append(i)
+
+    shards = {parent: render_shard(select_rows(artifact, rows))
+              for parent, rows in sorted(groups.items())}
+    types = {}
+    for t in artifact["strings"]["type"]:
+        types[t] = types.get(t, 0) + 1
+    manifest = {
+        "count": artifact["count"],
+        "types": types,
+        "shards": {parent: {"count": len(groups[parent]),
+                            "bytes": len(text.encode("utf-8")),
+                            "hash": hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]}
+                   for parent, text in shards.items()},
+    }
+    return {"core": render_core(select_rows(artifact, core), manifest),
+            "shards": shards, "manifest": manifest}
+
+
+def write_if_changed(path, text):
+    """Write a generated file only if its content changed (keeps mtimes, and
+    so Vite's dev server, quiet). Returns True if written."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return True
+
+
+def js_json_literal(value):
+    """JSON.parse('...') source for a value (single-quoted JS string)."""
+    text = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return "JSON.parse('" + text.replace("\\", "\\\\").replace("'", "\\'") + "')"
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def write_bundle(bundle, out_file, shard_dir):
+    """Write regions.js and the shards, dropping shards of parents that no
+    longer have rows. Returns the number of files written or removed."""
+    changed = int(write_if_changed(out_file, bundle["core"]))
+    os.makedirs(shard_dir, exist_ok=True)
+    for parent, text in bundle["shards"].items():
+        changed += write_if_changed(os.path.join(shard_dir, f"{parent}.js"), text)
+    for name in sorted(os.listdir(shard_dir)):
+        if name.endswith(".js") and name[:-3] not in bundle["shards"]:
+            os.remove(os.path.join(shard_dir, name))
+            changed += 1
+    return changed
+
+
+def main():
+    if len(sys.argv) not in (1, 3, 4):
+        print(__doc__.strip().split("Usage:")[1])
+        sys.exit(1)
+    if len(sys.argv) == 1:
+        data_file, out_file, shard_dir = DEFAULT_DATA_FILE, DEFAULT_OUT_FILE, DEFAULT_SHARD_DIR
+    else:
+        data_file, out_file = sys.argv[1:3]
+        shard_dir = sys.argv[3] if len(sys.argv) == 4 else \
+            os.path.join(os.path.dirname(os.path.abspath(out_file)), "shards")
+
+    artifact = build_columns(DataJsDocument.load(data_file))
+    bundle = render_bundle(artifact)
+    changed = write_bundle(bundle, out_file, shard_dir)
+    shards = bundle["manifest"]["shards"]
+    print(f"  📦 {os.path.relpath(out_file)}: {artifact['count']} regions × "
+          f"{len(artifact['columns'])} indicators, core {len(bundle['core'].encode('utf-8')) // 1024} KB "
+          f"+ {len(shards)} shards ({sum(s['bytes'] for s in shards.values()) // 1024} KB) "
+          f"({f'{changed} files written' if changed else 'up to date'})")
+
+
+if __name__ == "__main__":
+    main()
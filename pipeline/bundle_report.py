@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Apples to Apples — production bundle report
+
+Lists every chunk `vite build` wrote to dist/assets with its raw and gzip
+size, and fails if any RAW row of src/data.js made it into the bundle.
+The app gets its regions from src/regions.js + src/shards/
+(build_regions.py); RAW and parseData() stay in data.js as the pipeline's
+source only and are unreferenced, so the bundler must drop them. A build
+that still carries them is ~73 KB heavier and is stopped here instead of
+being deployed.
+
+Usage:
+  python3 bundle_report.py                       # ../dist against ../src/data.js
+  python3 bundle_report.py <dist dir> [--data-file <data.js>]
+  (also runs as npm's postbuild step)
+"""
+
+import argparse
+import gzip
+import os
+import sys
+
+from build_regions import SCRIPT_DIR, DEFAULT_DATA_FILE
+from datajs import DataJsDocument
+
+DEFAULT_DIST_DIR = os.path.join(SCRIPT_DIR, "..", "dist")
+CHUNK_EXTENSIONS = (".js", ".css")
+
+
+# ============================================================
+# REPORT
+# ============================================================
+
+def chunk_sizes(dist_dir):
+    """[(path relative to dist, bytes, gzip bytes)] for every JS/CSS chunk."""
+    chunks = []
+    for root, _, files in os.walk(dist_dir):
+        for fname in sorted(files):
+            if not fname.endswith(CHUNK_EXTENSIONS):
+                continue
+            path = os.path.join(root, fname)
+            with open(path, "rb") as f:
+                data = f.read()
+            chunks.append((os.path.relpath(path, dist_dir), len(data),
+                           len(gzip.compress(data, 9))))
+    return sorted(chunks)
+
+
+def raw_leaks(dist_dir, chunks, rows):
+    """{chunk: number of RAW rows found in it} for chunks that hold any."""
+    leaks = {}
+    for rel, _, _ in chunks:
+        if not rel.endswith(".js"):
+            continue
+        with open(os.path.join(dist_dir, rel), "r", encoding="utf-8") as f:
+            text = f.read()
+        found = sum(1 for row in rows if row in text)
+        if found:
+            leaks[rel] = found
+    return leaks
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Report production bundle sizes")
+    parser.add_argument("dist", nargs="?", default=DEFAULT_DIST_DIR)
+    parser.add_argument("--data-file", default=DEFAULT_DATA_FILE)
+    args = parser.parse_args()
+
+    chunks = chunk_sizes(args.dist)
+    if not chunks:
+        print(f"  ❌ No chunks in {args.dist} (run vite build first)")
+        sys.exit(1)
+    rows = [line for line in DataJsDocument.load(args.data_file).rows.render().split("\n")
+            if line.strip()]
+    leaks = raw_leaks(args.dist, chunks, rows)
+
+    print(f"📦 {os.path.relpath(args.dist)}: {len(chunks)} chunks")
+    for rel, size, gz in chunks:
+        flag = f"  ❌ {leaks[rel]} RAW rows" if rel in leaks else ""
+        print(f"  {rel:50s} {size / 1024:8.1f} KB  gzip {gz / 1024:7.1f} KB{flag}")
+    print(f"  {'total':50s} {sum(c[1] for c in chunks) / 1024:8.1f} KB  "
+          f"gzip {sum(c[2] for c in chunks) / 1024:7.1f} KB")
+
+    if leaks:
+        print(f"\n  ❌ RAW from data.js is in the bundle: something references RAW or "
+              f"parseData, so it was not tree-shaken")
+        sys.exit(1)
+    print(f"  ✅ No RAW rows in the bundle ({len(rows)} checked)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Apples to Apples — columnar indicator store
+
+Binary alternative to the per-indicator JSON stores in cache/wb/. One file
+per indicator holds a sorted ISO3 key table plus parallel arrays, and is
+memory-mapped on load, so a --cache run never builds the nested
+{iso3: {year: value}} dicts for every downloaded point.
+
+File layout (little-endian, every section 8-byte aligned):
+  magic   b"A2AC" + u16 version + u16 reserved + u32 header length
+  header  JSON {"fetchedAt", "indicator", "years", "countries",
+                "keys": n, "points": m}
+  keys    n × 3 ASCII bytes, sorted ISO3 codes
+  offsets (n + 1) × u32, rows of keys[i] are offsets[i]:offsets[i+1]
+  values  m × float64
+  years   m × int16, newest first within each country
+
+Usage:
+  python3 colstore.py stats cache/wb/inflation.col
+  python3 fetch_data.py --cache-format columnar --convert-cache
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+
+MAGIC = b"A2AC"
+VERSION = 1
+PREAMBLE = struct.Struct("<4sHHI")
+EXTENSION = ".col"
+
+
+def _pad(n):
+    return -n % 8
+
+
+# ============================================================
+# WRITING
+# ============================================================
+
+def write_store(path, store, indicator=None):
+    """Write a {"fetchedAt", "years", "countries", "points"} store."""
+    keys = sorted(store["points"])
+    offsets, values, years = array("I", [0]), array("d"), array("h")
+    for iso3 in keys:
+        if len(iso3) != 3 or not iso3.isascii():
+            raise ValueError(f"not an ISO3 code: {iso3!r}")
+        series = store["points"][iso3]
+        for year in sorted(series, reverse=True):
+            values.append(series[year])
+            years.append(year)
+        offsets.append(len(values))
+
+    header = json.dumps({
+        "fetchedAt": store["fetchedAt"],
+        "indicator": indicator,
+        "years": store.get("years"),
+        "countries": store.get("countries"),
+        "keys": len(keys),
+        "points": len(values),
+    }).encode()
+    header += b" " * _pad(PREAMBLE.size + len(header))
+    key_bytes = "".join(keys).encode("ascii")
+
+    if sys.byteorder != "little":
+        for column in (offsets, values, years):
+            column.byteswap()
+
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(PREAMBLE.pack(MAGIC, VERSION, 0, len(header)))
+        f.write(header)
+        for section in (key_bytes, offsets.tobytes(), values.tobytes(), years.tobytes()):
+            f.write(section)
+            f.write(b"\0" * _pad(len(section)))
+    os.replace(tmp, path)
+    return path
+
+
+# ============================================================
+# READING
+# ============================================================
+
+class ColumnarPoints(Mapping):
+    """Read-only {iso3: {year: value}} view over a mapped store.
+
+    Looking a country up builds just that country's small dict; the
+    columns themselves stay in the page cache. select_closest() works on
+    the columns directly.
+    """
+
+    def __init__(self, keys, offsets, values, years):
+        self.keys = keys
+        self.index = {iso3: i for i, iso3 in enumerate(keys)}
+        self.offsets = offsets
+        self.values = values
+        self.years = years
+
+    def __getitem__(self, iso3):
+        i = self.index[iso3]
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        return dict(zip(self.years[lo:hi], self.values[lo:hi]))
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, iso3):
+        return iso3 in self.index
+
+    def point_count(self):
+        return len(self.values)
+
+    def select_closest(self, year, fallback_range):
+        """Same result as fetch_data.select_closest on the dict form: the
+        year closest to `year` within ±fallback_range, ties to the later
+        year. Rows are newest first, so the first one wins a tie and the
+        scan stops at the first year below the window."""
+        results = {}
+        offsets, values, years = self.offsets, self.values, self.years
+        oldest = year - fallback_range
+        for i, iso3 in enumerate(self.keys):
+            best, best_dist = None, fallback_range + 1
+            for row in range(offsets[i], offsets[i + 1]):
+                y = years[row]
+                if y < oldest:
+                    break
+                dist = abs(y - year)
+                if dist < best_dist:
+                    best, best_dist = row, dist
+            if best is not None:
+                results[iso3] = {"value": values[best], "year": years[best]}
+        return results
+
+
+def read_store(path):
+    """Map a columnar store → {"fetchedAt", "indicator", "years",
+    "countries", "points": ColumnarPoints}."""
+    with open(path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            raise ValueError(f"{path}: not a columnar store")
+    view = memoryview(buf)
+
+    magic, version, _, header_len = PREAMBLE.unpack_from(view)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path}: not a columnar store (version {VERSION})")
+    pos = PREAMBLE.size
+    header = json.loads(bytes(view[pos:pos + header_len]))
+    pos += header_len
+    n, m = header["keys"], header["points"]
+
+    def section(size):
+        nonlocal pos
+        start = pos
+        pos += size + _pad(size)
+        return view[start:start + size]
+
+    key_bytes = bytes(section(3 * n)).decode("ascii")
+    keys = [key_bytes[i:i + 3] for i in range(0, 3 * n, 3)]
+    columns = [section(4 * (n + 1)), section(8 * m), section(2 * m)]
+    if sys.byteorder == "little":
+        offsets, values, years = (col.cast(code) for col, code in zip(columns, "Idh"))
+    else:
+        offsets, values, years = (array(code, col) for col, code in zip(columns, "Idh"))
+        for column in (offsets, values, years):
+            column.byteswap()
+
+    return {
+        "fetchedAt": header["fetchedAt"],
+        "indicator": header.get("indicator"),
+        "years": header["years"],
+        "countries": header["countries"],
+        "points": ColumnarPoints(keys, offsets, values, years),
+    }
+
+
+def to_dict_points(points):
+    """Plain nested dicts from either store form (for JSON export)."""
+    return {iso3: dict(points[iso3]) for iso3 in points}
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] != "stats":
+        print(__doc__.strip().split("Usage:")[1])
+        sys.exit(1)
+    store = read_store(sys.argv[2])
+    points = store["points"]
+    print(f"  🗜️  {store['indicator']}: {len(points)} countries, "
+          f"{points.point_count()} points, years {store['years']}, "
+          f"fetched {store['fetchedAt']}")
+
+
+if __name__ == "__main__":
+    main()
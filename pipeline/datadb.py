@@ -0,0 +1,588 @@
+#!/usr/bin/env python3
+"""
+Apples to Apples — SQLite system of record
+
+Keeps the dataset in an indexed SQLite database (pipeline/data.sqlite)
+instead of only in the RAW template literal, so questions like "which
+regions lack hdi" or "what changed in the last run" are index lookups:
+
+  region       pos (RAW row order) → id, name, type, parent, flag
+  indicator    parseData key → RAW field index, scale, INDICATORS year tag
+  cell         (pos, field) → the published RAW text, and the run that
+               last changed it
+  observation  (region, indicator, source, year) → value, fetched_at,
+               origin (wb, lookup, file): every value a source offers, in
+               RAW units (year 0 = undated)
+  run, change  one run per import/load/merge/export, with every cell it
+               changed
+
+RAW may list a region id more than once, so regions are keyed by row
+position, with a non-unique index on id. Cells keep the exact text
+(".921", "0.921", ""), so data.js regenerates byte for byte.
+
+The database is where the pipeline resolves data; data.js is its
+committed export. `load` upserts source observations, `merge.py --db`
+resolves them into cells as a "merge" run, and `export` regenerates
+data.js, re-rendering only the rows whose cells changed since the last
+export (an index scan on cell.run). `init` builds the database from
+data.js and `import` records edits made to data.js by other tools,
+leaving rows with unexported database changes alone. The "merge" stage
+of stages.py runs import → load wb lookup → merge --db → export.
+
+Usage:
+  python3 datadb.py init                        # (re)build from src/data.js
+  python3 datadb.py import                      # sync edits made to data.js
+  python3 datadb.py load wb lookup              # upsert WB cache + v4 lookup
+  python3 datadb.py load files ../expansion/cn_cities_*.txt
+  python3 merge.py --db --year 2022             # resolve observations into cells
+  python3 datadb.py export                      # regenerate src/data.js
+  python3 datadb.py missing hdi --type country  # regions without a value
+  python3 datadb.py changes                     # cells changed by the last run
+  python3 datadb.py region us                   # cells + observations
+  python3 datadb.py sql "SELECT ..."
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, ".."))
+
+from build_regions import DEFAULT_DATA_FILE, STRING_FIELDS, parser_spec
+from datajs import DataJsDocument
+import snapshots
+
+DEFAULT_DB_FILE = os.path.join(SCRIPT_DIR, "data.sqlite")
+LOOKUP_FILE = os.path.join(SCRIPT_DIR, "..", "pipeline_v4_lookup.json")
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+REPORT_LIMIT = 10
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS region (
+    pos     INTEGER PRIMARY KEY,
+    id      TEXT NOT NULL,
+    name    TEXT NOT NULL,
+    type    TEXT NOT NULL,
+    parent  TEXT NOT NULL,
+    flag    TEXT NOT NULL,
+    run     INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS region_id ON region (id);
+CREATE INDEX IF NOT EXISTS region_parent ON region (parent, type);
+CREATE INDEX IF NOT EXISTS region_run ON region (run);
+
+CREATE TABLE IF NOT EXISTS indicator (
+    key     TEXT PRIMARY KEY,
+    field   INTEGER NOT NULL UNIQUE,
+    scale   REAL,
+    year    TEXT
+);
+
+CREATE TABLE IF NOT EXISTS cell (
+    pos     INTEGER NOT NULL,
+    field   INTEGER NOT NULL,
+    text    TEXT NOT NULL,
+    run     INTEGER NOT NULL,
+    PRIMARY KEY (pos, field)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cell_run ON cell (run);
+CREATE INDEX IF NOT EXISTS cell_field ON cell (field, pos);
+
+CREATE TABLE IF NOT EXISTS observation (
+    region      TEXT NOT NULL,
+    indicator   TEXT NOT NULL,
+    source      TEXT NOT NULL,
+    year        INTEGER NOT NULL,
+    value       REAL NOT NULL,
+    fetched_at  TEXT,
+    origin      TEXT NOT NULL,
+    PRIMARY KEY (region, indicator, source, year)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS observation_indicator ON observation (indicator, region);
+
+CREATE TABLE IF NOT EXISTS run (
+    id      INTEGER PRIMARY KEY,
+    at      TEXT NOT NULL,
+    kind    TEXT NOT NULL,
+    detail  TEXT
+);
+CREATE TABLE IF NOT EXISTS change (
+    run     INTEGER NOT NULL,
+    pos     INTEGER NOT NULL,
+    field   INTEGER NOT NULL,
+    old     TEXT,
+    new     TEXT
+);
+CREATE INDEX IF NOT EXISTS change_run ON change (run);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key     TEXT PRIMARY KEY,
+    value   TEXT
+);
+"""
+
+OBSERVATION_UPSERT = """
+INSERT INTO observation (region, indicator, source, year, value, fetched_at, origin)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (region, indicator, source, year)
+DO UPDATE SET value = excluded.value, fetched_at = excluded.fetched_at, origin = excluded.origin
+WHERE value IS NOT excluded.value OR fetched_at IS NOT excluded.fetched_at
+   OR origin IS NOT excluded.origin
+"""
+
+
+# ============================================================
+# DATABASE
+# ============================================================
+
+def indicator_year(doc, key):
+    entry = doc.indicators.get(key)
+    return None if entry is None else entry.get("year")
+
+
+class DataDB:
+    """A connection plus the run being recorded."""
+
+    def __init__(self, path=DEFAULT_DB_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(observation)")}
+        if "origin" not in columns:     # databases from before merge read them
+            self.conn.execute("ALTER TABLE observation ADD COLUMN origin TEXT NOT NULL DEFAULT ''")
+        self.run_id = None
+
+    def close(self):
+        self.conn.close()
+
+    def begin_run(self, kind, detail=None):
+        cur = self.conn.execute("INSERT INTO run (at, kind, detail) VALUES (?, ?, ?)",
+                                (time.strftime(TIMESTAMP_FORMAT), kind, detail))
+        self.run_id = cur.lastrowid
+        return self.run_id
+
+    def meta(self, key, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return default if row is None else row[0]
+
+    def set_meta(self, key, value):
+        self.conn.execute("INSERT INTO meta (key, value) VALUES (?, ?) "
+                          "ON CONFLICT (key) DO UPDATE SET value = excluded.value", (key, str(value)))
+
+    def indicator_fields(self):
+        """{field index: key}."""
+        return dict(self.conn.execute("SELECT field, key FROM indicator"))
+
+    # --- rows ---
+
+    def rows(self):
+        """[(pos, [field text, ...])] in RAW order."""
+        fields = {}
+        for pos, field, text in self.conn.execute("SELECT pos, field, text FROM cell ORDER BY pos, field"):
+            fields.setdefault(pos, []).append(text)
+        return [(pos, [rid, name, rtype, parent, flag] + fields.get(pos, []))
+                for pos, rid, name, rtype, parent, flag in self.conn.execute(
+                    "SELECT pos, id, name, type, parent, flag FROM region ORDER BY pos")]
+
+    def put_row(self, pos, fields, old=None):
+        """Insert or update one RAW row; records changed cells. Returns the
+        number of cells changed."""
+        fields = fields + [""] * max(0, len(STRING_FIELDS) - len(fields))
+        old = old or []
+        changes = [(self.run_id, pos, i, old[i] if i < len(old) else None, v)
+                   for i, v in enumerate(fields) if i >= len(old) or old[i] != v]
+        changes += [(self.run_id, pos, i, old[i], None) for i in range(len(fields), len(old))]
+        if not changes:
+            return 0
+        if any(i < len(STRING_FIELDS) for _, _, i, _, _ in changes) or not old:
+            self.conn.execute(
+                "INSERT INTO region (pos, id, name, type, parent, flag, run) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (pos) DO UPDATE SET id = excluded.id, name = excluded.name, "
+                "type = excluded.type, parent = excluded.parent, flag = excluded.flag, run = excluded.run",
+                (pos, *fields[:len(STRING_FIELDS)], self.run_id))
+        self.conn.executemany(
+            "INSERT INTO cell (pos, field, text, run) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (pos, field) DO UPDATE SET text = excluded.text, run = excluded.run",
+            [(pos, i, new, self.run_id) for _, _, i, _, new in changes
+             if i >= len(STRING_FIELDS) and new is not None])
+        self.conn.executemany("DELETE FROM cell WHERE pos = ? AND field = ?",
+                              [(pos, i) for _, _, i, _, new in changes if new is None])
+        self.conn.executemany("INSERT INTO change (run, pos, field, old, new) VALUES (?, ?, ?, ?, ?)",
+                              changes)
+        return len(changes)
+
+    def synced_fields(self, pos, fields):
+        """A row's fields as data.js last had them (at the last export, or
+        the last import that wrote the row): `fields`, its current ones,
+        with the changes recorded since undone. [] if it is new."""
+        since = max(int(self.meta("exported_run", 0)), self.conn.execute(
+            "SELECT COALESCE(MAX(change.run), 0) FROM change JOIN run ON run.id = change.run "
+            "WHERE change.pos = ? AND run.kind IN ('init', 'import')", (pos,)).fetchone()[0])
+        cells = dict(enumerate(fields))
+        for field, old in self.conn.execute(
+                "SELECT field, old FROM change WHERE pos = ? AND run > ? "
+                "ORDER BY run DESC, rowid DESC", (pos, since)):
+            if old is None:
+                cells.pop(field, None)
+            else:
+                cells[field] = old
+        return [cells[i] for i in sorted(cells)]
+
+    def pending_rows(self):
+        """Positions with changes not exported to data.js yet, in order
+        (what import and init recorded came from data.js)."""
+        since = int(self.meta("exported_run", 0))
+        synced = "SELECT id FROM run WHERE id > ? AND kind IN ('init', 'import')"
+        return [pos for (pos,) in self.conn.execute(
+            f"SELECT pos FROM cell WHERE run > ? AND run NOT IN ({synced}) UNION "
+            f"SELECT pos FROM region WHERE run > ? AND run NOT IN ({synced}) ORDER BY pos",
+            (since, since, since, since))]
+
+    # --- data.js ---
+
+    def import_doc(self, doc, keep_pending=False, force=False):
+        """Sync regions, cells and indicators from a loaded data.js. With
+        keep_pending, rows changed in the database since the last export,
+        and while there are any the year tags, are left as they are (the
+        database wins until it is exported). If data.js was edited on such
+        a row too, raises ValueError unless force, which takes data.js's.
+        Returns (cells changed, rows added, rows removed)."""
+        stored = dict(self.rows())
+        doc_rows = list(doc.rows)
+        pending = set(self.pending_rows()) if keep_pending else set()
+        conflicts = [pos for pos in sorted(pending) if pos < len(doc_rows)
+                     and list(doc_rows[pos].fields) != stored[pos]
+                     and list(doc_rows[pos].fields) != self.synced_fields(pos, stored[pos])]
+        if conflicts and not force:
+            ids = ", ".join(stored[pos][0] for pos in conflicts[:REPORT_LIMIT])
+            raise ValueError(f"data.js edits {len(conflicts)} rows with unexported database "
+                             f"changes ({ids}); `export` would overwrite them, "
+                             f"`import --force` keeps data.js's")
+        pending -= set(conflicts)
+        years = dict(self.conn.execute("SELECT key, year FROM indicator")) if pending else {}
+        spec = parser_spec(doc.text())
+        self.conn.executemany(
+            "INSERT INTO indicator (key, field, scale, year) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET field = excluded.field, scale = excluded.scale, "
+            "year = excluded.year",
+            [(key, idx, scale, years[key] if key in years else indicator_year(doc, key))
+             for key, idx, scale in spec])
+
+        changed = added = 0
+        for pos, row in enumerate(doc_rows):
+            if pos in pending:
+                continue
+            old = stored.get(pos)
+            added += old is None
+            changed += self.put_row(pos, list(row.fields), old)
+        removed = [pos for pos in stored if pos >= len(doc_rows) and pos not in pending]
+        for pos in removed:
+            self.put_row(pos, [], stored[pos])
+        self.conn.executemany("DELETE FROM region WHERE pos = ?", [(pos,) for pos in removed])
+        return changed, added, len(removed)
+
+    def export_doc(self, doc):
+        """Write the rows changed since the last export (and any new rows)
+        into a loaded data.js, plus the year tags. Returns rows rendered."""
+        positions = self.pending_rows()
+        doc_rows = list(doc.rows)
+        if len(doc_rows) > self.conn.execute("SELECT COUNT(*) FROM region").fetchone()[0]:
+            raise ValueError("data.js has rows the database does not; run `import` first")
+
+        rendered, appended = 0, []
+        for pos in positions:
+            rid, name, rtype, parent, flag = self.conn.execute(
+                "SELECT id, name, type, parent, flag FROM region WHERE pos = ?", (pos,)).fetchone()
+            cells = [text for (text,) in self.conn.execute(
+                "SELECT text FROM cell WHERE pos = ? ORDER BY field", (pos,))]
+            text = ",".join([rid, name, rtype, parent, flag] + cells)
+            if pos < len(doc_rows):
+                if doc_rows[pos].text != text:
+                    doc_rows[pos].text = text
+                    rendered += 1
+            else:
+                appended.append(text)
+        if appended:
+            doc.rows.append("\n".join(appended))
+            rendered += len(appended)
+
+        for key, year in self.conn.execute("SELECT key, year FROM indicator"):
+            entry = doc.indicators.get(key)
+            if entry is None:
+                continue
+            if year is None:
+                entry.remove("year")
+            else:
+                entry.set("year", year, first=True)
+        return rendered
+
+    # --- sources ---
+
+    def upsert_observations(self, rows):
+        """Insert or update observations; returns how many were added or
+        changed (the upsert's own row count)."""
+        return self.conn.executemany(OBSERVATION_UPSERT, rows).rowcount
+
+
+# ============================================================
+# SOURCE LOADERS
+# ============================================================
+# Each yields (region id, indicator key, source, year, value, fetched_at,
+# origin) with values in RAW units.
+
+def country_ids(db):
+    """ISO3 → [region id, ...] for the country rows in the database."""
+    from fetch_data import REGION_TO_ISO3
+    ids = {}
+    for (rid,) in db.conn.execute("SELECT DISTINCT id FROM region WHERE type = 'country'"):
+        if rid in REGION_TO_ISO3:
+            ids.setdefault(REGION_TO_ISO3[rid], []).append(rid)
+    return ids
+
+
+def wb_observations(db):
+    import fetch_data
+    keys = db.indicator_fields()
+    countries = country_ids(db)
+    for name, store in fetch_data.load_cache_entries().items():
+        key = keys.get(fetch_data.WB_FIELD_MAP[name][0])
+        if key is None:
+            continue
+        spec = fetch_data.FIELD_SPECS[name]
+        points = store["points"]
+        for iso3 in points:
+            if iso3 not in countries:
+                continue
+            series = points[iso3]
+            years = list(series)
+            values = fetch_data.transform_column(spec, [series[y] for y in years])
+            for rid in countries[iso3]:
+                for year, value in zip(years, values):
+                    if value is not None:
+                        yield rid, key, "World Bank", int(year), value, store["fetchedAt"], "wb"
+
+
+def lookup_observations(db, path=LOOKUP_FILE):
+    from pipeline_v4_inject import INDICATOR_FIELDS
+    keys = db.indicator_fields()
+    countries = country_ids(db)
+    fetched_at = time.strftime(TIMESTAMP_FORMAT, time.localtime(os.path.getmtime(path)))
+    with open(path) as f:
+        lookup = json.load(f)
+    for iso3, entries in lookup.items():
+        for name, entry in entries.items():
+            if name not in INDICATOR_FIELDS or entry.get("value") is None:
+                continue
+            key = keys.get(INDICATOR_FIELDS[name][0])
+            for rid in countries.get(iso3, []) if key else []:
+                yield rid, key, entry.get("source", "lookup"), int(entry.get("year") or 0), \
+                    entry["value"], fetched_at, "lookup"
+
+
+def read_region_files(db, paths):
+    """[(source, fetched_at, RAW fields)] for the rows of region CSV files."""
+    from ingest import read_region_lines, normalise
+    width = len(STRING_FIELDS) + len(db.indicator_fields())
+    records = []
+    for path in paths:
+        source = f"file:{os.path.basename(path)}"
+        fetched_at = time.strftime(TIMESTAMP_FORMAT, time.localtime(os.path.getmtime(path)))
+        for where, fields in read_region_lines([path]):
+            fields = normalise(fields, width)
+            if fields is None or not fields[0]:
+                print(f"  ⚠️  {where}: skipped (malformed)")
+                continue
+            records.append((source, fetched_at, fields))
+    return records
+
+
+def add_file_regions(db, records):
+    """Add the regions of read_region_files() records that the database
+    does not have yet as new rows (appended at the end of RAW on export).
+    Returns the number added."""
+    known = {rid for (rid,) in db.conn.execute("SELECT DISTINCT id FROM region")}
+    next_pos = db.conn.execute("SELECT COALESCE(MAX(pos) + 1, 0) FROM region").fetchone()[0]
+    added = 0
+    for _, _, fields in records:
+        if fields[0] not in known:
+            db.put_row(next_pos + added, fields)
+            known.add(fields[0])
+            added += 1
+    return added
+
+
+def file_observations(db, records):
+    keys = db.indicator_fields()
+    for source, fetched_at, fields in records:
+        for idx, key in keys.items():
+            try:
+                yield fields[0], key, source, 0, float(fields[idx]), fetched_at, "file"
+            except (IndexError, ValueError):
+                pass
+
+
+# ============================================================
+# QUERIES
+# ============================================================
+
+def field_of(db, key):
+    row = db.conn.execute("SELECT field FROM indicator WHERE key = ?", (key,)).fetchone()
+    if row is None:
+        raise SystemExit(f"❌ Unknown indicator {key!r}")
+    return row[0]
+
+
+def query_missing(db, key, region_type=None):
+    """[(id, name, type)] for rows with no value for the indicator."""
+    sql = ("SELECT r.id, r.name, r.type FROM region r "
+           "LEFT JOIN cell c ON c.pos = r.pos AND c.field = ? "
+           "WHERE (c.text IS NULL OR TRIM(c.text) = '')")
+    args = [field_of(db, key)]
+    if region_type:
+        sql += " AND r.type = ?"
+        args.append(region_type)
+    return db.conn.execute(sql + " ORDER BY r.pos", args).fetchall()
+
+
+def query_changes(db, run=None):
+    """(run row, [(id, field key, old, new)]) for a run (default: the
+    latest run that changed anything)."""
+    if run is None:
+        row = db.conn.execute("SELECT MAX(run) FROM change").fetchone()
+        run = row[0]
+    if run is None:
+        return None, []
+    info = db.conn.execute("SELECT id, at, kind, detail FROM run WHERE id = ?", (run,)).fetchone()
+    names = dict(db.conn.execute("SELECT field, key FROM indicator"))
+    names.update(enumerate(STRING_FIELDS))
+    changes = [(rid if rid is not None else f"#{pos}", names.get(field, field), old, new)
+               for pos, rid, field, old, new in db.conn.execute(
+                   "SELECT c.pos, r.id, c.field, c.old, c.new FROM change c "
+                   "LEFT JOIN region r ON r.pos = c.pos WHERE c.run = ? ORDER BY c.pos, c.field", (run,))]
+    return info, changes
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite system of record for data.js")
+    parser.add_argument("--db", default=DEFAULT_DB_FILE)
+    parser.add_argument("--data-file", default=DEFAULT_DATA_FILE)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("init", help="Rebuild the database from data.js")
+    imp = sub.add_parser("import", help="Record edits made to data.js")
+    imp.add_argument("--force", action="store_true",
+                     help="Take data.js's rows even where the database has unexported changes")
+    load = sub.add_parser("load", help="Upsert source observations")
+    load.add_argument("sources", nargs="+", help="wb, lookup, files, then file paths")
+    sub.add_parser("export", help="Regenerate data.js from the database")
+    missing = sub.add_parser("missing", help="Regions without a value for an indicator")
+    missing.add_argument("indicator")
+    missing.add_argument("--type")
+    changes = sub.add_parser("changes", help="Cells changed by a run")
+    changes.add_argument("--run", type=int)
+    region = sub.add_parser("region", help="Cells and observations for a region")
+    region.add_argument("id")
+    sql = sub.add_parser("sql", help="Run a read-only query")
+    sql.add_argument("query")
+    args = parser.parse_args()
+
+    if args.command == "init" and os.path.exists(args.db):
+        os.remove(args.db)
+    db = DataDB(args.db)
+    started = time.perf_counter()
+
+    if args.command in ("init", "import"):
+        db.begin_run(args.command, os.path.relpath(args.data_file))
+        try:
+            changed, added, removed = db.import_doc(DataJsDocument.load(args.data_file),
+                                                    keep_pending=True,
+                                                    force=getattr(args, "force", False))
+        except ValueError as e:
+            raise SystemExit(f"❌ {e}")
+        if db.meta("exported_run") is None:     # data.js is what was just read
+            db.set_meta("exported_run", db.run_id)
+        pending = len(db.pending_rows())
+        db.conn.commit()
+        print(f"  🗄️  {os.path.relpath(args.db)}: {added} rows added, {removed} removed, "
+              f"{changed} cells changed ({time.perf_counter() - started:.2f}s)")
+        if pending:
+            print(f"  ⏳ {pending} rows with unexported changes kept (run `export`)")
+
+    elif args.command == "load":
+        kinds = [s for s in args.sources if s in ("wb", "lookup", "files")]
+        paths = [s for s in args.sources if s not in kinds]
+        if paths and "files" not in kinds:
+            raise SystemExit(f"❌ Unknown source(s): {', '.join(paths)}")
+        db.begin_run("load", " ".join(args.sources))
+        for kind in kinds:
+            if kind == "files":
+                records = read_region_files(db, paths)
+                added = add_file_regions(db, records)
+                if added:
+                    print(f"  ➕ files: {added} new regions")
+                rows = file_observations(db, records)
+            else:
+                rows = {"wb": wb_observations, "lookup": lookup_observations}[kind](db)
+            print(f"  📥 {kind}: {db.upsert_observations(rows)} observations added/changed")
+        db.conn.commit()
+
+    elif args.command == "export":
+        doc = DataJsDocument.load(args.data_file)
+        db.begin_run("export", os.path.relpath(args.data_file))
+        rendered = db.export_doc(doc)
+        written = doc.save(args.data_file)
+        db.set_meta("exported_run", db.run_id)
+        db.conn.commit()
+        if written:
+            snapshots.record(args.data_file, "datadb export")
+        print(f"  📤 {os.path.relpath(args.data_file)}: {rendered} rows re-rendered"
+              f"{'' if written else ' (unchanged)'}")
+
+    elif args.command == "missing":
+        rows = query_missing(db, args.indicator, args.type)
+        for rid, name, rtype in rows:
+            print(f"  {rid:10s} {name} ({rtype})")
+        print(f"  {len(rows)} regions without {args.indicator}")
+
+    elif args.command == "changes":
+        info, rows = query_changes(db, args.run)
+        if info is None:
+            print("  No changes recorded")
+        else:
+            print(f"  Run {info[0]} ({info[2]} {info[3] or ''}) at {info[1]}: {len(rows)} cells")
+            for rid, key, old, new in rows:
+                print(f"    {rid:10s} {key:20s} {old if old is not None else '—':>10s} → "
+                      f"{new if new is not None else '—'}")
+
+    elif args.command == "region":
+        positions = db.conn.execute("SELECT pos FROM region WHERE id = ?", (args.id,)).fetchall()
+        if not positions:
+            raise SystemExit(f"❌ No region {args.id!r}")
+        names = db.indicator_fields()
+        for (pos,) in positions:
+            print(f"  row {pos}:")
+            for field, text in db.conn.execute("SELECT field, text FROM cell WHERE pos = ? AND text != '' "
+                                               "ORDER BY field", (pos,)):
+                print(f"    {names.get(field, field):20s} {text}")
+        for key, source, year, value in db.conn.execute(
+                "SELECT indicator, source, year, value FROM observation WHERE region = ? "
+                "ORDER BY indicator, year DESC, source", (args.id,)):
+            print(f"    · {key:20s} {value:>12g}  {year or '—'}  {source}")
+
+    elif args.command == "sql":
+        db.conn.execute("PRAGMA query_only = ON")
+        for row in db.conn.execute(args.query):
+            print("  " + " | ".join("" if v is None else str(v) for v in row))
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
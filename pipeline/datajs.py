@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Apples to Apples — data.js document model
+
+Parses src/data.js once into structured, indexed parts that every pipeline
+script can edit in memory:
+
+  doc.rows        RAW CSV block, one Row per data line, indexed by region id
+  doc.indicators  `export const INDICATORS = {...}`, one Entry per indicator
+  doc.categories  `export const INDICATOR_CATEGORIES = {...}`
+
+Everything else (parser code, presets, comments) is kept as verbatim text.
+Serializing re-renders only the rows and entries that were changed, so an
+untouched document round-trips byte for byte and edits stay minimal diffs.
+
+Usage:
+  from datajs import DataJsDocument
+  doc = DataJsDocument.load(path)
+  doc.rows["us"].set(5, "335")
+  doc.indicators["gdp"].set("year", "2024")
+  doc.save(path)                    # writes only if something changed
+
+  python3 datajs.py check ../src/data.js   # parse + round-trip report
+"""
+
+import re
+import sys
+
+RAW_START = "const RAW = `"
+RAW_END = "`.trim();"
+INDICATORS_START = "export const INDICATORS = {\n"
+CATEGORIES_START = "export const INDICATOR_CATEGORIES = {\n"
+OBJECT_END = "\n};"
+
+
+# ============================================================
+# JS VALUES
+# ============================================================
+
+class JsCode(str):
+    """A property value written as-is (arrow functions, numbers, ...)."""
+
+
+def js_literal(value):
+    """Python value → JS source for an INDICATORS-style property."""
+    if isinstance(value, JsCode):
+        return str(value)
+    if isinstance(value, str):
+        return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(js_literal(v) for v in value) + "]"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return repr(value)
+
+
+_STRING = re.compile(r"""'((?:[^'\\]|\\.)*)'|"((?:[^"\\]|\\.)*)\"""")
+
+def parse_literal(source):
+    """JS source → str for string literals, list for arrays of strings,
+    otherwise JsCode(source)."""
+    source = source.strip()
+    m = _STRING.fullmatch(source)
+    if m:
+        text = m.group(1) if m.group(1) is not None else m.group(2)
+        return re.sub(r"\\(.)", r"\1", text)
+    if source.startswith("[") and source.endswith("]"):
+        items = split_top_level(source[1:-1])
+        parsed = [parse_literal(item) for item in items if item.strip()]
+        if all(isinstance(p, str) and not isinstance(p, JsCode) for p in parsed):
+            return parsed
+    return JsCode(source)
+
+
+def split_top_level(source):
+    """Split JS source on commas outside strings and brackets."""
+    parts, depth, quote, start, i = [], 0, None, 0, 0
+    while i < len(source):
+        ch = source[i]
+        if quote:
+            if ch == "\\":
+                i += 1
+            elif ch == quote:
+                quote = None
+        elif ch in "'\"`":
+            quote = ch
+        elif ch in "([{":
+            depth += 1
+        elif ch in ")]}":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append(source[start:i])
+            start = i + 1
+        i += 1
+    parts.append(source[start:])
+    return parts
+
+
+# ============================================================
+# RAW CSV BLOCK
+# ============================================================
+
+class Row:
+    """One RAW data line. `fields` are the comma-separated values as
+    written; the line is re-joined only after a change."""
+
+    __slots__ = ("_text", "fields")
+
+    def __init__(self, text):
+        self._text = text
+        self.fields = text.split(",")
+
+    @property
+    def id(self):
+        return self.fields[0].strip()
+
+    @property
+    def text(self):
+        if self._text is None:
+            self._text = ",".join(self.fields)
+        return self._text
+
+    @text.setter
+    def text(self, text):
+        self._text = text
+        self.fields = text.split(",")
+
+    def get(self, idx):
+        return self.fields[idx].strip() if idx < len(self.fields) else ""
+
+    def set(self, idx, value):
+        """Set field idx (padding with empty fields); True if it changed."""
+        value = str(value)
+        if self.get(idx) == value:
+            return False
+        while len(self.fields) <= idx:
+            self.fields.append("")
+        self.fields[idx] = value
+        self._text = None
+        return True
+
+
+class RawBlock:
+    """The RAW template literal: Row objects for data lines, plain strings
+    for blank and // comment lines, and an id → Row index."""
+
+    def __init__(self, text):
+        self.lines = [self._parse_line(line) for line in text.split("\n")]
+        self.index = {}
+        for line in self.lines:
+            if isinstance(line, Row):
+                self.index.setdefault(line.id, line)
+
+    @staticmethod
+    def _parse_line(line):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("//") or "," not in stripped:
+            return line
+        return Row(line)
+
+    def __iter__(self):
+        return (line for line in self.lines if isinstance(line, Row))
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, region_id):
+        return self.index[region_id]
+
+    def __contains__(self, region_id):
+        return region_id in self.index
+
+    def get(self, region_id):
+        return self.index.get(region_id)
+
+    def append(self, text):
+        """Add data lines (one per line of `text`) at the end of RAW."""
+        tail = len(self.lines)
+        while tail and isinstance(self.lines[tail - 1], str) and not self.lines[tail - 1].strip():
+            tail -= 1
+        added = [self._parse_line(line) for line in text.split("\n")]
+        self.lines[tail:tail] = added
+        for line in added:
+            if isinstance(line, Row):
+                self.index.setdefault(line.id, line)
+        return [line for line in added if isinstance(line, Row)]
+
+    def render(self):
+        return "\n".join(line.text if isinstance(line, Row) else line for line in self.lines)
+
+
+# ============================================================
+# OBJECT BLOCKS (INDICATORS, INDICATOR_CATEGORIES)
+# ============================================================
+
+_ENTRY = re.compile(r"^(\s*)(\w+)\s*:\s*\{\s*(.*?)\s*\}(,?)\s*$")
+
+class Entry:
+    """One `  key: { prop: value, ... },` line of an object block."""
+
+    def __init__(self, key, props, indent="  ", text=None):
+        self.key = key
+        self.props = props          # [[name, js_source], ...] in file order
+        self.indent = indent
+        self._text = text
+
+    @classmethod
+    def parse(cls, line):
+        m = _ENTRY.match(line)
+        if not m:
+            return None
+        props = []
+        for part in split_top_level(m.group(3)):
+            if not part.strip():
+                continue
+            name, sep, source = part.partition(":")
+            if not sep:
+                return None
+            props.append([name.strip(), source.strip()])
+        return cls(m.group(2), props, m.group(1), line)
+
+    def _find(self, name):
+        for prop in self.props:
+            if prop[0] == name:
+                return prop
+        return None
+
+    def get(self, name, default=None):
+        prop = self._find(name)
+        return default if prop is None else parse_literal(prop[1])
+
+    def __contains__(self, name):
+        return self._find(name) is not None
+
+    def set(self, name, value, first=False):
+        """Set a property (new ones go last, or first); True if it changed."""
+        source = js_literal(value)
+        prop = self._find(name)
+        if prop is not None:
+            if prop[1] == source:
+                return False
+            prop[1] = source
+        elif first:
+            self.props.insert(0, [name, source])
+        else:
+            self.props.append([name, source])
+        self._text = None
+        return True
+
+    def remove(self, name):
+        prop = self._find(name)
+        if prop is None:
+            return False
+        self.props.remove(prop)
+        self._text = None
+        return True
+
+    def render(self):
+        if self._text is None:
+            body = ", ".join(f"{name}: {source}" for name, source in self.props)
+            self._text = f"{self.indent}{self.key}: {{ {body} }},"
+        return self._text
+
+
+class ObjectBlock:
+    """Body of an `export const NAME = {...};` object with one entry per
+    line, kept in file order. A repeated key resolves to its last entry,
+    as it does in JS; earlier copies are kept as dead lines."""
+
+    def __init__(self, text):
+        self.lines = []
+        self.index = {}
+        for line in text.split("\n"):
+            entry = Entry.parse(line)
+            if entry is None:
+                self.lines.append(line)
+            else:
+                self.lines.append(entry)
+                self.index[entry.key] = entry
+
+    def __iter__(self):
+        return (line for line in self.lines if isinstance(line, Entry))
+
+    def keys(self):
+        """Distinct keys in first-seen order, i.e. Object.keys() in JS."""
+        return list(self.index)
+
+    def __getitem__(self, key):
+        return self.index[key]
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def get(self, key):
+        return self.index.get(key)
+
+    def add_line(self, line, after=None):
+        """Insert an entry given as its JS source line, after entry `after`
+        (or at the end). Returns the Entry; an existing key is left alone."""
+        entry = Entry.parse(line)
+        if entry is None:
+            raise ValueError(f"not an object entry: {line!r}")
+        if entry.key in self.index:
+            return self.index[entry.key]
+        return self._insert(entry, after)
+
+    def add(self, key, props, after=None):
+        """Insert a new entry from {name: value} (see js_literal)."""
+        if key in self.index:
+            return self.index[key]
+        entry = Entry(key, [[name, js_literal(value)] for name, value in props.items()])
+        return self._insert(entry, after)
+
+    def _insert(self, entry, after):
+        if after is not None and after in self.index:
+            pos = self.lines.index(self.index[after]) + 1
+        else:
+            pos = len(self.lines)
+            while pos and isinstance(self.lines[pos - 1], str) and not self.lines[pos - 1].strip():
+                pos -= 1
+        self.lines.insert(pos, entry)
+        self.index[entry.key] = entry
+        return entry
+
+    def render(self):
+        return "\n".join(line.render() if isinstance(line, Entry) else line
+                         for line in self.lines)
+
+
+# ============================================================
+# DOCUMENT
+# ============================================================
+
+class DataJsDocument:
+    """src/data.js as verbatim code segments around the RAW, INDICATORS and
+    INDICATOR_CATEGORIES blocks. Blocks missing from the file are None."""
+
+    def __init__(self, text):
+        self.original = text
+        self.segments = [text]
+        self.rows = self._split(RAW_START, RAW_END, RawBlock)
+        self.indicators = self._split(INDICATORS_START, OBJECT_END, ObjectBlock)
+        self.categories = self._split(CATEGORIES_START, OBJECT_END, ObjectBlock)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(f.read())
+
+    def _split(self, start_marker, end_marker, block_cls):
+        """Carve the first start…end region out of a code segment."""
+        for i, segment in enumerate(self.segments):
+            if not isinstance(segment, str):
+                continue
+            start = segment.find(start_marker)
+            if start < 0:
+                continue
+            body_start = start + len(start_marker)
+            end = segment.find(end_marker, body_start)
+            if end < 0:
+                continue
+            block = block_cls(segment[body_start:end])
+            self.segments[i:i + 1] = [segment[:body_start], block, segment[end:]]
+            return block
+        return None
+
+    # --- verbatim code ---
+
+    def replace(self, old, new, count=1):
+        """Replace text in the code outside the parsed blocks (parser,
+        presets, comments). Returns True if anything was replaced."""
+        for i, segment in enumerate(self.segments):
+            if isinstance(segment, str) and old in segment:
+                self.segments[i] = segment.replace(old, new, count)
+                return True
+        return False
+
+    def set_comment(self, prefix, line):
+        """Replace the first code line starting with `prefix` (e.g.
+        "// Sources:") with `line`. Returns True if it changed."""
+        pattern = re.compile(rf"^{re.escape(prefix)}.*$", re.MULTILINE)
+        for i, segment in enumerate(self.segments):
+            if isinstance(segment, str):
+                m = pattern.search(segment)
+                if m:
+                    if m.group(0) == line:
+                        return False
+                    self.segments[i] = segment[:m.start()] + line + segment[m.end():]
+                    return True
+        return False
+
+    # --- serialization ---
+
+    def text(self):
+        return "".join(s if isinstance(s, str) else s.render() for s in self.segments)
+
+    def changed(self):
+        return self.text() != self.original
+
+    def save(self, path):
+        """Write the document if it differs from what was loaded."""
+        text = self.text()
+        if text == self.original:
+            return False
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        self.original = text
+        return True
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] != "check":
+        print("Usage: python3 datajs.py check <path_to_data.js>")
+        sys.exit(1)
+    doc = DataJsDocument.load(sys.argv[2])
+    print(f"  📄 {sys.argv[2]}")
+    print(f"     RAW: {len(doc.rows) if doc.rows is not None else 'missing'} regions")
+    print(f"     INDICATORS: {len(doc.indicators.keys()) if doc.indicators else 'missing'}")
+    print(f"     INDICATOR_CATEGORIES: "
+          f"{len(doc.categories.keys()) if doc.categories else 'missing'}")
+    print(f"     round-trip: {'identical' if doc.text() == doc.original else 'DIFFERS'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,19 +14,49 @@ Usage:
   python3 fetch_data.py                # Fetch + cache + update (default year 2022)
   python3 fetch_data.py --cache        # Use cached data (no API calls)
   python3 fetch_data.py --refresh      # Force re-fetch even if cache exists
+  python3 fetch_data.py --refresh-only inflation,gdpBillions
+                                       # Re-fetch just these indicators
+  python3 fetch_data.py --resume       # Continue an interrupted fetch
   python3 fetch_data.py --dry-run      # Preview changes without writing
   python3 fetch_data.py --year 2023    # Target different year
+  python3 fetch_data.py --window 2015:2024
+                                       # Download a wider year range once
+  python3 fetch_data.py --workers 6    # Fetch indicators/pages concurrently
+  python3 fetch_data.py --all-countries
+                                       # Request country/all, not just mapped ISO3s
+  python3 fetch_data.py --cache-format columnar --convert-cache
+                                       # Switch the cache to mmap'd column files
+  python3 fetch_data.py --fill-gaps --max-lag 3
+                                       # Fetch only the country/indicator cells
+                                       # data_coverage.json shows missing or
+                                       # older than 3 years (per-country mrv)
+  python3 fetch_data.py --cache --year 2030 --wpp
+                                       # Fill population/density gaps from the
+                                       # UN WPP projections (cache/wpp2024.series)
 """
 
 import json
+import codecs
 import time
 import argparse
 import os
 import sys
-from urllib.request import urlopen, Request
+import queue
+import zlib
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 from urllib.error import HTTPError, URLError
 from collections import Counter
 
+import colstore
+from wb_coverage import Coverage
+from datajs import DataJsDocument
+from series import read_series
+import snapshots
+
+
 # ============================================================
 # ACTUAL FIELD LAYOUT IN data.js (verified from source)
 # ============================================================
@@ -107,6 +137,26 @@ WB_FIELD_MAP["exports"] = (22, "NE.EXP.GNFS.CD", "div1e9")   # USD → billions
 WB_FIELD_MAP["fdiInflow"] = (23, "BX.KLT.DINV.CD.WD", "div1e9")  # USD → billions
 WB_FIELD_MAP["healthExpenditure"] = (20, "SH.XPD.CHEX.GD.ZS", "direct")  # % GDP
 
+# Unit conversion and rounding, compiled once per field into
+# FIELD_SPECS[name] = (divisor or None, decimals or 0 for ints) and applied a
+# whole column at a time (see transform_column / format_column)
+TRANSFORM_DIVISORS = {"direct": None, "div1e3": 1_000, "div1e6": 1_000_000,
+                      "div1e9": 1_000_000_000}
+FIELD_DECIMALS = {
+    "gdpBillions": 0,        # 27360 billion
+    "exports": 0,
+    "fdiInflow": 0,
+    "gdpPerCapita": 0,       # 81695
+    "area": 0,               # 9833 thousand km²
+    "populationDensity": 0,  # 34 /km²
+}                            # everything else: 1 decimal (population 335.0 million)
+
+def compile_field_spec(field_name, transform):
+    return TRANSFORM_DIVISORS[transform], FIELD_DECIMALS.get(field_name, 1)
+
+FIELD_SPECS = {name: compile_field_spec(name, transform)
+               for name, (_, _, transform) in WB_FIELD_MAP.items()}
+
 # Region ID → ISO3 code (country-level only)
 REGION_TO_ISO3 = {
     "us": "USA", "cn": "CHN", "de": "DEU", "jp": "JPN", "gb": "GBR",
@@ -127,160 +177,1066 @@ REGION_TO_ISO3 = {
     "ma": "MAR", "tn": "TUN", "rw": "RWA", "sn": "SEN", "ci": "CIV",
     "lk": "LKA", "mm": "MMR", "kh": "KHM", "np": "NPL",
     "gr": "GRC", "ua": "UKR",
+    "sk": "SVK", "si": "SVN", "ir": "IRN", "iq": "IRQ", "dz": "DZA", "ve": "VEN",
 }
 
+# WB codes with no data series of their own (TWN is not a WB economy);
+# a single unknown code makes the API reject a whole batched request.
+WB_UNSUPPORTED_ISO3 = {"TWN"}
+
+# WB regional/income aggregates — never matched by update_countries
+WB_AGGREGATES = frozenset("""
+    AFE AFW ARB CEB CSS EAP EAR EAS ECA ECS EMU EUU FCS HIC HPC IBD IBT IDA
+    IDB IDX INX LAC LCN LDC LIC LMC LMY LTE MEA MIC MNA NAC OED OSS PRE PSS
+    PST SAS SSA SSF SST TEA TEC TLA TMN TSA TSS UMC WLD
+""".split())
+
+# Countries per batched country/A;B;C request (~400-char URLs; one batch
+# covers every mapped country today)
+WB_BATCH_SIZE = 100
+
+def target_iso3():
+    """Sorted ISO3 codes the pipeline actually maps to regions."""
+    return sorted(set(REGION_TO_ISO3.values()) - WB_UNSUPPORTED_ISO3)
+
+def country_batches(countries):
+    """Split ISO3 codes into `country/...` path segments; None → ["all"]."""
+    if countries is None:
+        return ["all"]
+    return [";".join(countries[i:i + WB_BATCH_SIZE])
+            for i in range(0, len(countries), WB_BATCH_SIZE)]
+
 # ============================================================
 # CACHING
 # ============================================================
 CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Days before a cached indicator is considered stale and re-fetched.
+# Fast-moving series expire sooner; slow structural ones can sit for months.
+DEFAULT_CACHE_TTL_DAYS = 30
+CACHE_TTL_DAYS = {
+    "inflation":        7,
+    "unemployment":     7,
+    "area":             365,
+    "forestCover":      180,
+    "populationDensity": 90,
+    "literacy":         90,
+}
+
+STORE_DIR = os.path.join(CACHE_DIR, "wb")
+WPP_SERIES_FILE = os.path.join(CACHE_DIR, "wpp2024.series")   # pipeline_v4_extract.py
+WPP_AREA_FALLBACK = 100   # years
+COVERAGE_RANGE = 100      # years: the coverage matrix records any cached year
+GAP_MRV = 5               # most recent values requested per gap country
+GAP_RECHECK_DAYS = 30     # days before --fill-gaps asks again for a checked gap
+
+# Store layout: one file per indicator holding every downloaded point,
+#   {"fetchedAt", "indicator", "years": [start, end],
+#    "countries": [iso3, ...] or null for country/all,
+#    "points": {iso3: {year: value}}}
+# Closest-year selection for a --year/--fallback runs locally on top of it,
+# so changing either never needs a new download while the window covers it.
+#
+# Stores are written as JSON ({name}.json) or, with --cache-format
+# columnar, as memory-mapped column files ({name}.col, see colstore.py).
+# Either format is read back; saving one removes the other.
+CACHE_FORMATS = {"json": ".json", "columnar": colstore.EXTENSION}
+CACHE_FORMAT = "json"
+
+def get_store_path(name, cache_format=None):
+    return os.path.join(STORE_DIR, f"{name}{CACHE_FORMATS[cache_format or CACHE_FORMAT]}")
+
+def save_store(name, store, cache_format=None):
+    cache_format = cache_format or CACHE_FORMAT
+    os.makedirs(STORE_DIR, exist_ok=True)
+    path = get_store_path(name, cache_format)
+    if cache_format == "columnar":
+        colstore.write_store(path, store, WB_FIELD_MAP[name][1])
+    else:
+        with open(path, 'w') as f:
+            json.dump({
+                "fetchedAt": store["fetchedAt"],
+                "indicator": WB_FIELD_MAP[name][1],
+                "years": store["years"],
+                "countries": store.get("countries"),
+                "points": {iso3: {str(y): v for y, v in series.items()}
+                           for iso3, series in store["points"].items()},
+            }, f, indent=2)
+    for other in CACHE_FORMATS:
+        if other != cache_format and os.path.exists(get_store_path(name, other)):
+            os.remove(get_store_path(name, other))
+    return path
+
+def load_store(name):
+    """Read one indicator store in whichever format is on disk (the
+    configured one first), or None."""
+    for cache_format in sorted(CACHE_FORMATS, key=lambda f: f != CACHE_FORMAT):
+        path = get_store_path(name, cache_format)
+        if not os.path.exists(path):
+            continue
+        if cache_format == "columnar":
+            return colstore.read_store(path)
+        with open(path, 'r') as f:
+            cached = json.load(f)
+        return {
+            "fetchedAt": cached["fetchedAt"],
+            "years": cached["years"],
+            "countries": cached.get("countries"),
+            "points": {iso3: {int(y): v for y, v in series.items()}
+                       for iso3, series in cached["points"].items()},
+        }
+    return None
+
+def load_legacy_points(stores):
+    """Seed stores from the old per-year caches (wb_data_{year}.json and
+    wb_{year}/{name}.json). They only hold one point per country and no
+    known window, so they satisfy --cache runs but never count as fresh."""
+    if not os.path.isdir(CACHE_DIR):
+        return
+    legacy = []
+    for entry in sorted(os.listdir(CACHE_DIR)):
+        path = os.path.join(CACHE_DIR, entry)
+        if entry.startswith("wb_data_") and entry.endswith(".json"):
+            with open(path, 'r') as f:
+                cached = json.load(f)
+            legacy.extend((cached["fetchedAt"], name, data)
+                          for name, data in cached["data"].items())
+        elif entry.startswith("wb_") and entry[3:].isdigit() and os.path.isdir(path):
+            for fname in sorted(os.listdir(path)):
+                with open(os.path.join(path, fname), 'r') as f:
+                    cached = json.load(f)
+                legacy.append((cached["fetchedAt"], fname[:-len(".json")], cached["data"]))
+
+    for fetched_at, name, data in legacy:
+        if name not in WB_FIELD_MAP:
+            continue
+        store = stores.setdefault(name, {"fetchedAt": fetched_at, "years": None, "points": {}})
+        store["fetchedAt"] = min(store["fetchedAt"], fetched_at)
+        for iso3, d in data.items():
+            store["points"].setdefault(iso3, {}).setdefault(d["year"], d["value"])
+
+def load_cache_entries():
+    """Load every cached indicator store as {name: store}."""
+    stores = {}
+    for name in WB_FIELD_MAP:
+        store = load_store(name)
+        if store is not None:
+            stores[name] = store
+    legacy = {}
+    load_legacy_points(legacy)
+    for name, store in legacy.items():
+        stores.setdefault(name, store)
+
+    if stores:
+        oldest = min(e["fetchedAt"] for e in stores.values())
+        print(f"  📦 Cache loaded: {len(stores)} indicators from {CACHE_DIR}")
+        print(f"     Oldest fetch: {oldest}")
+    return stores
+
+def convert_cache():
+    """Rewrite every indicator store in CACHE_FORMAT."""
+    converted = 0
+    for name in WB_FIELD_MAP:
+        store = load_store(name)
+        if store is None:
+            continue
+        before = os.path.getsize(next(get_store_path(name, f) for f in CACHE_FORMATS
+                                      if os.path.exists(get_store_path(name, f))))
+        if isinstance(store["points"], colstore.ColumnarPoints):
+            store["points"] = colstore.to_dict_points(store["points"])
+        path = save_store(name, store)
+        converted += 1
+        print(f"  🔄 {name}: {before / 1024:.0f} KB → {os.path.getsize(path) / 1024:.0f} KB")
+    print(f"  💾 {converted} stores in {CACHE_FORMAT} format: {STORE_DIR}/")
+
+def select_closest(points, year, fallback_range):
+    """Pick each country's value closest to year within ±fallback_range.
+
+    Ties go to the later year, matching the order the API returns dates in
+    (newest first) and therefore the old first-seen-wins reduction.
+    """
+    if isinstance(points, colstore.ColumnarPoints):
+        return points.select_closest(year, fallback_range)
+    results = {}
+    for iso3, series in points.items():
+        best = None
+        for y in series:
+            if abs(y - year) > fallback_range:
+                continue
+            if best is None or (abs(y - year), -y) < (abs(best - year), -best):
+                best = y
+        if best is not None:
+            results[iso3] = {"value": series[best], "year": best}
+    return results
 
-def get_cache_path(year):
-    return os.path.join(CACHE_DIR, f"wb_data_{year}.json")
-
-def save_cache(all_data, year):
-    os.makedirs(CACHE_DIR, exist_ok=True)
-    path = get_cache_path(year)
-    with open(path, 'w') as f:
-        json.dump({
-            "fetchedAt": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "targetYear": year,
-            "data": all_data
-        }, f, indent=2)
-    size_kb = os.path.getsize(path) / 1024
-    print(f"  💾 Cache saved: {path} ({size_kb:.0f} KB)")
-
-def load_cache(year):
-    path = get_cache_path(year)
+def select_all(stores, year, fallback_range):
+    return {name: select_closest(stores[name]["points"], year, fallback_range)
+            for name in WB_FIELD_MAP if name in stores}
+
+def fill_from_wpp(all_data, store, year, area):
+    """Fill population and populationDensity where WB has no value in the
+    window with the WPP median projection for `year` (WB units: people,
+    and people per sq km over `area`, {iso3: {"value": sq km}}).
+    Returns {field: countries filled}."""
+    if year not in store.years:
+        return {}
+    population = all_data.setdefault("population", {})
+    density = all_data.setdefault("populationDensity", {})
+    filled = Counter()
+    for iso3, thousands in store.at_year("population", year).items():
+        if iso3 not in population:
+            population[iso3] = {"value": thousands * 1000, "year": year}
+            filled["population"] += 1
+        sq_km = (area.get(iso3) or {}).get("value")
+        if iso3 not in density and sq_km:
+            density[iso3] = {"value": population[iso3]["value"] / sq_km, "year": year}
+            filled["populationDensity"] += 1
+    return dict(filled)
+
+def covers(store, start_year, end_year, countries=None):
+    """True if the store holds the year window for the requested countries
+    (None = country/all)."""
+    if store.get("years") is None:
+        return False
+    if not (store["years"][0] <= start_year and end_year <= store["years"][1]):
+        return False
+    stored = store.get("countries")
+    if stored is None:
+        return True
+    return countries is not None and set(countries) <= set(stored)
+
+def is_expired(name, entry, now=None):
+    ttl_days = CACHE_TTL_DAYS.get(name, DEFAULT_CACHE_TTL_DAYS)
+    fetched = time.mktime(time.strptime(entry["fetchedAt"], TIMESTAMP_FORMAT))
+    return (now or time.time()) - fetched > ttl_days * 86400
+
+
+# --- Resumable fetch checkpoints ---
+# A run writes plan.json (windows + countries + start time) before it
+# fetches, saves each indicator's store as soon as it completes, and keeps
+# every finished page of in-flight indicators in {name}.json. An indicator
+# whose fetch fails keeps its checkpoint (and the plan) for the next run.
+# --resume re-runs the plan for the indicators not stored complete since it
+# started, replaying checkpointed pages instead of requesting them again.
+CHECKPOINT_DIR = os.path.join(STORE_DIR, ".checkpoint")
+
+def write_json_atomic(path, obj):
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump(obj, f)
+    os.replace(tmp, path)
+
+def save_plan(windows, countries):
+    os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+    write_json_atomic(os.path.join(CHECKPOINT_DIR, "plan.json"), {
+        "startedAt": time.strftime(TIMESTAMP_FORMAT),
+        "windows": {name: list(w) for name, w in windows.items()},
+        "countries": countries,
+    })
+
+def load_plan():
+    path = os.path.join(CHECKPOINT_DIR, "plan.json")
     if not os.path.exists(path):
         return None
     with open(path, 'r') as f:
-        cached = json.load(f)
-    print(f"  📦 Cache loaded: {path}")
-    print(f"     Fetched at: {cached['fetchedAt']}")
-    return cached["data"]
+        return json.load(f)
+
+def clear_checkpoints():
+    if not os.path.isdir(CHECKPOINT_DIR):
+        return
+    for fname in os.listdir(CHECKPOINT_DIR):
+        os.remove(os.path.join(CHECKPOINT_DIR, fname))
+    os.rmdir(CHECKPOINT_DIR)
+
+
+class IndicatorCheckpoint:
+    """Finished pages of one in-flight indicator, rewritten after each page.
+
+    Pages are keyed by request (country batch or mrv fallback) and page
+    number and keep only the points collect_points would use, in API order,
+    so replaying them reproduces the same store.
+    """
+
+    def __init__(self, name, window, countries, resume=False):
+        self.path = os.path.join(CHECKPOINT_DIR, f"{name}.json")
+        self.state = {"window": list(window), "countries": countries, "pages": {}}
+        if resume and os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                saved = json.load(f)
+            if saved["window"] == self.state["window"] and saved["countries"] == countries:
+                self.state = saved
+
+    def get(self, key, page):
+        """(total_pages, points) for a finished page, else None."""
+        saved = self.state["pages"].get(f"{key}#{page}")
+        if saved is None:
+            return None
+        total_pages, points = saved
+        return total_pages, [tuple(p) for p in points]
+
+    def put(self, key, page, total_pages, points):
+        page_key = f"{key}#{page}"
+        if page_key in self.state["pages"]:
+            return
+        self.state["pages"][page_key] = [total_pages, [list(p) for p in points]]
+        os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+        write_json_atomic(self.path, self.state)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
 
 
 # ============================================================
-# DATA FETCHING
+# RATE LIMITING
 # ============================================================
 
-def fetch_wb_indicator(indicator_code, year, fallback_range=2):
-    """Fetch one indicator for all countries. Uses date range, picks closest year."""
-    start_year = year - fallback_range
-    end_year = year + fallback_range
+class TokenBucket:
+    """Thread-safe token bucket shared by every fetch worker.
 
-    results = {}
-    page = 1
-    total_pages = 1
+    Replaces the old fixed sleep after each page: requests go out as soon
+    as a token is available, and the bucket caps the combined request rate
+    no matter how many workers are running.
+    """
 
-    while page <= total_pages:
-        url = (
-            f"https://api.worldbank.org/v2/country/all/indicator/{indicator_code}"
-            f"?date={start_year}:{end_year}&format=json&per_page=1000&page={page}"
-        )
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# 4 requests/s matches the old sleep(0.25) pace of the sequential path
+RATE_LIMITER = TokenBucket(rate=4)
+
+
+# ============================================================
+# HTTP SESSION
+# ============================================================
+
+WB_API_BASE = os.environ.get("WB_API_BASE", "https://api.worldbank.org/v2")
+STREAM_CHUNK_SIZE = 16 * 1024
+
+
+class BodyReadError(URLError):
+    """The connection failed after the response body had started."""
+
+
+class CircuitOpenError(URLError):
+    """Raised without touching the network while the breaker is open."""
+
+
+class WBSession:
+    """Keep-alive HTTP client shared by all fetch workers.
+
+    - Connections are pooled per host and reused across pages, so only the
+      first request to a host pays the TCP+TLS handshake.
+    - 429/5xx responses and connection errors are retried with bounded
+      exponential backoff; other HTTP errors are raised immediately.
+    - After `breaker_threshold` consecutive failed requests the circuit
+      opens and requests fail fast with CircuitOpenError for
+      `breaker_cooldown` seconds. The first request after that is a trial:
+      the other workers wait until it is done, then go ahead if it closed
+      the circuit or fail fast again if it reopened it.
+    - Every attempt records (url, status, latency, bytes) for print_stats.
+
+    base_url is where page URLs are built from; point it at a replay
+    server (wb_replay.py) to run the fetcher offline.
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, base_url=WB_API_BASE, timeout=30, max_retries=3, backoff_base=0.5,
+                 backoff_max=8.0, breaker_threshold=5, breaker_cooldown=30.0, limiter=None):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self.limiter = limiter
+        self.pools = {}
+        self.lock = threading.Lock()
+        self.failures = 0
+        self.opened_at = None
+        self.trial = None       # thread id of the half-open trial request
+        self.trial_done = threading.Condition(self.lock)
+        self.stats = []
+        self.retries = 0
+
+    # --- connection pool ---
+
+    def _pool(self, scheme, netloc):
+        with self.lock:
+            return self.pools.setdefault((scheme, netloc), queue.LifoQueue())
+
+    def _checkout(self, scheme, netloc):
         try:
-            req = Request(url, headers={"User-Agent": "ApplesToApples/3.0"})
-            with urlopen(req, timeout=30) as resp:
-                data = json.loads(resp.read().decode())
+            return self._pool(scheme, netloc).get_nowait()
+        except queue.Empty:
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            return cls(netloc, timeout=self.timeout)
+
+    def _checkin(self, scheme, netloc, conn):
+        self._pool(scheme, netloc).put(conn)
+
+    def close(self):
+        with self.lock:
+            pools, self.pools = self.pools, {}
+        for pool in pools.values():
+            while not pool.empty():
+                pool.get_nowait().close()
+
+    # --- circuit breaker ---
+
+    def _check_circuit(self, url):
+        with self.lock:
+            while self.trial is not None:
+                self.trial_done.wait()
+            if self.opened_at is None:
+                return
+            if time.monotonic() - self.opened_at < self.breaker_cooldown:
+                raise CircuitOpenError(f"circuit open, skipping {url}")
+            # Half-open: let this request through as the only trial
+            self.opened_at = None
+            self.failures = self.breaker_threshold - 1
+            self.trial = threading.get_ident()
+
+    def _end_trial(self):
+        """Wake the requests held back by this thread's trial, if any.
+        The caller holds self.lock."""
+        if self.trial == threading.get_ident():
+            self.trial = None
+            self.trial_done.notify_all()
+
+    def _record_outcome(self, ok):
+        with self.lock:
+            if ok:
+                self.failures = 0
+            else:
+                self.failures += 1
+                if self.failures >= self.breaker_threshold and self.opened_at is None:
+                    self.opened_at = time.monotonic()
+                    print(f"    ⛔ World Bank API failing ({self.failures} in a row), "
+                          f"pausing requests for {self.breaker_cooldown:.0f}s")
+            self._end_trial()
+
+    # --- requests ---
+
+    def _request_once(self, url):
+        """One attempt → (connection, response) with the body still unread.
+        Raises OSError on connection problems."""
+        parts = urlsplit(url)
+        target = parts.path + (f"?{parts.query}" if parts.query else "")
+        conn = self._checkout(parts.scheme, parts.netloc)
+        try:
+            conn.request("GET", target, headers={
+                "User-Agent": "ApplesToApples/3.0",
+                "Accept-Encoding": "gzip",
+                "Connection": "keep-alive",
+            })
+            return conn, conn.getresponse()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            raise
+
+    def _release(self, url, conn, resp, started, nbytes):
+        """Record the finished attempt and return the connection to its pool."""
+        with self.lock:
+            self.stats.append((url, resp.status, time.monotonic() - started, nbytes))
+        if resp.will_close:
+            conn.close()
+        else:
+            parts = urlsplit(url)
+            self._checkin(parts.scheme, parts.netloc, conn)
+
+    def _backoff(self, attempt, retry_after=None):
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        if retry_after and retry_after.isdigit():
+            delay = min(self.backoff_max, max(delay, int(retry_after)))
+        with self.lock:
+            self.retries += 1
+        time.sleep(delay)
+
+    def _open(self, url):
+        """Send the request, retrying transient failures, until a < 400
+        response arrives → (connection, response, start time).
+
+        Raises HTTPError for final HTTP errors and URLError for connection
+        failures, like urlopen did.
+        """
+        self._check_circuit(url)
+        for attempt in range(self.max_retries + 1):
+            last = attempt == self.max_retries
+            if self.limiter:
+                self.limiter.acquire()
+            started = time.monotonic()
+            try:
+                conn, resp = self._request_once(url)
+                if resp.status >= 400:
+                    drained = False
+                    try:
+                        nbytes = len(resp.read())
+                        drained = True
+                    finally:
+                        if not drained:
+                            conn.close()
+                    self._release(url, conn, resp, started, nbytes)
+            except (OSError, http.client.HTTPException) as e:
+                with self.lock:
+                    self.stats.append((url, None, time.monotonic() - started, 0))
+                if last:
+                    self._record_outcome(False)
+                    raise URLError(e)
+                self._backoff(attempt)
+                continue
 
-            if not data or len(data) < 2 or not data[1]:
-                break
+            if resp.status < 400:
+                return conn, resp, started
+            if resp.status in self.RETRY_STATUSES and not last:
+                self._backoff(attempt, resp.headers.get("Retry-After"))
+                continue
+            self._record_outcome(resp.status not in self.RETRY_STATUSES)
+            raise HTTPError(url, resp.status, http.client.responses.get(resp.status, ""),
+                            resp.headers, None)
+
+    def stream(self, url, chunk_size=STREAM_CHUNK_SIZE):
+        """GET url and yield the (decompressed) body in chunks as it arrives.
+
+        Failures before the body starts are retried as in get(); a
+        connection lost mid-body raises BodyReadError, since chunks already
+        handed out cannot be taken back. A caller that stops early closes
+        the connection instead of returning it to the pool.
+        """
+        try:
+            conn, resp, started = self._open(url)
+        except BaseException:
+            with self.lock:
+                self._end_trial()
+            raise
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS) \
+            if resp.getheader("Content-Encoding") == "gzip" else None
+        nbytes, finished = 0, False
+        try:
+            while True:
+                raw = resp.read(chunk_size)
+                if not raw:
+                    if resp.length:  # read(amt) returns b"" on a short body
+                        raise http.client.IncompleteRead(b"", resp.length)
+                    break
+                nbytes += len(raw)
+                chunk = decoder.decompress(raw) if decoder else raw
+                if chunk:
+                    yield chunk
+            if decoder:
+                tail = decoder.flush()
+                if tail:
+                    yield tail
+            finished = True
+        except (OSError, http.client.HTTPException, zlib.error) as e:
+            with self.lock:
+                self.stats.append((url, None, time.monotonic() - started, nbytes))
+            self._record_outcome(False)
+            raise BodyReadError(e)
+        finally:
+            if not finished:
+                conn.close()
+                with self.lock:
+                    self._end_trial()
+        self._release(url, conn, resp, started, nbytes)
+        self._record_outcome(True)
+
+    def get(self, url):
+        """GET url and return the whole body (see stream())."""
+        return b"".join(self.stream(url))
+
+    def print_stats(self):
+        with self.lock:
+            stats = list(self.stats)
+        if not stats:
+            return
+        latencies = sorted(s[2] for s in stats)
+        total_bytes = sum(s[3] for s in stats)
+        failed = sum(1 for s in stats if s[1] is None or s[1] >= 400)
+
+        def pct(p):
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+        print(f"  🌐 {len(stats)} requests ({self.retries} retries, {failed} failed), "
+              f"{total_bytes / 1024:.0f} KB received")
+        print(f"     latency p50 {pct(0.5):.0f} ms, p95 {pct(0.95):.0f} ms, "
+              f"max {latencies[-1] * 1000:.0f} ms")
+
+
+SESSION = WBSession(limiter=RATE_LIMITER)
 
-            total_pages = data[0].get("pages", 1)
 
-            for entry in data[1]:
-                iso3 = entry.get("countryiso3code", "")
-                value = entry.get("value")
-                date_str = entry.get("date", "")
+# ============================================================
+# DATA FETCHING
+# ============================================================
 
-                if not iso3 or value is None:
-                    continue
-                try:
-                    entry_year = int(date_str)
-                except (ValueError, TypeError):
-                    continue
-
-                # Keep closest to target year
-                if iso3 not in results:
-                    results[iso3] = {"value": float(value), "year": entry_year}
-                else:
-                    if abs(entry_year - year) < abs(results[iso3]["year"] - year):
-                        results[iso3] = {"value": float(value), "year": entry_year}
-
-            page += 1
-            time.sleep(0.25)
-
-        except (HTTPError, URLError) as e:
-            print(f"    ⚠️  Error: {e}")
-            # Fallback: try mrv=5
-            if page == 1:
-                return fetch_wb_fallback(indicator_code, year, fallback_range)
-            break
-        except json.JSONDecodeError as e:
-            print(f"    ⚠️  JSON error: {e}")
+class PageParser:
+    """Incremental parser for one World Bank API page body.
+
+    A page is `[meta, [entry, ...]]` (or `[meta, null]`, or just `[message]`
+    for API errors). Chunks are decoded as they arrive and each entry is
+    parsed on its own and turned into a point straight away, so neither the
+    whole body nor the full list of entry dicts is ever held. `meta` is set
+    once the first element has been read; `points()` then yields the usable
+    (iso3, year, value) points and leaves `has_entries` False when the
+    entry list is missing, null or empty.
+    """
+
+    _decoder = json.JSONDecoder()
+    _whitespace = " \t\n\r"
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.text = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.done = False
+        self.meta = None
+        self.has_entries = False
+
+    def _more(self):
+        if self.done:
+            return False
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.done = True
+            text = self.text.decode(b"", final=True)
+        else:
+            text = self.text.decode(chunk)
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+        return True
+
+    def _peek(self):
+        """Next non-whitespace character ("" at end of body)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in self._whitespace:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._more():
+                return ""
+
+    def _expect(self, chars):
+        ch = self._peek()
+        if not ch or ch not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self.buf, self.pos)
+        self.pos += 1
+        return ch
+
+    def _value(self):
+        """Decode the next object (or null). Only self-delimiting values are
+        read this way, so a value cut off at a chunk boundary always fails
+        to decode instead of parsing short."""
+        self._peek()
+        while True:
+            try:
+                value, self.pos = self._decoder.raw_decode(self.buf, self.pos)
+                return value
+            except json.JSONDecodeError:
+                if not self._more():
+                    raise
+
+    def points(self):
+        self._expect("[")
+        self.meta = self._value()
+        if self._expect(",]") == "]":
+            return
+        if self._peek() == "n":
+            self._value()
+        else:
+            self._expect("[")
+            if self._peek() == "]":
+                self.pos += 1
+            else:
+                self.has_entries = True
+                while True:
+                    point = entry_point(self._value())
+                    if point is not None:
+                        yield point
+                    if self._expect(",]") == "]":
+                        break
+        self._expect("]")
+        if self._peek():  # also drains the body, so the connection can be reused
+            raise json.JSONDecodeError("Extra data", self.buf, self.pos)
+
+
+def fetch_wb_page(url):
+    """GET one World Bank API page through the shared session, parsing it
+    as it streams in → (total_pages, points or None).
+
+    points is None when the page has no entry list (API error message or
+    past the last page). A connection lost mid-body drops the partial page
+    and retries it, like a failed request.
+    """
+    for attempt in range(SESSION.max_retries + 1):
+        chunks = SESSION.stream(url)
+        page = PageParser(chunks)
+        try:
+            points = list(page.points())
+        except BodyReadError:
+            if attempt == SESSION.max_retries:
+                raise
+            SESSION._backoff(attempt)
+            continue
+        finally:
+            chunks.close()
+        meta = page.meta if isinstance(page.meta, dict) else {}
+        return meta.get("pages", 1), points if page.has_entries else None
+
+
+def fetch_remaining_pages(fetch_page, total_pages, pool=None):
+    """Yield (page, result or exception) for pages 2..total_pages in order.
+
+    With a pool the pages are requested in parallel, but they are still
+    yielded in page order so the reduction matches the sequential path.
+    """
+    pages = range(2, total_pages + 1)
+    if pool is None:
+        for page in pages:
+            try:
+                yield page, fetch_page(page)
+            except Exception as e:
+                yield page, e
+        return
+
+    futures = [(page, pool.submit(fetch_page, page)) for page in pages]
+    for page, future in futures:
+        try:
+            yield page, future.result()
+        except Exception as e:
+            yield page, e
+
+
+def entry_point(entry):
+    """(iso3, year, value) for a usable API entry, else None."""
+    iso3 = entry.get("countryiso3code", "")
+    value = entry.get("value")
+    date_str = entry.get("date", "")
+
+    if not iso3 or iso3 in WB_AGGREGATES or value is None:
+        return None
+    try:
+        entry_year = int(date_str)
+    except (ValueError, TypeError):
+        return None
+    return iso3, entry_year, float(value)
+
+
+def collect_points(results, points):
+    """Fold (iso3, year, value) points into {iso3: {year: value}}, keeping
+    every year."""
+    for iso3, year, value in points:
+        results.setdefault(iso3, {}).setdefault(year, value)
+
+
+def checkpointed_fetcher(page_url, checkpoint, key):
+    """page → (total_pages, points), served from the checkpoint when the
+    page is already done."""
+    def fetch_page(page):
+        if checkpoint is not None:
+            saved = checkpoint.get(key, page)
+            if saved is not None:
+                return saved
+        return fetch_wb_page(page_url(page))
+    return fetch_page
+
+
+def fetch_wb_indicator(indicator_code, start_year, end_year, pool=None, countries="all",
+                       checkpoint=None):
+    """Fetch one indicator over a date range for `countries` (a country/
+    path segment: "all" or "USA;CHN;...").
+
+    Returns (points, complete): every (iso3, year, value) point as
+    {iso3: {year: value}}, and False if a page failed or the mrv fallback
+    stood in for the range, so the points are not the whole window.
+    Closest-year selection happens later in select_closest. Page 1 is
+    fetched first to learn total_pages; with a pool the remaining pages are
+    then fetched in parallel. Each page is recorded in `checkpoint` once it
+    has been folded in.
+    """
+
+    def page_url(page):
+        return (
+            f"{SESSION.base_url}/country/{countries}/indicator/{indicator_code}"
+            f"?date={start_year}:{end_year}&format=json&per_page=1000&page={page}"
+        )
+
+    fetch_page = checkpointed_fetcher(page_url, checkpoint, countries)
+
+    results = {}
+    try:
+        total_pages, points = fetch_page(1)
+    except (HTTPError, URLError) as e:
+        print(f"    ⚠️  Error: {e}")
+        # Fallback: try mrv=5 (recent values only, never the whole window)
+        results, _ = fetch_wb_fallback(indicator_code, pool, countries, checkpoint)
+        return results, False
+    except json.JSONDecodeError as e:
+        print(f"    ⚠️  JSON error: {e}")
+        return results, False
+
+    if points is None:
+        return results, True
+    collect_points(results, points)
+    if checkpoint is not None:
+        checkpoint.put(countries, 1, total_pages, points)
+
+    for page, result in fetch_remaining_pages(fetch_page, total_pages, pool):
+        if isinstance(result, (HTTPError, URLError)):
+            print(f"    ⚠️  Error: {result}")
+            return results, False
+        if isinstance(result, json.JSONDecodeError):
+            print(f"    ⚠️  JSON error: {result}")
+            return results, False
+        if isinstance(result, Exception):
+            raise result
+        _, points = result
+        if points is None:
             break
+        collect_points(results, points)
+        if checkpoint is not None:
+            checkpoint.put(countries, page, total_pages, points)
 
-    return results
+    return results, True
 
 
-def fetch_wb_fallback(indicator_code, year, fallback_range):
-    """Fallback using mrv parameter."""
+def fetch_wb_fallback(indicator_code, pool=None, countries="all", checkpoint=None, mrv=5):
+    """Fallback using mrv parameter (most recent `mrv` values per country).
+    Returns (points, complete) like fetch_wb_indicator."""
     url = (
-        f"https://api.worldbank.org/v2/country/all/indicator/{indicator_code}"
-        f"?mrv=5&format=json&per_page=1000"
+        f"{SESSION.base_url}/country/{countries}/indicator/{indicator_code}"
+        f"?mrv={mrv}&format=json&per_page=1000"
     )
-    results = {}
-    page = 1
-    total_pages = 1
 
-    while page <= total_pages:
-        page_url = f"{url}&page={page}"
-        try:
-            req = Request(page_url, headers={"User-Agent": "ApplesToApples/3.0"})
-            with urlopen(req, timeout=30) as resp:
-                data = json.loads(resp.read().decode())
-
-            if not data or len(data) < 2 or not data[1]:
-                break
-            total_pages = data[0].get("pages", 1)
-
-            for entry in data[1]:
-                iso3 = entry.get("countryiso3code", "")
-                value = entry.get("value")
-                date_str = entry.get("date", "")
-                if not iso3 or value is None:
-                    continue
-                try:
-                    entry_year = int(date_str)
-                except (ValueError, TypeError):
-                    continue
-                if abs(entry_year - year) > fallback_range:
-                    continue
-                if iso3 not in results or abs(entry_year - year) < abs(results[iso3]["year"] - year):
-                    results[iso3] = {"value": float(value), "year": entry_year}
-
-            page += 1
-            time.sleep(0.25)
-        except Exception as e:
-            print(f"    ⚠️  Fallback error: {e}")
+    def page_url(page):
+        return f"{url}&page={page}"
+
+    key = f"mrv:{countries}"
+    fetch_page = checkpointed_fetcher(page_url, checkpoint, key)
+
+    results = {}
+    try:
+        total_pages, points = fetch_page(1)
+    except Exception as e:
+        print(f"    ⚠️  Fallback error: {e}")
+        return results, False
+
+    if points is None:
+        return results, True
+    collect_points(results, points)
+    if checkpoint is not None:
+        checkpoint.put(key, 1, total_pages, points)
+
+    for page, result in fetch_remaining_pages(fetch_page, total_pages, pool):
+        if isinstance(result, Exception):
+            print(f"    ⚠️  Fallback error: {result}")
+            return results, False
+        _, points = result
+        if points is None:
             break
+        collect_points(results, points)
+        if checkpoint is not None:
+            checkpoint.put(key, page, total_pages, points)
 
-    return results
+    return results, True
 
 
-def fetch_all_indicators(target_year, fallback_range):
-    """Fetch all WB indicators."""
+def fetch_wb_indicator_batched(indicator_code, start_year, end_year, pool=None, countries=None,
+                               checkpoint=None):
+    """fetch_wb_indicator over country batches (None = country/all)
+    → (points, complete: every batch complete)."""
+    results = {}
+    complete = True
+    for batch in country_batches(countries):
+        points, batch_complete = fetch_wb_indicator(indicator_code, start_year, end_year,
+                                                    pool, batch, checkpoint)
+        for iso3, series in points.items():
+            results.setdefault(iso3, {}).update(series)
+        complete = complete and batch_complete
+    return results, complete
+
+
+def fetch_indicator_task(name, window, pool, countries, resume, on_done):
+    """Fetch one indicator with page checkpoints, then hand it to
+    on_done(name, points, complete) (which stores it). The checkpoint is
+    only dropped once the fetch completed, so --resume can pick up the
+    pages of a failed one. Returns (points, complete)."""
+    checkpoint = IndicatorCheckpoint(name, window, countries, resume)
+    data, complete = fetch_wb_indicator_batched(WB_FIELD_MAP[name][1], *window, pool,
+                                                countries, checkpoint)
+    if on_done is not None:
+        on_done(name, data, complete)
+    if complete:
+        checkpoint.clear()
+    return data, complete
+
+
+def store_fetched(stores, name, points, complete, window, countries):
+    """Save a finished fetch as the indicator's store. A complete fetch
+    replaces the store; an incomplete one (failed or cut short) only adds
+    its points to the cached store, keeping its fetchedAt and window, so it
+    is still due for a refetch and never hides older cached data behind an
+    empty "fresh" store. Returns the saved store, or None."""
+    if complete:
+        store = {"fetchedAt": time.strftime(TIMESTAMP_FORMAT), "years": list(window),
+                 "countries": countries, "points": points}
+    elif not points:
+        return None
+    elif name in stores:
+        old = stores[name]
+        merged = {iso3: dict(old["points"][iso3]) for iso3 in old["points"]}
+        for iso3, series in points.items():
+            merged.setdefault(iso3, {}).update(series)
+        store = dict(old, points=merged)
+    else:
+        store = {"fetchedAt": time.strftime(TIMESTAMP_FORMAT), "years": None,
+                 "countries": countries, "points": points}
+    save_store(name, store)
+    stores[name] = store
+    return store
+
+
+def fill_gaps(stores, coverage, max_lag, workers=1, mrv=GAP_MRV):
+    """Fetch only the cells `coverage` shows missing or more than max_lag
+    years old: one country/A;B;C?mrv=N request per indicator and batch of
+    gap countries, instead of a full-window or fetch_wb_fallback sweep.
+    New and revised points are merged into the stores (fetchedAt and
+    window unchanged, so freshness rules still apply) and saved. Every
+    cell of a batch that was fetched completely is marked checked in
+    `coverage`, value or not, and is skipped for GAP_RECHECK_DAYS.
+    Returns {name: (countries requested, new points, revised points)}."""
+    gaps = coverage.gaps(max_lag, recheck_cutoff())
+    if not gaps:
+        return {}
+    print(f"🩹 Filling {sum(len(c) for c in gaps.values())} gap cells in "
+          f"{len(gaps)} indicators (mrv={mrv})...\n")
+
+    def fetch(name):
+        points, checked = {}, []
+        for batch in country_batches(gaps[name]):
+            fetched, complete = fetch_wb_fallback(WB_FIELD_MAP[name][1], None, batch, mrv=mrv)
+            for iso3, series in fetched.items():
+                points.setdefault(iso3, {}).update(series)
+            if complete:
+                checked.extend(batch.split(";"))
+        return points, checked
+
+    if workers <= 1:
+        fetched = {name: fetch(name) for name in gaps}
+    else:
+        with ThreadPoolExecutor(workers) as pool:
+            fetched = dict(zip(gaps, pool.map(fetch, gaps)))
+
+    now = time.strftime(TIMESTAMP_FORMAT)
+    result = {}
+    for name, (points, checked) in fetched.items():
+        coverage.mark_checked(name, checked, now)
+        store = stores.get(name) or {"fetchedAt": now, "years": None,
+                                     "countries": gaps[name], "points": {}}
+        merged = {iso3: dict(store["points"][iso3]) for iso3 in store["points"]}
+        added = revised = 0
+        for iso3, series in points.items():
+            known = merged.setdefault(iso3, {})
+            for year, value in series.items():
+                if year not in known:
+                    added += 1
+                elif known[year] != value:
+                    revised += 1
+                known[year] = value
+        if added or revised:
+            store = dict(store, points=merged)
+            save_store(name, store)
+            stores[name] = store
+        result[name] = (len(gaps[name]), added, revised)
+        print(f"  {'✅' if added or revised else '➖'} {name}: {len(gaps[name])} countries, "
+              f"{added} new points" + (f", {revised} revised" if revised else ""))
+    return result
+
+def recheck_cutoff(now=None):
+    """Gap cells checked at or after this timestamp are not requested again."""
+    return time.strftime(TIMESTAMP_FORMAT,
+                         time.localtime((now or time.time()) - GAP_RECHECK_DAYS * 86400))
+
+def build_coverage(stores, year, previous=None):
+    """Coverage matrix of the cache for the mapped countries, keeping the
+    gap checks of `previous` that are not due again yet."""
+    cutoff = recheck_cutoff()
+    checked = {name: {iso3: at for iso3, at in cells.items() if at >= cutoff}
+               for name, cells in (previous.checked if previous else {}).items()}
+    return Coverage.build(select_all(stores, year, COVERAGE_RANGE), year,
+                          target_iso3(), list(WB_FIELD_MAP), checked)
+
+def coverage_path(data_file):
+    return os.path.join(os.path.dirname(data_file), "data_coverage.json")
+
+def report_indicator(data, complete=True):
+    count = len(data)
+    icon = "✅" if count > 100 and complete else ("⚠️" if count > 0 else "❌")
+    print(f"    {icon} {count} countries" + ("" if complete else " (fetch incomplete)"))
+
+
+def fetch_all_indicators(windows, workers=1, countries=None, on_done=None, resume=False):
+    """Fetch WB indicators, {name: (start_year, end_year)} → {name: points}.
+
+    countries is a list of ISO3 codes requested in batches, or None for
+    country/all. on_done(name, points, complete) is called as soon as each
+    indicator finishes, complete=False if any of its requests failed; with
+    resume, checkpointed pages are replayed, not refetched.
+
+    workers=1 keeps the original one-at-a-time sweep. With more workers,
+    indicators are fetched concurrently and each indicator's pages 2..N are
+    fetched in parallel; results are assembled in WB_FIELD_MAP order so the
+    cache file is identical to the sequential one.
+    """
     all_data = {}
-    wb_codes = {name: info[1] for name, info in WB_FIELD_MAP.items()}
+    wb_codes = {name: info[1] for name, info in WB_FIELD_MAP.items() if name in windows}
     total = len(wb_codes)
 
-    for i, (name, code) in enumerate(wb_codes.items(), 1):
-        print(f"  [{i}/{total}] {name} ({code})...")
-        data = fetch_wb_indicator(code, target_year, fallback_range)
-        all_data[name] = data
-        count = len(data)
-        icon = "✅" if count > 100 else ("⚠️" if count > 0 else "❌")
-        print(f"    {icon} {count} countries")
+    if workers <= 1:
+        for i, (name, code) in enumerate(wb_codes.items(), 1):
+            print(f"  [{i}/{total}] {name} ({code})...")
+            data, complete = fetch_indicator_task(name, windows[name], None, countries,
+                                                  resume, on_done)
+            all_data[name] = data
+            report_indicator(data, complete)
+        return all_data
+
+    # Separate pools: indicator tasks block on their page tasks, so sharing
+    # one pool could deadlock once every worker is waiting on a page.
+    with ThreadPoolExecutor(workers) as page_pool, ThreadPoolExecutor(workers) as pool:
+        futures = {
+            name: pool.submit(fetch_indicator_task, name, windows[name],
+                              page_pool, countries, resume, on_done)
+            for name, code in wb_codes.items()
+        }
+        for i, (name, code) in enumerate(wb_codes.items(), 1):
+            data, complete = futures[name].result()
+            all_data[name] = data
+            print(f"  [{i}/{total}] {name} ({code})...")
+            report_indicator(data, complete)
 
     return all_data
 
@@ -289,53 +1245,59 @@ def fetch_all_indicators(target_year, fallback_range):
 # VALUE TRANSFORMATION
 # ============================================================
 
+def transform_column(spec, raw_values):
+    """Apply a compiled (divisor, decimals) spec to a column of raw WB
+    values; None stays None."""
+    divisor, decimals = spec
+    if divisor is not None:
+        raw_values = [None if v is None else v / divisor for v in raw_values]
+    if decimals == 0:
+        return [None if v is None else int(round(v, 0)) for v in raw_values]
+    return [None if v is None else round(v, decimals) for v in raw_values]
+
+
 def transform_value(field_name, raw_value, transform):
-    """Apply unit conversion."""
-    if raw_value is None:
-        return None
+    """Apply unit conversion to one value."""
+    return transform_column(compile_field_spec(field_name, transform), [raw_value])[0]
 
-    if transform == "div1e6":
-        v = raw_value / 1_000_000
-    elif transform == "div1e9":
-        v = raw_value / 1_000_000_000
-    elif transform == "div1e3":
-        v = raw_value / 1_000
-    else:  # "direct"
-        v = raw_value
-
-    # Format based on field
-    if field_name in ("population",):
-        return round(v, 1)  # 335.0 million
-    elif field_name in ("gdpBillions", "exports", "fdiInflow"):
-        return int(round(v, 0))  # 27360 billion
-    elif field_name in ("gdpPerCapita",):
-        return int(round(v, 0))  # 81695
-    elif field_name in ("area",):
-        return int(round(v, 0))  # 9833 thousand km²
-    elif field_name in ("populationDensity",):
-        return int(round(v, 0))  # 34 /km²
-    elif field_name == "gini":
-        return round(v, 1)
-    elif field_name in ("lifeExpectancy", "birthRate", "deathRate",
-                        "urbanization", "literacy", "manufacturing",
-                        "forestCover", "renewableEnergy", "pm25",
-                        "unemployment", "inflation", "rdExpenditure",
-                        "militarySpending", "co2PerCapita", "doctors",
-                        "hospitalBeds", "healthExpenditure"):
-        return round(v, 1)
-    else:
-        return round(v, 1)
+
+def format_column(values):
+    """Format a column of numbers for CSV output (see format_value)."""
+    return ["" if v is None
+            else str(v) if isinstance(v, int)
+            else str(int(v)) if v == int(v)
+            else str(v)
+            for v in values]
 
 
 def format_value(v):
     """Format number for CSV output."""
-    if v is None:
-        return ""
-    if isinstance(v, int):
-        return str(v)
-    if v == int(v):
-        return str(int(v))
-    return str(v)
+    return format_column([v])[0]
+
+
+def convert_column(spec, raw_values):
+    """format_column(transform_column(spec, raw_values)) in one pass.
+
+    "%.Nf" rounds exactly like round(v, N) (both are correctly rounded), so
+    below 1e15, where the shortest repr of the rounded value has the same
+    digits, the string can be built directly; larger or non-finite values
+    take the two-step path.
+    """
+    divisor, decimals = spec
+    pattern = f"%.{decimals}f"
+    if divisor is not None:
+        raw_values = [None if v is None else v / divisor for v in raw_values]
+    out = ["" if v is None else pattern % v if -1e15 < v < 1e15 else None
+           for v in raw_values]
+    if decimals:  # "335.0" → "335", like format_value on a whole float
+        out = [s.rstrip("0").rstrip(".") if s and s[-1] == "0" else s for s in out]
+    if None in out or "-0" in out:
+        for i, s in enumerate(out):
+            if s is None:
+                out[i] = format_column(transform_column((None, decimals), [raw_values[i]]))[0]
+            elif s == "-0":
+                out[i] = "0"
+    return out
 
 
 # ============================================================
@@ -343,35 +1305,27 @@ def format_value(v):
 # ============================================================
 
 def parse_data_js(filepath):
-    """Parse data.js RAW lines."""
-    import re
-    with open(filepath, 'r') as f:
-        content = f.read()
-
-    match = re.search(r'const RAW = `(.*?)`', content, re.DOTALL)
-    if not match:
+    """Parse data.js once; RAW rows become region dicts for update_countries."""
+    doc = DataJsDocument.load(filepath)
+    if doc.rows is None:
         print("ERROR: Could not find RAW template literal")
         sys.exit(1)
 
-    raw_text = match.group(1).strip()
     regions = []
-
-    for line in raw_text.split('\n'):
-        line = line.strip()
-        if not line or line.startswith('//'):
-            continue
-        parts = line.split(',')
+    for row in doc.rows:
+        parts = row.text.strip().split(',')
         if len(parts) >= 5:
             regions.append({
-                "raw": line,
+                "raw": row.text.strip(),
                 "id": parts[0].strip(),
                 "name": parts[1].strip() if len(parts) > 1 else "",
                 "type": parts[2].strip() if len(parts) > 2 else "",
                 "parts": parts,
-                "num_fields": len(parts)
+                "num_fields": len(parts),
+                "row": row,
             })
 
-    return regions, content
+    return regions, doc
 
 
 def update_countries(regions, all_data, target_year):
@@ -379,27 +1333,29 @@ def update_countries(regions, all_data, target_year):
     changes = []
     updated_ids = set()
 
-    for reg in regions:
-        if reg["type"] != "country":
-            continue
+    targets = [(reg, REGION_TO_ISO3[reg["id"]]) for reg in regions
+               if reg["type"] == "country" and REGION_TO_ISO3.get(reg["id"])]
+    wanted = {iso3 for _, iso3 in targets}
 
-        iso3 = REGION_TO_ISO3.get(reg["id"])
-        if not iso3:
+    # Convert and format each field's column once:
+    # [(field, idx, {iso3: new_str}, entries)] in WB_FIELD_MAP order
+    columns = []
+    for field_name, (field_idx, wb_code, transform) in WB_FIELD_MAP.items():
+        if field_name not in all_data:
             continue
+        entries = all_data[field_name]
+        iso3s = list(wanted.intersection(entries))
+        new_strs = convert_column(FIELD_SPECS[field_name],
+                                  [entries[iso3]["value"] for iso3 in iso3s])
+        columns.append((field_name, field_idx, dict(zip(iso3s, new_strs)), entries))
 
+    for reg, iso3 in targets:
         parts = reg["parts"][:]
         changed = False
 
-        for field_name, (field_idx, wb_code, transform) in WB_FIELD_MAP.items():
-            if field_name not in all_data:
-                continue
-
-            wb_entry = all_data[field_name].get(iso3)
-            if not wb_entry:
-                continue
-
-            new_val = transform_value(field_name, wb_entry["value"], transform)
-            if new_val is None:
+        for field_name, field_idx, column, entries in columns:
+            new_str = column.get(iso3)
+            if not new_str:  # no data, or a null value
                 continue
 
             # Ensure list is long enough
@@ -407,7 +1363,6 @@ def update_countries(regions, all_data, target_year):
                 parts.append("")
 
             old_str = parts[field_idx].strip()
-            new_str = format_value(new_val)
 
             # Skip if same value
             if old_str == new_str:
@@ -418,7 +1373,7 @@ def update_countries(regions, all_data, target_year):
             if old_str:
                 try:
                     old_num = float(old_str)
-                    if old_num != 0 and abs(new_val / old_num) > 100:
+                    if old_num != 0 and abs(float(new_str) / old_num) > 100:
                         print(f"    ⚠️  SKIP {reg['id']}.{field_name}: "
                               f"{old_str} → {new_str} (>100x change, likely unit mismatch)")
                         continue
@@ -431,7 +1386,7 @@ def update_countries(regions, all_data, target_year):
                 "idx": field_idx,
                 "old": old_str,
                 "new": new_str,
-                "year": wb_entry["year"],
+                "year": entries[iso3]["year"],
             })
             parts[field_idx] = new_str
             changed = True
@@ -444,34 +1399,33 @@ def update_countries(regions, all_data, target_year):
     return changes, len(updated_ids)
 
 
-def write_data_js(filepath, content, regions, target_year):
-    """Write updated data.js."""
-    import re
-    new_raw = "\n".join(r["raw"] for r in regions)
-
-    content = re.sub(
-        r'(const RAW = `\s*\n?)(.*?)(\n?\s*`\.trim\(\);)',
-        lambda m: m.group(1) + new_raw + m.group(3),
-        content,
-        flags=re.DOTALL
-    )
-
-    # Update comment
-    content = re.sub(
-        r'// Sources:.*',
-        f'// Sources: World Bank API (country data unified to {target_year}), national statistics bureaus',
-        content,
-        count=1
-    )
+def write_data_js(filepath, doc, regions, target_year):
+    """Write updated rows back through the document (one write, changed
+    rows only)."""
+    for reg in regions:
+        if reg["raw"] != reg["row"].text.strip():
+            reg["row"].text = reg["raw"]
 
-    with open(filepath, 'w') as f:
-        f.write(content)
+    doc.set_comment(
+        "// Sources:",
+        f"// Sources: World Bank API (country data unified to {target_year}), "
+        f"national statistics bureaus")
+    doc.save(filepath)
 
 
 # ============================================================
 # REPORTING
 # ============================================================
 
+def print_coverage(coverage, fallback_range):
+    """One line on the cells update_countries will have to skip."""
+    total = len(coverage.countries) * len(coverage.indicators)
+    missing = sum(m for _, _, m, _ in coverage.summary())
+    stale = sum(len(c) for c in coverage.gaps(fallback_range).values()) - missing
+    print(f"\n  📋 Coverage: {total - missing - stale}/{total} cells within ±{fallback_range} years, "
+          f"{missing} missing, {stale} older"
+          + (" (fetch_data.py --fill-gaps)" if missing or stale else ""))
+
 def print_report(all_data, target_year):
     print(f"\n{'='*60}")
     print(f"DATA QUALITY REPORT — Target Year: {target_year}")
@@ -501,9 +1455,42 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Preview only")
     parser.add_argument("--cache", action="store_true", help="Use cached data (no API)")
     parser.add_argument("--refresh", action="store_true", help="Force re-fetch")
+    parser.add_argument("--refresh-only", type=str, default="",
+                        help="Comma-separated indicators to re-fetch (e.g. inflation,gdpBillions)")
+    parser.add_argument("--window", type=str, default="",
+                        help="Year range START:END to keep in the cache (widens the fetch)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted fetch from its last checkpoint")
+    parser.add_argument("--api-base", type=str, default=WB_API_BASE,
+                        help="World Bank API base URL (e.g. a wb_replay.py server)")
+    parser.add_argument("--all-countries", action="store_true",
+                        help="Request country/all instead of only REGION_TO_ISO3 codes")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Concurrent fetch workers (1 = sequential)")
+    parser.add_argument("--rate", type=float, default=4.0,
+                        help="Max World Bank API requests per second (all workers)")
+    parser.add_argument("--cache-format", choices=sorted(CACHE_FORMATS), default="json",
+                        help="Format new cache stores are written in")
+    parser.add_argument("--convert-cache", action="store_true",
+                        help="Rewrite every cached store in --cache-format and exit")
+    parser.add_argument("--fill-gaps", action="store_true",
+                        help="Fetch only the cells missing or older than --max-lag "
+                             "(data_coverage.json)")
+    parser.add_argument("--max-lag", type=int, default=None,
+                        help="Years behind --year that count as a gap (default: --fallback)")
+    parser.add_argument("--wpp", action="store_true",
+                        help="Fill population/density gaps from the UN WPP series")
     parser.add_argument("--data-file", type=str,
                         default=os.path.expanduser("~/Desktop/apples-to-apples/src/data.js"))
     args = parser.parse_args()
+    RATE_LIMITER.rate = args.rate
+    SESSION.base_url = args.api_base.rstrip("/")
+    global CACHE_FORMAT
+    CACHE_FORMAT = args.cache_format
+
+    if args.convert_cache:
+        convert_cache()
+        return
 
     print(f"""
 ╔══════════════════════════════════════════════════════╗
@@ -514,22 +1501,125 @@ def main():
 ╚══════════════════════════════════════════════════════╝
 """)
 
-    # 1. Get data (cache or fetch)
-    all_data = None
-    if not args.refresh:
-        all_data = load_cache(args.year)
+    refresh_only = [n.strip() for n in args.refresh_only.split(",") if n.strip()]
+    unknown = [n for n in refresh_only if n not in WB_FIELD_MAP]
+    if unknown:
+        print(f"  ❌ Unknown indicator(s) for --refresh-only: {', '.join(unknown)}")
+        print(f"     Choose from: {', '.join(WB_FIELD_MAP)}")
+        sys.exit(1)
 
-    if all_data is None:
+    # Year window this run needs; --window widens it for backfills
+    start_year, end_year = args.year - args.fallback, args.year + args.fallback
+    if args.window:
+        w_start, w_end = (int(y) for y in args.window.split(":"))
+        start_year, end_year = min(start_year, w_start), max(end_year, w_end)
+
+    countries = None if args.all_countries else target_iso3()
+
+    # 1. Get data (cache or fetch) — only missing, expired or too-narrow
+    #    indicators hit the API; closest-year selection is always local
+    stores = load_cache_entries() if not args.refresh or args.resume else {}
+
+    plan = load_plan() if args.resume else None
+    if args.resume and plan is None:
+        print("  ℹ️  No interrupted fetch to resume\n")
+
+    if plan:
+        countries = plan["countries"]
+        windows = {name: tuple(w) for name, w in plan["windows"].items()
+                   if not (name in stores and stores[name]["fetchedAt"] >= plan["startedAt"]
+                           and covers(stores[name], *w, countries))}
+        print(f"  ⏯️  Resuming fetch started {plan['startedAt']}: "
+              f"{len(windows)}/{len(plan['windows'])} indicators left\n")
+        if not windows:
+            clear_checkpoints()   # nothing left: the plan is done
+    else:
         if args.cache:
-            print("  ❌ No cache found. Run without --cache first.")
-            sys.exit(1)
-        print("📡 Fetching from World Bank API...\n")
-        all_data = fetch_all_indicators(args.year, args.fallback)
-        save_cache(all_data, args.year)
+            if not stores:
+                print("  ❌ No cache found. Run without --cache first.")
+                sys.exit(1)
+            missing = [n for n in WB_FIELD_MAP if n not in stores]
+            if missing:
+                print(f"  ⚠️  Not cached, skipped: {', '.join(missing)}")
+            to_fetch = []
+        elif args.fill_gaps:
+            to_fetch = []       # gap cells only, below
+        elif args.refresh:
+            to_fetch = list(WB_FIELD_MAP)
+        elif refresh_only:
+            to_fetch = [n for n in WB_FIELD_MAP
+                        if n in refresh_only or n not in stores
+                        or not covers(stores[n], start_year, end_year, countries)]
+        else:
+            to_fetch = [n for n in WB_FIELD_MAP
+                        if n not in stores or is_expired(n, stores[n])
+                        or not covers(stores[n], start_year, end_year, countries)]
+
+        # One range download per indicator: the union of what is stored and
+        # what this run needs, so earlier backfills are not narrowed again
+        windows = {}
+        for name in to_fetch:
+            years = (stores.get(name) or {}).get("years")
+            windows[name] = (min(start_year, years[0]), max(end_year, years[1])) if years \
+                else (start_year, end_year)
+        if windows:
+            clear_checkpoints()
+            save_plan(windows, countries)
+
+    if windows:
+        print(f"📡 Fetching {len(windows)}/{len(WB_FIELD_MAP)} indicators from World Bank API...\n")
+
+        incomplete = []
+
+        def on_done(name, points, complete):
+            store_fetched(stores, name, points, complete, windows[name], countries)
+            if not complete:
+                incomplete.append(name)
+
+        fetch_all_indicators(windows, args.workers, countries, on_done, resume=bool(plan))
+        SESSION.print_stats()
+        SESSION.close()
+        saved = [n for n in windows if n not in incomplete]
+        total_kb = sum(os.path.getsize(get_store_path(n)) for n in saved) / 1024
+        print(f"  💾 Cache saved: {STORE_DIR}/ ({len(saved)} indicators, {total_kb:.0f} KB)")
+        if incomplete:
+            print(f"  ⚠️  {len(incomplete)} incomplete, cached data kept: {', '.join(sorted(incomplete))}")
+            print("     Run with --resume to retry them from their checkpoints")
+        else:
+            clear_checkpoints()
     else:
         print("  Using cached data (add --refresh to re-fetch)\n")
 
+    path = coverage_path(args.data_file)
+    coverage = Coverage.load(path) if os.path.exists(path) else None
+    if args.fill_gaps:
+        if coverage is None or coverage.target_year != args.year:
+            coverage = build_coverage(stores, args.year, coverage)
+        if fill_gaps(stores, coverage, args.fallback if args.max_lag is None else args.max_lag,
+                     args.workers):
+            SESSION.print_stats()
+            SESSION.close()
+        else:
+            print("  ✅ No gaps to fill\n")
+
+    all_data = select_all(stores, args.year, args.fallback)
+    coverage = build_coverage(stores, args.year, coverage)
+    if args.wpp:
+        if not os.path.exists(WPP_SERIES_FILE):
+            print(f"  ❌ Not found: {WPP_SERIES_FILE} (run pipeline_v4_extract.py)")
+            sys.exit(1)
+        store = read_series(WPP_SERIES_FILE)
+        # Land area barely moves: take the nearest year WB has, however far
+        area = select_closest(stores["area"]["points"], args.year, WPP_AREA_FALLBACK) \
+            if "area" in stores else {}
+        filled = fill_from_wpp(all_data, store, args.year, area)
+        if args.year not in store.years:
+            print(f"  ⚠️  {args.year} is outside WPP {store.years[0]}–{store.years[-1]}")
+        for name, count in sorted(filled.items()):
+            print(f"  📈 {name}: {count} countries from UN WPP {args.year}")
+
     print_report(all_data, args.year)
+    print_coverage(coverage, args.fallback)
 
     # 2. Parse data.js
     print(f"\n📂 Parsing {args.data_file}...")
@@ -537,7 +1627,7 @@ def main():
         print(f"  ❌ Not found: {args.data_file}")
         sys.exit(1)
 
-    regions, content = parse_data_js(args.data_file)
+    regions, doc = parse_data_js(args.data_file)
     countries = [r for r in regions if r["type"] == "country"]
     sub = [r for r in regions if r["type"] != "country"]
     print(f"  {len(regions)} regions: {len(countries)} countries, {len(sub)} subnational")
@@ -560,7 +1650,7 @@ def main():
         print(f"\n🔍 DRY RUN — no files modified")
     else:
         print(f"\n💾 Writing...")
-        write_data_js(args.data_file, content, regions, args.year)
+        write_data_js(args.data_file, doc, regions, args.year)
         print(f"  ✅ data.js updated")
 
         # Metadata
@@ -583,6 +1673,8 @@ def main():
         with open(meta_path, 'w') as f:
             json.dump(meta, f, indent=2)
         print(f"  ✅ Metadata: {meta_path}")
+        coverage.save(coverage_path(args.data_file))
+        print(f"  ✅ Coverage: {coverage_path(args.data_file)}")
 
         # Changelog
         log_path = os.path.join(os.path.dirname(args.data_file), "data_changelog.json")
@@ -595,6 +1687,7 @@ def main():
                 "changes": changes
             }, f, indent=2)
         print(f"  ✅ Changelog: {log_path}")
+        snapshots.record(args.data_file, f"fetch_data {args.year}")
 
     print(f"""
 ╔══════════════════════════════════════════════════════╗
@@ -602,7 +1695,7 @@ def main():
 ║  Countries: {num_updated:>3} updated                            ║
 ║  Changes:  {len(changes):>4} fields                            ║
 ║  Year:     {args.year}                                  ║
-║  Cache:    pipeline/cache/wb_data_{args.year}.json       ║
+║  Cache:    pipeline/cache/wb/                        ║
 ║                                                      ║
 ║  Next: cd ~/Desktop/apples-to-apples                 ║
 ║        npm run build && npx gh-pages -d dist         ║
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Apples to Apples — bulk region ingest
+
+Merges any number of region CSV files (expansion/cn_cities_*.txt,
+expansion/new_regions_v2.txt, add-regions/new_regions.txt, ...) into the
+RAW block of src/data.js in one pass:
+
+  - every file is streamed line by line; blank and // comment lines skip
+  - rows are checked against an id → rows index of RAW (and of the rows
+    added so far), so re-running a file updates instead of duplicating
+  - short rows are padded to the parseData() layout (27-field files from
+    before the 35-field expansion get empty new columns); rows with extra
+    non-empty fields are rejected
+  - an id that already belongs to a different region (cn-gz Guizhou vs
+    an incoming cn-gz Guangzhou) is a conflict; with --rename the row
+    moves to the next free suffix (cn-gz2), or merges into that suffix
+    if the region is already there
+  - new rows are appended to RAW in one edit and data.js is written once
+
+Existing regions are upserted per --on-existing:
+  fill     only set fields that are empty in RAW (default)
+  update   overwrite with every non-empty incoming field
+  skip     leave existing regions untouched
+
+Usage:
+  python3 ingest.py ../expansion/cn_cities_*.txt ../add-regions/new_regions.txt
+  python3 ingest.py --rename --on-existing update cities.txt
+  python3 ingest.py --dry-run --data-file ../src/data.js new.txt
+"""
+
+import argparse
+import os
+import sys
+
+from build_regions import DEFAULT_DATA_FILE, STRING_FIELDS, parser_spec
+from datajs import DataJsDocument, Row
+
+ON_EXISTING = ("fill", "update", "skip")
+MAX_SUFFIX = 99        # --rename tries id2 … id99
+REPORT_LIMIT = 20      # conflicts / value differences printed in full
+
+
+# ============================================================
+# INPUT
+# ============================================================
+
+def read_region_lines(paths):
+    """Yield (where, fields) for every data line of the files, streamed."""
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith("//"):
+                    continue
+                yield f"{os.path.basename(path)}:{number}", [v.strip() for v in line.split(",")]
+
+
+def normalise(fields, width):
+    """Fields padded (or trailing empties trimmed) to `width`; None if the
+    row carries data beyond the layout."""
+    if len(fields) > width:
+        if any(fields[width:]):
+            return None
+        fields = fields[:width]
+    return fields + [""] * (width - len(fields))
+
+
+def same_number(a, b):
+    try:
+        return float(a) == float(b)
+    except ValueError:
+        return a == b
+
+
+# ============================================================
+# MERGE
+# ============================================================
+
+class Ingest:
+    """Upserts rows into a loaded document; new rows are held back and
+    appended to RAW together by finish()."""
+
+    def __init__(self, doc, on_existing="fill", rename=False):
+        self.doc = doc
+        self.width = len(STRING_FIELDS) + len(parser_spec(doc.text()))
+        self.on_existing = on_existing
+        self.rename = rename
+        self.index = {}                      # id → [Row, ...] (RAW copies + new)
+        for row in doc.rows:
+            self.index.setdefault(row.id, []).append(row)
+        self.new_rows = []
+        self.report = {"read": 0, "added": [], "updated": set(), "unchanged": 0,
+                       "renamed": [], "conflicts": [], "differences": []}
+
+    def duplicates(self):
+        """Ids that already appear more than once in RAW."""
+        return sorted(i for i, rows in self.index.items() if len(rows) > 1)
+
+    def _target(self, fields):
+        """(id to use, existing rows or None); None if it conflicts."""
+        region_id, name = fields[0], fields[1]
+        candidates = [region_id]
+        if self.rename:
+            candidates += [f"{region_id}{n}" for n in range(2, MAX_SUFFIX + 1)]
+        for candidate in candidates:
+            rows = self.index.get(candidate)
+            if rows is None:
+                return candidate, None
+            if rows[0].get(1) == name:
+                return candidate, rows
+        return None
+
+    def add(self, where, fields):
+        self.report["read"] += 1
+        fields = normalise(fields, self.width)
+        if fields is None:
+            self.report["conflicts"].append((where, "", f"more than {self.width} fields"))
+            return
+        if not fields[0] or not fields[1]:
+            self.report["conflicts"].append((where, fields[0], "missing id or name"))
+            return
+
+        target = self._target(fields)
+        if target is None:
+            existing = self.index[fields[0]][0].get(1)
+            self.report["conflicts"].append(
+                (where, fields[0], f"id is {existing!r} in RAW, not {fields[1]!r}"
+                                   + ("" if self.rename else " (use --rename)")))
+            return
+        region_id, rows = target
+        if region_id != fields[0]:
+            self.report["renamed"].append((fields[0], region_id))
+            fields[0] = region_id
+
+        if rows is None:
+            row = Row(",".join(fields))
+            self.index[region_id] = [row]
+            self.new_rows.append(row)
+            self.report["added"].append(region_id)
+        elif self.on_existing == "skip":
+            self.report["unchanged"] += 1
+        else:
+            self._upsert(where, rows, fields)
+
+    def _upsert(self, where, rows, fields):
+        changed = False
+        for row in rows:                     # every copy of a duplicated id
+            for idx in range(2, self.width):
+                value, old = fields[idx], row.get(idx)
+                if not value or same_number(value, old):
+                    continue
+                if old and self.on_existing == "fill":
+                    if row is rows[0]:
+                        self.report["differences"].append((where, row.id, idx, old, value))
+                    continue
+                changed |= row.set(idx, value)
+        if changed:
+            self.report["updated"].add(rows[0].id)
+        else:
+            self.report["unchanged"] += 1
+
+    def finish(self):
+        """Append the new rows to RAW (one edit)."""
+        if self.new_rows:
+            self.doc.rows.append("\n".join(row.text for row in self.new_rows))
+        return self.report
+
+
+def ingest(doc, paths, on_existing="fill", rename=False):
+    """Merge the files into doc; returns (Ingest, report)."""
+    merger = Ingest(doc, on_existing, rename)
+    for where, fields in read_region_lines(paths):
+        merger.add(where, fields)
+    return merger, merger.finish()
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def print_report(merger, report):
+    print(f"  📥 {report['read']} rows read: {len(report['added'])} added, "
+          f"{len(report['updated'])} updated, {report['unchanged']} unchanged, "
+          f"{len(report['conflicts'])} conflicts")
+    for old, new in report["renamed"]:
+        print(f"  🔀 {old} → {new}")
+    for where, region_id, message in report["conflicts"][:REPORT_LIMIT]:
+        print(f"  ⚠️  {where} {region_id}: {message}")
+    differences = report["differences"]
+    if differences:
+        print(f"  ≠  {len(differences)} fields differ from RAW (kept; --on-existing update to overwrite)")
+        for where, region_id, idx, old, new in differences[:REPORT_LIMIT]:
+            print(f"     {where} {region_id}[{idx}]: {old} → {new}")
+    for items in (report["conflicts"], differences):
+        if len(items) > REPORT_LIMIT:
+            print(f"     ... and {len(items) - REPORT_LIMIT} more")
+    duplicates = merger.duplicates()
+    if duplicates:
+        print(f"  ℹ️  {len(duplicates)} ids appear more than once in RAW; upserts update every copy")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge region CSV files into data.js")
+    parser.add_argument("files", nargs="+", help="Region CSV files (one RAW line per row)")
+    parser.add_argument("--data-file", default=DEFAULT_DATA_FILE)
+    parser.add_argument("--on-existing", choices=ON_EXISTING, default="fill")
+    parser.add_argument("--rename", action="store_true",
+                        help="Move clashing ids to the next free numeric suffix")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    doc = DataJsDocument.load(args.data_file)
+    print(f"📊 Ingesting {len(args.files)} file(s) into {os.path.relpath(args.data_file)} "
+          f"({len(doc.rows)} regions)...")
+    merger, report = ingest(doc, args.files, args.on_existing, args.rename)
+    print_report(merger, report)
+
+    if args.dry_run:
+        print("🔍 DRY RUN — data.js not written")
+    elif doc.save(args.data_file):
+        print(f"✅ {os.path.relpath(args.data_file)}: {len(doc.rows)} regions")
+    else:
+        print(f"✅ {os.path.relpath(args.data_file)} up to date")
+    if report["conflicts"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Apples to Apples — precomputed preset match index
+
+Preset weights only change between builds, so the ranking findMatches()
+would compute for (region, preset) can be computed once here. For every
+MATCH_PRESETS preset this scores all region pairs exactly like
+computeSimilarity() in src/matching.js (min-max normalisation over
+REGIONS, weighted 1 - |Δ|, skipped missing values, Math.round to one
+decimal, stable sort by score) and writes the top K per region to
+src/matchIndex.js:
+
+  export const COUNT = <REGIONS.length>;
+  export const K = 20;
+  export const TOP = JSON.parse('{"<preset>": {"<id>": [i, s, i, s, ...]}}');
+
+where i is an index into REGIONS and s is the score × 10. matching.js
+loads it lazily and serves preset matches from it; custom weights still
+use the live scan.
+
+Usage:
+  python3 match_index.py                   # ../src/data.js → ../src/matchIndex.js
+  python3 match_index.py <data.js> <matchIndex.js> [K]
+  (also runs as npm's prebuild/predev step)
+"""
+
+import math
+import os
+import sys
+
+from build_regions import SCRIPT_DIR, DEFAULT_DATA_FILE, build_columns, \
+    js_json_literal, write_if_changed
+from datajs import DataJsDocument, ObjectBlock, OBJECT_END, split_top_level
+
+DEFAULT_OUT_FILE = os.path.join(SCRIPT_DIR, "..", "src", "matchIndex.js")
+DEFAULT_K = 20                    # Compare.jsx asks findMatches for 20
+PRESETS_START = "export const MATCH_PRESETS = {\n"
+
+
+# ============================================================
+# INPUTS
+# ============================================================
+
+def parse_presets(code):
+    """{preset: {indicator: weight}} from the MATCH_PRESETS object."""
+    start = code.find(PRESETS_START)
+    if start < 0:
+        raise ValueError("MATCH_PRESETS not found in data.js")
+    start += len(PRESETS_START)
+    block = ObjectBlock(code[start:code.index(OBJECT_END, start)])
+
+    presets = {}
+    for entry in block:
+        source = str(entry.get("weights", "")).strip()
+        if not (source.startswith("{") and source.endswith("}")):
+            raise ValueError(f"MATCH_PRESETS.{entry.key} has no weights object")
+        weights = {}
+        for part in split_top_level(source[1:-1]):
+            if part.strip():
+                name, _, value = part.partition(":")
+                weights[name.strip()] = float(value)
+        presets[entry.key] = weights
+    return presets
+
+
+def norm_columns(columns, keys):
+    """{key: [normalised value or None]} with computeNormParams' min/max."""
+    norms = {}
+    for key in keys:
+        col = columns.get(key)
+        if col is None:
+            continue                  # not a region field: never scored
+        values = [v for v in col if v is not None]
+        if not values:
+            continue
+        lo, hi = min(values), max(values)
+        if hi == lo:
+            norms[key] = [None if v is None else 0.5 for v in col]
+        else:
+            span = hi - lo
+            norms[key] = [None if v is None else (v - lo) / span for v in col]
+    return norms
+
+
+def js_round(x):
+    """Math.round: halves go up."""
+    r = math.floor(x)
+    return r + 1 if x - r >= 0.5 else r
+
+
+# ============================================================
+# SCORING
+# ============================================================
+
+def score_row(src, active):
+    """computeSimilarity(REGIONS[src], t, weights) × 10 for every t, as
+    integers. `active` is [(weight, normalised column)] in INDICATOR_KEYS
+    order, so sums accumulate in the same order as the JS loop."""
+    n = len(active[0][1]) if active else 0
+    total = [0.0] * n
+    weight = [0.0] * n
+    for w, col in active:
+        s = col[src]
+        if s is None:
+            continue
+        total = [a if t is None else a + w * (1 - abs(s - t)) for a, t in zip(total, col)]
+        weight = [a if t is None else a + w for a, t in zip(weight, col)]
+    return [js_round(a / b * 1000) if b else 0 for a, b in zip(total, weight)]
+
+
+def build_index(doc, k=DEFAULT_K):
+    artifact = build_columns(doc)
+    ids = artifact["strings"]["id"]
+    keys = doc.indicators.keys()
+    norms = norm_columns(artifact["columns"], keys)
+    presets = parse_presets(doc.text())
+
+    first = {}
+    for i, region_id in enumerate(ids):
+        first.setdefault(region_id, i)
+
+    top = {}
+    for name, weights in presets.items():
+        active = [(weights[key], norms[key]) for key in keys
+                  if weights.get(key, 0) > 0 and key in norms]
+        ranked = {}
+        for region_id, src in first.items():
+            scores = score_row(src, active) if active else [0] * len(ids)
+            order = sorted((t for t in range(len(ids)) if ids[t] != region_id),
+                           key=lambda t: -scores[t])[:k]
+            ranked[region_id] = [x for t in order for x in (t, scores[t])]
+        top[name] = ranked
+
+    return {"count": artifact["count"], "k": k, "top": top}
+
+
+def render_module(index):
+    return (
+        "// Generated by pipeline/match_index.py from data.js. Do not edit.\n"
+        f"export const COUNT = {index['count']};\n"
+        f"export const K = {index['k']};\n"
+        f"export const TOP = {js_json_literal(index['top'])};\n"
+    )
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def main():
+    if len(sys.argv) not in (1, 3, 4):
+        print(__doc__.strip().split("Usage:")[1])
+        sys.exit(1)
+    data_file, out_file = sys.argv[1:3] if len(sys.argv) >= 3 else (DEFAULT_DATA_FILE, DEFAULT_OUT_FILE)
+    k = int(sys.argv[3]) if len(sys.argv) == 4 else DEFAULT_K
+
+    index = build_index(DataJsDocument.load(data_file), k)
+    written = write_if_changed(out_file, render_module(index))
+    print(f"  🎯 {os.path.relpath(out_file)}: top {k} for {len(index['top'])} presets × "
+          f"{len(next(iter(index['top'].values()), {}))} regions "
+          f"({'written' if written else 'up to date'})")
+
+
+if __name__ == "__main__":
+    main()
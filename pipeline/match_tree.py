@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Apples to Apples — KD-tree layout for custom-weight matching
+
+Custom weights can't use the precomputed preset rankings, so findMatches
+would rescan every region on each slider change. This stage lays REGIONS
+out for a KD-tree over the min-max normalised indicator space (the same
+space computeSimilarity works in); src/kdtree.js builds the node boxes at
+load time and answers queries with per-query axis weights.
+
+computeSimilarity only counts indicators both regions have, so a single
+tree's distance bound would not hold for regions with gaps. Regions are
+therefore grouped by which indicators they are missing (a few dozen
+patterns in practice) and each group gets its own tree: inside a group
+every region shares the same indicators, and 1 - Σ w·boxdist / Σ w is an
+exact upper bound on its scores.
+
+Each group is stored as a permutation of REGIONS indices arranged as an
+implicit balanced tree: a node covering perm[lo:hi] splits at
+(lo + hi) >> 1 along its widest indicator, down to LEAF_SIZE regions.
+
+  export const TREE = JSON.parse('{"count": n, "leafSize": 8,
+      "keys": [...], "groups": [{"missing": [key idx, ...],
+                                 "perm": [region idx, ...]}, ...]}');
+
+Usage:
+  python3 match_tree.py                    # ../src/data.js → ../src/matchTree.js
+  python3 match_tree.py <data.js> <matchTree.js>
+  (also runs as npm's prebuild/predev step)
+"""
+
+import os
+import sys
+
+from build_regions import SCRIPT_DIR, DEFAULT_DATA_FILE, build_columns, \
+    js_json_literal, write_if_changed
+from datajs import DataJsDocument
+from match_index import norm_columns
+
+DEFAULT_OUT_FILE = os.path.join(SCRIPT_DIR, "..", "src", "matchTree.js")
+LEAF_SIZE = 8
+
+
+# ============================================================
+# BUILD
+# ============================================================
+
+def arrange(perm, coords, dims, lo, hi):
+    """Reorder perm[lo:hi] in place into the implicit KD layout."""
+    if hi - lo <= LEAF_SIZE:
+        return
+    spread = []
+    for d in dims:
+        values = [coords[d][i] for i in perm[lo:hi]]
+        spread.append((max(values) - min(values), d))
+    _, axis = max(spread)
+    perm[lo:hi] = sorted(perm[lo:hi], key=lambda i: (coords[axis][i], i))
+    mid = (lo + hi) >> 1
+    arrange(perm, coords, dims, lo, mid)
+    arrange(perm, coords, dims, mid, hi)
+
+
+def build_tree(doc):
+    artifact = build_columns(doc)
+    norms = norm_columns(artifact["columns"], doc.indicators.keys())
+    keys = list(norms)
+    coords = [norms[key] for key in keys]
+
+    groups = {}
+    for i in range(artifact["count"]):
+        missing = tuple(d for d in range(len(keys)) if coords[d][i] is None)
+        groups.setdefault(missing, []).append(i)
+
+    out = []
+    for missing, perm in groups.items():
+        dims = [d for d in range(len(keys)) if d not in missing]
+        if dims:
+            arrange(perm, coords, dims, 0, len(perm))
+        out.append({"missing": list(missing), "perm": perm})
+
+    return {"count": artifact["count"], "leafSize": LEAF_SIZE, "keys": keys, "groups": out}
+
+
+def render_module(tree):
+    return (
+        "// Generated by pipeline/match_tree.py from data.js. Do not edit.\n"
+        f"export const TREE = {js_json_literal(tree)};\n"
+    )
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def main():
+    if len(sys.argv) not in (1, 3):
+        print(__doc__.strip().split("Usage:")[1])
+        sys.exit(1)
+    data_file, out_file = sys.argv[1:3] if len(sys.argv) == 3 else (DEFAULT_DATA_FILE, DEFAULT_OUT_FILE)
+
+    tree = build_tree(DataJsDocument.load(data_file))
+    written = write_if_changed(out_file, render_module(tree))
+    print(f"  🌲 {os.path.relpath(out_file)}: {tree['count']} regions in "
+          f"{len(tree['groups'])} trees over {len(tree['keys'])} indicators "
+          f"({'written' if written else 'up to date'})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Apples to Apples — multi-source merge
+
+Replaces running fetch_data.py, pipeline_v4_inject.py and
+pipeline_v4_years.py one after another, where whichever pass ran last won
+a cell. Every source is loaded into one region × indicator matrix of
+candidates, each cell is resolved once by declared rules, and data.js is
+rewritten once:
+
+  lookup   pipeline_v4_lookup.json (IMF WEO, UNDP HDR, UN WPP), per-cell
+           value/year/source, mapped by pipeline_v4_inject.INDICATOR_FIELDS
+  wb       the World Bank cache (fetch_data.py), closest year to --year
+           within ±--fallback, converted by fetch_data.WB_FIELD_MAP
+  raw      RAW as it stands: the manual values (all subnational rows,
+           hand-entered indicators) and the fallback for every cell
+
+Rules (RULES, default "priority"):
+  priority  first source in SOURCE_ORDER that has the cell
+  recent    newest year wins; ties go to SOURCE_ORDER; raw only if no
+            dated source has the cell
+
+A candidate more than 100x away from the RAW value is rejected as a unit
+mismatch (the guard fetch_data and inject already apply) and the next one
+is tried. Resolution runs a whole indicator column at a time, so the
+result does not depend on the order sources are loaded in.
+
+Outputs:
+  src/data.js                   RAW cells, plus INDICATORS year tags taken
+                                from the years that actually won (modal
+                                country year, when most countries share it)
+  pipeline/data_provenance.json {region: {indicator: [value, year, source]}}
+                                for every cell not taken from RAW, and the
+                                rejects (outside src/, so the app build
+                                neither hashes nor bundles it)
+
+With --db the lookup and wb candidates come from the observations
+datadb.py loaded (each indicator's latest load per source) and the result
+is recorded in the database as a "merge" run instead of being written to
+data.js; `datadb.py export` then writes data.js. This is how stages.py
+runs it.
+
+Usage:
+  python3 merge.py                      # year 2022, ±2 years for WB
+  python3 merge.py --year 2023 --fallback 3
+  python3 merge.py --dry-run            # report, don't write
+  python3 merge.py --db [data.sqlite]   # read and record via datadb.py
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, ".."))
+
+from build_regions import DEFAULT_DATA_FILE, parser_spec
+from datadb import DEFAULT_DB_FILE, DataDB
+from datajs import DataJsDocument
+import fetch_data
+from fetch_data import FIELD_SPECS, REGION_TO_ISO3, WB_FIELD_MAP, convert_column
+from pipeline_v4_inject import INDICATOR_FIELDS
+import snapshots
+
+LOOKUP_FILE = os.path.join(SCRIPT_DIR, "..", "pipeline_v4_lookup.json")
+PROVENANCE_FILE = os.path.join(SCRIPT_DIR, "data_provenance.json")
+
+SOURCE_ORDER = ("lookup", "wb", "raw")      # priority, highest first
+DEFAULT_RULE = "priority"
+RULES = {                                   # parseData key → rule
+    "population": "recent",
+    "populationDensity": "recent",
+    "lifeExpectancy": "recent",
+}
+MAX_RATIO = 100                             # unit-mismatch guard
+YEAR_TAG_SHARE = 0.5                        # modal year share needed for a tag
+REPORT_LIMIT = 20
+
+
+# ============================================================
+# SOURCES
+# ============================================================
+# Each loader returns {RAW field index: {iso3: (text, year, label)}}, text
+# already converted and formatted the way RAW writes it.
+
+def load_lookup(path=LOOKUP_FILE):
+    if not os.path.exists(path):
+        print(f"  ⚠️  lookup: {os.path.relpath(path)} not found")
+        return {}
+    with open(path) as f:
+        lookup = json.load(f)
+    table = {}
+    for key, (idx, decimals) in INDICATOR_FIELDS.items():
+        isos = [iso for iso, row in lookup.items() if (row.get(key) or {}).get("value") is not None]
+        texts = convert_column((None, decimals), [lookup[iso][key]["value"] for iso in isos])
+        table[idx] = {iso: (text, lookup[iso][key].get("year"), lookup[iso][key].get("source", "lookup"))
+                      for iso, text in zip(isos, texts) if text}
+    return table
+
+
+def load_wb(year, fallback):
+    stores = fetch_data.load_cache_entries()
+    if not stores:
+        print("  ⚠️  wb: no cached World Bank data (run fetch_data.py)")
+    table = {}
+    for name, entries in fetch_data.select_all(stores, year, fallback).items():
+        isos = list(entries)
+        texts = convert_column(FIELD_SPECS[name], [entries[iso]["value"] for iso in isos])
+        table[WB_FIELD_MAP[name][0]] = {iso: (text, entries[iso]["year"], "World Bank")
+                                        for iso, text in zip(isos, texts) if text}
+    return table
+
+
+LATEST_OBSERVATIONS = """
+SELECT o.region, o.indicator, o.source, o.year, o.value, o.origin
+FROM observation o
+JOIN (SELECT indicator, origin, MAX(fetched_at) AS fetched_at FROM observation
+      WHERE origin IN ('wb', 'lookup') GROUP BY indicator, origin) latest
+  ON latest.indicator = o.indicator AND latest.origin = o.origin
+ AND latest.fetched_at = o.fetched_at
+"""
+
+
+def load_db(db, year, fallback):
+    """The lookup and wb tables from a datadb database. Only each
+    indicator's latest load counts, so values a source has since dropped
+    are not picked up; wb takes the closest year the way select_closest
+    does (values are already in RAW units)."""
+    decimals = {idx: dec for idx, dec in INDICATOR_FIELDS.values()}
+    wb_decimals = {idx: FIELD_SPECS[name][1] for name, (idx, *_) in WB_FIELD_MAP.items()}
+    fields = {key: idx for idx, key in db.indicator_fields().items()}
+    best = {"lookup": {}, "wb": {}}
+    for rid, key, source, obs_year, value, origin in db.conn.execute(LATEST_OBSERVATIONS):
+        iso3, idx = REGION_TO_ISO3.get(rid), fields.get(key)
+        if iso3 is None or idx is None or idx not in (decimals if origin == "lookup" else wb_decimals):
+            continue
+        if origin == "wb":
+            if abs(obs_year - year) > fallback:
+                continue
+            rank = (abs(obs_year - year), -obs_year)
+        else:
+            rank = (-obs_year,)
+        cell = best[origin].setdefault(idx, {})
+        if iso3 not in cell or rank < cell[iso3][0]:
+            cell[iso3] = (rank, value, obs_year or None, source)
+
+    tables = {}
+    for origin, places in (("lookup", decimals), ("wb", wb_decimals)):
+        table = tables[origin] = {}
+        for idx, cells in best[origin].items():
+            isos = list(cells)
+            texts = convert_column((None, places[idx]), [cells[iso][1] for iso in isos])
+            table[idx] = {iso: (text, cells[iso][2], cells[iso][3])
+                          for iso, text in zip(isos, texts) if text}
+    return tables
+
+
+# ============================================================
+# MATRIX
+# ============================================================
+
+def as_number(text):
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return None
+
+
+def resolve(rule, candidates, raw_text):
+    """Winning (text, year, source, label) for one cell, and rejected
+    candidates. candidates: [(source, (text, year, label))] in SOURCE_ORDER."""
+    raw = as_number(raw_text)
+    if rule == "recent":
+        candidates = sorted(candidates, key=lambda c: -(c[1][1] or 0))   # stable: ties keep order
+    rejected = []
+    for source, (text, year, label) in candidates:
+        new = as_number(text)
+        if raw and new is not None and abs(new / raw) > MAX_RATIO:
+            rejected.append((source, text, year))
+            continue
+        return (text, year, source, label), rejected
+    return None, rejected
+
+
+class Merge:
+    """RAW rows × indicator fields with candidates from every source."""
+
+    def __init__(self, doc, sources):
+        self.doc = doc
+        self.keys = {idx: key for key, idx, _ in parser_spec(doc.text())}
+        self.sources = sources                      # {name: table}
+        self.rows = {}                              # id → [Row, ...]
+        for row in doc.rows:
+            self.rows.setdefault(row.id, []).append(row)
+        self.iso3 = {rid: REGION_TO_ISO3[rid] for rid, rows in self.rows.items()
+                     if rows[0].get(2) == "country" and rid in REGION_TO_ISO3}
+
+    def run(self):
+        """Resolve and apply every cell. Returns the report."""
+        report = {"changed": [], "provenance": {}, "rejected": [], "wins": Counter(),
+                  "years": {}}
+        dated = [name for name in SOURCE_ORDER if name != "raw"]
+        for idx, key in sorted(self.keys.items()):
+            rule = RULES.get(key, DEFAULT_RULE)
+            columns = [(name, self.sources.get(name, {}).get(idx, {})) for name in dated]
+            if not any(column for _, column in columns):
+                continue
+            years = Counter()
+            for rid, iso3 in self.iso3.items():
+                rows = self.rows[rid]
+                raw_text = rows[0].get(idx)
+                candidates = [(name, column[iso3]) for name, column in columns if iso3 in column]
+                won, rejected = resolve(rule, candidates, raw_text)
+                for source, text, year in rejected:
+                    report["rejected"].append({"region": rid, "indicator": key, "source": source,
+                                               "value": text, "year": year, "raw": raw_text})
+                if won is None:
+                    report["wins"]["raw"] += bool(raw_text)
+                    continue
+                text, year, source, label = won
+                report["wins"][source] += 1
+                years[year] += 1
+                report["provenance"].setdefault(rid, {})[key] = [as_number(text), year, label]
+                changed = False
+                for row in rows:                    # every copy of a duplicated id
+                    if as_number(row.get(idx)) != as_number(text):   # else keep RAW's spelling
+                        changed |= row.set(idx, text)
+                if changed:
+                    report["changed"].append((rid, key, raw_text, text, year, source))
+            report["years"][key] = years, sum(1 for rid in self.iso3 if self.rows[rid][0].get(idx))
+        return report
+
+    def update_year_tags(self, report):
+        """Set each merged indicator's year tag to the modal year of its
+        country cells when it covers YEAR_TAG_SHARE of them; others keep
+        their tag. Returns {key: year} for the tags that changed."""
+        changed = {}
+        for key, (years, filled) in report["years"].items():
+            entry = self.doc.indicators.get(key)
+            if entry is None or not years or not filled:
+                continue
+            year, count = max(years.items(), key=lambda item: (item[1], item[0] or 0))
+            if year is not None and count / filled >= YEAR_TAG_SHARE:
+                if entry.set("year", str(year), first=True):
+                    changed[key] = year
+        return changed
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def write_provenance(path, args, report):
+    with open(path, "w") as f:
+        json.dump({
+            "targetYear": args.year,
+            "fallback": args.fallback,
+            "sourceOrder": list(SOURCE_ORDER),
+            "rules": {key: RULES.get(key, DEFAULT_RULE) for key in sorted(report["years"])},
+            "cells": report["provenance"],
+            "rejected": report["rejected"],
+        }, f, indent=1, ensure_ascii=False, sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge every data source into data.js")
+    parser.add_argument("--year", type=int, default=2022, help="World Bank target year")
+    parser.add_argument("--fallback", type=int, default=2, help="World Bank ±years")
+    parser.add_argument("--data-file", default=DEFAULT_DATA_FILE)
+    parser.add_argument("--lookup", default=LOOKUP_FILE)
+    parser.add_argument("--provenance", default=PROVENANCE_FILE)
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--db", nargs="?", const=DEFAULT_DB_FILE,
+                        help="Read sources from and record the merge in this database")
+    args = parser.parse_args()
+
+    doc = DataJsDocument.load(args.data_file)
+    if args.db:
+        print(f"🔀 Merging sources into {os.path.relpath(args.db)} (year {args.year})...")
+        db = DataDB(args.db)
+        db.export_doc(doc)      # start from the database's cells, not data.js's
+        sources = load_db(db, args.year, args.fallback)
+    else:
+        print(f"🔀 Merging sources into {os.path.relpath(args.data_file)} (year {args.year})...")
+        sources = {"lookup": load_lookup(args.lookup), "wb": load_wb(args.year, args.fallback)}
+    for name, table in sources.items():
+        print(f"  📚 {name}: {sum(len(c) for c in table.values())} cells, {len(table)} indicators")
+
+    merge = Merge(doc, sources)
+    report = merge.run()
+    tags = merge.update_year_tags(report)
+
+    wins = ", ".join(f"{name} {report['wins'][name]}" for name in SOURCE_ORDER)
+    print(f"  🏆 country cells by source: {wins}")
+    print(f"  ✏️  {len(report['changed'])} cells changed")
+    for rid, key, old, new, year, source in report["changed"][:REPORT_LIMIT]:
+        print(f"     {rid:6s} {key:20s} {old or '—':>10s} → {new:>10s}  ({source} {year})")
+    if len(report["changed"]) > REPORT_LIMIT:
+        print(f"     ... and {len(report['changed']) - REPORT_LIMIT} more")
+    for r in report["rejected"][:REPORT_LIMIT]:
+        print(f"  ⚠️  rejected {r['region']}.{r['indicator']} {r['source']}: "
+              f"{r['raw']} → {r['value']} (>{MAX_RATIO}x)")
+    for key, year in sorted(tags.items()):
+        print(f"  🏷️  {key}: year {year}")
+
+    if args.dry_run:
+        print("🔍 DRY RUN — nothing written")
+        return
+    if args.db:
+        db.begin_run("merge", f"year {args.year}")
+        changed, _, _ = db.import_doc(doc)
+        db.conn.commit()
+        write_provenance(args.provenance, args, report)
+        print(f"✅ {os.path.relpath(args.db)}: {changed} cells recorded + "
+              f"{os.path.relpath(args.provenance)} (run datadb.py export to write data.js)")
+        return
+    doc.save(args.data_file)
+    write_provenance(args.provenance, args, report)
+    snapshots.record(args.data_file, f"merge {args.year}")
+    print(f"✅ {os.path.relpath(args.data_file)} + {os.path.relpath(args.provenance)} "
+          f"({sum(len(c) for c in report['provenance'].values())} sourced cells)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Apples to Apples — year-indexed time-series store
+
+Annual country series on one fixed year axis, e.g. the UN WPP 2024
+median projections written by pipeline_v4_extract.py: every (series,
+country) is a contiguous run of float64s, one per year, so any year or
+year range is an O(1) slice of the memory-mapped file and a whole year
+across countries (a year-slider frame) is one strided view.
+
+File layout (little-endian, every section 8-byte aligned):
+  magic   b"A2AS" + u16 version + u16 reserved + u32 header length
+  header  JSON {"source", "firstYear", "years": Y, "keys": n,
+                "series": [name, ...], "units": {name: unit}}
+  keys    n × 3 ASCII bytes, sorted ISO3 codes
+  values  len(series) × n × Y float64, NaN = missing;
+          series s, country k, year y at (s·n + k)·Y + (y - firstYear)
+
+Usage:
+  python3 series.py stats cache/wpp2024.series
+  python3 series.py get cache/wpp2024.series population USA 2030
+  python3 series.py get cache/wpp2024.series growthRate JPN 2024:2030
+"""
+
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+MAGIC = b"A2AS"
+VERSION = 1
+PREAMBLE = struct.Struct("<4sHHI")
+EXTENSION = ".series"
+
+
+def _pad(n):
+    return -n % 8
+
+
+# ============================================================
+# WRITING
+# ============================================================
+
+def encode_series(first_year, years, series, source=None, units=None):
+    """File bytes for {name: {iso3: [value or None per year]}}; every list
+    has `years` entries starting at first_year."""
+    names = list(series)
+    keys = sorted({iso3 for rows in series.values() for iso3 in rows})
+    for iso3 in keys:
+        if len(iso3) != 3 or not iso3.isascii():
+            raise ValueError(f"not an ISO3 code: {iso3!r}")
+
+    missing = [math.nan] * years
+    values = array("d")
+    for name in names:
+        rows = series[name]
+        for iso3 in keys:
+            row = rows.get(iso3, missing)
+            if len(row) != years:
+                raise ValueError(f"{name}/{iso3}: {len(row)} values for {years} years")
+            values.extend(math.nan if v is None else v for v in row)
+    if sys.byteorder != "little":
+        values.byteswap()
+
+    header = json.dumps({
+        "source": source,
+        "firstYear": first_year,
+        "years": years,
+        "keys": len(keys),
+        "series": names,
+        "units": units or {},
+    }).encode()
+    header += b" " * _pad(PREAMBLE.size + len(header))
+    key_bytes = "".join(keys).encode("ascii")
+
+    parts = [PREAMBLE.pack(MAGIC, VERSION, 0, len(header)), header]
+    for section in (key_bytes, values.tobytes()):
+        parts += [section, b"\0" * _pad(len(section))]
+    return b"".join(parts)
+
+
+def write_series(path, first_year, years, series, source=None, units=None):
+    """Write the store; returns True if the file changed."""
+    data = encode_series(first_year, years, series, source, units)
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
+
+
+# ============================================================
+# READING
+# ============================================================
+
+class SeriesStore:
+    """Read-only view over a mapped store."""
+
+    def __init__(self, header, keys, values):
+        self.source = header.get("source")
+        self.units = header.get("units", {})
+        self.names = header["series"]
+        self.first_year = header["firstYear"]
+        self.years = range(self.first_year, self.first_year + header["years"])
+        self.keys = keys
+        self.index = {iso3: i for i, iso3 in enumerate(keys)}
+        self.values = values
+
+    def __contains__(self, iso3):
+        return iso3 in self.index
+
+    def _base(self, name, iso3):
+        return (self.names.index(name) * len(self.keys) + self.index[iso3]) * len(self.years)
+
+    def row(self, name, iso3, start=None, end=None):
+        """Values for years [start, end] (default: all) as a zero-copy view."""
+        base = self._base(name, iso3)
+        lo = 0 if start is None else max(0, start - self.first_year)
+        hi = len(self.years) if end is None else min(len(self.years), end - self.first_year + 1)
+        return self.values[base + lo:base + max(lo, hi)]
+
+    def value(self, name, iso3, year):
+        """One value, or None if the year is off the axis or missing."""
+        if iso3 not in self.index or year not in self.years:
+            return None
+        v = self.values[self._base(name, iso3) + year - self.first_year]
+        return None if v != v else v
+
+    def at_year(self, name, year):
+        """{iso3: value} for one year across every country (NaN skipped)."""
+        if year not in self.years:
+            return {}
+        start = self.names.index(name) * len(self.keys) * len(self.years) + year - self.first_year
+        column = self.values[start:start + len(self.keys) * len(self.years):len(self.years)]
+        return {iso3: v for iso3, v in zip(self.keys, column) if v == v}
+
+
+def read_series(path):
+    """Map a store → SeriesStore."""
+    with open(path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            raise ValueError(f"{path}: not a series store")
+    view = memoryview(buf)
+
+    magic, version, _, header_len = PREAMBLE.unpack_from(view)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path}: not a series store (version {VERSION})")
+    pos = PREAMBLE.size
+    header = json.loads(bytes(view[pos:pos + header_len]))
+    pos += header_len
+    n = header["keys"]
+
+    key_bytes = bytes(view[pos:pos + 3 * n]).decode("ascii")
+    pos += 3 * n + _pad(3 * n)
+    keys = [key_bytes[i:i + 3] for i in range(0, 3 * n, 3)]
+    size = 8 * len(header["series"]) * n * header["years"]
+    if sys.byteorder == "little":
+        values = view[pos:pos + size].cast("d")
+    else:
+        values = array("d", view[pos:pos + size])
+        values.byteswap()
+    return SeriesStore(header, keys, values)
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def main():
+    if len(sys.argv) == 3 and sys.argv[1] == "stats":
+        store = read_series(sys.argv[2])
+        names = ", ".join(f"{n} ({store.units.get(n, '?')})" for n in store.names)
+        print(f"  📈 {store.source}: {len(store.keys)} countries × "
+              f"{store.years[0]}–{store.years[-1]}, series {names}")
+    elif len(sys.argv) in (5, 6) and sys.argv[1] == "get":
+        store = read_series(sys.argv[2])
+        name, iso3 = sys.argv[3], sys.argv[4].upper()
+        span = sys.argv[5] if len(sys.argv) == 6 else f"{store.years[0]}:{store.years[-1]}"
+        start, _, end = span.partition(":")
+        start, end = int(start), int(end or start)
+        for year, v in zip(range(start, end + 1), store.row(name, iso3, start, end)):
+            print(f"  {iso3} {name} {year}: {'n/a' if v != v else f'{v:g}'}")
+    else:
+        print(__doc__.strip().split("Usage:")[1])
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Apples to Apples — vectorised all-pairs similarity (offline QA)
+
+NumPy mirror of computeSimilarity() in src/matching.js for auditing match
+quality over every region pair at once. The region table becomes an N×K
+matrix of min-max normalised indicators plus a presence mask; scores for
+a whole batch of weight vectors (all presets, or any number of candidate
+presets) are computed together in row blocks sized to a memory budget.
+
+Scores match the JS exactly: terms are accumulated in INDICATOR_KEYS
+order with the same float operations, a pair only counts indicators both
+regions have, no shared indicator scores 0, and results are
+Math.round(x * 1000) / 10.
+
+Requires numpy (QA only; the build stages stay stdlib).
+
+Usage:
+  python3 similarity.py summary [weights.json]   # per-preset score stats
+  python3 similarity.py check                    # compare with match_index.py
+  weights.json: {"name": {"gdp": 0.5, ...}, ...}  (default: MATCH_PRESETS)
+"""
+
+import json
+import sys
+
+import numpy as np
+
+from build_regions import DEFAULT_DATA_FILE, build_columns
+from datajs import DataJsDocument
+from match_index import parse_presets
+
+DEFAULT_MEMORY_MB = 256
+
+
+# ============================================================
+# REGION MATRIX
+# ============================================================
+
+class RegionMatrix:
+    """REGIONS as N×K arrays over the scorable INDICATOR_KEYS.
+
+    values[i, k] is region i's indicator k normalised with
+    computeNormParams' min/max (0 where missing); mask[i, k] says whether
+    it is present.
+    """
+
+    def __init__(self, ids, keys, values, mask):
+        self.ids = ids
+        self.keys = keys
+        self.values = values
+        self.mask = mask
+
+    @classmethod
+    def from_doc(cls, doc):
+        artifact = build_columns(doc)
+        columns = artifact["columns"]
+        keys = [k for k in doc.indicators.keys()
+                if k in columns and any(v is not None for v in columns[k])]
+        raw = np.array([[np.nan if v is None else v for v in columns[k]] for k in keys],
+                       dtype=np.float64).T.reshape(artifact["count"], len(keys))
+        mask = ~np.isnan(raw)
+        lo, hi = np.nanmin(raw, axis=0), np.nanmax(raw, axis=0)
+        span = hi - lo
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values = np.where(span == 0, 0.5, (raw - lo) / span)
+        values[~mask] = 0.0
+        return cls(artifact["strings"]["id"], keys, values, mask)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def weight_matrix(self, presets):
+        """P×K weights for a list of {indicator: weight} dicts; weights <= 0
+        and unknown indicators are dropped, as in computeSimilarity."""
+        W = np.zeros((len(presets), len(self.keys)))
+        for p, weights in enumerate(presets):
+            for k, key in enumerate(self.keys):
+                w = weights.get(key) or 0
+                if w > 0:
+                    W[p, k] = w
+        return W
+
+
+# ============================================================
+# SCORING
+# ============================================================
+
+def js_round(x):
+    """Math.round elementwise: halves go up."""
+    r = np.floor(x)
+    return r + (x - r >= 0.5)
+
+
+def block_rows(n, presets, memory_mb=DEFAULT_MEMORY_MB):
+    """Source rows per block so ~4 float64 arrays of P×rows×N fit."""
+    per_row = 4 * 8 * max(presets, 1) * max(n, 1)
+    return max(1, min(n, memory_mb * 2**20 // per_row))
+
+
+def score_block(matrix, W, rows):
+    """P×len(rows)×N scores (score = computeSimilarity(rows[i], t, W[p]))."""
+    X, M = matrix.values, matrix.mask
+    P, N = W.shape[0], len(matrix)
+    total = np.zeros((P, len(rows), N))
+    weight = np.zeros((P, len(rows), N))
+    term = np.empty((len(rows), N))
+    tmp = np.empty((len(rows), N))
+    for k in range(len(matrix.keys)):
+        active = np.flatnonzero(W[:, k])
+        if not active.size:
+            continue
+        both = M[rows, k][:, None] & M[None, :, k]                  # B×N
+        np.subtract(X[rows, k][:, None], X[None, :, k], out=term)
+        np.abs(term, out=term)
+        np.subtract(1, term, out=term)
+        # An exact 0.0 where either value is missing leaves the running
+        # sums bit-identical to skipping the term, as the JS loop does
+        term[~both] = 0.0
+        present = both.astype(np.float64)
+        for p in active:
+            w = W[p, k]
+            np.multiply(term, w, out=tmp)
+            total[p] += tmp
+            np.multiply(present, w, out=tmp)
+            weight[p] += tmp
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scores = js_round(total / weight * 1000) / 10
+    scores[weight == 0] = 0.0
+    return scores
+
+
+def iter_scores(matrix, W, memory_mb=DEFAULT_MEMORY_MB):
+    """Yield (row slice, P×B×N scores) blocks covering all source rows."""
+    n = len(matrix)
+    step = block_rows(n, W.shape[0], memory_mb)
+    for start in range(0, n, step):
+        rows = np.arange(start, min(n, start + step))
+        yield slice(start, rows[-1] + 1), score_block(matrix, W, rows)
+
+
+def similarity_matrix(matrix, W, memory_mb=DEFAULT_MEMORY_MB):
+    """Full P×N×N score matrix (fine for thousands of regions; use
+    iter_scores / top_k beyond that)."""
+    out = np.empty((W.shape[0], len(matrix), len(matrix)))
+    for rows, scores in iter_scores(matrix, W, memory_mb):
+        out[:, rows] = scores
+    return out
+
+
+def top_k(matrix, W, k=20, memory_mb=DEFAULT_MEMORY_MB):
+    """(indices, scores), each P×N×k: findMatches' ranking for every source
+    row, i.e. the region itself (by id) excluded and ties kept in REGIONS
+    order."""
+    ids = np.array(matrix.ids)
+    P, N = W.shape[0], len(matrix)
+    k = min(k, N)
+    idx = np.zeros((P, N, k), dtype=np.int64)
+    val = np.zeros((P, N, k))
+    for rows, scores in iter_scores(matrix, W, memory_mb):
+        # Scores are tenths in [0, 100]: rank by the unique integer
+        # (1000 - score × 10) × N + index, so a partial sort keeps the
+        # stable tie order; the region itself goes last
+        tenths = np.rint(scores * 10).astype(np.int64)
+        same = ids[rows][:, None] == ids[None, :]
+        tenths[:, same] = -1
+        rank = (1000 - tenths) * N + np.arange(N)
+        part = np.argpartition(rank, k - 1, axis=2)[:, :, :k] if k < N else \
+            np.broadcast_to(np.arange(N), rank.shape)
+        order = np.take_along_axis(
+            part, np.argsort(np.take_along_axis(rank, part, axis=2), axis=2), axis=2)
+        idx[:, rows] = order
+        val[:, rows] = np.take_along_axis(scores, order, axis=2)
+    return idx, val
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def summary(matrix, names, W):
+    idx, val = top_k(matrix, W, k=5)
+    for p, name in enumerate(names):
+        top1 = val[p, :, 0]
+        print(f"  📈 {name:<16} top-1 mean {top1.mean():5.1f}  median {np.median(top1):5.1f}  "
+              f"min {top1.min():5.1f}  top-5 mean {val[p].mean():5.1f}  "
+              f"indicators {int((W[p] > 0).sum())}")
+
+
+def check(matrix, doc, names, W):
+    """Compare the top 20 against match_index.py's pure-Python ranking."""
+    from match_index import build_index
+    index = build_index(doc)
+    idx, val = top_k(matrix, W, k=index["k"])
+    first = {}
+    for i, region_id in enumerate(matrix.ids):
+        first.setdefault(region_id, i)
+    mismatches = 0
+    for p, name in enumerate(names):
+        for region_id, row in first.items():
+            expected = index["top"][name][region_id]
+            got = [x for t, s in zip(idx[p, row], val[p, row])
+                   for x in (int(t), int(round(s * 10)))][:len(expected)]
+            if got != expected:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"  ❌ {name}/{region_id}: {got[:6]} != {expected[:6]}")
+    total = len(names) * len(first)
+    print(f"  {'✅' if not mismatches else '❌'} {total - mismatches}/{total} rankings identical")
+    return mismatches == 0
+
+
+def main():
+    if len(sys.argv) not in (2, 3) or sys.argv[1] not in ("summary", "check"):
+        print(__doc__.strip().split("Usage:")[1])
+        sys.exit(1)
+    doc = DataJsDocument.load(DEFAULT_DATA_FILE)
+    matrix = RegionMatrix.from_doc(doc)
+    if len(sys.argv) == 3:
+        with open(sys.argv[2]) as f:
+            presets = json.load(f)
+    else:
+        presets = parse_presets(doc.text())
+    names = list(presets)
+    W = matrix.weight_matrix([presets[name] for name in names])
+    print(f"  🧮 {len(matrix)} regions × {len(matrix.keys)} indicators, {len(names)} weight vectors")
+
+    if sys.argv[1] == "summary":
+        summary(matrix, names, W)
+    elif not check(matrix, doc, names, W):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
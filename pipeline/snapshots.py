@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Apples to Apples — snapshot archive
+
+fetch_data.py, merge.py and pipeline_v4_inject.py overwrite
+data_changelog.json, data_metadata.json and data.js itself, so the state
+of an earlier run is gone and comparing two runs means diffing whole
+files. After every run that writes data.js, the archive records it:
+
+  pipeline/cache/snapshots/
+    objects/ab/cdef…   zlib blobs named by the SHA-256 of their content
+    runs/000001.json   one manifest per run, never rewritten
+
+RAW is stored column by column (id, name, …, one column per parseData
+field), each column cut into blocks of about BLOCK_ROWS cells at rows
+picked by a hash of the region id, so an inserted row moves no later
+block boundary. A block already in objects/ is not written again, so a
+run that changed a handful of cells costs a manifest plus the few blocks
+that hold them. The side files
+(metadata, changelogs, provenance) are stored the same way, whole.
+
+`diff` compares the manifests' block hashes first: identical columns and
+blocks are never read, and only the differing blocks are decompressed
+and compared cell by cell. Blocks pair up by their id block; rows of
+blocks whose ids changed are matched by id (nth copy of a duplicated id
+to nth copy).
+
+Usage:
+  python3 snapshots.py snapshot --label "manual edit"
+  python3 snapshots.py list
+  python3 snapshots.py diff              # previous run → latest
+  python3 snapshots.py diff 3 7          # run 3 → run 7 (-1 = latest)
+  python3 snapshots.py cat 3 data_changelog.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import zlib
+from bisect import bisect_right
+from itertools import accumulate
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, ".."))
+
+from build_regions import DEFAULT_DATA_FILE, STRING_FIELDS, parser_spec
+from datajs import DataJsDocument
+
+ARCHIVE_DIR = os.path.join(SCRIPT_DIR, "cache", "snapshots")
+BLOCK_ROWS = 64                                 # average block size
+MAX_BLOCK_ROWS = 4 * BLOCK_ROWS
+SIDE_FILES = ("data_metadata.json", "data_changelog.json", "data_coverage.json",
+              "data_provenance.json")          # next to data.js or in pipeline/, when present
+REPORT_LIMIT = 40
+
+
+# ============================================================
+# OBJECTS
+# ============================================================
+
+class Archive:
+    """Content-addressed blobs plus numbered run manifests."""
+
+    def __init__(self, root=ARCHIVE_DIR):
+        self.root = root
+        self.objects = os.path.join(root, "objects")
+        self.runs = os.path.join(root, "runs")
+        self._blocks = {}                       # hash → cells, per process
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects, digest[:2], digest[2:])
+
+    def put(self, data):
+        """Store bytes; returns their hash. Existing objects are not rewritten."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(zlib.compress(data, 6))
+            os.replace(tmp, path)
+        return digest
+
+    def get(self, digest):
+        with open(self._object_path(digest), "rb") as f:
+            return zlib.decompress(f.read())
+
+    def block(self, digest):
+        """A column block as a list of cell texts."""
+        if digest not in self._blocks:
+            self._blocks[digest] = self.get(digest).decode("utf-8").split("\n")
+        return self._blocks[digest]
+
+    def column(self, hashes):
+        return [cell for digest in hashes for cell in self.block(digest)]
+
+    # --- runs ---
+
+    def run_ids(self):
+        if not os.path.isdir(self.runs):
+            return []
+        return sorted(int(name[:-5]) for name in os.listdir(self.runs) if name.endswith(".json"))
+
+    def manifest(self, run):
+        with open(os.path.join(self.runs, f"{run:06d}.json")) as f:
+            return json.load(f)
+
+    def resolve(self, ref):
+        """Run number from "7", or "-1" (latest), "-2" (the one before)."""
+        ids = self.run_ids()
+        n = int(ref)
+        if n < 0:
+            if -n > len(ids):
+                raise SystemExit(f"❌ Only {len(ids)} runs archived")
+            return ids[n]
+        if n not in ids:
+            raise SystemExit(f"❌ No run {n}")
+        return n
+
+    def add_run(self, manifest):
+        """Write the next manifest (exclusive create, so concurrent runs
+        can't take the same number); returns its run number."""
+        os.makedirs(self.runs, exist_ok=True)
+        run = (self.run_ids() or [0])[-1] + 1
+        while True:
+            try:
+                with open(os.path.join(self.runs, f"{run:06d}.json"), "x") as f:
+                    json.dump(dict(manifest, run=run), f, indent=1, ensure_ascii=False)
+                return run
+            except FileExistsError:
+                run += 1
+
+
+# ============================================================
+# SNAPSHOT
+# ============================================================
+
+def columns_of(doc):
+    """[(name, [cell text per row])] for RAW, names from parseData()."""
+    names = list(STRING_FIELDS)
+    for key, idx, _ in parser_spec(doc.text()):
+        names += [None] * (idx + 1 - len(names))
+        names[idx] = key
+    rows = [row.fields for row in doc.rows]
+    width = max([len(names)] + [len(fields) for fields in rows])
+    names += [None] * (width - len(names))
+    return [(name or f"field{idx}", [fields[idx] if idx < len(fields) else "" for fields in rows])
+            for idx, name in enumerate(names)]
+
+
+def block_bounds(ids):
+    """[(start, end)] row spans: a block ends after a row whose id hashes
+    to 0 mod BLOCK_ROWS (or at MAX_BLOCK_ROWS), so inserting or removing a
+    row only changes the blocks around it, not every block after it."""
+    bounds, start = [], 0
+    for i, rid in enumerate(ids):
+        if zlib.crc32(rid.strip().encode("utf-8")) % BLOCK_ROWS == 0 or i + 1 - start == MAX_BLOCK_ROWS:
+            bounds.append((start, i + 1))
+            start = i + 1
+    if start < len(ids):
+        bounds.append((start, len(ids)))
+    return bounds
+
+
+def snapshot(data_file=DEFAULT_DATA_FILE, label=None, archive=None):
+    """Archive data.js and its side files. Returns (run, blocks written);
+    run is None if nothing changed since the latest run."""
+    archive = archive or Archive()
+    doc = DataJsDocument.load(data_file)
+    written = 0
+    columns = []
+    rows = 0
+    table = columns_of(doc)
+    bounds = block_bounds(table[0][1])
+    for name, cells in table:
+        rows = len(cells)
+        hashes = []
+        for start, end in bounds:
+            data = "\n".join(cells[start:end]).encode("utf-8")
+            written += not os.path.exists(archive._object_path(hashlib.sha256(data).hexdigest()))
+            hashes.append(archive.put(data))
+        columns.append([name, hashes])
+
+    files = {}
+    folder = os.path.dirname(os.path.abspath(data_file))
+    for name in SIDE_FILES:
+        for path in (os.path.join(folder, name), os.path.join(SCRIPT_DIR, name)):
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    files[name] = archive.put(f.read())
+                break
+    years = {key: doc.indicators[key].get("year") for key in doc.indicators.keys()
+             if "year" in doc.indicators[key]}
+
+    ids = archive.run_ids()
+    if ids:
+        latest = archive.manifest(ids[-1])
+        if latest["columns"] == columns and latest["files"] == files and latest["years"] == years:
+            return None, 0
+    run = archive.add_run({
+        "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "label": label,
+        "dataFile": os.path.relpath(data_file, os.path.join(SCRIPT_DIR, "..")),
+        "rows": rows,
+        "columns": columns,
+        "years": years,
+        "files": files,
+    })
+    return run, written
+
+
+def record(data_file, label, archive=None):
+    """snapshot() for the pipeline scripts: prints one line, never fails
+    the run that called it."""
+    try:
+        run, written = snapshot(data_file, label, archive)
+    except (OSError, ValueError) as e:
+        print(f"  ⚠️  Snapshot skipped: {e}")
+        return None
+    if run is None:
+        print("  🗃️  Snapshot: unchanged since the latest run")
+    else:
+        print(f"  🗃️  Snapshot: run {run} ({written} new blocks)")
+    return run
+
+
+# ============================================================
+# DIFF
+# ============================================================
+
+def row_keys(ids):
+    """(id, nth copy) per row, so duplicated ids still pair up."""
+    seen = {}
+    keys = []
+    for rid in ids:
+        rid = rid.strip()
+        seen[rid] = seen.get(rid, 0) + 1
+        keys.append((rid, seen[rid]))
+    return keys
+
+
+def diff(archive, a, b):
+    """Changes from run a to run b:
+    {"cells": [(id, column, old, new)], "added": [id], "removed": [id],
+     "years": [(key, old, new)], "files": [name], "blocksRead": n}"""
+    old, new = archive.manifest(a), archive.manifest(b)
+    old_cols, new_cols = dict(old["columns"]), dict(new["columns"])
+    result = {"cells": [], "added": [], "removed": [], "years": [], "files": [], "blocksRead": 0}
+
+    def block(digest):
+        result["blocksRead"] += 1
+        return archive.block(digest)
+
+    def compare(name, ids, before, after):
+        for rid, x, y in zip(ids, before, after):
+            if x != y:
+                result["cells"].append((rid[0], name, x, y))
+
+    # Rows: the id column's blocks give every block's row span and key.
+    old_ids = [block(h) for h in old_cols["id"]]
+    new_ids = old_ids if old_cols["id"] == new_cols["id"] else [block(h) for h in new_cols["id"]]
+    old_keys, new_keys = row_keys(sum(old_ids, [])), row_keys(sum(new_ids, []))
+    old_at = {key: i for i, key in enumerate(old_keys)}
+    new_set = set(new_keys)
+    result["removed"] = [rid for rid, n in old_keys if (rid, n) not in new_set]
+    result["added"] = [rid for rid, n in new_keys if (rid, n) not in old_at]
+    old_start = list(accumulate((len(b) for b in old_ids[:-1]), initial=0))
+    new_start = list(accumulate((len(b) for b in new_ids[:-1]), initial=0))
+
+    # Block j of the new run pairs with the old block holding the same ids
+    # (same id-block hash); only unpaired blocks need matching by key.
+    old_block_of = {}
+    for i, h in enumerate(old_cols["id"]):
+        old_block_of.setdefault(h, i)
+    pairs, unpaired = [], []
+    for j, h in enumerate(new_cols["id"]):
+        i = old_block_of.pop(h, None)
+        (unpaired if i is None else pairs).append((i, j))
+
+    for name, after in new["columns"]:
+        before = old_cols.get(name)
+        if name == "id" or before == after:
+            continue                            # column unchanged: never read
+        for i, j in pairs:
+            if before is None or before[i] != after[j]:
+                keys = new_keys[new_start[j]:new_start[j] + len(new_ids[j])]
+                cells = block(after[j])
+                compare(name, keys, block(before[i]) if before else [""] * len(cells), cells)
+        for _, j in unpaired:
+            keys = new_keys[new_start[j]:new_start[j] + len(new_ids[j])]
+            for key, y in zip(keys, block(after[j])):
+                i = old_at.get(key)
+                if i is None:
+                    continue                    # added row
+                n = bisect_right(old_start, i) - 1
+                x = archive.block(before[n])[i - old_start[n]] if before else ""
+                if x != y:
+                    result["cells"].append((key[0], name, x, y))
+
+    for key in sorted(set(old["years"]) | set(new["years"])):
+        if old["years"].get(key) != new["years"].get(key):
+            result["years"].append((key, old["years"].get(key), new["years"].get(key)))
+    result["files"] = sorted(name for name in set(old["files"]) | set(new["files"])
+                             if old["files"].get(name) != new["files"].get(name))
+    return result
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def print_diff(a, b, result):
+    cells = result["cells"]
+    print(f"🔍 Run {a} → run {b}: {len(cells)} cells changed, {len(result['added'])} regions added, "
+          f"{len(result['removed'])} removed ({result['blocksRead']} blocks read)")
+    for rid, name, old, new in cells[:REPORT_LIMIT]:
+        print(f"  {rid:10s} {name:20s} {old.strip() or '—':>12s} → {new.strip() or '—'}")
+    if len(cells) > REPORT_LIMIT:
+        print(f"  ... and {len(cells) - REPORT_LIMIT} more (--json for all)")
+    for label, ids in (("➕ added", result["added"]), ("➖ removed", result["removed"])):
+        if ids:
+            print(f"  {label}: {' '.join(ids[:REPORT_LIMIT])}" + (" …" if len(ids) > REPORT_LIMIT else ""))
+    for key, old, new in result["years"]:
+        print(f"  🏷️  {key}: year {old or '—'} → {new or '—'}")
+    if result["files"]:
+        print(f"  📄 changed: {', '.join(result['files'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Versioned snapshots of data.js")
+    parser.add_argument("--archive", default=ARCHIVE_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    snap = sub.add_parser("snapshot", help="Archive the current data.js")
+    snap.add_argument("--data-file", default=DEFAULT_DATA_FILE)
+    snap.add_argument("--label")
+    sub.add_parser("list", help="List archived runs")
+    compare = sub.add_parser("diff", help="Cell-level changes between two runs")
+    compare.add_argument("a", nargs="?", default="-2")
+    compare.add_argument("b", nargs="?", default="-1")
+    compare.add_argument("--json", action="store_true")
+    show = sub.add_parser("cat", help="Print a side file as archived by a run")
+    show.add_argument("run")
+    show.add_argument("name", choices=SIDE_FILES)
+    args = parser.parse_args()
+
+    archive = Archive(args.archive)
+    if args.command == "snapshot":
+        record(args.data_file, args.label, archive)
+    elif args.command == "list":
+        for run in archive.run_ids():
+            m = archive.manifest(run)
+            print(f"  {run:4d}  {m['at']}  {m['rows']:5d} rows  {m['label'] or ''}")
+    elif args.command == "diff":
+        a, b = archive.resolve(args.a), archive.resolve(args.b)
+        result = diff(archive, a, b)
+        if args.json:
+            json.dump(result, sys.stdout, indent=1, ensure_ascii=False)
+            print()
+        else:
+            print_diff(a, b, result)
+    elif args.command == "cat":
+        m = archive.manifest(archive.resolve(args.run))
+        if args.name not in m["files"]:
+            raise SystemExit(f"❌ Run {m['run']} has no {args.name}")
+        sys.stdout.write(archive.get(m["files"][args.name]).decode("utf-8"))
+
+
+if __name__ == "__main__":
+    main()
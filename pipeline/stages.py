@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+Apples to Apples — incremental pipeline runner
+
+Replaces the always-run-everything run_pipeline.sh. Each stage declares
+the files it reads and writes; the runner keeps a content hash of every
+input and output in cache/.stages.json and skips a stage when its inputs
+(and parameters such as --year) hash the same as on its last successful
+run and its outputs are still exactly what that run produced. Stages
+whose inputs overlap another stage's outputs run after it; the rest run
+in parallel.
+
+  extract       pipeline_v4_extract.py: source workbooks → pipeline_v4_lookup.json
+                + the WPP 2024–2100 series store (pipeline/cache/wpp2024.series)
+  merge         datadb.py import + load wb lookup → pipeline/data.sqlite,
+                merge.py --db resolves the cells there, datadb.py export
+                → src/data.js (one rewrite) + pipeline/data_provenance.json
+  disclaimers   year in the page disclaimers (src/pages/*.jsx)
+  regions       build_regions.py → src/regions.js, src/shards/
+  match_index   match_index.py   → src/matchIndex.js
+  match_tree    match_tree.py    → src/matchTree.js
+  build         vite build       → dist/  (skipped while src/ etc. are
+                                           byte-identical to the last build),
+                then bundle_report.py: chunk sizes, fails if RAW is bundled
+
+A stage that edits a file in place (data.js, the pages) lists it as an
+output only: it reruns when someone else changed the file, not because
+it changed it itself.
+
+Files are only re-hashed when their size or mtime changed, so a no-op run
+is a few stat() calls per input.
+
+The region scripts (add-regions/, expansion/) are one-off migrations that
+append rows to RAW, not re-runnable stages, so they are not part of this.
+
+Usage:
+  python3 stages.py                     # year 2022, cached World Bank data
+  python3 stages.py 2023                # different year
+  python3 stages.py 2022 --fetch        # download missing/expired indicators first
+  python3 stages.py 2022 --refresh      # re-download everything first
+  python3 stages.py --dry-run           # show what would run
+  python3 stages.py --force             # run every stage
+  python3 stages.py --only regions,match_index
+  python3 stages.py --no-build          # stop before vite build
+  python3 stages.py --jobs 1            # no parallelism
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.normpath(os.path.join(SCRIPT_DIR, ".."))
+STATE_FILE = os.path.join(SCRIPT_DIR, "cache", ".stages.json")
+PY = sys.executable or "python3"
+
+
+# ============================================================
+# STAGES
+# ============================================================
+
+class Stage:
+    """One step of the build. `run(params)` returns the stage's console
+    output; inputs and outputs are glob patterns relative to the repo
+    root."""
+
+    def __init__(self, name, run, inputs, outputs, params=()):
+        self.name = name
+        self.run = run
+        self.inputs = inputs
+        self.outputs = outputs
+        self.params = params
+
+    def __repr__(self):
+        return f"Stage({self.name!r})"
+
+
+def command(*argvs):
+    """A stage body running each argv in turn from the repo root."""
+    def run(params):
+        out = []
+        for argv in argvs:
+            argv = [str(a).format(**params) for a in argv]
+            proc = subprocess.run(argv, cwd=ROOT, stdout=subprocess.PIPE,
+                                  stderr=subprocess.STDOUT, text=True)
+            out.append(proc.stdout)
+            if proc.returncode:
+                raise StageError(f"{' '.join(argv)} exited with {proc.returncode}", "".join(out))
+        return "".join(out)
+    return run
+
+
+class StageError(Exception):
+    def __init__(self, message, output=""):
+        super().__init__(message)
+        self.output = output
+
+
+DISCLAIMER_PAGES = ["src/pages/Compare.jsx", "src/pages/Home.jsx"]
+DISCLAIMER_PATTERNS = [
+    "Data approximate, primarily 2022–2023",
+    "Data approximate, primarily 2022-2023",
+    "Country data unified to",
+]
+
+
+def update_disclaimers(params):
+    """The old run_pipeline.sh step: point the first matching disclaimer
+    string in each page at the target year. Writes only on change."""
+    out = []
+    new_text = (f"Country data unified to {params['year']} via World Bank API. "
+                f"Subnational data from 2021–2023. For reference only.")
+    for rel in DISCLAIMER_PAGES:
+        path = os.path.join(ROOT, rel)
+        with open(path, "r", encoding="utf-8") as f:
+            code = f.read()
+        updated = code
+        for old in DISCLAIMER_PATTERNS:
+            start = code.find(old)
+            if start < 0:
+                continue
+            end = re.search(r"['\"]", code[start:])
+            old_text = code[start:start + end.start()] if end else code[start:]
+            updated = code.replace(old_text, new_text, 1)
+            break
+        if updated != code:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(updated)
+            out.append(f"  ✅ {rel}\n")
+        else:
+            out.append(f"  ⏭️  {rel}: no disclaimer to update\n")
+    return "".join(out)
+
+
+PIPELINE_PY = ["pipeline/datajs.py", "pipeline/build_regions.py"]
+
+STAGES = [
+    Stage("extract", command([PY, "pipeline_v4_extract.py"]),
+          inputs=["*.xlsx", "pipeline_v4_extract.py", "pipeline/xlsx.py", "pipeline/series.py"],
+          outputs=["pipeline_v4_lookup.json", "pipeline/cache/wpp2024.series"]),
+    Stage("merge", command([PY, "pipeline/datadb.py", "import"],
+                           [PY, "pipeline/datadb.py", "load", "wb", "lookup"],
+                           [PY, "pipeline/merge.py", "--db", "--year", "{year}"],
+                           [PY, "pipeline/datadb.py", "export"]),
+          inputs=["pipeline/cache/*.json", "pipeline/cache/wb/*", "pipeline_v4_lookup.json",
+                  "pipeline/merge.py", "pipeline/datadb.py", "pipeline/fetch_data.py",
+                  "pipeline/colstore.py", "pipeline/series.py", "pipeline_v4_inject.py"]
+                 + PIPELINE_PY,
+          outputs=["src/data.js", "pipeline/data_provenance.json", "pipeline/data.sqlite"],
+          params=("year",)),
+    Stage("disclaimers", update_disclaimers,
+          inputs=["pipeline/stages.py"],
+          outputs=DISCLAIMER_PAGES,
+          params=("year",)),
+    Stage("regions", command([PY, "pipeline/build_regions.py"]),
+          inputs=["src/data.js"] + PIPELINE_PY,
+          outputs=["src/regions.js", "src/shards/*.js"]),
+    Stage("match_index", command([PY, "pipeline/match_index.py"]),
+          inputs=["src/data.js", "pipeline/match_index.py"] + PIPELINE_PY,
+          outputs=["src/matchIndex.js"]),
+    Stage("match_tree", command([PY, "pipeline/match_tree.py"]),
+          inputs=["src/data.js", "pipeline/match_tree.py", "pipeline/match_index.py"] + PIPELINE_PY,
+          outputs=["src/matchTree.js"]),
+    Stage("build", command(["npx", "--no-install", "vite", "build"],
+                           [PY, "pipeline/bundle_report.py"]),
+          inputs=["src/**/*", "index.html", "vite.config.js", "package.json",
+                  "tailwind.config.js", "postcss.config.js", "public/**/*",
+                  "pipeline/bundle_report.py"],
+          outputs=["dist/**/*"]),
+]
+
+
+# ============================================================
+# HASHING
+# ============================================================
+
+def expand(patterns):
+    """Sorted repo-relative files matching the patterns."""
+    files = set()
+    for pattern in patterns:
+        for path in glob.glob(os.path.join(ROOT, pattern), recursive=True):
+            if os.path.isfile(path):
+                files.add(os.path.relpath(path, ROOT))
+    return sorted(files)
+
+
+class Hasher:
+    """sha256 per file, reusing the stored digest while (size, mtime) match."""
+
+    def __init__(self, known):
+        self.known = known            # {path: [size, mtime_ns, digest]}
+
+    def __call__(self, rel):
+        path = os.path.join(ROOT, rel)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        entry = self.known.get(rel)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        self.known[rel] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+
+def matches(patterns, rel):
+    return any(glob_match(p, rel) for p in patterns)
+
+
+def glob_match(pattern, rel):
+    """Path match with glob semantics (* within a segment, ** across)."""
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+        elif pattern.startswith("**", i):
+            regex += ".*"
+            i += 2
+        elif pattern[i] == "*":
+            regex += "[^/]*"
+            i += 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+    return re.fullmatch(regex, rel) is not None
+
+
+def stage_key(stage, params, hasher):
+    """Digest of the stage's parameters and of every input that is not
+    also one of its outputs."""
+    h = hashlib.sha256(stage.name.encode())
+    for name in stage.params:
+        h.update(f"\0{name}={params[name]}".encode())
+    for rel in expand(stage.inputs):
+        if not matches(stage.outputs, rel):
+            h.update(f"\0{rel}\0{hasher(rel)}".encode())
+    return h.hexdigest()
+
+
+def output_hashes(stage, hasher):
+    return {rel: hasher(rel) for rel in expand(stage.outputs)}
+
+
+# ============================================================
+# SCHEDULING
+# ============================================================
+
+def dependencies(stages):
+    """{stage name: names of earlier stages whose outputs it reads}."""
+    deps = {}
+    for i, stage in enumerate(stages):
+        deps[stage.name] = {
+            other.name for other in stages[:i]
+            if any(overlaps(pattern, other.outputs) for pattern in stage.inputs)
+        }
+    return deps
+
+
+def overlaps(pattern, outputs):
+    """Could the input pattern match a file one of the output patterns
+    produces? Compared as patterns and on the outputs' current files."""
+    for out in outputs:
+        if glob_match(pattern, out) or glob_match(out, pattern):
+            return True
+        if any(glob_match(pattern, rel) for rel in expand([out])):
+            return True
+    return False
+
+
+def load_state():
+    try:
+        with open(STATE_FILE, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {"files": {}, "stages": {}}
+
+
+def save_state(state):
+    os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
+    tmp = STATE_FILE + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(tmp, STATE_FILE)
+
+
+def is_fresh(stage, params, state, hasher):
+    """(fresh?, key): same inputs as the last run and outputs untouched."""
+    key = stage_key(stage, params, hasher)
+    last = state["stages"].get(stage.name)
+    fresh = (bool(last) and "failed" not in last and last["key"] == key
+             and last["outputs"] == output_hashes(stage, hasher))
+    return fresh, key
+
+
+def run_stages(stages, params, jobs=4, force=False, dry_run=False):
+    """Run the DAG; returns {stage name: "ran" | "skipped" | "would run" | "failed"}."""
+    state = load_state()
+    hasher = Hasher(state["files"])
+    deps = dependencies(stages)
+    status = {}
+    pending = list(stages)
+
+    def visit(stage):
+        if dry_run:
+            upstream = any(status[d] == "would run" for d in deps[stage.name])
+            fresh, _ = is_fresh(stage, params, state, hasher)
+            return "would run" if force or upstream or not fresh else "skipped", ""
+        fresh, key = is_fresh(stage, params, state, hasher)
+        if fresh and not force:
+            return "skipped", ""
+        started = time.perf_counter()
+        try:
+            output = stage.run(params)
+            # Re-hash everything the stage may have written
+            for rel in expand(stage.outputs):
+                hasher.known.pop(rel, None)
+            state["stages"][stage.name] = {
+                "key": key,
+                "outputs": output_hashes(stage, hasher),
+                "ranAt": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "seconds": round(time.perf_counter() - started, 2),
+            }
+        except Exception as e:
+            # Recorded so the stage reruns next time even if its inputs don't change
+            state["stages"][stage.name] = {
+                "failed": str(e),
+                "ranAt": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            if isinstance(e, StageError):
+                raise
+            raise StageError(f"{type(e).__name__}: {e}") from e
+        return "ran", output
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            running = {}
+            while pending or running:
+                for stage in list(pending):
+                    if any(d in status and status[d] == "failed" for d in deps[stage.name]):
+                        status[stage.name] = "failed"
+                        pending.remove(stage)
+                        print(f"  ⛔ {stage.name}: upstream stage failed")
+                    elif all(d in status for d in deps[stage.name]):
+                        pending.remove(stage)
+                        running[pool.submit(visit, stage)] = stage
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    try:
+                        status[stage.name], output = future.result()
+                    except StageError as e:
+                        status[stage.name] = "failed"
+                        print(f"  ❌ {stage.name}: {e}")
+                        if e.output.strip():
+                            print(e.output.rstrip())
+                        continue
+                    icon = {"ran": "✅", "skipped": "⏭️ ", "would run": "🔍"}[status[stage.name]]
+                    print(f"  {icon} {stage.name}: {status[stage.name]}")
+                    if output.strip():
+                        print("     " + output.rstrip().replace("\n", "\n     "))
+    finally:
+        if not dry_run:
+            save_state(state)
+    return status
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Apples to Apples incremental pipeline")
+    parser.add_argument("year", nargs="?", type=int, default=2022)
+    parser.add_argument("--fetch", action="store_true",
+                        help="Download missing/expired World Bank indicators first")
+    parser.add_argument("--refresh", action="store_true", help="Re-download every indicator first")
+    parser.add_argument("--cache", action="store_true",
+                        help="Use cached data only (the default; kept for run_pipeline.sh)")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would run")
+    parser.add_argument("--force", action="store_true", help="Run every stage")
+    parser.add_argument("--only", type=str, default="", help="Comma-separated stage names")
+    parser.add_argument("--no-build", action="store_true", help="Skip the vite build")
+    parser.add_argument("--jobs", type=int, default=4)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    print(f"\n🍎 Apples to Apples — Pipeline (year {args.year})\n")
+
+    # The download is the one step that is not a function of files on disk;
+    # it only fills pipeline/cache/, which the update stage hashes
+    if (args.fetch or args.refresh) and not args.dry_run:
+        argv = [PY, "pipeline/fetch_data.py", "--year", str(args.year), "--dry-run",
+                "--data-file", "src/data.js"] + (["--refresh"] if args.refresh else [])
+        print("📡 Fetching World Bank data...")
+        if subprocess.run(argv, cwd=ROOT).returncode:
+            sys.exit(1)
+
+    only = {n.strip() for n in args.only.split(",") if n.strip()}
+    unknown = only - {s.name for s in STAGES}
+    if unknown:
+        print(f"  ❌ Unknown stage(s): {', '.join(sorted(unknown))}")
+        print(f"     Choose from: {', '.join(s.name for s in STAGES)}")
+        sys.exit(1)
+    stages = [s for s in STAGES if (not only or s.name in only)
+              and not (args.no_build and s.name == "build")]
+
+    status = run_stages(stages, {"year": args.year}, jobs=args.jobs,
+                        force=args.force, dry_run=args.dry_run)
+    ran = sum(1 for s in status.values() if s in ("ran", "would run"))
+    print(f"\n{'❌' if 'failed' in status.values() else '✅'} {ran}/{len(status)} stages "
+          f"{'would run' if args.dry_run else 'ran'} in {time.perf_counter() - started:.2f}s")
+    if "failed" in status.values():
+        sys.exit(1)
+    if status.get("build") == "ran":
+        print("   Deploy: npx gh-pages -d dist")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for datadb.py against a copy of src/data.js.
+
+Usage:
+  python3 -m pytest pipeline/test_datadb.py
+  python3 pipeline/test_datadb.py
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from datadb import DataDB
+from datajs import DataJsDocument
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "data.js")
+FIELD = 5       # population
+
+
+class PendingImportTest(unittest.TestCase):
+    """`import` keeps unexported database changes, but not by dropping a
+    data.js edit made to the same row."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.tmp, "data.js")
+        shutil.copy(DATA_FILE, self.data_file)
+        self.db = DataDB(os.path.join(self.tmp, "data.sqlite"))
+        self.db.begin_run("init")
+        self.db.import_doc(DataJsDocument.load(self.data_file))
+        self.db.set_meta("exported_run", self.db.run_id)
+        rows = dict(self.db.rows())
+        self.pos = next(pos for pos, fields in rows.items() if fields[0] == "us")
+        # A merge changes the row in the database only
+        self.db.begin_run("merge")
+        fields = list(rows[self.pos])
+        fields[FIELD] = "999"
+        self.db.put_row(self.pos, fields, rows[self.pos])
+
+    def tearDown(self):
+        self.db.conn.close()
+        shutil.rmtree(self.tmp)
+
+    def edit(self, value):
+        doc = DataJsDocument.load(self.data_file)
+        doc.rows["us"].set(FIELD, value)
+        doc.save(self.data_file)
+
+    def reimport(self, force=False):
+        self.db.begin_run("import")
+        return self.db.import_doc(DataJsDocument.load(self.data_file), keep_pending=True,
+                                  force=force)
+
+    def cell(self):
+        return dict(self.db.rows())[self.pos][FIELD]
+
+    def test_untouched_pending_row_is_kept(self):
+        doc = DataJsDocument.load(self.data_file)
+        doc.rows["ca"].set(FIELD, "1")
+        doc.save(self.data_file)
+        self.assertEqual(self.reimport(), (1, 0, 0))
+        self.assertEqual(self.cell(), "999")
+        self.assertEqual(self.db.pending_rows(), [self.pos])
+
+    def test_edit_to_pending_row_is_refused_unless_forced(self):
+        self.edit("7")
+        with self.assertRaises(ValueError):
+            self.reimport()
+        self.assertEqual(self.cell(), "999")
+
+        self.reimport(force=True)
+        self.assertEqual(self.cell(), "7")
+        self.assertEqual(self.db.pending_rows(), [])
+
+        # data.js is the row's baseline now, so a second edit is no conflict
+        self.edit("8")
+        self.reimport()
+        self.assertEqual(self.cell(), "8")
+
+
+if __name__ == "__main__":
+    unittest.main()
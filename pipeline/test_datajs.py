@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for datajs.py against src/data.js.
+
+Usage:
+  python3 -m pytest pipeline/test_datajs.py
+  python3 pipeline/test_datajs.py
+"""
+
+import difflib
+import os
+import shutil
+import tempfile
+import unittest
+
+from datajs import DataJsDocument, ObjectBlock
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "data.js")
+
+
+def changed_lines(a, b):
+    """Lines removed from a and added in b."""
+    return [line for line in difflib.ndiff(a.split("\n"), b.split("\n"))
+            if line[:1] in "+-"]
+
+
+class RoundTripTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "data.js")
+        shutil.copy(DATA_FILE, self.path)
+        with open(self.path, encoding="utf-8") as f:
+            self.original = f.read()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_untouched_document_is_byte_identical(self):
+        doc = DataJsDocument.load(self.path)
+        self.assertEqual(doc.text(), self.original)
+        self.assertFalse(doc.changed())
+        self.assertFalse(doc.save(self.path))
+        self.assertGreater(len(doc.rows), 400)
+        self.assertIn("population", doc.indicators)
+
+    def test_edit_changes_only_its_lines(self):
+        doc = DataJsDocument.load(self.path)
+        self.assertTrue(doc.rows["us"].set(5, "340.1"))
+        self.assertFalse(doc.rows["fr"].set(5, doc.rows["fr"].get(5)))
+        self.assertTrue(doc.indicators["gdp"].set("year", "2031", first=True))
+        self.assertTrue(doc.save(self.path))
+
+        with open(self.path, encoding="utf-8") as f:
+            saved = f.read()
+        diff = changed_lines(self.original, saved)
+        added = [line[2:] for line in diff if line.startswith("+")]
+        self.assertEqual(len(diff), 4, diff)        # one row and one entry, nothing else
+        self.assertTrue(added[0].startswith("us,United States,country,,🇺🇸,340.1,"), added)
+        self.assertTrue(added[1].startswith("  gdp: { year: '2031', label: 'GDP'"), added)
+
+        reloaded = DataJsDocument.load(self.path)
+        self.assertEqual(reloaded.rows["us"].get(5), "340.1")
+        self.assertEqual(reloaded.indicators["gdp"].get("year"), "2031")
+        self.assertEqual(reloaded.text(), saved)
+
+
+class ObjectBlockTest(unittest.TestCase):
+
+    def test_repeated_key_resolves_to_last_entry(self):
+        block = ObjectBlock("  a: { year: '2020' },\n  b: { year: '2021' },\n"
+                            "  a: { year: '2022' },")
+        self.assertEqual(block.keys(), ["a", "b"])
+        self.assertEqual(block["a"].get("year"), "2022")
+
+
+if __name__ == "__main__":
+    unittest.main()
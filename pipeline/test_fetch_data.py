@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Tests for fetch_data.py against a wb_replay.py server (no network).
+
+Usage:
+  python3 -m pytest pipeline/test_fetch_data.py
+  python3 pipeline/test_fetch_data.py
+"""
+
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import colstore
+import fetch_data
+from wb_coverage import Coverage
+from wb_replay import ReplayServer
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_FILE = os.path.join(SCRIPT_DIR, "..", "src", "data.js")
+WB_SNAPSHOT = os.path.join(SCRIPT_DIR, "cache", "wb_data_2022.json")
+YEAR = 2022
+NAME = "inflation"
+
+
+class ReplayCacheTest(unittest.TestCase):
+    """Fresh stores for every indicator in a temporary cache, NAME expired,
+    and a replay server for NAME."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        cache_dir = os.path.join(self.tmp, "cache")
+        store_dir = os.path.join(cache_dir, "wb")
+        self.patches = [
+            mock.patch.object(fetch_data, "CACHE_DIR", cache_dir),
+            mock.patch.object(fetch_data, "STORE_DIR", store_dir),
+            mock.patch.object(fetch_data, "CHECKPOINT_DIR", os.path.join(store_dir, ".checkpoint")),
+            mock.patch.object(fetch_data, "SESSION", fetch_data.SESSION),
+        ]
+        for patch in self.patches:
+            patch.start()
+        # Every indicator fresh except NAME, which has expired
+        now = time.strftime(fetch_data.TIMESTAMP_FORMAT)
+        for name in fetch_data.WB_FIELD_MAP:
+            fetch_data.save_store(name, {
+                "fetchedAt": "2000-01-01 00:00:00" if name == NAME else now,
+                "years": [YEAR - 2, YEAR + 2], "countries": None,
+                "points": {"USA": {YEAR: 3.0}},
+            })
+        self.cached = fetch_data.load_store(NAME)
+
+    def tearDown(self):
+        for patch in reversed(self.patches):
+            patch.stop()
+        shutil.rmtree(self.tmp)
+
+    @contextlib.contextmanager
+    def serve(self, error_rate, points=(("USA", YEAR, 8.0),)):
+        """Replay NAME's points; yields the base URL SESSION points at."""
+        code = fetch_data.WB_FIELD_MAP[NAME][1]
+        server = ReplayServer({code: {
+            "indicator": {"id": code, "value": NAME},
+            "countries": {"USA": "United States"},
+            "points": [list(p) for p in points],
+        }}, error_rate=error_rate)
+        base_url = server.start()
+        fetch_data.SESSION = fetch_data.WBSession(base_url=base_url, backoff_base=0.01,
+                                                  breaker_cooldown=60)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                yield base_url
+        finally:
+            fetch_data.SESSION.close()
+            server.stop()
+
+    def run_main(self, error_rate, *extra):
+        with self.serve(error_rate) as base_url:
+            argv = ["fetch_data.py", "--dry-run", "--all-countries", "--year", str(YEAR),
+                    "--rate", "1000", "--api-base", base_url, "--data-file", DATA_FILE, *extra]
+            with mock.patch.object(sys, "argv", argv):
+                fetch_data.main()
+
+    def selected(self):
+        stores = fetch_data.load_cache_entries()
+        return fetch_data.select_all(stores, YEAR, 2)[NAME]["USA"]["value"]
+
+
+class FailedFetchTest(ReplayCacheTest):
+    """A failed fetch must not replace a cached store or drop its checkpoint."""
+
+    def test_failed_fetch_keeps_cache_and_checkpoint(self):
+        self.run_main(1.0)
+        self.assertEqual(fetch_data.load_store(NAME), self.cached)
+        self.assertIsNotNone(fetch_data.load_plan())
+        self.assertEqual(self.selected(), 3.0)
+
+        # The next run still sees the old cache as due and refetches it
+        self.run_main(0.0, "--resume")
+        store = fetch_data.load_store(NAME)
+        self.assertNotEqual(store["fetchedAt"], self.cached["fetchedAt"])
+        self.assertIsNone(fetch_data.load_plan())
+        self.assertEqual(self.selected(), 8.0)
+
+    def test_resume_with_nothing_left_clears_plan(self):
+        fetch_data.save_plan({NAME: (YEAR - 2, YEAR + 2)}, None)
+        fetch_data.save_store(NAME, dict(self.cached, fetchedAt="2100-01-01 00:00:00"))
+        self.run_main(1.0, "--resume")
+        self.assertIsNone(fetch_data.load_plan())
+
+    def test_incomplete_points_merge_into_cached_store(self):
+        stores = {NAME: self.cached}
+        fetch_data.store_fetched(stores, NAME, {"FRA": {YEAR: 1.0}}, False,
+                                 (YEAR - 2, YEAR + 2), None)
+        store = fetch_data.load_store(NAME)
+        self.assertEqual(store["fetchedAt"], self.cached["fetchedAt"])
+        self.assertEqual(store["years"], self.cached["years"])
+        self.assertEqual(store["points"], {"USA": {YEAR: 3.0}, "FRA": {YEAR: 1.0}})
+
+
+class FillGapsTest(ReplayCacheTest):
+    """--fill-gaps records what it asked for and takes revised values."""
+
+    def test_checked_gaps_are_skipped_and_revisions_kept(self):
+        stores = {NAME: dict(self.cached, points={"USA": {YEAR - 7: 3.0}})}
+        coverage = Coverage.build(fetch_data.select_all(stores, YEAR, 100), YEAR,
+                                  ["USA", "FRA"], [NAME])
+        with self.serve(0.0, [("USA", YEAR - 7, 4.0)]):
+            self.assertEqual(fetch_data.fill_gaps(stores, coverage, 2), {NAME: (2, 0, 1)})
+            self.assertEqual(sorted(coverage.checked[NAME]), ["FRA", "USA"])
+            self.assertEqual(fetch_data.fill_gaps(stores, coverage, 2), {})
+        self.assertEqual(fetch_data.load_store(NAME)["points"]["USA"], {YEAR - 7: 4.0})
+
+        carried = fetch_data.build_coverage(stores, YEAR, Coverage.from_json(coverage.to_json()))
+        self.assertEqual(carried.checked, coverage.checked)
+
+    def test_future_point_outside_window_is_a_gap(self):
+        stores = {NAME: dict(self.cached, points={"USA": {YEAR + 7: 3.0}, "FRA": {YEAR + 1: 1.0}})}
+        coverage = Coverage.build(fetch_data.select_all(stores, YEAR, 100), YEAR,
+                                  ["USA", "FRA"], [NAME])
+        self.assertEqual(coverage.gaps(2), {NAME: ["USA"]})
+
+
+class HalfOpenCircuitTest(unittest.TestCase):
+    """Only one request gets through a half-open circuit at a time."""
+
+    def test_single_trial(self):
+        server = ReplayServer({}, latency_ms=100, error_rate=1.0)
+        session = fetch_data.WBSession(base_url=server.start(), max_retries=0,
+                                       breaker_threshold=1, breaker_cooldown=60)
+        session.opened_at = time.monotonic() - 61   # cooldown just over
+        errors = []
+
+        def request():
+            try:
+                session.get(f"{session.base_url}/country/all/indicator/X?format=json")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=request) for _ in range(4)]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            session.close()
+            server.stop()
+        self.assertEqual(server.requests, 1)
+        self.assertEqual(sum(isinstance(e, fetch_data.CircuitOpenError) for e in errors), 3)
+
+
+def legacy_transform_value(field_name, raw_value, transform):
+    """transform_value as it was before FIELD_SPECS (one branch per field)."""
+    if raw_value is None:
+        return None
+    divisor = {"div1e6": 1_000_000, "div1e9": 1_000_000_000, "div1e3": 1_000}.get(transform)
+    v = raw_value / divisor if divisor else raw_value
+    if field_name in ("gdpBillions", "exports", "fdiInflow", "gdpPerCapita", "area",
+                      "populationDensity"):
+        return int(round(v, 0))
+    return round(v, 1)
+
+
+def legacy_format_value(v):
+    if v is None:
+        return ""
+    if isinstance(v, int):
+        return str(v)
+    if v == int(v):
+        return str(int(v))
+    return str(v)
+
+
+class ConvertColumnTest(unittest.TestCase):
+    """convert_column gives the same text as the old per-value chain."""
+
+    def assertSameAsLegacy(self, name, values):
+        transform = fetch_data.WB_FIELD_MAP[name][2]
+        expected = [legacy_format_value(legacy_transform_value(name, v, transform))
+                    for v in values]
+        self.assertEqual(fetch_data.convert_column(fetch_data.FIELD_SPECS[name], values),
+                         expected, name)
+
+    def test_committed_cache(self):
+        with open(WB_SNAPSHOT) as f:
+            data = json.load(f)["data"]
+        checked = 0
+        for name, entries in data.items():
+            if name in fetch_data.WB_FIELD_MAP:
+                self.assertSameAsLegacy(name, [e["value"] for e in entries.values()])
+                checked += len(entries)
+        self.assertGreater(checked, 1000)
+
+    def test_edge_values(self):
+        values = [None, 0.0, -0.04, 0.05, 0.15, 2.675, 1e15, 3.3e17, -1.25e16, 335e6]
+        for name in fetch_data.WB_FIELD_MAP:
+            self.assertSameAsLegacy(name, values)
+
+
+class ColumnarStoreTest(unittest.TestCase):
+    """An A2AC store reads back (memory-mapped) exactly as it was written."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        rng = random.Random(7)
+        self.store = {
+            "fetchedAt": "2026-01-01 00:00:00", "years": [2015, 2024], "countries": None,
+            "points": {iso3: {year: rng.uniform(-1e12, 1e12)
+                              for year in rng.sample(range(2015, 2025), rng.randint(1, 10))}
+                       for iso3 in ("USA", "FRA", "DEU", "JPN", "BRA", "IND", "ZAF")},
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_round_trip_and_select_closest(self):
+        path = os.path.join(self.tmp, "inflation" + colstore.EXTENSION)
+        colstore.write_store(path, self.store, "inflation")
+        loaded = colstore.read_store(path)
+        self.assertEqual(loaded["indicator"], "inflation")
+        for key in ("fetchedAt", "years", "countries"):
+            self.assertEqual(loaded[key], self.store[key])
+        self.assertEqual(colstore.to_dict_points(loaded["points"]), self.store["points"])
+
+        for year in range(2013, 2027):
+            for fallback in range(4):
+                self.assertEqual(
+                    fetch_data.select_closest(loaded["points"], year, fallback),
+                    fetch_data.select_closest(self.store["points"], year, fallback),
+                    (year, fallback))
+
+    def test_rejects_non_iso3_keys(self):
+        store = dict(self.store, points={"USAX": {2020: 1.0}})
+        with self.assertRaises(ValueError):
+            colstore.write_store(os.path.join(self.tmp, "bad.col"), store)
+
+
+if __name__ == "__main__":
+    unittest.main()
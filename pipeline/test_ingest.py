@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for ingest.py on src/data.js in memory (nothing is written).
+
+Usage:
+  python3 -m pytest pipeline/test_ingest.py
+  python3 pipeline/test_ingest.py
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from datajs import DataJsDocument
+from ingest import ingest
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "data.js")
+POPULATION = 5
+EMPTY = 17          # empty in the cn-sz row
+
+
+class IngestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.doc = DataJsDocument.load(DATA_FILE)
+        self.rows = len(list(self.doc.rows))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def run_ingest(self, lines, **options):
+        path = os.path.join(self.tmp, "regions.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("// test regions\n\n" + "\n".join(lines) + "\n")
+        return ingest(self.doc, [path], **options)[1]
+
+    def sz_line(self, values):
+        """A cn-sz row with only the {field: text} values set."""
+        fields = ["cn-sz", "Shenzhen", "city", "cn", "🇨🇳"] + [""] * 30
+        for idx, value in values.items():
+            fields[idx] = value
+        return ",".join(fields)
+
+    def test_new_region_is_appended_once(self):
+        line = "zz-test,Testland,country,,🏳️,1.5"
+        report = self.run_ingest([line])
+        self.assertEqual(report["added"], ["zz-test"])
+        self.assertEqual(list(self.doc.rows)[-1].id, "zz-test")
+        self.assertEqual(len(self.doc.rows["zz-test"].fields), 35)     # padded to the layout
+
+        report = self.run_ingest([line])
+        self.assertEqual((report["added"], report["unchanged"]), ([], 1))
+        self.assertEqual(len(list(self.doc.rows)), self.rows + 1)
+
+    def test_fill_keeps_raw_values_and_fills_empty_fields(self):
+        old = self.doc.rows["cn-sz"].get(POPULATION)
+        report = self.run_ingest([self.sz_line({POPULATION: "99", EMPTY: "4.2"})])
+        self.assertEqual(report["updated"], {"cn-sz"})
+        self.assertEqual(self.doc.rows["cn-sz"].get(EMPTY), "4.2")
+        self.assertEqual(self.doc.rows["cn-sz"].get(POPULATION), old)
+        self.assertEqual([d[1:] for d in report["differences"]], [("cn-sz", POPULATION, old, "99")])
+
+    def test_update_and_skip(self):
+        line = self.sz_line({POPULATION: "99"})
+        self.run_ingest([line], on_existing="skip")
+        self.assertNotEqual(self.doc.rows["cn-sz"].get(POPULATION), "99")
+        self.run_ingest([line], on_existing="update")
+        self.assertEqual(self.doc.rows["cn-sz"].get(POPULATION), "99")
+
+    def test_conflicts(self):
+        report = self.run_ingest(["us,Utopia,country,,🏳️,2", "zz-wide,Wide,country,,🏳️" + ",1" * 40])
+        self.assertEqual([c[1] for c in report["conflicts"]], ["us", ""])
+        self.assertEqual(self.doc.rows["us"].get(1), "United States")
+        self.assertEqual(len(list(self.doc.rows)), self.rows)
+
+        report = self.run_ingest(["us,Utopia,country,,🏳️,2"], rename=True)
+        self.assertEqual(report["renamed"], [("us", "us2")])
+        self.assertEqual(self.doc.rows["us2"].get(1), "Utopia")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for merge.py's resolution rules on src/data.js (nothing is written).
+
+Usage:
+  python3 -m pytest pipeline/test_merge.py
+  python3 pipeline/test_merge.py
+"""
+
+import os
+import unittest
+
+from datajs import DataJsDocument
+from merge import Merge, resolve
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "data.js")
+POPULATION, GDP = 5, 6          # "recent" and "priority" (default) rule fields
+
+
+class MergeRulesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.doc = DataJsDocument.load(DATA_FILE)
+        self.raw = {rid: self.doc.rows[rid].get(GDP) for rid in ("us", "fr", "de", "jp")}
+
+    def merge(self, sources):
+        return Merge(self.doc, sources).run()
+
+    def test_priority_lookup_then_wb_then_raw(self):
+        report = self.merge({
+            "lookup": {GDP: {"USA": ("30000", 2024, "IMF WEO Oct 2024")}},
+            "wb": {GDP: {"USA": ("29500", 2023, "World Bank"),
+                         "FRA": ("3100", 2023, "World Bank")}},
+        })
+        self.assertEqual(self.doc.rows["us"].get(GDP), "30000")
+        self.assertEqual(self.doc.rows["fr"].get(GDP), "3100")
+        self.assertEqual(self.doc.rows["jp"].get(GDP), self.raw["jp"])
+        self.assertEqual(report["provenance"]["us"]["gdp"], [30000.0, 2024, "IMF WEO Oct 2024"])
+        self.assertEqual(report["provenance"]["fr"]["gdp"], [3100.0, 2023, "World Bank"])
+        self.assertNotIn("jp", report["provenance"])
+        self.assertEqual((report["wins"]["lookup"], report["wins"]["wb"]), (1, 1))
+
+    def test_recent_takes_the_newest_year(self):
+        self.merge({
+            "lookup": {POPULATION: {"USA": ("340", 2022, "UN WPP 2024"),
+                                    "FRA": ("68", 2024, "UN WPP 2024")}},
+            "wb": {POPULATION: {"USA": ("338", 2024, "World Bank"),
+                                "FRA": ("67", 2024, "World Bank")}},
+        })
+        self.assertEqual(self.doc.rows["us"].get(POPULATION), "338")
+        self.assertEqual(self.doc.rows["fr"].get(POPULATION), "68")   # tie: SOURCE_ORDER
+
+    def test_unit_mismatch_falls_through(self):
+        report = self.merge({
+            "lookup": {GDP: {"DEU": ("4500000000", 2024, "IMF WEO Oct 2024")}},
+            "wb": {GDP: {"DEU": ("4400", 2023, "World Bank")}},
+        })
+        self.assertEqual(self.doc.rows["de"].get(GDP), "4400")
+        self.assertEqual([(r["region"], r["source"]) for r in report["rejected"]],
+                         [("de", "lookup")])
+
+        won, rejected = resolve("priority", [("wb", ("60000", 2023, "World Bank"))], "500")
+        self.assertIsNone(won)
+        self.assertEqual(rejected, [("wb", "60000", 2023)])
+        won, _ = resolve("priority", [("wb", ("49000", 2023, "World Bank"))], "500")
+        self.assertEqual(won, ("49000", 2023, "wb", "World Bank"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for snapshots.py on a copy of src/data.js with a temporary archive.
+
+Usage:
+  python3 -m pytest pipeline/test_snapshots.py
+  python3 pipeline/test_snapshots.py
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from datajs import DataJsDocument, Row
+from snapshots import Archive, diff, snapshot
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "data.js")
+
+
+class SnapshotDiffTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.tmp, "data.js")
+        shutil.copy(DATA_FILE, self.data_file)
+        self.archive = Archive(os.path.join(self.tmp, "snapshots"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_diff_reads_only_changed_blocks(self):
+        first, _ = snapshot(self.data_file, "first", self.archive)
+        self.assertEqual(snapshot(self.data_file, "again", self.archive), (None, 0))
+
+        doc = DataJsDocument.load(self.data_file)
+        old = doc.rows["us"].get(5)
+        doc.rows["us"].set(5, "340.1")
+        doc.indicators["gdp"].set("year", "2031")
+        lines = doc.rows.lines
+        at = lines.index(doc.rows["fr"])            # a row inserted mid-RAW
+        lines.insert(at, Row("zz-test,Testland,country,,🏳️,1.5"))
+        doc.save(self.data_file)
+        with open(os.path.join(self.tmp, "data_metadata.json"), "w") as f:
+            f.write("{}")
+        second, written = snapshot(self.data_file, "second", self.archive)
+        self.assertEqual(second, first + 1)
+        self.assertGreater(written, 0)
+
+        result = diff(self.archive, first, second)
+        self.assertEqual(result["cells"], [("us", "population", old, "340.1")])
+        self.assertEqual((result["added"], result["removed"]), (["zz-test"], []))
+        self.assertEqual(result["years"], [("gdp", "2024", "2031")])
+        self.assertEqual(result["files"], ["data_metadata.json"])
+        manifest = self.archive.manifest(second)
+        blocks = sum(len(hashes) for _, hashes in manifest["columns"])
+        self.assertLess(result["blocksRead"], blocks // 4)
+
+        reverse = diff(self.archive, second, first)
+        self.assertEqual(reverse["cells"], [("us", "population", "340.1", old)])
+        self.assertEqual(reverse["removed"], ["zz-test"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Apples to Apples — World Bank coverage matrix
+
+Which (country, indicator) cells the World Bank cache can fill for a
+target year, and how old the value is. fetch_data.py writes it next to
+data_metadata.json as data_coverage.json, and --fill-gaps reads it to
+request only the missing or stale cells.
+
+Cells are countries (ISO3, rows) × indicators (WB_FIELD_MAP names,
+columns), row-major, i·K + j. The value is the cached year closest to the
+target (any distance), so a cell the ±fallback window skips still shows
+its lag:
+
+  {"targetYear": 2022, "countries": [iso3, ...], "indicators": [name, ...],
+   "present": base64 bitmap, bit i·K + j, least significant bit first,
+   "lag":     base64 int8 array, targetYear − year (clamped to ±127,
+              MISSING_LAG where the bit is 0),
+   "checkedAt": {name: {iso3: "YYYY-MM-DD HH:MM:SS"}}}
+
+checkedAt is sparse: the last time --fill-gaps asked the API for a cell,
+whether or not it had a value, so a gap the World Bank cannot fill is not
+requested again on every run.
+
+Usage:
+  python3 wb_coverage.py ../src/data_coverage.json           # per-indicator summary
+  python3 wb_coverage.py ../src/data_coverage.json --gaps 2  # cells missing or > 2 years off
+"""
+
+import argparse
+import base64
+import json
+import os
+from array import array
+
+MISSING_LAG = -128
+
+
+class Coverage:
+    """Presence bitmap + year-lag array over countries × indicators."""
+
+    def __init__(self, target_year, countries, indicators, present, lag, checked=None):
+        self.target_year = target_year
+        self.countries = list(countries)
+        self.indicators = list(indicators)
+        self.present = bytearray(present)
+        self.lag = array("b", lag)
+        self.checked = {name: dict(cells) for name, cells in (checked or {}).items()}
+        self.row = {iso3: i for i, iso3 in enumerate(self.countries)}
+        self.column = {name: j for j, name in enumerate(self.indicators)}
+
+    @classmethod
+    def build(cls, selected, target_year, countries, indicators, checked=None):
+        """From {name: {iso3: {"value", "year"}}} (fetch_data.select_all)."""
+        k = len(indicators)
+        present = bytearray((len(countries) * k + 7) // 8)
+        lag = array("b", [MISSING_LAG]) * (len(countries) * k)
+        for j, name in enumerate(indicators):
+            entries = selected.get(name) or {}
+            for i, iso3 in enumerate(countries):
+                entry = entries.get(iso3)
+                if entry is None:
+                    continue
+                cell = i * k + j
+                present[cell >> 3] |= 1 << (cell & 7)
+                lag[cell] = max(-127, min(127, target_year - entry["year"]))
+        return cls(target_year, countries, indicators, present, lag, checked)
+
+    def _cell(self, iso3, name):
+        return self.row[iso3] * len(self.indicators) + self.column[name]
+
+    def has(self, iso3, name):
+        cell = self._cell(iso3, name)
+        return bool(self.present[cell >> 3] >> (cell & 7) & 1)
+
+    def lag_of(self, iso3, name):
+        """Years behind the target, or None if the cache has no value."""
+        return self.lag[self._cell(iso3, name)] if self.has(iso3, name) else None
+
+    def gaps(self, max_lag, checked_since=None):
+        """{name: [iso3, ...]} missing or more than max_lag years from the
+        target year either way, leaving out cells checked at or after
+        checked_since (a timestamp)."""
+        k = len(self.indicators)
+        result = {}
+        for j, name in enumerate(self.indicators):
+            recent = {iso3 for iso3, at in self.checked.get(name, {}).items()
+                      if checked_since and at >= checked_since}
+            stale = [iso3 for i, iso3 in enumerate(self.countries)
+                     if iso3 not in recent
+                     and (not self.present[(i * k + j) >> 3] >> ((i * k + j) & 7) & 1
+                          or abs(self.lag[i * k + j]) > max_lag)]
+            if stale:
+                result[name] = stale
+        return result
+
+    def mark_checked(self, name, countries, timestamp):
+        cells = self.checked.setdefault(name, {})
+        for iso3 in countries:
+            cells[iso3] = timestamp
+
+    def summary(self):
+        """[(name, present, missing, max lag)] per indicator."""
+        rows = []
+        for name in self.indicators:
+            lags = [self.lag_of(iso3, name) for iso3 in self.countries]
+            have = [v for v in lags if v is not None]
+            rows.append((name, len(have), len(lags) - len(have), max(have, key=abs) if have else None))
+        return rows
+
+    # --- serialization ---
+
+    def to_json(self):
+        return {
+            "targetYear": self.target_year,
+            "countries": self.countries,
+            "indicators": self.indicators,
+            "present": base64.b64encode(bytes(self.present)).decode("ascii"),
+            "lag": base64.b64encode(self.lag.tobytes()).decode("ascii"),
+            "checkedAt": {name: dict(sorted(cells.items()))
+                          for name, cells in sorted(self.checked.items()) if cells},
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        lag = array("b")
+        lag.frombytes(base64.b64decode(data["lag"]))
+        return cls(data["targetYear"], data["countries"], data["indicators"],
+                   base64.b64decode(data["present"]), lag, data.get("checkedAt"))
+
+    def save(self, path):
+        """Write if changed; returns True if the file changed."""
+        text = json.dumps(self.to_json(), indent=2) + "\n"
+        if os.path.exists(path):
+            with open(path) as f:
+                if f.read() == text:
+                    return False
+        with open(path, "w") as f:
+            f.write(text)
+        return True
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_json(json.load(f))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect a World Bank coverage matrix")
+    parser.add_argument("path")
+    parser.add_argument("--gaps", type=int, metavar="YEARS",
+                        help="List cells missing or older than YEARS")
+    args = parser.parse_args()
+
+    coverage = Coverage.load(args.path)
+    print(f"📋 {len(coverage.countries)} countries × {len(coverage.indicators)} indicators, "
+          f"target {coverage.target_year}")
+    if args.gaps is None:
+        for name, have, missing, worst in coverage.summary():
+            icon = "✅" if not missing else ("⚠️" if have else "❌")
+            print(f"  {icon} {name:20s} {have:4d} present, {missing:4d} missing"
+                  + (f", up to {worst} years old" if worst else ""))
+    else:
+        gaps = coverage.gaps(args.gaps)
+        for name, countries in gaps.items():
+            print(f"  {name:20s} {len(countries):4d}: {' '.join(countries)}")
+        print(f"  {sum(len(c) for c in gaps.values())} cells missing or > {args.gaps} years old")
+
+
+if __name__ == "__main__":
+    main()
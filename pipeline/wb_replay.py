@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Apples to Apples — World Bank API record/replay harness
+
+Serves recorded /v2/country/.../indicator/... pages from local fixtures so
+fetch_data.py can run (and be benchmarked) without the live API. The
+server re-paginates fixtures per request, so per_page/page, date=a:b,
+mrv=N and batched country/A;B;C paths all behave like the real thing.
+
+Fixtures live in pipeline/fixtures/wb/{INDICATOR}.json:
+  {"indicator": {"id", "value"}, "countries": {iso3: name},
+   "points": [[iso3, year, value_or_null], ...]}   # API order
+
+Usage:
+  python3 wb_replay.py record               # Record all WB_FIELD_MAP indicators (live API)
+  python3 wb_replay.py record --years 2000:2024
+  python3 wb_replay.py synth                # Build fixtures from pipeline/cache (offline)
+  python3 wb_replay.py serve --port 8765    # Serve fixtures
+  python3 wb_replay.py serve --latency 120 --error-rate 0.05 --page-size 100
+
+Then:
+  python3 fetch_data.py --api-base http://127.0.0.1:8765/v2 ...
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+import fetch_data
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "wb")
+
+
+# ============================================================
+# FIXTURES
+# ============================================================
+
+def fixture_path(indicator_code, fixture_dir=FIXTURE_DIR):
+    return os.path.join(fixture_dir, f"{indicator_code}.json")
+
+def save_fixture(indicator_code, fixture, fixture_dir=FIXTURE_DIR):
+    os.makedirs(fixture_dir, exist_ok=True)
+    with open(fixture_path(indicator_code, fixture_dir), 'w') as f:
+        json.dump(fixture, f, separators=(",", ":"))
+
+def load_fixtures(fixture_dir=FIXTURE_DIR):
+    fixtures = {}
+    if not os.path.isdir(fixture_dir):
+        return fixtures
+    for fname in sorted(os.listdir(fixture_dir)):
+        if fname.endswith(".json"):
+            with open(os.path.join(fixture_dir, fname), 'r') as f:
+                fixtures[fname[:-len(".json")]] = json.load(f)
+    return fixtures
+
+def record_fixtures(start_year, end_year, fixture_dir=FIXTURE_DIR):
+    """Download every WB_FIELD_MAP indicator (country/all, all pages) as-is,
+    aggregates and null values included."""
+    session = fetch_data.SESSION
+    for name, (_, code, _) in fetch_data.WB_FIELD_MAP.items():
+        print(f"  ⏺️  {name} ({code})...")
+        points, countries, meta = [], {}, None
+        page, total_pages = 1, 1
+        while page <= total_pages:
+            url = (f"{session.base_url}/country/all/indicator/{code}"
+                   f"?date={start_year}:{end_year}&format=json&per_page=1000&page={page}")
+            data = json.loads(session.get(url).decode())
+            if not data or len(data) < 2 or not data[1]:
+                break
+            total_pages = data[0].get("pages", 1)
+            for entry in data[1]:
+                meta = meta or entry.get("indicator")
+                iso3 = entry.get("countryiso3code", "")
+                if not iso3:
+                    continue
+                countries.setdefault(iso3, (entry.get("country") or {}).get("value", iso3))
+                points.append([iso3, int(entry["date"]), entry.get("value")])
+            page += 1
+        save_fixture(code, {"indicator": meta or {"id": code, "value": name},
+                            "countries": countries, "points": points}, fixture_dir)
+        print(f"     {len(points)} points, {len(countries)} economies")
+    session.print_stats()
+
+def synth_fixtures(fixture_dir=FIXTURE_DIR):
+    """Build fixtures from the local cache stores (no network). Points are
+    written in API order: by country, newest year first."""
+    stores = fetch_data.load_cache_entries()
+    if not stores:
+        print("  ❌ No cache found. Run fetch_data.py (or `record`) first.")
+        sys.exit(1)
+    for name, store in stores.items():
+        code = fetch_data.WB_FIELD_MAP[name][1]
+        points = [[iso3, year, series[year]]
+                  for iso3, series in store["points"].items()
+                  for year in sorted(series, reverse=True)]
+        save_fixture(code, {"indicator": {"id": code, "value": name},
+                            "countries": {iso3: iso3 for iso3 in store["points"]},
+                            "points": points}, fixture_dir)
+        print(f"  🧪 {name} ({code}): {len(points)} points")
+
+
+# ============================================================
+# REPLAY SERVER
+# ============================================================
+
+class ReplayServer:
+    """Threaded HTTP stand-in for the World Bank v2 API.
+
+    latency_ms/jitter_ms delay every response, error_rate turns a random
+    share of requests into 503s (seeded, so runs are repeatable), and
+    page_size, when set, overrides the client's per_page so fixtures can be
+    split into as many pages as a benchmark needs.
+    """
+
+    def __init__(self, fixtures, host="127.0.0.1", port=0, latency_ms=0, jitter_ms=0,
+                 error_rate=0.0, page_size=None, seed=0):
+        self.fixtures = fixtures
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.page_size = page_size
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v2"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _roll(self):
+        with self.lock:
+            self.requests += 1
+            delay = self.latency_ms + (self.random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+            fail = self.error_rate and self.random.random() < self.error_rate
+        return delay / 1000, fail
+
+    def respond(self, path, query):
+        """Return (status, JSON-able body) for an API path."""
+        parts = path.strip("/").split("/")
+        # v2/country/{codes}/indicator/{code}
+        if len(parts) != 5 or parts[0] != "v2" or parts[1] != "country" or parts[3] != "indicator":
+            return 404, [{"message": [{"id": "120", "key": "Invalid value"}]}]
+        codes, indicator = parts[2], parts[4]
+        fixture = self.fixtures.get(indicator)
+        if fixture is None:
+            return 200, [{"message": [{"id": "175", "key": "Invalid format",
+                                       "value": "The indicator was not found."}]}]
+
+        wanted = None if codes.lower() == "all" else set(codes.upper().split(";"))
+        points = [p for p in fixture["points"] if wanted is None or p[0] in wanted]
+        if "date" in query:
+            start, _, end = query["date"].partition(":")
+            start, end = int(start), int(end or start)
+            points = [p for p in points if start <= p[1] <= end]
+        if "mrv" in query:
+            mrv, seen, kept = int(query["mrv"]), {}, []
+            for p in points:  # newest first within each country
+                if seen.get(p[0], 0) < mrv:
+                    seen[p[0]] = seen.get(p[0], 0) + 1
+                    kept.append(p)
+            points = kept
+
+        per_page = self.page_size or int(query.get("per_page", 50))
+        page = int(query.get("page", 1))
+        total = len(points)
+        pages = max(1, -(-total // per_page))
+        chunk = points[(page - 1) * per_page:page * per_page]
+        meta = {"page": page, "pages": pages, "per_page": per_page, "total": total,
+                "sourceid": "2", "lastupdated": "replay"}
+        names = fixture.get("countries", {})
+        entries = [{
+            "indicator": fixture["indicator"],
+            "country": {"id": iso3, "value": names.get(iso3, iso3)},
+            "countryiso3code": iso3,
+            "date": str(year),
+            "value": value,
+            "unit": "", "obs_status": "", "decimal": 1,
+        } for iso3, year, value in chunk]
+        return 200, [meta, entries or None]
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+            disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                delay, fail = server._roll()
+                if delay:
+                    time.sleep(delay)
+                if fail:
+                    self._send(503, b"Service Unavailable", "text/plain")
+                    return
+                url = urlsplit(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                status, body = server.respond(url.path, query)
+                self._send(status, json.dumps(body).encode(), "application/json")
+
+            def _send(self, status, body, content_type):
+                gz = "gzip" in (self.headers.get("Accept-Encoding") or "")
+                if gz:
+                    body = gzip.compress(body, 1)
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                if gz:
+                    self.send_header("Content-Encoding", "gzip")
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="World Bank API record/replay harness")
+    parser.add_argument("--fixtures", type=str, default=FIXTURE_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="Record fixtures from the live API")
+    rec.add_argument("--years", type=str, default="2000:2024")
+    rec.add_argument("--api-base", type=str, default=fetch_data.WB_API_BASE)
+
+    sub.add_parser("synth", help="Build fixtures from the local cache")
+
+    srv = sub.add_parser("serve", help="Serve fixtures over HTTP")
+    srv.add_argument("--host", type=str, default="127.0.0.1")
+    srv.add_argument("--port", type=int, default=8765)
+    srv.add_argument("--latency", type=float, default=0, help="Per-response delay (ms)")
+    srv.add_argument("--jitter", type=float, default=0, help="Extra random delay, 0..N ms")
+    srv.add_argument("--error-rate", type=float, default=0.0, help="Share of 503 responses")
+    srv.add_argument("--page-size", type=int, default=None,
+                     help="Override per_page to force more pages")
+    srv.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.command == "record":
+        start, end = (int(y) for y in args.years.split(":"))
+        fetch_data.SESSION.base_url = args.api_base.rstrip("/")
+        print(f"⏺️  Recording {len(fetch_data.WB_FIELD_MAP)} indicators ({start}–{end}) "
+              f"→ {args.fixtures}\n")
+        record_fixtures(start, end, args.fixtures)
+    elif args.command == "synth":
+        print(f"🧪 Building fixtures from cache → {args.fixtures}\n")
+        synth_fixtures(args.fixtures)
+    else:
+        fixtures = load_fixtures(args.fixtures)
+        if not fixtures:
+            print(f"  ❌ No fixtures in {args.fixtures}. Run `record` or `synth` first.")
+            sys.exit(1)
+        server = ReplayServer(fixtures, args.host, args.port, args.latency, args.jitter,
+                              args.error_rate, args.page_size, args.seed)
+        print(f"🔁 Replaying {len(fixtures)} indicators at {server.base_url}")
+        print(f"   latency {args.latency:.0f}±{args.jitter:.0f} ms, "
+              f"error rate {args.error_rate:.0%}, page size {args.page_size or 'client'}")
+        print(f"   python3 fetch_data.py --api-base {server.base_url} ...")
+        try:
+            server.httpd.serve_forever()
+        except KeyboardInterrupt:
+            print(f"\n  {server.requests} requests served")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Pipeline v4: Workbook extraction
+Builds pipeline_v4_lookup.json (read by pipeline_v4_inject.py) from the
+source workbooks next to this script:
+
+  HDR23-24_Statistical_Annex_HDI_Table*.xlsx  → hdi              (UNDP HDR 2023/24)
+  UN_PPP2024_Output_PopTot*.xlsx              → population       (UN WPP 2024, median
+                                                                  projection; only where
+                                                                  no other source has it)
+  UN_PPP2024_Output_PopGrowthRate*.xlsx       → populationGrowth (UN WPP 2024, median)
+
+Sheets are streamed with pipeline/xlsx.py, reading only the needed rows
+and columns. Workbooks are hashed first: byte-identical copies (a browser's
+"... (1).xlsx") are extracted once, and each extraction is cached under
+pipeline/cache/xlsx/ by content hash, so unchanged workbooks are never
+parsed twice. The rest are extracted in parallel processes.
+
+The WPP workbooks are kept whole: the median projection for every year
+(2024–2100) goes into pipeline/cache/wpp2024.series (pipeline/series.py),
+so pipeline_v4_inject.py --wpp-year and fetch_data.py --wpp can read any
+year's population, growth rate or density without opening a workbook.
+
+The extracted values are merged into the existing lookup: entries from
+sources without a workbook here (IMF WEO, UN WPP estimates) are kept.
+
+Usage:
+  python3 pipeline_v4_extract.py                 # WPP year 2024
+  python3 pipeline_v4_extract.py --year 2025     # lookup values for 2025
+  python3 pipeline_v4_extract.py --dry-run       # report, don't write
+  python3 pipeline_v4_extract.py --no-cache      # re-parse every workbook
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, 'pipeline'))
+from series import read_series, write_series
+from xlsx import Workbook
+
+LOOKUP_FILE = os.path.join(SCRIPT_DIR, 'pipeline_v4_lookup.json')
+CACHE_DIR = os.path.join(SCRIPT_DIR, 'pipeline', 'cache', 'xlsx')
+SERIES_FILE = os.path.join(SCRIPT_DIR, 'pipeline', 'cache', 'wpp2024.series')
+EXTRACTOR_VERSION = 2   # bump when an extractor's output changes
+
+# WPP workbook kind → (series name, unit) in SERIES_FILE
+WPP_SERIES = {
+    'poptot': ('population', 'thousands'),
+    'growth': ('growthRate', '% per year'),
+}
+
+# HDR country names that differ from the WPP names used to find ISO3 codes
+HDR_ALIASES = {
+    'Congo (Democratic Republic of the)': 'COD',
+    'Eswatini (Kingdom of)': 'SWZ',
+    'Hong Kong, China (SAR)': 'HKG',
+    "Korea (Democratic People's Rep. of)": 'PRK',
+    'Korea (Republic of)': 'KOR',
+    'Micronesia (Federated States of)': 'FSM',
+    'Moldova (Republic of)': 'MDA',
+    'Palestine, State of': 'PSE',
+    'Tanzania (United Republic of)': 'TZA',
+    'United States': 'USA',
+}
+
+
+# ============================================================
+# EXTRACTORS (run in worker processes; results are cached JSON)
+# ============================================================
+
+def extract_hdr(path):
+    """HDI table: {"year": data year, "values": {country name: hdi}}.
+    Only ranked rows (column A) are countries; group aggregates have no
+    rank."""
+    with Workbook(path) as wb:
+        sheet = next(iter(wb.sheets))
+        data_year, values = None, {}
+        for _, cells in wb.rows(sheet, columns={'A', 'B', 'C'}):
+            if data_year is None and 'B' not in cells and cells.get('C', '').isdigit():
+                data_year = int(cells['C'])           # the year row under the header
+            elif cells.get('A', '').isdigit() and 'B' in cells:
+                try:
+                    values[cells['B'].strip()] = float(cells['C'])
+                except (KeyError, ValueError):
+                    pass                              # '..' = not available
+    return {'year': data_year, 'values': values}
+
+
+def extract_wpp(path, header_rows=40):
+    """WPP probabilistic projection, median sheet: {"firstYear": year,
+    "years": count, "names": {name: iso3}, "values": {iso3: [value or
+    None per year]}} over every year column."""
+    with Workbook(path) as wb:
+        sheet = next(name for name in wb.sheets if name.startswith('Median'))
+        header = next(((number, cells) for number, cells in wb.rows(sheet, max_row=header_rows)
+                       if cells.get('F') == 'ISO3 Alpha-code'), None)
+        if header is None:
+            raise ValueError(f"{os.path.basename(path)}: header row not found")
+        number, cells = header
+        year_columns = sorted(((int(v), c) for c, v in cells.items() if v.isdigit()))
+        first_year = year_columns[0][0]
+        if [y for y, _ in year_columns] != list(range(first_year, first_year + len(year_columns))):
+            raise ValueError(f"{os.path.basename(path)}: year columns are not consecutive")
+        columns = [c for _, c in year_columns]
+
+        names, values = {}, {}
+        for _, cells in wb.rows(sheet, columns={'C', 'F', *columns}, min_row=number + 1):
+            iso3 = cells.get('F')
+            if not iso3:
+                continue                              # world, regions, income groups
+            names[cells['C'].strip()] = iso3
+            row = []
+            for column in columns:
+                try:
+                    row.append(float(cells[column]))
+                except (KeyError, ValueError):
+                    row.append(None)                  # '...' = not available
+            values[iso3] = row
+    return {'firstYear': first_year, 'years': len(columns), 'names': names, 'values': values}
+
+
+# Workbook kind → (file pattern, extractor(path))
+WORKBOOKS = {
+    'hdr': ('HDR23-24_Statistical_Annex_HDI_Table*.xlsx', extract_hdr),
+    'poptot': ('UN_PPP2024_Output_PopTot*.xlsx', extract_wpp),
+    'growth': ('UN_PPP2024_Output_PopGrowthRate*.xlsx', extract_wpp),
+}
+
+
+# ============================================================
+# DISCOVERY + CACHE
+# ============================================================
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def find_workbooks(directory):
+    """{kind: (path, sha256)}: one file per kind; byte-identical copies
+    collapse, differing ones resolve to the newest with a warning."""
+    found = {}
+    for kind, (pattern, _) in WORKBOOKS.items():
+        # Shortest name first, so "x.xlsx" wins over its "x (1).xlsx" copy
+        paths = sorted(glob.glob(os.path.join(directory, pattern)), key=lambda p: (len(p), p))
+        if not paths:
+            print(f"  ⚠️  {kind}: no {pattern}")
+            continue
+        by_hash = {}
+        for path in paths:
+            by_hash.setdefault(file_hash(path), []).append(path)
+        for digest, copies in by_hash.items():
+            if len(copies) > 1:
+                print(f"  ♻️  {kind}: {len(copies)} identical copies, using {os.path.basename(copies[0])}")
+        digest, copies = max(by_hash.items(), key=lambda item: os.path.getmtime(item[1][0]))
+        if len(by_hash) > 1:
+            print(f"  ⚠️  {kind}: {len(by_hash)} different versions, using newest "
+                  f"{os.path.basename(copies[0])}")
+        found[kind] = (copies[0], digest)
+    return found
+
+
+def cache_path(kind, digest):
+    return os.path.join(CACHE_DIR, f"{kind}-{digest[:16]}-v{EXTRACTOR_VERSION}.json")
+
+
+def extract_all(found, use_cache=True, workers=None):
+    """{kind: extraction}, from the cache or from parallel workers."""
+    results, todo = {}, {}
+    for kind, (path, digest) in found.items():
+        cached = cache_path(kind, digest)
+        if use_cache and os.path.exists(cached):
+            with open(cached) as f:
+                results[kind] = json.load(f)
+            print(f"  💾 {kind}: cached ({os.path.basename(path)})")
+        else:
+            todo[kind] = (path, digest)
+
+    if todo:
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers or len(todo)) as pool:
+            futures = {kind: pool.submit(WORKBOOKS[kind][1], path)
+                       for kind, (path, _) in todo.items()}
+            for kind, future in futures.items():
+                results[kind] = future.result()
+                path, digest = todo[kind]
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                tmp = cache_path(kind, digest) + '.tmp'
+                with open(tmp, 'w') as f:
+                    json.dump(results[kind], f)
+                os.replace(tmp, cache_path(kind, digest))
+                print(f"  📖 {kind}: {len(results[kind]['values'])} rows from {os.path.basename(path)}")
+        print(f"  ⏱️  extracted {len(todo)} workbook(s) in {time.perf_counter() - started:.2f}s")
+    return results
+
+
+# ============================================================
+# SERIES STORE
+# ============================================================
+
+def write_wpp_series(results, path=SERIES_FILE):
+    """Write the WPP series in `results` to the store; returns True if the
+    file changed, None if there is nothing to write."""
+    wpp = {kind: results[kind] for kind in WPP_SERIES if kind in results}
+    if not wpp:
+        return None
+    axes = {(r['firstYear'], r['years']) for r in wpp.values()}
+    if len(axes) > 1:
+        raise ValueError(f"WPP workbooks disagree on the year axis: {sorted(axes)}")
+    first_year, years = axes.pop()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return write_series(path, first_year, years,
+                        {WPP_SERIES[kind][0]: r['values'] for kind, r in wpp.items()},
+                        source='UN WPP 2024 (median)',
+                        units={WPP_SERIES[kind][0]: WPP_SERIES[kind][1] for kind in wpp})
+
+
+# ============================================================
+# LOOKUP
+# ============================================================
+
+def wpp_at_year(extraction, year):
+    """{iso3: value} for one year of a WPP extraction."""
+    i = year - extraction['firstYear']
+    if not 0 <= i < extraction['years']:
+        raise ValueError(f"{year} is outside WPP {extraction['firstYear']}–"
+                         f"{extraction['firstYear'] + extraction['years'] - 1}")
+    return {iso3: row[i] for iso3, row in extraction['values'].items() if row[i] is not None}
+
+
+def build_entries(results, year):
+    """[(iso3, indicator, entry, override)] from the extractions, taking
+    WPP values for `year`."""
+    entries = []
+    names = dict((results.get('poptot') or results.get('growth') or {}).get('names', {}))
+    names.update(HDR_ALIASES)
+
+    hdr = results.get('hdr')
+    if hdr:
+        for name, value in hdr['values'].items():
+            iso3 = names.get(name)
+            if iso3:
+                entries.append((iso3, 'hdi', {'value': round(value, 3), 'year': hdr['year'],
+                                              'source': 'UNDP HDR 2023/24'}, True))
+            else:
+                print(f"  ⚠️  hdr: no ISO3 for {name!r}")
+
+    poptot = results.get('poptot')
+    if poptot:
+        for iso3, value in wpp_at_year(poptot, year).items():
+            entries.append((iso3, 'population', {'value': round(value / 1000, 3), 'year': year,
+                                                 'source': 'UN WPP 2024'}, False))
+
+    growth = results.get('growth')
+    if growth:
+        for iso3, value in wpp_at_year(growth, year).items():
+            entries.append((iso3, 'populationGrowth', {'value': round(value, 3), 'year': year,
+                                                       'source': 'UN WPP 2024'}, True))
+    return entries
+
+
+def merge_lookup(lookup, entries):
+    """Apply entries in place; override=False only fills gaps. Returns
+    {indicator: number of values added or changed}."""
+    changed = {}
+    for iso3, indicator, entry, override in entries:
+        row = lookup.setdefault(iso3, {})
+        if indicator in row and (not override or row[indicator] == entry):
+            continue
+        row[indicator] = entry
+        changed[indicator] = changed.get(indicator, 0) + 1
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract pipeline_v4_lookup.json from the source workbooks")
+    parser.add_argument('--year', type=int, default=2024, help="WPP projection year for the lookup")
+    parser.add_argument('--dir', default=SCRIPT_DIR, help="Directory holding the .xlsx files")
+    parser.add_argument('--out', default=LOOKUP_FILE)
+    parser.add_argument('--series', default=SERIES_FILE, help="WPP time-series store to write")
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--dry-run', action='store_true')
+    args = parser.parse_args()
+
+    print(f"📊 Extracting workbooks in {os.path.relpath(args.dir)}...")
+    found = find_workbooks(args.dir)
+    results = extract_all(found, use_cache=not args.no_cache)
+
+    lookup = {}
+    if os.path.exists(args.out):
+        with open(args.out) as f:
+            lookup = json.load(f)
+    changed = merge_lookup(lookup, build_entries(results, args.year))
+
+    for indicator, count in sorted(changed.items()):
+        print(f"  ✏️  {indicator}: {count} values added/changed")
+    if args.dry_run:
+        print("🔍 DRY RUN — lookup and series not written")
+        return
+
+    written = write_wpp_series(results, args.series)
+    if written is not None:
+        store = read_series(args.series)
+        print(f"  {'📈' if written else '✅'} {os.path.relpath(args.series)}: {len(store.keys)} countries × "
+              f"{store.years[0]}–{store.years[-1]}{'' if written else ' (unchanged)'}")
+    if changed or not os.path.exists(args.out):
+        with open(args.out, 'w') as f:
+            json.dump(lookup, f, indent=2, ensure_ascii=False)
+        print(f"✅ {os.path.relpath(args.out)}: {len(lookup)} countries")
+    else:
+        print(f"✅ {os.path.relpath(args.out)} up to date")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,194 +3,208 @@
 Pipeline v4: Multi-Source Data Integration
 Injects IMF WEO Oct 2024 + UNDP HDI 2023/24 data into data.js
 Each data point carries: value + year + source
+
+Country rows in RAW are indexed once by ISO3 (region ids are lowercase
+ISO2, mapped through fetch_data.REGION_TO_ISO3), every lookup column is
+formatted once, and all cells are applied in a single pass over the rows.
+
+With --wpp-year YEAR, population and population density for that year
+are taken from the UN WPP 2024 median series (pipeline/series.py, written
+by pipeline_v4_extract.py) instead of the lookup; density divides the
+projected population by the row's RAW area.
+
+Usage:
+  python3 pipeline_v4_inject.py src/data.js
+  python3 pipeline_v4_inject.py src/data.js --wpp-year 2030
 """
 
 import json
-import re
 import sys
 import os
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pipeline'))
+from datajs import DataJsDocument
+from fetch_data import REGION_TO_ISO3, convert_column
+from series import read_series
+import snapshots
+
+# Lookup key → (RAW field index, decimals). Units already match RAW:
+# population in millions, GDP in billions USD.
+INDICATOR_FIELDS = {
+    'population': (5, 1),          # Population (M)
+    'gdp': (6, 0),                 # GDP (B USD)
+    'gdpPerCapita': (7, 0),        # GDP per capita USD
+    'hdi': (11, 3),                # Human Development Index
+    'lifeExpectancy': (13, 1),     # Life expectancy (years)
+    'unemployment': (27, 1),       # Unemployment %
+    'inflation': (28, 1),          # Inflation %
+    'populationDensity': (31, 0),  # Pop density /km²
+    'medianAge': (32, 1),          # Median age (years)
+    # fertilityRate, govDebt: no RAW column
+}
+
+AREA_FIELD = 8   # Area (1000 km²)
+SERIES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           'pipeline', 'cache', 'wpp2024.series')
+
+MAJOR_ISO3 = ['CHN', 'USA', 'JPN', 'DEU', 'GBR', 'FRA', 'IND', 'BRA']
+
 def load_lookup(path='pipeline_v4_lookup.json'):
     with open(path) as f:
         return json.load(f)
 
-def inject_into_datajs(datajs_path, lookup):
-    with open(datajs_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Mapping from data.js indicator keys to our lookup keys
-    INDICATOR_MAP = {
-        'gdp': 'gdp',              # GDP in billions USD
-        'gdpPerCapita': 'gdpPerCapita',  # GDP per capita USD
-        'population': 'population',      # Population in millions
-        'unemployment': 'unemployment',  # Unemployment %
-        'hdi': 'hdi',                    # Human Development Index
-        'lifeExpectancy': 'lifeExpectancy',  # Life expectancy (years)
-        'medianAge': 'medianAge',            # Median age (years)
-        'fertilityRate': 'fertilityRate',    # Fertility rate
-        'populationDensity': 'populationDensity',  # Pop density
-    }
-
-    # Find all region objects in the REGIONS array
-    # Pattern: { id: "xxx", ... iso: "XXX" or iso3: "XXX" ... indicators: { ... } }
-    
-    # We need to find each region's ISO code and update its indicators
-    # Strategy: find each region block, extract iso/iso3, match to lookup, update values
-    
+def index_country_rows(doc):
+    """ISO3 → [RAW Row, ...] for every country row with a known ISO3 (a few
+    countries appear more than once in RAW; all copies are updated)."""
+    index = {}
+    for row in doc.rows:
+        if row.get(2) == 'country':
+            iso3 = REGION_TO_ISO3.get(row.id)
+            if iso3:
+                index.setdefault(iso3, []).append(row)
+    return index
+
+def wpp_overlay(doc, lookup, store, year):
+    """Lookup with population (M) and populationDensity (/km²) replaced by
+    the WPP series values for `year`; other indicators are kept."""
+    if year not in store.years:
+        raise ValueError(f"{year} is outside WPP {store.years[0]}–{store.years[-1]}")
+    source = f"{store.source} {year}"
+    overlaid = {iso: dict(entry) for iso, entry in lookup.items()}
+    population = store.at_year('population', year)   # thousands
+    for iso, rows in index_country_rows(doc).items():
+        pop = population.get(iso)
+        if pop is None:
+            continue
+        entry = overlaid.setdefault(iso, {})
+        entry['population'] = {'value': round(pop / 1000, 3), 'year': year, 'source': source}
+        try:
+            area = float(rows[0].get(AREA_FIELD))
+        except (TypeError, ValueError):
+            area = 0
+        if area > 0:
+            # thousands of people per 1000 km² = people per km²
+            entry['populationDensity'] = {'value': round(pop / area, 1), 'year': year, 'source': source}
+    return overlaid
+
+def inject_into_datajs(doc, lookup):
+    """Write every lookup value into its country's RAW row.
+
+    Returns (updated_count, changelog, cells, skipped): cells is
+    {region_id: {indicator: {value, year, source}}} for every applied
+    cell, changelog lists the ones whose value actually changed.
+    """
+    rows = index_country_rows(doc)
+    matched = [iso for iso in lookup if iso in rows]
+
+    # Format each indicator column once: {iso3: new_str}
+    columns = []
+    for key, (idx, decimals) in INDICATOR_FIELDS.items():
+        isos = [iso for iso in matched
+                if lookup[iso].get(key, {}).get('value') is not None]
+        new_strs = convert_column((None, decimals), [lookup[iso][key]['value'] for iso in isos])
+        columns.append((key, idx, dict(zip(isos, new_strs))))
+
     updated_count = 0
-    skipped = []
     changelog = []
+    cells = {}
+
+    for iso, row in ((iso, row) for iso in matched for row in rows[iso]):
+        for key, idx, column in columns:
+            new_str = column.get(iso)
+            if not new_str:
+                continue
+            meta = lookup[iso][key]
+            old_str = row.get(idx)
+            try:
+                old_val = float(old_str) if old_str else None
+            except ValueError:
+                old_val = None
+
+            # Same guard as fetch_data: a >100x jump is a unit mismatch
+            if old_val and abs(meta['value'] / old_val) > 100:
+                print(f"    ⚠️  SKIP {row.id}.{key}: {old_str} → {new_str} (>100x change)")
+                continue
+
+            cells.setdefault(row.id, {})[key] = {
+                'value': meta['value'], 'year': meta['year'], 'source': meta['source'],
+            }
+            updated_count += 1
+            if old_val is not None and float(new_str) == old_val:
+                continue  # same number, keep the existing spelling (.921 vs 0.921)
+            row.set(idx, new_str)
+            changelog.append({
+                'iso': iso,
+                'region': row.id,
+                'indicator': key,
+                'old': old_val,
+                'new': float(new_str),
+                'year': meta['year'],
+                'source': meta['source'],
+            })
+
+    skipped = [iso for iso in MAJOR_ISO3 if iso in lookup and iso not in rows]
+    return updated_count, changelog, cells, skipped
 
-    # Find region blocks - they start with { id: " and contain indicators: {
-    # We'll use a regex to find iso codes and indicator values
-    
-    # First, find all ISO codes in the data.js
-    iso_pattern = re.compile(r'''(?:iso3?|code)\s*:\s*['"]([A-Z]{2,3})['"]''')
-    
-    # For each country in our lookup, find and update its indicators
-    for iso, indicators in lookup.items():
-        # Search for this ISO in data.js
-        # Could be iso: "CHN" or iso3: "CHN" or code: "CN"
-        patterns_to_try = [
-            rf'iso3?\s*:\s*[\'"]({re.escape(iso)})[\'"]',
-            rf'code\s*:\s*[\'"]({re.escape(iso)})[\'"]',
-        ]
-        # Also try 2-letter code
-        iso2_map = {
-            'CHN': 'CN', 'USA': 'US', 'JPN': 'JP', 'DEU': 'DE', 'GBR': 'GB',
-            'FRA': 'FR', 'IND': 'IN', 'BRA': 'BR', 'KOR': 'KR', 'AUS': 'AU',
-            'CAN': 'CA', 'ITA': 'IT', 'ESP': 'ES', 'MEX': 'MX', 'IDN': 'ID',
-            'TUR': 'TR', 'SAU': 'SA', 'CHE': 'CH', 'NLD': 'NL', 'SWE': 'SE',
-            'POL': 'PL', 'NOR': 'NO', 'AUT': 'AT', 'BEL': 'BE', 'ISR': 'IL',
-            'THA': 'TH', 'ARE': 'AE', 'SGP': 'SG', 'MYS': 'MY', 'PHL': 'PH',
-            'ZAF': 'ZA', 'EGY': 'EG', 'NGA': 'NG', 'ARG': 'AR', 'CHL': 'CL',
-            'COL': 'CO', 'PER': 'PE', 'VNM': 'VN', 'NZL': 'NZ', 'IRL': 'IE',
-            'DNK': 'DK', 'FIN': 'FI', 'PRT': 'PT', 'CZE': 'CZ', 'GRC': 'GR',
-            'ROU': 'RO', 'HUN': 'HU', 'UKR': 'UA', 'RUS': 'RU', 'KAZ': 'KZ',
-            'PAK': 'PK', 'BGD': 'BD', 'ETH': 'ET', 'KEN': 'KE', 'TZA': 'TZ',
-            'GHA': 'GH', 'MAR': 'MA', 'TUN': 'TN', 'IRQ': 'IQ', 'QAT': 'QA',
-            'KWT': 'KW', 'OMN': 'OM', 'BHR': 'BH', 'JOR': 'JO', 'LBN': 'LB',
-            'HKG': 'HK', 'TWN': 'TW', 'ISL': 'IS', 'LUX': 'LU', 'SVN': 'SI',
-            'SVK': 'SK', 'HRV': 'HR', 'BGR': 'BG', 'SRB': 'RS', 'LTU': 'LT',
-            'LVA': 'LV', 'EST': 'EE',
-        }
-        if iso in iso2_map:
-            patterns_to_try.append(rf'code\s*:\s*[\'"]({re.escape(iso2_map[iso])})[\'"]')
-        
-        found = False
-        for pat_str in patterns_to_try:
-            pat = re.compile(pat_str)
-            match = pat.search(content)
-            if match:
-                found = True
-                # Found this country in data.js
-                # Now find and update each indicator value
-                # We need to find the indicators block near this match
-                pos = match.start()
-                
-                # Search for indicators: { ... } block within ~2000 chars after the match
-                block = content[max(0,pos-200):pos+3000]
-                
-                for our_key, lookup_key in INDICATOR_MAP.items():
-                    if lookup_key not in indicators:
-                        continue
-                    
-                    new_val = indicators[lookup_key]['value']
-                    new_year = indicators[lookup_key]['year']
-                    new_source = indicators[lookup_key]['source']
-                    
-                    # Find pattern like: gdp: 1234.5  or  gdp: 1234
-                    ind_pattern = re.compile(
-                        rf'({re.escape(our_key)}\s*:\s*)([-\d.,]+)',
-                    )
-                    
-                    # Search in the block near this region
-                    ind_match = ind_pattern.search(block)
-                    if ind_match:
-                        old_val_str = ind_match.group(2)
-                        try:
-                            old_val = float(old_val_str.replace(',', ''))
-                        except:
-                            old_val = None
-                        
-                        # Format new value
-                        if our_key == 'hdi':
-                            new_val_str = f"{new_val:.3f}"
-                        elif our_key == 'population':
-                            new_val_str = f"{new_val:.2f}"
-                        elif our_key in ('gdp', 'gdpPerCapita'):
-                            new_val_str = f"{new_val:.1f}"
-                        elif our_key == 'unemployment':
-                            new_val_str = f"{new_val:.1f}"
-                        else:
-                            new_val_str = f"{new_val}"
-                        
-                        # Calculate the absolute position in content
-                        block_start = max(0, pos - 200)
-                        abs_start = block_start + ind_match.start()
-                        abs_end = block_start + ind_match.end()
-                        
-                        old_text = content[abs_start:abs_end]
-                        new_text = f"{ind_match.group(1)}{new_val_str}"
-                        
-                        content = content[:abs_start] + new_text + content[abs_end:]
-                        
-                        if old_val is not None and abs(old_val - new_val) > 0.01:
-                            changelog.append({
-                                'iso': iso,
-                                'indicator': our_key,
-                                'old': old_val,
-                                'new': new_val,
-                                'year': new_year,
-                                'source': new_source,
-                            })
-                        
-                        updated_count += 1
-                
-                break
-        
-        if not found and iso in ['CHN', 'USA', 'JPN', 'DEU', 'GBR', 'FRA', 'IND', 'BRA']:
-            skipped.append(iso)
-
-    # Write updated content
-    with open(datajs_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    # Save changelog
-    with open('pipeline_v4_changelog.json', 'w') as f:
+def write_changelog(path, updated_count, changelog, cells, skipped):
+    with open(path, 'w') as f:
         json.dump({
             'total_updates': updated_count,
-            'changes': changelog[:200],  # limit size
+            'changes': changelog,
             'skipped_major': skipped,
+            'cells': cells,
         }, f, indent=2, ensure_ascii=False)
-    
-    return updated_count, len(changelog), skipped
 
 if __name__ == '__main__':
-    if len(sys.argv) < 2:
-        print("Usage: python3 pipeline_v4_inject.py <path_to_data.js>")
+    args = sys.argv[1:]
+    wpp_year = None
+    if '--wpp-year' in args:
+        i = args.index('--wpp-year')
+        try:
+            wpp_year = int(args[i + 1])
+        except (IndexError, ValueError):
+            print("Error: --wpp-year needs a year")
+            sys.exit(1)
+        del args[i:i + 2]
+    if len(args) < 1:
+        print("Usage: python3 pipeline_v4_inject.py <path_to_data.js> [--wpp-year YEAR]")
         print("Example: python3 pipeline_v4_inject.py src/data.js")
         sys.exit(1)
-    
-    datajs_path = sys.argv[1]
+
+    datajs_path = args[0]
     if not os.path.exists(datajs_path):
         print(f"Error: {datajs_path} not found")
         sys.exit(1)
-    
+
     # Check for lookup file
     lookup_path = 'pipeline_v4_lookup.json'
     if not os.path.exists(lookup_path):
         print(f"Error: {lookup_path} not found. Run data extraction first.")
         sys.exit(1)
-    
+
     lookup = load_lookup(lookup_path)
-    
+
     print(f"Injecting data from {len(lookup)} countries into {datajs_path}...")
-    updates, changes, skipped = inject_into_datajs(datajs_path, lookup)
-    
+    doc = DataJsDocument.load(datajs_path)
+    if wpp_year is not None:
+        if not os.path.exists(SERIES_FILE):
+            print(f"Error: {SERIES_FILE} not found. Run pipeline_v4_extract.py first.")
+            sys.exit(1)
+        try:
+            lookup = wpp_overlay(doc, lookup, read_series(SERIES_FILE), wpp_year)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"  📈 population + density from UN WPP {wpp_year}")
+    updates, changelog, cells, skipped = inject_into_datajs(doc, lookup)
+    doc.save(datajs_path)
+    write_changelog('pipeline_v4_changelog.json', updates, changelog, cells, skipped)
+    snapshots.record(datajs_path, 'pipeline_v4_inject')
+
     print(f"\n✅ Pipeline v4 complete!")
+    print(f"   Countries matched: {len(cells)}")
     print(f"   Total field updates: {updates}")
-    print(f"   Values changed: {changes}")
+    print(f"   Values changed: {len(changelog)}")
     if skipped:
         print(f"   ⚠️  Major countries not found in data.js: {skipped}")
     print(f"\nChangelog saved to pipeline_v4_changelog.json")
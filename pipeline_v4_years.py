@@ -4,10 +4,12 @@ Pipeline v4: Update INDICATORS year metadata based on actual data sources.
 Updates the year property in each indicator definition to reflect the primary data source year.
 """
 
-import re
 import sys
 import os
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pipeline'))
+from datajs import DataJsDocument
+
 # Indicator year mapping based on Pipeline v4 sources
 INDICATOR_YEARS = {
     # From IMF WEO Oct 2024 → mostly 2024 data
@@ -49,54 +51,23 @@ INDICATOR_YEARS = {
     'universityCount': None,
 }
 
-def update_indicator_years(datajs_path):
-    with open(datajs_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+def update_indicator_years(doc):
+    """Set each INDICATORS entry's year tag in the document; returns how many
+    changed."""
     updated = 0
     for indicator, meta in INDICATOR_YEARS.items():
+        entry = doc.indicators.get(indicator)
+        if entry is None:
+            continue
         if meta is None:
             # Remove year tag if exists
-            pattern = re.compile(
-                rf'({indicator}\s*:\s*\{{)\s*year:\s*[\'"][^\'"]*[\'"]\s*,\s*'
-            )
-            if pattern.search(content):
-                content = pattern.sub(r'\1 ', content)
+            entry.remove('year')
             continue
-        
-        year_str = meta['year']
-        source = meta['source']
-        
-        # Check if year property already exists
-        has_year = re.search(
-            rf'{indicator}\s*:\s*\{{[^}}]*?year\s*:', content
-        )
-        
-        if has_year:
-            # Update existing year
-            pattern = re.compile(
-                rf'({indicator}\s*:\s*\{{[^}}]*?)year\s*:\s*[\'"][^\'"]*[\'"]'
-            )
-            replacement = rf"\1year: '{year_str}'"
-            new_content = pattern.sub(replacement, content)
-            if new_content != content:
-                content = new_content
-                updated += 1
-        else:
-            # Add year property after the opening brace
-            pattern = re.compile(
-                rf'({indicator}\s*:\s*\{{)'
-            )
-            match = pattern.search(content)
-            if match:
-                content = pattern.sub(
-                    rf"\1 year: '{year_str}',", content, count=1
-                )
-                updated += 1
-    
-    with open(datajs_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
+
+        # Update an existing year, or add it right after the opening brace
+        if entry.set('year', meta['year'], first=True):
+            updated += 1
+
     return updated
 
 if __name__ == '__main__':
@@ -109,7 +80,9 @@ if __name__ == '__main__':
         print(f"Error: {datajs_path} not found")
         sys.exit(1)
     
-    updated = update_indicator_years(datajs_path)
+    doc = DataJsDocument.load(datajs_path)
+    updated = update_indicator_years(doc)
+    doc.save(datajs_path)
     print(f"✅ Updated year metadata for {updated} indicators")
     print(f"   GDP, population, unemployment etc → 2024 (IMF WEO)")
     print(f"   HDI → 2022 (UNDP)")
@@ -1,9 +1,10 @@
 import { useState, useRef, useEffect } from 'react'
-import { REGIONS, TYPE_STYLES } from '../data'
+import { REGIONS, TYPE_STYLES, loadShards, shardsLoaded } from '../data'
 
 export default function SearchInput({ value, onSelect, placeholder = 'Search regions...', exclude = [] }) {
   const [focused, setFocused] = useState(false)
   const [inputVal, setInputVal] = useState('')
+  const [ready, setReady] = useState(shardsLoaded())
   const ref = useRef(null)
 
   useEffect(() => {
@@ -13,7 +14,12 @@ export default function SearchInput({ value, onSelect, placeholder = 'Search reg
     } else {
       setInputVal('')
     }
-  }, [value])
+  }, [value, ready])
+
+  // Subnational regions are searchable once their shards are in
+  const loadAll = () => {
+    if (!ready) loadShards().then(() => setReady(true))
+  }
 
   const filtered = (() => {
     let results = REGIONS.filter(r => !exclude.includes(r.id))
@@ -30,7 +36,7 @@ export default function SearchInput({ value, onSelect, placeholder = 'Search reg
         ref={ref}
         value={inputVal}
         onChange={e => setInputVal(e.target.value)}
-        onFocus={() => setFocused(true)}
+        onFocus={() => { setFocused(true); loadAll() }}
         onBlur={() => setTimeout(() => setFocused(false), 200)}
         placeholder={placeholder}
         className="w-full px-4 py-3 text-base rounded-xl bg-surface text-slate-200 border-2 border-border focus:border-indigo-500 outline-none transition-colors font-sans"
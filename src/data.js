@@ -4,79 +4,79 @@
 
 // Field order: id,name,type,parent,flag,pop(M),gdp(B$),gdpPC,area(k),urban%,gini,hdi,net%,lifeExp,co2PC,unis,lit%,pisa,docs,beds,health%,mfg%,exp(B),fdi(B),forest%,pm25,renew%,unemp%,inflate%,rd%,mil%,popDens,medAge,birthR,deathR,unemp%,inflate%,rd%,mil%,popDens,medAge,birthR,deathR
 const RAW = `
-us,United States,country,,🇺🇸,334,25605,76657,9147,80,41.7,.921,92,77.4,14.4,5300,99,495,3.7,2.7,16.5,10.7,3017,417,33.9,7.8,10.9,3.6,8,3.6,3.3,37,38.5,11,9.8
-cn,China,country,,🇨🇳,1412.2,18317,12971,9388,65.2,36,.768,73,78.2,8.0,2956,96.7,555,3.1,5.4,5.9,26.4,3718,190,23.8,34.8,15.2,5,2,2.6,1.6,150,38.5,6.8,7.4
-jp,Japan,country,,🇯🇵,125.1,4262,34066,364,92,32.3,.925,93,84,8.5,803,99,520,2.6,12.6,12.3,19.8,918,48,68.4,12.8,8.8,2.6,2.5,3.4,1,343,48.6,6.3,12.9
-de,Germany,country,,🇩🇪,83.2,4201,50507,349,81.8,32.4,.942,93,80.6,7.9,423,99,500,4.5,7.6,12.4,18.3,1917,87,32.7,10.3,17.6,3.1,6.9,3.1,1.4,238,45.8,8.8,12.7
-gb,United Kingdom,country,,🇬🇧,67.6,3181,47057,242,83.1,32.4,.929,95,81,5.2,164,99,494,3.1,2.4,11.1,8,1084,93,13.3,9.9,12.2,3.8,7.9,2.9,2.1,279,40.5,10.1,9.5
-fr,France,country,,🇫🇷,68.2,2795,40989,539,78.8,31.2,.903,90,82.1,4.5,253,99,474,3.3,5.7,11.8,9.3,1023,112,32.3,9.6,16.2,7.3,5.2,2.2,2,127,42.0,10.7,9.9
-in,India,country,,🇮🇳,1425.4,3346,2347,2973,34.8,25.5,.633,47,71.7,1.9,1113,76.3,,0.7,1.6,3.4,13.1,778,50,24.4,48.4,34.9,4.8,6.7,0.6,2.4,479,28.4,16.3,6.6
-br,Brazil,country,,🇧🇷,210.3,1952,9281,8358,87.3,52,.754,81,74.9,2.2,302,94.4,413,2.4,2.5,9.4,13.1,383,76,59.1,12.2,46.5,9.2,9.3,1.1,1.1,25,33.5,12.6,7.5
-it,Italy,country,,🇮🇹,59,2104,35654,296,69.5,33.7,.895,87,82.7,5.3,98,99,477,4.2,3.1,8.9,15.4,739,62,32.7,14.7,17.5,8.1,8.2,1.4,1.7,200,47.2,6.7,12.1
-ca,Canada,country,,🇨🇦,38.9,2190,56257,8789,82.4,31.1,.936,97,81.2,14.3,223,99,512,2.8,2.5,11.1,9.3,743,50,39.5,6.6,23.8,5.3,6.8,1.7,1.2,4,41.1,9,8.6
-kr,South Korea,country,,🇰🇷,51.7,1799,34822,98,81.2,32.9,.925,98,82.7,11.6,430,99,526,2.6,12.8,8.9,26.5,815,25,64.2,25.9,3.6,2.9,5.1,5.2,2.6,529,43.7,4.9,7.3
-au,Australia,country,,🇦🇺,26,1696,65170,7692,87.3,33.8,.951,96,83.2,15.0,43,99,494,4.1,3.8,9.9,5.3,432,69,17.4,8.3,12.3,3.7,6.6,1.9,1.9,3,37.9,11.6,7.3
-mx,Mexico,country,,🇲🇽,128.6,1467,11406,1944,79.2,43.5,.758,76,74,3.6,965,95.8,420,2.6,1,5.7,21.5,630,39,33.7,15,13,3.3,7.9,0.3,0.7,66,29.2,16,6.5
-es,Spain,country,,🇪🇸,47.8,1449,30319,500,80,33.6,.905,93,83.1,5.0,87,99.7,481,4.3,2.9,9.7,11,575,67,37.2,9.6,19,13,8.4,1.4,1.4,96,44.9,6.9,9.7
-id,Indonesia,country,,🇮🇩,278.8,1319,4731,1893,57.5,35.5,.705,62,70.9,2.3,4593,96,382,0.7,1.4,2.7,18.3,323,25,48,17.9,20.2,3.5,4.2,0.3,0.8,147,29.7,16.2,7.5
-nl,Netherlands,country,,🇳🇱,17.7,1047,59123,34,95,25.7,.941,98,81.6,8.3,58,99,493,3.9,2.4,10,10.3,1009,15,11,10.9,12.2,3.5,10,2.3,1.3,526,42.8,9.5,9.6
-sa,Saudi Arabia,country,,🇸🇦,32.2,1239,38510,2150,84.1,45.9,.875,98,77.3,16.6,43,97.9,373,3.5,2.4,5.3,15.1,446,27,0.5,53.1,0.1,5.6,2.5,0.5,6.4,15,31.8,15.2,2.6
-tr,Turkey,country,,🇹🇷,85,926,10898,770,89,44.5,.838,83,77.6,5.1,209,97.3,454,2.2,3,3.7,21.8,353,14,29.3,21.6,12,10.5,72.3,1.3,1.7,110,32.2,12.2,5.9
-ch,Switzerland,country,,🇨🇭,8.8,829,94395,40,84.9,33.8,.962,96,83.6,4.0,36,99,495,4.5,4.4,11.6,18.1,631,-12,32.3,9.1,27.7,4.1,2.8,3.3,0.7,222,42.5,9.4,8.5
-pl,Poland,country,,🇵🇱,36.8,696,18891,306,59.8,28.9,.876,87,77.2,8.1,397,99,516,3.4,6,6.5,17.7,434,42,31.1,18,15.2,2.8,14.4,1.5,2.2,120,41.7,8.3,12.2
-se,Sweden,country,,🇸🇪,10.5,575,54837,407,88.4,31.6,.947,97,83.1,3.6,51,99,478,4.4,1.9,10.9,13.7,312,54,68.7,5.6,57.9,7.4,8.4,3.4,1.3,26,40.5,10,9
-be,Belgium,country,,🇧🇪,11.7,591,50606,30,87.5,26.4,.937,94,81.7,8.1,34,99,493,3.6,5.5,10.7,12.5,558,13,22.6,11.2,11.7,5.6,9.6,3.4,1.2,383,41.5,9.8,10
-th,Thailand,country,,🇹🇭,71.7,496,6909,511,59.7,34.3,.800,78,75.3,3.6,310,91.1,415,0.5,2.4,5.4,27,324,12,38.8,31,19,0.9,-1.6,1.2,1.2,140,40.2,8.4,9.2
-at,Austria,country,,🇦🇹,9,473,52337,83,69,30.9,.926,93,81.3,6.9,73,99,490,5.4,6.7,11.2,16.7,291,14,47.2,10.9,36,5,8.5,3.2,0.8,110,43.5,9.1,10.3
-no,Norway,country,,🇳🇴,5.5,596,109270,364,83,26.9,.961,98,82.5,7.5,48,99,499,4.9,3.4,7.9,4.9,331,14,33.5,6.1,61.4,3.2,5.8,1.6,1.5,15,39.5,9.4,8.4
-il,Israel,country,,🇮🇱,9.6,525,54950,22,91.5,37.9,.919,90,82.7,6.2,63,98,470,3.7,3.1,7.1,12.2,165,23,6.5,18.6,6.2,3.7,4.4,6,4.4,442,30.1,19,5.4
-ie,Ireland,country,,🇮🇪,5.2,548,105191,69,63.9,29.9,.945,92,82.5,7.3,26,99,496,3.4,2.9,6,37.1,765,-36,11.5,8.2,12.7,4.5,7.8,1,0.2,76,37.8,10.4,6.7
-sg,Singapore,country,,🇸🇬,5.6,509,90299,1,100,45.9,.939,96,82.9,8.9,34,97.7,549,2.8,2.8,4.3,19.7,947,150,21.2,13.9,1.1,3.6,6.1,2.2,2.4,7851,35.5,7.9,6.3
-my,Malaysia,country,,🇲🇾,34.7,408,11755,329,76,40.7,.803,90,75.4,8.0,146,95.8,438,2.3,1.9,3.9,23.3,313,15,57.9,16.2,7.5,3.9,3.4,1,0.9,106,30.5,12.4,5.5
-ph,Philippines,country,,🇵🇭,114,404,3548,298,54.8,39.3,.710,68,69.5,1.3,2180,98.5,353,0.8,1,5.2,17.2,115,9,24.3,20.3,28,2.6,5.8,0.3,1.3,382,25.7,16.1,6.3
-vn,Vietnam,country,,🇻🇳,99.7,413,4148,313,37.5,36.1,.726,74,74.5,3.5,445,96.1,496,1.1,2.6,4.5,24.8,386,18,47.2,20.8,24.2,1.6,3.2,0.4,2.3,318,31.9,14.3,6.5
-ng,Nigeria,country,,🇳🇬,223.2,647,2899,911,61.4,33.9,.535,36,54.1,0.6,270,63.2,,0.4,0.5,4.2,9.1,65,0,23.4,56.5,80.3,3.8,18.8,0.1,0.7,245,18.1,33.2,12
-eg,Egypt,country,,🇪🇬,112.6,477,4233,995,42.6,28.5,.731,72,71,2.3,82,79.5,,0.7,1.1,4.7,16,72,11,0,54.9,6.1,6.5,13.9,1,1,113,24.1,21.1,5.7
-ar,Argentina,country,,🇦🇷,45.4,634,13962,2737,92.1,40.7,.842,87,75.8,3.9,131,99.1,402,5.4,3.4,10.2,16.4,103,15,10.4,14.9,9.2,6.8,72.4,0.5,0.7,17,31.8,10.9,8.8
-za,South Africa,country,,🇿🇦,62.4,408,6534,1213,63.5,63.0,.713,72,65.5,6.7,26,90,389,0.8,2.3,8.7,12.4,137,9,14,23.8,9.7,33.3,7,0.6,0.8,51,27.6,19.1,9.4
-dk,Denmark,country,,🇩🇰,5.9,400,67781,40,88.4,29.3,.948,98,81.3,4.9,32,99,494,4.5,2.5,9.5,12.8,283,28,15.8,9.1,39.5,4.4,7.7,2.9,1.4,148,41.7,9.9,10.1
-fi,Finland,country,,🇫🇮,5.6,280,50441,304,73.7,27.9,.940,96,81.2,6.7,38,99,507,3.6,2.6,9.7,15.8,130,13,73.7,4.9,50.2,6.7,7.1,3,1.6,18,42.8,8.1,11.4
-nz,New Zealand,country,,🇳🇿,5.1,250,49100,263,83.9,36.0,.937,95,82,6.8,8,99,494,3.6,2.6,10.6,8.9,60,10,37.7,6.5,28.9,3.3,7.2,1.5,1.2,19,37.3,11.5,7.5
-pt,Portugal,country,,🇵🇹,10.4,257,24621,92,61.1,36.3,.866,85,81.6,4.0,49,96,477,5.9,3.5,10.5,12.5,127,13,36.2,8.5,32.3,6.1,7.8,1.7,1.4,114,46.2,8,11.9
-cz,Czech Republic,country,,🇨🇿,10.7,302,28282,77,72.7,25.9,.895,88,78.9,8.5,72,99,497,4.4,6.5,8.5,19.4,219,9,34.7,14.1,17.2,2.2,15.1,2,1.3,138,43.0,9.5,11.3
-ro,Romania,country,,🇷🇴,19,295,15504,230,52.2,32.3,.821,84,75.2,3.5,91,99.2,428,3.6,7.2,5.8,13.8,129,11,30.1,14.9,23.6,5.6,13.8,0.5,1.8,83,42.5,9.4,14.3
-gr,Greece,country,,🇬🇷,10.4,218,20887,129,78.6,33.4,.887,85,80.8,5.0,40,98,451,6.6,4.3,8.4,9.7,107,8,30.3,14.4,21.5,12.4,9.6,1.5,4,81,45.8,7.3,13.4
-hu,Hungary,country,,🇭🇺,9.6,177,18428,91,70.2,30.6,.846,89,75.9,4.6,66,99,481,3.5,6.6,6.6,16.8,159,-2,22.5,14.1,15.3,3.6,14.6,1.4,1.8,105,43.3,9.3,14.2
-ua,Ukraine,country,,🇺🇦,41,162,4200,579,69.4,25.6,.773,75,72.7,3.6,289,100,453,3.5,6.1,8.2,7.6,57,0,16.7,14.9,8.9,9.8,20.2,0.3,25.6,71,40.5,5.7,14.2
-ru,Russia,country,,🇷🇺,144.2,2292,15620,16377,74.9,33.9,.822,85,72.5,12.1,724,99.9,478,5.1,6.8,6.9,13.2,635,-40,49.8,11.3,3.5,3.9,13.7,0.9,4.6,9,39.6,8.9,12.9
-ae,UAE,country,,🇦🇪,10.1,511,50760,71,85.5,32.5,.911,99,80.5,20.8,78,98.3,432,2.9,1.9,4.6,8.5,522,23,4.5,36.3,1,2.9,5.3,1.5,,142,,9.3,1.2
-cl,Chile,country,,🇨🇱,19.6,301,15406,743,88.6,43,.855,90,79.2,4.3,61,97,423,3.2,1.9,10,9.5,107,19,24.8,23.3,24.2,8.2,11.6,0.4,1.5,26,35.5,9.7,7.6
-co,Colombia,country,,🇨🇴,51.7,346,6680,1110,78,54.8,.752,73,76.5,1.8,372,95.3,406,2.5,1.7,7.6,11.1,70,17,52.9,14.2,29.7,10.5,10.2,0.3,2.8,47,30.8,13.7,5.9
-pk,Pakistan,country,,🇵🇰,243.7,375,1538,771,38.4,29.6,.544,36,67.4,1.0,228,58.9,,1.2,0.6,2.9,13.8,40,1,4.7,43,41.6,5.3,19.9,0.2,3.2,316,22.8,28.1,6.5
-bd,Bangladesh,country,,🇧🇩,169.4,460,2716,130,31.7,30.9,.661,39,74.3,0.6,162,79,,0.7,1,2.2,21.8,59,2,14.5,42.4,25,4.6,7.7,0.3,1,1300,27.6,20.6,5
-pe,Peru,country,,🇵🇪,33.5,246,7351,1280,84.4,40.3,.762,71,76.8,1.8,143,93.7,401,1.6,1.6,6.1,12.4,71,11,56.2,27,30.6,4.3,8.3,0.2,1.1,26,28.2,16.2,6.4
-sk,Slovakia,country,,🇸🇰,5,133,24358,49,54,24.1,.848,87,77.2,5.5,37,99,486,3.6,5.7,7.2,22.0,113,2,40.3,16.9,22.0,,,,,,,,
-bg,Bulgaria,country,,🇧🇬,6.5,91,13999,109,73.5,38.2,.795,80,74.2,5.1,52,98,420,4.3,8,7.6,15.2,63,5,36.1,17.1,20.4,4.1,15.3,0.8,1.6,60,,8.8,18.4
-hr,Croatia,country,,🇭🇷,3.9,71,18466,56,57,30,.858,82,77.6,3.8,32,99,472,3.9,5.8,7.3,12.3,42,4,34.7,16.1,34.1,6.8,10.8,1.4,1.8,69,,8.8,14.8
-si,Slovenia,country,,🇸🇮,2,68,32135,20,56,23.5,.918,89,81.3,5.8,8,99,485,3.3,4.4,9.5,21.0,54,1,62.0,14.8,36.0,,,,,,,,
-lt,Lithuania,country,,🇱🇹,2.8,71,25086,63,68.3,36.6,.875,86,75.6,4.2,22,99,476,4.5,5.7,7.2,16.4,62,2,35.2,9.2,33.2,6,19.7,1.1,2.4,45,,7.8,15.1
-lv,Latvia,country,,🇱🇻,1.9,38,20221,62,68.3,33.7,.863,89,74.3,3.6,25,99,487,3.4,5,8.1,12,29,1,54.9,11.6,44,6.8,17.3,0.8,2.3,30,,8.5,16.4
-ee,Estonia,country,,🇪🇪,1.3,38,28340,43,70.5,32.3,.890,92,77.8,7.2,19,99,526,3.5,4.2,6.9,12,33,2,57.1,6.1,38,5.6,19.4,1.8,2.1,32,,8.6,12.8
-ir,Iran,country,,🇮🇷,89,413,4632,1648,76,42.0,.774,79,76.7,8.5,590,88,,1.6,1.6,6.7,10.8,100,1,6.8,35.5,6.5,,,,,,,,
-iq,Iraq,country,,🇮🇶,46,264,5803,438,71,29.5,.686,75,71.1,4.8,38,86,,0.8,1.3,3.0,2.8,104,3,1.9,57.5,3.0,,,,,,,,
-kw,Kuwait,country,,🇰🇼,4.6,184,39982,18,100,,.831,98,80.6,21.6,15,96.5,,2.3,2.3,4.2,7.9,111,1,0.4,53.7,0.1,2.1,4,0.1,4.5,258,,10.8,1.8
-qa,Qatar,country,,🇶🇦,2.7,236,88701,11,99.2,,.875,99,81.9,32.4,12,93,407,3,1.2,2.2,9.3,162,0,0,75.7,0,0.1,5,0.7,6.5,231,,10.1,0.9
-et,Ethiopia,country,,🇪🇹,125.4,123,982,1128,22.7,31.1,.498,19,66.9,0.2,51,60.5,,0.1,0.3,2.9,4.2,10,4,15,27.3,90.6,3.4,33.9,0.3,1.5,111,19.5,32.4,6.1
-ke,Kenya,country,,🇰🇪,54.3,114,2110,581,31.4,37.7,.575,40,63.5,0.4,74,82,,0.2,1.4,4.3,7.7,18,1,6.2,24.4,67.7,5.6,7.7,0.4,1,93,20.0,27.3,7.2
-gh,Ghana,country,,🇬🇭,33.1,74,2230,228,57.3,43.5,.602,68,65.2,0.6,77,76.5,,0.1,0.9,3.7,11.5,26,1,35.2,54.2,39,2.9,31.3,0.4,0.3,146,21.1,26.6,7.1
-tz,Tanzania,country,,🇹🇿,64.7,76,1208,886,34.8,40.5,.549,32,66.9,0.2,58,78.2,,0.1,0.8,3.1,8.2,12,1,50.6,25.1,78.3,1.6,4.4,0.5,1.2,73,17.7,35.6,5.8
-ma,Morocco,country,,🇲🇦,37.3,131,3463,446,62.5,39.5,.683,88,75.2,1.8,96,74,359,0.7,0.7,5.8,16,59,2,12.9,21.3,10.9,9.4,6.7,,3.8,84,,17,5.6
-dz,Algeria,country,,🇩🇿,46,195,4277,2382,74,27.6,.745,71,77.1,3.7,106,81,,1.8,1.9,6.2,5.0,45,1,0.8,35.2,1.0,,,,,,,,
-ve,Venezuela,country,,🇻🇪,29,92,3190,916,88,44.8,.691,72,72.0,3.5,65,97,,1.2,0.9,3.8,11.0,6,-3,52.4,15.2,65.0,,,,,,,,
-ec,Ecuador,country,,🇪🇨,17.8,116,6516,248,63.1,45.5,.740,70,76.6,2.3,62,96.3,,2.3,1.3,7.6,12.9,36,1,49.8,16.7,18.9,3.7,3.5,0.3,2.2,72,28.5,15.4,5.4
-uy,Uruguay,country,,🇺🇾,3.4,71,20819,175,95.5,40.6,.830,90,76.5,2.0,18,98.8,418,4.7,2.5,8.9,10.5,24,9,11.8,10.6,57.8,7.9,9.1,0.6,2,19,35.5,10,10.8
-cr,Costa Rica,country,,🇨🇷,5.1,69,13626,51,78.4,47.2,.809,81,79.3,1.7,64,98,402,2.7,1.1,7.2,14.1,29,4,60.1,14.3,34.2,11.3,8.3,0.3,0.0,100,33.5,10.3,6.1
-pa,Panama,country,,🇵🇦,4.4,76,17379,74,65.8,48.9,.805,73,79.3,2.9,43,96.1,365,1.6,2.1,9,5.1,37,2,56.5,11.5,28,8.1,2.9,0.2,0.0,59,29.8,16.2,4.8
+us,United States,country,,🇺🇸,336.8,29168,86601,9147,80,41.7,0.927,92,79.3,14.4,5300,99,495,3.7,2.7,16.5,10.7,3017,417,33.9,7.8,10.9,4.1,3,3.6,3.3,38,38,11,9.8
+cn,China,country,,🇨🇳,1409,18273,12969,9388,65.2,36,0.788,73,78,8.0,2956,96.7,555,3.1,5.4,5.9,26.4,3718,190,23.8,34.8,15.2,5.1,0.4,2.6,1.6,148,39.1,6.8,7.4
+jp,Japan,country,,🇯🇵,123.9,4070,32859,364,92,32.3,0.92,93,84.7,8.5,803,99,520,2.6,12.6,12.3,19.8,918,48,68.4,12.8,8.8,2.5,2.2,3.4,1,330,49,6.3,12.9
+de,Germany,country,,🇩🇪,84.8,4710,55521,349,81.8,32.4,0.95,93,81.4,7.9,423,99,500,4.5,7.6,12.4,18.3,1917,87,32.7,10.3,17.6,3.4,2.4,3.1,1.4,243,45.1,8.8,12.7
+gb,United Kingdom,country,,🇬🇧,68.4,3588,52423,242,83.1,32.4,0.94,95,81.3,5.2,164,99,494,3.1,2.4,11.1,8,1084,93,13.3,9.9,12.2,4.3,2.6,2.9,2.1,283,39.8,10.1,9.5
+fr,France,country,,🇫🇷,66.1,3174,48012,539,78.8,31.2,0.91,90,83.3,4.5,253,99,474,3.3,5.7,11.8,9.3,1023,112,32.3,9.6,16.2,7.4,2.3,2.2,2,120,41.8,10.7,9.9
+in,India,country,,🇮🇳,1441.7,3889,2698,2973,34.8,25.5,0.644,47,72,1.9,1113,76.3,,0.7,1.6,3.4,13.1,778,50,24.4,48.4,34.9,4.8,4.4,0.6,2.4,484,28.1,16.3,6.6
+br,Brazil,country,,🇧🇷,212.5,2188,10296,8358,87.3,52,0.76,81,75.8,2.2,302,94.4,413,2.4,2.5,9.4,13.1,383,76,59.1,12.2,46.5,7.2,4.3,1.1,1.1,25,33.9,12.6,7.5
+it,Italy,country,,🇮🇹,59,2377,40287,296,69.5,33.7,0.906,87,83.7,5.3,98,99,477,4.2,3.1,8.9,15.4,739,62,32.7,14.7,17.5,7,1.3,1.4,1.7,201,47.5,6.7,12.1
+ca,Canada,country,,🇨🇦,41.1,2215,53834,8789,82.4,31.1,0.935,97,82.6,14.3,223,99,512,2.8,2.5,11.1,9.3,743,50,39.5,6.6,23.8,6.2,2.4,1.7,1.2,4,40.3,9,8.6
+kr,South Korea,country,,🇰🇷,51.8,1870,36132,98,81.2,32.9,0.929,98,84.3,11.6,430,99,526,2.6,12.8,8.9,26.5,815,25,64.2,25.9,3.6,2.9,2.5,5.2,2.6,523,44.5,4.9,7.3
+au,Australia,country,,🇦🇺,27.3,1802,65966,7692,87.3,33.8,0.946,96,83.9,15.0,43,99,494,4.1,3.8,9.9,5.3,432,69,17.4,8.3,12.3,4.2,3.3,1.9,1.9,3,37.8,11.6,7.3
+mx,Mexico,country,,🇲🇽,132.3,1848,13972,1944,79.2,43.5,0.781,76,75.1,3.6,965,95.8,420,2.6,1,5.7,21.5,630,39,33.7,15,13,3,4.7,0.3,0.7,66,28.9,16,6.5
+es,Spain,country,,🇪🇸,48.4,1731,35789,500,80,33.6,0.911,93,83.7,5.0,87,99.7,481,4.3,2.9,9.7,11,575,67,37.2,9.6,19,11.6,2.8,1.4,1.4,95,44.9,6.9,9.7
+id,Indonesia,country,,🇮🇩,281.6,1403,4981,1893,57.5,35.5,0.713,62,71.1,2.3,4593,96,382,0.7,1.4,2.7,18.3,323,25,48,17.9,20.2,5.2,2.5,0.3,0.8,147,29.8,16.2,7.5
+nl,Netherlands,country,,🇳🇱,17.9,1218,67984,34,95,25.7,0.946,98,82.2,8.3,58,99,493,3.9,2.4,10,10.3,1009,15,11,10.9,12.2,3.9,3.2,2.3,1.3,537,41.4,9.5,9.6
+sa,Saudi Arabia,country,,🇸🇦,33.5,1101,32881,2150,84.1,45.9,.875,98,78.7,16.6,43,97.9,373,3.5,2.4,5.3,15.1,446,27,0.5,53.1,0.1,3.8,1.7,0.5,6.4,16,29.2,15.2,2.6
+tr,Turkey,country,,🇹🇷,85.8,1344,15666,770,89,44.5,0.855,83,77.2,5.1,209,97.3,454,2.2,3,3.7,21.8,353,14,29.3,21.6,12,9.3,60.9,1.3,1.7,113,32.5,12.2,5.9
+ch,Switzerland,country,,🇨🇭,8.9,942,106098,40,84.9,33.8,0.967,96,84,4.0,36,99,495,4.5,4.4,11.6,18.1,631,-12,32.3,9.1,27.7,2.4,1.3,3.3,0.7,222,42.3,9.4,8.5
+pl,Poland,country,,🇵🇱,36.6,863,23563,306,59.8,28.9,0.881,87,78.6,8.1,397,99,516,3.4,6,6.5,17.7,434,42,31.1,18,15.2,3.2,3.9,1.5,2.2,127,41.3,8.3,12.2
+se,Sweden,country,,🇸🇪,10.6,609,57213,407,88.4,31.6,0.952,97,83.3,3.6,51,99,478,4.4,1.9,10.9,13.7,312,54,68.7,5.6,57.9,8.5,2,3.4,1.3,26,39.9,10,9
+be,Belgium,country,,🇧🇪,11.8,662,56129,30,87.5,26.4,0.942,94,82.1,8.1,34,99,493,3.6,5.5,10.7,12.5,558,13,22.6,11.2,11.7,5.7,4.3,3.4,1.2,387,41.4,9.8,10
+th,Thailand,country,,🇹🇭,70.3,529,7527,511,59.7,34.3,0.803,78,76.4,3.6,310,91.1,415,0.5,2.4,5.4,27,324,12,38.8,31,19,1.1,0.5,1.2,1.2,140,39.7,8.4,9.2
+at,Austria,country,,🇦🇹,9.1,536,58669,83,69,30.9,.926,93,82,6.9,73,99,490,5.4,6.7,11.2,16.7,291,14,47.2,10.9,36,5.6,3,3.2,0.8,111,43.1,9.1,10.3
+no,Norway,country,,🇳🇴,5.6,504,90434,364,83,26.9,0.966,98,83.3,7.5,48,99,499,4.9,3.4,7.9,4.9,331,14,33.5,6.1,61.4,4.3,3.3,1.6,1.5,18,39.5,9.4,8.4
+il,Israel,country,,🇮🇱,9.9,528,53111,22,91.5,37.9,0.915,90,82.4,6.2,63,98,470,3.7,3.1,7.1,12.2,165,23,6.5,18.6,6.2,3.1,3.1,6,4.4,428,29.1,19,5.4
+ie,Ireland,country,,🇮🇪,5.4,561,103500,69,63.9,29.9,0.95,92,82.4,7.3,26,99,496,3.4,2.9,6,37.1,765,-36,11.5,8.2,12.7,4.4,1.7,1,0.2,76,38.4,10.4,6.7
+sg,Singapore,country,,🇸🇬,5.9,531,89370,1,100,45.9,0.949,96,83.7,8.9,34,97.7,549,2.8,2.8,4.3,19.7,947,150,21.2,13.9,1.1,1.9,2.6,2.2,2.4,8476,35.1,7.9,6.3
+my,Malaysia,country,,🇲🇾,33.5,440,13142,329,76,40.7,0.807,90,76.7,8.0,146,95.8,438,2.3,1.9,3.9,23.3,313,15,57.9,16.2,7.5,3.5,2.8,1,0.9,107,30.1,12.4,5.5
+ph,Philippines,country,,🇵🇭,113.2,470,4154,298,54.8,39.3,.710,68,69.8,1.3,2180,98.5,353,0.8,1,5.2,17.2,115,9,24.3,20.3,28,4.4,3.3,0.3,1.3,383,25.3,16.1,6.3
+vn,Vietnam,country,,🇻🇳,100.8,468,4649,313,37.5,36.1,.726,74,74.6,3.5,445,96.1,496,1.1,2.6,4.5,24.8,386,18,47.2,20.8,24.2,2.1,4.1,0.4,2.3,320,32.4,14.3,6.5
+ng,Nigeria,country,,🇳🇬,227.7,200,877,911,61.4,33.9,0.548,36,54.5,0.6,270,63.2,,0.4,0.5,4.2,9.1,65,0,23.4,56.5,80.3,3.8,32.5,0.1,0.7,250,17.8,33.2,12
+eg,Egypt,country,,🇪🇬,107.3,380,3542,995,42.6,28.5,0.728,72,71.6,2.3,82,79.5,,0.7,1.1,4.7,16,72,11,0,54.9,6.1,7.2,33.3,1,1,115,24,21.1,5.7
+ar,Argentina,country,,🇦🇷,47.2,604,12814,2737,92.1,40.7,0.849,87,77.4,3.9,131,99.1,402,5.4,3.4,10.2,16.4,103,15,10.4,14.9,9.2,8.2,229.8,0.5,0.7,16,32.1,10.9,8.8
+za,South Africa,country,,🇿🇦,63.2,403,6377,1213,63.5,63.0,0.717,72,66.1,6.7,26,90,389,0.8,2.3,8.7,12.4,137,9,14,23.8,9.7,33.7,4.7,0.6,0.8,52,28.2,19.1,9.4
+dk,Denmark,country,,🇩🇰,6,412,69273,40,88.4,29.3,0.952,98,81.9,4.9,32,99,494,4.5,2.5,9.5,12.8,283,28,15.8,9.1,39.5,2.9,1.8,2.9,1.4,140,41.2,9.9,10.1
+fi,Finland,country,,🇫🇮,5.6,306,54774,304,73.7,27.9,0.942,96,81.9,6.7,38,99,507,3.6,2.6,9.7,15.8,130,13,73.7,4.9,50.2,8.3,1.2,3,1.6,18,42.8,8.1,11.4
+nz,New Zealand,country,,🇳🇿,5.4,252,47072,263,83.9,36.0,0.939,95,82.1,6.8,8,99,494,3.6,2.6,10.6,8.9,60,10,37.7,6.5,28.9,5.1,2.7,1.5,1.2,20,37.3,11.5,7.5
+pt,Portugal,country,,🇵🇹,10.3,303,29341,92,61.1,36.3,0.874,85,82.4,4.0,49,96,477,5.9,3.5,10.5,12.5,127,13,36.2,8.5,32.3,6.5,2.5,1.7,1.4,113,46.2,8,11.9
+cz,Czech Republic,country,,🇨🇿,10.9,343,31366,77,72.7,25.9,.895,88,79.8,8.5,72,99,497,4.4,6.5,8.5,19.4,219,9,34.7,14.1,17.2,2.8,2.3,2,1.3,140,42.7,9.5,11.3
+ro,Romania,country,,🇷🇴,18.9,381,20089,230,52.2,32.3,0.827,84,75.9,3.5,91,99.2,428,3.6,7.2,5.8,13.8,129,11,30.1,14.9,23.6,5.6,5.3,0.5,1.8,83,42.6,9.4,14.3
+gr,Greece,country,,🇬🇷,10.4,253,24342,129,78.6,33.4,0.893,85,81.9,5.0,40,98,451,6.6,4.3,8.4,9.7,107,8,30.3,14.4,21.5,10.5,2.9,1.5,4,78,45.7,7.3,13.4
+hu,Hungary,country,,🇭🇺,9.6,229,23881,91,70.2,30.6,0.851,89,77,4.6,66,99,481,3.5,6.6,6.6,16.8,159,-2,22.5,14.1,15.3,4.4,3.8,1.4,1.8,107,43.3,9.3,14.2
+ua,Ukraine,country,,🇺🇦,33.4,184,5505,579,69.4,25.6,0.734,75,73.4,3.6,289,100,453,3.5,6.1,8.2,7.6,57,0,16.7,14.9,8.9,14.2,5.8,0.3,25.6,65,42,5.7,14.2
+ru,Russia,country,,🇷🇺,146.1,2184,14953,16377,74.9,33.9,0.821,85,73.2,12.1,724,99.9,478,5.1,6.8,6.9,13.2,635,-40,49.8,11.3,3.5,2.6,7.9,0.9,4.6,9,39.5,8.9,12.9
+ae,UAE,country,,🇦🇪,11,545,49550,71,85.5,32.5,0.937,99,82.9,20.8,78,98.3,432,2.9,1.9,4.6,8.5,522,23,4.5,36.3,1,2.9,2.3,1.5,,150,31.2,9.3,1.2
+cl,Chile,country,,🇨🇱,20.1,329,16365,743,88.6,43,0.86,90,81.2,4.3,61,97,423,3.2,1.9,10,9.5,107,19,24.8,23.3,24.2,8.5,3.9,0.4,1.5,26,36,9.7,7.6
+co,Colombia,country,,🇨🇴,52.7,417,7917,1110,78,54.8,0.758,73,77.7,1.8,372,95.3,406,2.5,1.7,7.6,11.1,70,17,52.9,14.2,29.7,10.2,6.7,0.3,2.8,47,31.6,13.7,5.9
+pk,Pakistan,country,,🇵🇰,235.9,375,1588,771,38.4,29.6,0.54,36,67.6,1.0,228,58.9,,1.2,0.6,2.9,13.8,40,1,4.7,43,41.6,8,23.4,0.2,3.2,321,20.3,28.1,6.5
+bd,Bangladesh,country,,🇧🇩,172,451,2625,130,31.7,30.9,0.67,39,74.7,0.6,162,79,,0.7,1,2.2,21.8,59,2,14.5,42.4,25,4.6,9.7,0.3,1,1317,25.3,20.6,5
+pe,Peru,country,,🇵🇪,34.1,283,8316,1280,84.4,40.3,.762,71,77.7,1.8,143,93.7,401,1.6,1.6,6.1,12.4,71,11,56.2,27,30.6,6.8,2.5,0.2,1.1,26,29.5,16.2,6.4
+sk,Slovakia,country,,🇸🇰,5.4,143,26290,48,53.2,24.1,0.855,87,78.3,5.5,37,99,486,3.7,5.7,7.7,17.4,115,5,40.1,15.4,17.9,5.6,2.8,1,1.8,112,41.3,9.7,11
+bg,Bulgaria,country,,🇧🇬,6.4,108,17069,109,73.5,38.2,0.799,80,75.6,5.1,52,98,420,4.3,8,7.6,15.2,63,5,36.1,17.1,20.4,4.3,2.8,0.8,1.6,63,44.3,8.8,18.4
+hr,Croatia,country,,🇭🇷,3.8,90,23380,56,57,30,0.878,82,78.6,3.8,32,99,472,3.9,5.8,7.3,12.3,42,4,34.7,16.1,34.1,5.6,4,1.4,1.8,70,44.8,8.8,14.8
+si,Slovenia,country,,🇸🇮,2.1,73,34544,20,55.3,24.3,0.926,89,81.6,5.8,8,99,485,3.4,4.1,9.6,19.9,56,2,61.3,14.3,23.4,3.5,2,2.1,1.3,105,43.9,8.3,10.6
+lt,Lithuania,country,,🇱🇹,2.9,83,28713,63,68.3,36.6,0.879,86,76,4.2,22,99,476,4.5,5.7,7.2,16.4,62,2,35.2,9.2,33.2,7.3,0.9,1.1,2.4,46,42.1,7.8,15.1
+lv,Latvia,country,,🇱🇻,1.9,46,24223,62,68.3,33.7,0.879,89,76.2,3.6,25,99,487,3.4,5,8.1,12,29,1,54.9,11.6,44,6.7,1.4,0.8,2.3,30,43.1,8.5,16.4
+ee,Estonia,country,,🇪🇪,1.4,43,31531,43,70.5,32.3,0.899,92,79.2,7.2,19,99,526,3.5,4.2,6.9,12,33,2,57.1,6.1,38,7.5,3.4,1.8,2.1,32,41.9,8.6,12.8
+ir,Iran,country,,🇮🇷,86.6,434,5013,1622,76.3,34.8,0.78,79,77.7,8.5,590,88.6,,1.8,1.6,5.6,22.2,108,2,6.6,32.3,0.9,8,31.7,0.7,2.1,56,32.9,13.3,4.9
+iq,Iraq,country,,🇮🇶,44.4,264,5947,434,69.9,29.8,0.673,75,72.3,4.8,38,84.1,,1,1.3,4.3,2.2,128,-2,1.9,38.2,1.1,15.4,3.2,0,1.6,104,20.3,26,4.2
+kw,Kuwait,country,,🇰🇼,5,162,32290,18,100,,0.847,98,80.4,21.6,15,96.5,,2.3,2.3,4.2,7.9,111,1,0.4,53.7,0.1,2.1,3,0.1,4.5,272,34.5,10.8,1.8
+qa,Qatar,country,,🇶🇦,3.1,221,71568,11,99.2,,.875,99,82.4,32.4,12,93,407,3,1.2,2.2,9.3,162,0,0,75.7,0,0.1,1,0.7,6.5,257,33.2,10.1,0.9
+et,Ethiopia,country,,🇪🇹,107.4,145,1350,1128,22.7,31.1,0.492,19,67.3,0.2,51,60.5,,0.1,0.3,2.9,4.2,10,4,15,27.3,90.6,3.4,23.9,0.3,1.5,129,18.7,32.4,6.1
+ke,Kenya,country,,🇰🇪,52.4,116,2218,581,31.4,37.7,0.601,40,63.6,0.4,74,82,,0.2,1.4,4.3,7.7,18,1,6.2,24.4,67.7,5.6,5.1,0.4,1,95,19.5,27.3,7.2
+gh,Ghana,country,,🇬🇭,33.7,75,2232,228,57.3,43.5,.602,68,65.5,0.6,77,76.5,,0.1,0.9,3.7,11.5,26,1,35.2,54.2,39,2.9,19.5,0.4,0.3,148,20.9,26.6,7.1
+tz,Tanzania,country,,🇹🇿,65.2,80,1224,886,34.8,40.5,0.532,32,67,0.2,58,78.2,,0.1,0.8,3.1,8.2,12,1,50.6,25.1,78.3,1.6,3.2,0.5,1.2,75,17.2,35.6,5.8
+ma,Morocco,country,,🇲🇦,37.4,157,4204,446,62.5,39.5,0.698,88,75.3,1.8,96,74,359,0.7,0.7,5.8,16,59,2,12.9,21.3,10.9,13.4,1.7,,3.8,84,29.2,17,5.6
+dz,Algeria,country,,🇩🇿,46.6,260,5579,2382,74.2,27.6,.745,71,76.3,3.7,106,81,,1.7,1.9,3.6,10.2,69,0,0.8,25.6,0.1,12.4,5.3,,4.1,19,28.2,20.5,4.6
+ve,Venezuela,country,,🇻🇪,26.5,106,4019,882,89.2,44.8,0.699,72,72.5,3.5,65,97,,1.2,1,4.6,11.0,15,2,52.3,15.3,33.7,5.6,59.6,,0.6,31,29,15,7.3
+ec,Ecuador,country,,🇪🇨,18,121,6758,248,63.1,45.5,0.765,70,77.4,2.3,62,96.3,,2.3,1.3,7.6,12.9,36,1,49.8,16.7,18.9,4.2,1.9,0.3,2.2,72,28.4,15.4,5.4
+uy,Uruguay,country,,🇺🇾,3.6,82,23053,175,95.5,40.6,.830,90,78.1,2.0,18,98.8,418,4.7,2.5,8.9,10.5,24,9,11.8,10.6,57.8,8.4,4.9,0.6,2,20,35.8,10,10.8
+cr,Costa Rica,country,,🇨🇷,5.3,95,17860,51,78.4,47.2,0.806,81,80.8,1.7,64,98,402,2.7,1.1,7.2,14.1,29,4,60.1,14.3,34.2,8.3,-0.3,0.3,0.0,100,34.1,10.3,6.1
+pa,Panama,country,,🇵🇦,4.5,87,19369,74,65.8,48.9,0.82,73,79.6,2.9,43,96.1,365,1.6,2.1,9,5.1,37,2,56.5,11.5,28,8.4,1.3,0.2,0.0,60,29.6,16.2,4.8
 cn-bj,Beijing,province,cn,🇨🇳,22,660,30136,16,87,36.5,.891,92,82.5,7.2,92,99,,4.8,6.3,8.5,11.2,52,15,44.8,33.8,12.0,3.5,0.5,6.8,0.0,1375,42.5,6.8,5.5
 cn-sh,Shanghai,province,cn,🇨🇳,25,715,28744,6,89,37.2,.883,91,83.7,8.4,64,99,,3.9,5.8,8.2,23.5,185,22,18.5,32.5,8.5,4.2,0.8,4.2,0.0,4167,44.8,5.2,5.8
 cn-tj,Tianjin,province,cn,🇨🇳,14,256,18467,12,84,33.8,.852,88,81.9,10.2,57,98,,3.2,4.8,7.0,28.2,48,9,12.5,48.5,6.5,3.8,0.5,3.5,0.0,1167,42.2,6.5,6.2
@@ -225,22 +225,22 @@ ca-sk,Saskatchewan,province,ca,🇨🇦,1,88,72542,652,67,32.8,.912,88,80.0,55.2
 nl-nh,North Holland,province,nl,🇳🇱,3,145,52182,3,92,27.5,.945,98,82.0,7.8,8,99,,3.5,3.2,11.5,8.2,85,25,8.5,10.5,18.0,3.2,4.0,2.8,0.0,1025,41.5,9.8,9.2
 nl-zh,South Holland,province,nl,🇳🇱,4,165,42542,3,95,28.2,.935,97,81.5,8.5,12,99,,3.2,3.0,11.2,12.5,125,22,5.8,11.2,22.0,3.5,4.0,2.0,0.0,1333,41.2,10.2,9.5
 se-st,Stockholm Region,city,se,🇸🇪,3,180,68542,7,96,30.5,.955,98,83.5,3.2,12,99,,4.5,2.2,11.8,6.5,48,12,72.5,6.8,55.0,5.5,5.8,4.5,0.0,371,39.5,11.5,7.8
-ru,Russia,country,,🇷🇺,144.2,2292,15620,16377,74.9,33.9,.822,85,72.5,11.8,1100,99.9,488,5.1,6.8,6.9,13.2,635,-40,49.8,11.3,3.5,3.9,13.7,0.9,4.6,9,39.6,8.9,12.9
+ru,Russia,country,,🇷🇺,146.1,2184,14953,16377,74.9,33.9,0.821,85,73.2,11.8,1100,99.9,488,5.1,6.8,6.9,13.2,635,-40,49.8,11.3,3.5,2.6,7.9,0.9,4.6,9,39.5,8.9,12.9
 ru-ms,Moscow,city,ru,🇷🇺,13,480,36842,3,99,38.5,.892,95,77.5,5.2,125,100,,5.5,8.5,8.2,8.5,,,54.0,12.5,8.0,1.5,5.5,2.5,0.0,4333,40.5,10.5,10.2
 ru-sp,St Petersburg,city,ru,🇷🇺,5,120,23518,1,100,35.2,.878,92,76.8,5.8,82,100,,5.2,8.2,7.8,12.8,,,52.5,14.2,5.0,2.2,5.5,2.2,0.0,3991,40.2,10.2,12.5
-cl,Chile,country,,🇨🇱,19.6,301,15406,743,88.6,43,.855,82,79.2,4.5,62,97,423,3.2,1.9,10,9.5,107,19,24.8,23.3,24.2,8.2,11.6,0.4,1.5,26,35.5,9.7,7.6
-co,Colombia,country,,🇨🇴,51.7,346,6680,1110,78,54.8,.752,73,76.5,1.8,375,95.3,412,2.5,1.7,7.6,11.1,70,17,52.9,14.2,29.7,10.5,10.2,0.3,2.8,47,30.8,13.7,5.9
-pe,Peru,country,,🇵🇪,33.5,246,7351,1280,84.4,40.3,.762,65,76.8,1.8,143,93.7,404,1.6,1.6,6.1,12.4,71,11,56.2,27,30.6,4.3,8.3,0.2,1.1,26,28.2,16.2,6.4
-pk,Pakistan,country,,🇵🇰,243.7,375,1538,771,38.4,29.6,.544,36,67.4,0.9,235,58.9,,1.2,0.6,2.9,13.8,40,1,4.7,43,41.6,5.3,19.9,0.2,3.2,316,22.8,28.1,6.5
-bd,Bangladesh,country,,🇧🇩,169.4,460,2716,130,31.7,30.9,.661,40,74.3,0.5,165,79,,0.7,1,2.2,21.8,59,2,14.5,42.4,25,4.6,7.7,0.3,1,1300,27.6,20.6,5
-et,Ethiopia,country,,🇪🇹,125.4,123,982,1128,22.7,31.1,.492,25,66.9,0.2,65,60.5,,0.1,0.3,2.9,4.2,10,4,15,27.3,90.6,3.4,33.9,0.3,1.5,111,19.5,32.4,6.1
-ke,Kenya,country,,🇰🇪,54.3,114,2110,581,31.4,37.7,.575,32,63.5,0.4,82,82,,0.2,1.4,4.3,7.7,18,1,6.2,24.4,67.7,5.6,7.7,0.4,1,93,20.0,27.3,7.2
-gh,Ghana,country,,🇬🇭,33.1,74,2230,228,57.3,43.5,.602,48,65.2,0.6,42,76.5,,0.1,0.9,3.7,11.5,26,1,35.2,54.2,39,2.9,31.3,0.4,0.3,146,21.1,26.6,7.1
-tz,Tanzania,country,,🇹🇿,64.7,76,1208,886,34.8,40.5,.529,20,66.9,0.2,55,78.2,,0.1,0.8,3.1,8.2,12,1,50.6,25.1,78.3,1.6,4.4,0.5,1.2,73,17.7,35.6,5.8
-cr,Costa Rica,country,,🇨🇷,5.1,69,13626,51,78.4,47.2,.806,81,79.3,1.8,65,98,,2.7,1.1,7.2,14.1,29,4,60.1,14.3,34.2,11.3,8.3,0.3,0.0,100,33.5,10.3,6.1
-uy,Uruguay,country,,🇺🇾,3.4,71,20819,175,95.5,40.6,.830,87,76.5,2.1,18,98.8,,4.7,2.5,8.9,10.5,24,9,11.8,10.6,57.8,7.9,9.1,0.6,2,19,35.5,10,10.8
-pa,Panama,country,,🇵🇦,4.4,76,17379,74,65.8,48.9,.805,72,79.3,2.8,22,96.1,,1.6,2.1,9,5.1,37,2,56.5,11.5,28,8.1,2.9,0.2,0.0,59,29.8,16.2,4.8
-ec,Ecuador,country,,🇪🇨,17.8,116,6516,248,63.1,45.5,.740,65,76.6,2.3,62,96.3,,2.3,1.3,7.6,12.9,36,1,49.8,16.7,18.9,3.7,3.5,0.3,2.2,72,28.5,15.4,5.4
+cl,Chile,country,,🇨🇱,20.1,329,16365,743,88.6,43,0.86,82,81.2,4.5,62,97,423,3.2,1.9,10,9.5,107,19,24.8,23.3,24.2,8.5,3.9,0.4,1.5,26,36,9.7,7.6
+co,Colombia,country,,🇨🇴,52.7,417,7917,1110,78,54.8,0.758,73,77.7,1.8,375,95.3,412,2.5,1.7,7.6,11.1,70,17,52.9,14.2,29.7,10.2,6.7,0.3,2.8,47,31.6,13.7,5.9
+pe,Peru,country,,🇵🇪,34.1,283,8316,1280,84.4,40.3,.762,65,77.7,1.8,143,93.7,404,1.6,1.6,6.1,12.4,71,11,56.2,27,30.6,6.8,2.5,0.2,1.1,26,29.5,16.2,6.4
+pk,Pakistan,country,,🇵🇰,235.9,375,1588,771,38.4,29.6,0.54,36,67.6,0.9,235,58.9,,1.2,0.6,2.9,13.8,40,1,4.7,43,41.6,8,23.4,0.2,3.2,321,20.3,28.1,6.5
+bd,Bangladesh,country,,🇧🇩,172,451,2625,130,31.7,30.9,0.67,40,74.7,0.5,165,79,,0.7,1,2.2,21.8,59,2,14.5,42.4,25,4.6,9.7,0.3,1,1317,25.3,20.6,5
+et,Ethiopia,country,,🇪🇹,107.4,145,1350,1128,22.7,31.1,.492,25,67.3,0.2,65,60.5,,0.1,0.3,2.9,4.2,10,4,15,27.3,90.6,3.4,23.9,0.3,1.5,129,18.7,32.4,6.1
+ke,Kenya,country,,🇰🇪,52.4,116,2218,581,31.4,37.7,0.601,32,63.6,0.4,82,82,,0.2,1.4,4.3,7.7,18,1,6.2,24.4,67.7,5.6,5.1,0.4,1,95,19.5,27.3,7.2
+gh,Ghana,country,,🇬🇭,33.7,75,2232,228,57.3,43.5,.602,48,65.5,0.6,42,76.5,,0.1,0.9,3.7,11.5,26,1,35.2,54.2,39,2.9,19.5,0.4,0.3,148,20.9,26.6,7.1
+tz,Tanzania,country,,🇹🇿,65.2,80,1224,886,34.8,40.5,0.532,20,67,0.2,55,78.2,,0.1,0.8,3.1,8.2,12,1,50.6,25.1,78.3,1.6,3.2,0.5,1.2,75,17.2,35.6,5.8
+cr,Costa Rica,country,,🇨🇷,5.3,95,17860,51,78.4,47.2,.806,81,80.8,1.8,65,98,,2.7,1.1,7.2,14.1,29,4,60.1,14.3,34.2,8.3,-0.3,0.3,0.0,100,34.1,10.3,6.1
+uy,Uruguay,country,,🇺🇾,3.6,82,23053,175,95.5,40.6,.830,87,78.1,2.1,18,98.8,,4.7,2.5,8.9,10.5,24,9,11.8,10.6,57.8,8.4,4.9,0.6,2,20,35.8,10,10.8
+pa,Panama,country,,🇵🇦,4.5,87,19369,74,65.8,48.9,0.82,72,79.6,2.8,22,96.1,,1.6,2.1,9,5.1,37,2,56.5,11.5,28,8.4,1.3,0.2,0.0,60,29.6,16.2,4.8
+ec,Ecuador,country,,🇪🇨,18,121,6758,248,63.1,45.5,0.765,65,77.4,2.3,62,96.3,,2.3,1.3,7.6,12.9,36,1,49.8,16.7,18.9,4.2,1.9,0.3,2.2,72,28.4,15.4,5.4
 cz-pr,Prague,city,cz,🇨🇿,1,82,65542,1,100,25.8,.928,93,80.5,6.5,12,99,,4.5,6.8,9.8,8.5,,,11.2,15.2,8.0,1.8,12.0,3.5,0.0,2642,42.8,10.5,10.2
 pl-mz,Masovia (Warsaw),city,pl,🇵🇱,6,148,26042,36,65,30.2,.908,92,79.5,7.5,52,99,,3.8,6.2,7.2,12.5,,,31.0,22.5,12.0,2.5,10.5,2.2,0.0,167,40.5,9.8,10.5
 hu-bp,Budapest,city,hu,🇭🇺,2,82,42542,1,100,31.2,.882,92,77.5,4.2,22,99,,3.8,7.2,7.5,9.5,,,24.0,18.5,8.0,2.8,17.2,2.5,0.0,3384,42.2,9.5,12.2
@@ -286,25 +286,25 @@ mx-nl,Nuevo León,state,mx,🇲🇽,6,85,14842,65,95,42.8,.812,80,77.2,5.5,42,96
 mx-mx,State of Mexico,state,mx,🇲🇽,17,105,6218,22,87,45.5,.738,68,75.5,2.8,52,93,,1.8,1.0,5.2,15.8,18,5,45.5,32.5,15.0,4.5,5.5,0.2,2.2,773,27.8,19.2,5.5
 mx-bc,Baja California,state,mx,🇲🇽,4,45,12342,71,92,41.5,.792,78,76.2,3.5,22,95,,2.2,1.2,5.5,22.5,28,5,55.5,22.2,18.0,2.8,4.2,0.4,2.5,56,29.5,17.5,5.2
 mx-qr,Quintana Roo,state,mx,🇲🇽,2,22,12542,44,90,42.8,.785,75,77.0,3.2,12,95,,1.8,1.0,5.5,3.5,5,3,72.5,12.5,12.0,3.2,5.8,0.2,2.2,45,29.2,16.8,4.5
-ae,UAE,country,,🇦🇪,10.1,511,50760,71,85.5,32.5,.911,99,80.5,20.8,82,98.3,,2.9,1.9,4.6,8.5,522,23,4.5,36.3,1,2.9,5.3,1.5,3.8,142,33.5,9.3,1.2
-qa,Qatar,country,,🇶🇦,2.7,236,88701,11,99.2,41.1,.855,99,81.9,32.5,15,97,,3,1.2,2.2,9.3,162,0,0,75.7,0,0.1,5,0.7,6.5,231,33.8,10.1,0.9
-kw,Kuwait,country,,🇰🇼,4.6,184,39982,18,100,39.5,.831,98,80.6,25.2,12,96.5,,2.3,2.3,4.2,7.9,111,1,0.4,53.7,0.1,2.1,4,0.1,4.5,258,33.2,10.8,1.8
-jo,Jordan,country,,🇯🇴,11.3,49,4332,89,92.4,33.7,.720,67,77.1,2.5,32,94.8,,2.9,1.4,7.7,17.1,21,1,1.1,28.8,11.5,18.2,4.2,0.3,4.8,127,24.2,20.9,3.2
-bg,Bulgaria,country,,🇧🇬,6.5,91,13999,109,73.5,38.2,.795,79,74.2,5.8,55,98,,4.3,8,7.6,15.2,63,5,36.1,17.1,20.4,4.1,15.3,0.8,1.6,60,45.2,8.8,18.4
-hr,Croatia,country,,🇭🇷,3.9,71,18466,56,57,30,.858,82,77.6,4.2,28,99,,3.9,5.8,7.3,12.3,42,4,34.7,16.1,34.1,6.8,10.8,1.4,1.8,69,44.5,8.8,14.8
-rs,Serbia,country,,🇷🇸,6.7,67,10025,84,61.9,32.8,.802,78,75.2,5.5,52,99.3,,3.1,5.8,8.6,14.8,41,5,32.4,22.5,27.2,8.4,12,1,2.2,79,41.8,9.3,16.3
-lt,Lithuania,country,,🇱🇹,2.8,71,25086,63,68.3,36.6,.875,85,75.6,4.2,22,100,,4.5,5.7,7.2,16.4,62,2,35.2,9.2,33.2,6,19.7,1.1,2.4,45,42.5,7.8,15.1
-lv,Latvia,country,,🇱🇻,1.9,38,20221,62,68.3,33.7,.866,83,74.3,3.5,18,100,,3.4,5,8.1,12,29,1,54.9,11.6,44,6.8,17.3,0.8,2.3,30,43.8,8.5,16.4
-ee,Estonia,country,,🇪🇪,1.3,38,28340,43,70.5,32.3,.890,90,77.8,8.5,12,100,,3.5,4.2,6.9,12,33,2,57.1,6.1,38,5.6,19.4,1.8,2.1,32,42.2,8.6,12.8
-ma,Morocco,country,,🇲🇦,37.3,131,3463,446,62.5,39.5,.683,85,75.2,1.8,42,74,,0.7,0.7,5.8,16,59,2,12.9,21.3,10.9,9.4,6.7,0.2,3.8,84,29.5,17,5.6
-tn,Tunisia,country,,🇹🇳,12.1,45,3707,155,69.7,33.7,.732,68,76,2.8,28,86.2,,1.3,1.8,7.5,15.6,23,1,4.5,24.2,11.6,15.3,8.3,0.4,2.6,78,32.5,14.1,6.2
-rw,Rwanda,country,,🇷🇼,13.7,13,975,25,27.8,39.4,.534,32,67.5,0.1,42,78.8,,0.1,0.7,5.9,9.9,3,0,11.3,31.3,79.9,15.1,17.7,0.8,1.3,553,19.5,28.9,6
-sn,Senegal,country,,🇸🇳,17.7,28,1574,193,53.4,36.2,.511,42,67.8,0.6,22,50.4,,0.1,0.3,4,15.6,7,3,41.5,63.7,35.4,2.8,9.7,0.1,1.5,92,19.2,29.5,5.9
-ci,Côte dIvoire,country,,🇨🇮,30.4,71,2333,318,52.8,35.3,.550,28,61.6,0.4,12,50,,0.2,0.4,3.6,12.8,17,2,8.2,49.5,58.2,2.3,5.2,0.1,0.9,96,19.8,32.5,7.8
-lk,Sri Lanka,country,,🇱🇰,22.2,74,3343,62,20,39.8,.782,52,77.3,1.2,42,92.5,,1.1,3.9,4,19.7,16,1,34.1,20,48.8,4.5,49.7,0.1,1.3,359,32.5,12.4,8.1
-mm,Myanmar,country,,🇲🇲,53.8,62,1158,653,30.3,30.7,.585,35,66.5,0.5,175,93.5,,0.7,1.1,4.5,25.6,12,1,42.8,32.3,62.9,3.1,3.5,0,4.2,82,27.8,16.9,9.2
-kh,Cambodia,country,,🇰🇭,17.2,40,2325,177,40.4,36.1,.593,52,70.5,0.5,55,71.9,,0.2,0.8,4.5,27.1,29,4,43.9,24.1,52.4,0.2,5.3,0.1,1.5,97,26.5,21.3,6.3
-np,Nepal,country,,🇳🇵,29.7,41,1386,143,66.3,30,.602,42,70.1,0.5,32,68,,1,0.5,6.5,4.8,3,0,41.6,45.7,73.7,10.7,7.7,0.2,1.2,207,24.2,19.6,6.9
+ae,UAE,country,,🇦🇪,11,545,49550,71,85.5,32.5,0.937,99,82.9,20.8,82,98.3,,2.9,1.9,4.6,8.5,522,23,4.5,36.3,1,2.9,2.3,1.5,3.8,150,31.2,9.3,1.2
+qa,Qatar,country,,🇶🇦,3.1,221,71568,11,99.2,41.1,0.875,99,82.4,32.5,15,97,,3,1.2,2.2,9.3,162,0,0,75.7,0,0.1,1,0.7,6.5,257,33.2,10.1,0.9
+kw,Kuwait,country,,🇰🇼,5,162,32290,18,100,39.5,0.847,98,80.4,25.2,12,96.5,,2.3,2.3,4.2,7.9,111,1,0.4,53.7,0.1,2.1,3,0.1,4.5,272,34.5,10.8,1.8
+jo,Jordan,country,,🇯🇴,11.4,53,4682,89,92.4,33.7,0.736,67,77.8,2.5,32,94.8,,2.9,1.4,7.7,17.1,21,1,1.1,28.8,11.5,22,2.1,0.3,4.8,129,24.3,20.9,3.2
+bg,Bulgaria,country,,🇧🇬,6.4,108,17069,109,73.5,38.2,0.799,79,75.6,5.8,55,98,,4.3,8,7.6,15.2,63,5,36.1,17.1,20.4,4.3,2.8,0.8,1.6,63,44.3,8.8,18.4
+hr,Croatia,country,,🇭🇷,3.8,90,23380,56,57,30,0.878,82,78.6,4.2,28,99,,3.9,5.8,7.3,12.3,42,4,34.7,16.1,34.1,5.6,4,1.4,1.8,70,44.8,8.8,14.8
+rs,Serbia,country,,🇷🇸,6.6,83,12514,84,61.9,32.8,0.805,78,76.8,5.5,52,99.3,,3.1,5.8,8.6,14.8,41,5,32.4,22.5,27.2,9.1,4.5,1,2.2,88,43.9,9.3,16.3
+lt,Lithuania,country,,🇱🇹,2.9,83,28713,63,68.3,36.6,0.879,85,76,4.2,22,100,,4.5,5.7,7.2,16.4,62,2,35.2,9.2,33.2,7.3,0.9,1.1,2.4,46,42.1,7.8,15.1
+lv,Latvia,country,,🇱🇻,1.9,46,24223,62,68.3,33.7,0.879,83,76.2,3.5,18,100,,3.4,5,8.1,12,29,1,54.9,11.6,44,6.7,1.4,0.8,2.3,30,43.1,8.5,16.4
+ee,Estonia,country,,🇪🇪,1.4,43,31531,43,70.5,32.3,0.899,90,79.2,8.5,12,100,,3.5,4.2,6.9,12,33,2,57.1,6.1,38,7.5,3.4,1.8,2.1,32,41.9,8.6,12.8
+ma,Morocco,country,,🇲🇦,37.4,157,4204,446,62.5,39.5,0.698,85,75.3,1.8,42,74,,0.7,0.7,5.8,16,59,2,12.9,21.3,10.9,13.4,1.7,0.2,3.8,84,29.2,17,5.6
+tn,Tunisia,country,,🇹🇳,12.3,53,4267,155,69.7,33.7,.732,68,76.5,2.8,28,86.2,,1.3,1.8,7.5,15.6,23,1,4.5,24.2,11.6,16.4,7.1,0.4,2.6,78,32.1,14.1,6.2
+rw,Rwanda,country,,🇷🇼,13.9,14,986,25,27.8,39.4,0.548,32,67.8,0.1,42,78.8,,0.1,0.7,5.9,9.9,3,0,11.3,31.3,79.9,15.1,4.9,0.8,1.3,576,19.4,28.9,6
+sn,Senegal,country,,🇸🇳,18.7,34,1805,193,53.4,36.2,0.517,42,68.7,0.6,22,50.4,,0.1,0.3,4,15.6,7,3,41.5,63.7,35.4,2.8,1.5,0.1,1.5,94,19.1,29.5,5.9
+ci,Côte dIvoire,country,,🇨🇮,32,87,2720,318,52.8,35.3,0.534,28,61.9,0.4,12,50,,0.2,0.4,3.6,12.8,17,2,8.2,49.5,58.2,2.3,3.8,0.1,0.9,98,18.1,32.5,7.8
+lk,Sri Lanka,country,,🇱🇰,22.4,75,3330,62,20,39.8,0.78,52,77.5,1.2,42,92.5,,1.1,3.9,4,19.7,16,1,34.1,20,48.8,5.2,45.2,0.1,1.3,366,32.8,12.4,8.1
+mm,Myanmar,country,,🇲🇲,54.5,64,1179,653,30.3,30.7,0.608,35,66.9,0.5,175,93.5,,0.7,1.1,4.5,25.6,12,1,42.8,32.3,62.9,3.1,22,0,4.2,83,29.5,16.9,9.2
+kh,Cambodia,country,,🇰🇭,17.2,47,2744,177,40.4,36.1,0.6,52,70.7,0.5,55,71.9,,0.2,0.8,4.5,27.1,29,4,43.9,24.1,52.4,0.2,0.7,0.1,1.5,96,25.8,21.3,6.3
+np,Nepal,country,,🇳🇵,31.6,44,1381,143,66.3,30,0.601,42,70.4,0.5,32,68,,1,0.5,6.5,4.8,3,0,41.6,45.7,73.7,10.7,5.6,0.2,1.2,202,24.7,19.6,6.9
 in-dl,Delhi,city,in,🇮🇳,32,150,4705,1,97,37.5,.746,69,73.8,2.5,28,87,,1.2,1.2,4.0,5.8,8,6,12.5,175.5,12.0,7.2,5.8,0.8,1.5,11874,29.2,18.5,5.2
 in-up,Uttar Pradesh,state,in,🇮🇳,235,310,1317,241,22,33.2,.596,28,66.8,0.8,82,73,,0.4,0.5,2.5,11.2,12,2,6.5,58.5,8.0,5.8,5.2,0.3,0.8,976,23.8,24.2,6.8
 in-rj,Rajasthan,state,in,🇮🇳,81,180,2223,342,25,34.5,.629,38,68.5,1.2,48,67,,0.5,0.5,2.8,10.8,8,2,8.2,48.2,15.0,5.2,4.5,0.4,1.2,237,24.5,23.5,6.2
@@ -345,25 +345,25 @@ mx-nl,Nuevo León,state,mx,🇲🇽,6,85,14842,65,95,42.8,.812,80,77.2,5.5,42,96
 mx-mx,State of Mexico,state,mx,🇲🇽,17,105,6218,22,87,45.5,.738,68,75.5,2.8,52,93,,1.8,1.0,5.2,15.8,18,5,45.5,32.5,15.0,4.5,5.5,0.2,2.2,773,27.8,19.2,5.5
 mx-bc,Baja California,state,mx,🇲🇽,4,45,12342,71,92,41.5,.792,78,76.2,3.5,22,95,,2.2,1.2,5.5,22.5,28,5,55.5,22.2,18.0,2.8,4.2,0.4,2.5,56,29.5,17.5,5.2
 mx-qr,Quintana Roo,state,mx,🇲🇽,2,22,12542,44,90,42.8,.785,75,77.0,3.2,12,95,,1.8,1.0,5.5,3.5,5,3,72.5,12.5,12.0,3.2,5.8,0.2,2.2,45,29.2,16.8,4.5
-ae,UAE,country,,🇦🇪,10.1,511,50760,71,85.5,32.5,.911,99,80.5,20.8,82,98.3,,2.9,1.9,4.6,8.5,522,23,4.5,36.3,1,2.9,5.3,1.5,3.8,142,33.5,9.3,1.2
-qa,Qatar,country,,🇶🇦,2.7,236,88701,11,99.2,41.1,.855,99,81.9,32.5,15,97,,3,1.2,2.2,9.3,162,0,0,75.7,0,0.1,5,0.7,6.5,231,33.8,10.1,0.9
-kw,Kuwait,country,,🇰🇼,4.6,184,39982,18,100,39.5,.831,98,80.6,25.2,12,96.5,,2.3,2.3,4.2,7.9,111,1,0.4,53.7,0.1,2.1,4,0.1,4.5,258,33.2,10.8,1.8
-jo,Jordan,country,,🇯🇴,11.3,49,4332,89,92.4,33.7,.720,67,77.1,2.5,32,94.8,,2.9,1.4,7.7,17.1,21,1,1.1,28.8,11.5,18.2,4.2,0.3,4.8,127,24.2,20.9,3.2
-bg,Bulgaria,country,,🇧🇬,6.5,91,13999,109,73.5,38.2,.795,79,74.2,5.8,55,98,,4.3,8,7.6,15.2,63,5,36.1,17.1,20.4,4.1,15.3,0.8,1.6,60,45.2,8.8,18.4
-hr,Croatia,country,,🇭🇷,3.9,71,18466,56,57,30,.858,82,77.6,4.2,28,99,,3.9,5.8,7.3,12.3,42,4,34.7,16.1,34.1,6.8,10.8,1.4,1.8,69,44.5,8.8,14.8
-rs,Serbia,country,,🇷🇸,6.7,67,10025,84,61.9,32.8,.802,78,75.2,5.5,52,99.3,,3.1,5.8,8.6,14.8,41,5,32.4,22.5,27.2,8.4,12,1,2.2,79,41.8,9.3,16.3
-lt,Lithuania,country,,🇱🇹,2.8,71,25086,63,68.3,36.6,.875,85,75.6,4.2,22,100,,4.5,5.7,7.2,16.4,62,2,35.2,9.2,33.2,6,19.7,1.1,2.4,45,42.5,7.8,15.1
-lv,Latvia,country,,🇱🇻,1.9,38,20221,62,68.3,33.7,.866,83,74.3,3.5,18,100,,3.4,5,8.1,12,29,1,54.9,11.6,44,6.8,17.3,0.8,2.3,30,43.8,8.5,16.4
-ee,Estonia,country,,🇪🇪,1.3,38,28340,43,70.5,32.3,.890,90,77.8,8.5,12,100,,3.5,4.2,6.9,12,33,2,57.1,6.1,38,5.6,19.4,1.8,2.1,32,42.2,8.6,12.8
-ma,Morocco,country,,🇲🇦,37.3,131,3463,446,62.5,39.5,.683,85,75.2,1.8,42,74,,0.7,0.7,5.8,16,59,2,12.9,21.3,10.9,9.4,6.7,0.2,3.8,84,29.5,17,5.6
-tn,Tunisia,country,,🇹🇳,12.1,45,3707,155,69.7,33.7,.732,68,76,2.8,28,86.2,,1.3,1.8,7.5,15.6,23,1,4.5,24.2,11.6,15.3,8.3,0.4,2.6,78,32.5,14.1,6.2
-rw,Rwanda,country,,🇷🇼,13.7,13,975,25,27.8,39.4,.534,32,67.5,0.1,42,78.8,,0.1,0.7,5.9,9.9,3,0,11.3,31.3,79.9,15.1,17.7,0.8,1.3,553,19.5,28.9,6
-sn,Senegal,country,,🇸🇳,17.7,28,1574,193,53.4,36.2,.511,42,67.8,0.6,22,50.4,,0.1,0.3,4,15.6,7,3,41.5,63.7,35.4,2.8,9.7,0.1,1.5,92,19.2,29.5,5.9
-ci,Côte dIvoire,country,,🇨🇮,30.4,71,2333,318,52.8,35.3,.550,28,61.6,0.4,12,50,,0.2,0.4,3.6,12.8,17,2,8.2,49.5,58.2,2.3,5.2,0.1,0.9,96,19.8,32.5,7.8
-lk,Sri Lanka,country,,🇱🇰,22.2,74,3343,62,20,39.8,.782,52,77.3,1.2,42,92.5,,1.1,3.9,4,19.7,16,1,34.1,20,48.8,4.5,49.7,0.1,1.3,359,32.5,12.4,8.1
-mm,Myanmar,country,,🇲🇲,53.8,62,1158,653,30.3,30.7,.585,35,66.5,0.5,175,93.5,,0.7,1.1,4.5,25.6,12,1,42.8,32.3,62.9,3.1,3.5,0,4.2,82,27.8,16.9,9.2
-kh,Cambodia,country,,🇰🇭,17.2,40,2325,177,40.4,36.1,.593,52,70.5,0.5,55,71.9,,0.2,0.8,4.5,27.1,29,4,43.9,24.1,52.4,0.2,5.3,0.1,1.5,97,26.5,21.3,6.3
-np,Nepal,country,,🇳🇵,29.7,41,1386,143,66.3,30,.602,42,70.1,0.5,32,68,,1,0.5,6.5,4.8,3,0,41.6,45.7,73.7,10.7,7.7,0.2,1.2,207,24.2,19.6,6.9
+ae,UAE,country,,🇦🇪,11,545,49550,71,85.5,32.5,0.937,99,82.9,20.8,82,98.3,,2.9,1.9,4.6,8.5,522,23,4.5,36.3,1,2.9,2.3,1.5,3.8,150,31.2,9.3,1.2
+qa,Qatar,country,,🇶🇦,3.1,221,71568,11,99.2,41.1,0.875,99,82.4,32.5,15,97,,3,1.2,2.2,9.3,162,0,0,75.7,0,0.1,1,0.7,6.5,257,33.2,10.1,0.9
+kw,Kuwait,country,,🇰🇼,5,162,32290,18,100,39.5,0.847,98,80.4,25.2,12,96.5,,2.3,2.3,4.2,7.9,111,1,0.4,53.7,0.1,2.1,3,0.1,4.5,272,34.5,10.8,1.8
+jo,Jordan,country,,🇯🇴,11.4,53,4682,89,92.4,33.7,0.736,67,77.8,2.5,32,94.8,,2.9,1.4,7.7,17.1,21,1,1.1,28.8,11.5,22,2.1,0.3,4.8,129,24.3,20.9,3.2
+bg,Bulgaria,country,,🇧🇬,6.4,108,17069,109,73.5,38.2,0.799,79,75.6,5.8,55,98,,4.3,8,7.6,15.2,63,5,36.1,17.1,20.4,4.3,2.8,0.8,1.6,63,44.3,8.8,18.4
+hr,Croatia,country,,🇭🇷,3.8,90,23380,56,57,30,0.878,82,78.6,4.2,28,99,,3.9,5.8,7.3,12.3,42,4,34.7,16.1,34.1,5.6,4,1.4,1.8,70,44.8,8.8,14.8
+rs,Serbia,country,,🇷🇸,6.6,83,12514,84,61.9,32.8,0.805,78,76.8,5.5,52,99.3,,3.1,5.8,8.6,14.8,41,5,32.4,22.5,27.2,9.1,4.5,1,2.2,88,43.9,9.3,16.3
+lt,Lithuania,country,,🇱🇹,2.9,83,28713,63,68.3,36.6,0.879,85,76,4.2,22,100,,4.5,5.7,7.2,16.4,62,2,35.2,9.2,33.2,7.3,0.9,1.1,2.4,46,42.1,7.8,15.1
+lv,Latvia,country,,🇱🇻,1.9,46,24223,62,68.3,33.7,0.879,83,76.2,3.5,18,100,,3.4,5,8.1,12,29,1,54.9,11.6,44,6.7,1.4,0.8,2.3,30,43.1,8.5,16.4
+ee,Estonia,country,,🇪🇪,1.4,43,31531,43,70.5,32.3,0.899,90,79.2,8.5,12,100,,3.5,4.2,6.9,12,33,2,57.1,6.1,38,7.5,3.4,1.8,2.1,32,41.9,8.6,12.8
+ma,Morocco,country,,🇲🇦,37.4,157,4204,446,62.5,39.5,0.698,85,75.3,1.8,42,74,,0.7,0.7,5.8,16,59,2,12.9,21.3,10.9,13.4,1.7,0.2,3.8,84,29.2,17,5.6
+tn,Tunisia,country,,🇹🇳,12.3,53,4267,155,69.7,33.7,.732,68,76.5,2.8,28,86.2,,1.3,1.8,7.5,15.6,23,1,4.5,24.2,11.6,16.4,7.1,0.4,2.6,78,32.1,14.1,6.2
+rw,Rwanda,country,,🇷🇼,13.9,14,986,25,27.8,39.4,0.548,32,67.8,0.1,42,78.8,,0.1,0.7,5.9,9.9,3,0,11.3,31.3,79.9,15.1,4.9,0.8,1.3,576,19.4,28.9,6
+sn,Senegal,country,,🇸🇳,18.7,34,1805,193,53.4,36.2,0.517,42,68.7,0.6,22,50.4,,0.1,0.3,4,15.6,7,3,41.5,63.7,35.4,2.8,1.5,0.1,1.5,94,19.1,29.5,5.9
+ci,Côte dIvoire,country,,🇨🇮,32,87,2720,318,52.8,35.3,0.534,28,61.9,0.4,12,50,,0.2,0.4,3.6,12.8,17,2,8.2,49.5,58.2,2.3,3.8,0.1,0.9,98,18.1,32.5,7.8
+lk,Sri Lanka,country,,🇱🇰,22.4,75,3330,62,20,39.8,0.78,52,77.5,1.2,42,92.5,,1.1,3.9,4,19.7,16,1,34.1,20,48.8,5.2,45.2,0.1,1.3,366,32.8,12.4,8.1
+mm,Myanmar,country,,🇲🇲,54.5,64,1179,653,30.3,30.7,0.608,35,66.9,0.5,175,93.5,,0.7,1.1,4.5,25.6,12,1,42.8,32.3,62.9,3.1,22,0,4.2,83,29.5,16.9,9.2
+kh,Cambodia,country,,🇰🇭,17.2,47,2744,177,40.4,36.1,0.6,52,70.7,0.5,55,71.9,,0.2,0.8,4.5,27.1,29,4,43.9,24.1,52.4,0.2,0.7,0.1,1.5,96,25.8,21.3,6.3
+np,Nepal,country,,🇳🇵,31.6,44,1381,143,66.3,30,0.601,42,70.4,0.5,32,68,,1,0.5,6.5,4.8,3,0,41.6,45.7,73.7,10.7,5.6,0.2,1.2,202,24.7,19.6,6.9
 cn-sz,Shenzhen,city,cn,🇨🇳,18,520,29012,2,100,37.8,.882,95,81.5,8.2,15,99,,3.5,4.2,7.5,38.5,285,18,39.5,22.5,8.0,5.8,2.5,5.5,,8667,33.5,8.8,2.2
 cn-gz2,Guangzhou,city,cn,🇨🇳,19,460,24211,7,86,35.5,.868,90,81.2,6.8,82,99,,3.2,4.5,7.2,28.5,95,12,43.5,28.5,10.0,4.5,2.8,3.2,,2714,33.2,9.5,4.5
 cn-su,Suzhou,city,cn,🇨🇳,13,370,28462,8,80,32.5,.858,85,82.0,9.5,28,99,,3.0,4.2,6.5,42.5,185,15,32.5,38.2,12.0,3.2,1.5,3.5,,1531,40.5,7.2,5.5
@@ -508,7 +508,11 @@ cn-lj2,Lijiang,city,cn,🇨🇳,1,8,8000,21,42,33.5,.712,55,75.5,2.8,1,88,,1.5,4
 cn-bs,Baoshan,city,cn,🇨🇳,3,15,5000,20,38,33.8,.698,48,74.8,3.2,2,88,,1.5,4.8,5.0,8.5,2,0,65.5,22.5,72.0,4.2,0.8,0.5,,150,33.5,13.5,6.5
 `.trim();
 
-// Parse data
+import { MANIFEST, CORE, hydrateRegions } from './regions.js';
+
+// Parse data (reference mapping: pipeline/build_regions.py runs RAW through
+// this at build time and writes ./regions.js, so the browser never does).
+// Nothing below references RAW or parseData, so the bundler drops both.
 function parseData(raw) {
   const lines = raw.split('\n').filter(l => l.trim());
   return lines.map(line => {
@@ -549,7 +553,55 @@ function parseData(raw) {
   });
 }
 
-export const REGIONS = parseData(RAW);
+// REGIONS come from the precompiled columns (npm prebuild/predev step; the
+// dev server rebuilds them when this file changes). REGIONS starts as the
+// core bundle (countries); subnational regions are split into one shard per
+// parent country (./shards/<parent>.js) and merged in, in RAW order, by
+// loadShards(). With every shard loaded REGIONS is the same array
+// parseData(RAW) would give.
+export const REGIONS = hydrateRegions(CORE);
+export { MANIFEST };
+
+const SHARD_MODULES = import.meta.glob('./shards/*.js');
+const REGION_POSITIONS = [...CORE.positions];
+const SHARD_LOADS = {};
+const SHARDS_MERGED = new Set();
+
+function mergeShard(positions, regions) {
+  const rows = REGION_POSITIONS.map((at, i) => [at, REGIONS[i]]);
+  positions.forEach((at, i) => rows.push([at, regions[i]]));
+  rows.sort((a, b) => a[0] - b[0]);
+  REGIONS.length = 0;
+  REGION_POSITIONS.length = 0;
+  for (const [at, region] of rows) {
+    REGION_POSITIONS.push(at);
+    REGIONS.push(region);
+  }
+}
+
+// Load the shards of the given parent countries (default: all) into
+// REGIONS. Resolves once they are merged; each shard is fetched once.
+export function loadShards(parents = Object.keys(MANIFEST.shards)) {
+  return Promise.all(parents.filter(p => MANIFEST.shards[p]).map(p => {
+    SHARD_LOADS[p] ||= SHARD_MODULES[`./shards/${p}.js`]()
+      .then(({ default: part }) => {
+        mergeShard(part.positions, hydrateRegions(part));
+        SHARDS_MERGED.add(p);
+      });
+    return SHARD_LOADS[p];
+  }));
+}
+
+// Shards holding the given region ids: a subnational id is <parent>-<code>
+// (pipeline/build_regions.py enforces it); countries need none
+export function shardsFor(ids) {
+  const parents = ids.filter(id => id.includes('-')).map(id => id.slice(0, id.indexOf('-')));
+  return [...new Set(parents)].filter(p => MANIFEST.shards[p]);
+}
+
+export function shardsLoaded(parents = Object.keys(MANIFEST.shards)) {
+  return parents.every(p => !MANIFEST.shards[p] || SHARDS_MERGED.has(p));
+}
 
 // Indicator metadata
 export const INDICATORS = {
@@ -573,8 +625,8 @@ export const INDICATORS = {
   exports: { year: '2022', label: 'Exports', unit: 'M USD', color: '#ca8a04', format: v => v ? '$'+(v/1e3).toFixed(0)+'B' : 'N/A', category: 'economic' },
   fdiInflow: { year: '2022', label: 'FDI Inflow', unit: 'M USD', color: '#a16207', format: v => v ? '$'+(v/1e3).toFixed(1)+'B' : 'N/A', category: 'economic' },
   forestCoverage: { year: '2022', label: 'Forest %', unit: '%', color: '#166534', format: v => v ? v.toFixed(1)+'%' : 'N/A', category: 'environment' },
-  airQualityPM25: { label: 'PM2.5', unit: 'μg/m³', color: '#78716c', format: v => v?.toFixed(1) || 'N/A', category: 'environment' },
-  renewableEnergy: { year: '2022', label: 'Renewable %', unit: '%', color: '#059669', format: v => v ? v.toFixed(0)+'%' : 'N/A', category: 'environment' },
+  airQualityPM25: { year: '2020', label: 'PM2.5', unit: 'μg/m³', color: '#78716c', format: v => v?.toFixed(1) || 'N/A', category: 'environment' },
+  renewableEnergy: { year: '2021', label: 'Renewable %', unit: '%', color: '#059669', format: v => v ? v.toFixed(0)+'%' : 'N/A', category: 'environment' },
   unemployment: { year: '2024', label: 'Unemployment %', unit: '%', color: '#dc2626', format: v => v ? v.toFixed(1)+'%' : 'N/A', category: 'economic' },
   inflation: { year: '2024', label: 'Inflation %', unit: '%', color: '#b91c1c', format: v => v ? v.toFixed(1)+'%' : 'N/A', category: 'economic' },
   rdExpenditure: { year: '2022', label: 'R&D % GDP', unit: '%', color: '#7c3aed', format: v => v ? v.toFixed(1)+'%' : 'N/A', category: 'economic' },
@@ -583,14 +635,6 @@ export const INDICATORS = {
   medianAge: { year: '2023', label: 'Median Age', unit: 'yrs', color: '#9333ea', format: v => v ? v.toFixed(1)+' yrs' : 'N/A', category: 'demographic' },
   birthRate: { year: '2022', label: 'Birth Rate', unit: '‰', color: '#2563eb', format: v => v ? v.toFixed(1)+'‰' : 'N/A', category: 'demographic' },
   deathRate: { year: '2022', label: 'Death Rate', unit: '‰', color: '#475569', format: v => v ? v.toFixed(1)+'‰' : 'N/A', category: 'demographic' },
-  unemployment: { label: 'Unemployment %', unit: '%', color: '#dc2626', format: v => v ? v.toFixed(1)+'%' : 'N/A', category: 'economic' },
-  inflation: { label: 'Inflation %', unit: '%', color: '#b91c1c', format: v => v ? v.toFixed(1)+'%' : 'N/A', category: 'economic' },
-  rdExpenditure: { label: 'R&D % GDP', unit: '%', color: '#7c3aed', format: v => v ? v.toFixed(1)+'%' : 'N/A', category: 'economic' },
-  militarySpending: { label: 'Military % GDP', unit: '%', color: '#374151', format: v => v ? v.toFixed(1)+'%' : 'N/A', category: 'economic' },
-  populationDensity: { label: 'Pop. Density', unit: '/km²', color: '#d97706', format: v => v ? v.toLocaleString()+'/km²' : 'N/A', category: 'basic' },
-  medianAge: { label: 'Median Age', unit: 'yrs', color: '#9333ea', format: v => v ? v.toFixed(1)+' yrs' : 'N/A', category: 'demographic' },
-  birthRate: { label: 'Birth Rate', unit: '‰', color: '#2563eb', format: v => v ? v.toFixed(1)+'‰' : 'N/A', category: 'demographic' },
-  deathRate: { label: 'Death Rate', unit: '‰', color: '#475569', format: v => v ? v.toFixed(1)+'‰' : 'N/A', category: 'demographic' },
 };
 
 export const INDICATOR_KEYS = Object.keys(INDICATORS);
@@ -0,0 +1,166 @@
+// KD-tree nearest-match queries for custom weights.
+// Layout comes from pipeline/match_tree.py (one tree per missing-value
+// pattern); node boxes are built here on first use, in the same normalised
+// space computeSimilarity scores in. Per-query weights rescale the axes.
+
+function nodeBoxes(perm, coords, dims, leafSize) {
+  const nodes = [];
+  (function build(lo, hi) {
+    const node = { lo, hi, right: -1, min: null, max: null };
+    nodes.push(node);
+    const K = coords.length;
+    node.min = new Float64Array(K);
+    node.max = new Float64Array(K);
+    if (hi - lo > leafSize) {
+      const left = nodes.length;
+      const mid = (lo + hi) >> 1;
+      build(lo, mid);
+      node.right = nodes.length;
+      build(mid, hi);
+      const a = nodes[left], b = nodes[node.right];
+      for (const d of dims) {
+        node.min[d] = Math.min(a.min[d], b.min[d]);
+        node.max[d] = Math.max(a.max[d], b.max[d]);
+      }
+    } else {
+      for (const d of dims) {
+        let mn = Infinity, mx = -Infinity;
+        for (let j = lo; j < hi; j++) {
+          const v = coords[d][perm[j]];
+          if (v < mn) mn = v;
+          if (v > mx) mx = v;
+        }
+        node.min[d] = mn;
+        node.max[d] = mx;
+      }
+    }
+  })(0, perm.length);
+  return nodes;
+}
+
+export function createSpatialIndex(tree, regions, normParams) {
+  const { keys, groups, leafSize } = tree;
+  const coords = keys.map(key => {
+    const { min, max } = normParams[key];
+    const col = new Float64Array(regions.length);
+    for (let i = 0; i < regions.length; i++) {
+      const v = regions[i][key];
+      col[i] = v == null || isNaN(v) ? NaN : max === min ? 0.5 : (v - min) / (max - min);
+    }
+    return col;
+  });
+  const trees = groups.map(({ missing, perm }) => {
+    const present = keys.map((_, d) => !missing.includes(d));
+    const dims = keys.map((_, d) => d).filter(d => present[d]);
+    return { present, perm, nodes: nodeBoxes(perm, coords, dims, leafSize) };
+  });
+  return { keys, coords, trees };
+}
+
+// Upper bound on a node's scores (tenths, like Math.round(x * 1000)):
+// 1 - Σ w·(distance from the source to the box) / Σ w over shared indicators
+function bound(node, q, active, w, totalW) {
+  if (!totalW) return 0;
+  let d = 0;
+  for (const k of active) {
+    const v = q[k];
+    const gap = v < node.min[k] ? node.min[k] - v : v > node.max[k] ? v - node.max[k] : 0;
+    d += w[k] * gap;
+  }
+  return Math.round((1 - d / totalW + 1e-9) * 1000);
+}
+
+// computeSimilarity from the normalised columns: same terms, same order
+// (keys follow INDICATOR_KEYS), so the same floats
+function similarity(coords, q, w, active, i) {
+  let totalScore = 0, totalWeight = 0;
+  for (const k of active) {
+    const t = coords[k][i];
+    if (t !== t) continue; // missing
+    totalScore += w[k] * (1 - Math.abs(q[k] - t));
+    totalWeight += w[k];
+  }
+  if (totalWeight === 0) return 0;
+  return Math.round((totalScore / totalWeight) * 1000) / 10;
+}
+
+// Top `limit` regions by computeSimilarity(REGIONS[sourceIdx], ·, weights),
+// best first, ties in REGIONS order, skipping exclude(i). Same result as
+// scoring every region and sorting.
+export function nearest(index, sourceIdx, weights, limit, exclude) {
+  if (limit <= 0) return [];
+  const { keys, coords, trees } = index;
+  const q = coords.map(col => col[sourceIdx]);
+  const w = keys.map(key => weights[key] || 0);
+  const sourceActive = keys.map((_, k) => k).filter(k => w[k] > 0 && !isNaN(q[k]));
+
+  // Best-first over every tree's nodes, by score bound
+  const queue = [];
+  const push = item => {
+    queue.push(item);
+    let i = queue.length - 1;
+    while (i > 0) {
+      const p = (i - 1) >> 1;
+      if (queue[p].ub >= item.ub) break;
+      queue[i] = queue[p];
+      i = p;
+    }
+    queue[i] = item;
+  };
+  const pop = () => {
+    const top = queue[0], last = queue.pop();
+    if (queue.length) {
+      let i = 0;
+      for (;;) {
+        const l = 2 * i + 1, r = l + 1;
+        let c = l;
+        if (l >= queue.length) break;
+        if (r < queue.length && queue[r].ub > queue[l].ub) c = r;
+        if (queue[c].ub <= last.ub) break;
+        queue[i] = queue[c];
+        i = c;
+      }
+      queue[i] = last;
+    }
+    return top;
+  };
+
+  for (const tree of trees) {
+    const active = [];
+    let totalW = 0;
+    for (let k = 0; k < keys.length; k++) {
+      if (w[k] > 0 && tree.present[k] && !isNaN(q[k])) {
+        active.push(k);
+        totalW += w[k];
+      }
+    }
+    const ctx = { tree, active, totalW };
+    push({ ub: bound(tree.nodes[0], q, active, w, totalW), ctx, node: 0 });
+  }
+
+  const results = []; // { i, score }, best first
+  const worse = (a, b) => a.score < b.score || (a.score === b.score && a.i > b.i);
+  while (queue.length) {
+    const { ub, ctx, node: id } = pop();
+    const { tree, active, totalW } = ctx;
+    if (results.length === limit && ub / 10 < results[limit - 1].score) break;
+    const node = tree.nodes[id];
+    if (node.right < 0) {
+      for (let j = node.lo; j < node.hi; j++) {
+        const i = tree.perm[j];
+        if (exclude(i)) continue;
+        const item = { i, score: similarity(coords, q, w, sourceActive, i) };
+        if (results.length === limit && !worse(results[limit - 1], item)) continue;
+        let pos = results.length;
+        while (pos > 0 && worse(results[pos - 1], item)) pos--;
+        results.splice(pos, 0, item);
+        if (results.length > limit) results.pop();
+      }
+    } else {
+      for (const child of [id + 1, node.right]) {
+        push({ ub: bound(tree.nodes[child], q, active, w, totalW), ctx, node: child });
+      }
+    }
+  }
+  return results;
+}
@@ -0,0 +1,4 @@
+// Generated by pipeline/match_index.py from data.js. Do not edit.
+export const COUNT = 502;
+export const K = 20;
+export const TOP = JSON.parse('{"economic":{"us":[108,619,157,612,156,609,27,604,116,603,3,595,146,595,283,594,342,594,110,593,150,584,133,579,124,578,109,577,111,576,137,576,154,574,141,573,149,573,130,572],"cn":[6,692,92,642,12,635,88,635,95,629,2,627,22,627,14,626,30,626,223,626,91,623,168,623,76,622,207,621,28,619,44,618,85,618,90,618,221,618,78,614],"jp":[10,943,8,942,207,939,13,928,192,924,276,923,335,923,19,918,39,916,185,915,5,913,191,911,74,910,167,910,187,909,188,909,3,908,193,908,159,907,176,907],"de":[154,935,4,929,5,913,2,908,9,907,8,900,20,894,23,892,155,887,181,886,202,884,207,884,171,883,212,883,21,882,36,880,159,880,239,880,158,879,211,878],"gb":[5,976,9,962,154,958,202,951,155,940,45,939,282,939,341,939,3,929,239,926,8,925,11,921,13,919,169,919,218,918,20,916,215,916,216,915,272,914,331,914],"fr":[4,976,154,965,9,963,202,959,155,958,239,949,45,941,282,941,341,941,8,939,13,932,169,925,37,918,206,916,222,916,20,915,209,914,2,913,3,913,210,913],"in":[48,846,227,846,14,837,32,836,44,834,221,834,243,831,302,831,249,825,308,825,67,824,246,824,305,824,254,822,313,822,250,821,309,821,43,820,31,819,162,819],"br":[47,941,225,941,266,938,325,938,260,935,319,935,263,930,322,930,257,927,316,927,12,926,69,926,236,926,262,925,321,925,34,922,164,922,264,922,323,922,17,920],"it":[13,966,154,949,202,948,240,947,10,946,182,944,9,943,167,943,2,942,5,939,239,939,159,938,193,938,207,935,191,932,197,932,206,930,222,930,172,929,219,929],"ca":[154,978,5,963,4,962,45,960,202,960,282,960,341,960,155,955,20,951,21,949,212,946,216,946,239,946,8,943,211,943,218,943,169,942,11,941,13,939,171,939],"kr":[273,950,332,950,8,946,2,943,366,940,13,939,190,937,74,935,207,934,192,933,166,932,83,930,364,930,405,929,179,928,191,928,377,928,175,927,361,927,167,925],"au":[157,971,213,958,112,957,269,957,328,957,165,954,268,951,271,951,327,951,330,951,156,950,211,950,220,950,131,948,217,948,241,947,61,946,237,944,9,941,214,940],"mx":[17,975,28,956,164,951,278,949,337,949,261,944,280,944,320,944,339,944,33,942,277,941,336,941,258,940,317,940,259,939,318,939,44,936,221,936,92,935,88,932],"es":[240,967,8,966,206,964,222,958,189,955,194,952,184,950,239,950,73,949,202,949,205,948,57,945,154,945,183,945,193,945,197,945,291,945,350,945,482,945,38,942],"id":[161,968,29,958,253,958,312,958,58,957,30,956,162,951,245,951,304,951,96,950,285,950,344,950,49,947,228,947,248,947,307,947,488,947,163,946,443,946,490,946],"nl":[237,975,35,952,61,950,21,949,157,945,241,943,220,939,268,938,327,938,271,937,330,937,213,934,11,933,211,933,9,932,170,929,214,928,141,927,269,927,328,927],"sa":[60,951,38,942,73,942,55,940,127,940,289,940,348,940,284,939,343,939,71,938,233,938,222,937,240,937,13,936,164,936,187,935,188,935,74,933,193,933,17,931],"tr":[12,975,28,968,164,967,278,965,337,965,261,963,320,963,258,958,259,958,317,958,318,958,280,957,339,957,33,952,277,952,336,952,257,946,316,946,363,946,264,945],"ch":[270,925,329,925,150,923,26,919,124,909,27,899,135,896,24,895,116,895,137,894,108,893,110,888,126,886,130,886,170,886,118,885,152,884,214,882,140,879,35,876],"pl":[42,973,207,972,478,963,238,962,275,962,334,962,51,960,53,957,287,957,346,957,39,955,40,955,223,954,200,953,276,950,335,950,386,949,185,948,187,948,188,947],"se":[212,982,23,981,211,975,171,974,21,969,36,967,154,966,25,963,35,960,216,959,181,958,45,957,282,957,341,957,115,954,104,952,9,951,169,950,272,950,331,950],"be":[20,969,36,969,212,966,171,963,23,962,154,958,211,958,218,957,45,955,282,955,341,955,237,954,35,952,25,950,9,949,15,949,216,949,219,949,155,948,158,945],"th":[30,978,95,978,91,976,444,974,76,973,80,973,85,973,58,970,436,970,78,969,81,969,93,969,299,968,358,968,385,968,163,967,412,967,415,967,77,966,423,966],"at":[20,981,171,978,36,975,212,975,181,971,211,968,21,962,125,962,158,960,159,960,35,959,120,957,208,956,143,954,104,953,138,953,25,952,145,952,118,951,152,951],"no":[137,947,165,939,109,935,214,934,111,932,217,932,170,931,61,929,220,929,110,928,124,927,150,927,105,926,269,926,328,926,157,923,35,922,123,922,213,922,268,922],"il":[115,979,104,974,107,974,212,972,139,970,143,969,148,968,120,967,128,967,211,967,37,966,151,964,171,964,216,964,20,963,121,962,122,962,45,958,106,958,134,958],"ie":[18,919,160,860,208,859,150,857,24,852,27,852,270,851,329,851,124,844,170,843,117,838,158,838,35,833,137,831,110,825,116,825,23,824,214,824,108,823,130,823],"sg":[110,921,116,908,150,905,18,899,124,899,140,894,61,891,146,891,283,890,342,890,126,888,136,888,109,887,137,887,111,886,133,886,152,886,130,885,108,884,138,882],"my":[280,980,339,980,278,976,337,976,33,971,261,970,320,970,17,968,99,968,363,967,383,963,277,962,336,962,76,960,397,960,437,960,30,959,435,959,93,958,164,958],"ph":[66,986,292,986,351,986,161,985,297,976,356,976,253,975,312,975,162,971,285,970,344,970,33,969,58,969,245,968,248,968,295,968,304,968,307,968,354,968,246,967],"vn":[22,978,58,978,245,977,304,977,163,972,299,969,358,969,161,968,444,968,95,967,412,962,93,961,253,960,312,960,28,959,29,959,423,959,49,958,228,958,298,958],"ng":[243,988,302,988,247,983,306,983,251,981,310,981,244,978,303,978,250,971,309,971,255,970,314,970,48,969,227,969,501,969,246,968,254,968,305,968,313,968,63,967],"eg":[252,980,311,980,48,976,227,976,246,976,248,976,305,976,307,976,162,972,293,972,352,972,249,971,308,971,161,970,67,969,285,969,344,969,49,968,82,968,100,968],"ar":[259,976,318,976,257,974,316,974,50,973,164,973,226,973,264,973,323,973,52,972,286,972,345,972,28,971,97,971,66,970,292,970,351,970,29,969,280,968,339,968],"za":[47,968,225,968,260,948,263,948,319,948,322,948,266,945,325,945,69,944,236,944,265,939,324,939,262,938,321,938,68,935,279,935,338,935,50,932,226,932,64,930],"dk":[61,976,170,972,241,968,220,967,268,967,327,967,213,962,271,962,330,962,237,961,20,960,211,960,23,959,214,959,147,957,269,957,328,957,118,955,212,954,119,953],"fi":[171,990,212,981,181,976,23,975,21,969,20,967,218,967,104,963,158,962,172,962,219,961,216,960,120,959,143,959,173,958,159,957,25,956,182,956,154,952,169,952],"nz":[197,980,169,979,151,977,155,977,203,975,216,971,210,970,239,970,139,969,209,969,215,969,45,968,194,968,282,968,341,968,189,967,25,966,206,966,115,964,222,963],"pt":[73,988,199,982,55,981,289,981,348,981,204,980,223,979,274,979,333,979,57,977,187,977,240,977,291,977,350,977,56,974,60,974,184,974,290,974,349,974,41,972],"cz":[54,980,176,977,207,975,180,974,51,973,276,973,335,973,185,972,192,970,188,966,275,966,334,966,173,965,186,965,200,965,172,962,175,961,42,960,187,960,191,958],"ro":[53,976,287,976,346,976,478,976,42,975,223,975,56,974,290,974,349,974,394,974,41,973,199,973,288,973,347,973,198,972,103,971,238,971,187,970,52,969,274,969],"gr":[198,988,56,987,290,987,349,987,195,982,223,980,53,978,287,978,346,978,199,977,238,975,274,974,333,974,40,973,60,973,196,973,38,972,70,972,234,972,57,970],"hu":[478,986,275,983,334,983,53,979,287,979,346,979,200,977,238,977,40,975,207,975,187,974,19,973,51,973,188,973,56,971,274,971,276,971,290,971,333,971,335,971],"ua":[67,984,476,977,475,976,461,971,450,969,479,969,501,969,477,968,59,967,300,967,359,967,466,967,487,966,449,965,480,963,247,962,251,962,255,962,306,962,310,962],"ru":[394,942,223,941,40,940,288,939,347,939,97,937,462,937,12,936,103,936,388,935,392,935,390,933,389,932,52,931,286,931,345,931,442,931,162,930,381,930,496,930],"ae":[155,984,169,977,239,970,37,968,215,968,218,965,197,964,216,964,203,963,154,961,202,961,9,960,272,959,331,959,25,958,151,958,210,958,212,958,20,957,21,955],"cl":[168,986,256,972,315,972,70,970,234,970,257,969,316,969,259,967,318,967,71,966,233,966,264,966,323,966,281,965,340,965,50,964,52,964,226,964,286,964,345,964],"co":[260,978,319,978,263,975,322,975,34,968,262,968,266,968,321,968,325,968,265,965,324,965,69,961,236,961,68,958,50,955,226,955,256,953,315,953,64,951,231,951],"pk":[243,981,302,981,32,976,246,975,305,975,254,971,313,971,249,970,308,970,31,969,252,969,311,969,251,968,310,968,162,967,250,966,309,966,49,965,228,965,244,964],"bd":[163,979,58,976,245,973,304,973,414,973,298,972,357,972,93,971,161,969,32,968,447,968,454,968,485,967,48,965,100,965,227,965,252,965,311,965,412,965,423,965],"pe":[69,977,236,977,66,976,292,976,351,976,442,976,257,974,316,974,33,973,64,972,231,972,68,971,431,971,296,970,355,970,496,970,162,968,168,968,294,968,353,968],"sk":[275,976,334,976,39,973,42,973,54,972,180,970,200,968,238,964,276,964,335,964,478,964,187,963,188,962,207,962,53,961,176,961,185,961,287,961,346,961,19,960],"bg":[259,974,288,974,318,974,347,974,33,972,388,972,71,971,233,971,264,970,323,970,392,970,40,969,389,969,103,968,390,968,394,968,55,967,257,967,289,967,316,967],"hr":[238,991,56,987,290,987,349,987,274,986,333,986,478,983,223,982,199,981,42,979,204,979,41,978,183,977,40,976,198,976,200,976,57,975,291,975,350,975,275,973],"si":[176,989,39,980,185,979,192,977,180,976,186,973,51,972,173,972,175,971,276,971,335,971,191,966,179,964,201,964,177,963,172,962,193,962,275,962,334,962,188,961],"lt":[187,982,38,981,200,978,199,976,73,973,188,973,274,973,333,973,204,972,275,972,276,972,334,972,335,972,223,970,478,970,56,969,57,969,290,969,291,969,349,969],"lv":[223,990,41,987,53,987,287,987,346,987,199,985,274,983,333,983,238,982,478,982,57,981,198,981,291,981,350,981,204,980,195,979,38,974,40,974,70,974,187,974],"ee":[204,993,184,992,183,989,199,989,274,988,333,988,205,987,188,985,187,984,482,982,56,981,60,981,290,981,349,981,178,979,200,979,193,978,38,977,238,977,189,976],"ir":[245,990,304,990,163,988,93,980,423,979,30,978,161,978,49,976,228,976,253,976,312,976,414,975,493,975,424,974,435,973,437,972,444,972,96,971,285,971,344,971],"iq":[498,982,499,981,477,976,300,975,359,975,62,972,229,972,479,972,500,972,395,970,466,970,476,970,43,967,67,967,475,966,480,966,255,965,314,965,461,962,242,961],"kw":[178,992,206,989,189,987,184,982,194,982,57,981,183,981,205,981,291,981,350,981,222,980,204,976,73,975,203,975,210,975,38,974,188,974,41,973,274,972,333,972],"qa":[147,988,268,987,327,987,144,985,214,985,269,983,328,983,113,982,132,982,141,982,271,981,330,981,213,979,217,979,220,979,241,979,237,978,153,977,157,977,35,976],"et":[300,988,359,988,251,984,310,984,255,982,314,982,480,981,479,980,247,977,306,977,59,972,466,971,498,971,499,970,475,969,244,968,303,968,500,967,63,966,230,966],"ke":[65,988,232,988,242,986,301,986,247,984,306,984,294,982,353,982,244,980,255,980,303,980,314,980,296,976,355,976,450,976,501,976,250,974,309,974,480,974,461,973],"gh":[68,990,69,979,236,979,294,979,353,979,65,978,232,978,296,973,355,973,50,972,63,972,226,972,230,972,279,972,338,972,66,970,244,970,292,970,303,970,351,970],"tz":[63,988,230,988,294,987,353,987,64,978,231,978,247,978,306,978,242,974,301,974,244,973,303,973,68,972,255,972,314,972,251,970,310,970,296,967,355,967,450,967],"ma":[29,986,297,983,356,983,253,981,295,981,312,981,354,981,248,980,293,980,307,980,352,980,285,977,344,977,50,976,162,976,226,976,279,976,338,976,296,975,355,975],"dz":[43,984,476,979,475,977,487,977,461,972,249,971,308,971,463,971,450,970,471,970,32,969,250,969,309,969,501,969,431,968,496,968,59,967,244,967,254,967,303,967],"ve":[64,990,231,990,69,985,236,985,279,978,338,978,263,975,265,975,322,975,324,975,260,973,294,973,319,973,353,973,65,972,232,972,50,971,226,971,257,971,262,971],"ec":[279,989,338,989,68,985,257,981,316,981,64,979,231,979,264,979,266,979,323,979,325,979,50,977,226,977,263,977,265,977,322,977,324,977,260,975,319,975,262,972],"uy":[195,979,56,974,223,974,290,974,349,974,41,972,198,971,46,970,224,970,196,968,53,966,284,966,287,966,343,966,346,966,52,965,60,965,73,965,286,965,345,965],"cr":[264,981,323,981,257,977,259,977,316,977,318,977,258,976,317,976,256,973,315,973,52,971,266,971,286,971,325,971,345,971,69,967,236,967,46,966,164,966,224,966],"pa":[256,982,315,982,267,967,326,967,71,965,233,965,262,965,321,965,281,963,340,963,265,961,324,961,46,959,224,959,60,957,196,957,266,957,325,957,260,955,263,955],"cn-bj":[38,988,204,976,57,975,60,975,291,975,350,975,55,973,184,973,199,973,289,973,348,973,274,971,333,971,187,970,41,969,56,969,183,969,240,969,284,969,290,969],"cn-sh":[364,966,55,965,289,965,348,965,361,965,366,965,405,962,38,957,207,957,377,956,73,954,192,954,365,952,373,952,28,950,187,950,273,950,276,950,332,950,335,950],"cn-tj":[365,992,370,992,470,992,371,991,384,988,376,987,421,986,76,985,373,985,372,983,377,982,379,982,409,982,422,982,429,982,457,982,374,981,364,980,361,979,401,976],"cn-cq":[371,988,421,986,75,985,80,984,90,984,91,984,409,984,422,984,429,984,85,982,363,980,365,980,470,980,379,979,415,979,457,979,458,978,78,977,88,977,95,977],"cn-he":[87,988,89,988,411,985,382,981,80,979,85,979,418,979,426,978,445,978,430,977,91,976,406,976,90,975,385,975,416,973,448,973,415,972,436,972,374,971,81,968],"cn-sx":[81,993,102,992,410,988,458,988,80,987,85,985,385,984,415,984,448,984,412,983,433,983,456,983,484,983,397,982,408,982,95,981,99,981,101,981,383,981,485,981],"cn-nm":[481,990,483,990,397,989,455,989,474,989,363,988,420,988,433,986,99,985,456,985,101,984,383,984,408,984,484,983,454,982,386,981,458,981,447,980,485,980,437,979],"cn-ln":[415,993,85,992,448,991,91,990,385,989,78,987,436,987,429,986,409,985,422,985,76,984,87,982,371,982,421,982,81,981,77,979,90,979,102,979,379,979,457,979],"cn-jl":[410,995,78,993,102,992,385,988,412,988,447,987,458,987,441,986,454,986,485,986,453,985,448,984,473,984,101,983,414,983,415,983,436,983,456,983,484,983,433,982],"cn-hl":[459,995,434,994,100,993,425,993,96,991,427,991,387,990,393,990,440,990,468,990,469,989,486,989,490,988,497,988,467,986,472,986,488,986,491,986,443,985,464,983],"cn-js":[84,970,86,969,92,964,367,959,419,957,368,956,495,951,375,950,428,950,399,948,400,948,88,947,396,947,360,946,432,946,398,945,374,944,417,943,89,942,90,942],"cn-zj":[86,976,83,970,90,970,92,970,374,970,88,968,368,968,401,968,416,965,75,964,89,964,365,964,419,963,370,962,495,961,87,960,400,960,406,960,426,959,76,958],"cn-ah":[80,992,91,992,78,985,415,985,385,984,448,984,76,982,87,982,90,981,95,981,429,981,409,980,422,980,77,979,436,979,81,978,89,977,102,977,371,977,88,976],"cn-fj":[419,981,428,979,396,978,84,976,368,976,375,976,374,975,399,975,367,974,432,974,495,974,401,973,416,970,417,970,83,969,400,968,413,967,90,966,370,966,365,965],"cn-jx":[382,991,77,988,418,985,426,985,430,984,89,983,80,982,85,982,406,982,445,982,411,981,416,979,90,978,374,978,91,976,401,976,78,975,385,975,415,975,448,975],"cn-sd":[90,982,91,980,76,977,85,976,80,973,89,973,371,973,95,972,409,972,421,972,422,972,429,972,84,968,75,967,415,966,22,965,379,964,436,964,448,964,457,964],"cn-ha":[77,988,87,983,90,979,91,979,85,977,418,977,80,976,382,976,426,976,445,976,430,975,88,973,95,973,406,972,411,972,415,970,448,969,374,968,385,968,416,968],"cn-hb":[91,985,76,984,88,982,85,981,371,980,80,979,89,979,421,979,87,978,406,978,409,978,422,978,429,978,418,977,430,977,426,976,75,975,77,975,374,975,416,975],"cn-hn":[85,992,80,990,95,986,90,985,76,984,415,984,436,982,448,982,409,981,422,981,88,980,385,980,89,979,371,979,429,979,78,978,421,978,22,976,77,976,87,976],"cn-gd":[84,970,83,964,88,958,89,952,90,952,374,948,416,948,86,947,77,942,87,942,406,942,76,941,91,941,418,941,426,941,430,941,401,940,445,940,495,940,371,939],"cn-gx":[473,990,447,989,485,989,493,989,424,988,453,988,423,987,441,987,454,987,99,986,408,986,414,985,435,985,437,985,484,985,101,984,163,984,383,984,456,984,96,983],"cn-hi":[391,995,449,986,461,986,450,983,462,983,501,983,476,980,475,979,394,977,466,976,431,975,500,975,288,974,347,974,442,974,471,974,198,973,388,973,496,973,103,972],"cn-sc":[91,986,78,981,85,981,22,978,80,978,76,977,81,976,93,975,99,975,435,974,444,974,89,973,90,973,102,973,410,973,437,973,88,972,415,972,363,971,424,971],"cn-gz":[469,994,488,993,491,993,497,993,443,992,467,992,82,991,387,991,427,991,464,990,494,990,490,989,100,988,434,988,459,988,472,988,381,987,440,987,468,987,486,987],"cn-yn":[96,986,103,986,388,985,451,985,465,985,439,984,443,984,446,984,492,984,248,983,307,983,438,983,467,983,489,983,452,982,464,982,491,982,288,981,347,981,387,981],"cn-xz":[395,982,449,972,477,972,196,964,391,962,94,960,198,959,479,958,500,957,394,956,466,956,476,956,59,954,300,954,359,954,53,953,287,953,346,953,392,953,43,952],"cn-sn":[383,991,363,990,397,989,408,987,455,987,93,986,79,985,437,985,420,984,433,983,424,982,435,982,456,982,484,982,78,981,473,981,101,980,483,980,485,979,493,979],"cn-gs":[440,995,468,995,459,994,82,993,434,993,490,993,427,991,425,990,387,989,469,989,488,989,96,988,486,988,497,988,393,986,467,986,472,986,491,986,443,985,414,984],"cn-qh":[456,998,454,997,484,997,433,996,441,995,447,995,453,994,473,994,485,994,408,993,455,993,424,992,397,991,435,991,437,991,414,990,383,988,410,988,493,988,102,987],"cn-nx":[410,994,78,992,81,992,458,991,456,988,101,987,415,986,433,986,484,986,385,985,448,985,454,985,408,984,412,984,455,984,447,983,485,983,397,982,437,982,441,982],"cn-xj":[390,992,288,990,347,990,388,990,446,989,97,986,392,985,462,985,389,984,486,984,472,983,489,983,387,982,439,982,492,982,394,981,451,981,465,981,494,981,82,980],"us-al":[120,992,143,991,107,987,115,979,145,978,139,976,25,974,121,972,125,972,128,972,148,971,171,970,119,968,127,968,212,968,134,965,151,965,136,964,138,964,36,963],"us-ak":[123,978,153,978,111,976,109,975,156,973,130,971,114,970,132,968,133,966,137,966,144,966,149,966,165,964,217,963,126,962,131,956,147,956,269,956,328,956,214,954],"us-az":[122,986,128,986,142,985,139,983,121,980,148,980,131,976,145,974,113,973,134,973,151,972,115,971,129,969,283,966,342,966,147,964,61,963,104,963,125,963,216,962],"us-ar":[104,987,143,984,120,980,151,978,115,976,139,976,127,975,25,974,145,969,121,967,148,967,128,966,134,965,119,962,212,961,37,960,106,959,122,959,125,959,171,959],"us-ca":[124,944,150,944,135,937,110,925,116,923,146,904,133,898,109,896,111,895,137,895,18,893,141,892,149,892,126,891,130,891,283,891,342,891,270,890,329,890,113,888],"us-co":[111,989,133,980,149,980,123,979,105,975,137,972,116,969,130,968,126,967,153,967,132,966,165,964,110,963,144,961,269,959,328,959,131,958,141,957,214,957,283,957],"us-ct":[116,970,124,969,137,966,111,964,150,964,109,963,133,957,130,956,149,956,132,954,126,953,61,950,113,949,144,949,283,949,342,949,123,948,147,944,141,943,105,942],"us-de":[109,989,123,978,105,976,133,976,137,972,149,972,116,967,153,967,110,964,130,964,132,962,131,961,165,959,144,958,283,958,342,958,126,957,217,956,61,953,114,952],"us-fl":[131,975,113,972,123,969,114,967,153,967,141,965,133,964,283,962,342,962,149,961,269,961,328,961,157,960,142,959,213,959,61,958,11,957,106,957,147,956,165,956],"us-ga":[141,984,61,982,283,982,342,982,147,980,106,973,149,973,112,972,142,972,131,971,128,970,132,970,133,970,144,969,121,968,268,968,327,968,138,967,145,967,119,965],"us-hi":[153,980,131,978,105,970,142,969,112,967,156,967,123,966,129,966,147,964,213,963,269,963,328,963,217,961,271,961,330,961,122,960,113,959,220,959,61,958,132,958],"us-id":[148,990,122,983,128,982,139,981,25,979,104,979,216,978,107,976,129,976,120,974,151,973,134,972,106,971,121,970,143,970,142,969,119,967,212,966,147,965,37,964],"us-il":[110,970,109,969,126,968,111,967,130,967,133,967,150,966,141,965,149,965,132,959,113,958,137,956,124,955,283,955,342,955,123,954,144,952,147,951,61,950,146,946],"us-in":[136,970,140,969,152,968,138,965,125,963,118,960,119,960,145,958,208,955,120,947,128,944,158,943,143,942,121,941,104,940,147,940,141,937,113,935,122,935,142,935],"us-ia":[152,991,140,987,119,982,138,978,136,973,147,973,125,972,145,969,144,964,120,962,126,962,61,961,117,960,132,960,141,960,130,959,271,959,330,959,113,958,128,957],"us-ks":[138,985,145,984,152,983,118,982,140,979,147,978,128,974,136,974,125,973,121,971,122,971,142,970,104,968,132,968,148,968,115,967,141,967,113,965,126,965,131,965],"us-ky":[143,994,104,992,107,980,125,979,115,974,145,973,136,971,139,969,25,967,121,967,128,967,181,967,127,965,138,965,140,965,148,965,152,964,119,963,171,963,118,962],"us-la":[128,986,145,982,106,980,122,974,125,973,148,973,104,972,119,971,142,971,115,970,113,968,143,968,107,967,120,967,139,966,136,965,138,965,25,962,131,962,147,961],"us-me":[148,991,106,986,128,986,142,986,115,983,129,978,139,976,121,974,216,974,147,973,119,971,131,970,145,968,151,968,132,967,134,967,144,967,61,966,271,966,330,966],"us-md":[149,985,133,983,109,979,105,978,111,978,153,978,156,973,165,973,131,972,132,970,112,969,126,968,283,967,342,967,114,966,144,965,61,964,217,963,269,963,328,963],"us-ma":[150,981,110,969,116,955,109,952,137,952,111,951,133,951,149,948,108,944,135,941,123,937,113,933,130,933,126,932,132,930,283,929,342,929,105,928,141,928,24,927],"us-mi":[136,988,138,984,145,984,120,979,152,979,140,977,128,976,143,974,119,973,121,973,104,972,118,972,106,963,117,963,122,963,23,962,148,962,107,959,115,959,142,958],"us-mn":[130,990,132,985,144,982,147,979,149,978,141,975,61,972,170,972,214,971,133,969,116,968,123,968,109,967,283,966,342,966,119,965,113,964,152,963,165,963,268,963],"us-ms":[107,975,143,970,104,968,120,965,151,962,167,957,182,957,193,955,209,955,37,954,55,952,139,952,172,952,289,952,348,952,115,951,191,951,240,951,159,950,197,950],"us-mo":[106,986,121,986,122,986,148,985,115,982,145,982,142,981,125,976,119,974,147,974,104,972,139,972,113,970,141,970,131,969,25,967,120,967,138,967,211,967,107,966],"us-mt":[134,980,148,979,122,978,115,976,272,974,331,974,139,973,131,971,142,970,106,969,216,968,153,967,215,967,114,966,151,965,128,964,25,956,37,955,104,955,147,953],"us-ne":[126,990,132,987,144,985,147,978,149,972,61,971,105,971,170,970,109,968,141,968,116,967,214,967,133,966,137,966,111,964,153,964,283,964,342,964,119,962,123,962],"us-nv":[142,984,114,978,153,977,106,976,112,975,123,972,113,971,129,971,122,970,134,970,128,969,283,969,342,969,147,968,213,967,61,966,269,966,328,966,119,965,139,965],"us-nh":[144,993,130,987,147,986,126,985,61,982,149,979,141,977,153,977,283,977,342,977,214,973,113,970,123,970,105,968,119,968,122,967,133,967,109,966,142,966,217,966],"us-nj":[149,988,123,983,109,980,111,976,113,970,283,970,342,970,126,969,165,968,61,967,116,967,132,967,141,967,105,966,130,966,112,964,153,964,144,963,131,961,214,961],"us-nm":[139,988,129,980,151,979,272,974,331,974,106,973,115,972,131,970,148,969,142,968,215,968,122,967,104,965,107,965,216,965,128,961,143,961,121,959,25,958,120,958],"us-ny":[124,941,108,937,150,926,110,917,270,912,329,912,111,908,109,905,116,905,133,904,123,902,112,899,137,899,18,896,105,892,149,892,24,890,165,881,153,880,146,878],"us-nc":[125,988,138,986,140,984,145,982,152,981,119,974,118,973,120,971,117,970,128,966,143,966,121,965,104,964,113,960,142,960,141,959,106,956,147,954,107,952,122,952],"us-nd":[109,972,111,972,105,966,110,966,130,966,144,963,132,960,149,958,116,956,126,956,133,956,214,956,153,955,217,955,165,954,123,952,124,952,269,952,328,952,150,950],"us-oh":[136,986,119,985,125,984,152,983,145,982,140,980,118,978,141,971,113,967,128,967,117,965,120,965,121,965,147,965,104,964,143,962,142,959,122,957,126,956,106,955],"us-ok":[151,989,134,988,106,983,115,981,148,978,104,976,107,976,122,976,142,975,216,975,129,973,143,973,128,972,25,970,37,969,120,969,272,967,331,967,121,966,131,965],"us-or":[152,990,118,987,136,984,138,980,119,979,125,977,145,972,117,969,147,968,120,965,141,963,113,961,128,960,143,960,104,958,121,958,126,956,132,956,283,955,342,955],"us-pa":[147,986,113,984,61,982,283,979,342,979,132,977,126,975,149,975,144,974,138,971,268,971,327,971,128,970,130,968,119,967,133,967,153,967,269,966,328,966,112,965],"us-ri":[122,986,106,985,131,984,128,981,148,979,139,975,145,973,113,972,147,972,121,971,271,971,283,971,330,971,342,971,61,970,119,970,129,970,114,969,115,969,134,968],"us-sc":[120,994,104,991,107,984,125,974,139,973,145,972,115,970,127,970,25,969,121,968,136,966,181,966,128,964,171,964,151,963,138,962,148,962,134,961,212,961,140,960],"us-sd":[132,993,61,985,130,985,147,985,126,982,153,977,283,976,342,976,149,975,214,975,141,974,217,972,268,971,327,971,113,969,269,969,328,969,165,968,271,968,330,968],"us-tn":[119,984,125,984,121,982,128,982,136,982,138,982,104,978,106,974,152,974,120,973,142,973,140,972,143,972,107,969,118,969,122,968,113,967,148,967,115,964,141,963],"us-tx":[141,960,283,958,342,958,61,954,113,954,138,949,112,948,116,946,145,946,119,945,126,945,147,945,133,943,149,943,121,941,132,941,140,941,136,940,35,939,152,939],"us-ut":[61,988,132,986,141,986,144,985,283,981,342,981,113,980,126,979,119,978,130,978,268,977,327,977,153,976,128,974,118,973,122,973,269,973,328,973,142,972,271,972],"us-vt":[122,991,115,990,128,985,106,980,129,979,142,979,139,978,216,974,121,973,104,971,147,970,151,970,134,969,25,968,119,968,107,967,145,967,120,965,132,964,131,963],"us-va":[133,988,123,985,109,980,132,979,126,978,141,975,144,975,283,975,342,975,61,974,113,973,111,972,130,972,214,972,165,971,147,970,153,970,105,966,142,966,116,965],"us-wa":[124,981,116,966,110,964,109,950,137,950,130,948,126,947,108,944,149,944,111,943,141,942,133,941,132,940,144,933,147,932,113,931,123,930,283,928,342,928,24,927],"us-wv":[139,989,134,979,107,978,37,977,115,973,169,973,106,972,148,970,122,968,215,968,142,967,216,966,104,965,129,965,25,964,143,963,127,962,128,961,197,960,272,959],"us-wi":[118,991,140,990,119,983,138,983,136,981,125,979,145,974,147,970,117,968,120,964,126,963,128,962,141,961,113,959,143,959,104,958,121,957,132,957,144,957,271,955],"us-wy":[217,981,114,980,105,978,123,978,61,977,131,977,132,977,144,977,147,976,269,976,328,976,157,975,156,973,165,972,283,972,342,972,149,970,142,968,213,968,109,967],"jp-tk":[9,978,212,971,20,966,5,965,171,962,45,961,282,961,341,961,4,958,21,958,169,958,25,957,202,956,211,955,209,953,36,952,155,952,23,951,159,951,181,950],"kr-sl":[45,984,169,984,282,984,341,984,210,980,239,980,209,978,37,977,203,976,197,975,218,972,219,968,215,967,194,964,174,963,216,962,189,961,178,960,272,959,331,959],"gb-ln":[165,981,157,976,105,973,123,973,153,973,269,971,328,971,217,970,114,967,144,965,149,964,214,962,61,961,133,959,213,959,268,959,327,959,132,958,109,955,112,955],"fr-pr":[269,990,328,990,165,985,217,983,213,979,268,978,327,978,61,977,156,976,153,975,11,971,214,971,220,970,271,967,330,967,141,965,144,963,149,963,147,962,112,960],"de-by":[160,974,208,972,36,962,181,962,23,960,166,960,171,959,273,959,332,959,212,953,159,951,201,951,20,949,190,948,172,946,175,946,179,946,21,945,117,943,191,940],"de-nw":[172,982,166,976,191,975,173,972,182,971,167,969,190,967,181,966,209,966,273,966,332,966,185,965,201,964,219,963,179,962,276,962,335,962,171,961,207,961,23,960],"de-bw":[158,974,208,971,36,942,273,941,332,941,181,940,166,939,171,938,23,937,201,932,212,932,159,928,172,927,175,926,190,926,20,925,117,925,179,925,21,923,191,919],"in-mh":[253,986,312,986,29,985,245,980,304,980,58,978,162,975,285,974,344,974,66,973,96,973,163,973,292,973,295,973,297,973,351,973,354,973,356,973,246,972,305,972],"in-ka":[248,989,307,989,246,987,305,987,250,986,293,986,309,986,352,986,296,984,355,984,244,982,249,982,285,982,303,982,308,982,344,982,438,982,471,982,442,981,452,981],"in-tn":[245,991,304,991,58,988,93,984,423,983,493,981,414,980,49,979,228,979,424,979,412,976,435,976,447,976,473,976,485,976,437,975,99,974,253,974,298,974,312,974],"br-sp":[258,989,317,989,259,979,318,979,33,973,264,969,323,969,257,968,316,968,17,967,278,967,337,967,71,966,233,966,261,962,277,962,320,962,336,962,279,961,338,961],"au-nsw":[157,985,217,985,214,982,269,982,328,982,156,981,213,977,268,977,327,977,123,973,153,972,149,971,61,970,220,970,133,968,144,968,271,966,330,966,132,965,105,964],"it-lm":[190,977,159,976,191,974,201,974,273,973,332,973,179,972,172,969,175,967,173,961,158,960,192,960,167,959,181,958,182,958,171,952,185,951,209,951,276,951,335,951],"es-ct":[182,995,193,991,186,980,276,980,335,980,185,979,188,978,191,978,192,976,184,975,187,975,482,975,172,974,173,973,177,973,190,973,183,972,200,972,180,971,174,970],"mx-cd":[46,986,224,986,281,977,340,977,257,971,316,971,264,969,323,969,50,968,226,968,262,966,321,966,94,965,391,965,256,964,265,964,315,964,324,964,33,962,68,960],"de-be":[215,985,155,984,37,979,203,979,210,979,216,979,218,979,272,978,331,978,45,977,282,977,341,977,239,976,197,974,209,974,151,973,212,968,194,967,139,964,189,964],"de-hh":[214,973,35,972,61,972,126,972,130,970,132,963,144,963,241,963,220,961,217,960,268,960,327,960,271,958,330,958,165,957,147,955,213,954,269,952,328,952,149,950],"de-he":[36,990,212,989,181,982,23,978,20,974,104,970,216,967,25,964,143,964,218,964,21,963,120,963,154,962,159,961,169,961,172,961,182,961,209,961,272,960,331,960],"de-ni":[173,990,159,982,191,982,201,981,185,977,182,976,219,976,179,975,167,974,175,974,190,974,209,971,166,969,176,968,186,968,276,967,335,967,174,965,181,965,192,965],"de-sn":[172,990,191,985,175,984,201,984,179,980,185,980,176,978,190,976,182,974,167,973,219,973,54,972,159,972,174,971,186,971,177,970,180,970,192,969,193,968,276,968],"de-sh":[177,989,219,984,482,984,209,983,205,982,210,980,183,976,239,976,186,975,178,974,184,974,203,974,182,973,173,971,193,971,194,971,57,970,60,970,167,970,189,970],"de-rp":[190,990,201,990,179,989,173,984,176,980,191,980,273,975,332,975,172,974,54,971,185,970,192,970,166,967,182,964,167,963,186,962,39,961,174,961,180,961,177,960],"de-th":[54,989,185,984,192,983,175,980,180,980,173,978,39,977,186,977,179,975,201,975,191,973,276,973,335,973,177,971,190,970,172,968,193,968,482,967,275,966,334,966],"de-bb":[482,993,174,989,186,985,183,983,205,983,193,981,219,981,180,980,184,978,240,977,178,976,204,976,57,975,185,975,188,975,291,975,350,975,182,974,209,974,167,973],"de-mv":[60,992,205,987,183,984,184,981,189,981,482,981,57,979,291,979,350,979,210,978,177,976,194,976,204,976,206,976,174,974,186,974,188,973,274,973,333,973,180,972],"de-sl":[190,992,201,992,175,989,191,985,173,980,273,978,332,978,172,975,176,975,185,975,192,974,166,972,182,967,167,966,186,965,54,964,276,964,335,964,159,962,193,962],"de-st":[186,989,200,984,188,983,176,980,177,980,185,979,276,979,335,979,183,978,193,977,482,977,54,976,205,976,187,975,39,974,184,973,57,972,178,972,182,972,204,972],"de-hb":[171,982,36,976,212,975,23,971,120,967,143,966,159,966,172,965,216,964,104,962,158,962,173,962,191,962,20,958,166,958,272,957,331,957,169,956,179,956,201,956],"fr-ra":[167,995,193,988,186,981,191,981,188,979,185,977,172,976,276,976,335,976,482,976,173,974,177,974,190,974,174,973,183,973,209,973,180,972,184,972,187,972,192,972],"fr-na":[184,995,205,993,57,989,291,989,350,989,188,988,204,988,482,988,274,986,333,986,178,984,177,983,186,982,199,982,60,981,193,980,200,980,238,980,180,978,187,978],"fr-oc":[183,995,57,992,291,992,350,992,205,991,204,989,188,984,199,984,274,984,333,984,482,984,60,982,193,982,178,981,187,980,189,980,177,978,186,977,240,976,276,976],"fr-pd":[186,988,276,987,335,987,192,986,176,984,193,982,173,980,54,979,167,979,180,979,275,979,334,979,482,979,188,978,207,978,172,977,182,977,191,977,200,977,177,975],"fr-br":[180,989,185,988,193,988,188,986,200,986,482,986,177,985,183,982,182,981,205,981,167,980,276,980,335,980,187,978,176,977,184,977,192,976,174,975,204,975,57,974],"fr-hf":[200,991,188,989,199,989,204,987,274,985,333,985,57,984,291,984,350,984,193,983,55,982,289,982,348,982,478,981,184,980,276,980,335,980,183,978,186,978,207,978],"fr-ge":[200,990,187,989,183,988,186,986,193,986,57,985,204,985,276,985,291,985,335,985,350,985,184,984,180,983,274,983,333,983,205,982,199,981,182,979,207,979,482,979],"fr-paca":[194,994,206,992,60,987,197,985,203,985,210,982,178,981,184,980,205,978,222,978,240,977,57,976,291,976,350,976,482,976,183,975,193,974,284,973,343,973,239,971],"it-vn":[179,992,175,990,191,988,201,985,273,985,332,985,166,977,192,977,173,976,172,974,182,974,167,973,185,972,176,970,276,968,335,968,159,967,193,966,54,961,186,960],"it-er":[190,988,173,985,179,985,172,982,192,982,182,981,175,980,201,980,167,978,185,977,159,975,273,975,332,975,166,974,276,974,335,974,176,973,193,973,54,966,186,965],"it-pm":[276,989,335,989,185,986,176,983,191,982,193,978,54,977,190,977,167,976,186,976,188,976,207,975,179,974,275,974,334,974,182,972,187,972,184,971,200,971,39,970],"it-ts":[167,991,182,988,186,988,188,986,482,984,187,983,184,982,185,982,177,981,276,981,335,981,183,980,200,979,57,978,192,978,204,978,205,978,240,978,291,978,350,978],"it-lz":[189,994,197,988,203,988,206,986,210,984,60,982,222,980,178,976,240,976,184,975,239,974,205,973,174,971,482,971,57,970,183,970,193,970,291,970,350,970,284,969],"it-cm":[198,991,196,988,41,982,223,981,56,979,70,979,234,979,290,979,349,979,53,971,60,971,287,971,346,971,391,968,38,967,206,967,73,966,94,966,199,966,284,965],"it-si":[195,988,198,984,41,973,56,971,223,971,290,971,349,971,70,968,234,968,391,966,60,964,98,964,53,963,94,963,287,963,346,963,40,960,449,960,199,958,394,958],"es-md":[203,993,194,988,210,988,189,985,239,984,37,980,206,977,209,977,155,975,169,974,222,972,60,971,174,969,219,968,178,966,240,966,184,965,45,964,215,964,282,964],"es-an":[195,991,41,988,196,984,56,981,290,981,349,981,53,976,287,976,346,976,391,975,223,974,94,973,40,972,199,972,60,971,70,971,234,971,189,969,274,968,333,968],"es-vc":[274,995,333,995,204,992,57,989,187,989,291,989,350,989,238,986,56,985,290,985,349,985,184,984,38,982,183,982,200,982,53,981,188,981,287,981,346,981,223,980],"es-ga":[187,991,188,990,186,986,204,985,274,985,333,985,180,984,275,984,334,984,478,983,199,982,207,981,183,980,238,980,276,980,335,980,57,979,193,979,291,979,350,979],"es-pv":[179,992,175,990,190,985,173,984,172,981,191,980,176,975,166,974,273,972,332,972,185,969,192,967,54,964,159,964,219,964,182,961,186,961,167,960,174,959,209,959],"gb-en":[45,961,282,961,341,961,9,960,5,959,37,957,154,956,155,956,4,951,13,949,8,948,169,947,197,947,239,942,203,940,25,939,151,938,11,937,215,937,206,936],"gb-sc":[197,993,210,993,194,988,239,986,189,985,209,980,169,979,155,976,37,975,60,975,174,974,206,974,178,971,184,971,215,969,219,969,205,968,222,967,482,967,167,966],"gb-wl":[57,993,274,993,291,993,333,993,350,993,199,992,184,989,183,988,187,987,188,985,200,985,205,985,238,984,482,982,38,980,56,980,290,980,349,980,53,979,287,979],"gb-ni":[183,993,184,991,482,989,57,987,178,987,291,987,350,987,204,985,177,983,174,982,188,982,60,981,186,981,274,981,333,981,189,978,193,978,199,977,200,977,209,977],"gb-mn":[189,992,60,989,194,986,222,982,240,982,284,978,343,978,197,977,178,976,203,974,205,972,210,972,184,971,57,968,73,968,291,968,350,968,195,967,482,967,37,966],"jp-os":[276,986,335,986,275,982,334,982,200,981,188,979,185,978,187,978,39,975,42,975,192,975,19,972,204,971,186,969,180,968,274,968,333,968,167,967,55,966,182,966],"jp-ai":[158,972,160,971,23,956,117,955,181,949,166,947,171,946,273,946,332,946,36,943,212,939,20,936,125,935,190,935,201,933,211,932,159,931,179,931,136,929,152,928],"jp-fk":[239,988,219,985,174,983,210,983,203,980,155,978,197,977,205,977,482,977,183,976,169,974,177,974,184,974,182,973,172,971,167,970,193,970,37,969,194,968,57,967],"jp-hk":[203,993,239,990,197,988,194,984,209,983,189,982,155,980,174,980,169,979,178,978,60,975,205,974,482,973,184,972,206,972,219,971,37,970,177,970,182,970,183,970],"ca-on":[20,975,23,968,212,968,25,967,128,967,216,963,122,961,148,961,35,960,115,960,121,959,21,958,106,958,171,958,268,957,327,957,125,956,145,956,154,955,271,954],"ca-qc":[171,989,20,982,36,981,23,975,181,975,216,975,25,972,154,971,104,968,169,968,211,968,272,967,331,967,21,966,115,966,218,964,209,963,107,961,120,961,143,961],"ca-bc":[220,990,268,990,327,990,269,989,271,989,328,989,330,989,217,983,241,980,61,979,157,979,214,978,165,977,147,970,153,968,131,967,144,965,113,964,114,963,142,963],"ca-ab":[61,985,268,985,327,985,165,982,217,980,213,978,269,978,328,978,271,977,330,977,144,975,132,973,170,973,149,972,126,971,157,971,220,971,241,970,130,967,147,965],"ca-ns":[272,991,331,991,169,985,216,978,218,972,37,969,203,969,45,968,134,968,151,968,282,968,341,968,129,967,155,967,210,965,197,964,139,962,239,962,209,959,212,959],"ca-mb":[272,985,331,985,169,979,115,978,215,978,139,975,212,975,122,974,148,974,37,971,218,971,129,968,271,968,330,968,171,967,151,966,134,965,25,964,45,964,181,964],"ca-sk":[165,985,269,984,328,984,157,983,213,983,153,981,214,980,220,980,268,980,271,980,327,980,330,980,61,979,144,972,156,970,241,970,132,966,147,964,105,963,123,963],"nl-nh":[169,979,155,972,215,972,216,971,272,970,331,970,36,967,45,965,282,965,341,965,171,964,212,964,219,963,37,962,203,960,210,960,237,960,239,960,209,959,174,958],"nl-zh":[209,985,174,984,177,981,239,980,172,976,482,976,173,973,210,971,182,970,203,969,155,968,183,968,197,968,167,966,186,966,205,966,184,965,193,965,201,964,159,963],"se-st":[213,990,241,988,271,986,330,986,269,982,328,982,217,980,268,980,327,980,61,979,214,971,157,970,165,970,237,970,35,967,153,964,147,963,131,962,170,961,272,960],"ru-ms":[206,982,60,980,194,980,284,980,343,980,189,978,197,972,240,971,203,967,73,965,210,965,37,963,38,959,13,958,178,958,151,956,184,956,239,955,205,954,482,953],"ru-sp":[56,990,290,990,349,990,53,982,287,982,346,982,195,981,41,980,199,980,38,979,238,977,478,977,40,975,274,975,333,975,70,974,198,974,234,974,204,972,196,971],"cz-pr":[241,984,61,978,15,975,271,973,330,973,220,970,268,962,327,962,35,961,213,961,218,960,21,954,214,952,142,951,217,951,269,950,328,950,216,949,122,948,170,946],"pl-mz":[53,991,274,991,287,991,333,991,346,991,199,986,204,984,56,982,290,982,349,982,183,980,200,980,478,979,42,977,57,977,223,977,291,977,350,977,188,976,275,976],"hu-bp":[210,990,209,988,203,986,197,984,155,980,219,980,169,976,174,976,194,974,189,971,37,970,45,970,205,970,282,970,341,970,482,969,178,967,182,965,184,965,206,965],"ro-bh":[206,982,482,981,193,978,38,977,177,977,189,977,57,976,184,976,194,976,291,976,350,976,205,974,183,973,204,973,222,971,167,970,60,969,73,969,182,968,199,968],"at-vi":[271,990,330,990,220,988,237,984,213,980,268,980,327,980,61,979,214,970,217,970,269,970,328,970,35,968,142,965,147,964,216,964,170,963,122,962,144,960,119,959],"in-dl":[63,986,230,986,466,983,255,982,314,982,450,978,479,978,480,977,501,977,461,975,65,974,232,974,247,973,306,973,294,971,353,971,500,971,475,970,499,970,498,969],"in-up":[31,988,244,982,303,982,48,981,227,981,254,979,313,979,250,978,309,978,246,977,247,977,305,977,306,977,251,976,310,976,249,973,308,973,296,971,355,971,162,968],"in-rj":[247,991,306,991,250,990,309,990,296,987,355,987,254,986,313,986,246,985,305,985,162,982,243,982,249,982,302,982,308,982,63,980,230,980,31,978,251,978,310,978],"in-gj":[163,991,58,990,253,982,312,982,161,980,423,979,93,978,30,977,299,977,358,977,414,975,444,975,493,975,297,974,356,974,49,973,228,973,424,973,435,973,437,971],"in-wb":[162,987,250,987,309,987,248,986,254,986,307,986,313,986,244,985,303,985,249,984,293,984,308,984,352,984,252,983,296,983,311,983,355,983,295,982,354,982,247,979],"in-mp":[244,991,303,991,251,987,310,987,255,986,314,986,501,986,63,984,230,984,250,984,309,984,450,984,31,983,461,983,254,982,313,982,246,979,305,979,480,979,65,978],"in-tl":[293,994,352,994,460,992,452,991,285,990,344,990,438,990,439,990,162,989,252,989,311,989,465,989,489,989,492,989,451,988,246,986,305,986,249,985,308,985,471,985],"in-ke":[254,993,313,993,250,992,309,992,463,992,296,990,355,990,252,988,311,988,471,988,487,987,431,986,248,985,307,985,496,985,246,984,305,984,293,983,352,983,162,982],"in-ap":[249,992,254,992,308,992,313,992,296,991,355,991,244,990,303,990,471,988,246,987,305,987,463,987,496,987,162,986,247,984,248,984,306,984,307,984,442,984,293,983],"in-br":[247,987,306,987,62,984,229,984,31,981,475,980,244,978,255,978,303,978,314,978,243,976,254,976,300,976,302,976,313,976,359,976,476,976,461,974,480,974,501,974],"in-pb":[248,989,293,989,307,989,352,989,249,988,308,988,285,985,344,985,460,985,438,984,452,984,246,983,254,983,295,983,305,983,313,983,354,983,446,983,100,982,439,982],"in-hr":[285,987,344,987,161,986,293,984,295,984,352,984,354,984,488,984,297,983,356,983,443,983,490,983,96,982,245,982,248,982,304,982,307,982,469,982,66,981,292,981],"in-or":[249,993,308,993,250,992,309,992,296,989,355,989,463,989,471,988,244,986,246,986,303,986,305,986,431,984,496,984,252,983,311,983,487,983,247,982,248,982,306,982],"in-as":[480,992,466,988,247,986,300,986,306,986,359,986,479,986,62,982,229,982,242,982,301,982,501,981,63,980,230,980,461,980,450,979,251,978,310,978,244,977,254,977],"br-rj":[72,982,235,982,262,974,321,974,71,973,233,973,46,972,224,972,260,969,265,969,319,969,324,969,263,967,322,967,266,965,325,965,168,964,60,959,70,957,234,957],"br-mg":[264,993,323,993,259,983,318,983,69,981,236,981,279,979,338,979,71,977,233,977,258,975,317,975,33,974,50,974,226,974,266,973,325,973,68,971,168,971,46,969],"br-rs":[164,989,259,989,318,989,264,980,323,980,71,976,233,976,278,976,337,976,257,975,316,975,261,973,277,973,320,973,336,973,279,971,338,971,280,969,339,969,33,966],"br-pr":[258,989,317,989,264,986,323,986,257,983,316,983,164,979,71,977,233,977,278,977,337,977,33,976,52,974,279,974,286,974,338,974,345,974,261,973,320,973,277,972],"br-ba":[263,995,322,995,262,989,321,989,266,987,325,987,265,985,324,985,47,978,225,978,69,975,236,975,68,973,256,969,315,969,279,966,338,966,257,964,316,964,50,963],"br-sc":[278,991,337,991,280,985,339,985,277,974,336,974,258,973,259,973,317,973,318,973,420,973,483,971,28,970,474,969,363,968,481,966,52,965,286,965,345,965,17,963],"br-pe":[265,995,324,995,263,990,322,990,260,989,319,989,266,985,325,985,256,974,315,974,69,972,236,972,68,971,47,968,225,968,168,966,72,965,235,965,279,963,338,963],"br-ce":[260,995,319,995,262,990,265,990,321,990,324,990,266,986,325,986,69,977,236,977,47,975,68,975,225,975,256,967,279,967,315,967,338,967,64,966,231,966,264,961],"br-go":[257,993,316,993,259,986,318,986,71,981,233,981,258,980,317,980,69,979,236,979,279,979,338,979,266,974,325,974,33,973,52,970,286,970,345,970,68,969,164,969],"br-pa":[262,995,321,995,263,990,322,990,260,985,319,985,266,981,325,981,69,977,236,977,68,975,256,969,315,969,279,967,338,967,64,966,231,966,47,965,225,965,168,964],"br-am":[260,987,319,987,263,986,322,986,262,985,321,985,265,981,324,981,69,979,236,979,264,974,323,974,257,973,316,973,71,971,233,971,68,970,279,970,338,970,47,968],"br-df":[60,971,72,967,235,967,281,958,284,958,340,958,343,958,70,954,234,954,256,950,315,950,196,949,195,947,46,943,224,943,71,942,233,942,73,941,38,940,198,938],"au-vc":[213,990,61,987,269,987,271,987,328,987,330,987,214,985,217,980,220,980,241,980,157,978,147,977,165,977,141,971,144,971,113,968,35,967,283,967,342,967,132,965],"au-ql":[157,990,213,989,268,987,327,987,217,984,61,983,165,982,220,982,214,978,271,978,330,978,153,976,147,973,156,971,241,970,144,969,131,966,141,966,283,966,342,966],"au-wa":[18,925,124,925,150,922,137,914,135,912,24,906,214,903,110,902,109,893,108,890,130,890,165,890,268,890,327,890,111,889,116,888,269,886,328,886,126,885,144,884],"au-sa":[241,990,213,989,268,987,327,987,220,986,61,981,217,980,269,978,328,978,214,977,237,973,147,972,142,971,144,968,216,968,157,967,122,966,165,966,131,965,153,964],"au-ts":[215,991,216,985,169,978,129,974,134,974,218,970,139,967,212,967,115,964,271,963,330,963,37,961,148,961,122,960,171,960,203,960,213,960,220,960,45,959,151,959],"kr-gg":[190,985,179,978,175,975,191,975,166,973,201,972,159,966,172,964,173,962,192,962,182,961,167,960,158,959,185,957,366,956,176,955,276,953,335,953,10,950,74,950],"kr-bs":[199,995,204,993,238,991,57,988,291,988,350,988,53,986,183,986,287,986,346,986,187,985,200,985,184,984,56,983,188,983,290,983,349,983,205,981,38,979,478,979],"kr-dg":[200,984,42,983,207,982,276,981,335,981,478,981,185,979,187,977,51,976,238,976,274,976,333,976,188,975,192,974,53,973,199,973,287,973,346,973,386,973,55,972],"kr-ic":[192,989,185,987,207,986,188,985,193,981,275,981,334,981,167,980,186,980,187,980,200,980,180,979,183,977,182,976,184,976,57,975,204,975,291,975,350,975,191,974],"mx-jl":[280,981,339,981,278,978,337,978,297,976,356,976,261,974,279,974,320,974,338,974,258,973,317,973,259,972,318,972,264,969,323,969,443,969,257,968,316,968,469,967],"mx-nl":[261,991,320,991,280,989,339,989,277,978,336,978,259,977,318,977,28,976,258,976,317,976,363,972,383,968,164,967,420,967,17,965,99,965,264,965,323,965,397,965],"mx-mx":[69,989,236,989,257,979,264,979,316,979,323,979,68,978,66,976,292,976,351,976,259,974,277,974,318,974,336,974,64,972,231,972,258,971,317,971,266,970,325,970],"mx-bc":[278,989,337,989,261,985,320,985,277,981,336,981,28,980,437,976,435,975,383,974,408,973,424,972,363,971,397,971,433,971,455,971,484,970,258,969,259,969,317,969],"mx-qr":[168,977,46,965,224,965,500,964,72,963,235,963,264,961,323,961,242,959,262,959,301,959,321,959,257,958,265,958,267,958,316,958,324,958,326,958,391,958,395,955],"jo":[293,995,352,995,438,991,248,990,307,990,452,990,460,989,465,989,439,988,451,988,488,988,253,987,312,987,490,987,492,987,469,986,489,986,252,985,311,985,440,985],"rs":[388,994,390,993,103,990,394,988,462,988,389,987,392,987,446,986,381,985,489,983,439,982,451,982,472,982,492,982,97,981,387,981,465,981,494,981,431,980,438,980],"tn":[285,995,344,995,248,994,307,994,438,994,452,993,460,993,439,992,465,992,451,991,492,991,489,990,252,989,311,989,295,987,354,987,162,986,463,985,471,985,496,985],"rw":[65,987,232,987,63,982,230,982,64,979,231,979,244,975,303,975,296,974,355,974,68,973,242,971,247,971,295,971,301,971,306,971,354,971,450,971,501,971,66,969],"sn":[293,987,352,987,296,986,355,986,253,984,312,984,248,983,252,983,307,983,311,983,438,983,246,982,285,982,305,982,344,982,66,981,292,981,351,981,452,981,460,981],"ci":[250,991,309,991,249,990,308,990,254,989,313,989,244,987,303,987,295,986,354,986,442,985,471,985,496,985,162,984,463,984,246,983,305,983,293,982,352,982,248,981],"lk":[66,983,253,983,292,983,312,983,351,983,29,976,277,976,336,976,245,974,295,974,304,974,354,974,161,973,285,973,344,973,293,969,352,969,443,968,488,968,490,968],"mm":[412,985,410,978,81,977,299,975,358,975,414,975,102,974,163,974,49,972,78,972,228,972,444,970,447,970,454,970,485,969,245,967,304,967,385,967,423,967,441,967],"kh":[444,982,245,977,304,977,412,976,298,975,357,975,436,972,163,970,30,969,385,969,22,968,253,968,312,968,415,968,423,968,448,968,58,967,81,967,297,966,356,966],"np":[62,988,229,988,480,987,255,986,314,986,479,985,477,978,466,977,251,976,310,976,59,975,475,975,476,974,498,973,247,972,306,972,499,972,500,969,242,968,301,968],"cn-sz":[398,972,362,969,367,968,369,956,375,953,399,952,86,949,74,948,361,948,366,948,83,946,368,946,419,946,405,945,413,945,495,944,84,942,400,942,407,941,377,939],"cn-gz2":[377,987,365,986,364,985,372,984,370,983,376,983,405,983,75,979,366,979,368,974,470,973,76,972,371,971,373,971,400,970,384,968,421,967,74,965,379,963,457,963],"cn-su":[369,984,398,979,367,974,360,969,407,969,375,961,399,960,402,955,86,953,368,953,413,952,400,950,419,950,404,949,366,948,428,947,396,944,403,944,405,943,432,943],"cn-cd":[99,990,79,988,383,988,420,988,397,987,435,986,437,986,408,985,455,985,483,984,424,983,474,982,433,981,76,980,93,980,456,980,484,980,381,979,423,979,473,979],"cn-hz":[373,986,361,985,377,985,365,984,372,983,370,982,376,982,75,980,405,979,366,978,368,973,470,972,76,971,371,971,363,969,384,968,400,968,420,968,74,966,421,966],"cn-wh":[370,996,75,992,376,991,372,987,470,987,361,986,377,986,371,985,364,984,373,984,384,982,405,982,421,981,76,980,366,977,368,977,379,976,409,976,422,976,429,976],"cn-nj":[405,989,377,988,372,981,370,980,376,980,361,979,364,978,365,977,75,975,368,970,470,970,373,969,371,968,400,967,384,966,74,965,421,964,398,962,76,961,192,961],"cn-nb":[398,986,375,985,399,984,368,978,413,976,419,976,86,974,362,974,400,974,407,971,428,971,360,968,396,968,495,968,432,967,369,966,374,965,372,964,417,964,376,963],"cn-qd":[400,992,374,987,372,986,401,985,376,984,416,983,370,980,377,979,367,978,365,977,406,977,419,977,86,976,428,976,361,974,375,974,396,974,430,974,75,973,364,973],"cn-wx":[362,984,398,975,367,966,407,963,375,959,360,956,399,955,402,950,400,948,413,948,368,947,366,946,404,945,419,945,428,945,396,942,86,941,432,941,403,940,401,937],"cn-cs":[365,996,376,995,75,992,372,991,377,990,470,990,371,988,373,987,384,985,421,984,361,983,364,982,405,981,366,980,368,980,379,980,457,980,409,979,422,979,429,979],"cn-zz":[421,996,75,991,379,991,409,991,422,991,429,991,457,991,470,991,384,990,76,988,370,988,415,986,365,985,376,984,436,983,448,983,80,982,374,982,416,982,372,981],"cn-fz":[376,996,377,992,370,991,365,987,368,986,384,985,361,984,75,983,364,983,373,983,400,983,405,983,470,982,366,981,371,981,379,979,457,979,421,978,429,977,374,975],"cn-jn":[370,987,376,987,364,986,75,985,365,984,372,983,470,983,384,982,420,982,371,981,458,981,474,981,483,980,377,978,421,978,481,978,379,976,429,976,457,976,78,974],"cn-hf":[416,995,401,991,406,990,368,987,430,987,396,986,428,985,384,984,419,984,382,983,418,983,432,983,371,982,426,982,75,981,400,981,470,981,495,981,417,980,421,979],"cn-nt":[399,991,367,985,413,985,396,983,419,983,428,983,432,981,398,980,401,978,86,976,407,976,495,975,368,974,400,973,374,972,417,972,416,970,376,964,380,964,370,963],"cn-dl":[372,996,370,995,365,991,377,991,75,987,373,987,470,986,384,985,368,984,371,984,361,983,364,982,405,982,421,982,366,980,379,980,457,980,400,979,429,979,374,977],"cn-xm":[372,992,376,991,370,990,405,990,366,988,361,987,365,986,364,985,75,982,470,982,368,979,400,979,371,978,373,978,384,978,421,976,379,972,457,972,409,971,422,971],"cn-dg":[404,981,403,967,407,959,402,953,399,941,413,940,362,935,375,935,419,935,495,935,367,934,380,931,428,931,396,930,432,930,374,928,417,927,369,926,86,925,360,923],"cn-yc":[457,1000,384,994,421,992,371,991,429,991,409,987,422,987,470,987,458,986,415,985,385,984,448,984,416,983,75,982,102,981,370,980,376,980,401,980,436,980,76,979],"cn-wz":[417,990,418,986,426,986,445,985,495,983,432,982,382,981,430,981,419,980,406,978,413,977,428,977,396,976,402,975,416,974,87,973,374,971,409,971,411,971,422,971],"cn-km":[494,994,464,993,467,992,491,992,472,991,387,990,443,990,388,989,469,989,486,989,386,988,497,988,96,987,488,987,427,986,288,985,347,985,393,985,383,984,425,984],"cn-cc":[418,994,426,994,430,993,87,991,406,991,445,991,411,989,416,987,415,984,374,983,385,983,401,983,417,983,448,983,77,981,380,981,429,981,409,980,422,980,432,980],"cn-sy":[397,996,408,995,455,994,433,992,437,992,99,991,456,990,473,990,484,990,424,989,435,989,101,988,363,988,420,988,485,988,447,986,453,986,454,986,483,986,441,985],"cn-nc":[379,994,457,994,470,992,371,990,421,990,429,989,75,988,370,985,372,985,376,985,409,985,422,985,374,984,401,984,416,984,415,983,448,983,458,983,365,982,373,982],"cn-sjz":[448,996,415,995,436,995,80,989,429,989,81,988,409,988,422,988,410,987,102,985,78,984,85,984,379,984,421,984,457,984,382,983,411,983,384,982,412,982,371,981],"cn-ty":[381,988,486,988,389,987,393,987,472,987,425,986,434,986,392,985,387,984,455,984,459,984,494,984,427,983,464,983,390,982,397,982,440,982,467,982,468,982,491,982],"cn-nn":[472,997,427,996,467,996,491,996,469,995,486,995,425,994,434,994,443,994,490,994,494,994,497,994,459,993,464,993,440,992,468,992,488,992,96,991,82,990,381,990],"cn-gy":[288,994,347,994,390,993,103,990,381,989,389,989,446,988,489,988,494,988,439,987,464,987,472,987,492,987,392,986,451,986,462,986,465,986,467,986,97,985,438,985],"cn-hhht":[392,997,390,991,388,989,288,987,347,987,386,987,446,987,394,985,103,984,393,984,381,981,425,981,486,981,434,980,472,980,459,979,462,978,82,977,387,977,489,977],"cn-lz":[288,993,347,993,388,993,446,993,103,992,392,992,389,991,394,985,462,985,486,985,472,984,489,984,393,983,492,983,386,982,425,982,439,982,451,982,381,981,434,981],"cn-hk2":[94,995,449,990,461,986,462,985,450,983,501,983,394,981,476,980,475,979,288,977,347,977,388,977,431,977,466,976,198,975,442,975,500,975,390,974,471,973,496,973],"cn-xn":[389,997,390,992,288,987,347,987,388,986,446,986,103,985,386,985,394,985,393,981,462,979,425,978,486,978,381,977,489,977,434,976,472,976,492,976,439,975,451,975],"cn-yc2":[425,995,486,995,434,993,472,993,459,992,494,991,82,990,387,990,464,990,427,989,467,988,491,988,386,987,440,987,468,987,497,987,100,986,469,986,101,985,381,985],"cn-wlmq":[462,993,288,988,347,988,431,987,389,985,390,985,392,985,388,984,103,981,391,981,442,981,446,979,463,979,471,979,496,979,449,978,94,977,381,977,487,977,386,976],"cn-ls":[98,982,449,978,477,978,500,975,59,970,391,967,498,967,499,966,94,964,479,964,300,962,359,962,476,962,466,961,475,957,480,957,43,956,281,955,340,955,62,953],"cn-ty2":[428,995,432,994,419,990,401,989,495,988,416,987,374,986,417,986,375,983,399,983,413,983,406,980,384,979,86,978,382,978,400,977,430,977,380,976,379,975,457,975],"cn-xt":[455,998,383,996,408,995,433,995,456,993,484,993,101,991,485,990,79,989,99,989,437,989,447,989,453,989,454,989,473,989,483,989,441,988,474,988,363,987,420,987],"cn-cz":[367,986,375,980,362,979,399,979,369,975,413,973,360,972,400,970,368,969,419,969,428,968,396,964,407,964,432,964,366,962,405,962,86,961,495,961,377,960,372,959],"cn-jx2":[375,991,413,991,419,990,428,987,367,984,396,983,407,983,432,983,495,983,417,980,398,979,374,978,401,978,86,975,416,975,402,972,368,971,380,970,406,970,400,968],"cn-zy":[368,992,401,988,372,983,374,981,416,981,376,979,377,979,428,978,396,977,406,975,419,975,367,974,370,974,384,974,432,974,375,973,382,973,405,972,430,972,361,970],"cn-yz":[374,991,416,991,396,989,400,988,428,988,368,985,406,985,419,985,384,984,382,983,432,983,430,982,379,980,457,980,470,979,375,978,399,978,418,978,426,978,495,978],"cn-hs":[407,987,403,984,413,977,380,975,417,974,399,972,404,967,495,967,432,966,419,965,426,964,375,963,406,963,418,963,430,963,445,963,396,961,428,961,382,958,416,958],"cn-zs":[402,984,404,979,407,975,378,967,413,966,380,961,399,960,417,959,432,955,495,955,419,954,375,951,396,950,406,950,428,950,426,949,430,949,418,948,445,948,367,946],"cn-fs":[378,981,403,979,407,974,402,967,399,960,413,954,375,953,419,953,495,952,367,951,362,949,428,948,369,945,380,945,396,945,432,944,374,942,86,941,417,941,398,940],"cn-zh":[377,990,366,989,361,983,372,983,365,982,376,982,370,981,364,979,470,976,75,974,400,972,368,970,373,970,384,970,371,969,421,969,409,965,422,965,429,965,379,964],"cn-pt":[430,997,416,993,418,992,382,991,426,991,374,990,417,989,445,989,429,987,401,985,409,984,421,984,422,984,411,983,87,982,432,982,415,981,396,980,428,980,371,979],"cn-qz":[402,987,399,983,413,980,375,976,419,976,403,975,404,974,495,973,428,972,367,971,396,971,432,971,362,969,374,967,417,967,398,964,416,964,369,963,380,963,401,961],"cn-ly":[433,996,383,995,397,995,437,995,456,995,484,995,455,994,473,994,101,993,424,993,435,992,485,992,447,991,453,991,454,991,441,990,493,989,99,987,414,987,420,987],"cn-zy2":[422,1000,429,996,421,995,415,993,436,992,371,991,448,991,385,988,470,988,379,987,430,987,457,987,80,985,384,985,458,985,76,984,406,984,418,984,426,983,75,982],"cn-xz2":[81,995,102,994,454,990,412,989,441,989,78,988,101,988,447,988,453,988,458,988,485,988,385,987,473,987,456,986,484,986,433,985,414,984,424,984,436,984,448,984],"cn-ha2":[382,989,77,985,418,985,426,985,430,985,445,985,385,983,406,983,87,981,448,980,436,979,415,978,416,978,412,975,374,974,417,974,401,973,80,972,81,972,89,972],"cn-bd":[410,989,81,988,414,988,298,985,357,985,444,985,102,984,485,984,78,983,447,983,385,982,423,982,453,982,441,981,454,981,458,980,473,980,484,980,493,979,101,978],"cn-ts":[399,991,432,988,417,986,375,985,396,983,428,983,419,982,407,980,416,980,495,979,380,977,402,977,367,976,374,976,406,976,430,974,398,973,401,972,382,971,418,970],"cn-ly2":[447,995,441,994,485,994,453,993,454,993,423,992,473,991,101,990,456,990,484,990,493,990,433,989,412,988,424,988,408,987,440,987,468,987,455,986,93,985,397,985],"cn-wf":[448,997,385,995,429,994,436,994,80,993,409,993,422,993,421,989,102,986,371,986,85,985,379,985,457,985,78,984,91,984,382,984,81,983,384,983,418,983,426,983],"cn-yt":[374,995,406,993,401,991,430,990,382,987,396,987,432,987,418,986,426,985,428,985,384,984,368,983,379,983,417,983,457,983,371,982,419,982,421,982,445,982,400,981],"cn-zb":[432,991,380,990,406,989,430,988,428,987,396,986,413,986,419,986,495,984,382,983,416,983,418,983,426,983,374,980,399,980,445,980,429,978,401,975,409,975,422,975],"cn-jh":[426,999,445,996,430,995,382,994,406,992,380,986,416,986,87,985,411,985,409,984,422,984,374,983,415,983,417,983,436,982,448,982,429,981,421,980,77,979,385,978],"cn-sx2":[428,993,495,993,396,990,399,990,432,989,417,986,401,985,374,984,375,983,413,982,416,982,86,981,380,980,368,977,406,977,367,976,407,976,400,975,430,975,418,974],"cn-yc3":[483,997,474,994,481,991,79,988,363,988,383,988,397,987,408,987,455,987,437,985,99,984,433,984,424,983,435,983,484,983,373,982,456,982,473,982,386,980,101,979],"cn-xy":[371,996,409,995,422,995,429,995,379,992,457,992,470,992,384,990,415,989,436,988,448,987,75,986,76,986,370,984,385,984,406,984,458,984,430,983,80,982,376,982],"cn-zz2":[409,1000,429,996,421,995,415,993,436,992,371,991,448,991,385,988,470,988,379,987,430,987,457,987,80,985,384,985,458,985,76,984,406,984,418,984,426,983,75,982],"cn-hy":[493,997,424,994,435,993,414,992,437,992,473,992,447,991,485,991,453,990,441,989,454,989,484,988,93,987,408,987,488,987,101,986,444,986,456,986,433,985,469,985],"cn-yy":[435,997,473,997,437,996,493,996,423,994,485,994,408,993,447,993,453,993,454,993,484,993,101,992,441,992,456,991,433,990,383,989,93,988,414,988,397,987,455,987],"cn-dt":[434,998,459,996,393,995,387,994,427,994,486,994,82,993,472,993,440,992,468,992,491,992,467,991,469,991,497,991,100,990,443,990,490,990,494,990,446,989,464,989],"cn-tz":[418,999,445,997,382,994,430,994,406,991,380,986,87,985,411,985,416,985,409,983,415,983,417,983,422,983,374,982,436,981,448,981,429,980,421,979,77,978,385,978],"cn-ls2":[469,997,497,997,387,996,434,996,490,996,459,995,488,995,425,994,440,994,468,994,472,994,486,994,491,994,467,993,443,992,494,992,82,991,96,991,100,991,464,991],"cn-hz2":[396,995,419,993,432,993,495,991,401,988,399,987,417,987,374,985,416,985,375,983,413,983,406,980,86,979,400,978,380,977,430,977,368,976,384,976,382,975,470,973],"cn-zz3":[409,996,422,996,421,995,415,994,448,992,371,991,379,991,457,991,384,989,385,989,436,989,406,987,458,987,470,987,80,986,430,986,76,984,75,982,85,981,102,981],"cn-lz2":[406,997,418,995,426,994,382,993,445,992,416,990,417,988,374,987,409,987,422,987,429,986,411,985,87,984,421,983,401,982,415,982,380,981,448,981,436,980,432,979],"cn-gl":[442,994,463,993,471,993,462,992,496,992,487,991,489,988,394,987,439,987,492,987,249,986,308,986,451,986,465,986,438,985,446,985,452,985,460,985,254,984,313,984],"cn-wh2":[396,994,428,993,417,991,419,989,413,988,495,988,416,987,374,983,399,983,401,983,380,982,406,982,375,981,382,980,430,979,379,975,384,975,418,975,457,975,86,974],"cn-bb":[456,998,455,997,484,997,101,996,408,996,397,995,441,994,447,993,453,993,454,993,473,993,485,993,383,992,437,992,424,990,435,990,414,989,493,987,79,986,102,986],"cn-aq":[425,998,459,997,427,996,82,994,387,994,440,994,468,994,486,994,100,993,393,993,469,993,497,993,472,992,490,992,491,992,467,991,488,991,443,990,446,989,464,989],"cn-yb":[437,998,424,997,473,994,423,993,484,993,493,993,408,992,101,991,456,991,485,991,433,990,447,990,453,990,383,989,441,989,454,989,464,988,397,987,455,987,494,987],"cn-dy":[385,995,448,995,415,994,409,992,422,992,429,989,421,988,80,987,410,984,81,983,371,983,91,982,418,982,424,982,445,982,102,981,426,981,444,981,470,981,379,980],"cn-my":[435,998,424,996,408,995,456,994,484,994,473,993,493,993,383,992,423,992,433,992,101,991,455,990,485,990,397,989,447,989,453,989,454,989,441,988,494,987,363,986],"cn-nch":[452,999,439,998,465,998,451,997,460,997,492,997,489,996,293,994,352,994,285,991,344,991,248,990,307,990,496,989,442,987,446,987,471,987,488,987,490,986,388,985],"cn-dz":[465,999,492,999,438,998,451,998,452,998,489,998,460,997,293,992,352,992,248,990,307,990,446,989,488,989,285,988,344,988,490,988,388,987,431,987,442,987,469,987],"cn-gy2":[468,1000,490,997,100,995,459,995,427,994,434,994,387,992,425,992,469,992,488,992,486,991,497,991,82,990,467,989,472,989,491,989,443,988,96,987,393,987,414,987],"cn-jdz":[447,999,453,999,454,998,485,998,473,996,101,995,484,995,414,994,433,994,456,994,493,993,424,992,408,990,455,990,410,989,423,989,435,989,397,988,437,988,93,987],"cn-zj2":[431,994,496,994,471,991,451,988,463,988,465,988,438,987,439,987,462,987,492,987,489,986,296,985,355,985,452,985,487,985,250,984,309,984,460,983,249,982,308,982],"cn-mm":[467,997,491,997,464,996,469,996,494,995,497,995,387,994,488,994,96,992,427,992,472,992,486,991,490,991,381,990,425,990,434,990,459,989,440,988,468,988,82,985],"cn-st":[423,986,412,985,410,983,299,982,358,982,493,982,81,981,436,981,424,980,435,980,102,978,414,978,437,978,473,978,447,977,485,977,78,976,385,976,448,976,453,976],"cn-jm":[426,997,418,996,430,992,382,991,406,989,380,985,411,985,415,983,87,982,416,982,436,982,448,982,409,981,422,981,417,980,374,979,77,978,385,978,429,978,421,977],"cn-qhd":[390,993,489,991,492,990,103,989,425,989,434,989,439,989,451,989,388,988,452,988,460,988,465,988,486,988,387,987,389,987,427,987,438,987,288,986,347,986,392,986],"cn-cz2":[441,999,485,999,453,998,454,998,473,996,101,995,414,995,456,995,484,995,424,993,433,993,493,993,408,991,423,991,455,991,435,990,93,989,397,989,437,989,410,988],"cn-lf":[415,997,385,996,436,995,429,992,80,991,409,991,422,991,421,987,102,985,78,984,81,984,85,984,379,984,410,984,457,984,371,983,382,983,384,983,91,982,418,982],"cn-hs2":[391,990,94,986,476,986,475,982,477,980,462,979,394,978,395,978,461,977,390,975,392,974,450,974,501,974,389,973,98,972,431,972,288,971,347,971,487,971,388,970],"cn-mz":[501,998,461,997,475,990,466,989,476,989,496,985,247,984,306,984,471,984,94,983,391,983,442,982,463,981,479,980,255,979,314,979,480,979,242,978,244,978,301,978],"cn-sg":[465,999,492,999,439,998,489,998,438,997,452,997,460,995,293,991,352,991,446,989,488,989,248,988,285,988,307,988,344,988,442,988,496,988,497,987,388,986,431,986],"cn-qy":[438,999,439,998,460,998,451,997,465,997,489,997,492,997,293,993,352,993,248,991,307,991,285,990,344,990,496,989,446,988,471,988,488,987,490,986,388,985,431,985],"cn-hb2":[441,999,485,999,447,998,454,997,473,997,484,996,101,994,493,994,414,993,424,993,433,993,456,993,408,991,423,990,435,990,397,989,437,989,455,989,93,988,410,988],"cn-sq":[441,998,447,998,101,997,453,997,485,997,456,995,473,995,484,995,414,993,424,993,433,993,408,991,455,991,493,991,410,990,397,989,423,989,435,989,437,989,93,987],"cn-ha3":[397,998,433,997,456,995,383,994,408,994,484,994,101,993,447,991,454,991,437,990,441,990,485,990,79,989,453,989,473,989,483,989,458,988,474,988,99,987,420,987],"cn-lj":[101,998,433,998,484,997,408,995,447,995,454,995,455,995,437,994,441,994,485,994,397,993,453,993,473,993,424,991,435,991,383,990,414,990,102,988,493,987,410,986],"cn-yz2":[379,1000,384,994,421,992,371,991,429,991,409,987,422,987,470,987,458,986,415,985,385,984,448,984,416,983,75,982,102,981,370,980,376,980,401,980,436,980,76,979],"cn-dq":[102,991,78,988,410,988,455,988,81,987,429,987,379,986,397,986,457,986,409,985,422,985,433,985,383,984,421,984,384,983,456,983,408,982,484,982,79,981,373,981],"cn-hrb":[434,997,425,996,82,995,427,995,440,995,468,995,100,994,387,993,393,992,469,992,486,992,490,992,497,992,472,990,488,990,443,989,467,989,491,989,96,988,494,987],"cn-ly3":[452,998,438,997,439,997,489,997,465,996,492,996,451,995,293,993,352,993,248,992,307,992,285,989,344,989,471,989,496,989,446,988,463,986,488,986,490,986,252,985],"cn-ey":[450,997,501,997,475,993,476,991,466,990,471,987,94,986,391,986,496,985,463,984,247,983,306,983,479,983,480,982,431,981,487,981,255,980,314,980,442,979,500,978],"cn-bh":[394,993,431,992,288,988,347,988,442,987,388,986,471,986,496,986,103,985,390,985,391,985,463,985,446,984,94,983,487,982,489,981,439,980,451,980,472,980,492,980],"cn-yl":[471,997,431,993,487,993,496,993,249,992,308,992,254,989,313,989,442,988,250,987,309,987,460,986,293,985,352,985,462,985,248,984,296,984,307,984,355,984,452,984],"cn-zh2":[494,999,467,997,472,997,491,997,443,996,469,994,486,994,381,993,387,993,488,993,497,993,427,991,96,990,393,990,425,989,434,989,490,989,435,988,388,987,437,986],"cn-qj":[439,999,451,999,438,998,492,998,452,997,489,997,460,996,293,992,352,992,248,989,285,989,307,989,344,989,442,988,446,988,488,988,496,988,490,987,388,986,431,986],"cn-dl2":[479,991,461,990,480,990,450,989,501,989,255,988,314,988,500,988,499,986,498,985,242,983,301,983,475,983,477,983,476,981,300,977,359,977,471,977,94,976,391,976],"cn-zyt":[491,999,443,997,464,997,494,997,387,996,469,996,497,996,472,995,488,995,486,994,427,993,96,992,381,992,490,992,425,991,434,991,440,989,459,989,468,989,393,988],"cn-gs2":[440,1000,490,997,100,995,459,995,427,994,434,994,387,992,425,992,469,992,488,992,486,991,497,991,82,990,467,989,472,989,491,989,443,988,96,987,393,987,414,987],"cn-jz":[497,999,427,997,488,997,491,997,443,996,467,996,387,995,490,995,96,994,464,994,472,994,494,994,434,993,440,992,459,992,468,992,486,992,425,991,82,989,100,989],"cn-ez":[75,992,384,992,421,992,371,991,370,990,409,988,422,988,365,987,379,987,429,987,457,987,376,986,373,983,372,982,377,982,374,981,415,981,436,981,76,980,401,979],"cn-hg":[463,997,496,997,431,993,487,993,442,991,460,989,249,988,250,988,254,988,308,988,309,988,313,988,452,988,438,987,461,987,439,986,462,986,489,986,248,985,293,985],"cn-xf":[486,998,387,997,464,997,494,997,467,995,491,995,427,994,469,994,393,993,425,993,497,993,434,992,443,992,490,992,381,991,488,991,459,990,440,989,468,989,96,988],"cn-bj2":[424,997,453,997,441,996,447,996,484,996,485,996,454,995,101,994,408,994,435,994,493,994,433,993,437,993,456,993,423,992,414,991,93,990,383,990,397,989,455,989],"cn-yl2":[483,997,481,996,420,994,79,989,397,988,455,988,433,985,383,984,408,984,456,984,484,984,363,982,101,981,373,981,386,981,458,981,485,981,384,980,437,980,447,980],"cn-ts2":[476,996,461,993,501,992,450,990,479,987,487,985,466,983,449,982,463,982,480,981,251,980,310,980,471,980,94,979,391,979,477,979,247,978,306,978,496,978,67,977],"cn-ww":[475,996,461,991,450,989,501,989,449,986,487,985,477,984,479,983,466,981,94,980,391,980,67,979,463,979,496,979,431,978,471,978,43,977,480,977,251,976,310,976],"cn-zy3":[479,986,476,984,466,983,500,983,449,980,475,979,480,979,300,978,359,978,395,978,59,976,498,975,461,974,499,974,98,972,94,971,391,971,450,971,501,971,255,970],"cn-klmy":[42,986,53,983,200,983,287,983,346,983,56,982,290,982,349,982,187,981,275,981,334,981,238,979,274,979,333,979,199,977,223,977,40,976,188,975,204,975,392,974],"cn-aks":[480,994,466,991,475,987,255,986,314,986,477,986,300,985,359,985,498,984,461,983,476,983,499,983,501,982,62,980,229,980,450,980,500,979,242,978,301,978,463,974],"cn-ks":[479,994,255,992,314,992,466,990,300,987,359,987,498,983,461,982,499,982,62,981,229,981,475,981,501,981,247,979,306,979,450,979,477,979,500,978,242,977,301,977],"cn-bt":[474,996,483,994,420,991,79,990,455,986,397,985,433,984,456,983,101,981,383,981,408,981,484,981,363,979,386,979,454,979,458,979,373,978,447,978,384,977,441,977],"cn-erds":[177,993,205,989,183,988,186,986,174,984,184,984,193,984,57,982,204,982,291,982,350,982,178,981,240,981,185,979,188,979,274,979,333,979,180,977,209,977,182,976],"cn-wh3":[420,997,474,997,481,994,79,990,397,989,455,989,408,987,383,986,433,986,484,985,363,984,456,984,437,982,473,982,101,981,386,981,458,981,485,981,99,980,373,980],"cn-rz":[101,997,433,997,456,997,453,996,473,996,485,996,408,995,441,995,447,995,454,995,437,994,455,994,397,993,424,993,435,993,383,990,414,990,493,990,423,988,486,987],"cn-jn2":[447,999,453,999,441,998,454,997,473,996,484,996,101,994,414,994,424,994,456,994,433,993,493,993,408,992,423,991,435,991,397,990,437,990,455,990,93,989,383,988],"cn-ta":[472,998,387,995,393,995,494,995,425,994,427,994,434,994,464,994,467,994,491,994,459,992,469,992,440,991,443,991,468,991,490,991,497,991,82,989,381,989,488,989],"cn-yc4":[463,993,471,993,431,991,496,991,249,987,308,987,442,985,475,985,476,985,254,983,313,983,460,983,452,982,462,982,438,981,461,981,250,980,252,980,309,980,311,980],"cn-cz3":[469,997,497,997,490,996,491,996,427,995,467,995,443,994,96,993,464,993,494,993,387,992,440,992,468,992,434,991,472,991,459,990,492,990,100,989,425,989,439,989],"cn-ld":[492,999,439,998,451,998,452,997,460,997,465,997,438,996,446,991,293,990,352,990,248,989,307,989,488,989,388,988,431,988,469,988,490,988,497,988,285,986,344,986],"cn-xx":[440,997,468,997,427,996,488,996,469,995,497,995,387,994,100,993,434,992,459,992,467,992,472,992,491,992,443,991,486,991,425,990,96,989,464,989,494,989,82,988],"cn-ly4":[467,999,443,997,464,997,469,997,494,997,387,996,488,996,497,996,472,995,427,994,486,994,96,993,381,992,425,992,434,992,490,992,440,989,459,989,468,989,393,988],"cn-nc2":[439,999,451,999,489,999,465,998,438,997,452,997,460,996,293,991,352,991,446,990,488,990,248,989,307,989,497,988,285,987,344,987,388,987,431,987,442,987,469,987],"cn-zg":[423,997,424,996,453,994,473,994,435,993,437,993,441,993,447,993,485,993,454,991,414,990,484,990,93,989,408,989,101,988,497,988,433,987,456,987,469,987,383,985],"cn-ls3":[464,999,467,997,472,997,491,997,443,995,486,995,381,994,387,994,469,994,497,994,488,993,427,992,393,991,96,990,425,990,434,989,490,989,388,988,435,987,437,987],"cn-pzh":[419,993,428,991,396,988,432,988,417,984,380,983,399,983,374,981,413,979,416,979,401,978,406,976,470,976,375,975,86,974,430,974,407,973,426,973,445,973,418,972],"cn-gy3":[471,997,442,994,463,993,431,992,487,991,438,989,452,989,460,989,451,988,465,988,250,987,309,987,439,987,492,987,462,986,489,986,249,985,293,985,296,985,308,985],"cn-my2":[469,999,427,997,488,997,467,996,491,996,443,995,490,995,387,994,494,994,96,993,434,993,464,993,472,993,459,992,425,991,440,991,468,991,486,991,82,988,100,988],"cn-ab":[499,999,500,986,466,985,479,984,480,983,59,982,461,975,477,975,501,975,255,974,314,974,475,974,300,973,359,973,450,972,62,971,229,971,476,971,242,969,301,969],"cn-gz3":[498,999,500,987,466,986,479,983,480,982,59,981,461,976,501,976,255,975,314,975,475,974,477,974,450,973,300,972,359,972,62,970,229,970,242,970,301,970,476,970],"cn-lj2":[466,988,499,987,498,986,477,983,479,979,461,978,480,978,450,977,501,977,255,976,314,976,94,975,391,975,395,975,59,972,476,972,242,971,301,971,475,971,300,969],"cn-bs":[450,998,461,997,475,992,466,989,476,989,247,986,306,986,471,985,496,985,94,983,391,983,463,983,479,982,255,981,314,981,480,981,250,979,309,979,442,979,431,978]},"education":{"us":[14,746,2,745,3,738,4,733,221,733,23,725,11,722,15,721,21,721,37,721,9,720,10,719,26,718,35,717,54,717,5,715,39,715,18,712,36,711,13,710],"cn":[221,729,88,716,2,708,99,707,92,706,459,705,90,704,30,703,80,703,382,703,44,701,77,701,91,701,249,701,308,701,256,700,315,700,386,700,413,700,454,700],"jp":[10,968,19,954,9,953,202,950,3,947,182,945,166,944,274,943,333,943,173,942,179,942,191,942,203,942,206,942,215,942,197,941,273,941,275,941,332,941,334,941],"de":[154,977,4,976,26,972,155,972,157,972,158,972,11,970,15,970,156,970,160,970,9,969,24,969,35,969,171,969,202,969,207,969,208,969,165,968,268,968,327,968],"gb":[202,991,11,989,207,989,211,989,15,988,21,988,37,988,159,988,154,986,208,986,169,985,213,985,241,985,271,985,273,985,330,985,332,985,35,984,212,984,214,984],"fr":[8,988,202,982,238,982,184,981,186,981,13,980,185,980,189,980,194,980,176,979,178,979,182,979,183,979,190,979,192,979,193,979,205,979,217,979,275,978,334,978],"in":[246,810,305,810,49,803,228,803,499,798,162,797,64,793,231,791,243,789,302,789,245,788,304,788,480,787,498,779,253,778,312,778,66,775,254,774,313,774,292,772],"br":[225,979,89,978,95,975,47,973,87,969,226,967,77,965,50,964,85,964,91,964,387,963,394,962,277,961,336,961,412,961,79,960,94,958,423,958,431,958,490,958],"it":[238,992,183,991,184,991,13,989,73,989,178,989,180,989,192,989,194,989,204,989,205,989,5,988,185,988,186,988,189,988,176,987,182,987,188,987,190,987,193,987],"ca":[202,990,159,989,273,987,332,987,207,985,211,985,212,985,214,985,154,984,201,984,209,984,213,984,219,984,282,984,341,984,169,983,172,983,208,982,210,982,36,981],"kr":[202,981,273,974,332,974,9,973,159,973,172,972,210,972,212,972,175,971,209,971,181,970,197,970,237,970,272,970,331,970,174,969,207,969,211,969,214,969,276,969],"au":[15,998,156,997,208,997,21,996,155,996,158,996,171,996,207,996,35,995,211,995,218,995,268,995,270,995,327,995,329,995,26,994,37,994,157,994,160,994,241,994],"mx":[225,947,7,940,47,940,91,938,99,937,77,936,88,935,249,935,308,935,385,933,90,932,85,931,391,931,52,930,58,928,80,928,413,928,485,928,22,927,424,927],"es":[8,989,189,988,238,988,176,987,184,987,185,987,186,987,190,987,193,987,182,986,183,986,192,986,194,986,217,986,177,985,178,985,205,985,216,985,275,985,334,985],"id":[29,832,12,751,0,746,47,739,7,734,225,733,34,731,50,722,226,719,72,704,71,698,68,697,77,691,22,688,285,688,344,688,89,686,95,684,52,683,78,683],"nl":[11,998,208,998,21,997,155,997,156,997,158,997,207,997,211,997,157,996,171,996,160,995,218,995,268,995,270,995,327,995,329,995,35,994,241,994,269,994,328,994],"sa":[283,990,342,990,198,989,366,989,195,988,287,988,346,988,74,987,196,986,200,986,360,986,361,986,75,985,239,985,240,985,364,984,377,984,187,983,199,983,365,983],"tr":[83,988,84,982,365,980,75,979,267,979,326,979,370,977,196,975,363,974,367,974,195,973,376,973,60,972,92,972,284,972,343,972,368,972,362,971,369,971,373,971],"ch":[24,995,35,992,160,992,170,992,220,992,26,991,165,991,155,990,156,990,157,990,158,990,11,989,171,989,15,988,268,988,270,988,327,988,329,988,21,987,208,987],"pl":[74,978,73,975,360,975,239,974,287,974,346,974,361,973,366,973,187,972,223,971,222,970,240,968,289,968,348,968,10,967,188,967,290,967,349,967,364,967,377,966],"se":[157,999,158,999,160,999,155,998,156,997,165,997,171,996,208,996,170,995,220,995,268,995,270,995,327,995,329,995,207,993,211,993,218,993,241,992,269,992,328,992],"be":[241,998,269,998,328,998,15,997,207,997,208,997,211,997,213,997,11,996,37,996,156,996,169,996,171,996,218,996,271,996,330,996,158,995,214,995,268,995,327,995],"th":[381,960,297,959,356,959,85,957,90,957,76,955,495,955,58,954,257,954,259,954,316,954,318,954,7,953,225,953,390,952,91,951,384,951,435,951,464,951,449,950],"at":[172,996,197,996,210,996,273,996,276,996,332,996,335,996,174,995,175,995,212,995,237,995,159,994,166,994,181,994,182,994,209,994,272,994,331,994,274,993,333,993],"no":[18,995,160,992,170,992,220,992,155,991,157,991,158,991,156,990,165,990,26,989,171,989,208,989,35,988,268,988,270,988,327,988,329,988,154,986,218,986,11,985],"il":[167,997,182,991,177,990,189,990,216,990,275,990,334,990,173,989,185,989,190,989,203,989,238,989,166,988,176,988,184,988,186,988,191,988,193,988,206,988,215,988],"ie":[171,999,155,998,156,998,158,998,165,998,268,998,270,998,327,998,329,998,35,997,157,996,160,996,170,996,208,996,218,996,220,996,241,995,269,995,328,995,11,994],"sg":[156,991,171,991,155,990,158,990,268,990,327,990,165,989,208,989,270,989,329,989,157,988,160,988,218,988,170,987,220,987,241,987,269,987,282,987,328,987,341,987],"my":[90,993,258,989,317,989,278,988,337,988,402,988,426,988,420,987,470,987,478,987,76,986,397,986,421,986,86,985,445,985,99,984,259,984,318,984,379,984,407,984],"ph":[68,853,78,835,12,832,14,832,82,832,77,831,80,831,285,828,344,828,81,827,89,826,88,825,69,824,236,824,95,823,97,823,47,822,93,822,72,821,425,819],"vn":[77,958,285,955,344,955,89,953,68,951,78,950,95,950,69,948,82,948,93,948,236,948,425,946,91,944,103,944,279,944,338,944,81,943,99,943,87,942,88,941],"ng":[48,966,227,966,251,966,310,966,229,931,62,930,300,911,359,911,244,908,303,908,247,904,306,904,243,902,302,902,98,893,250,888,255,888,309,888,314,888,299,887],"eg":[163,983,67,975,252,965,311,965,245,963,304,963,161,958,253,958,312,958,49,956,228,956,479,950,162,949,498,946,293,945,352,945,480,945,66,943,292,941,351,941],"ar":[83,986,362,986,365,986,369,986,398,985,75,984,361,984,364,984,363,983,367,983,405,983,376,981,377,981,368,980,240,979,366,979,84,978,168,978,234,978,196,977],"za":[477,991,465,988,97,986,96,985,100,985,260,983,319,983,392,980,466,980,500,978,103,977,262,977,321,977,461,976,463,976,475,976,496,976,265,972,324,972,476,971],"dk":[165,999,160,998,171,998,26,997,155,997,156,997,157,997,158,997,170,997,220,997,268,997,327,997,270,996,329,996,11,995,208,995,218,995,15,994,21,994,241,994],"fi":[241,999,269,998,328,998,169,997,207,997,208,997,211,997,213,997,271,997,330,997,156,996,171,996,214,996,218,996,158,995,209,995,219,995,268,995,270,995,327,995],"nz":[169,999,271,999,330,999,213,998,219,998,241,998,269,998,328,998,201,997,214,997,218,997,21,996,211,996,209,995,268,995,270,995,327,995,329,995,11,994,171,994],"pt":[283,991,342,991,198,989,55,980,60,980,267,980,284,980,326,980,343,980,366,980,195,978,370,978,53,977,287,977,346,977,196,976,240,976,372,976,374,976,75,975],"cz":[73,996,188,996,187,993,74,992,183,992,238,992,184,991,180,990,204,990,192,989,194,989,222,989,239,989,360,989,178,988,185,988,186,988,189,988,199,988,200,988],"ro":[168,990,234,990,419,986,483,986,398,985,288,984,347,984,399,984,375,983,428,983,70,982,363,982,368,980,400,980,233,979,373,979,383,979,401,979,362,978,365,978],"gr":[200,997,199,995,187,990,188,990,73,989,167,987,183,987,74,986,239,986,360,986,180,985,184,985,204,985,238,985,287,985,346,985,194,984,198,984,178,983,186,983],"hu":[369,995,362,994,364,993,51,992,75,992,365,992,398,992,405,992,361,989,367,989,377,989,240,988,363,988,366,988,376,988,368,987,196,986,195,984,234,984,267,984],"ua":[78,956,82,954,80,951,68,949,81,949,285,949,344,949,69,946,236,946,77,945,288,942,347,942,425,941,93,940,279,939,338,939,286,937,345,937,459,937,89,936],"ru":[92,945,42,939,83,937,288,936,347,936,168,935,234,934,51,931,88,931,84,930,383,930,419,930,483,930,233,929,398,929,399,928,86,927,261,927,320,927,363,927],"ae":[159,994,211,993,207,992,213,992,273,992,332,992,169,991,212,991,214,991,208,990,209,990,219,990,172,989,201,989,241,989,271,989,330,989,155,988,156,988,269,988],"cl":[267,992,326,992,370,991,75,989,195,988,196,988,283,988,342,988,365,988,198,987,60,986,284,986,343,986,364,985,373,985,362,984,363,984,367,984,376,983,404,983],"co":[226,976,77,975,89,975,95,975,7,973,50,973,87,972,91,972,78,971,412,971,69,969,236,969,82,968,94,968,411,968,425,968,85,966,387,966,394,965,447,965],"pk":[31,966,251,958,310,958,229,944,62,943,296,911,355,911,295,904,354,904,300,882,359,882,244,878,303,878,247,875,306,875,243,874,302,874,98,864,250,858,255,858],"bd":[245,984,304,984,480,969,498,963,162,960,163,960,32,956,246,954,305,954,161,951,59,948,479,948,253,941,312,941,66,938,292,935,351,935,67,934,499,934,252,933],"pe":[87,993,95,991,89,990,387,989,277,988,336,988,394,988,79,987,85,986,423,985,440,985,468,985,490,985,497,985,431,984,264,983,323,983,393,983,414,983,451,983],"sk":[369,999,362,997,405,996,364,995,377,994,42,992,240,992,398,992,75,990,196,990,366,990,361,989,365,989,367,989,56,988,195,988,376,988,287,987,346,987,368,986],"bg":[233,995,383,995,256,992,315,992,386,990,458,990,288,989,347,989,382,989,415,989,417,989,459,987,396,986,484,986,80,984,379,984,397,984,418,984,455,984,457,984],"hr":[239,997,360,996,55,995,366,995,74,994,187,994,240,994,289,993,348,993,290,992,349,992,377,992,223,991,361,990,364,990,188,989,73,988,362,988,405,988,369,987],"si":[174,999,181,999,237,999,276,999,335,999,175,998,197,998,210,998,272,998,331,998,179,997,166,996,172,996,191,996,206,996,274,996,333,996,173,995,201,995,203,995],"lt":[287,999,346,999,239,998,360,997,53,995,187,995,74,994,240,994,366,994,290,993,349,993,377,992,223,990,56,989,188,989,361,989,364,989,73,988,362,988,405,988],"lv":[287,999,346,999,239,998,360,996,187,995,74,994,240,994,366,994,289,993,348,993,377,992,223,990,55,989,188,989,361,989,364,989,51,988,73,988,362,988,405,988],"ee":[188,998,180,996,204,996,183,995,178,994,184,994,186,994,192,994,194,994,205,994,176,993,185,993,187,993,238,993,189,992,190,992,193,992,199,992,217,992,177,991],"ir":[22,954,297,938,356,938,85,935,242,934,301,934,47,931,225,931,390,931,91,930,435,930,464,930,262,929,321,929,392,929,12,928,50,928,89,928,95,928,226,928],"iq":[266,976,325,976,161,973,479,973,245,964,263,964,304,964,322,964,498,961,101,959,265,958,324,958,476,957,501,957,480,954,163,952,293,952,352,952,475,952,260,949],"kw":[267,993,326,993,370,993,404,990,367,989,376,989,372,988,373,988,368,987,46,986,224,986,75,985,400,985,401,985,196,984,363,984,374,984,375,984,482,984,235,983],"qa":[105,982,153,982,129,980,137,977,122,975,148,974,144,973,198,973,147,971,118,970,115,969,130,969,132,969,114,968,152,967,111,965,119,965,140,964,60,963,110,963],"et":[251,961,310,961,48,943,227,943,31,930,295,914,354,914,296,903,355,903,300,888,359,888,244,885,303,885,247,881,306,881,98,870,250,865,255,865,309,865,314,865],"ke":[64,963,231,962,498,949,294,947,353,947,59,946,246,946,305,946,479,946,245,942,304,942,65,938,232,938,254,938,313,938,161,937,299,932,358,932,255,931,314,931],"gh":[246,973,305,973,254,972,313,972,299,967,358,967,255,965,314,965,499,964,63,963,230,963,243,957,302,957,247,953,294,953,306,953,353,953,162,950,65,949,232,949],"tz":[294,982,353,982,64,949,231,949,63,938,230,937,246,936,305,936,255,935,314,935,254,925,313,925,245,920,299,920,304,920,358,920,480,919,243,918,302,918,499,915],"ma":[248,984,307,984,253,977,312,977,162,974,252,969,311,969,395,963,499,953,163,952,480,951,245,950,304,950,32,943,254,941,313,941,49,938,228,938,246,938,305,938],"dz":[32,975,163,969,242,956,301,956,479,954,293,953,352,953,161,952,252,951,311,951,245,945,304,945,253,943,263,943,312,943,322,943,266,941,325,941,59,939,262,939],"ve":[78,967,82,965,285,964,344,964,81,963,69,960,236,960,100,955,425,955,96,954,97,953,103,953,279,953,338,953,30,951,77,951,93,951,459,951,412,950,487,950],"ec":[81,994,82,992,425,992,77,989,78,989,94,987,385,987,411,987,412,987,249,986,308,986,391,985,99,984,447,984,277,983,336,983,413,982,459,982,485,982,79,981],"uy":[399,993,419,993,428,993,483,993,375,992,398,992,400,990,168,989,368,988,376,986,363,985,367,985,369,985,401,985,404,985,373,984,362,983,405,983,40,982,403,982],"cr":[383,998,286,996,345,996,288,991,347,991,396,989,484,989,417,988,256,987,315,987,418,987,386,986,458,986,168,985,261,985,320,985,382,985,415,985,419,985,483,985],"pa":[378,996,380,996,432,996,278,995,337,995,371,995,374,994,407,994,482,994,261,992,320,992,372,992,86,991,164,991,402,991,403,991,416,991,420,991,426,991,258,990],"cn-bj":[39,996,74,994,187,993,188,991,57,990,222,990,360,990,8,989,41,989,239,989,53,988,55,988,56,988,183,988,287,988,346,988,238,987,361,987,366,987,180,986],"cn-sh":[360,996,239,995,53,994,55,994,56,994,73,994,187,994,287,993,346,993,39,992,366,992,361,991,188,989,223,988,16,987,57,987,240,987,289,987,290,987,348,987],"cn-tj":[365,999,367,995,363,994,376,994,196,993,368,993,42,992,195,991,267,991,326,991,51,990,370,990,46,989,224,989,362,989,369,989,400,989,375,988,364,987,168,986],"cn-cq":[384,996,259,994,318,994,406,994,429,994,437,993,280,992,339,992,422,992,409,991,427,990,444,989,379,988,381,988,389,988,408,988,455,988,457,988,481,988,486,988],"cn-he":[69,989,236,989,82,986,91,986,99,985,425,985,78,984,81,984,87,984,95,983,249,982,308,982,89,980,94,980,385,980,411,980,412,980,50,979,85,979,90,979],"cn-sx":[82,998,81,993,69,989,236,989,77,984,425,984,459,980,412,979,80,978,99,978,249,978,308,978,382,977,94,976,385,976,411,976,87,975,256,975,315,975,386,975],"cn-nm":[277,996,336,996,414,996,423,994,431,994,490,994,388,993,387,992,430,992,434,992,441,992,462,992,488,992,87,991,257,991,316,991,394,991,85,990,410,990,436,990],"cn-ln":[99,985,52,984,286,984,345,984,459,984,81,982,249,982,308,982,71,981,233,981,382,981,82,980,88,980,385,980,256,979,315,979,383,979,78,978,386,978,391,978],"cn-jl":[82,995,69,994,236,994,78,993,459,987,425,986,382,985,77,984,94,984,249,983,308,983,385,983,411,983,80,982,256,982,315,982,386,982,415,982,99,981,391,981],"cn-hl":[78,998,81,995,69,992,236,992,425,987,77,986,412,982,459,982,80,980,99,980,249,980,308,980,382,980,94,979,385,978,411,978,87,977,256,977,315,977,386,977],"cn-js":[17,988,33,986,363,986,84,985,365,985,376,985,75,984,368,984,367,983,168,982,370,981,400,980,375,979,42,978,196,977,399,977,398,976,428,976,92,975,195,975],"cn-zj":[373,990,370,988,404,988,83,985,363,985,86,984,168,984,164,983,17,982,46,982,224,982,267,982,326,982,368,982,400,982,401,982,60,981,92,981,284,981,343,981],"cn-ah":[91,993,87,991,79,990,388,989,430,988,434,988,441,988,462,988,488,988,95,987,257,987,277,987,316,987,336,987,50,986,226,986,410,986,414,986,436,986,89,984],"cn-fj":[164,998,371,996,374,993,72,991,378,991,482,991,235,990,372,990,380,989,432,988,278,987,337,987,407,987,401,986,28,985,84,984,90,984,261,984,320,984,168,983],"cn-jx":[50,993,226,993,277,993,336,993,79,991,85,991,95,991,387,991,394,990,89,989,423,989,431,989,490,989,414,988,388,985,77,984,91,984,94,984,264,984,323,984],"cn-sd":[90,985,92,985,256,985,315,985,382,984,386,984,415,984,459,982,458,981,28,980,80,980,99,980,417,979,286,978,345,978,52,977,448,977,396,976,484,976,76,975],"cn-ha":[95,997,50,990,226,990,87,989,85,984,387,982,277,981,336,981,394,981,77,980,79,980,7,978,91,978,423,978,431,978,487,978,490,978,393,977,471,977,412,976],"cn-hb":[28,993,397,989,99,988,258,988,317,988,421,988,445,988,76,986,379,986,455,986,457,986,481,986,486,986,88,985,278,985,337,985,402,985,420,985,426,985,86,984],"cn-hn":[85,993,473,988,453,987,77,986,99,986,424,986,472,986,389,985,408,985,447,985,87,984,94,984,281,984,340,984,433,984,469,984,76,983,79,983,249,983,308,983],"cn-gd":[88,985,261,982,320,982,84,981,416,981,403,980,86,979,28,978,90,978,164,977,401,977,418,977,72,976,83,975,235,975,380,975,396,975,484,975,168,974,371,974],"cn-gx":[279,995,338,995,103,985,102,984,285,981,344,981,393,981,471,981,493,981,450,980,460,980,467,980,487,980,492,980,440,979,461,979,463,979,468,979,496,979,497,979],"cn-hi":[411,999,447,997,412,996,423,993,431,993,453,993,473,993,490,993,277,991,336,991,414,991,424,991,472,991,281,990,340,990,387,990,389,990,394,990,408,990,433,990],"cn-sc":[89,997,50,991,87,991,226,991,85,987,387,985,277,984,336,984,394,984,77,983,79,983,91,981,423,981,490,981,431,980,487,980,393,979,414,979,471,979,493,979],"cn-gz":[100,997,34,985,97,985,477,985,265,982,324,982,101,980,476,980,501,980,465,977,475,975,500,973,260,972,319,972,103,970,392,970,466,970,262,966,321,966,461,966],"cn-yn":[34,986,96,985,477,985,100,983,103,982,461,978,463,978,496,978,465,977,93,973,260,972,319,972,500,972,102,971,475,971,466,970,279,969,338,969,392,969,265,967],"cn-xz":[244,984,303,984,250,982,300,982,309,982,359,982,247,964,306,964,299,957,358,957,395,953,254,952,313,952,499,950,255,943,314,943,248,934,307,934,246,931,305,931],"cn-sn":[249,994,308,994,385,992,413,991,391,990,454,990,485,990,90,988,446,988,456,988,459,987,91,986,389,986,408,986,448,986,76,985,77,985,80,985,281,985,340,985],"cn-gs":[96,997,477,988,34,985,265,984,324,984,97,983,476,983,501,983,101,982,465,980,475,978,260,975,319,975,500,975,392,972,466,972,103,971,262,969,321,969,461,968],"cn-qh":[265,998,324,998,501,998,476,997,475,992,500,990,466,987,260,986,319,986,100,982,262,982,321,982,96,980,266,979,325,979,263,978,322,978,477,978,34,970,465,970],"cn-nx":[450,996,467,996,460,995,492,995,439,994,438,991,463,991,452,990,461,990,489,990,496,990,103,989,279,989,338,989,392,986,93,984,393,984,471,984,493,984,487,983],"cn-xj":[102,989,279,988,338,988,93,985,467,985,450,984,460,984,461,984,463,984,492,984,439,983,465,983,496,983,97,982,438,980,452,979,489,979,34,977,285,976,344,976],"us-al":[120,996,121,993,139,993,107,990,143,990,151,988,134,985,145,984,131,979,113,977,106,972,127,972,136,969,117,968,128,966,125,959,138,958,146,958,61,956,112,952],"us-ak":[153,1000,129,997,137,994,122,992,148,992,144,991,147,988,118,987,115,986,130,986,132,986,114,985,152,984,61,982,111,982,119,982,140,981,109,979,110,979,126,979],"us-az":[136,996,117,989,113,988,128,987,131,986,146,986,145,985,138,984,125,983,112,980,143,980,119,979,142,979,139,976,115,975,120,975,111,973,104,972,118,972,144,971],"us-ar":[151,998,121,996,134,992,104,990,120,987,139,986,127,982,143,982,145,974,131,973,113,967,106,962,117,958,136,958,128,956,61,950,125,949,138,948,146,948,115,946],"us-ca":[135,979,124,965,109,964,110,964,126,964,133,964,150,964,141,963,116,962,140,962,149,961,123,959,152,959,114,958,130,957,132,957,118,956,147,955,112,952,144,952],"us-co":[150,1000,126,997,110,996,114,994,132,993,147,992,124,988,148,988,133,987,137,986,140,986,123,983,152,983,129,982,130,981,118,980,105,979,149,979,153,979,144,976],"us-ct":[109,996,150,996,114,994,126,993,132,993,147,992,124,988,148,988,137,986,140,984,129,983,133,983,123,981,130,981,153,980,105,979,152,979,118,978,144,976,122,975],"us-de":[115,994,119,994,142,994,130,992,144,990,118,989,123,989,152,989,122,987,137,987,140,987,149,987,133,985,148,985,129,984,105,982,153,982,125,981,147,980,132,979],"us-fl":[138,994,146,988,116,987,141,987,128,986,117,984,136,983,106,980,125,980,142,978,149,976,113,975,111,972,135,972,119,971,123,970,152,970,115,968,133,968,145,968],"us-ga":[145,993,136,992,131,991,106,988,128,985,143,985,117,984,138,981,139,981,146,981,120,980,125,980,104,977,112,975,134,973,121,971,142,968,107,967,115,967,119,967],"us-hi":[132,998,147,995,109,994,110,994,126,994,150,994,148,993,137,991,129,988,140,986,105,985,153,985,123,983,124,983,130,983,133,982,144,981,152,981,118,980,122,979],"us-id":[119,996,111,994,122,993,144,991,118,988,130,988,142,988,125,987,105,986,153,986,123,985,129,985,152,985,140,983,149,983,137,982,117,981,133,980,148,980,128,979],"us-il":[141,993,112,987,149,987,123,983,125,983,138,983,135,982,133,981,142,981,128,976,140,975,146,975,111,974,117,974,119,974,136,974,152,973,126,972,106,970,115,970],"us-in":[128,998,125,991,138,990,106,989,136,988,112,984,113,984,131,983,145,983,115,981,142,981,119,980,146,977,143,976,122,975,111,974,116,974,149,974,118,973,139,973],"us-ia":[130,997,152,997,144,996,122,994,140,994,119,992,129,990,111,989,137,989,115,988,105,987,148,987,153,987,147,985,123,984,142,983,149,983,132,982,109,980,114,980],"us-ks":[115,996,111,994,118,992,144,992,122,990,130,990,123,989,152,989,142,988,125,987,149,987,140,986,129,985,133,984,105,982,137,982,153,982,117,980,148,980,106,979],"us-ky":[139,997,104,996,143,995,121,990,134,989,107,987,145,987,151,985,131,983,113,980,106,975,117,971,136,971,127,969,128,969,125,962,138,961,146,961,61,957,115,956],"us-la":[107,996,151,994,104,993,134,992,120,990,139,987,143,985,127,978,145,978,131,973,113,971,106,966,117,962,136,962,128,960,125,953,138,952,146,952,61,950,112,946],"us-me":[144,997,118,994,130,994,115,993,105,992,153,992,129,991,152,991,119,990,140,989,137,988,111,987,148,986,147,983,125,981,132,981,142,981,114,979,123,979,149,977],"us-md":[133,995,149,994,140,990,111,989,119,989,115,985,130,985,132,985,152,985,118,984,147,984,109,983,114,983,116,983,126,983,142,983,150,983,110,981,144,981,135,980],"us-ma":[109,988,110,988,126,988,150,988,114,983,132,982,147,980,133,976,148,976,137,974,140,974,149,973,123,972,152,972,129,971,118,969,130,969,105,968,153,968,135,967],"us-mi":[117,991,128,991,115,987,119,987,138,987,142,987,136,984,106,983,116,983,149,983,141,982,111,981,122,981,112,980,113,980,118,980,144,979,152,979,123,977,130,977],"us-mn":[109,997,150,997,114,994,110,993,132,993,147,992,124,988,148,988,137,986,140,986,133,984,123,983,129,983,149,983,152,983,130,981,118,980,153,980,105,979,144,976],"us-ms":[151,983,107,982,121,978,134,974,104,972,120,969,139,968,143,964,145,956,131,955,113,949,106,944,136,941,117,940,128,938,61,932,125,931,138,930,146,930,142,929],"us-mo":[117,998,138,992,125,991,136,990,106,987,112,986,113,985,145,982,131,981,115,979,142,979,146,979,119,978,116,976,141,974,143,974,149,974,122,973,111,972,118,971],"us-mt":[105,997,137,997,153,997,148,995,144,994,122,991,147,991,118,990,130,989,132,989,114,988,152,987,115,985,119,985,111,984,140,984,110,983,126,983,109,982,150,982],"us-ne":[118,997,152,997,144,996,140,995,122,994,111,992,137,992,119,990,148,990,129,989,115,988,147,988,105,986,142,986,153,986,123,985,132,985,114,983,149,983,109,981],"us-nv":[113,991,145,991,143,989,106,986,139,986,117,983,120,983,136,983,128,981,134,981,104,979,125,974,107,973,115,973,121,973,138,973,142,973,146,972,151,972,119,970],"us-nh":[114,998,147,997,148,995,109,993,110,993,126,993,150,993,137,992,129,989,140,988,105,986,153,986,123,985,130,985,144,983,152,983,118,982,124,982,122,981,133,980],"us-nj":[123,995,149,992,109,987,150,987,111,985,140,985,119,984,126,984,135,984,110,983,152,983,114,982,116,981,115,980,118,980,130,980,132,980,142,979,147,979,124,976],"us-nm":[107,992,121,992,139,992,151,991,120,989,143,989,104,985,131,981,145,980,127,974,113,973,106,969,117,965,136,965,128,963,125,956,138,955,115,954,142,954,146,954],"us-ny":[133,984,141,983,116,982,149,982,123,980,108,979,109,972,112,972,126,972,150,972,140,970,110,969,111,969,119,969,124,967,152,967,114,966,138,966,115,965,118,965],"us-nc":[106,996,113,992,128,990,146,989,117,988,138,988,145,985,125,984,112,983,131,983,142,976,143,976,119,975,116,974,139,973,115,972,141,972,149,972,120,971,104,969],"us-nd":[148,998,129,997,105,994,147,994,153,994,130,992,132,992,114,991,144,990,152,990,118,989,122,988,111,987,140,987,109,986,110,986,126,986,150,985,115,982,119,982],"us-oh":[112,994,128,992,117,990,136,988,125,987,146,987,106,984,116,983,141,982,113,981,119,976,142,976,115,974,145,974,131,973,149,972,111,970,118,968,122,968,152,968],"us-ok":[120,997,143,996,104,993,134,992,145,988,121,987,107,986,131,986,151,984,113,981,106,976,117,973,136,973,128,971,127,968,125,964,138,963,146,962,115,959,119,959],"us-or":[130,995,152,995,118,994,144,991,147,991,123,990,148,990,122,989,132,988,149,988,111,987,137,987,109,986,114,986,119,986,126,986,133,985,150,985,110,984,129,984],"us-pa":[116,993,112,987,135,983,149,983,125,982,138,982,146,980,142,979,123,976,133,975,128,974,140,974,111,973,119,973,117,972,136,972,152,971,106,969,115,969,118,969],"us-ri":[111,994,115,988,119,988,125,987,130,986,144,984,118,983,123,983,152,983,116,981,117,981,122,981,137,981,140,981,149,981,106,979,128,979,133,979,141,979,148,979],"us-sc":[139,996,120,995,145,992,104,990,131,989,134,989,113,985,121,985,107,982,106,980,151,980,117,976,136,976,128,974,125,967,138,966,146,966,127,964,115,962,142,962],"us-sd":[122,997,118,996,130,996,129,994,152,993,119,992,105,991,115,991,140,991,153,991,111,990,137,990,148,988,142,984,147,984,132,983,114,981,123,981,125,979,149,979],"us-tn":[113,993,143,992,131,991,139,988,120,987,106,985,136,985,104,984,117,983,128,982,134,980,121,978,125,975,107,974,138,974,146,974,151,972,112,968,115,964,119,964],"us-tx":[136,989,112,988,138,987,106,986,113,981,141,980,128,979,117,977,116,975,125,974,145,974,131,972,142,968,143,966,119,965,135,965,149,964,111,962,139,962,115,961],"us-ut":[132,997,148,996,114,995,137,994,109,992,110,992,126,992,150,992,129,991,140,991,105,988,130,988,153,988,152,986,118,985,123,984,144,984,122,983,149,982,111,980],"us-vt":[137,998,147,996,129,995,132,995,114,993,105,992,153,992,130,990,140,990,109,988,110,988,126,988,144,988,150,988,152,988,118,987,122,986,111,985,115,980,119,980],"us-va":[123,994,133,992,140,988,111,987,116,987,119,987,152,986,115,983,118,983,125,983,126,983,130,983,141,983,135,982,147,982,142,981,150,980,109,979,132,979,144,979],"us-wa":[109,1000,126,997,110,996,114,994,132,993,147,992,124,988,148,988,133,987,137,985,140,985,123,983,152,983,129,982,118,980,130,980,149,980,105,979,153,979,144,976],"us-wv":[107,998,121,994,134,991,104,988,120,985,139,984,127,983,143,980,131,972,145,972,113,965,106,960,117,956,136,956,128,954,61,949,125,947,138,946,146,946,115,945],"us-wi":[118,997,130,997,140,995,144,993,122,991,137,990,111,989,119,989,148,988,129,987,147,986,149,986,115,985,123,985,105,984,153,984,109,983,126,983,132,983,133,983],"us-wy":[105,1000,129,997,137,994,122,992,148,992,144,991,147,988,118,987,115,986,130,986,132,986,114,985,152,984,61,982,111,982,119,982,140,981,110,980,126,980,109,979],"jp-tk":[157,987,4,986,20,986,24,986,160,986,18,985,155,985,158,985,9,984,35,984,170,984,220,984,11,983,15,983,26,983,156,983,165,983,171,982,207,982,208,982],"kr-sl":[158,999,20,998,26,998,156,998,157,998,160,998,15,997,35,997,171,997,208,997,11,996,165,996,268,996,327,996,270,995,329,995,21,994,36,994,170,994,207,994],"gb-ln":[171,999,26,998,155,998,158,998,208,998,268,998,327,998,11,997,15,997,20,997,35,997,160,997,270,997,329,997,21,996,36,996,157,996,165,996,218,996,241,995],"fr-pr":[20,999,155,998,160,998,35,997,158,997,15,996,26,996,156,996,165,996,171,995,208,995,11,994,170,994,207,994,220,994,268,994,327,994,211,993,270,993,329,993],"de-by":[20,999,155,999,26,998,156,998,160,998,15,997,35,997,157,997,171,997,208,997,11,996,165,996,268,996,270,996,327,996,329,996,21,995,36,995,170,994,207,994],"de-nw":[273,998,332,998,207,996,211,996,212,996,214,996,201,995,209,995,213,995,219,995,21,994,23,994,45,994,169,994,172,994,15,993,36,993,37,993,208,993,210,993],"de-bw":[20,999,35,998,155,998,157,998,158,998,156,997,165,997,26,996,170,996,171,996,208,996,220,996,15,995,268,995,327,995,11,994,270,994,329,994,21,993,36,993],"in-mh":[479,975,59,973,266,973,325,973,163,971,263,960,322,960,32,958,245,957,304,957,101,955,265,955,324,955,476,953,501,953,67,952,49,951,228,951,293,949,352,949],"in-ka":[253,981,312,981,292,976,351,976,245,975,304,975,66,974,252,973,311,973,480,972,246,964,305,964,248,963,307,963,499,962,49,960,163,960,228,959,395,959,498,953],"in-tn":[32,983,245,974,304,974,161,971,67,969,253,969,312,969,479,967,498,963,252,961,311,961,49,960,162,960,228,960,480,957,266,954,325,954,292,953,351,953,59,952],"br-sp":[86,998,371,996,374,995,482,992,72,991,372,991,378,991,235,990,380,989,432,989,278,988,337,988,407,987,401,986,373,985,258,984,261,984,317,984,320,984,28,983],"au-nsw":[35,999,26,998,170,998,220,998,268,998,327,998,20,997,160,997,171,997,270,997,329,997,155,996,156,996,157,996,158,996,218,996,208,994,241,994,269,994,328,994],"it-lm":[203,999,274,999,333,999,173,998,179,998,191,998,206,998,215,998,182,997,197,997,275,997,276,997,334,997,335,997,54,996,174,996,177,996,216,996,175,995,176,995],"es-ct":[25,997,177,993,216,993,275,993,334,993,176,992,190,992,191,992,193,992,203,992,206,992,215,992,166,991,173,991,185,991,189,991,199,991,217,991,179,990,182,990],"mx-cd":[399,993,419,993,483,993,363,992,375,992,428,992,40,990,400,990,70,989,234,989,368,989,365,988,373,988,376,987,75,986,367,986,404,986,71,985,233,985,383,985],"de-be":[37,999,213,999,214,998,219,998,241,998,271,998,330,998,36,997,201,997,269,997,328,997,21,996,209,996,211,996,218,996,175,995,212,995,159,994,171,994,172,994],"de-hh":[220,1000,165,998,35,997,26,996,160,996,268,996,270,996,327,996,329,996,20,995,171,995,155,994,156,994,157,994,158,994,218,994,241,993,269,993,328,993,18,992],"de-he":[26,999,156,999,268,999,327,999,35,998,270,998,329,998,155,997,158,997,165,997,208,997,218,997,11,996,15,996,20,996,21,996,36,996,160,996,241,996,269,996],"de-ni":[209,999,175,998,210,998,212,998,181,997,214,997,237,997,23,996,54,996,197,996,219,996,272,996,273,996,276,996,331,996,332,996,335,996,174,995,201,995,213,995],"de-sn":[203,1000,191,999,206,999,215,999,274,999,333,999,166,998,177,998,179,998,182,998,275,998,334,998,185,997,216,997,176,996,189,996,190,996,193,996,197,996,217,996],"de-sh":[276,1000,335,1000,54,999,197,999,175,998,181,998,237,998,272,998,331,998,179,997,210,997,274,997,333,997,166,996,191,996,203,996,206,996,215,996,23,995,172,995],"de-rp":[181,999,210,999,237,999,272,999,331,999,54,998,172,998,174,998,197,998,276,998,335,998,209,997,212,996,214,996,219,996,23,995,166,995,169,995,173,995,179,995],"de-th":[190,1000,193,1000,217,1000,185,999,186,999,189,999,177,998,194,998,216,998,275,998,334,998,178,997,192,997,205,997,206,997,215,997,173,996,180,996,184,996,191,996],"de-bb":[216,1000,275,999,334,999,173,998,176,998,185,998,190,998,191,998,193,998,203,998,206,998,215,998,217,998,179,997,186,997,189,997,274,997,333,997,166,996,178,996],"de-mv":[192,1000,205,1000,194,999,180,998,184,998,186,998,193,998,204,998,217,998,176,997,185,997,190,997,238,997,177,996,183,996,189,996,216,996,275,996,334,996,57,994],"de-sl":[191,999,206,999,215,999,274,999,333,999,166,998,173,998,203,998,54,997,174,997,177,997,216,997,275,997,276,997,334,997,335,997,181,996,182,996,197,996,217,996],"de-st":[204,1000,178,998,183,998,192,998,194,998,205,998,186,997,57,996,176,996,184,996,190,996,193,996,217,996,177,995,185,995,188,995,189,995,216,995,238,995,275,994],"de-hb":[237,1000,272,1000,331,1000,54,999,175,999,174,998,210,998,276,998,335,998,172,997,197,997,179,996,201,996,209,996,219,996,212,995,214,995,274,995,333,995,23,994],"fr-ra":[173,998,203,998,166,997,191,997,206,997,215,997,274,997,333,997,179,996,275,996,334,996,177,995,185,995,189,995,216,995,238,995,23,994,176,994,184,994,190,994],"fr-na":[180,998,184,998,204,998,238,998,194,997,178,996,186,996,188,996,189,996,192,996,205,996,57,995,185,995,176,994,190,994,193,994,217,994,177,993,216,993,275,993],"fr-oc":[194,999,238,999,178,998,183,998,186,998,192,998,205,998,185,997,189,997,204,997,176,996,180,996,190,996,193,996,217,996,188,995,275,995,334,995,57,994,173,994],"fr-pd":[189,1000,176,999,186,999,190,999,193,999,217,999,177,998,275,998,334,998,173,997,178,997,184,997,192,997,194,997,203,997,205,997,216,997,191,996,206,996,215,996],"fr-br":[176,999,185,999,178,998,184,998,189,998,190,998,192,998,193,998,194,998,205,998,217,998,177,997,180,997,204,997,216,997,238,997,275,997,334,997,183,996,203,996],"fr-hf":[239,996,55,995,56,995,188,995,287,995,346,995,360,995,53,994,74,994,39,993,57,993,73,993,41,990,180,990,183,990,200,990,204,990,366,990,184,989,194,989],"fr-ge":[57,998,39,996,183,996,180,995,184,995,187,995,204,995,194,994,238,994,178,993,186,993,192,993,205,993,185,992,189,992,199,992,291,992,350,992,73,991,176,991],"fr-paca":[185,1000,176,999,190,999,193,999,186,998,217,998,275,998,334,998,177,997,184,997,192,997,194,997,216,997,173,996,178,996,183,996,191,996,203,996,205,996,215,996],"it-vn":[176,1000,193,1000,185,999,189,999,217,999,177,998,186,998,192,998,194,998,216,998,275,998,334,998,178,997,191,997,205,997,206,997,173,996,180,996,184,996,203,996],"it-er":[206,1000,215,1000,173,999,179,999,203,999,166,998,177,998,216,998,274,998,275,998,333,998,334,998,182,997,190,997,193,997,54,996,174,996,176,996,185,996,189,996],"it-pm":[178,1000,194,1000,205,1000,180,998,184,998,186,998,190,998,193,998,204,998,176,997,185,997,189,997,217,997,238,997,177,996,183,996,216,996,275,996,334,996,191,995],"it-ts":[176,1000,190,1000,217,1000,185,999,189,999,177,998,178,998,186,998,192,998,205,998,216,998,275,998,334,998,191,997,194,997,206,997,173,996,180,996,184,996,203,996],"it-lz":[192,1000,178,999,184,999,205,999,176,998,180,998,186,998,190,998,204,998,238,998,183,997,185,997,189,997,193,997,217,997,177,996,216,996,275,996,334,996,57,994],"it-cm":[196,998,367,992,75,991,364,991,377,991,405,991,240,990,362,990,365,990,369,990,376,990,16,988,46,988,51,988,224,988,368,988,267,987,326,987,400,987,283,986],"it-si":[195,998,367,994,75,993,405,993,362,992,365,992,369,992,376,992,51,990,368,990,267,989,326,989,364,989,377,989,400,989,46,988,224,988,240,988,363,987,375,987],"es-md":[174,999,276,999,335,999,54,998,175,998,210,998,237,998,166,997,181,997,272,997,274,997,331,997,333,997,23,996,172,996,173,996,179,996,203,996,191,995,206,995],"es-an":[283,998,342,998,16,989,38,989,46,987,224,987,53,986,55,986,56,986,287,986,346,986,195,985,200,985,267,985,326,985,41,984,239,984,360,984,196,983,199,983],"es-vc":[200,996,41,995,57,992,188,992,167,991,180,990,204,990,39,988,178,988,183,988,192,988,194,988,205,988,25,987,184,987,186,987,187,987,176,986,190,986,193,986],"es-ga":[41,997,199,996,187,990,57,989,188,989,39,988,167,987,180,987,204,987,239,987,360,987,16,986,55,986,56,986,73,986,53,985,178,985,183,985,192,985,194,985],"es-pv":[219,999,214,998,37,997,169,997,213,997,271,997,330,997,181,996,209,996,237,996,241,996,269,996,272,996,328,996,331,996,54,995,159,995,172,995,175,995,210,995],"gb-en":[23,992,4,991,273,991,332,991,9,990,159,990,210,990,172,989,175,989,212,989,181,988,197,988,209,988,237,988,272,988,331,988,54,987,174,987,276,987,335,987],"gb-sc":[173,1000,166,999,191,999,206,999,215,999,274,999,333,999,177,998,179,998,182,998,275,998,334,998,185,997,216,997,174,996,176,996,186,996,189,996,190,996,193,996],"gb-wl":[180,1000,178,998,183,998,192,998,194,998,205,998,184,997,186,997,57,996,176,996,190,996,193,996,217,996,238,996,177,995,185,995,188,995,189,995,216,995,275,994],"gb-ni":[178,1000,192,1000,194,999,180,998,184,998,186,998,193,998,204,998,217,998,176,997,185,997,190,997,238,997,177,996,183,996,189,996,216,996,275,996,334,996,57,994],"gb-mn":[191,1000,215,1000,173,999,179,999,203,999,166,998,177,998,216,998,274,998,275,998,333,998,334,998,176,997,182,997,190,997,193,997,54,996,174,996,185,996,217,996],"jp-os":[211,998,15,997,21,997,36,997,208,997,11,996,159,996,241,996,269,995,328,995,37,994,155,994,156,994,157,994,158,994,169,994,213,994,271,994,273,994,330,994],"jp-ai":[15,998,156,998,11,997,21,997,36,997,155,997,158,997,171,997,207,997,218,997,20,996,26,996,160,996,211,996,241,996,268,996,269,996,327,996,328,996,35,995],"jp-fk":[172,999,212,999,214,998,175,997,210,997,219,997,273,997,332,997,169,996,181,996,201,996,213,996,237,996,272,996,331,996,36,995,37,995,54,995,159,995,174,995],"jp-hk":[175,999,237,999,54,998,172,998,181,998,197,998,272,998,331,998,174,997,209,997,276,997,335,997,23,996,212,996,214,996,166,995,201,995,213,995,219,995,273,995],"ca-on":[207,998,15,997,21,997,36,997,37,996,159,996,169,996,208,996,213,996,271,996,330,996,11,995,212,995,214,995,241,995,269,995,273,995,328,995,332,995,155,994],"ca-qc":[209,999,172,998,273,998,332,998,214,997,159,996,175,996,210,996,219,996,23,995,169,995,181,995,201,995,211,995,213,995,237,995,21,994,36,994,37,994,54,994],"ca-bc":[169,999,37,998,214,998,21,997,36,997,201,997,219,997,241,997,269,997,271,997,328,997,330,997,209,996,211,996,159,995,171,995,172,995,208,995,210,995,212,995],"ca-ab":[219,999,169,998,201,998,209,998,213,998,37,997,172,997,212,997,36,996,159,996,175,996,210,996,271,996,330,996,21,995,181,995,211,995,237,995,241,995,269,995],"ca-ns":[191,1000,206,1000,173,999,179,999,203,999,166,998,177,998,216,998,274,998,275,998,333,998,334,998,176,997,182,997,174,996,185,996,189,996,190,996,193,996,217,996],"ca-mb":[177,1000,275,999,334,999,176,998,190,998,191,998,193,998,206,998,215,998,217,998,173,997,179,997,185,997,186,997,189,997,203,997,166,996,178,996,192,996,194,996],"ca-sk":[176,1000,193,1000,185,999,190,999,177,998,178,998,186,998,189,998,205,998,216,998,275,998,334,998,192,997,194,997,173,996,179,996,180,996,184,996,191,996,203,996],"nl-nh":[241,998,268,998,269,998,270,998,327,998,328,998,329,998,37,997,171,997,208,997,271,997,330,997,21,996,26,996,36,996,156,996,165,996,169,996,11,995,15,995],"nl-zh":[201,999,214,999,37,998,169,998,209,997,213,997,271,997,330,997,172,996,175,996,181,996,212,996,237,996,241,996,269,996,328,996,36,995,54,995,159,995,210,995],"se-st":[170,1000,165,998,35,997,26,996,160,996,268,996,270,996,327,996,329,996,20,995,171,995,218,995,155,994,156,994,157,994,158,994,241,993,269,993,328,993,18,992],"ru-ms":[73,990,39,989,223,989,291,989,350,989,289,986,290,986,348,986,349,986,187,985,188,985,74,984,13,983,57,983,41,982,360,982,8,981,183,981,239,981,53,980],"ru-sp":[289,996,348,996,290,995,349,995,53,991,55,990,56,990,287,990,346,990,222,989,74,988,239,988,366,988,360,987,361,987,73,985,187,985,291,985,350,985,39,984],"cz-pr":[181,1000,54,999,175,999,210,999,272,999,331,999,174,998,197,998,276,998,335,998,172,997,201,996,209,996,219,996,23,995,166,995,179,995,212,995,214,995,215,995],"pl-mz":[184,999,183,998,194,998,178,997,186,997,192,997,205,997,185,996,189,996,204,996,176,995,180,995,182,995,190,995,193,995,217,995,188,994,275,994,334,994,57,993],"hu-bp":[55,998,56,998,360,998,53,997,287,997,346,997,187,996,74,995,240,992,289,992,290,992,348,992,349,992,366,992,57,991,188,991,377,991,39,989,73,989,223,988],"ro-bh":[377,998,361,995,364,995,366,995,53,994,55,994,56,994,287,994,346,994,405,994,362,993,369,993,51,992,239,992,360,991,195,990,187,989,42,988,196,988,289,988],"at-vi":[36,999,269,999,328,999,21,998,37,998,169,998,218,998,271,998,330,998,213,997,171,996,201,996,207,996,208,996,219,996,268,996,270,996,327,996,329,996,26,995],"in-dl":[293,986,352,986,262,982,321,982,260,978,319,978,392,975,466,975,263,974,322,974,500,972,475,970,465,968,461,967,463,967,496,967,265,966,324,966,101,964,102,964],"in-up":[254,975,313,975,255,973,314,973,299,971,358,971,247,963,306,963,64,957,231,955,300,946,359,946,246,942,305,942,499,940,395,931,244,930,303,930,98,927,63,925],"in-rj":[98,984,250,980,309,980,300,974,359,974,247,966,306,966,299,948,358,948,254,946,313,946,395,939,499,936,246,934,255,934,305,934,314,934,243,930,302,930,248,928],"in-gj":[49,984,228,984,480,982,498,977,162,975,163,974,59,964,32,963,246,963,305,963,479,963,161,957,253,956,312,956,292,951,351,951,66,950,252,948,311,948,499,947],"in-wb":[231,975,64,973,499,973,162,964,480,964,245,963,304,963,498,957,254,956,313,956,49,954,228,954,253,947,312,947,63,946,230,946,255,943,299,943,314,943,358,943],"in-mp":[299,981,300,981,358,981,359,981,254,974,313,974,244,966,255,966,303,966,314,966,98,964,243,963,302,963,250,959,309,959,231,954,64,953,395,943,499,940,246,939],"in-tl":[292,987,351,987,66,984,395,979,253,969,312,969,162,963,252,960,311,960,250,948,309,948,299,945,358,945,254,944,313,944,499,944,480,942,163,940,245,938,304,938],"in-ke":[385,998,391,996,99,994,413,994,454,993,485,993,446,991,456,991,424,990,472,990,389,989,408,989,448,989,281,988,340,988,379,988,433,988,455,988,457,988,469,988],"in-ap":[98,982,244,980,303,980,300,972,359,972,247,959,306,959,395,959,248,948,307,948,299,945,358,945,254,944,313,944,499,943,292,936,351,936,66,933,255,932,314,932],"in-br":[31,966,62,961,229,960,48,958,227,958,300,923,359,923,244,918,303,918,247,913,306,913,296,912,355,912,98,905,295,905,354,905,255,900,314,900,250,898,309,898],"in-pb":[253,992,312,992,162,973,292,973,351,973,66,969,32,965,163,961,248,960,307,960,480,955,67,951,245,948,304,948,499,945,395,942,479,940,246,939,305,939,498,937],"in-hr":[252,992,311,992,162,981,292,981,351,981,66,977,163,969,248,969,307,969,480,963,32,958,245,956,304,956,499,953,395,950,479,948,246,947,305,947,498,945,67,943],"in-or":[255,987,314,987,299,986,358,986,243,975,302,975,231,974,247,974,306,974,64,972,300,965,359,965,499,965,246,956,305,956,395,956,98,952,244,946,303,946,248,944],"in-as":[254,987,313,987,299,981,358,981,243,973,302,973,231,968,247,966,306,966,64,965,300,959,359,959,499,956,395,946,98,943,246,943,305,943,294,941,353,941,65,935],"br-rj":[386,997,458,997,382,996,415,996,417,995,459,994,52,992,286,992,345,992,396,992,379,991,455,991,457,991,481,991,484,991,486,991,397,990,418,990,258,989,317,989],"br-mg":[474,996,449,995,436,993,388,992,410,992,79,991,430,991,381,990,434,990,441,990,444,990,462,990,488,990,495,990,389,989,408,989,277,988,280,988,281,988,336,988],"br-rs":[397,998,402,997,421,997,426,997,420,996,445,996,470,996,478,996,278,995,337,995,379,995,457,995,455,994,481,994,486,994,407,993,448,993,259,992,318,992,380,992],"br-pr":[384,997,429,996,406,995,76,994,422,994,437,994,280,993,339,993,381,993,397,993,409,993,258,992,317,992,421,992,427,992,444,991,445,991,379,990,389,990,408,990],"br-ba":[466,998,262,994,321,994,500,994,475,992,265,988,324,988,476,987,501,987,101,986,34,983,263,983,322,983,477,982,293,981,352,981,465,980,242,978,301,978,100,975],"br-sc":[416,999,403,998,401,995,418,995,235,993,380,993,396,993,484,993,72,992,432,992,407,991,278,990,337,990,373,990,378,990,404,990,417,990,256,988,315,988,371,988],"br-pe":[260,994,319,994,466,993,500,990,475,988,293,986,352,986,465,986,265,984,324,984,101,982,242,982,301,982,476,982,501,982,263,979,322,979,392,978,34,977,477,977],"br-ce":[293,988,352,988,500,986,266,985,325,985,475,984,260,983,319,983,466,983,265,980,324,980,262,979,321,979,101,978,476,978,501,978,242,974,301,974,477,973,34,967],"br-go":[442,999,491,999,443,997,451,997,440,996,468,996,494,995,497,995,390,994,393,994,435,994,471,994,423,993,431,993,464,993,490,993,493,993,277,991,336,991,387,990],"br-pa":[501,999,101,998,476,998,475,993,500,991,260,988,319,988,466,988,100,984,262,984,321,984,96,982,263,980,266,980,322,980,325,980,477,978,34,972,465,971,293,970],"br-am":[263,985,322,985,501,981,265,980,324,980,476,980,101,979,59,976,475,975,479,975,161,973,293,973,352,973,500,973,466,970,260,969,319,969,100,965,262,964,321,964],"br-df":[370,994,60,993,284,993,343,993,46,992,224,992,75,991,365,990,367,990,376,990,404,990,196,989,373,989,368,988,195,987,283,987,342,987,51,985,198,985,363,985],"au-vc":[171,999,270,999,329,999,26,998,156,998,165,998,218,998,35,997,155,996,158,996,170,996,208,996,220,996,241,996,269,996,328,996,11,995,15,995,20,995,21,995],"au-ql":[241,999,271,999,330,999,21,998,36,998,37,998,218,998,169,997,213,997,171,996,201,996,208,996,219,996,268,996,270,996,327,996,329,996,26,995,207,995,211,995],"au-wa":[268,999,327,999,26,998,171,998,218,998,156,997,165,997,35,996,158,996,170,996,220,996,241,996,269,996,271,996,328,996,330,996,11,995,15,995,20,995,36,995],"au-sa":[37,999,269,999,328,999,169,998,241,998,36,997,201,997,213,997,218,997,219,997,21,996,211,996,214,996,270,996,329,996,268,995,327,995,171,994,181,994,207,994],"au-ts":[181,1000,175,999,237,999,54,998,174,998,210,998,197,997,276,997,335,997,172,996,179,996,201,996,209,996,219,995,23,994,166,994,169,994,191,994,206,994,212,994],"kr-gg":[159,998,212,998,209,997,23,996,172,996,210,995,211,995,214,995,175,994,201,994,207,994,213,994,219,994,21,993,169,993,181,993,197,993,237,993,272,993,331,993],"kr-bs":[166,999,173,999,179,999,203,999,191,998,206,998,215,998,174,997,177,997,182,997,197,997,275,997,276,997,334,997,335,997,54,996,185,996,216,996,175,995,176,995],"kr-dg":[177,999,216,999,173,998,176,998,185,998,189,998,190,998,191,998,193,998,203,998,206,998,215,998,217,998,166,997,179,997,186,997,274,997,333,997,178,996,182,996],"kr-ic":[174,1000,54,999,197,999,175,998,181,998,237,998,166,997,179,997,210,997,272,997,274,997,331,997,333,997,23,996,172,996,173,996,191,996,203,996,206,996,215,996],"mx-jl":[423,997,431,997,490,997,79,996,387,995,394,994,414,994,87,993,388,992,94,991,264,991,323,991,411,991,430,991,434,991,441,991,462,991,488,991,442,990,491,990],"mx-nl":[402,996,407,996,420,996,426,996,72,995,258,995,317,995,380,995,432,995,470,995,478,995,235,994,397,993,421,993,378,992,445,992,371,991,374,991,379,991,418,991],"mx-mx":[93,995,102,989,103,988,285,986,344,986,393,986,471,986,467,985,487,985,493,985,440,984,450,984,460,984,463,984,468,984,492,984,439,983,461,983,496,983,497,983],"mx-bc":[409,999,427,999,422,998,437,998,444,997,281,996,340,996,384,996,389,996,406,996,408,996,429,996,433,995,469,995,424,994,472,994,259,993,318,993,446,993,456,993],"mx-qr":[433,1000,389,999,408,999,469,999,424,998,444,998,472,998,280,996,339,996,409,996,427,996,453,996,473,996,422,994,437,994,406,993,384,992,391,992,410,992,413,992],"jo":[279,986,338,986,487,986,412,984,93,981,94,981,387,981,411,981,394,980,102,978,447,978,425,977,103,976,277,976,336,976,423,976,431,976,490,976,393,975,414,975],"rs":[71,991,233,990,383,990,52,989,286,989,345,989,40,984,70,981,234,981,396,981,417,981,484,981,256,980,315,980,386,979,418,979,458,979,258,978,317,978,382,978],"tn":[263,988,322,988,242,986,262,986,301,986,321,986,260,981,319,981,466,979,500,976,475,974,266,973,325,973,465,972,265,970,324,970,392,969,501,969,101,968,476,968],"rw":[232,983,65,982,231,955,64,953,63,947,230,946,255,941,314,941,246,937,305,937,498,931,254,930,313,930,480,929,299,928,358,928,245,927,304,927,499,925,243,917],"sn":[296,987,355,987,62,914,229,913,251,905,310,905,48,904,227,903,31,871,300,844,359,844,244,830,303,830,98,829,247,825,306,825,255,821,314,821,299,820,358,820],"ci":[295,987,354,987,251,912,310,912,48,911,227,910,62,903,229,903,31,878,300,851,359,851,244,837,303,837,98,835,247,832,306,832,255,829,314,829,299,825,358,825],"lk":[390,993,435,992,464,992,494,990,443,989,264,988,323,988,388,987,442,987,491,987,79,986,257,986,316,986,410,986,430,986,434,986,436,986,441,986,462,986,488,986],"mm":[97,924,93,923,96,923,68,921,100,921,230,919,63,918,103,918,279,918,338,918,50,914,226,914,89,913,95,913,285,912,344,912,34,911,87,909,477,909,487,909],"kh":[254,986,313,986,247,981,255,981,306,981,314,981,300,972,359,972,243,971,302,971,231,968,64,967,395,959,98,957,499,956,244,948,303,948,248,945,250,945,307,945],"np":[98,982,247,981,306,981,244,974,303,974,250,972,299,972,309,972,358,972,254,965,313,965,255,959,314,959,231,946,243,946,302,946,64,944,395,935,499,932,248,923],"cn-sz":[239,998,55,997,53,996,56,996,74,996,287,996,346,996,187,995,366,992,240,991,290,991,349,991,73,990,188,990,289,990,348,990,377,990,39,989,57,989,361,989],"cn-gz2":[240,995,366,995,364,994,377,993,74,991,362,991,53,990,287,990,346,990,42,989,51,989,55,989,56,989,360,989,405,989,239,988,369,988,73,987,223,987,16,986],"cn-su":[405,998,51,997,364,997,369,997,377,995,42,994,240,993,196,992,361,991,366,991,195,990,398,990,75,989,287,989,346,989,53,988,55,988,56,988,367,988,365,987],"cn-cd":[368,997,376,995,75,994,367,994,365,993,400,993,168,992,375,992,370,991,398,990,399,990,428,990,42,988,373,988,419,988,483,988,196,987,83,986,404,986,70,985],"cn-hz":[362,997,377,996,51,995,240,995,405,995,361,994,366,994,369,994,42,993,195,991,53,990,287,990,346,990,55,989,56,989,196,989,74,987,75,987,239,987,360,987],"cn-wh":[75,999,367,994,363,993,376,993,42,992,196,992,368,991,195,990,267,990,326,990,51,989,46,988,168,988,224,988,369,988,370,988,362,987,400,987,33,986,364,986],"cn-nj":[53,995,240,995,287,995,346,995,361,995,55,994,56,994,364,994,377,994,74,992,239,992,360,992,362,991,51,990,187,990,16,989,369,989,405,989,42,988,223,988],"cn-nb":[376,998,368,996,75,995,196,994,363,994,365,994,400,994,375,993,195,992,267,990,326,990,369,990,370,990,398,990,399,990,428,990,42,989,51,989,60,989,284,989],"cn-qd":[376,998,363,997,367,996,400,996,375,995,75,993,399,993,428,993,398,992,365,991,419,991,483,991,196,990,370,990,168,989,373,989,404,989,70,988,195,988,234,988],"cn-wx":[51,999,362,997,405,997,42,995,364,994,377,994,240,993,398,993,196,992,195,990,367,990,75,989,366,989,361,988,365,988,376,988,53,987,55,987,287,987,346,987],"cn-cs":[267,994,326,994,373,994,60,993,284,993,343,993,376,992,404,992,46,991,224,991,363,991,75,990,367,990,368,990,84,988,365,988,400,987,375,986,401,986,372,985],"cn-zz":[374,998,86,996,164,996,482,996,72,995,378,995,235,994,372,994,380,993,432,992,278,991,337,991,407,991,401,990,261,988,320,988,258,987,317,987,373,987,402,987],"cn-fz":[374,996,371,994,482,994,378,993,72,992,235,992,380,992,164,991,373,991,404,991,432,991,86,990,407,990,401,989,60,988,278,988,284,988,337,988,343,988,258,986],"cn-jn":[404,998,370,994,375,992,401,992,372,991,84,990,261,990,320,990,374,990,267,989,326,989,368,989,399,989,400,989,416,989,428,989,60,988,168,988,284,988,343,988],"cn-hf":[371,998,372,996,164,995,482,995,72,994,378,994,86,993,235,993,380,992,432,992,278,991,337,991,373,990,407,990,401,989,404,988,261,987,320,987,258,986,317,986],"cn-nt":[399,998,400,998,428,997,419,996,368,995,483,995,376,994,404,994,367,993,70,992,168,992,234,992,363,992,373,992,398,990,75,988,401,988,196,987,365,986,370,986],"cn-dl":[367,998,368,998,363,995,400,995,75,994,375,994,365,993,196,992,370,992,399,992,398,991,428,991,195,990,267,990,326,990,419,990,60,989,483,989,42,988,51,988],"cn-xm":[240,998,364,996,362,995,405,995,51,994,366,994,369,994,361,993,53,992,55,992,56,992,287,992,346,992,195,991,239,991,360,990,42,989,196,989,398,988,187,987],"cn-dg":[380,998,235,997,432,997,482,997,72,996,407,996,371,995,374,994,372,993,278,992,337,992,401,992,402,992,420,992,426,992,470,992,86,991,164,991,403,991,416,991],"cn-yc":[455,1000,457,1000,481,1000,486,1000,421,998,448,998,397,997,445,997,446,996,456,996,258,995,317,995,426,995,485,995,402,994,413,994,420,994,454,994,470,994,478,994],"cn-wz":[432,999,378,998,407,998,235,997,72,996,278,995,337,995,482,995,402,994,420,994,426,994,261,993,320,993,371,993,403,993,416,993,470,993,478,993,258,992,317,992],"cn-km":[495,995,259,993,318,993,384,991,257,990,316,990,429,990,449,990,474,990,406,989,76,988,422,988,437,988,280,987,339,987,388,987,397,987,409,987,410,987,436,987],"cn-cc":[386,997,415,997,459,997,256,996,315,996,458,994,417,992,446,991,456,991,413,990,448,990,485,990,52,989,286,989,345,989,396,989,454,989,484,989,379,988,385,988],"cn-sy":[71,998,233,998,52,995,286,995,345,995,396,991,484,991,288,990,347,990,418,989,417,988,256,987,261,987,315,987,320,987,419,987,416,986,483,986,168,985,258,985],"cn-nc":[406,998,429,998,259,997,318,997,422,997,437,997,76,996,280,996,339,996,409,995,427,995,444,993,281,992,340,992,379,992,389,992,408,992,455,992,457,992,481,992],"cn-sjz":[249,998,308,998,391,998,413,995,454,995,485,995,456,993,99,992,424,992,446,992,472,992,389,991,408,991,448,991,281,990,340,990,379,990,433,990,457,990,459,990],"cn-ty":[415,999,256,997,315,997,382,997,458,997,417,995,459,995,396,992,448,992,484,992,379,991,446,991,455,991,456,991,457,991,481,991,486,991,52,990,286,990,345,990],"cn-nn":[394,999,277,995,336,995,423,995,431,995,490,995,412,993,414,993,440,993,468,993,79,992,497,992,87,991,388,991,487,991,94,990,264,990,323,990,393,990,411,990],"cn-gy":[430,999,434,999,441,999,462,999,488,999,410,997,436,997,414,996,390,994,423,994,431,994,490,994,79,993,435,993,449,993,473,993,474,993,257,992,277,992,316,992],"cn-hhht":[408,1000,281,999,340,999,433,999,469,999,472,998,424,997,444,997,280,996,339,996,409,996,473,996,427,995,453,995,422,994,437,994,384,992,406,992,429,992,447,992],"cn-lz":[435,999,464,999,494,997,443,996,264,994,323,994,388,994,491,994,297,993,356,993,430,993,434,993,442,993,488,993,441,992,451,992,462,992,436,991,410,990,440,990],"cn-hk2":[385,998,249,996,308,996,413,996,454,996,485,996,446,995,456,994,472,994,424,993,448,993,281,992,340,992,433,992,469,992,481,992,379,991,389,991,408,991,453,991],"cn-xn":[465,992,461,991,463,991,496,991,102,986,450,984,460,984,467,984,477,984,492,984,439,982,34,980,438,979,452,979,489,979,262,978,321,978,103,975,242,975,279,975],"cn-yc2":[493,1000,471,999,497,998,440,997,468,997,451,996,264,994,323,994,442,994,491,994,438,993,452,993,489,993,443,992,394,991,494,991,387,990,439,990,390,989,435,989],"cn-wlmq":[387,999,423,996,431,996,490,996,277,994,336,994,414,994,412,993,440,993,468,993,497,993,487,992,79,991,388,991,393,991,430,991,434,991,441,991,451,991,462,991],"cn-ls":[248,979,307,979,292,966,351,966,499,965,66,963,480,962,162,959,250,959,299,959,309,959,358,959,254,956,313,956,98,953,253,950,312,950,255,946,314,946,498,945],"cn-ty2":[484,1000,418,998,417,997,403,995,458,995,402,994,416,994,420,994,426,994,261,993,320,993,470,993,478,993,256,992,315,992,386,992,415,992,383,991,401,991,258,990],"cn-xt":[421,999,445,999,258,998,317,998,379,997,455,997,457,997,481,997,486,997,402,996,420,996,426,996,448,995,470,995,478,995,456,994,259,993,278,993,318,993,337,993],"cn-cz":[369,993,42,992,51,992,70,992,234,992,368,992,376,991,400,991,405,991,362,990,363,990,367,990,375,990,377,988,399,988,428,988,364,987,240,986,419,986,483,986],"cn-jx2":[428,1000,375,998,419,998,483,998,400,996,70,993,168,993,234,993,368,993,376,992,404,991,363,990,367,990,401,990,373,989,398,988,75,986,196,986,372,986,403,986],"cn-zy":[375,998,428,997,368,996,399,996,376,995,483,995,367,994,419,994,363,993,398,991,404,991,70,990,168,990,234,990,75,989,196,989,373,989,195,987,365,987,370,987],"cn-yz":[403,996,416,996,261,995,320,995,404,994,418,993,482,993,373,992,378,992,419,992,483,992,235,991,396,991,484,991,72,990,371,990,399,990,428,990,432,990,372,989],"cn-hs":[420,1000,426,1000,470,999,478,999,258,997,317,997,421,997,445,997,278,996,337,996,397,996,407,996,455,995,486,995,379,994,380,994,396,994,432,994,457,994,481,994],"cn-zs":[416,999,261,998,320,998,401,996,418,996,396,995,484,995,380,993,432,993,235,992,72,991,378,991,407,991,417,991,404,990,482,990,458,989,278,988,337,988,373,988],"cn-fs":[373,998,375,994,401,994,370,992,372,991,399,991,400,991,416,991,428,991,60,990,261,990,267,990,284,990,320,990,326,990,343,990,403,990,368,989,419,989,483,989],"cn-zh":[362,998,369,997,51,996,364,995,377,995,240,994,196,993,42,992,195,991,398,991,361,989,366,989,53,988,55,988,56,988,287,988,346,988,367,987,75,986,239,986],"cn-pt":[429,1000,384,998,422,998,437,998,427,997,280,996,339,996,409,996,259,995,318,995,76,994,444,994,495,994,281,993,340,993,379,993,433,993,455,993,457,993,469,993],"cn-qz":[380,998,432,998,235,996,278,996,337,996,378,996,402,996,420,996,426,996,470,995,478,995,72,994,482,994,258,993,317,993,397,993,421,993,445,993,416,992,418,992],"cn-ly":[389,1000,281,999,340,999,433,999,469,999,424,998,444,998,472,998,280,996,339,996,409,996,427,995,453,995,473,995,422,994,437,994,447,993,384,992,406,992,413,992],"cn-zy2":[427,1000,280,999,339,999,422,998,437,998,444,998,281,996,340,996,389,996,406,996,408,996,429,996,433,996,469,996,384,995,472,995,424,994,259,993,318,993,446,993],"cn-xz2":[436,1000,430,998,434,998,441,998,462,998,488,998,388,997,449,997,474,997,414,994,424,993,472,993,257,992,281,992,316,992,340,992,423,992,431,992,433,992,453,992],"cn-ha2":[94,999,447,997,412,996,453,994,473,994,423,993,431,993,490,993,424,992,472,992,277,991,336,991,408,991,414,991,281,990,340,990,387,990,389,990,394,990,425,990],"cn-bd":[94,996,411,996,447,994,387,993,394,993,425,993,423,990,431,990,453,990,473,990,490,990,277,988,336,988,408,988,414,988,424,988,472,988,69,987,236,987,281,987],"cn-ts":[485,1000,454,999,446,997,456,997,391,996,448,996,385,995,249,994,308,994,379,994,455,994,457,994,481,994,486,994,444,993,281,992,340,992,397,992,408,992,421,992],"cn-ly2":[423,998,431,997,490,997,79,996,388,996,430,996,434,996,441,996,462,996,488,996,277,994,336,994,394,994,410,994,436,994,387,993,443,993,447,993,94,991,411,991],"cn-wf":[386,999,382,997,458,997,256,996,315,996,417,996,459,994,448,993,379,992,396,992,457,992,484,992,446,991,455,991,456,991,481,991,486,991,397,990,413,990,418,990],"cn-yt":[261,999,320,999,403,999,401,996,418,996,396,994,484,994,235,993,380,993,432,993,407,992,72,991,378,991,404,991,417,991,278,989,337,989,373,989,458,989,482,989],"cn-zb":[458,998,396,997,415,996,484,996,256,995,315,995,386,995,418,994,421,994,397,993,445,993,382,992,379,991,403,991,416,991,455,991,457,991,481,991,486,991,258,990],"cn-jh":[396,998,484,997,403,996,416,996,261,995,320,995,417,994,401,993,402,992,407,992,426,992,458,992,278,991,337,991,420,991,470,991,478,991,256,990,315,990,380,990],"cn-sx2":[483,1000,399,998,428,998,375,996,400,994,70,993,168,993,234,993,401,992,368,991,376,990,404,989,363,988,367,988,403,988,416,988,261,987,320,987,373,987,383,987],"cn-yc3":[402,1000,426,1000,470,1000,478,999,421,997,445,997,258,996,278,996,317,996,337,996,397,996,407,996,432,995,455,995,486,995,379,994,380,994,396,994,457,994,481,994],"cn-xy":[445,1000,397,999,379,998,455,998,457,998,481,998,486,998,258,997,317,997,402,997,420,997,426,996,448,996,470,996,478,996,456,995,417,994,446,994,278,993,337,993],"cn-zz2":[437,1000,280,998,339,998,406,998,409,998,427,998,429,998,384,997,444,996,433,995,259,994,281,994,318,994,340,994,389,994,408,994,469,994,424,993,448,993,472,993],"cn-hy":[431,1000,490,1000,414,998,277,997,336,997,394,996,387,995,79,994,388,994,430,994,434,994,441,994,442,994,462,994,488,994,94,993,264,993,323,993,411,993,491,993],"cn-yy":[472,1000,281,998,340,998,408,998,433,998,469,998,473,998,389,997,444,997,453,997,447,995,280,994,339,994,409,994,427,994,436,994,391,993,410,993,422,993,437,993],"cn-dt":[412,993,69,992,236,992,411,990,94,989,391,989,447,988,82,987,385,987,394,987,81,986,249,986,308,986,387,986,413,986,454,986,485,986,77,985,453,985,473,985],"cn-tz":[402,1000,420,1000,470,999,478,999,258,997,317,997,445,997,278,996,337,996,397,996,407,996,421,996,379,995,455,995,457,995,486,995,380,994,396,994,432,994,481,994],"cn-ls2":[409,1000,280,999,339,999,422,998,437,998,406,997,429,997,444,997,281,996,340,996,433,996,469,996,384,995,389,995,408,995,424,994,446,994,472,994,456,993,259,992],"cn-hz2":[399,1000,419,998,483,998,375,997,400,997,70,993,234,993,368,993,168,992,376,991,404,991,363,990,367,990,401,990,373,989,398,988,196,986,372,986,403,986,416,986],"cn-zz3":[406,1000,384,998,422,998,437,998,427,997,259,996,280,996,318,996,339,996,409,996,444,995,76,994,455,994,486,994,379,993,433,993,457,993,469,993,481,993,495,993],"cn-lz2":[434,1000,441,1000,462,1000,488,1000,388,999,410,998,436,998,414,996,431,995,490,995,423,994,449,994,473,994,474,994,390,993,435,993,453,993,464,993,79,992,472,992],"cn-gl":[423,1000,490,1000,277,997,336,997,414,997,394,996,387,995,430,995,79,994,388,994,434,994,441,994,462,994,488,994,94,993,264,993,323,993,411,993,442,993,491,993],"cn-wh2":[380,999,407,998,235,997,378,997,72,996,482,996,278,995,337,995,420,995,402,994,426,994,470,994,478,994,403,993,416,993,261,992,320,992,371,992,374,992,258,991],"cn-bb":[281,1000,340,1000,469,1000,389,999,408,999,424,998,444,998,472,998,409,996,427,996,453,996,473,996,280,995,339,995,422,995,437,995,406,993,429,993,447,993,391,992],"cn-aq":[430,1000,441,1000,462,1000,488,1000,388,999,410,998,436,998,414,996,474,995,423,994,431,994,435,994,449,994,464,994,473,994,490,994,390,993,453,993,79,992,494,992],"cn-yb":[464,1000,390,999,494,998,443,997,442,995,491,995,264,994,323,994,434,994,488,994,388,993,430,993,441,993,451,993,462,993,297,992,356,992,436,992,410,991,440,991],"cn-dy":[410,1000,430,998,434,998,441,998,462,998,488,998,388,997,474,997,449,996,414,994,424,994,472,994,257,993,316,993,281,992,340,992,423,992,431,992,433,992,435,992],"cn-my":[422,1000,280,998,339,998,406,998,409,998,427,998,429,998,384,997,444,996,433,995,469,995,259,994,281,994,318,994,340,994,389,994,408,994,448,994,76,993,424,993],"cn-nch":[452,1000,489,1000,439,997,467,995,450,994,460,994,471,994,492,994,393,993,493,993,102,991,440,991,468,991,497,991,451,990,442,988,491,988,264,987,323,987,443,986],"cn-dz":[450,998,460,998,467,998,492,998,438,997,452,997,489,996,102,994,393,990,471,990,493,990,440,988,468,988,497,988,451,987,461,986,463,986,496,986,442,985,487,985],"cn-gy2":[468,1000,497,999,451,998,393,997,471,997,493,997,264,996,323,996,442,996,491,996,443,994,387,993,394,993,494,992,435,991,438,991,452,991,464,991,489,991,390,990],"cn-jdz":[430,1000,434,1000,462,1000,488,1000,388,999,410,998,436,998,414,996,449,995,474,995,423,994,431,994,453,994,464,994,490,994,435,993,473,993,79,992,390,992,494,992],"cn-zj2":[491,1000,264,999,323,999,443,998,451,998,440,996,468,996,494,996,497,996,435,995,471,995,393,994,423,994,464,994,493,994,390,993,431,993,490,993,414,991,277,990],"cn-mm":[442,998,491,998,494,998,264,997,323,997,435,997,464,997,390,996,451,996,440,994,468,994,497,994,414,993,471,993,393,992,493,992,423,991,431,991,488,991,490,991],"cn-st":[281,998,340,998,408,998,409,998,433,998,469,998,280,997,339,997,389,997,424,997,427,997,422,996,437,996,472,996,429,995,473,995,406,994,453,994,454,994,384,993],"cn-jm":[421,1000,397,999,455,998,486,998,379,997,402,997,420,997,426,997,457,997,481,997,258,996,317,996,448,996,470,996,478,996,456,995,446,994,407,993,417,993,454,993],"cn-qhd":[456,1000,448,998,454,998,413,997,455,997,481,997,485,997,486,997,379,996,457,996,391,995,421,994,427,994,445,994,280,993,339,993,397,993,409,993,385,992,422,992],"cn-cz2":[94,997,411,997,473,997,453,996,424,995,412,994,472,994,408,993,414,993,433,993,469,993,281,992,340,992,389,992,423,991,431,991,444,991,490,991,388,990,430,990],"cn-lf":[379,998,446,998,455,998,456,998,457,998,481,998,486,998,413,996,421,996,445,996,454,996,485,996,397,995,437,994,258,993,317,993,391,993,402,993,415,993,420,993],"cn-hs2":[474,1000,410,997,436,996,257,995,316,995,441,995,462,995,495,995,430,994,434,994,488,994,388,993,444,993,433,992,469,992,281,991,340,991,389,991,408,991,409,991],"cn-mz":[460,1000,467,1000,492,1000,439,998,102,996,452,995,489,995,438,994,393,988,461,988,463,988,471,988,493,988,496,988,487,987,440,986,468,986,497,986,451,985,103,984],"cn-sg":[440,998,442,998,468,998,491,998,497,998,264,997,323,997,393,996,443,996,471,996,493,996,494,995,435,993,464,993,390,992,423,992,431,992,490,992,394,991,387,990],"cn-qy":[438,1000,489,1000,439,997,450,995,460,995,492,995,467,994,471,994,493,994,393,993,440,991,468,991,497,991,102,990,451,990,442,988,491,988,264,987,323,987,443,986],"cn-hb2":[473,1000,424,997,472,997,281,996,340,996,433,996,447,996,469,996,389,995,408,995,411,994,441,994,444,994,462,994,94,993,430,993,434,993,488,993,388,992,409,992],"cn-sq":[485,1000,413,999,446,998,456,998,391,996,448,996,385,995,455,995,486,995,379,994,444,994,457,994,481,994,249,993,308,993,445,993,421,992,433,992,469,992,281,991],"cn-ha3":[379,1000,457,1000,481,1000,486,1000,421,998,445,998,448,998,397,997,446,997,456,997,402,995,420,995,426,995,454,995,258,994,317,994,413,994,429,994,458,994,470,994],"cn-lj":[446,1000,448,998,454,998,413,997,455,997,485,997,486,997,379,996,457,996,481,996,421,995,445,995,391,994,397,994,280,993,339,993,385,993,409,993,427,993,422,992],"cn-yz2":[379,1000,455,1000,481,1000,486,1000,421,998,448,998,397,997,445,997,446,996,456,996,258,995,317,995,426,995,485,995,402,994,413,994,420,994,454,994,470,994,478,994],"cn-dq":[417,998,256,997,315,997,386,997,415,997,396,995,484,995,382,994,455,994,481,994,486,994,379,993,457,993,418,992,448,992,459,992,421,991,445,991,446,991,52,990],"cn-hrb":[382,997,386,995,256,994,315,994,415,994,458,992,413,991,454,991,485,991,385,990,417,990,446,989,456,989,391,988,52,987,81,987,99,987,249,987,286,987,308,987],"cn-ly3":[450,1000,467,1000,492,1000,439,998,102,995,452,995,489,995,438,994,393,988,461,988,463,988,471,988,493,988,496,988,487,987,440,986,468,986,497,986,451,985,103,984],"cn-ey":[463,1000,496,1000,392,991,102,990,450,988,460,988,465,988,467,988,492,988,439,986,103,984,279,983,338,983,438,983,452,983,489,983,477,980,93,979,97,978,393,977],"cn-bh":[430,1000,434,1000,441,1000,488,1000,388,999,410,998,436,998,414,996,449,995,474,995,423,994,431,994,453,994,464,994,490,994,435,993,473,993,79,992,390,992,494,992],"cn-yl":[461,1000,496,1000,102,991,392,991,450,988,460,988,465,988,467,988,492,988,439,986,103,984,279,984,338,984,438,983,452,983,489,983,477,980,93,979,97,978,471,977],"cn-zh2":[435,1000,390,999,494,998,443,997,491,995,434,994,441,994,442,994,462,994,488,994,264,993,323,993,430,993,451,993,297,992,356,992,388,992,410,992,436,992,440,991],"cn-qj":[392,992,477,991,34,988,461,988,463,988,496,988,262,986,321,986,103,983,466,982,100,980,260,980,319,980,102,979,500,979,96,977,97,977,450,977,460,977,467,977],"cn-dl2":[260,998,319,998,500,996,475,995,262,993,321,993,476,989,501,989,265,988,324,988,101,987,477,984,263,983,322,983,465,982,34,980,293,979,352,979,242,975,301,975],"cn-zyt":[450,1000,460,1000,492,1000,439,998,102,996,438,995,452,994,489,994,393,988,461,988,463,988,471,988,493,988,496,988,487,987,440,986,468,986,497,986,103,985,279,985],"cn-gs2":[440,1000,497,999,451,998,393,997,471,997,493,997,264,996,323,996,442,996,491,996,443,994,387,993,394,993,494,992,435,991,438,991,452,991,464,991,489,991,390,990],"cn-jz":[433,1000,281,999,340,999,389,999,408,999,424,998,444,998,472,998,409,996,427,996,453,996,473,996,280,995,339,995,437,995,422,994,406,993,429,993,447,993,391,992],"cn-ez":[420,1000,478,1000,402,999,426,999,258,996,317,996,421,996,445,996,278,995,337,995,397,995,407,995,379,994,432,994,455,994,457,994,481,994,484,994,486,994,380,993],"cn-hg":[493,1000,393,999,497,998,440,997,468,997,451,996,442,995,264,994,323,994,438,994,452,994,491,994,443,993,489,993,394,991,494,991,387,990,439,990,435,989,464,989],"cn-xf":[424,1000,281,998,340,998,389,998,408,998,433,998,469,998,473,998,453,997,444,996,409,995,280,994,339,994,391,994,427,994,436,994,447,994,410,993,422,993,437,993],"cn-bj2":[453,1000,424,998,472,998,447,997,281,996,340,996,389,996,433,996,469,996,408,995,444,995,411,994,430,994,434,994,488,994,94,993,388,993,441,993,462,993,280,992],"cn-yl2":[449,1000,410,997,436,997,257,996,316,996,434,995,441,995,462,995,488,995,430,994,495,994,388,993,444,993,433,992,469,992,280,991,281,991,339,991,340,991,389,991],"cn-ts2":[500,998,466,995,476,995,501,995,265,993,324,993,101,992,260,992,319,992,262,988,321,988,477,985,263,984,322,984,100,978,465,977,34,976,96,975,266,975,325,975],"cn-ww":[501,1000,265,998,324,998,101,997,475,995,500,992,466,989,260,987,319,987,100,983,262,982,321,982,96,980,266,980,325,980,477,980,263,978,322,978,34,971,465,971],"cn-zy3":[34,991,465,991,100,988,500,987,96,985,97,985,475,985,392,984,466,984,260,982,319,982,461,980,463,980,476,980,496,980,501,980,101,978,265,978,324,978,262,977],"cn-klmy":[470,1000,402,999,420,999,426,999,258,996,317,996,421,996,445,996,278,995,337,995,397,995,407,995,379,994,432,994,455,994,457,994,481,994,486,994,380,993,396,993],"cn-aks":[161,975,266,975,325,975,59,973,498,971,163,967,480,964,245,963,304,963,263,961,322,961,101,958,476,957,501,957,265,956,324,956,67,954,475,952,162,951,32,950],"cn-ks":[245,982,304,982,498,982,162,972,49,969,228,969,499,965,246,964,305,964,479,964,253,963,312,963,395,962,163,957,252,955,311,955,59,954,292,954,351,954,66,951],"cn-bt":[379,1000,455,1000,457,1000,486,1000,421,998,448,998,397,997,445,997,446,997,456,996,258,994,317,994,402,994,413,994,420,994,426,994,454,994,458,994,470,994,478,994],"cn-erds":[378,997,371,996,432,996,235,995,374,995,380,995,72,994,372,994,407,994,401,993,164,992,86,991,278,991,337,991,402,991,420,991,426,991,470,991,478,991,403,990],"cn-wh3":[419,1000,399,998,428,998,375,995,400,995,70,993,168,993,234,993,401,992,368,991,376,989,404,989,363,988,367,988,403,988,416,988,261,987,320,987,373,987,40,986],"cn-rz":[396,1000,418,997,417,996,403,995,458,995,416,994,420,994,470,994,261,993,320,993,402,993,426,993,478,993,386,992,415,992,256,991,315,991,383,991,401,991,258,990],"cn-jn2":[413,1000,454,1000,446,997,456,997,391,996,448,996,379,995,385,995,457,995,455,994,481,994,486,994,249,993,308,993,444,993,397,992,408,992,421,992,433,992,445,992],"cn-ta":[379,1000,455,1000,457,1000,481,1000,421,998,445,998,448,998,397,997,446,997,456,997,402,995,420,995,426,995,454,995,258,994,317,994,413,994,429,994,458,994,470,994],"cn-yc4":[394,992,387,991,423,989,431,989,490,989,393,988,471,988,493,988,414,987,450,987,460,987,467,987,492,987,277,986,285,986,336,986,344,986,440,986,468,986,497,986],"cn-cz3":[430,1000,434,1000,441,1000,462,1000,388,999,410,998,436,998,414,996,474,995,423,994,431,994,435,994,449,994,464,994,473,994,490,994,390,993,453,993,79,992,494,992],"cn-ld":[438,1000,452,1000,439,996,450,995,460,995,492,995,467,994,493,994,393,993,471,993,497,992,440,991,468,991,102,990,451,990,442,988,491,988,264,987,323,987,443,986],"cn-xx":[423,1000,431,1000,277,997,336,997,414,997,394,996,387,995,430,995,79,994,388,994,434,994,441,994,462,994,488,994,94,993,264,993,323,993,411,993,442,993,491,993],"cn-ly4":[442,1000,264,999,323,999,443,998,451,998,497,997,440,996,468,996,494,996,435,995,464,995,493,995,390,994,393,994,471,994,423,993,431,993,490,993,414,991,277,990],"cn-nc2":[450,1000,460,1000,467,1000,439,998,102,995,452,995,489,995,438,994,393,988,461,988,463,988,471,988,493,988,496,988,487,987,440,986,468,986,497,986,451,985,103,984],"cn-zg":[393,1000,471,1000,497,998,440,997,468,997,451,996,491,995,442,994,452,994,489,994,264,993,323,993,438,993,443,992,394,991,494,991,387,990,439,990,435,989,464,989],"cn-ls3":[435,998,443,998,464,998,390,997,442,996,491,996,264,995,323,995,451,995,497,993,430,992,434,992,440,992,441,992,462,992,468,992,488,992,388,991,393,991,414,991],"cn-pzh":[381,995,449,995,406,994,474,994,429,993,384,992,422,992,410,991,436,991,437,991,257,990,316,990,409,990,427,990,259,989,280,989,318,989,339,989,430,989,434,989],"cn-gy3":[461,1000,463,1000,392,991,102,990,450,988,460,988,465,988,467,988,492,988,439,986,103,983,279,983,338,983,438,983,452,983,489,983,477,980,93,979,97,978,393,977],"cn-my2":[440,999,468,999,393,998,451,998,471,998,493,998,491,997,442,996,264,995,323,995,443,994,394,993,494,993,387,992,489,992,435,991,438,991,452,991,464,991,390,990],"cn-ab":[480,982,245,977,304,977,479,971,49,963,163,963,228,963,59,961,499,958,246,957,305,957,162,953,63,949,230,948,161,947,266,947,325,947,32,946,253,945,312,945],"cn-gz3":[246,973,305,973,231,966,254,965,313,965,395,965,480,965,64,964,162,962,498,958,292,957,351,957,255,956,299,956,314,956,358,956,66,953,253,953,312,953,98,950],"cn-lj2":[475,998,466,996,260,994,319,994,476,992,501,992,265,991,324,991,101,990,262,990,321,990,477,987,263,986,322,986,465,979,34,978,293,976,352,976,100,975,96,973],"cn-bs":[476,1000,265,999,324,999,101,998,475,995,500,992,466,989,260,987,319,987,100,983,262,982,321,982,266,981,325,981,96,980,477,980,263,978,322,978,34,971,465,971]},"health":{"us":[142,950,123,947,133,947,135,943,141,943,122,941,110,938,148,936,112,935,116,935,111,934,126,934,132,933,124,932,108,931,152,931,149,929,125,924,140,922,150,922],"cn":[382,888,386,887,459,885,81,884,88,884,99,883,481,880,77,879,381,879,389,879,458,877,482,876,79,874,80,874,384,874,413,874,78,873,90,873,371,873,478,873],"jp":[154,973,207,956,10,955,209,944,208,942,210,941,274,934,333,934,273,929,332,929,155,921,275,909,334,909,276,895,335,895,5,852,172,842,177,837,182,833,175,832],"de":[160,982,170,980,158,978,171,976,169,973,159,966,241,956,172,955,181,954,175,948,237,946,173,943,179,943,23,932,174,926,176,924,182,916,189,916,39,915,18,914],"gb":[219,980,9,976,202,973,156,971,206,968,37,966,272,965,331,965,211,963,214,961,218,961,36,959,46,958,224,958,270,958,329,958,15,953,215,952,204,951,212,951],"fr":[183,977,182,973,184,973,185,967,188,967,189,964,186,963,21,957,187,955,157,951,174,948,180,938,177,937,272,936,331,936,74,935,269,935,328,935,176,933,54,931],"in":[14,888,246,884,305,884,245,875,304,875,59,872,162,870,161,868,32,867,250,867,253,867,309,867,312,867,49,864,228,864,252,859,311,859,163,858,248,855,307,855],"br":[256,962,315,962,257,960,316,960,264,947,323,947,258,942,259,942,317,942,318,942,47,941,225,941,69,935,236,935,164,925,261,925,320,925,12,921,285,917,344,917],"it":[13,985,166,985,191,985,190,984,193,983,192,975,11,965,194,963,199,962,167,957,200,954,268,954,327,954,25,952,165,949,35,948,201,948,15,946,24,945,198,943],"ca":[211,983,4,976,212,975,202,974,213,972,214,972,219,968,37,962,270,962,329,962,272,961,331,961,206,958,215,958,156,956,218,955,204,954,36,951,198,951,269,951],"kr":[274,975,333,975,273,968,332,968,155,959,2,955,207,953,154,952,209,946,275,943,334,943,208,942,210,940,276,932,335,932,177,833,5,832,74,832,178,830,21,819],"au":[165,981,268,977,327,977,166,974,191,973,190,969,193,969,13,968,271,968,330,968,8,965,194,964,201,964,167,963,269,962,328,962,15,957,18,956,199,956,192,953],"mx":[280,963,339,963,277,960,336,960,278,956,337,956,168,952,279,950,338,950,281,948,340,948,58,941,69,938,236,938,47,937,225,937,28,935,285,926,344,926,50,924],"es":[8,985,166,984,191,984,190,981,193,977,194,971,11,968,167,967,192,967,199,966,35,960,201,958,268,957,327,957,15,956,20,956,200,955,165,952,36,950,198,950],"id":[253,961,312,961,245,959,304,959,32,958,162,950,161,948,29,945,252,944,311,944,49,943,228,943,250,943,309,943,59,940,246,939,305,939,163,937,248,930,254,930],"nl":[36,981,37,979,35,971,199,964,268,964,327,964,192,963,271,963,330,963,198,962,190,959,193,959,218,959,20,958,269,958,270,958,328,958,329,958,11,957,166,957],"sa":[57,947,291,947,350,947,26,935,377,935,60,930,284,930,343,930,405,930,19,929,168,928,360,927,25,926,278,924,337,924,402,924,404,923,84,921,378,920,398,920],"tr":[28,961,249,954,308,954,444,951,402,949,60,948,284,948,343,948,443,947,442,944,403,942,464,942,448,941,450,940,451,940,452,940,407,939,414,939,434,939,445,939],"ch":[201,978,167,970,165,963,197,958,220,958,11,956,268,953,327,953,157,950,194,949,20,944,271,944,330,944,182,941,166,939,191,939,184,938,189,938,13,937,24,932],"pl":[84,972,240,972,53,971,287,971,346,971,42,966,51,965,373,965,238,963,370,963,83,960,383,959,371,957,368,956,57,955,291,955,350,955,386,955,80,954,88,952],"se":[220,981,35,963,268,961,327,961,15,958,167,958,201,957,13,956,165,956,166,953,191,952,194,951,37,949,199,949,11,946,18,944,197,944,190,943,193,942,8,941],"be":[183,968,182,967,184,967,189,967,271,965,330,965,188,963,185,962,5,957,174,957,186,957,269,957,328,957,180,955,37,954,54,954,157,954,218,953,272,952,331,952],"th":[30,937,66,931,249,931,292,931,308,931,351,931,58,929,297,929,356,929,293,927,352,927,450,927,50,926,226,926,452,926,281,925,340,925,67,924,463,921,280,920],"at":[241,970,237,945,169,942,170,939,73,938,3,932,173,931,160,926,176,926,175,924,171,923,174,923,158,920,21,918,39,917,38,916,179,916,159,914,181,914,182,914],"no":[194,950,166,949,191,949,8,945,35,945,193,944,167,941,11,940,13,940,201,940,190,939,197,939,268,939,327,939,192,935,25,933,165,933,18,932,20,931,220,930],"il":[192,971,26,970,193,960,360,959,190,957,36,955,200,955,199,954,377,953,8,952,198,952,166,951,191,951,37,949,15,948,405,948,269,946,328,946,364,946,57,945],"ie":[25,970,405,954,27,953,36,949,45,949,282,949,341,949,270,947,329,947,377,947,192,945,369,945,37,942,198,941,360,941,269,940,328,940,362,940,200,938,15,937],"sg":[45,971,282,971,341,971,26,953,60,927,284,927,343,927,25,924,61,924,283,924,342,924,369,923,270,920,329,920,405,920,362,919,9,918,367,917,404,916,195,913],"my":[278,963,337,963,67,962,280,962,339,962,17,961,249,961,308,961,60,950,168,950,284,950,343,950,277,948,336,948,58,947,281,947,340,947,444,943,69,941,236,941],"ph":[32,972,253,958,312,958,245,956,304,956,68,951,59,948,162,946,14,945,252,945,311,945,161,944,250,944,309,944,246,942,305,942,266,941,300,941,325,941,359,941],"vn":[242,956,301,956,163,948,450,946,463,945,68,944,252,944,311,944,59,941,67,941,263,941,322,941,452,941,476,941,248,940,307,940,32,938,22,937,477,937,500,937],"ng":[296,909,355,909,63,881,230,881,243,872,302,872,64,864,231,864,65,858,232,858,247,855,306,855,298,852,357,852,48,851,227,851,62,850,229,850,255,847,294,847],"eg":[29,972,253,968,312,968,68,963,59,962,252,962,311,962,245,961,304,961,162,959,14,958,161,954,246,953,305,953,163,951,242,949,301,949,265,944,324,944,266,943],"ar":[70,940,234,940,38,931,194,909,167,892,35,891,222,890,13,889,55,889,267,889,289,889,326,889,348,889,24,887,166,886,191,886,197,886,223,886,164,885,23,884],"za":[29,913,298,910,357,910,265,893,324,893,32,891,260,888,319,888,266,885,325,885,300,884,359,884,263,883,322,883,63,882,230,882,64,880,231,880,253,878,312,878],"dk":[15,971,36,967,194,964,20,963,13,960,166,960,191,960,220,960,37,956,190,950,193,950,8,948,192,948,167,946,268,946,327,946,11,945,24,945,201,945,199,940],"fi":[37,989,15,981,198,971,218,970,35,967,269,967,328,967,192,965,200,965,270,965,329,965,54,964,219,963,199,960,271,960,272,960,330,960,331,960,4,959,25,955],"nz":[36,989,15,979,218,977,198,974,269,974,328,974,219,970,199,969,272,969,331,969,271,968,330,968,270,967,329,967,4,966,200,965,9,962,268,961,327,961,156,960],"pt":[194,942,41,939,33,931,167,930,197,921,201,921,24,917,23,916,199,916,268,916,327,916,166,915,191,915,13,913,271,913,330,913,35,912,198,911,193,908,200,908],"cz":[237,967,73,961,238,960,176,952,53,949,287,949,346,949,173,946,366,944,365,941,180,939,239,939,51,938,55,938,289,938,348,938,74,936,179,933,174,932,170,931],"ro":[42,966,240,960,79,954,239,952,389,952,363,947,386,946,481,946,99,944,394,943,52,941,286,941,345,941,383,939,90,936,459,936,95,935,365,935,19,934,76,934],"gr":[38,939,73,907,24,902,194,898,23,893,360,889,35,885,33,884,8,882,166,881,191,881,39,880,193,878,54,877,167,877,192,876,377,876,13,875,74,875,271,875],"hu":[240,981,19,966,40,966,239,962,51,958,383,956,365,955,386,955,389,953,84,952,99,952,481,952,79,951,363,951,370,951,53,950,287,950,346,950,80,947,373,947],"ua":[395,938,101,937,288,935,347,935,392,934,79,931,98,930,389,926,56,924,290,924,349,924,394,924,42,922,97,922,103,922,78,919,102,918,40,917,51,915,386,915],"ru":[52,917,55,917,286,917,289,917,345,917,348,917,223,916,40,905,43,900,42,898,222,890,239,890,240,884,39,880,53,878,287,878,346,878,365,878,79,875,51,874],"ae":[27,971,26,949,61,947,283,947,342,947,60,932,284,932,343,932,25,925,369,924,9,923,362,921,405,921,16,918,270,916,329,916,213,914,71,913,233,913,367,913],"cl":[198,960,4,958,219,953,36,950,195,950,200,948,37,947,267,947,326,947,270,946,272,946,329,946,331,946,15,944,206,944,156,942,196,941,9,940,202,940,54,939],"co":[69,981,236,981,285,974,344,974,278,962,337,962,50,955,226,955,58,952,258,952,317,952,259,949,318,949,168,948,257,945,316,945,256,943,315,943,71,942,233,942],"pk":[243,952,302,952,247,946,306,946,255,945,314,945,65,943,232,943,62,940,229,940,244,939,303,939,251,936,310,936,254,931,313,931,298,930,357,930,250,928,309,928],"bd":[161,961,246,951,305,951,252,949,311,949,245,948,304,948,14,943,66,942,292,942,351,942,253,940,312,940,59,938,32,933,162,933,242,932,301,932,68,928,30,925],"pe":[58,982,281,966,340,966,249,957,277,957,293,957,308,957,336,957,352,957,69,956,236,956,47,955,225,955,450,954,452,954,67,953,443,953,279,952,338,952,278,951],"sk":[53,981,287,981,346,981,19,965,238,964,84,963,239,960,42,958,240,958,56,954,290,954,349,954,373,951,288,949,347,949,364,949,55,947,57,947,289,947,291,947],"bg":[40,941,223,941,239,938,55,935,289,935,348,935,42,922,44,917,221,917,240,916,222,914,51,912,39,911,53,910,287,910,288,910,346,910,347,910,43,908,79,907],"hr":[51,981,238,976,19,971,239,964,55,957,289,957,348,957,84,956,240,955,364,952,42,950,57,950,291,950,350,950,365,950,39,949,74,947,373,947,56,945,290,945],"si":[272,970,331,970,271,968,330,968,360,965,36,964,269,964,328,964,186,962,200,961,219,960,270,960,329,960,218,959,185,958,37,955,21,954,198,954,377,953,184,950],"lt":[53,957,287,957,346,957,51,947,56,946,290,946,349,946,239,940,39,938,42,936,238,936,52,935,286,935,345,935,19,931,223,928,40,924,240,924,389,922,366,921],"lv":[51,954,288,953,347,953,19,948,42,946,55,946,289,946,348,946,53,945,57,945,287,945,291,945,346,945,350,945,84,941,239,938,389,938,240,935,360,934,83,933],"ee":[360,971,377,970,361,959,84,957,19,955,238,953,53,950,287,950,346,950,83,949,398,949,75,948,362,948,405,948,16,947,51,947,25,945,54,945,56,945,290,945],"ir":[50,982,226,982,281,977,340,977,249,968,308,968,277,963,336,963,280,960,339,960,443,960,278,959,337,959,279,955,338,955,464,955,442,954,451,954,444,953,47,952],"iq":[68,978,162,975,163,970,248,967,253,967,307,967,312,967,252,966,311,966,245,965,246,965,304,965,305,965,32,962,250,962,309,962,161,961,242,961,301,961,265,960],"kw":[403,964,402,958,404,957,378,952,28,950,196,950,418,949,17,948,407,948,426,948,375,947,399,947,419,946,428,944,445,944,249,942,308,942,380,942,396,941,401,940],"qa":[45,947,282,947,341,947,27,924,60,921,284,921,343,921,71,915,233,915,369,912,26,911,405,909,362,908,16,905,398,901,46,897,224,897,25,896,367,894,168,893],"et":[65,977,232,977,295,967,354,967,251,956,310,956,247,955,306,955,243,949,255,949,302,949,314,949,294,944,353,944,244,943,303,943,48,940,64,940,227,940,231,940],"ke":[64,967,231,967,296,949,298,949,355,949,357,949,65,933,232,933,247,928,299,928,306,928,358,928,243,924,302,924,294,923,353,923,255,918,314,918,244,915,295,915],"gh":[63,967,230,967,65,964,232,964,298,957,357,957,247,953,306,953,243,948,302,948,255,945,294,945,314,945,353,945,296,944,355,944,295,943,299,943,354,943,358,943],"tz":[62,977,229,977,64,964,231,964,295,964,354,964,247,960,306,960,294,959,353,959,255,955,314,955,243,954,302,954,251,949,310,949,298,947,357,947,244,946,303,946],"ma":[266,963,325,963,265,955,324,955,263,953,322,953,68,945,252,945,279,945,311,945,338,945,161,944,32,942,49,942,228,942,242,938,301,938,59,937,262,935,321,935],"dz":[249,964,308,964,28,962,279,959,338,959,450,956,50,953,226,953,58,952,277,951,336,951,463,951,452,950,281,949,340,949,242,948,301,948,248,947,307,947,443,945],"ve":[59,978,163,975,162,972,248,972,307,972,242,970,301,970,252,969,311,969,253,968,312,968,266,966,325,966,32,963,265,963,324,963,161,962,246,955,250,955,305,955],"ec":[47,981,225,981,285,969,344,969,278,962,337,962,280,960,339,960,50,956,226,956,277,955,336,955,259,953,318,953,281,952,340,952,58,951,257,951,316,951,264,949],"uy":[33,940,35,931,267,917,326,917,194,913,16,912,164,910,8,909,13,908,192,907,191,905,258,905,317,905,15,904,166,904,190,904,51,903,193,903,36,902,46,902],"cr":[285,945,344,945,278,944,337,944,69,943,236,943,47,942,196,942,225,942,195,941,168,940,404,936,399,932,46,931,224,931,60,930,284,930,343,930,403,930,428,929],"pa":[261,956,320,956,196,949,378,949,259,947,318,947,264,943,323,943,258,938,317,938,257,937,316,937,50,936,226,936,195,935,217,931,293,928,352,928,402,927,403,927],"cn-bj":[39,961,366,957,74,950,237,945,23,938,364,935,194,928,238,926,24,924,365,920,53,917,169,917,287,917,346,917,21,916,189,915,8,914,170,914,176,913,182,913],"cn-sh":[364,964,366,961,73,950,53,947,287,947,346,947,182,945,238,940,193,939,360,938,8,937,21,937,190,937,39,936,51,936,189,936,5,935,192,935,365,935,11,933],"cn-tj":[361,984,362,978,368,975,405,975,369,974,367,971,377,970,398,969,360,967,83,966,376,965,364,962,400,959,483,959,370,958,84,954,373,954,416,952,57,948,291,948],"cn-cq":[90,985,99,974,80,973,437,973,421,971,88,970,371,970,470,970,95,969,420,969,458,968,381,967,384,965,472,965,495,965,382,964,388,964,478,964,486,964,91,963],"cn-he":[81,983,82,983,393,983,385,982,413,978,408,977,78,976,91,975,390,975,425,975,473,974,482,974,85,973,87,973,102,973,381,973,446,972,490,971,93,970,384,970],"cn-sx":[82,984,481,984,393,983,102,982,390,981,394,980,81,979,381,978,389,978,459,978,79,977,77,976,382,976,388,975,472,975,392,974,473,974,495,974,425,973,386,972],"cn-nm":[394,986,389,985,481,980,78,977,99,975,386,975,390,974,459,974,388,972,102,969,382,967,392,967,393,967,80,964,82,964,88,964,81,962,381,962,103,961,90,960],"cn-ln":[99,987,88,984,90,981,383,981,76,973,382,973,459,973,371,968,79,964,386,963,95,962,481,962,81,961,370,961,373,961,381,961,78,957,389,956,394,956,437,956],"cn-jl":[381,985,77,983,82,983,382,982,458,982,482,982,390,981,473,980,78,979,393,979,421,979,459,979,102,978,384,978,408,978,437,978,470,977,472,977,91,976,413,976],"cn-hl":[91,986,472,985,78,984,77,983,81,983,408,983,381,982,385,979,473,979,495,979,435,978,437,976,459,976,413,975,494,975,382,974,388,974,390,974,393,974,482,974],"cn-js":[368,981,84,980,373,978,376,974,370,972,75,966,361,963,383,961,19,960,92,960,400,960,398,959,416,959,483,956,86,955,367,955,362,954,371,954,88,953,377,953],"cn-zj":[83,980,373,974,368,973,19,972,376,965,51,963,370,963,383,962,57,957,291,957,350,957,53,956,287,956,346,956,371,956,75,954,238,954,88,953,364,953,42,952],"cn-ah":[387,990,430,990,469,990,424,989,431,989,485,989,494,987,422,986,488,986,87,985,409,985,423,985,411,984,436,984,441,984,474,984,490,984,93,983,385,983,412,983],"cn-fj":[374,990,372,985,397,982,432,982,401,981,417,981,415,978,416,978,94,976,380,976,420,975,486,975,92,974,371,974,483,974,384,973,419,973,484,973,375,972,391,972],"cn-jx":[490,992,497,989,423,988,93,987,491,987,387,986,411,986,412,986,493,986,85,985,431,984,474,984,430,983,441,983,469,983,471,983,488,983,494,983,424,982,414,981],"cn-sd":[80,984,90,980,99,980,382,978,459,976,371,974,383,972,76,970,386,969,481,968,381,967,79,964,373,964,81,962,437,962,370,961,95,960,420,960,421,959,389,958],"cn-ha":[388,975,103,970,91,967,394,966,82,965,96,965,425,965,97,964,435,964,78,963,467,962,472,962,490,962,493,962,473,961,495,961,87,960,408,960,491,960,497,959],"cn-hb":[76,985,99,985,80,981,88,980,371,978,381,978,95,973,382,973,459,972,437,971,81,970,383,970,421,968,470,967,482,966,386,965,394,965,420,965,458,965,481,965],"cn-hn":[472,990,408,987,82,986,437,986,385,984,495,984,473,983,435,982,458,982,413,980,381,979,388,979,436,979,446,979,494,979,421,978,85,977,384,977,478,977,81,976],"cn-gd":[86,974,400,969,372,968,432,968,416,967,371,964,374,964,401,964,397,962,367,961,380,961,417,961,83,960,483,960,391,958,415,958,419,956,375,955,420,955,486,955],"cn-gx":[87,987,387,985,431,985,490,985,412,984,85,983,430,981,469,981,494,981,423,980,424,980,411,979,435,978,422,977,474,977,497,977,409,976,471,976,493,976,385,975],"cn-hi":[374,984,391,984,397,984,415,983,417,983,484,980,432,979,486,978,86,976,384,976,446,976,455,975,485,975,372,974,379,974,396,974,420,974,457,974,387,973,421,973],"cn-sc":[90,973,99,970,76,969,81,968,82,964,78,962,80,962,381,962,459,962,88,960,382,960,394,960,77,959,91,959,89,958,437,956,388,955,472,954,79,951,371,951],"cn-gz":[97,971,103,971,100,970,89,965,467,956,465,953,101,952,388,952,435,950,461,950,93,949,394,948,494,948,490,947,493,947,474,946,87,945,491,945,497,945,102,944],"cn-yn":[100,987,103,985,101,975,96,971,388,970,392,966,394,966,89,964,102,963,425,961,78,958,472,957,473,956,495,956,79,955,390,955,82,954,91,954,393,952,467,951],"cn-xz":[395,986,101,931,43,930,392,921,499,918,498,916,100,913,102,913,393,912,288,908,347,908,390,906,97,905,425,902,394,901,103,899,77,895,78,895,56,891,81,891],"cn-sn":[80,987,459,986,90,985,382,981,88,980,79,975,386,975,481,975,76,974,381,974,81,970,95,970,383,970,389,969,78,968,394,968,82,966,371,966,472,965,91,964],"cn-gs":[97,987,103,980,392,973,101,971,96,970,102,970,425,968,388,965,78,964,472,964,473,963,495,963,390,962,82,961,394,961,91,959,393,959,467,958,408,957,89,956],"cn-qh":[392,978,97,975,100,971,394,970,103,968,102,961,79,957,390,954,78,953,96,952,393,951,388,950,481,946,389,945,82,943,425,941,381,940,459,940,81,939,99,939],"cn-nx":[390,992,393,989,392,983,78,982,394,982,425,979,81,978,473,975,77,973,82,973,482,971,100,970,481,970,79,969,381,969,389,969,467,969,388,968,408,968,472,967],"cn-xj":[97,985,100,980,392,972,394,972,96,971,89,970,388,970,101,968,102,963,79,961,425,961,78,957,472,957,473,956,495,956,390,955,82,954,76,952,91,952,99,952],"us-al":[120,992,107,981,121,978,139,977,151,977,145,975,127,973,128,972,117,971,143,968,119,962,113,961,138,961,129,957,134,956,153,955,118,948,125,946,136,945,144,943],"us-ak":[111,962,122,962,106,959,108,956,136,955,134,953,148,952,129,951,146,951,125,950,116,949,142,949,149,949,140,948,131,945,152,945,112,943,115,942,153,942,113,941],"us-az":[136,989,146,986,131,978,134,978,149,978,113,974,119,973,152,973,129,972,116,971,140,971,150,971,115,970,125,970,109,969,147,967,108,966,112,966,143,966,111,965],"us-ar":[139,994,104,981,117,976,120,975,143,974,145,974,127,968,113,966,134,962,138,961,153,961,118,960,121,959,128,959,151,959,131,957,119,955,129,951,136,951,125,946],"us-ca":[140,979,149,979,116,977,122,976,111,972,150,972,112,971,132,971,152,970,123,968,125,968,142,968,109,967,106,966,136,963,114,961,133,960,148,960,141,957,146,957],"us-co":[150,980,140,979,149,977,132,974,152,974,112,970,147,970,106,969,108,967,126,966,114,963,133,962,146,962,202,962,115,961,116,960,137,960,136,958,122,957,148,957],"us-ct":[148,976,133,973,135,973,142,966,124,965,123,961,126,959,132,956,114,955,108,944,109,944,122,944,111,942,140,942,150,942,149,941,112,939,141,939,0,938,152,937],"us-de":[122,989,116,985,125,983,152,976,112,974,108,972,142,971,149,971,136,969,141,969,138,968,106,965,140,964,132,963,133,963,105,962,129,961,148,961,128,958,146,958],"us-fl":[152,992,116,985,140,985,149,984,132,983,122,981,125,977,111,974,137,973,108,971,109,970,142,969,150,969,126,968,129,968,136,968,130,967,106,966,133,966,118,965],"us-ga":[117,990,143,986,119,979,146,978,136,977,131,976,134,976,128,975,106,974,145,974,125,973,139,971,138,969,129,967,107,966,153,965,118,964,152,962,104,961,116,961],"us-hi":[133,967,122,964,109,963,132,963,140,962,108,961,142,961,149,960,112,959,148,958,111,957,152,956,110,955,211,955,116,954,126,954,150,948,125,945,214,945,213,943],"us-id":[147,983,131,980,146,973,106,970,118,968,153,964,140,963,150,963,109,961,136,959,144,959,149,959,152,959,216,959,130,958,113,957,134,957,119,956,129,954,112,952],"us-il":[125,988,111,985,112,985,149,982,152,982,122,981,108,977,138,976,136,974,132,973,140,973,141,973,106,971,129,969,128,966,123,965,146,965,142,964,119,963,145,963],"us-in":[113,990,143,987,145,984,128,983,139,981,119,979,138,977,107,976,134,976,136,975,129,974,153,972,104,971,118,971,125,970,131,968,146,968,120,967,106,964,116,961],"us-ia":[153,993,129,985,119,979,130,976,144,975,131,972,117,971,152,970,115,968,146,968,149,966,112,965,136,965,139,965,113,964,128,964,106,963,116,961,107,960,122,960],"us-ks":[129,988,153,984,144,981,130,980,113,979,117,979,118,979,128,977,146,977,131,975,106,973,136,973,143,966,137,964,116,963,125,963,134,963,104,962,145,962,152,961],"us-ky":[104,992,121,982,151,980,145,977,107,975,128,974,139,973,143,971,138,969,117,967,127,965,129,960,134,959,119,958,113,957,125,955,153,951,136,948,116,945,118,945],"us-la":[151,992,120,982,104,978,127,970,145,965,128,962,107,959,138,957,139,955,143,953,117,949,125,942,129,941,119,940,134,940,113,939,136,936,141,936,144,936,130,935],"us-me":[111,989,152,983,112,981,116,981,125,981,142,979,149,979,108,976,140,972,132,970,133,970,136,966,138,966,106,964,114,964,129,964,141,963,148,963,105,962,118,960],"us-md":[142,971,132,969,108,968,150,967,116,965,140,964,149,964,141,962,148,962,110,961,133,960,125,956,106,955,126,955,152,955,111,954,112,954,122,954,136,951,109,950],"us-ma":[135,973,110,965,133,953,148,947,142,937,123,933,126,933,0,932,132,927,122,925,111,923,112,920,114,920,141,920,152,918,108,917,116,916,109,915,140,914,150,914],"us-mi":[116,988,138,984,111,983,122,981,136,981,152,978,112,977,128,975,141,974,149,974,113,973,143,972,145,972,106,970,117,970,134,969,108,968,140,966,129,965,132,964],"us-mn":[133,980,132,973,152,969,112,968,109,966,156,966,142,964,149,964,150,964,141,962,148,962,110,959,116,959,140,959,137,957,123,955,114,954,219,954,122,952,129,951],"us-ms":[104,973,151,971,121,970,107,968,120,965,139,962,145,947,128,945,117,944,143,941,153,940,119,935,113,934,138,934,118,933,129,930,134,929,131,925,144,925,130,924],"us-mo":[145,985,117,983,129,979,138,978,119,977,143,977,113,975,125,975,120,974,136,974,104,972,153,971,134,969,116,966,139,965,144,965,118,964,130,964,106,963,121,962],"us-mt":[153,990,119,988,144,986,118,985,130,985,128,979,136,975,117,974,152,973,106,972,146,970,116,969,137,969,112,968,143,968,149,968,113,967,125,965,134,965,122,964],"us-ne":[144,993,129,985,137,984,119,980,118,976,153,975,152,972,112,967,106,964,128,964,146,964,149,962,113,959,117,959,136,959,115,958,147,957,205,957,116,956,122,955],"us-nv":[146,987,115,980,106,978,136,978,113,976,119,975,153,973,118,972,134,971,117,968,143,965,129,963,147,963,139,962,149,962,125,961,144,961,107,957,152,957,116,955],"us-nh":[140,986,149,985,112,983,150,983,152,981,142,979,109,974,116,973,126,973,133,973,108,971,122,970,148,970,123,969,136,965,125,964,106,963,111,963,114,963,137,960],"us-nj":[142,982,126,980,148,980,110,973,132,973,122,970,114,967,112,966,141,966,111,963,152,963,109,962,116,961,108,960,123,960,135,959,140,959,150,959,149,958,124,953],"us-nm":[143,985,136,983,106,978,113,976,117,976,131,971,146,970,125,969,128,969,145,968,139,967,129,965,149,964,119,963,107,962,120,959,152,959,138,958,115,957,116,957],"us-ny":[110,973,124,973,133,959,126,951,148,951,0,943,142,941,123,937,141,934,132,931,112,929,114,929,122,929,111,927,116,923,152,922,105,921,108,921,109,920,156,920],"us-nc":[106,989,134,983,125,981,146,981,149,980,131,978,113,977,143,977,117,975,129,975,152,975,116,974,128,974,119,973,145,971,111,969,112,968,140,967,122,966,138,966],"us-nd":[130,984,144,977,152,974,112,973,129,969,203,966,149,965,119,964,140,962,109,960,132,960,116,959,118,959,122,958,153,958,126,957,150,957,106,954,128,954,125,952],"us-oh":[145,987,125,984,128,978,117,977,116,976,143,973,141,972,113,969,120,969,111,968,122,966,136,966,139,966,112,965,152,963,104,961,107,961,129,959,149,959,134,958],"us-ok":[107,994,117,981,145,980,143,979,104,977,120,973,113,971,134,967,138,966,153,966,118,965,128,965,127,962,131,962,119,960,129,956,136,956,121,955,151,954,125,952],"us-or":[132,986,112,985,149,985,152,983,150,982,108,979,109,979,116,973,122,972,106,971,147,971,142,968,136,967,125,966,148,965,111,964,123,964,115,963,114,962,137,962],"us-pa":[125,974,116,973,138,972,142,970,111,969,133,966,122,963,123,962,126,962,128,961,112,959,132,958,145,958,108,957,117,957,136,957,148,956,152,956,149,955,113,950],"us-ri":[148,984,133,982,122,979,132,979,111,971,123,971,149,971,152,971,141,970,112,969,108,968,140,968,150,967,110,966,116,964,126,964,114,961,125,960,136,955,106,953],"us-sc":[117,987,113,986,134,985,145,983,139,979,128,977,136,977,107,974,138,973,125,972,120,971,104,968,129,968,106,966,119,966,131,965,146,964,152,962,116,960,153,959],"us-sd":[130,993,129,986,119,981,137,977,153,976,118,975,146,969,106,965,128,965,152,965,112,961,131,961,149,961,113,960,117,960,136,960,115,959,203,959,205,958,122,956],"us-tn":[138,987,128,985,117,984,143,983,139,980,120,977,104,975,107,974,113,974,125,972,136,971,134,968,121,965,129,964,116,963,119,962,106,960,141,958,112,957,151,957],"us-tx":[131,987,106,986,136,981,113,978,119,977,115,973,147,972,149,971,129,970,134,970,144,969,117,968,118,968,152,966,153,966,116,965,130,964,143,964,109,962,125,962],"us-ut":[115,983,146,972,140,971,109,970,106,967,150,967,131,963,149,963,132,959,152,959,216,958,130,957,112,956,136,956,144,956,118,954,215,954,113,953,119,953,214,953],"us-vt":[142,984,133,980,110,976,132,970,140,965,122,963,123,962,126,962,111,961,108,960,150,959,114,958,109,957,112,957,141,956,149,956,152,955,105,952,135,951,116,949],"us-va":[152,991,132,985,140,985,112,984,116,982,136,980,108,979,122,979,150,979,106,978,109,977,125,974,111,971,142,971,146,971,129,968,118,966,137,965,123,964,126,964],"us-wa":[132,983,140,982,109,980,149,979,152,975,108,972,106,971,112,969,123,967,142,967,147,967,126,964,115,963,116,962,136,960,133,959,148,959,122,958,146,958,137,957],"us-wv":[121,992,120,980,104,977,127,971,107,959,145,957,128,955,139,954,143,951,138,950,117,947,129,940,134,940,119,939,113,938,125,935,144,935,130,934,111,932,153,932],"us-wi":[112,992,149,991,122,983,140,983,116,982,132,981,125,978,111,976,136,975,150,975,109,974,137,974,106,973,129,973,130,972,142,971,108,970,118,970,126,969,146,966],"us-wy":[118,993,129,990,119,984,144,976,130,975,131,973,117,972,128,971,139,966,146,966,113,965,115,964,136,964,152,963,106,962,107,961,116,959,143,959,112,958,137,958],"jp-tk":[2,973,208,963,207,961,209,956,10,952,155,944,210,942,273,933,332,933,274,929,333,929,275,907,334,907,276,895,335,895,5,859,172,851,177,848,175,846,181,845],"kr-sl":[273,979,332,979,208,970,275,963,334,963,10,959,276,951,335,951,274,947,333,947,154,944,210,940,209,929,207,927,2,921,177,864,74,862,5,856,21,855,185,849],"gb-ln":[219,982,211,973,215,972,4,971,218,970,126,966,272,965,331,965,270,962,329,962,202,961,37,960,212,958,206,957,9,956,214,956,36,954,203,952,213,950,133,948],"fr-pr":[182,976,189,973,183,963,184,959,21,954,165,953,5,951,18,950,271,947,330,947,268,944,327,944,185,941,11,940,186,937,201,935,269,935,328,935,188,932,218,932],"de-by":[160,993,3,978,171,973,170,970,159,968,169,964,181,962,172,952,241,944,175,938,237,936,173,933,179,933,23,920,174,915,176,913,157,908,39,904,182,904,189,904],"de-nw":[171,984,172,982,181,981,160,970,169,969,158,968,3,966,170,965,175,965,173,964,179,964,176,945,237,942,174,940,241,934,39,923,182,916,189,916,180,915,23,914],"de-bw":[158,993,3,982,171,976,170,974,159,970,169,967,181,959,172,955,241,950,175,941,237,938,173,935,179,935,23,926,174,918,176,916,157,915,182,910,189,910,18,909],"in-mh":[252,982,311,982,253,974,312,974,246,973,305,973,245,971,304,971,68,962,49,961,59,961,162,961,228,961,163,956,248,956,307,956,242,955,301,955,32,954,266,952],"in-ka":[250,981,309,981,253,977,312,977,59,975,245,974,304,974,68,972,163,969,248,967,307,967,252,962,311,962,161,961,246,961,305,961,242,960,301,960,32,959,14,950],"in-tn":[248,989,307,989,68,975,59,970,162,969,242,968,301,968,252,961,311,961,253,957,312,957,161,956,32,951,250,951,309,951,30,948,246,948,305,948,265,946,324,946],"br-sp":[258,977,317,977,261,965,320,965,267,962,326,962,259,959,318,959,256,958,315,958,204,951,206,950,202,945,257,943,316,943,46,935,47,935,136,935,224,935,225,935],"au-nsw":[268,990,327,990,11,981,271,975,330,975,269,969,328,969,167,968,201,967,193,966,166,964,191,964,18,963,199,963,190,960,218,957,20,956,194,956,15,954,157,953],"it-lm":[191,999,193,989,8,985,13,984,190,984,11,974,192,973,194,973,268,969,327,969,199,968,167,967,165,964,200,963,35,960,201,960,15,957,269,956,328,956,20,953],"es-ct":[201,991,194,979,197,973,18,970,268,969,327,969,165,968,13,967,166,967,191,967,220,964,11,963,20,958,190,958,193,958,8,957,199,956,269,950,328,950,271,948],"mx-cd":[278,976,337,976,280,959,339,959,12,952,28,950,285,950,344,950,47,948,225,948,69,947,236,947,277,945,336,945,71,940,233,940,281,940,340,940,58,937,50,936],"de-be":[170,977,3,973,171,972,159,969,160,967,241,965,158,964,172,960,181,958,175,955,237,953,173,950,179,950,23,942,174,933,176,931,39,921,73,917,182,908,189,908],"de-hh":[3,980,169,977,171,977,160,974,158,970,175,966,159,965,237,964,173,960,181,960,172,956,241,954,179,952,174,943,176,941,23,939,39,931,18,923,182,923,189,923],"de-he":[159,984,170,977,3,976,160,976,158,973,169,972,172,970,181,968,175,965,179,960,173,959,241,947,237,944,174,942,176,940,157,929,182,926,189,926,23,923,21,921],"de-ni":[159,982,175,982,179,980,181,973,171,970,173,968,176,961,169,960,174,958,170,956,3,955,160,955,158,952,237,935,182,933,189,933,180,931,177,926,187,925,241,925],"de-sn":[175,982,176,981,179,978,174,972,172,968,181,967,159,964,170,960,237,960,171,959,180,951,169,950,39,946,177,946,182,946,189,946,3,943,187,941,188,939,238,936],"de-sh":[176,979,175,976,173,972,179,969,180,968,187,966,188,964,177,963,172,958,21,957,183,954,184,953,5,948,237,948,182,947,189,947,170,943,178,943,185,943,171,942],"de-rp":[179,986,172,982,173,982,174,976,176,975,170,966,181,966,159,965,171,965,169,955,237,953,3,948,182,947,189,947,180,946,187,942,21,941,160,941,177,941,188,940],"de-th":[173,981,179,980,174,979,175,975,180,970,172,961,177,961,238,955,39,952,237,952,181,951,187,951,189,951,188,949,21,948,182,948,159,945,178,945,170,941,171,940],"de-bb":[178,980,187,973,174,963,180,962,176,961,188,959,204,947,205,947,173,946,185,943,179,942,175,941,21,938,186,938,5,937,203,935,183,931,184,929,206,929,238,928],"de-mv":[177,980,180,963,187,962,205,958,188,948,176,945,204,944,174,943,185,931,203,929,21,928,173,926,179,926,186,926,5,925,144,925,217,925,238,924,130,923,206,923],"de-sl":[175,986,172,980,176,980,173,978,181,971,174,969,159,964,171,960,170,952,180,951,169,950,237,945,3,943,177,942,187,937,182,936,189,936,238,936,160,935,188,935],"de-st":[176,970,174,968,178,963,177,962,187,958,188,956,21,955,238,954,173,951,179,951,19,948,175,946,183,946,51,945,53,944,287,944,346,944,184,943,39,939,5,938],"de-hb":[159,981,172,973,179,971,171,968,173,967,175,966,158,962,170,960,160,959,169,958,3,954,176,951,237,944,174,942,241,932,39,928,180,922,189,917,182,916,23,914],"fr-ra":[189,988,183,978,157,976,184,975,5,973,21,967,185,956,188,956,271,953,330,953,186,952,165,949,176,948,174,947,175,947,173,946,268,946,327,946,74,945,199,944],"fr-na":[184,992,189,985,182,978,5,977,185,975,186,972,188,969,21,968,157,963,174,954,269,953,328,953,218,952,271,951,330,951,187,950,200,949,54,946,180,946,272,944],"fr-oc":[183,992,185,980,189,978,186,976,182,975,5,973,21,967,188,966,269,961,328,961,157,959,218,957,200,956,271,955,330,955,174,953,54,950,272,949,331,949,165,948],"fr-pd":[186,991,184,980,183,975,188,973,272,969,331,969,189,968,5,967,21,962,219,960,54,958,270,957,271,957,329,957,330,957,182,956,187,954,269,954,328,954,218,953],"fr-br":[185,991,184,976,272,973,331,973,183,972,270,965,329,965,188,964,5,963,269,963,328,963,54,962,271,961,330,961,219,960,189,959,21,957,200,957,218,953,182,952],"fr-hf":[188,981,177,973,174,966,178,962,180,958,5,955,185,954,176,951,183,950,184,948,186,946,21,945,175,942,203,942,173,941,189,940,204,940,179,937,182,937,206,936],"fr-ge":[187,981,185,973,183,969,5,967,184,966,174,964,186,964,21,963,177,959,189,959,180,956,182,956,272,950,331,950,176,949,219,949,178,948,54,946,175,940,368,940],"fr-paca":[182,988,183,985,184,978,157,973,185,968,21,967,5,964,271,962,330,962,186,959,188,959,176,951,165,947,174,947,175,947,173,946,218,945,199,944,268,944,327,944],"it-vn":[193,994,8,984,166,984,191,984,192,984,13,981,199,974,11,969,268,965,327,965,200,963,194,961,165,960,15,959,167,958,25,957,36,955,198,954,269,952,328,952],"it-er":[166,999,193,990,8,985,13,984,190,984,192,974,194,974,11,973,199,969,268,968,327,968,167,967,165,964,200,964,35,960,201,960,15,957,269,955,328,955,271,953],"it-pm":[190,984,193,984,199,982,8,975,200,975,191,974,166,973,25,971,13,967,198,966,36,965,15,963,269,962,328,962,194,960,271,960,330,960,37,959,268,959,327,959],"it-ts":[190,994,191,990,166,989,192,984,8,983,13,977,199,973,268,970,327,970,11,969,200,969,165,966,194,966,25,960,15,959,167,958,269,958,328,958,271,956,330,956],"it-lz":[167,979,191,974,166,973,13,971,201,970,193,966,268,965,327,965,11,964,35,964,8,963,190,961,199,961,192,960,200,959,271,957,330,957,165,956,269,956,328,956],"it-cm":[196,981,404,953,46,950,224,950,215,949,205,948,399,947,428,944,375,942,71,941,233,941,419,941,198,939,214,939,361,939,403,939,367,938,398,938,60,937,204,937],"it-si":[195,981,60,950,284,950,343,950,403,950,72,949,216,949,235,949,261,945,320,945,404,944,71,942,233,942,46,941,224,941,217,939,399,939,402,939,378,938,428,936],"es-md":[201,977,167,973,220,961,18,958,194,952,166,951,191,950,13,948,268,946,327,946,165,945,20,944,11,941,190,940,193,940,8,939,24,939,199,938,35,932,218,932],"es-an":[200,985,199,975,37,974,36,971,269,969,328,969,270,967,329,967,192,966,218,963,15,962,46,960,224,960,272,960,331,960,219,958,271,956,330,956,54,954,190,954],"es-vc":[192,982,200,980,198,975,190,974,193,973,268,973,327,973,269,972,328,972,271,970,330,970,37,969,191,969,166,968,13,966,15,964,165,963,8,962,270,962,329,962],"es-ga":[198,985,199,980,269,980,328,980,192,975,270,975,329,975,193,969,218,967,36,965,37,965,191,964,166,963,190,963,272,963,331,963,54,961,271,960,330,960,194,959],"es-pv":[167,991,18,978,197,977,194,970,220,969,268,968,327,968,165,967,11,964,166,960,191,960,13,958,20,957,193,950,269,950,328,950,190,949,8,948,271,948,330,948],"gb-en":[206,977,9,974,4,973,216,973,211,972,214,969,204,967,215,966,212,963,109,962,156,961,219,961,213,958,217,957,152,955,112,954,205,954,149,950,203,950,267,950],"gb-sc":[206,967,137,966,204,966,144,959,130,955,205,954,156,952,267,952,326,952,202,950,215,949,129,948,219,946,272,946,331,946,152,945,119,943,187,942,112,941,149,941],"gb-wl":[205,978,206,978,202,967,203,966,219,962,217,961,9,954,272,954,331,954,215,953,216,953,137,952,144,952,212,952,4,951,164,951,130,950,152,950,267,950,326,950],"gb-ni":[204,978,217,967,215,959,216,959,144,958,178,958,272,958,331,958,130,957,206,957,202,954,203,954,212,951,214,949,219,949,195,948,177,947,137,946,129,944,9,943],"gb-mn":[204,978,202,977,4,968,203,967,267,967,326,967,219,963,216,962,152,960,217,959,9,958,156,957,205,957,150,955,211,954,215,954,132,953,214,953,112,952,149,950],"jp-os":[209,972,210,972,154,961,208,957,2,956,10,953,274,952,333,952,273,938,332,938,275,929,334,929,155,927,276,914,335,914,177,859,178,858,172,853,174,853,175,852],"jp-ai":[155,970,210,970,154,963,273,960,332,960,209,959,207,957,275,944,334,944,2,942,10,942,274,936,333,936,276,932,335,932,177,885,5,877,21,870,185,870,172,869],"jp-fk":[207,972,208,959,154,956,210,956,10,946,2,944,274,940,333,940,155,929,273,925,332,925,275,917,334,917,276,902,335,902,177,861,174,850,185,850,5,849,172,849],"jp-hk":[207,972,208,970,209,956,273,954,332,954,275,948,334,948,154,942,2,941,274,941,333,941,10,940,155,940,276,933,335,933,177,887,178,886,174,872,172,871,179,871],"ca-on":[9,983,213,976,212,975,214,974,156,973,202,972,215,972,4,963,219,958,109,956,114,955,206,954,216,954,218,953,37,952,270,951,329,951,272,949,331,949,152,945],"ca-qc":[213,980,214,977,9,975,211,975,215,973,219,964,202,963,270,960,329,960,156,958,218,957,272,957,331,957,216,955,204,952,4,951,205,951,269,949,328,949,217,948],"ca-bc":[214,989,212,980,211,976,9,972,215,969,216,960,202,958,4,951,156,950,147,946,219,946,109,944,114,943,270,943,329,943,206,942,37,940,217,940,218,940,205,938],"ca-ab":[213,989,212,977,215,977,211,974,9,972,202,969,216,968,4,961,219,957,156,956,147,953,206,953,217,951,109,950,205,949,218,949,272,948,331,948,37,947,114,945],"ca-ns":[214,977,212,973,216,973,156,972,211,972,213,969,202,966,217,962,219,960,205,959,9,958,147,954,206,954,204,953,4,952,130,952,144,951,195,949,203,949,109,947],"ca-mb":[217,980,202,973,215,973,214,968,206,962,213,960,115,959,205,959,147,958,212,955,211,954,204,953,118,951,131,951,9,949,196,949,261,949,320,949,146,948,4,946],"ca-sk":[216,980,205,967,215,962,204,961,206,959,202,957,214,951,115,949,118,949,212,948,261,948,320,948,147,946,153,943,131,941,144,940,213,940,219,940,196,939,9,938],"nl-nh":[219,979,37,977,269,977,328,977,272,976,331,976,270,972,329,972,36,970,156,970,200,967,271,964,330,964,198,963,268,963,327,963,4,961,15,959,54,959,199,959],"nl-zh":[272,983,331,983,156,982,4,980,218,979,270,974,329,974,37,970,9,968,212,964,36,963,206,963,269,963,328,963,204,962,202,961,54,960,185,960,186,960,215,960],"se-st":[20,981,201,969,167,964,197,961,35,960,18,958,165,952,268,952,327,952,13,950,15,948,194,948,166,947,191,947,37,940,199,940,11,939,190,937,193,937,218,937],"ru-ms":[223,973,239,919,39,914,52,914,286,914,345,914,241,906,55,902,289,902,348,902,73,900,23,898,237,896,181,893,33,890,44,890,221,890,240,890,53,889,169,889],"ru-sp":[222,973,52,941,286,941,345,941,239,932,55,928,289,928,348,928,44,916,221,916,39,915,42,905,240,905,53,904,287,904,346,904,73,902,40,898,51,898,237,898],"cz-pr":[39,967,170,964,173,960,169,953,175,953,176,952,174,948,3,946,23,945,73,945,179,945,171,944,181,944,159,942,160,938,158,936,172,935,180,935,238,933,365,929],"pl-mz":[53,976,287,976,346,976,51,964,19,963,365,961,39,960,239,960,176,955,84,954,180,954,57,953,291,953,350,953,240,951,364,951,370,951,366,949,383,947,42,946],"hu-bp":[240,971,53,964,287,964,346,964,42,962,51,960,238,960,40,952,365,950,19,949,55,940,289,940,348,940,363,940,39,939,52,938,56,938,286,938,290,938,345,938],"ro-bh":[42,981,19,972,239,971,363,962,40,960,365,960,51,958,53,955,287,955,346,955,383,955,238,951,99,950,370,950,84,949,386,947,80,946,373,946,90,943,76,941],"at-vi":[23,970,169,965,3,956,170,954,160,950,171,947,158,944,159,934,181,932,175,929,237,927,172,925,173,924,179,924,73,908,174,907,222,906,176,905,182,898,189,898],"in-dl":[252,973,311,973,68,970,163,968,248,966,307,966,59,961,162,960,30,956,263,956,322,956,161,955,253,953,266,953,312,953,325,953,265,951,279,951,324,951,338,951],"in-up":[247,982,306,982,255,969,314,969,244,962,303,962,65,954,232,954,254,954,313,954,48,952,227,952,62,949,229,949,251,949,310,949,64,948,231,948,298,947,357,947],"in-rj":[254,982,255,982,313,982,314,982,247,981,306,981,243,962,302,962,251,954,310,954,245,950,298,950,304,950,357,950,65,946,232,946,246,945,305,945,295,944,354,944],"in-gj":[253,981,312,981,246,976,305,976,162,974,161,971,250,970,309,970,59,965,32,961,252,961,311,961,14,959,29,956,254,955,313,955,68,952,244,950,303,950,49,948],"in-wb":[245,976,304,976,161,973,59,965,252,964,311,964,253,962,312,962,162,961,68,955,250,955,309,955,32,953,49,951,228,951,163,948,254,948,313,948,244,945,299,945],"in-mp":[255,985,314,985,243,982,302,982,244,981,303,981,254,972,313,972,298,961,357,961,65,960,232,960,62,955,229,955,64,953,231,953,251,952,310,952,48,946,227,946],"in-tl":[163,989,68,972,59,967,162,967,242,966,301,966,252,962,311,962,161,956,253,955,312,955,250,951,309,951,67,947,265,947,324,947,260,946,319,946,246,944,266,944],"in-ke":[443,977,442,975,464,972,450,971,451,971,452,970,58,968,444,967,462,966,67,964,28,961,281,958,340,958,463,958,50,957,226,957,378,957,434,957,410,956,17,954],"in-ap":[162,981,245,970,304,970,253,966,312,966,59,962,68,955,246,955,305,955,163,951,248,951,307,951,254,949,313,949,161,948,252,946,311,946,29,944,242,944,301,944],"in-br":[254,962,313,962,255,960,314,960,62,956,229,956,295,956,354,956,244,954,303,954,247,952,306,952,65,949,232,949,243,949,302,949,299,937,358,937,48,936,227,936],"in-pb":[161,982,253,980,312,980,242,973,301,973,68,969,59,966,246,964,305,964,32,962,162,962,248,962,307,962,163,961,245,961,304,961,266,960,325,960,265,957,324,957],"in-hr":[245,981,304,981,252,980,311,980,162,977,161,974,32,968,68,968,59,967,250,966,309,966,246,962,305,962,14,961,29,958,163,957,248,955,307,955,242,953,301,953],"in-or":[244,982,303,982,255,979,314,979,247,972,306,972,251,962,310,962,299,960,358,960,245,955,304,955,243,954,302,954,250,949,309,949,246,948,305,948,295,944,298,944],"in-as":[247,985,306,985,244,982,303,982,254,979,313,979,243,969,302,969,251,960,310,960,65,955,232,955,295,951,354,951,298,950,357,950,62,949,229,949,48,945,64,945],"br-rj":[258,980,317,980,257,975,316,975,259,974,318,974,7,962,164,958,261,957,320,957,47,943,225,943,264,940,323,940,69,937,236,937,278,935,337,935,267,933,326,933],"br-mg":[259,982,318,982,256,975,315,975,264,965,323,965,258,964,317,964,7,960,261,959,320,959,69,951,236,951,280,946,339,946,47,945,225,945,164,943,72,937,235,937],"br-rs":[259,982,318,982,256,980,315,980,164,977,261,977,320,977,257,964,316,964,47,952,225,952,267,944,326,944,7,942,69,941,236,941,278,939,337,939,72,938,235,938],"br-pr":[257,982,258,982,316,982,317,982,261,977,320,977,256,974,315,974,164,959,69,953,236,953,47,949,225,949,264,948,323,948,72,947,235,947,7,942,278,938,337,938],"br-ba":[262,990,321,990,263,977,322,977,293,964,352,964,265,958,324,958,264,955,323,955,266,954,325,954,248,946,307,946,279,944,338,944,163,942,242,941,301,941,50,940],"br-sc":[258,977,259,977,317,977,318,977,164,965,257,959,316,959,256,957,315,957,72,956,235,956,216,949,217,948,196,945,267,944,326,944,131,942,205,942,115,938,204,938],"br-pe":[260,990,319,990,263,978,322,978,293,974,352,974,264,960,323,960,265,954,279,954,324,954,338,954,50,950,226,950,266,950,325,950,277,945,336,945,69,942,236,942],"br-ce":[262,978,321,978,260,977,319,977,265,976,324,976,266,973,325,973,293,964,352,964,242,956,301,956,66,953,68,953,292,953,351,953,279,946,338,946,30,941,163,939],"br-go":[257,965,316,965,262,960,321,960,293,956,352,956,260,955,319,955,277,952,336,952,69,949,236,949,259,948,279,948,318,948,338,948,7,947,50,944,226,944,72,943],"br-pa":[266,991,325,991,263,976,322,976,68,963,59,960,260,958,319,958,252,957,311,957,66,955,292,955,351,955,262,954,321,954,242,951,301,951,161,949,248,947,307,947],"br-am":[265,991,324,991,263,973,322,973,68,966,66,963,292,963,351,963,252,960,311,960,59,957,260,954,319,954,242,953,301,953,161,952,262,950,321,950,253,946,312,946],"br-df":[206,967,164,962,203,952,202,950,204,950,46,947,224,947,156,945,258,944,261,944,317,944,320,944,219,943,4,941,216,939,152,936,106,935,125,935,116,934,141,933],"au-vc":[165,990,269,979,328,979,11,977,271,976,330,976,199,973,193,970,166,969,167,969,191,968,201,968,190,965,194,965,15,964,218,963,270,962,329,962,20,961,37,961],"au-ql":[200,980,270,980,329,980,268,979,327,979,271,978,330,978,218,977,272,977,331,977,37,974,199,972,165,969,198,969,36,967,54,964,186,963,219,963,11,962,192,962],"au-wa":[269,980,328,980,272,979,331,979,200,975,219,974,218,972,37,967,198,967,36,965,186,965,271,963,330,963,9,962,156,962,199,962,268,962,327,962,54,960,212,960],"au-sa":[269,978,328,978,268,976,327,976,165,975,199,970,11,968,37,968,54,968,21,965,272,965,331,965,218,964,15,963,270,963,329,963,189,962,186,961,36,960,192,960],"au-ts":[219,983,270,979,329,979,269,977,328,977,218,976,186,973,54,970,37,969,185,969,4,965,156,965,271,965,330,965,200,963,9,961,268,961,327,961,36,960,198,960],"kr-gg":[155,979,275,974,334,974,10,968,276,962,335,962,274,961,333,961,208,960,210,954,207,938,154,933,2,929,209,925,74,855,178,853,177,851,5,844,363,840,21,838],"kr-bs":[10,975,273,961,332,961,276,955,335,955,207,952,275,950,334,950,155,947,210,941,209,940,208,936,2,934,154,929,178,834,177,832,74,826,5,824,185,817,186,816],"kr-dg":[276,975,335,975,273,974,332,974,155,963,274,950,333,950,210,948,208,944,10,943,207,929,209,917,2,909,154,907,178,873,177,871,74,868,363,864,5,858,185,856],"kr-ic":[275,975,334,975,273,962,332,962,274,955,333,955,155,951,210,933,10,932,208,932,207,914,209,902,2,895,154,895,178,872,177,870,74,864,5,860,363,857,185,855],"mx-jl":[280,985,339,985,279,979,338,979,281,977,340,977,58,963,12,960,50,957,226,957,278,956,337,956,69,955,236,955,264,952,323,952,67,951,28,948,168,945,262,945],"mx-nl":[168,976,280,971,339,971,28,963,47,962,69,962,225,962,236,962,281,961,340,961,58,959,12,956,277,956,336,956,50,951,226,951,285,947,344,947,71,944,233,944],"mx-mx":[277,979,336,979,281,974,340,974,280,964,339,964,67,959,58,955,262,954,321,954,50,952,226,952,242,951,301,951,12,950,264,948,323,948,263,946,322,946,66,945],"mx-bc":[277,985,336,985,281,976,340,976,278,971,337,971,279,964,338,964,12,963,28,962,58,960,69,960,236,960,168,959,50,949,226,949,257,946,316,946,67,943,444,942],"mx-qr":[58,977,277,977,336,977,280,976,339,976,279,974,338,974,50,966,226,966,278,961,337,961,249,958,308,958,69,952,236,952,443,951,67,949,12,948,442,948,28,947],"jo":[47,974,225,974,69,969,236,969,168,950,278,947,337,947,71,945,233,945,258,935,317,935,50,934,226,934,164,931,293,931,352,931,259,930,280,930,318,930,339,930],"rs":[481,969,389,964,386,963,79,956,382,954,56,953,78,953,290,953,349,953,381,953,459,953,51,949,495,948,390,947,482,947,42,946,99,945,394,945,371,944,392,944],"tn":[262,974,321,974,260,964,263,964,319,964,322,964,50,957,226,957,264,956,323,956,69,946,236,946,67,944,47,942,225,942,279,942,338,942,265,941,324,941,58,939],"rw":[295,962,354,962,65,959,232,959,299,947,358,947,64,945,231,945,62,944,229,944,255,941,314,941,298,940,357,940,247,932,306,932,300,930,359,930,244,929,251,929],"sn":[62,967,229,967,65,964,232,964,294,962,353,962,251,956,310,956,255,951,299,951,314,951,358,951,244,944,254,944,303,944,313,944,64,943,231,943,247,936,306,936],"ci":[63,949,230,949,64,944,231,944,65,941,232,941,295,931,354,931,62,930,229,930,294,918,353,918,247,917,306,917,255,916,314,916,243,915,302,915,251,910,310,910],"lk":[452,967,489,966,463,963,450,962,462,962,442,961,464,959,451,958,460,957,434,956,410,955,443,955,249,954,308,954,454,952,414,951,447,951,440,950,468,950,441,948],"mm":[247,961,306,961,64,957,231,957,244,950,255,950,303,950,314,950,63,949,230,949,65,947,232,947,243,947,302,947,254,944,299,944,313,944,358,944,294,940,353,940],"kh":[254,960,313,960,295,951,354,951,300,949,359,949,245,947,294,947,304,947,353,947,246,945,305,945,298,944,357,944,64,943,231,943,255,943,314,943,244,942,303,942],"np":[299,949,358,949,254,944,266,944,313,944,325,944,265,942,324,942,29,941,250,940,309,940,59,936,245,935,304,935,246,933,305,933,298,931,357,931,68,930,294,930],"cn-sz":[377,986,361,978,57,971,291,971,350,971,75,967,362,966,54,965,405,964,398,961,369,960,25,959,367,954,364,952,368,949,200,946,198,944,400,942,26,941,83,941],"cn-gz2":[75,984,360,978,377,976,362,974,398,974,405,972,367,971,368,971,369,968,83,963,400,963,376,961,57,959,291,959,350,959,483,955,370,954,84,951,364,950,373,950],"cn-su":[369,995,398,987,405,983,367,980,75,978,377,978,361,974,400,967,360,966,376,965,368,962,428,962,375,961,399,959,419,959,483,959,83,954,416,952,401,951,404,950],"cn-cd":[365,972,370,970,240,962,383,959,373,955,368,953,42,951,376,950,84,948,19,947,40,947,83,943,80,942,239,940,238,939,364,934,88,933,377,933,76,932,51,931],"cn-hz":[366,972,74,964,75,962,368,962,365,961,377,959,84,953,53,952,287,952,346,952,360,952,376,952,238,951,361,950,51,949,362,948,25,946,369,946,370,945,83,944],"cn-wh":[363,972,370,966,238,961,364,961,240,960,368,958,42,955,366,955,383,954,376,951,19,950,53,950,239,950,287,950,346,950,373,950,51,947,84,947,83,944,377,943],"cn-nj":[364,972,74,961,73,957,365,955,238,949,39,944,53,944,287,944,346,944,370,939,368,935,75,934,377,933,19,931,51,928,360,928,363,927,84,926,361,925,376,925],"cn-nb":[400,987,398,985,369,982,362,980,483,979,428,973,376,972,405,972,416,972,75,971,361,971,375,971,401,971,399,970,419,970,372,967,377,967,368,964,92,961,404,961],"cn-qd":[376,989,370,982,83,981,373,979,75,975,84,973,361,971,398,970,367,964,383,963,400,963,483,963,362,962,364,962,377,962,405,961,369,959,365,958,19,956,416,956],"cn-wx":[362,995,398,989,405,984,367,982,75,974,377,974,400,970,361,968,376,967,428,964,375,963,399,961,419,961,483,961,360,960,368,959,416,954,401,953,404,952,380,950],"cn-cs":[373,984,368,982,376,981,383,979,83,972,363,970,365,966,19,963,84,963,80,961,88,961,371,960,75,958,400,958,398,957,386,955,361,954,483,954,367,953,416,952],"cn-zz":[381,984,482,981,382,979,420,979,90,978,470,977,421,976,437,976,373,975,81,974,86,974,88,974,459,972,417,971,478,971,481,971,76,970,386,970,458,970,486,970],"cn-fz":[432,994,401,993,374,989,375,987,380,987,419,986,86,985,391,984,428,984,399,982,400,979,396,978,397,978,417,977,404,976,416,975,484,975,94,974,407,974,415,974],"cn-jn":[370,984,368,979,383,979,83,978,376,977,371,975,84,974,386,970,382,967,19,965,88,964,80,961,400,961,416,961,381,960,389,960,459,960,481,959,483,958,482,957],"cn-hf":[86,990,432,990,372,989,397,989,417,988,94,984,380,984,415,984,401,983,420,982,484,981,486,981,391,980,416,980,384,979,470,979,421,978,419,977,483,977,375,976],"cn-nt":[419,998,428,997,399,994,401,991,404,989,380,988,372,987,400,983,432,981,374,976,418,976,391,975,426,975,483,975,396,974,398,973,416,973,86,972,367,971,407,969],"cn-dl":[368,989,370,981,373,977,398,976,83,974,400,973,483,973,367,972,369,967,416,966,75,965,84,965,362,965,371,964,361,961,383,960,428,958,375,957,401,957,405,957],"cn-xm":[360,986,362,978,405,978,361,976,398,975,369,974,57,970,75,970,291,970,350,970,367,967,368,962,364,959,400,955,25,953,54,953,83,953,376,952,428,950,375,948],"cn-dg":[402,976,403,975,445,974,407,971,429,968,444,965,427,964,396,963,418,963,443,963,426,962,464,961,449,960,406,959,462,958,249,957,308,957,451,956,442,955,380,954],"cn-yc":[457,1000,455,996,448,993,433,991,456,991,485,988,406,987,409,986,415,985,484,985,422,984,397,983,396,982,424,982,430,981,454,981,469,981,410,978,446,978,486,978],"cn-wz":[432,993,419,989,375,988,401,988,372,987,391,987,396,986,428,986,418,985,374,984,426,984,399,983,407,982,416,978,397,977,404,977,86,976,417,976,484,974,415,973],"cn-km":[382,988,459,988,482,988,437,986,81,985,371,984,472,984,495,984,458,983,82,982,481,982,386,981,421,980,91,979,470,979,478,979,78,978,90,978,384,977,390,977],"cn-cc":[459,993,381,988,386,984,437,984,481,984,81,982,99,981,371,979,88,978,458,977,78,976,472,976,482,976,389,975,421,975,495,975,82,974,384,974,470,974,80,973],"cn-sy":[80,981,370,979,373,979,88,972,90,970,99,970,386,966,371,964,368,963,382,963,76,962,84,962,459,962,83,961,376,960,19,959,363,959,42,956,389,956,240,955],"cn-nc":[458,994,413,992,421,992,486,992,417,991,446,991,470,991,397,990,437,990,385,988,415,988,420,988,409,987,422,986,408,984,478,984,424,983,473,983,485,983,469,982],"cn-sjz":[413,996,408,995,446,990,473,989,384,988,472,988,469,987,424,986,458,985,486,985,91,984,425,984,478,984,494,984,85,983,415,983,422,983,474,983,77,982,409,982],"cn-ty":[389,990,481,987,382,984,459,984,381,981,79,975,99,975,482,974,472,973,78,972,495,972,478,971,82,970,371,970,373,970,437,970,88,969,81,968,383,966,390,966],"cn-nn":[431,997,430,991,85,990,412,990,423,990,469,990,488,990,411,989,424,989,485,989,490,989,87,986,422,986,433,986,93,985,409,985,441,985,494,985,436,984,448,984],"cn-gy":[472,987,473,986,495,986,394,980,91,979,408,979,425,979,437,979,413,977,78,975,89,975,385,975,390,975,458,975,82,974,435,974,478,974,79,972,381,971,459,971],"cn-hhht":[386,990,481,989,79,985,78,978,390,976,459,976,382,975,394,974,381,970,393,970,99,969,102,969,392,967,472,967,495,967,388,966,82,964,288,964,347,964,473,964],"cn-lz":[102,992,393,989,394,983,473,982,78,981,81,981,425,980,482,979,381,977,481,977,389,976,392,976,408,976,77,975,388,975,472,975,79,974,82,974,495,974,413,973],"cn-hk2":[432,990,380,987,401,985,94,984,372,984,374,980,397,980,417,980,415,979,396,978,419,977,426,976,484,976,375,975,416,975,418,975,486,975,379,974,428,974,455,974],"cn-xn":[102,983,394,980,101,978,390,976,78,974,100,973,393,973,103,972,481,968,79,967,389,967,97,966,82,965,425,963,81,961,381,961,388,960,472,959,473,958,495,958],"cn-yc2":[425,990,102,989,390,989,77,983,78,983,81,979,394,979,413,976,473,976,82,974,385,974,392,973,482,973,381,971,481,971,389,970,474,970,490,970,388,969,408,969],"cn-wlmq":[79,986,390,983,102,982,78,980,388,980,392,980,393,979,481,975,389,974,82,973,103,972,101,970,425,970,381,969,459,969,81,968,99,968,472,967,89,966,97,966],"cn-ls":[98,986,43,938,101,938,392,929,498,926,100,921,102,921,393,920,288,915,347,915,499,914,97,913,390,913,425,910,394,909,103,907,56,905,290,905,349,905,480,904],"cn-ty2":[426,993,407,992,418,992,484,988,380,986,449,985,432,984,406,983,455,983,379,982,402,982,427,982,457,982,429,980,372,978,391,978,403,977,445,977,419,976,448,976],"cn-xt":[415,996,417,994,384,990,374,989,421,989,446,988,470,988,486,988,420,985,94,984,458,984,379,983,413,983,432,983,457,983,86,982,437,981,391,980,485,980,385,979],"cn-cz":[369,989,362,987,367,985,400,981,405,979,376,976,377,975,428,975,361,974,375,973,399,973,419,972,483,972,368,970,75,969,401,965,416,965,404,963,360,961,380,961],"cn-jx2":[428,997,375,994,419,994,404,989,401,986,380,983,372,982,400,978,418,977,426,976,432,976,483,975,398,973,374,971,391,971,367,970,407,970,396,969,403,968,416,968],"cn-zy":[367,987,483,986,401,984,416,984,375,983,419,982,398,981,428,981,372,979,399,978,432,974,376,973,404,973,380,971,86,970,369,970,92,969,391,969,374,968,362,967],"cn-yz":[372,993,419,992,375,991,432,990,428,989,380,988,399,986,391,985,400,984,374,983,416,982,86,981,404,980,483,978,418,976,426,975,396,974,397,974,417,973,367,971],"cn-hs":[403,989,407,987,445,986,396,982,426,981,418,980,429,980,444,977,378,976,427,976,484,976,449,972,406,971,455,971,379,970,457,970,380,968,404,966,432,966,448,963],"cn-zs":[402,989,418,985,407,984,426,984,396,977,404,977,378,975,445,975,380,972,427,970,429,970,399,968,419,968,375,967,401,967,444,966,428,965,432,965,484,965,60,964],"cn-fs":[375,989,399,989,419,988,428,986,401,980,380,977,403,977,372,976,400,973,407,971,418,971,426,970,432,970,402,966,374,965,391,965,483,964,396,963,398,963,416,962],"cn-zh":[369,984,362,983,398,979,377,978,75,975,361,972,367,972,360,964,368,961,400,960,399,958,376,957,428,955,26,954,404,954,375,953,83,952,483,952,419,951,370,950],"cn-pt":[429,991,449,990,456,990,454,989,379,987,427,987,455,987,457,987,410,986,445,985,434,984,396,983,448,980,433,978,484,977,426,976,444,976,407,975,418,975,462,975],"cn-qz":[396,992,418,992,426,991,402,987,429,985,403,984,380,982,445,981,427,980,484,980,432,979,449,977,379,975,406,975,455,975,457,975,372,974,378,971,404,971,419,971],"cn-ly":[385,995,473,993,413,992,472,992,458,990,478,989,494,988,91,987,446,987,495,987,436,986,421,985,437,985,384,984,469,984,470,984,82,983,435,983,486,982,420,981],"cn-zy2":[422,998,424,996,485,996,469,995,436,992,474,988,384,987,379,986,446,986,457,986,494,986,85,985,387,985,431,985,448,985,433,984,486,984,430,983,488,983,490,983],"cn-xz2":[434,997,454,997,433,987,456,987,406,986,414,986,447,986,448,985,462,985,441,984,449,984,453,984,488,983,464,982,444,980,423,979,379,978,430,978,451,978,457,978],"cn-ha2":[412,995,490,994,430,993,387,989,431,988,423,987,441,987,453,987,87,986,474,986,414,985,447,985,85,984,433,983,440,983,468,983,487,983,491,983,469,982,488,982],"cn-bd":[411,995,430,992,387,990,431,990,490,989,440,988,468,988,414,987,447,987,87,986,441,986,423,985,487,985,93,984,85,983,433,982,453,982,474,981,497,981,448,980],"cn-ts":[385,996,384,992,408,992,473,991,446,989,458,989,472,989,478,988,425,986,495,986,469,985,421,984,437,984,486,984,397,983,417,983,470,983,422,982,424,982,474,982],"cn-ly2":[447,1000,453,995,434,989,441,989,412,987,423,987,440,987,468,987,410,986,411,985,487,984,488,984,430,983,454,983,456,983,433,982,87,981,431,980,448,980,491,980],"cn-wf":[397,996,446,992,486,991,417,990,384,988,379,985,421,985,457,985,374,984,485,984,94,983,385,983,470,983,458,982,409,981,413,981,420,981,455,981,422,980,448,980],"cn-yt":[483,993,400,984,401,982,374,980,432,980,86,978,380,978,372,975,391,975,419,974,375,973,397,973,417,973,367,972,428,971,484,971,94,969,371,969,415,969,399,968],"cn-zb":[397,994,486,993,384,991,420,991,415,990,421,990,374,988,446,988,470,988,458,985,94,983,413,983,432,983,437,982,86,981,391,980,485,980,385,979,409,978,455,978],"cn-jh":[426,999,396,992,407,992,380,985,403,985,427,985,402,980,484,980,429,978,432,978,399,977,419,977,449,977,375,976,401,976,391,975,406,975,445,975,455,975,379,974],"cn-sx2":[375,998,428,997,399,994,401,992,380,989,404,988,372,986,400,982,432,982,374,977,391,977,418,977,426,977,396,976,483,976,416,974,86,973,398,972,407,971,367,970],"cn-yc3":[470,997,421,996,417,991,458,991,486,991,384,988,437,988,478,986,397,985,374,982,408,981,415,981,413,980,446,980,473,980,495,980,371,979,472,979,432,977,381,976],"cn-xy":[470,998,420,996,458,995,384,992,437,992,417,990,397,989,486,989,478,987,408,985,415,985,413,984,473,984,495,984,446,983,472,983,381,980,385,980,436,980,81,979],"cn-zz2":[409,998,424,997,469,996,485,994,436,993,474,989,448,988,446,987,494,987,85,986,384,986,387,986,431,986,433,985,379,984,430,984,457,984,488,984,490,984,385,983],"cn-hy":[441,995,488,995,387,990,430,989,431,989,87,988,491,988,497,988,411,987,414,987,447,987,490,987,453,986,493,986,85,985,412,985,440,985,468,985,469,983,471,983],"cn-yy":[469,998,422,997,409,996,436,995,485,994,494,990,85,989,387,989,431,989,474,989,430,987,433,987,490,987,385,986,488,986,446,985,448,985,435,984,384,983,87,982],"cn-dt":[393,990,413,986,473,986,385,984,490,981,390,980,474,980,102,979,388,979,408,979,384,978,472,978,495,977,77,975,446,975,458,975,478,975,87,974,411,974,78,973],"cn-tz":[418,999,396,993,407,991,427,986,380,984,403,984,402,981,484,981,429,979,419,977,432,977,449,977,391,976,399,976,406,976,445,976,455,976,375,975,379,975,401,975],"cn-ls2":[449,992,429,991,406,987,426,986,418,985,445,985,396,982,407,980,456,980,454,979,402,976,410,976,484,976,455,975,379,974,434,974,457,974,380,973,391,972,444,972],"cn-hz2":[375,997,399,997,419,997,401,989,380,986,404,986,372,984,400,981,432,979,483,978,398,975,374,974,391,974,418,974,367,973,426,973,396,972,416,971,86,970,407,967],"cn-zz3":[445,995,406,991,427,991,449,987,407,985,456,981,396,980,402,980,454,980,426,979,444,979,418,978,455,978,379,977,410,977,457,977,462,977,434,974,484,974,448,971],"cn-lz2":[441,994,411,993,412,992,387,991,85,990,431,990,433,990,423,989,448,988,469,988,488,988,490,988,424,987,485,987,494,987,435,985,453,985,422,984,447,984,474,984],"cn-gl":[387,997,412,990,430,990,469,990,488,990,85,989,423,989,424,989,485,989,411,988,490,988,422,986,93,985,409,985,433,985,494,985,87,984,436,984,441,984,448,983],"cn-wh2":[372,994,380,993,374,990,391,990,401,990,396,984,397,983,417,983,86,982,419,982,375,981,484,981,416,980,94,979,407,979,415,979,428,979,418,978,420,977,426,977],"cn-bb":[448,998,379,991,455,991,457,991,430,990,456,988,485,988,410,987,424,987,387,986,469,986,422,985,431,985,454,985,409,984,434,984,441,984,453,984,411,983,488,983],"cn-aq":[410,997,454,994,414,989,447,989,441,987,453,987,488,986,456,985,406,984,433,984,462,984,448,982,449,982,464,982,423,981,451,981,430,980,431,980,442,979,444,978],"cn-yb":[494,993,436,989,430,985,469,985,472,985,490,985,424,984,408,983,491,983,497,983,91,982,387,982,431,982,85,981,422,981,474,981,493,981,87,980,409,980,423,980],"cn-dy":[424,995,494,994,422,993,469,993,409,992,435,989,485,989,408,986,458,985,85,984,387,984,431,984,474,984,430,983,385,982,433,982,488,982,490,982,446,981,473,981],"cn-my":[458,993,421,992,472,991,495,991,384,990,470,990,420,988,91,986,381,986,408,985,382,984,413,984,473,984,478,984,446,983,486,983,417,982,397,981,385,979,388,979],"cn-nch":[461,994,492,993,439,992,471,991,493,988,467,987,491,986,497,985,440,983,468,983,465,982,487,981,490,975,87,974,423,974,494,972,496,972,460,971,474,971,412,970],"cn-dz":[492,997,438,992,471,992,465,990,461,988,467,987,487,985,440,983,468,983,496,980,493,979,491,977,497,977,475,976,490,976,87,975,423,975,460,974,466,972,93,971],"cn-gy2":[468,1000,471,991,412,988,414,987,447,987,441,986,423,985,487,985,492,985,411,983,438,983,439,983,460,983,453,982,489,982,497,981,87,980,430,980,488,980,493,979],"cn-jdz":[423,995,430,994,488,994,453,991,447,990,414,989,411,987,434,987,412,986,440,986,468,986,387,985,85,984,410,984,431,984,433,984,456,984,497,984,87,983,487,983],"cn-zj2":[451,997,464,994,443,992,462,987,452,981,434,979,440,977,444,977,463,977,468,977,410,976,450,976,249,975,308,975,414,975,447,975,454,973,441,970,453,970,423,969],"cn-mm":[451,994,442,992,464,992,462,986,444,985,452,982,249,977,308,977,434,977,450,977,410,975,454,972,463,970,414,969,440,969,447,969,468,969,445,968,429,964,441,964],"cn-st":[443,985,464,984,454,983,445,982,462,981,410,980,429,979,451,979,434,978,402,977,442,977,456,977,406,976,449,974,427,972,433,972,448,971,379,968,441,968,452,968],"cn-jm":[429,995,402,986,406,985,427,985,444,982,449,982,407,981,396,977,426,976,403,975,418,975,456,975,464,975,378,974,454,974,455,973,379,972,410,972,457,972,462,972],"cn-qhd":[415,992,384,991,385,990,413,989,486,989,397,988,417,988,458,988,485,988,408,987,422,987,409,986,424,985,469,984,421,983,437,983,470,982,387,981,436,981,448,981],"cn-cz2":[414,1000,453,995,441,990,434,989,412,987,423,987,440,987,468,987,410,986,411,985,487,985,430,984,454,984,488,984,456,983,433,982,497,981,87,980,431,980,448,980],"cn-lf":[433,998,379,993,455,993,457,993,456,989,422,988,430,988,485,987,409,985,410,985,424,985,387,984,454,984,469,984,431,983,434,982,453,982,411,981,441,981,446,981],"cn-hs2":[427,992,406,990,429,987,454,987,456,986,396,985,410,984,434,982,445,982,455,981,484,979,379,977,407,977,418,977,426,977,457,977,433,976,448,975,444,974,453,973],"cn-mz":[452,995,463,986,443,977,442,976,451,974,489,973,249,971,308,971,464,970,460,969,462,964,444,963,297,962,356,962,67,956,434,955,440,955,468,955,496,955,50,954],"cn-sg":[442,997,464,996,443,994,462,989,434,981,444,979,452,979,410,978,454,975,463,975,440,974,450,974,468,974,414,972,447,972,249,971,308,971,445,971,453,968,429,967],"cn-qy":[450,995,463,987,443,982,442,981,451,979,489,978,464,975,249,970,308,970,460,970,462,969,444,968,297,967,356,967,434,960,440,960,468,960,410,958,447,957,414,956],"cn-hb2":[414,995,447,995,441,991,411,987,434,987,423,986,488,986,430,985,410,984,433,984,456,984,487,983,491,983,412,982,440,982,448,982,468,982,454,981,490,981,493,981],"cn-sq":[410,997,434,994,456,990,406,989,449,987,433,985,462,985,447,984,448,984,414,983,444,983,379,981,441,981,453,981,457,981,488,981,429,980,455,980,427,979,464,979],"cn-ha3":[379,996,457,996,448,993,433,991,456,990,406,987,484,986,396,983,485,983,409,981,415,981,449,981,422,980,430,980,454,980,397,978,417,978,424,978,429,978,486,978],"cn-lj":[379,991,457,991,406,990,454,990,455,990,448,989,433,988,410,987,449,986,434,985,441,984,453,984,488,984,414,983,447,983,429,981,485,981,427,980,409,979,423,979],"cn-yz2":[379,1000,455,996,448,993,433,991,456,991,485,988,406,987,409,986,415,985,484,985,422,984,397,983,396,982,424,982,430,981,454,981,469,981,410,978,446,978,486,978],"cn-dq":[421,995,384,994,470,994,437,993,420,991,478,991,408,990,413,989,473,989,495,989,446,988,472,988,486,986,385,985,417,985,436,985,397,984,381,983,422,983,81,982],"cn-hrb":[382,993,381,988,99,986,386,984,481,983,81,979,78,978,472,977,82,976,88,976,389,976,437,976,482,975,79,974,495,974,80,973,91,973,458,973,90,972,371,972],"cn-ly3":[489,992,496,987,440,983,468,983,471,980,463,978,466,978,487,978,492,978,477,975,439,974,412,971,438,971,500,971,414,970,447,970,452,970,475,970,476,970,411,969],"cn-ey":[438,994,492,991,467,989,439,988,465,987,471,985,493,985,491,983,497,983,487,979,440,976,468,976,496,974,490,973,87,972,423,972,93,970,475,970,494,970,460,969],"cn-bh":[464,994,451,989,442,987,443,986,410,985,454,985,434,984,444,981,429,977,456,976,406,975,414,973,440,973,447,973,449,973,468,973,433,972,445,972,453,972,427,971],"cn-yl":[452,987,450,986,489,979,460,978,442,977,451,975,464,971,443,970,496,969,477,966,462,965,297,963,356,963,440,962,468,962,500,962,466,961,476,961,249,958,308,958],"cn-zh2":[451,996,442,994,462,994,443,992,444,984,410,982,434,982,454,979,445,975,452,975,249,972,308,972,429,971,447,971,463,971,414,970,440,970,450,970,456,970,468,970],"cn-qj":[439,990,492,988,461,987,438,982,467,982,471,982,475,982,496,979,466,978,487,976,477,975,500,974,440,973,468,973,493,973,491,971,497,970,501,970,87,969,490,969],"cn-dl2":[477,992,500,992,501,988,475,986,476,986,496,986,460,978,465,978,439,972,487,970,489,970,492,970,440,967,468,967,461,966,479,966,471,964,438,963,463,961,467,960],"cn-zyt":[493,991,461,989,491,989,497,989,438,987,439,987,487,985,492,985,465,982,471,979,490,979,87,978,423,977,494,975,474,974,488,973,93,972,411,972,435,972,441,972],"cn-gs2":[440,1000,471,991,412,988,414,987,447,987,441,986,423,985,487,985,492,985,411,983,438,983,439,983,460,983,453,982,489,982,497,981,87,980,430,980,488,980,493,979],"cn-jz":[424,998,422,996,409,995,436,993,485,993,474,991,494,991,85,990,387,990,431,990,430,988,488,988,490,988,385,987,433,986,413,985,435,985,408,984,446,984,448,984],"cn-ez":[421,998,420,997,458,994,384,991,437,990,478,989,397,988,417,988,486,988,408,984,413,983,415,983,473,983,495,983,446,982,472,982,374,979,381,979,482,979,385,978],"cn-hg":[492,994,439,992,438,991,440,991,468,991,493,987,461,985,491,985,497,985,490,984,87,983,423,983,465,982,487,982,460,980,412,979,447,979,467,979,411,978,414,978],"cn-xf":[495,994,408,992,473,992,437,991,91,990,413,989,385,988,458,988,388,987,478,987,82,985,435,985,381,984,421,983,384,982,470,982,494,982,420,979,436,979,446,979],"cn-bj2":[408,993,472,992,413,991,495,991,385,989,458,989,478,988,388,986,425,986,494,985,421,984,437,984,91,983,384,983,470,983,390,982,436,981,81,980,420,980,446,980],"cn-yl2":[490,992,469,991,422,989,424,989,409,988,494,987,411,986,485,985,85,984,87,984,430,984,436,984,385,983,413,982,491,982,387,981,412,981,431,981,435,981,408,980],"cn-ts2":[466,986,465,982,476,982,500,981,477,980,501,978,496,977,439,976,492,975,487,974,440,971,468,971,460,970,461,970,438,968,471,968,467,964,489,962,412,959,447,959],"cn-ww":[500,990,477,989,501,988,466,986,475,982,496,977,489,971,460,970,479,966,465,964,463,961,498,959,439,958,487,956,492,956,480,954,440,953,468,953,461,952,471,950],"cn-zy3":[500,996,466,992,476,989,496,982,501,982,475,980,489,976,460,975,465,975,439,968,492,967,463,966,487,966,440,964,468,964,461,962,479,961,414,960,438,960,447,960],"cn-klmy":[458,991,408,989,470,989,413,988,473,988,495,988,421,987,472,987,420,986,384,984,385,984,437,984,482,984,381,979,446,979,494,978,91,977,397,977,417,977,486,977],"cn-aks":[480,979,501,978,466,966,476,966,500,965,477,961,465,960,496,958,475,957,498,954,439,950,492,949,461,948,460,945,499,943,438,942,467,942,471,942,489,937,30,936],"cn-ks":[479,979,501,967,498,958,466,955,476,954,500,953,477,949,499,948,496,947,475,945,465,943,460,934,439,933,30,931,461,931,492,931,438,925,467,925,471,925,487,925],"cn-bt":[389,989,386,987,78,984,382,984,459,983,381,982,79,980,495,978,390,977,99,975,394,975,482,975,472,973,478,972,371,971,388,971,393,971,82,970,102,970,473,970],"cn-erds":[381,988,478,984,81,982,371,981,458,981,390,979,408,979,470,979,413,978,473,978,495,978,421,977,472,977,382,976,420,976,384,975,459,975,481,975,77,974,82,974],"cn-wh3":[416,993,400,986,367,979,401,978,428,978,374,977,419,976,375,975,399,975,86,974,376,973,432,973,372,972,398,972,380,971,391,968,397,966,417,966,371,964,404,964],"cn-rz":[396,988,455,986,379,985,457,985,485,982,374,981,426,981,432,981,94,980,407,980,409,980,418,980,415,979,422,979,449,979,397,978,417,978,448,978,406,977,486,977],"cn-jn2":[409,996,422,994,424,994,469,993,85,989,387,989,431,989,436,989,379,988,433,988,446,988,457,988,430,987,448,987,488,986,474,985,415,984,494,984,384,983,455,983],"cn-ta":[417,993,384,992,415,991,420,991,421,989,446,989,397,988,470,988,458,986,385,985,409,984,413,984,422,983,437,983,408,982,374,981,424,981,469,980,485,980,94,978],"cn-yc4":[492,988,412,985,439,985,440,985,447,985,467,985,468,985,414,984,411,983,423,983,441,983,453,983,471,982,438,981,493,981,461,979,491,979,497,979,460,978,488,978],"cn-cz3":[423,995,441,994,387,990,431,990,430,988,469,988,85,986,424,986,434,986,453,986,485,986,414,984,422,984,447,984,456,984,491,984,497,984,87,983,409,983,410,983],"cn-ld":[460,992,440,982,468,982,447,979,463,979,414,978,452,978,496,978,471,976,477,976,453,974,450,973,500,972,476,971,412,970,466,970,492,970,441,969,487,969,423,968],"cn-xx":[411,994,87,992,474,992,387,989,412,989,491,989,430,988,431,988,469,988,494,988,423,987,424,987,493,987,497,986,93,985,435,985,85,984,422,984,471,984,409,983],"cn-ly4":[493,998,497,997,467,989,490,989,423,988,87,987,438,986,494,986,471,985,488,984,411,983,435,983,441,983,453,983,461,983,474,982,436,981,414,980,447,980,487,979],"cn-nc2":[439,997,471,994,438,993,461,991,465,988,487,988,440,985,467,985,468,985,493,981,491,979,496,979,497,979,460,978,87,977,490,977,423,976,475,975,93,974,474,973],"cn-zg":[491,998,497,998,467,991,438,988,471,987,490,987,87,986,423,986,461,985,494,984,488,982,411,981,435,981,441,981,453,981,487,981,492,981,436,979,439,979,440,979],"cn-ls3":[436,994,435,993,469,991,424,990,408,988,490,988,85,987,422,987,430,987,474,987,497,987,409,986,491,986,387,985,431,985,473,985,385,984,485,984,493,984,87,983],"cn-pzh":[472,994,437,991,473,991,458,989,478,988,408,987,388,986,413,986,91,984,381,984,421,984,470,983,384,982,385,982,420,980,82,979,435,979,481,978,482,978,425,977],"cn-gy3":[460,987,466,986,477,982,439,980,465,979,492,979,489,978,500,978,475,977,476,977,461,974,501,974,438,972,471,972,487,972,440,970,468,970,463,969,467,969,423,961],"cn-my2":[493,998,491,997,87,989,467,989,423,988,494,987,490,986,438,985,471,985,441,984,488,984,435,983,461,983,387,981,412,981,436,981,440,981,447,981,468,981,411,980],"cn-ab":[499,971,501,962,476,959,480,958,500,958,477,954,479,954,466,950,475,941,496,936,465,932,489,930,460,929,395,926,260,924,319,924,266,923,325,923,439,922,265,921],"cn-gz3":[498,971,480,948,479,943,501,933,265,930,324,930,476,930,500,929,477,925,266,922,325,922,466,921,263,919,322,919,98,918,68,917,59,915,395,914,475,912,30,909],"cn-lj2":[477,996,466,992,476,990,501,987,475,981,496,978,465,974,489,972,460,971,479,965,439,964,461,962,463,962,487,962,492,962,440,959,468,959,453,958,498,958,438,956],"cn-bs":[466,988,476,988,500,987,477,982,475,978,479,978,496,974,465,970,460,967,480,967,498,962,439,960,461,958,487,958,489,958,492,958,440,955,468,955,467,952,471,952]},"environment":{"us":[128,967,147,962,138,950,111,944,179,942,3,941,123,941,12,940,152,938,106,937,207,937,39,935,133,935,5,933,9,931,19,931,188,931,11,930,126,929,208,929],"cn":[6,913,368,896,400,896,83,895,401,885,397,882,448,882,486,882,487,882,373,881,485,881,88,880,375,877,396,877,417,876,432,876,369,875,374,875,414,875,366,871],"jp":[104,968,143,964,124,960,113,959,127,959,149,959,28,958,281,957,340,957,380,952,364,951,136,949,10,947,110,947,402,947,222,943,142,939,141,938,107,937,418,937],"de":[8,985,5,983,39,982,179,978,188,978,19,977,154,977,159,974,13,973,147,967,41,966,106,966,12,965,286,965,345,965,52,963,51,962,207,962,167,961,238,961],"gb":[26,982,185,981,15,980,33,974,34,971,170,971,43,970,66,970,292,970,351,970,237,969,116,968,168,967,186,966,240,962,21,961,218,960,454,960,42,958,191,958],"fr":[8,987,188,986,3,983,154,981,13,978,12,975,167,974,19,972,41,971,39,970,207,969,17,965,18,965,52,965,157,964,179,964,40,963,42,963,197,963,286,963],"in":[1,913,469,876,162,873,475,872,493,871,29,856,492,855,64,853,231,853,49,851,228,850,161,848,248,848,307,848,390,848,256,846,315,846,163,844,247,843,306,843],"br":[265,967,324,967,290,964,349,964,56,963,257,963,316,963,259,958,318,958,467,954,93,951,233,949,71,948,260,948,319,948,198,947,94,946,258,944,317,944,387,939],"it":[5,987,188,987,3,985,154,983,39,981,41,979,13,977,52,977,12,976,19,976,286,976,345,976,51,975,179,973,167,971,207,971,40,970,166,969,194,969,17,967],"ca":[109,975,126,968,175,962,37,958,146,957,147,955,171,955,13,951,114,951,179,951,267,951,326,951,268,950,327,950,123,948,160,946,474,946,51,945,152,945,183,945],"kr":[127,971,143,965,402,956,104,954,141,953,28,951,113,951,149,949,2,947,364,946,418,946,110,945,136,945,124,940,84,939,221,938,380,938,44,937,107,935,410,934],"au":[116,985,117,969,269,968,328,968,15,960,21,960,26,960,4,956,170,954,106,951,186,949,43,948,165,948,375,948,185,946,240,946,396,945,131,943,138,943,147,943],"mx":[8,976,5,975,188,975,207,974,17,971,167,969,154,967,3,965,19,964,189,964,39,963,238,962,13,960,52,960,286,958,345,958,41,957,40,956,51,956,157,955],"es":[154,991,52,982,167,980,286,980,345,980,5,978,51,978,8,977,267,977,326,977,3,973,207,973,39,971,188,970,442,970,41,968,184,968,179,966,22,965,183,964],"id":[69,972,236,972,30,968,193,958,277,957,336,957,183,954,209,951,443,951,199,950,462,949,445,948,280,947,339,947,377,947,279,944,338,944,483,944,47,942,51,942],"nl":[26,990,170,982,4,980,237,977,218,976,116,973,185,973,33,971,21,967,34,963,11,960,168,960,219,960,66,959,187,959,292,959,351,959,25,958,43,957,269,955],"sa":[60,982,284,972,343,972,45,954,282,954,341,954,59,941,276,937,335,937,58,930,67,928,75,927,447,919,411,917,478,917,32,915,480,913,413,910,251,907,310,907],"tr":[238,982,85,976,374,974,12,971,19,971,155,970,166,970,444,970,273,968,332,968,366,968,8,967,188,967,5,965,207,965,275,965,334,965,239,964,194,963,274,963],"ch":[184,985,195,979,38,978,55,978,288,978,289,978,347,978,348,978,40,975,37,972,262,971,321,971,41,970,53,969,287,969,346,969,173,968,126,967,160,966,5,965],"pl":[238,983,188,980,39,978,3,977,8,976,5,972,17,971,106,971,159,971,432,970,166,968,179,968,41,967,366,965,383,965,12,964,147,964,194,964,286,964,345,964],"se":[200,983,220,980,36,958,211,958,431,950,461,947,96,941,500,939,501,935,261,934,320,934,427,933,258,927,317,927,452,927,466,927,265,923,324,923,56,922,290,922],"be":[42,977,157,977,106,970,197,970,401,970,444,970,159,968,15,967,239,966,27,964,26,962,170,962,238,962,375,962,486,962,4,961,275,961,334,961,396,961,397,961],"th":[363,984,442,975,462,971,434,968,51,966,13,965,279,965,338,965,377,965,446,965,52,964,80,963,81,962,154,962,250,962,286,962,309,962,345,962,472,962,484,962],"at":[114,966,198,966,68,965,171,965,160,964,57,962,391,960,291,958,350,958,175,957,277,957,336,957,176,955,37,952,55,952,108,952,289,952,348,952,38,951,56,949],"no":[158,960,178,958,177,952,180,946,140,942,271,935,330,935,115,931,297,931,356,931,176,930,174,929,261,924,320,924,172,921,204,921,264,921,323,921,108,920,298,918],"il":[237,978,33,969,293,965,352,965,170,963,34,961,276,959,335,959,15,958,58,958,26,955,66,954,292,954,351,954,43,953,67,952,403,952,218,951,4,950,285,950],"ie":[15,990,4,982,185,981,237,977,170,976,218,975,116,970,33,968,21,962,34,962,186,962,11,960,168,959,187,959,66,958,269,958,292,958,328,958,351,958,43,956],"sg":[21,964,274,961,333,961,170,958,239,956,117,954,111,951,155,951,403,951,43,950,74,950,273,950,275,950,332,950,334,950,42,948,237,948,157,944,375,943,138,942],"my":[110,979,222,975,223,969,142,966,107,963,124,963,141,963,136,962,402,959,2,958,125,957,149,957,419,957,426,956,127,954,10,951,428,951,104,949,112,949,145,949],"ph":[163,972,195,971,46,970,224,970,256,966,315,966,190,962,248,962,307,962,162,961,40,955,288,955,347,955,194,954,18,950,206,947,262,947,321,947,166,945,173,945],"vn":[277,977,336,977,14,968,193,968,183,967,69,966,236,966,483,965,442,961,462,961,199,960,377,959,443,958,263,957,322,957,175,956,445,956,47,955,225,955,280,955],"ng":[294,922,353,922,300,910,359,910,62,909,95,909,229,909,498,895,203,888,392,884,296,883,355,883,65,875,101,875,232,875,63,874,230,874,178,873,395,871,494,869],"eg":[246,987,305,987,251,975,310,975,89,970,243,970,255,970,302,970,314,970,247,963,306,963,490,959,385,957,480,955,244,953,303,953,253,952,312,952,75,949,254,944],"ar":[237,984,43,981,66,975,292,975,351,975,4,974,15,971,34,970,185,970,25,969,170,969,26,968,168,968,293,962,352,962,240,958,218,953,239,953,454,953,187,952],"za":[66,975,292,975,351,975,237,974,403,973,168,972,4,971,33,970,43,969,74,968,170,968,191,966,396,966,455,966,454,965,15,963,375,963,26,962,25,961,456,960],"dk":[202,982,156,979,169,976,241,976,206,966,164,965,196,965,204,964,205,961,182,959,172,958,264,953,323,953,131,952,390,951,216,948,176,945,477,944,476,942,100,941],"fi":[220,972,200,967,20,958,211,949,452,949,431,948,451,938,210,934,215,934,461,925,57,923,96,922,467,922,86,920,93,920,94,920,265,920,324,920,56,919,291,919],"nz":[160,983,184,981,171,979,38,977,109,977,114,976,175,975,18,972,55,972,262,972,289,972,321,972,348,972,126,970,192,963,267,963,326,963,13,962,173,962,263,960],"pt":[55,993,289,993,348,993,160,985,184,984,53,982,287,982,346,982,18,978,192,978,37,977,262,971,321,971,176,970,114,968,173,967,256,964,315,964,182,962,108,961],"cz":[179,988,3,982,8,981,154,979,19,978,188,978,286,977,345,977,52,975,51,974,159,973,147,972,167,972,13,971,207,971,5,970,383,968,41,967,123,966,106,964],"ro":[41,989,195,979,18,975,46,972,224,972,8,970,288,969,347,969,52,968,256,968,315,968,190,966,263,966,286,966,322,966,345,966,184,965,194,965,267,964,326,964],"gr":[40,989,8,979,52,978,286,976,345,976,188,974,190,972,5,971,154,971,194,971,195,971,18,970,166,970,288,969,347,969,13,968,19,967,39,967,159,967,3,966],"hu":[157,994,197,986,194,981,240,980,21,977,444,977,239,971,186,969,188,969,166,968,159,965,190,965,185,964,5,963,41,963,43,963,106,963,401,963,487,963,8,962],"ua":[33,981,240,975,66,972,237,972,292,972,351,972,239,971,4,970,34,969,403,968,170,966,186,965,157,964,185,964,42,963,168,963,444,961,21,959,74,959,191,958],"ru":[112,975,120,958,145,958,223,958,141,955,152,953,107,952,110,951,125,951,121,947,222,947,133,945,127,944,28,943,142,942,208,939,367,939,136,938,143,938,10,937],"ae":[60,964,276,958,335,958,16,954,284,953,343,953,478,953,58,948,59,942,458,940,67,923,75,920,25,918,447,912,481,912,293,907,352,907,455,905,74,903,285,903],"cl":[190,988,194,976,166,974,195,973,40,972,248,972,307,972,29,970,288,967,347,967,41,966,197,961,256,961,315,961,444,960,42,959,157,958,163,958,278,957,337,957],"co":[68,980,72,977,235,977,249,976,308,976,50,973,226,973,277,972,336,972,233,967,71,966,199,966,391,964,198,963,260,962,319,962,193,961,257,960,316,960,69,958],"pk":[252,961,311,961,476,954,477,946,100,937,103,935,390,929,49,927,228,926,296,926,355,926,245,920,304,920,394,916,202,914,196,912,161,909,162,909,205,909,164,908],"bd":[161,980,163,954,245,952,304,952,244,944,303,944,393,943,102,942,415,942,248,940,307,940,278,938,337,938,29,935,390,935,379,934,457,934,88,933,454,933,253,932],"pe":[249,987,308,987,463,978,47,973,225,973,460,972,235,970,72,969,406,968,407,968,92,967,391,967,488,966,71,964,233,964,68,963,260,962,319,962,91,961,423,960],"sk":[377,982,462,982,167,981,52,980,154,980,286,980,345,980,13,978,363,978,405,978,8,975,39,974,442,974,484,973,207,972,483,972,189,971,188,970,267,970,326,970],"bg":[154,984,13,982,442,982,51,980,41,978,8,977,39,975,167,974,267,973,326,973,188,971,207,971,462,969,483,969,40,968,263,968,322,968,179,967,377,967,184,966],"hr":[55,987,289,987,348,987,38,982,192,980,176,975,256,972,315,972,160,971,184,971,18,969,108,968,492,968,182,967,173,966,195,965,262,964,288,964,321,964,347,964],"si":[429,975,384,973,201,972,406,972,135,968,424,967,441,967,193,965,199,965,72,964,87,964,235,964,407,964,422,964,84,962,418,962,92,959,71,958,233,958,409,958],"lt":[38,993,287,988,346,988,53,987,160,981,184,979,18,978,192,977,176,976,37,972,173,969,182,968,108,966,262,966,321,966,114,964,256,964,315,964,195,958,288,958],"lv":[257,987,316,987,198,982,265,978,324,978,259,971,318,971,387,971,391,965,489,964,7,963,57,962,430,962,68,961,258,960,317,960,94,958,291,958,350,958,439,958],"ee":[198,976,94,967,391,966,23,962,56,962,290,962,349,962,257,959,316,959,430,959,71,957,233,957,260,955,319,955,72,954,135,954,235,954,68,953,387,951,463,951],"ir":[276,969,335,969,59,967,25,958,67,958,45,948,282,948,341,948,74,945,447,943,34,942,75,942,237,938,293,936,352,936,375,936,455,936,170,935,379,934,403,934],"iq":[67,977,58,967,285,952,344,952,276,949,335,949,25,946,293,943,352,943,32,942,45,942,282,942,341,942,16,941,454,941,455,939,480,935,379,933,457,933,251,931],"kw":[16,982,45,964,282,964,341,964,478,933,59,924,276,923,335,923,58,913,75,913,67,911,458,910,413,908,447,905,411,904,480,901,32,893,479,893,251,891,310,891],"qa":[284,906,343,906,60,885,478,883,413,878,16,850,45,839,282,839,341,839,411,835,482,830,425,825,458,817,385,815,77,810,386,806,75,805,151,805,412,805,394,804],"et":[395,960,98,956,294,952,353,952,498,945,101,936,203,930,392,930,63,912,230,912,31,909,95,886,70,878,234,877,65,871,232,871,296,869,355,869,178,867,499,864],"ke":[294,945,353,945,296,940,355,940,70,936,234,936,392,935,101,931,174,922,62,912,229,912,178,910,477,904,395,901,476,901,204,900,98,899,164,897,205,897,48,895],"gh":[295,962,354,962,492,960,471,946,496,945,438,944,90,942,475,942,493,942,436,936,469,931,53,930,297,930,356,930,192,929,287,929,346,929,176,925,254,924,313,924],"tz":[494,957,381,940,300,938,359,938,466,937,150,935,95,933,97,931,298,931,357,931,499,931,501,929,500,926,115,921,272,921,331,921,140,918,465,917,420,915,299,912],"ma":[168,983,33,975,34,975,43,972,4,970,293,968,352,968,185,966,237,965,240,965,454,964,455,962,191,960,15,959,26,958,170,958,444,958,278,957,337,957,285,955],"dz":[59,977,285,961,344,961,58,958,293,955,352,955,25,952,33,939,276,939,335,939,168,933,34,930,66,930,237,930,292,930,351,930,16,928,32,923,43,923,45,923],"ve":[47,980,225,980,391,980,198,977,249,972,308,972,463,972,71,971,233,971,277,970,336,970,260,969,319,969,72,967,235,967,257,966,316,966,23,965,50,963,226,963],"ec":[193,979,14,972,280,972,339,972,199,971,209,970,443,969,277,968,336,968,30,966,445,966,183,965,462,964,377,963,51,961,201,961,279,959,338,959,428,959,47,958],"uy":[174,983,204,963,271,945,330,945,202,944,164,943,205,943,118,941,178,937,296,937,355,937,63,936,230,936,35,933,180,930,196,929,100,920,156,920,476,915,24,913],"cr":[260,995,319,995,94,975,391,973,68,971,235,969,249,969,308,969,72,968,198,967,47,966,225,966,50,964,226,964,463,964,257,962,316,962,372,961,488,961,406,959],"pa":[47,977,225,977,201,973,406,973,199,971,277,970,336,970,50,969,226,969,233,969,71,968,68,967,249,967,308,967,391,967,407,966,460,966,198,965,54,964,429,964],"cn-bj":[382,992,459,990,81,987,361,984,82,983,378,982,446,982,399,980,376,979,279,976,338,976,367,976,365,975,434,975,404,970,99,968,80,967,405,967,445,967,363,965],"cn-sh":[375,990,396,987,403,986,453,985,456,976,401,975,433,975,490,972,34,968,485,968,486,967,275,966,334,966,397,966,400,966,448,966,373,965,417,963,88,962,273,960],"cn-tj":[447,970,453,968,490,968,411,965,455,961,454,959,74,955,415,955,417,953,276,952,335,952,88,950,32,949,485,948,170,947,375,947,456,947,34,946,386,946,397,946],"cn-cq":[435,989,491,979,437,976,439,967,467,967,96,964,388,963,465,962,387,959,430,958,489,958,495,953,497,952,421,951,265,950,324,950,93,948,258,947,317,947,381,944],"cn-he":[472,970,383,960,385,960,80,959,412,955,99,952,362,951,398,951,365,949,404,949,432,948,363,947,254,946,313,946,371,945,22,943,83,942,376,941,39,939,484,939],"cn-sx":[386,970,425,965,389,963,417,963,83,962,485,959,397,957,487,957,373,956,448,956,368,955,400,955,369,954,190,952,248,951,307,951,414,950,88,949,486,948,79,947],"cn-nm":[389,979,134,960,165,953,139,951,78,947,102,945,162,945,268,942,327,942,469,942,474,941,173,938,46,936,224,936,256,936,315,936,131,935,425,935,481,935,190,933],"cn-ln":[376,982,365,981,484,980,99,977,363,976,446,975,434,973,81,972,383,968,472,968,73,967,377,967,462,965,22,963,405,961,483,961,382,960,77,959,279,958,338,958],"cn-jl":[446,994,73,987,376,987,279,986,338,986,434,985,382,984,459,983,361,980,365,980,405,979,363,978,82,977,445,977,377,975,443,974,99,973,378,973,80,972,484,972],"cn-hl":[459,991,399,988,382,987,367,984,73,983,445,983,361,981,443,981,81,977,279,973,338,973,378,971,428,971,446,971,209,970,405,970,426,966,434,966,376,965,377,965],"cn-js":[487,983,368,982,373,981,397,981,448,981,400,980,485,979,88,976,414,976,417,974,486,974,415,970,369,968,371,968,89,967,386,967,401,967,85,964,247,964,306,964],"cn-zj":[410,979,418,978,384,977,402,976,87,973,419,971,441,970,364,969,416,968,426,966,422,965,370,964,409,964,280,963,339,963,424,963,54,962,380,962,428,961,423,960],"cn-ah":[374,987,366,984,362,978,17,976,371,976,432,973,369,972,486,972,414,971,398,970,238,969,404,966,412,966,368,965,373,965,83,964,397,964,401,964,433,964,448,964],"cn-fj":[372,992,464,969,451,967,488,966,429,964,94,963,260,957,319,957,452,957,391,956,407,955,406,954,450,954,71,953,233,953,135,951,210,951,463,951,441,949,92,948],"cn-jx":[384,990,441,986,410,977,423,977,424,974,84,973,409,972,370,971,422,971,91,969,418,968,460,968,429,967,488,965,54,964,364,959,473,959,380,958,402,958,92,957],"cn-sd":[415,979,83,976,453,971,485,971,375,970,456,970,487,970,397,969,448,969,373,968,433,968,396,967,417,966,490,965,74,962,368,962,414,962,400,961,386,960,425,960],"cn-ha":[247,976,306,976,371,972,412,971,32,970,414,970,83,967,373,964,490,964,397,963,448,963,85,962,486,962,487,962,246,961,305,961,485,961,374,960,385,956,417,956],"cn-hb":[436,985,438,985,496,983,421,974,471,972,497,967,439,953,489,951,492,949,491,943,64,942,231,942,387,942,388,942,430,942,437,941,295,937,354,937,76,933,435,933],"cn-hn":[460,985,92,980,424,980,422,977,406,975,407,975,429,973,488,971,87,969,423,965,384,963,370,962,409,962,50,961,226,961,84,958,441,958,464,957,473,957,54,954],"cn-gd":[406,987,407,987,91,980,460,978,429,977,424,975,422,973,50,967,226,967,488,966,72,960,235,960,384,960,54,959,409,959,464,959,370,958,84,957,87,957,249,957],"cn-gx":[467,977,387,971,431,969,96,968,94,963,430,961,488,961,439,959,489,957,452,955,491,954,56,953,290,953,349,953,463,952,7,951,372,951,76,948,86,948,265,948],"cn-hi":[260,979,319,979,71,975,198,975,233,975,391,972,372,971,57,967,488,967,451,964,86,963,93,963,291,963,350,963,429,963,68,959,257,959,316,959,56,958,290,958],"cn-sc":[494,958,300,950,359,950,115,934,65,933,232,933,298,923,357,923,420,911,97,910,31,909,272,906,331,906,381,901,150,895,499,895,203,893,294,893,353,893,140,892],"cn-gz":[467,971,93,968,76,964,465,961,435,956,200,955,431,955,495,954,437,950,387,947,491,946,388,945,381,943,430,942,20,941,466,940,265,939,324,939,211,938,220,938],"cn-yn":[420,969,501,955,466,950,500,949,494,944,499,935,65,931,232,931,461,923,213,922,272,915,331,915,96,911,95,910,381,910,150,902,148,896,20,893,427,892,431,892],"cn-xz":[395,987,498,972,62,956,229,956,101,948,392,942,203,937,294,936,353,936,63,899,230,899,70,895,234,895,174,883,499,875,178,874,212,868,31,867,204,864,95,860],"cn-sn":[365,978,80,977,81,973,73,968,472,968,446,967,363,965,279,964,338,964,434,964,408,963,459,963,376,962,377,962,484,962,382,960,473,958,82,957,462,957,416,955],"cn-gs":[476,973,390,966,202,955,164,951,205,948,477,946,35,941,469,940,204,938,48,937,227,937,252,936,311,936,196,935,102,933,103,929,169,929,493,929,241,928,162,927],"cn-qh":[392,989,395,952,203,951,294,949,353,949,98,948,62,936,229,936,63,931,230,931,498,920,174,904,234,895,70,894,178,888,95,881,296,881,355,881,118,877,205,877],"cn-nx":[393,979,389,966,131,965,163,957,390,957,394,957,206,953,415,950,278,949,337,949,470,949,191,948,78,946,375,946,79,945,161,944,165,944,379,943,396,943,457,943],"cn-xj":[394,971,252,969,311,969,477,949,390,947,479,942,476,940,48,935,227,935,253,931,312,931,100,929,102,929,196,927,447,927,393,926,379,925,457,925,469,919,245,918],"us-al":[143,988,113,983,127,983,149,971,2,968,141,968,107,966,136,966,124,962,125,956,10,954,110,952,145,950,28,949,281,942,340,942,364,941,142,940,120,939,402,939],"us-ak":[146,917,482,906,126,898,474,898,109,895,217,891,137,888,9,881,114,881,139,881,55,880,214,880,289,880,348,880,37,879,38,879,160,878,108,877,134,877,129,875],"us-az":[159,984,147,974,179,972,19,971,21,970,188,968,3,966,157,965,39,964,42,963,111,962,5,961,166,961,268,960,327,960,197,959,238,959,400,959,194,958,273,958],"us-ar":[141,982,125,981,145,976,136,971,120,970,110,967,104,966,142,966,28,963,113,962,222,962,127,960,149,960,152,958,124,957,112,956,121,956,143,954,44,952,221,951],"us-ca":[176,980,287,970,346,970,173,969,53,968,55,966,289,966,348,966,182,965,160,962,38,961,126,958,172,957,192,957,18,956,37,954,114,953,23,952,288,952,347,952],"us-co":[126,992,37,977,9,975,184,969,171,967,146,965,160,962,474,962,114,961,38,960,268,960,327,960,18,959,175,959,262,957,321,957,134,956,55,955,147,955,179,955],"us-ct":[28,979,141,976,142,972,223,971,124,969,127,968,107,967,112,967,222,967,136,965,143,964,125,962,149,961,104,952,145,952,221,952,44,951,113,948,2,947,10,945],"us-de":[138,986,128,974,274,970,333,970,106,962,273,961,332,961,147,959,133,955,155,952,27,951,117,951,238,950,21,948,179,948,112,947,19,946,123,946,159,946,0,944],"us-fl":[221,976,44,975,152,970,110,967,133,967,223,965,145,962,120,960,141,959,142,958,125,957,107,956,208,956,222,954,123,953,209,953,367,953,121,951,127,950,28,949],"us-ga":[149,987,104,983,136,982,127,979,124,978,143,973,125,972,145,964,141,963,107,962,2,959,142,955,402,955,10,951,152,949,364,949,110,948,281,948,340,948,28,947],"us-hi":[171,981,160,978,37,976,175,973,38,968,23,966,55,964,289,964,348,964,109,961,184,957,192,955,126,954,173,954,108,953,262,952,287,952,321,952,346,952,9,951],"us-id":[150,961,140,950,272,944,331,944,95,934,24,931,212,931,65,921,177,921,232,921,213,916,300,914,359,914,178,913,158,912,494,912,203,911,381,906,298,898,357,898],"us-il":[11,985,15,973,26,970,269,970,328,970,170,969,4,968,117,961,21,960,185,957,34,953,237,953,218,951,43,950,106,950,131,949,186,948,375,948,33,946,396,945],"us-in":[11,969,116,961,138,960,21,959,128,957,27,954,170,953,111,951,458,948,106,947,239,944,269,943,328,943,273,941,332,941,43,940,74,940,403,940,275,939,334,939],"us-ia":[174,958,271,957,330,957,119,953,205,944,216,944,204,943,234,942,70,941,144,925,180,923,202,919,129,918,177,911,35,909,139,909,164,902,178,902,476,902,130,901],"us-ks":[144,968,216,962,205,956,118,953,202,947,130,938,35,937,181,937,477,935,476,930,172,929,196,929,139,928,219,927,131,926,165,923,129,921,174,921,204,920,271,920],"us-ky":[121,974,107,970,145,968,112,960,152,960,44,958,221,958,125,957,141,955,133,948,222,947,128,946,142,946,223,944,136,941,110,940,208,940,28,939,104,939,367,939],"us-la":[120,974,107,956,141,956,145,954,112,951,44,947,221,946,125,943,223,943,110,941,152,936,127,934,142,932,222,932,143,928,136,927,28,925,104,925,133,923,138,922],"us-me":[427,921,500,910,266,901,325,901,148,900,150,900,501,891,461,888,36,887,220,885,420,885,20,884,466,883,211,882,200,880,213,876,97,870,140,869,115,862,215,862],"us-md":[208,988,133,986,207,976,189,974,152,972,167,971,360,970,51,968,39,966,147,962,13,960,142,960,382,960,405,960,179,959,188,959,404,959,154,958,209,958,376,958],"us-ma":[149,991,136,985,113,978,142,976,125,970,402,970,110,969,127,964,28,963,104,962,2,960,418,960,143,959,145,959,107,957,141,956,135,954,54,952,222,952,281,950],"us-mi":[145,989,136,984,142,983,107,981,152,975,149,973,113,972,124,970,141,966,110,962,222,961,28,957,112,957,120,957,104,956,127,953,419,953,208,952,367,952,44,951],"us-mn":[109,992,37,970,9,968,18,967,268,967,327,967,134,965,147,963,179,962,184,962,474,961,165,960,171,959,108,958,38,956,55,956,146,956,289,956,348,956,288,955],"us-ms":[143,994,104,983,113,979,141,977,149,972,10,971,110,968,136,967,124,964,107,960,2,959,28,954,125,953,112,950,44,944,145,944,221,944,223,944,142,941,402,941],"us-mo":[138,982,147,979,111,974,0,967,133,965,179,959,117,957,123,957,106,954,39,952,152,952,207,952,273,952,332,952,360,951,188,948,3,947,208,947,238,947,120,946],"us-mt":[139,971,216,959,172,954,180,944,264,940,323,940,134,935,182,932,271,930,330,930,108,926,165,926,268,926,327,926,177,925,176,924,79,923,173,923,241,923,126,922],"us-ne":[181,987,144,966,219,965,269,962,328,962,481,959,187,949,218,947,119,938,116,934,131,934,11,932,165,931,26,927,134,927,15,926,278,926,337,926,268,924,327,924],"us-nv":[165,978,206,977,134,968,102,965,268,963,327,963,389,956,169,954,393,954,35,952,186,950,269,950,328,950,116,949,219,949,126,946,187,946,163,945,144,944,191,944],"us-nh":[215,941,210,940,449,929,135,922,281,918,340,918,440,918,468,918,54,916,450,916,149,915,124,913,113,912,441,912,464,910,104,907,201,907,384,907,2,906,380,905],"us-nj":[123,986,208,980,360,977,112,967,128,965,152,965,189,965,207,962,361,958,378,958,167,957,111,955,51,954,39,952,382,952,142,951,147,951,405,951,222,950,376,950],"us-nm":[165,989,268,980,327,980,131,968,389,967,126,965,79,960,139,959,109,956,173,945,269,945,328,945,206,944,9,942,11,942,159,941,18,940,144,940,195,940,106,939],"us-ny":[210,973,429,972,54,968,407,964,406,963,72,962,235,962,464,957,291,956,350,956,488,955,57,954,92,954,124,954,372,954,94,952,201,952,86,951,149,951,384,951],"us-nc":[149,989,124,985,125,984,113,982,142,973,145,973,107,971,141,971,127,967,104,966,110,965,143,963,28,962,152,959,402,958,222,951,2,949,418,948,112,947,10,945],"us-nd":[217,958,270,925,329,925,105,888,144,888,119,872,130,869,181,862,216,861,482,860,153,856,139,843,478,838,196,836,118,835,219,834,131,833,205,833,269,833,328,833],"us-oh":[111,986,128,982,147,961,117,960,274,960,333,960,106,953,273,952,332,952,0,950,133,947,238,945,11,943,19,943,155,943,179,943,27,942,21,940,188,940,112,939],"us-ok":[129,971,216,961,134,959,172,958,165,952,79,951,241,951,156,949,268,947,327,947,182,945,108,939,176,937,35,936,169,936,173,936,131,933,389,933,126,931,264,931],"us-or":[150,966,381,953,115,950,261,944,272,944,320,944,331,944,24,942,258,935,317,935,465,935,388,923,177,921,158,920,178,920,259,920,318,920,466,919,65,918,232,918],"us-pa":[107,982,127,977,110,976,136,971,143,971,104,968,125,966,28,963,113,963,145,961,149,960,112,959,121,956,124,956,44,955,120,955,221,954,10,953,223,952,142,949],"us-ri":[125,983,145,977,124,976,222,975,136,973,110,972,149,969,28,966,107,966,208,966,152,965,209,964,223,963,428,963,419,962,399,961,123,960,201,960,426,960,112,958],"us-sc":[127,994,104,988,113,973,141,971,149,967,10,965,2,964,110,964,136,963,124,959,107,954,125,949,28,948,112,945,145,939,221,939,223,939,281,939,340,939,44,938],"us-sd":[119,968,130,966,181,963,219,946,131,944,165,942,134,940,269,940,328,940,216,936,481,935,196,933,187,929,205,929,218,928,206,926,118,925,477,924,394,922,79,920],"us-tn":[125,989,152,981,142,977,107,976,136,973,120,968,113,964,112,962,149,962,141,961,124,959,208,959,367,959,44,958,209,957,221,957,222,957,123,955,121,954,223,954],"us-tx":[109,965,474,965,9,957,126,956,37,945,171,942,184,939,160,938,134,933,175,933,262,932,321,932,114,931,18,928,38,928,147,928,165,926,179,925,268,925,327,925],"us-ut":[179,980,128,979,106,974,39,972,188,969,3,967,19,964,126,963,0,962,5,962,123,962,138,961,111,959,167,959,159,958,207,958,152,957,154,957,8,956,9,955],"us-vt":[213,928,212,910,122,900,272,900,331,900,97,896,499,896,420,895,500,885,150,867,427,867,501,866,461,863,36,862,20,860,220,860,466,858,200,855,211,849,115,846],"us-va":[124,991,136,989,113,987,125,973,127,972,104,971,142,969,143,967,402,966,145,962,110,961,107,960,141,960,2,959,28,957,418,956,135,951,364,950,10,949,152,949],"us-wa":[140,966,115,961,272,952,331,952,381,942,213,939,65,935,232,935,494,932,466,928,212,923,500,923,501,920,261,918,320,918,495,917,499,916,420,914,258,911,317,911],"us-wv":[143,927,104,924,127,923,121,921,141,913,113,908,2,900,107,898,281,896,340,896,120,895,149,895,10,894,132,894,110,891,136,890,124,886,125,880,215,878,28,877],"us-wi":[145,981,125,975,208,974,123,972,112,970,133,965,142,965,209,961,120,960,367,960,136,959,107,958,147,957,189,957,459,957,399,956,382,955,44,953,128,952,221,952],"us-wy":[214,912,270,899,329,899,217,898,482,886,137,856,105,845,269,829,328,829,11,823,117,811,116,810,458,807,165,806,186,806,134,804,425,801,130,799,268,799,327,799],"jp-tk":[13,991,52,984,8,983,167,983,286,982,345,982,5,981,51,980,39,979,207,979,188,978,3,977,179,974,267,972,326,972,41,971,442,968,12,967,462,967,184,965],"kr-sl":[275,985,334,985,274,982,333,982,273,979,332,979,239,977,17,970,166,968,238,967,444,967,374,966,403,965,401,959,194,956,366,956,85,955,360,953,21,952,74,952],"gb-ln":[241,993,169,980,182,980,35,979,172,967,176,962,202,962,264,962,323,962,164,961,162,959,196,959,206,958,173,955,256,952,315,952,55,949,139,949,289,949,348,949],"fr-pr":[42,994,197,986,240,980,21,977,194,977,444,974,239,971,188,970,186,969,185,968,106,965,159,965,166,965,5,964,43,964,190,961,41,959,401,959,8,958,19,958],"de-by":[177,970,180,963,24,960,297,958,356,958,388,955,258,954,317,954,176,953,299,946,358,946,261,944,320,944,160,943,55,941,289,941,348,941,38,940,259,940,264,940],"de-nw":[106,984,166,976,3,974,179,974,39,973,194,973,19,971,197,970,21,968,41,967,8,966,42,965,157,965,188,965,5,962,154,962,268,961,327,961,190,959,400,959],"de-bw":[38,985,37,983,55,981,289,981,348,981,114,978,184,978,192,976,171,975,262,974,321,974,287,973,346,973,53,971,173,970,176,970,175,969,18,966,23,964,267,963],"in-mh":[49,980,228,979,245,962,304,962,163,959,248,957,307,957,415,957,88,954,244,949,303,949,487,949,278,948,337,948,433,946,78,945,191,945,456,945,102,944,379,943],"in-ka":[163,968,469,964,29,961,169,960,241,960,156,959,493,959,256,956,315,956,248,949,307,949,475,949,46,948,224,947,196,946,79,945,164,945,182,943,389,943,195,942],"in-tn":[29,972,162,968,206,963,161,959,46,958,224,958,102,957,49,954,228,954,278,953,337,953,195,952,248,952,307,952,169,951,191,950,190,948,240,947,256,947,315,947],"br-sp":[202,966,35,965,156,961,169,959,241,958,204,956,205,954,264,953,323,953,100,951,196,950,172,948,162,945,234,944,70,943,182,942,163,941,180,937,206,937,297,936],"au-nsw":[134,989,131,978,268,976,327,976,389,967,126,960,206,955,79,953,109,953,139,952,11,948,269,948,328,948,169,945,102,944,144,942,156,942,173,942,116,941,241,941],"it-lm":[194,987,190,982,159,976,46,974,224,974,17,970,41,970,191,970,8,969,19,968,42,968,155,968,197,968,238,968,368,967,400,967,250,966,309,966,444,966,157,965],"es-ct":[207,984,154,983,188,982,51,981,13,980,189,979,5,974,52,974,405,974,39,972,267,972,286,972,326,972,345,972,8,971,123,971,209,970,442,970,12,969,462,969],"mx-cd":[66,983,292,983,351,983,454,981,455,980,34,972,293,971,352,971,33,968,4,967,444,967,185,966,285,966,344,966,396,966,403,964,433,964,43,963,240,963,375,963],"de-be":[241,984,156,980,35,976,196,973,206,968,182,961,162,960,173,960,202,960,164,959,131,954,172,953,256,952,315,952,469,952,163,951,176,949,287,949,346,949,53,948],"de-hh":[237,985,15,982,26,976,4,971,33,969,116,969,34,968,43,966,185,964,25,963,21,962,218,960,27,958,66,958,292,958,351,958,403,958,74,957,11,954,117,953],"de-he":[175,989,114,981,37,979,160,975,184,973,262,970,321,970,483,968,109,967,23,965,183,964,277,962,336,962,18,961,38,960,126,959,263,959,267,959,322,959,326,959],"de-ni":[180,971,264,970,323,970,241,968,156,967,182,967,35,958,139,958,176,958,108,957,173,957,202,955,129,954,169,953,164,948,268,943,327,943,216,940,271,940,330,940],"de-sn":[256,979,315,979,182,975,195,974,160,970,55,969,108,969,176,969,289,969,348,969,18,968,38,967,287,967,346,967,53,966,192,965,288,963,347,963,37,962,40,962],"de-sh":[70,983,234,983,204,966,271,960,330,960,118,958,205,952,202,946,178,943,180,943,35,935,24,929,164,929,100,923,196,923,296,923,355,923,63,922,230,922,119,921],"de-rp":[171,989,483,976,37,975,183,975,114,973,160,969,184,968,267,968,326,968,263,967,322,967,51,966,13,963,262,963,321,963,9,962,377,962,208,960,286,960,345,960],"de-th":[182,982,108,980,287,977,346,977,55,976,289,976,348,976,53,975,38,970,160,970,173,969,241,965,192,964,264,964,323,964,18,963,156,962,37,958,172,958,184,958],"de-bb":[158,970,24,952,180,949,495,941,271,939,330,939,388,935,465,934,261,933,297,933,320,933,356,933,108,929,258,928,317,928,176,927,299,926,358,926,109,925,129,925],"de-mv":[24,958,180,953,174,943,271,941,330,941,204,940,70,937,234,937,158,931,172,931,203,931,264,922,323,922,140,920,241,920,177,918,156,917,182,915,115,913,164,913],"de-sl":[39,988,147,980,3,978,154,974,159,974,8,973,106,972,188,972,286,969,345,969,19,968,52,967,13,966,51,966,5,964,167,963,41,962,126,962,207,962,123,959],"de-st":[172,971,158,963,271,962,330,962,204,959,178,953,177,949,24,946,264,945,323,945,129,944,182,944,174,943,241,943,156,939,164,937,297,937,356,937,176,936,108,935],"de-hb":[130,987,219,970,481,964,144,963,269,957,328,957,187,956,218,951,119,937,116,935,131,935,278,933,337,933,15,931,11,930,165,930,393,928,26,925,134,924,268,921],"fr-ra":[176,982,264,981,323,981,156,980,241,977,173,975,256,972,315,972,55,968,287,968,289,968,346,968,348,968,53,967,172,967,195,966,108,965,38,962,18,961,169,961],"fr-na":[199,976,267,976,326,976,175,975,193,974,201,970,483,968,30,967,69,965,236,965,13,964,171,964,209,964,442,964,462,964,51,963,277,963,336,963,377,962,189,961],"fr-oc":[262,986,321,986,18,985,38,984,37,981,55,979,289,979,348,979,160,978,267,977,326,977,263,974,322,974,171,973,53,971,287,970,346,970,109,969,13,968,175,968],"fr-pd":[4,981,26,981,186,979,240,975,15,973,33,970,157,968,218,968,66,966,168,966,292,966,351,966,42,964,43,964,170,964,197,964,237,964,187,962,191,962,278,961],"fr-br":[197,982,185,979,240,976,191,975,42,969,157,969,4,966,43,965,206,965,194,964,218,964,26,962,187,957,278,957,337,957,269,954,328,954,15,953,21,952,159,952],"fr-hf":[219,983,218,982,278,977,337,977,185,962,206,962,191,960,15,959,26,959,186,957,379,957,457,957,181,956,4,954,196,953,481,953,33,952,237,952,130,949,197,948],"fr-ge":[8,987,5,986,167,982,207,981,19,980,3,978,39,978,154,978,12,975,41,974,179,972,52,971,238,971,286,971,345,971,13,970,51,970,157,970,42,969,147,969],"fr-paca":[208,983,167,979,207,978,123,974,405,974,51,971,209,970,462,970,133,965,382,965,12,964,377,964,361,963,459,963,434,962,154,961,183,961,188,961,82,960,446,960],"it-vn":[224,989,46,988,166,982,194,980,41,972,248,972,307,972,278,969,337,969,40,966,191,966,197,966,288,966,347,966,42,965,195,965,29,962,400,962,444,962,157,961],"it-er":[278,980,337,980,240,976,186,975,166,970,194,967,34,966,190,966,197,965,415,963,42,962,185,962,218,961,396,961,66,960,168,960,187,960,292,960,351,960,379,960],"it-pm":[287,981,346,981,53,980,38,978,288,978,347,978,55,977,289,977,348,977,160,976,184,968,256,968,315,968,492,968,173,965,442,965,176,964,37,963,52,963,195,962],"it-ts":[199,987,201,980,69,979,236,979,183,974,209,970,277,970,336,970,30,968,423,967,280,966,339,966,443,966,483,966,54,965,370,964,409,964,445,963,47,961,68,961],"it-lz":[166,987,42,981,197,981,190,980,157,977,224,977,46,976,159,973,41,971,239,971,240,971,8,969,444,969,191,967,40,965,195,965,19,964,186,964,188,964,17,963],"it-cm":[256,985,315,985,18,979,40,979,288,978,347,978,173,974,46,973,224,972,29,971,41,971,184,968,182,966,53,965,190,965,194,965,287,965,346,965,192,962,166,960],"it-si":[169,973,35,965,206,963,202,962,477,962,156,959,241,957,205,954,187,953,476,951,164,950,278,949,337,949,162,946,163,941,131,940,182,940,390,939,256,938,315,938],"es-md":[42,986,157,986,186,982,194,981,240,972,21,970,159,970,166,968,190,966,444,966,191,965,185,964,5,963,41,963,46,961,224,960,239,960,8,959,106,959,154,959],"es-an":[257,983,316,983,56,982,290,981,349,981,391,981,68,977,57,976,94,975,291,972,350,972,463,969,71,967,233,967,387,967,23,966,260,966,319,966,72,965,235,965],"es-vc":[201,990,193,987,183,976,69,971,72,971,236,971,235,970,280,968,339,968,47,966,225,966,423,966,54,965,209,964,277,962,336,962,68,961,370,961,409,961,30,960],"es-ga":[20,983,220,982,211,970,36,967,431,957,96,955,261,939,320,939,461,939,452,938,258,931,317,931,467,930,500,929,93,928,94,928,265,928,324,928,451,928,495,928],"es-pv":[199,990,193,980,72,973,235,973,54,972,423,972,183,970,280,970,339,970,370,967,409,967,69,961,236,961,142,960,426,959,406,958,47,957,209,957,225,957,222,956],"gb-en":[35,982,205,971,164,966,156,962,196,962,204,962,169,960,241,960,100,955,172,955,206,953,476,953,216,951,264,948,323,948,119,947,174,946,70,944,234,944,182,942],"gb-sc":[101,951,395,950,392,945,498,942,98,937,178,931,62,930,229,930,294,923,353,923,115,911,271,909,330,909,204,907,174,906,272,902,331,902,70,900,234,900,24,895],"gb-wl":[271,967,330,967,174,966,35,964,234,964,70,963,202,962,205,962,180,959,164,956,118,943,156,942,169,942,241,942,178,940,100,938,158,937,172,937,206,934,216,933],"gb-ni":[202,971,204,962,35,961,119,956,476,955,164,954,196,954,174,952,100,948,118,944,234,944,477,944,70,943,156,940,241,940,169,939,216,939,172,938,187,935,271,934],"gb-mn":[131,977,169,968,35,966,186,965,163,963,196,963,187,962,278,961,337,961,156,958,185,957,197,956,165,955,191,955,195,954,102,953,202,953,241,953,18,951,4,949],"jp-os":[167,984,188,981,154,979,189,978,123,976,12,974,13,973,208,973,51,972,8,971,39,971,52,971,286,971,345,971,5,969,238,968,17,965,404,965,405,964,19,963],"jp-ai":[123,988,189,983,133,980,152,974,207,973,382,972,209,970,405,970,167,968,361,968,459,968,360,967,142,966,484,966,51,965,376,965,399,965,73,964,377,963,39,962],"jp-fk":[443,987,445,983,405,972,428,971,69,970,82,970,167,970,189,970,193,970,208,970,236,970,377,968,51,967,399,966,426,966,222,965,142,964,183,964,199,964,81,963],"jp-hk":[135,973,464,970,450,969,429,957,440,956,468,956,54,953,86,951,372,949,72,947,406,947,451,947,235,946,407,945,215,944,441,942,281,941,340,941,132,940,488,939],"ca-on":[200,970,20,958,220,956,495,951,36,949,96,938,431,928,261,921,320,921,291,919,350,919,215,918,177,916,57,915,258,914,317,914,86,912,93,912,467,912,94,911],"ca-qc":[272,958,331,958,213,952,115,931,499,924,150,923,140,912,148,910,498,894,494,890,95,886,65,882,232,882,203,881,97,876,420,872,98,868,24,867,395,866,381,865],"ca-bc":[272,963,331,963,499,959,212,952,150,939,148,928,97,922,420,919,115,916,494,910,140,908,466,898,500,893,65,891,232,891,501,890,381,884,122,876,211,875,495,875],"ca-ab":[153,912,105,880,270,877,329,877,482,860,217,847,123,837,146,837,128,835,147,835,152,834,121,829,120,828,133,826,208,825,9,824,0,821,207,821,138,820,145,818],"ca-ns":[210,944,449,943,132,941,36,934,451,934,86,932,372,928,135,927,291,925,350,925,452,924,440,923,468,923,57,922,450,920,211,918,94,915,464,915,260,910,319,910],"ca-mb":[119,962,139,961,129,959,202,951,35,948,118,944,172,940,205,939,131,936,144,936,165,934,204,933,271,933,330,933,134,930,156,926,169,926,241,926,269,926,328,926],"ca-sk":[137,958,270,914,329,914,153,898,105,891,216,864,482,863,144,857,214,847,139,846,119,845,196,839,130,836,131,836,269,836,328,836,165,834,134,832,118,827,35,825],"nl-nh":[187,982,219,980,15,976,26,975,185,968,186,964,269,963,328,963,379,963,457,963,191,961,4,960,170,960,237,959,278,959,337,959,197,954,33,953,25,951,116,951],"nl-zh":[187,983,218,980,181,970,130,965,15,960,278,960,337,960,26,955,481,952,131,949,185,949,206,949,269,947,328,947,144,946,170,945,379,945,393,945,457,945,186,944],"se-st":[200,982,20,980,36,972,211,956,461,953,431,948,452,945,96,938,427,937,451,936,261,934,320,934,266,931,325,931,258,926,317,926,500,925,265,923,324,923,501,921],"ru-ms":[223,984,28,975,142,975,110,967,209,965,107,962,125,961,426,961,428,958,145,957,199,956,201,956,112,954,189,954,280,954,339,954,443,954,419,953,124,952,193,952],"ru-sp":[222,984,110,971,28,969,112,965,142,963,209,962,221,959,428,959,44,958,443,955,145,954,426,954,141,952,107,951,82,950,445,950,125,949,193,949,199,948,399,948],"cz-pr":[170,985,33,984,25,978,15,977,26,977,34,974,43,972,4,969,66,965,292,965,351,965,185,964,403,964,168,960,218,959,455,957,239,956,454,955,116,953,191,953],"pl-mz":[19,983,17,982,366,982,273,976,332,976,374,973,404,973,274,972,333,972,398,972,432,972,188,971,362,971,85,969,275,969,334,969,166,968,207,968,155,967,360,965],"hu-bp":[275,981,334,981,444,978,155,977,42,971,43,971,157,971,194,971,403,968,21,966,273,966,332,966,240,965,17,964,274,963,333,963,401,962,197,960,166,957,238,957],"ro-bh":[42,980,157,980,186,976,191,976,43,975,185,975,197,972,194,971,444,971,66,965,239,965,292,965,351,965,168,963,396,963,4,962,403,962,433,961,375,960,456,960],"at-vi":[156,993,169,984,182,977,35,976,172,968,176,965,173,961,162,960,202,960,164,958,264,958,323,958,196,957,206,953,256,952,315,952,469,952,108,951,139,951,287,949],"in-dl":[480,838,454,830,253,828,312,828,455,828,168,825,244,825,303,825,246,824,305,824,447,822,251,821,310,821,243,818,302,818,479,815,75,814,415,814,66,813,292,813],"in-up":[251,979,310,979,32,970,246,956,305,956,244,954,303,954,253,953,312,953,480,952,245,940,304,940,479,939,447,935,75,926,490,925,293,924,352,924,59,922,285,922],"in-rj":[245,980,304,980,253,973,312,973,447,965,379,960,457,960,479,959,243,954,302,954,32,953,454,953,415,952,455,951,480,950,161,949,88,948,168,948,251,948,310,948],"in-gj":[244,980,303,980,253,979,312,979,379,974,457,974,479,965,161,962,454,953,49,952,228,952,415,951,447,951,455,951,293,949,352,949,168,948,285,946,344,946,480,941],"in-wb":[32,987,490,970,247,962,306,962,89,961,411,959,243,956,302,956,453,956,251,949,310,949,433,949,456,948,88,947,403,946,74,945,244,945,303,945,414,945,75,939],"in-mp":[89,976,371,970,414,967,254,965,313,965,83,964,32,963,85,962,246,962,305,962,373,961,397,960,412,960,448,960,486,959,487,959,374,958,485,958,255,956,314,956],"in-tl":[250,978,309,978,46,972,190,972,224,972,29,962,194,962,166,961,161,957,368,957,400,957,40,956,41,953,163,952,247,952,306,952,78,951,195,951,162,949,374,949],"in-ke":[50,987,226,987,47,976,225,976,463,976,391,975,68,972,71,969,233,968,260,968,319,968,72,967,235,967,406,966,198,961,277,960,336,960,488,960,407,959,460,959],"in-ap":[248,978,307,978,166,966,254,965,313,965,85,963,374,963,22,962,194,960,432,960,17,958,363,957,366,957,8,956,368,956,400,955,40,954,247,954,306,954,41,953],"in-br":[243,979,302,979,32,975,480,955,246,949,305,949,244,948,303,948,253,947,312,947,245,933,304,933,479,933,59,931,447,929,58,927,75,927,25,920,490,919,276,918],"in-pb":[103,969,48,961,227,961,477,961,476,953,390,946,253,943,312,943,394,943,296,937,355,937,100,936,245,931,304,931,479,931,196,929,244,927,303,927,49,921,162,921],"in-hr":[479,986,245,979,304,979,244,973,303,973,480,962,379,961,457,961,243,953,302,953,32,952,447,952,251,947,310,947,252,943,311,943,161,942,394,940,293,939,352,939],"in-or":[255,968,314,968,247,965,250,965,306,965,309,965,472,965,432,964,85,962,383,958,371,956,366,955,362,954,398,952,434,952,487,952,83,951,365,951,374,951,22,950],"in-as":[32,970,254,968,313,968,247,956,306,956,385,954,371,948,85,946,472,945,404,943,89,942,366,940,246,939,305,939,360,939,362,939,412,939,434,939,365,938,383,938],"br-rj":[195,985,173,979,53,972,182,972,287,971,346,971,475,970,40,968,192,968,29,966,288,965,347,965,18,964,38,964,55,964,289,964,348,964,493,964,46,961,264,961],"br-mg":[56,987,290,987,349,987,198,983,265,977,324,977,259,972,318,972,387,971,489,967,68,966,391,965,7,963,71,962,233,962,260,962,319,962,430,962,47,960,225,960],"br-rs":[261,988,320,988,259,986,318,986,265,966,324,966,437,964,465,964,388,963,299,962,358,962,290,961,349,961,56,960,257,957,316,957,435,956,158,954,76,947,491,946],"br-pr":[258,986,317,986,265,980,324,980,261,975,320,975,257,972,316,972,56,971,290,971,349,971,491,959,7,958,198,957,299,955,358,955,437,955,465,955,388,954,467,951],"br-ba":[71,995,233,994,94,979,391,974,68,969,249,968,308,968,198,966,463,965,372,964,72,963,235,963,47,962,50,962,225,962,226,962,257,962,316,962,488,960,86,957],"br-sc":[258,988,317,988,259,975,318,975,465,969,265,957,324,957,299,956,358,956,437,954,388,953,56,949,290,949,349,949,257,947,316,947,435,945,140,944,158,944,381,941],"br-pe":[263,988,322,988,184,986,267,979,326,979,160,974,37,972,18,971,38,971,171,970,55,966,289,966,348,966,442,965,53,964,175,963,287,963,346,963,277,962,336,962],"br-ce":[262,988,321,988,267,982,326,982,184,974,442,974,52,968,175,967,40,966,51,966,286,966,345,966,160,962,18,961,13,960,37,960,167,960,183,960,38,959,171,959],"br-go":[182,981,172,970,176,964,156,962,256,961,315,961,241,958,173,957,55,954,289,954,348,954,35,953,164,953,38,951,53,951,287,950,297,950,346,950,356,950,18,949],"br-pa":[259,980,318,980,56,978,290,978,349,978,257,977,316,977,7,967,467,967,258,966,317,966,198,962,387,961,491,959,261,957,320,957,260,954,319,954,391,954,71,952],"br-am":[220,931,427,919,200,916,20,911,36,909,122,901,449,897,461,888,211,887,431,883,452,880,261,876,320,876,96,873,451,871,265,866,324,866,258,865,317,865,215,863],"br-df":[263,982,322,982,262,979,321,979,442,979,13,977,184,977,183,976,52,973,154,972,167,972,286,971,345,971,51,970,175,968,40,964,41,964,18,963,37,963,160,963],"au-vc":[134,980,165,976,126,967,131,963,159,961,389,961,106,960,109,960,46,955,224,955,190,954,9,950,173,950,18,947,40,947,41,947,139,947,179,947,197,947,78,946],"au-ql":[116,970,11,968,218,963,130,962,26,958,181,957,185,956,15,955,186,954,481,954,131,950,170,949,165,948,219,947,4,945,134,945,187,945,191,945,117,943,278,942],"au-wa":[137,925,217,914,482,902,153,899,458,882,478,882,214,877,116,875,269,874,328,874,11,871,130,868,15,866,26,865,105,861,117,858,218,858,181,856,170,853,4,849],"au-sa":[204,967,180,962,174,960,118,957,70,945,234,945,178,941,172,940,177,939,24,935,164,935,35,934,205,934,216,933,129,930,202,929,158,928,156,926,169,926,241,926],"au-ts":[213,963,212,958,150,952,115,944,140,944,499,944,494,930,65,921,232,921,97,915,420,912,95,906,381,905,203,902,148,900,261,894,320,894,466,891,24,888,258,886],"kr-gg":[274,989,333,989,275,982,334,982,155,979,238,976,17,968,239,966,360,966,374,966,369,965,19,963,362,962,366,962,398,962,111,961,74,960,400,960,403,960,404,960],"kr-bs":[273,989,332,989,155,982,275,974,334,974,238,972,111,970,17,963,239,963,27,961,360,961,138,960,19,958,374,958,366,954,369,954,166,953,21,952,106,952,398,952],"kr-dg":[155,985,273,982,332,982,239,981,403,978,444,975,274,974,333,974,401,973,238,969,374,968,486,967,74,966,400,966,17,965,166,965,368,965,366,962,21,961,396,961],"kr-ic":[58,969,25,959,45,958,282,958,341,958,75,952,59,949,74,944,447,944,293,942,352,942,237,940,67,939,170,938,285,938,344,938,455,938,16,937,375,937,403,936],"mx-jl":[30,977,47,972,225,972,68,970,72,970,193,970,235,970,69,968,236,968,183,963,171,962,199,962,262,962,321,962,406,961,249,960,308,960,391,960,184,959,50,958],"mx-nl":[191,980,187,977,190,969,393,967,185,961,206,961,168,960,219,960,218,959,224,958,240,958,379,958,457,958,46,957,66,957,186,957,292,957,351,957,34,956,454,955],"mx-mx":[81,986,434,983,446,980,73,976,459,976,445,975,376,974,82,973,382,972,405,972,443,971,363,970,365,967,462,967,361,966,22,965,377,965,378,965,99,964,399,963],"mx-bc":[426,982,423,974,419,973,69,972,236,972,428,971,201,970,416,970,409,969,199,968,370,968,443,967,193,966,445,965,418,964,84,963,410,963,462,963,377,961,406,960],"mx-qr":[380,960,2,957,364,953,124,950,113,948,149,948,450,948,418,944,410,943,104,942,402,942,210,941,143,939,136,938,222,935,127,934,54,933,464,933,441,932,142,931],"jo":[293,985,352,985,168,966,67,961,66,955,292,955,351,955,480,953,59,952,25,950,454,950,455,948,33,947,245,946,304,946,244,941,303,941,379,941,457,941,34,940],"rs":[18,978,192,978,195,978,470,970,40,969,41,969,224,968,442,968,46,967,52,966,184,966,190,966,286,966,345,966,256,965,287,965,315,965,346,965,53,964,173,963],"tn":[285,985,344,985,168,971,66,968,292,968,351,968,25,965,33,962,34,955,67,955,454,954,455,952,237,951,15,950,185,949,245,949,304,949,4,948,26,947,43,947],"rw":[392,958,62,952,229,952,101,949,63,945,230,945,395,938,98,936,203,923,31,922,296,914,355,914,70,913,234,913,498,910,174,898,95,893,300,887,359,887,178,886],"sn":[64,962,231,962,471,961,492,944,496,943,438,941,90,937,436,933,475,924,493,924,497,921,421,917,192,914,469,914,53,913,287,912,346,912,463,912,262,911,321,911],"ci":[63,940,230,940,70,937,234,937,252,937,311,937,476,928,48,926,100,926,227,926,174,923,294,914,353,914,103,906,477,905,390,902,204,901,205,898,118,896,164,896],"lk":[158,958,299,958,358,958,264,950,323,950,53,948,287,947,346,947,176,946,259,945,318,945,388,942,182,938,180,937,192,937,256,937,315,937,164,936,258,936,317,936],"mm":[299,959,358,959,300,953,359,953,437,942,381,941,388,940,465,940,65,931,232,931,435,929,261,928,320,928,496,928,438,927,436,926,95,923,297,923,356,923,76,922],"kh":[388,978,465,965,437,964,258,962,317,962,298,959,357,959,297,958,356,958,261,956,320,956,259,955,318,955,435,951,158,946,265,945,324,945,496,945,436,943,438,943],"np":[298,953,357,953,95,950,65,938,232,938,494,925,115,914,299,914,358,914,31,910,381,907,466,905,496,900,140,899,437,898,438,898,501,897,90,896,150,896,388,896],"cn-sz":[133,977,361,973,378,971,123,970,208,967,273,966,332,966,382,966,404,966,405,966,238,965,207,963,459,963,484,962,274,961,333,961,73,960,376,960,399,959,51,957],"cn-gz2":[382,991,459,989,73,984,82,981,81,980,378,980,446,978,399,977,376,974,360,973,367,973,405,973,434,969,208,968,377,968,484,968,279,966,338,966,365,966,445,966],"cn-su":[398,992,366,986,369,982,404,982,432,982,85,978,383,978,374,976,238,971,371,970,412,970,385,969,368,968,417,966,485,966,397,964,448,964,486,964,373,963,472,963],"cn-cd":[22,984,446,981,51,978,81,978,434,978,377,977,462,977,80,976,376,975,484,975,472,973,405,972,442,971,279,970,338,970,383,969,365,968,483,967,73,965,99,965],"cn-hz":[380,993,418,986,410,981,402,974,441,972,84,969,426,969,384,968,419,963,428,961,87,959,464,955,281,953,340,953,2,951,280,951,339,951,54,950,124,950,149,950],"cn-wh":[446,985,376,984,434,983,80,981,81,980,99,978,73,975,382,970,383,970,405,970,472,970,484,969,363,968,279,967,338,967,361,966,459,966,432,965,408,963,377,962],"cn-nj":[374,989,432,988,362,986,398,986,85,984,238,982,404,981,383,977,371,976,369,973,401,973,368,972,486,972,17,968,412,967,373,966,400,966,19,965,397,965,448,965],"cn-nb":[399,995,82,984,459,983,382,982,73,976,445,976,378,974,361,973,443,973,416,971,376,969,428,969,419,967,81,966,408,965,446,962,484,962,209,961,152,960,208,960],"cn-qd":[400,992,83,982,369,979,374,978,432,978,397,976,401,976,485,976,486,976,487,976,373,975,448,975,366,972,383,972,417,971,375,969,414,969,362,968,396,968,166,967],"cn-wx":[417,983,362,982,368,979,374,978,386,978,485,978,398,977,486,977,397,976,448,976,373,975,366,973,371,973,400,973,412,973,85,972,401,971,414,969,83,968,375,966],"cn-cs":[409,999,423,994,473,986,422,983,424,982,419,974,416,972,87,971,384,971,426,971,460,969,280,968,339,968,201,967,407,966,428,966,84,964,193,964,441,964,91,962],"cn-zz":[412,990,374,982,85,976,366,976,373,975,397,974,448,974,369,973,414,973,89,972,485,972,486,971,247,970,306,970,362,970,83,968,417,967,368,966,487,966,385,965],"cn-fz":[86,992,488,974,429,972,94,971,464,969,451,966,260,964,319,964,391,964,406,963,71,961,233,961,407,959,463,959,452,957,441,955,135,954,450,954,384,953,92,952],"cn-jn":[397,999,448,999,485,997,414,994,417,992,486,992,401,986,487,986,386,985,83,981,456,981,433,980,396,978,453,976,368,975,369,975,371,975,375,975,415,973,374,972],"cn-hf":[366,989,85,987,371,982,486,979,368,978,369,978,401,977,432,977,362,976,414,976,17,974,398,974,238,973,373,972,412,972,397,971,400,970,404,970,433,970,448,970],"cn-nt":[396,997,74,990,456,986,433,985,401,984,403,978,453,978,485,978,400,977,486,977,397,976,448,976,373,975,417,973,88,970,368,969,414,969,415,969,444,969,455,969],"cn-dl":[446,993,81,987,365,984,434,984,484,983,80,982,73,979,382,978,383,978,405,978,363,975,279,974,338,974,361,974,378,974,459,974,404,973,377,970,399,970,367,969],"cn-xm":[462,994,405,990,484,987,483,986,51,982,443,979,363,977,446,977,81,975,442,974,445,974,434,972,376,970,382,970,286,969,345,969,459,969,209,968,361,968,52,967],"cn-dg":[73,982,361,980,459,980,382,979,399,976,367,974,376,974,81,973,82,971,360,971,446,968,279,965,338,965,404,964,365,960,434,959,484,959,133,958,208,957,445,957],"cn-yc":[457,1000,245,974,304,974,455,972,454,971,479,969,415,967,447,967,218,963,253,961,312,961,191,960,244,960,303,960,278,958,337,958,456,958,187,957,433,957,393,954],"cn-wz":[364,993,418,983,410,980,441,971,402,966,384,965,426,964,84,962,464,962,281,960,340,960,87,958,419,956,428,953,2,952,280,950,339,950,429,947,445,947,450,947],"cn-km":[465,961,140,953,435,950,466,950,388,945,495,945,76,944,437,944,96,943,501,943,150,942,261,941,298,941,320,941,357,941,65,940,232,940,491,940,494,940,461,938],"cn-cc":[459,996,73,992,361,991,82,987,399,986,81,984,367,982,446,980,378,979,376,978,405,975,445,973,208,972,279,972,338,972,484,972,434,971,443,971,365,970,377,970],"cn-sy":[404,989,432,988,398,983,362,978,376,978,472,978,366,977,368,972,446,972,365,970,363,969,434,969,39,968,80,968,400,968,81,967,374,966,19,965,238,963,484,963],"cn-nc":[441,994,87,990,410,983,84,977,418,976,429,975,424,974,54,973,409,972,423,972,370,971,422,971,488,971,364,968,402,967,380,965,406,964,91,963,407,963,460,963],"cn-sjz":[412,974,362,969,371,965,398,962,77,960,32,957,366,957,89,956,255,954,314,954,411,954,273,953,332,953,404,953,432,953,369,952,85,949,383,949,374,947,485,947],"cn-ty":[417,993,485,988,397,986,448,986,373,985,414,979,369,978,486,978,401,972,487,972,78,970,453,968,83,967,456,967,375,966,425,965,433,965,368,964,400,964,411,964],"cn-nn":[430,991,489,984,463,979,467,976,439,972,497,972,56,971,93,971,257,971,316,971,290,970,349,970,391,970,491,969,198,967,421,963,265,961,324,961,76,959,435,959],"cn-gy":[465,984,437,982,299,978,358,978,435,967,76,963,258,963,317,963,491,957,158,955,436,955,259,954,318,954,261,953,320,953,467,951,497,951,421,948,438,947,96,945],"cn-hhht":[79,979,134,967,165,967,102,966,78,963,268,961,327,961,131,956,393,954,224,953,46,952,190,951,470,950,163,947,195,947,29,945,126,945,400,945,288,944,347,944],"cn-lz":[100,966,102,957,469,957,476,957,35,951,477,950,103,947,169,946,252,946,311,946,493,946,241,945,156,941,162,941,415,941,475,941,196,939,393,938,202,936,49,935],"cn-hk2":[463,985,198,981,68,980,249,975,308,975,260,974,319,974,71,973,233,973,94,972,387,970,50,967,72,967,226,967,235,967,57,966,406,966,56,965,257,965,290,965],"cn-xn":[101,989,294,958,353,958,395,947,203,945,98,942,63,935,230,935,62,930,229,930,174,915,498,915,70,904,234,904,178,897,95,890,118,888,296,888,355,888,205,887],"cn-yc2":[102,979,278,967,337,967,481,962,131,954,379,954,389,954,394,954,457,954,191,949,375,947,455,947,187,946,415,946,454,946,219,945,206,944,396,944,49,943,78,943],"cn-wlmq":[103,971,102,957,393,954,479,954,447,948,379,946,457,946,252,943,311,943,253,940,312,940,219,937,481,937,245,936,304,936,477,935,390,933,244,930,303,930,415,927],"cn-ls":[98,987,498,961,62,960,229,960,101,952,203,950,392,947,294,938,353,938,70,903,234,903,63,901,230,901,174,894,178,887,499,886,204,877,31,871,272,867,331,867],"cn-ty2":[375,997,456,989,401,988,433,988,74,987,403,981,486,980,373,978,397,977,448,977,453,975,485,975,400,974,414,972,415,972,444,972,455,972,454,971,417,970,368,968],"cn-xt":[448,1000,373,999,485,998,414,993,417,993,486,991,386,986,401,985,487,985,83,981,456,980,433,979,396,977,453,977,368,976,369,976,375,976,371,974,400,973,415,973],"cn-cz":[362,992,404,988,366,986,383,983,432,982,369,977,374,974,238,972,85,970,368,966,376,963,412,963,273,962,332,962,371,962,385,962,400,962,417,962,472,962,73,960],"cn-jx2":[367,995,82,988,459,988,382,986,445,981,73,980,443,978,361,977,378,976,416,974,428,974,419,972,81,971,376,970,408,970,446,967,209,966,208,965,484,965,426,964],"cn-zy":[368,992,401,982,83,980,375,977,485,975,396,974,486,974,487,974,369,973,397,973,448,973,373,972,432,972,374,970,417,970,383,968,166,967,74,966,275,966,334,966],"cn-yz":[486,992,396,988,373,986,397,985,448,985,375,984,414,984,444,984,485,983,400,982,456,981,433,980,417,978,374,977,487,977,368,976,74,975,275,973,334,973,366,973],"cn-hs":[418,983,84,976,364,974,419,974,124,970,410,969,384,967,149,966,380,966,426,966,399,962,428,961,441,960,28,959,87,958,136,958,367,957,10,956,416,956,113,955],"cn-zs":[74,986,396,981,275,978,334,978,375,978,456,978,433,977,453,977,490,976,34,973,401,973,444,970,43,968,239,968,486,967,155,965,168,964,237,964,240,962,414,961],"cn-fs":[383,989,398,988,362,982,366,981,432,977,238,973,376,973,73,970,374,970,382,968,446,968,472,967,85,966,360,966,207,965,361,964,363,964,369,964,378,964,459,964],"cn-zh":[377,990,462,990,446,985,443,983,434,982,445,981,484,980,81,979,483,979,51,978,376,978,382,975,167,974,189,974,361,973,459,973,209,972,279,972,338,972,363,972],"cn-pt":[407,992,429,989,92,987,460,984,424,981,422,978,91,975,72,973,235,973,54,972,464,971,488,971,50,968,226,968,249,966,308,966,391,966,384,964,135,963,372,963],"cn-qz":[406,992,92,987,422,983,460,983,429,981,424,980,91,975,488,970,50,968,226,968,409,967,72,966,370,966,235,965,54,964,135,964,384,963,464,963,423,962,463,960],"cn-ly":[399,970,73,965,367,965,99,963,365,963,82,961,459,960,382,959,428,957,378,956,419,955,416,954,81,953,445,953,473,952,443,951,361,950,376,950,446,949,426,947],"cn-zy2":[370,999,423,995,473,987,422,984,424,983,419,975,87,972,384,972,426,972,416,971,460,970,280,969,339,969,201,967,407,967,428,966,441,965,84,964,193,964,406,963],"cn-xz2":[441,989,384,983,364,981,380,980,84,979,418,979,87,977,402,969,280,963,339,963,426,960,464,960,419,959,423,959,429,958,424,957,54,956,488,956,416,955,409,954],"cn-ha2":[453,973,490,973,413,968,75,965,386,964,74,959,246,959,305,959,417,957,385,954,485,953,88,952,375,951,397,951,456,951,373,950,403,950,425,950,433,950,448,950],"cn-bd":[371,990,385,974,369,973,485,973,374,972,89,971,397,971,362,970,373,970,448,970,366,967,417,967,85,966,368,964,414,964,83,963,398,963,486,962,386,961,247,960],"cn-ts":[411,968,386,953,417,947,385,943,485,942,490,942,453,941,397,940,448,940,373,939,412,938,425,938,89,936,117,936,75,934,414,933,369,932,486,931,246,928,305,928],"cn-ly2":[373,994,397,993,448,993,486,992,487,992,485,991,417,986,401,984,433,984,456,982,386,979,83,976,374,976,444,976,371,973,396,972,85,971,89,970,453,970,490,970],"cn-wf":[88,979,456,977,487,977,433,976,455,976,454,974,373,973,397,973,396,972,448,972,83,970,453,970,485,970,375,969,414,969,379,967,457,967,486,967,417,965,490,965],"cn-yt":[428,984,419,982,399,974,426,973,370,972,367,971,409,971,280,970,339,970,445,970,484,970,84,968,423,967,443,967,82,962,459,962,376,961,377,961,473,961,81,960],"cn-zb":[485,995,386,993,397,993,448,993,373,992,414,986,486,984,369,983,487,979,401,978,83,974,453,974,375,973,456,973,433,972,368,971,396,970,400,970,371,967,412,967],"cn-jh":[364,986,380,983,402,983,426,981,410,979,84,978,384,976,419,972,428,970,441,970,87,968,280,964,339,964,429,964,445,964,54,962,124,960,443,959,149,956,424,955],"cn-sx2":[426,991,428,987,416,982,409,975,370,974,402,974,280,973,339,973,399,972,418,972,445,972,84,971,423,970,443,970,367,967,82,964,459,964,473,964,364,963,382,963],"cn-yc3":[97,969,494,951,501,948,500,941,466,940,213,919,461,916,65,915,232,915,150,914,272,912,331,912,95,911,499,910,96,905,381,902,148,895,115,893,140,890,200,887],"cn-xy":[497,988,436,976,438,976,439,975,90,974,496,974,489,973,430,968,491,964,387,963,437,962,435,954,471,953,76,951,23,949,388,948,465,947,463,943,467,941,257,940],"cn-zz2":[424,997,460,985,409,984,370,983,407,983,423,979,406,978,91,977,92,973,473,973,87,971,384,971,429,967,84,965,441,965,54,964,488,963,419,960,50,957,226,957],"cn-hy":[409,995,370,994,424,982,473,982,422,979,87,977,460,975,280,974,339,974,201,972,384,972,426,971,419,970,441,968,193,967,416,967,199,966,91,965,406,962,407,962],"cn-yy":[422,997,460,988,409,983,370,982,423,982,406,981,91,980,407,980,92,975,87,974,384,974,473,970,429,969,441,968,54,967,488,966,84,963,50,960,226,960,426,959],"cn-dt":[78,965,386,965,88,960,415,959,417,958,453,954,485,953,375,952,456,952,487,952,397,951,433,951,448,951,373,950,411,950,396,949,83,947,481,947,368,944,400,944],"cn-tz":[419,991,428,989,280,982,339,982,418,981,445,981,443,978,416,973,409,972,370,971,423,971,364,969,82,966,84,966,209,966,402,966,380,964,399,964,405,962,222,961],"cn-ls2":[461,968,500,939,220,937,501,935,20,933,466,928,200,924,122,921,449,921,266,919,325,919,36,917,381,915,431,915,452,911,96,904,451,902,211,894,97,892,420,885],"cn-hz2":[426,989,419,987,445,986,416,984,443,983,399,974,82,971,209,971,280,971,339,971,418,970,459,970,367,969,81,968,382,967,405,967,370,966,409,966,446,965,142,963],"cn-zz3":[406,989,464,982,488,982,407,981,92,977,54,975,384,975,460,974,91,973,135,972,372,972,424,969,441,969,87,967,422,967,450,967,72,964,86,964,235,964,418,964],"cn-lz2":[387,991,489,976,463,971,467,969,421,968,439,963,497,963,56,962,257,962,290,962,316,962,349,962,391,962,93,961,491,960,57,959,76,958,198,958,291,956,350,956],"cn-gl":[93,969,452,969,467,968,451,960,200,957,96,955,20,950,36,948,220,948,86,947,265,947,324,947,372,947,94,945,387,945,461,945,491,945,464,943,56,938,7,937],"cn-wh2":[366,988,383,988,362,982,398,982,368,978,374,977,404,977,472,974,85,973,238,972,400,972,19,970,188,968,446,968,376,966,434,966,365,965,371,965,83,964,254,964],"cn-bb":[456,999,396,988,486,987,375,985,414,984,455,984,454,982,373,980,401,980,397,979,448,979,403,977,453,977,485,977,490,977,415,976,487,976,74,975,417,972,374,970],"cn-aq":[446,991,81,985,376,984,279,983,338,983,365,983,405,982,363,978,462,977,73,975,80,973,377,972,382,971,445,970,361,969,383,969,459,969,484,969,22,968,82,966],"cn-yb":[491,990,76,989,437,985,439,978,465,968,489,968,388,967,467,965,497,963,387,959,96,956,258,956,317,956,421,954,299,951,358,951,381,950,430,950,259,949,265,949],"cn-dy":[438,992,496,990,90,985,497,981,421,976,471,970,489,966,439,960,491,957,387,956,388,955,437,955,492,955,430,952,435,947,192,943,299,943,358,943,76,940,465,940],"cn-my":[435,985,465,983,388,982,76,976,491,975,497,969,258,964,299,964,317,964,358,964,439,963,421,962,489,961,467,959,259,955,318,955,436,955,261,954,320,954,387,951],"cn-nch":[496,998,436,992,90,985,497,980,471,978,421,976,489,966,439,965,492,963,491,953,387,952,437,949,388,947,493,945,64,944,231,944,430,944,299,943,358,943,435,943],"cn-dz":[491,988,489,983,435,978,497,978,421,975,387,972,76,967,438,965,430,963,437,963,467,963,496,963,436,960,93,959,56,958,290,957,349,957,90,953,463,953,257,950],"cn-gy2":[468,1000,450,983,464,972,451,959,210,956,429,954,441,954,488,952,449,950,460,950,384,949,452,948,410,946,87,944,91,943,406,943,380,942,407,942,86,941,372,941],"cn-jdz":[384,994,410,989,87,986,364,972,380,971,84,970,418,970,429,969,464,969,423,968,424,968,54,967,488,967,409,965,422,965,370,964,402,960,460,959,91,958,406,958],"cn-zj2":[483,984,52,982,286,980,345,980,267,979,326,979,462,979,22,975,51,974,263,974,322,974,377,974,363,971,13,970,167,970,405,969,154,968,288,968,347,968,41,966],"cn-mm":[445,996,209,987,405,983,428,983,82,981,377,979,399,978,426,978,81,974,459,974,367,973,462,973,279,971,338,971,382,971,419,970,446,970,69,969,236,969,280,967],"cn-st":[401,984,239,978,486,978,42,977,414,976,275,975,334,975,157,974,396,972,240,971,17,970,21,970,373,970,403,970,433,970,194,969,375,969,397,969,448,969,487,969],"cn-jm":[443,996,428,986,82,983,209,983,399,981,405,981,426,981,81,977,459,977,367,976,279,975,338,975,377,974,382,973,446,973,419,972,416,970,434,970,462,970,484,968],"cn-qhd":[81,994,376,993,434,991,365,985,405,985,73,982,363,981,279,980,338,980,382,980,459,979,361,978,484,978,377,977,80,975,462,975,445,973,383,972,82,971,483,971],"cn-cz2":[75,970,455,970,454,968,379,967,457,967,244,965,303,965,415,963,479,960,88,957,453,957,485,957,490,957,375,955,456,955,373,954,397,954,433,954,448,954,253,952],"cn-lf":[397,1000,373,999,485,998,414,993,417,993,486,992,386,986,487,986,401,985,83,981,456,980,433,979,396,977,453,977,369,976,375,976,368,975,371,974,400,973,415,972],"cn-hs2":[451,959,450,952,440,950,468,950,452,948,215,943,86,940,372,940,464,937,260,933,319,933,94,932,233,931,71,930,210,930,132,929,391,926,488,923,427,921,431,921],"cn-mz":[464,985,440,983,468,983,451,972,210,969,429,967,452,961,406,956,86,954,372,954,441,954,449,952,488,951,460,949,281,948,340,948,384,948,407,948,380,947,72,945],"cn-sg":[452,989,450,972,86,967,372,966,94,964,464,963,431,960,440,959,449,959,468,959,488,949,210,947,93,946,429,945,260,944,319,944,391,943,233,942,71,941,198,940],"cn-qy":[451,989,431,969,450,961,86,957,372,957,93,955,94,955,464,954,36,949,387,949,440,948,449,948,468,948,220,945,467,941,430,940,488,940,200,938,210,938,429,936],"cn-hb2":[490,986,74,985,485,979,375,978,456,978,397,977,403,977,433,977,448,977,373,976,396,975,417,974,411,973,88,971,414,970,415,970,486,969,75,968,386,968,401,963],"cn-sq":[455,998,433,982,168,981,456,981,415,974,379,971,396,971,457,971,486,970,375,968,414,968,447,968,34,965,66,964,292,964,351,964,373,962,397,962,401,962,448,962],"cn-ha3":[454,998,433,984,456,983,168,980,415,976,379,972,396,972,457,972,486,972,447,970,375,969,414,968,34,966,373,964,401,964,448,964,397,963,66,962,292,962,351,962],"cn-lj":[433,999,396,989,486,989,375,986,455,983,414,982,373,981,401,981,454,981,397,980,448,980,403,978,453,978,485,978,490,978,415,977,74,976,487,975,417,973,88,970],"cn-yz2":[379,1000,245,974,304,974,455,972,454,971,479,969,415,967,447,967,218,963,253,961,312,961,191,960,244,960,303,960,278,958,337,958,456,958,187,957,433,957,393,954],"cn-dq":[117,948,170,946,116,943,237,941,478,941,34,940,45,940,282,940,341,940,11,936,269,936,328,936,276,933,335,933,403,930,15,929,74,929,75,929,25,927,66,927],"cn-hrb":[382,996,82,991,73,990,361,989,399,988,81,983,367,983,378,980,446,979,445,977,279,976,338,976,376,974,443,974,405,973,428,970,377,969,434,969,208,968,484,968],"cn-ly3":[424,988,91,985,422,985,406,984,407,983,92,978,423,975,429,974,50,972,226,972,488,972,409,970,370,969,87,968,463,968,72,966,235,966,384,963,464,961,249,959],"cn-ey":[427,968,501,961,500,955,220,953,466,953,20,947,431,945,200,939,381,938,96,935,452,935,451,926,36,925,97,923,420,916,93,914,467,913,211,909,465,907,450,904],"cn-bh":[377,994,405,990,484,985,483,984,51,982,442,979,363,977,434,977,446,975,443,973,22,971,189,970,445,970,52,969,81,969,167,969,376,968,154,967,279,967,286,967],"cn-yl":[391,985,387,979,50,978,226,978,249,976,308,976,68,972,430,971,489,970,198,969,488,969,460,968,260,965,319,965,71,964,233,964,406,961,407,960,372,959,423,959],"cn-zh2":[450,985,429,982,440,972,468,972,406,971,210,970,86,969,372,969,441,969,488,966,384,963,407,963,451,963,380,962,460,961,410,960,92,959,54,957,87,957,91,957],"cn-qj":[388,984,437,983,261,969,320,969,435,968,299,965,358,965,258,964,317,964,76,962,96,961,381,961,491,958,495,957,259,955,318,955,467,952,497,952,421,947,439,946],"cn-dl2":[501,992,500,971,461,953,97,950,381,950,96,940,420,940,65,937,232,937,494,930,150,928,427,928,20,927,499,920,93,919,140,919,431,919,200,918,467,918,220,913],"cn-zyt":[93,977,387,976,491,975,96,971,430,969,431,968,76,967,265,967,324,967,435,965,439,963,489,961,437,959,56,957,290,957,349,957,463,956,7,954,465,952,259,951],"cn-gs2":[440,1000,450,983,464,972,451,959,210,956,429,954,441,954,488,952,449,950,460,950,384,949,452,948,410,946,87,944,91,943,406,943,380,942,407,942,86,941,372,941],"cn-jz":[493,989,475,974,492,969,162,964,390,957,470,954,256,953,315,953,169,952,241,952,46,950,182,950,224,950,173,948,192,947,195,947,248,947,307,947,471,947,156,945],"cn-ez":[288,970,347,970,432,960,492,960,475,959,493,959,362,956,472,956,383,955,469,954,192,953,195,952,18,951,389,950,102,949,398,949,366,948,126,947,80,945,368,945],"cn-hg":[438,978,492,976,496,976,90,972,436,970,295,961,354,961,493,958,497,958,475,954,421,953,463,949,192,948,469,947,53,946,64,946,231,946,287,945,346,945,489,944],"cn-xf":[383,978,432,974,363,973,77,970,365,970,80,968,99,968,404,967,254,965,313,965,366,965,362,963,446,963,22,962,398,962,286,960,345,960,434,960,85,959,52,958],"cn-bj2":[409,987,370,986,423,982,422,973,424,970,419,964,416,961,87,959,384,959,426,959,99,958,460,958,91,957,280,957,339,957,407,956,428,955,201,954,84,953,441,953],"cn-yl2":[146,965,109,962,126,961,288,952,347,952,192,950,9,946,470,944,389,943,79,941,37,939,134,938,179,938,184,938,171,936,286,936,345,936,442,936,52,934,147,934],"cn-ts2":[493,985,469,974,256,970,315,970,492,969,195,959,470,959,471,954,173,953,192,952,162,949,248,948,307,948,288,947,347,947,53,946,182,945,287,945,346,945,46,944],"cn-ww":[100,973,477,973,390,957,205,955,48,954,227,954,202,953,252,953,311,953,196,951,35,942,103,940,164,936,469,933,102,930,119,930,379,930,457,930,162,928,169,928],"cn-zy3":[476,973,196,962,252,961,311,961,390,950,103,949,48,946,100,946,227,946,35,944,205,944,202,942,156,939,162,939,169,938,241,937,119,935,394,935,278,931,337,931],"cn-klmy":[45,953,282,953,341,953,284,943,343,943,458,941,276,934,335,934,60,933,16,917,59,906,58,903,285,903,344,903,481,903,75,901,447,900,25,899,181,899,293,897],"cn-aks":[253,986,312,986,379,969,457,969,245,965,304,965,480,962,447,960,244,959,303,959,394,954,415,946,454,946,455,946,103,942,243,939,302,939,32,937,293,936,352,936],"cn-ks":[253,962,312,962,479,962,32,955,251,955,310,955,285,953,344,953,243,952,302,952,447,952,244,950,303,950,293,947,352,947,245,941,304,941,454,940,455,938,59,935],"cn-bt":[181,964,393,962,130,959,269,954,328,954,187,953,278,953,337,953,219,952,379,952,457,952,425,947,218,946,102,941,389,941,394,937,276,936,335,936,79,935,144,935],"cn-erds":[105,906,270,902,329,902,117,899,458,898,425,895,159,894,194,893,269,893,328,893,11,890,134,890,197,889,42,888,106,888,166,888,389,888,268,887,327,887,21,886],"cn-wh3":[377,986,442,984,462,984,484,981,405,979,175,976,51,972,286,971,345,971,446,971,52,969,171,968,183,968,363,967,193,966,30,965,81,965,443,965,376,964,267,963],"cn-rz":[377,987,462,985,376,983,483,981,80,980,405,980,446,978,363,975,51,973,81,972,382,972,416,970,365,969,434,969,361,968,445,968,459,968,208,966,399,965,443,965],"cn-jn2":[397,998,448,998,373,997,417,995,414,991,486,989,386,988,487,984,401,983,83,979,453,979,369,978,375,978,456,978,433,977,368,976,396,975,400,975,412,973,371,972],"cn-ta":[373,992,401,992,414,992,448,992,397,991,456,989,485,989,433,987,487,985,417,984,396,980,374,979,386,978,444,978,369,977,375,977,368,976,83,974,400,974,85,972],"cn-yc4":[414,992,373,986,448,986,397,985,486,985,485,984,83,983,417,979,401,977,415,977,368,976,433,976,456,975,400,974,386,972,88,970,444,969,374,968,371,966,396,965],"cn-cz3":[429,982,372,974,460,972,91,971,384,971,406,971,407,970,463,969,94,967,441,967,50,966,86,966,92,966,226,966,424,966,464,966,87,965,422,963,233,962,71,961],"cn-ld":[497,985,387,984,439,983,491,978,430,976,421,973,463,970,435,968,257,967,316,967,436,966,438,966,496,966,56,964,290,964,349,964,437,961,467,961,198,959,76,958],"cn-xx":[453,986,456,978,433,977,403,976,411,973,74,972,246,970,305,970,414,970,373,969,75,968,397,968,448,968,396,967,486,967,485,966,88,965,415,965,89,964,375,964],"cn-ly4":[435,990,439,988,76,979,489,978,437,975,467,975,497,973,387,969,421,964,430,960,259,959,265,959,318,959,324,959,465,958,388,957,436,957,93,954,56,953,290,953],"cn-nc2":[493,980,471,976,469,969,475,969,53,968,192,968,287,967,346,967,438,963,496,963,64,960,231,960,470,960,55,958,289,958,348,958,436,955,38,954,90,949,176,949],"cn-zg":[469,989,475,985,492,980,256,964,315,964,182,960,162,959,470,959,195,958,471,958,287,955,346,955,53,954,173,953,192,952,288,948,347,948,390,946,438,945,46,944],"cn-ls3":[95,958,65,957,232,957,420,951,97,944,381,940,499,937,150,932,272,930,331,930,466,930,300,925,359,925,435,925,501,922,500,916,491,915,76,914,115,912,213,910],"cn-pzh":[465,957,96,954,76,953,211,951,430,946,435,946,381,945,467,945,388,942,177,941,265,941,324,941,437,940,261,936,320,936,387,936,491,936,258,933,317,933,56,932],"cn-gy3":[438,998,436,990,90,983,497,979,471,976,421,974,489,966,439,963,492,963,491,952,387,950,437,948,64,945,231,945,299,945,358,945,388,945,295,943,354,943,493,943],"cn-my2":[421,988,489,985,436,981,438,980,496,979,439,978,491,973,387,972,437,969,90,967,430,963,435,963,471,958,463,954,76,952,465,952,257,951,316,951,388,951,56,949],"cn-ab":[98,972,395,961,62,945,229,945,203,942,101,920,392,915,294,910,353,910,499,903,178,900,31,895,212,894,95,886,272,880,331,880,115,878,63,873,230,873,234,869],"cn-gz3":[213,959,272,944,331,944,494,937,97,935,65,931,232,931,212,924,466,920,500,918,150,916,501,913,420,910,381,907,498,903,115,896,148,896,95,895,140,892,265,887],"cn-lj2":[501,979,466,971,461,955,97,949,420,941,20,939,427,939,200,929,65,926,232,926,220,925,150,923,381,921,431,921,499,918,494,916,96,911,122,910,211,901,140,899],"cn-bs":[466,992,500,979,461,961,97,955,420,948,381,943,20,935,427,935,96,932,65,929,232,929,431,927,200,926,494,922,220,921,150,920,499,913,93,911,140,911,467,910]},"comprehensive":{"us":[116,828,123,826,11,822,108,821,126,821,110,820,109,819,9,817,149,817,133,816,141,815,111,811,124,811,4,808,3,807,150,806,138,805,146,805,152,805,269,804],"cn":[88,847,99,836,397,831,415,830,85,829,78,828,382,826,385,826,448,826,77,824,80,824,90,824,379,823,457,823,485,823,486,823,81,822,89,822,373,822,455,822],"jp":[10,941,207,925,210,924,3,922,273,922,332,922,209,918,208,917,193,916,201,915,275,914,334,914,274,913,333,913,8,911,54,911,364,910,192,909,276,908,335,908],"de":[159,958,171,955,158,952,4,948,160,946,21,943,23,941,5,939,166,939,8,935,172,935,35,934,208,933,181,932,175,931,173,930,191,930,167,929,179,929,218,929],"gb":[202,964,218,960,5,957,21,957,3,948,15,948,219,946,37,942,35,939,157,939,159,938,269,937,328,937,268,935,327,935,171,934,185,934,209,934,169,933,9,932],"fr":[182,959,4,957,189,955,13,954,8,953,184,953,188,953,167,950,194,950,183,949,209,949,185,947,202,947,186,946,37,945,166,945,159,944,21,943,197,942,3,939],"in":[162,887,250,882,309,882,228,877,246,877,305,877,49,876,248,874,307,874,252,872,311,872,245,870,304,870,161,869,253,863,312,863,163,862,480,860,479,859,244,858],"br":[257,936,316,936,259,929,318,929,47,928,225,928,258,926,317,926,50,919,226,916,264,915,323,915,71,912,233,912,256,909,261,909,315,909,320,909,277,907,336,907],"it":[193,970,13,967,166,967,190,967,191,965,192,965,194,965,167,960,179,957,188,955,183,954,189,954,5,953,184,953,173,951,186,948,176,947,182,947,159,946,199,946],"ca":[11,942,37,939,5,938,211,935,4,932,202,931,209,929,268,927,327,927,21,924,269,924,328,924,212,923,271,921,330,921,165,919,218,919,272,919,331,919,13,918],"kr":[2,941,273,938,332,938,208,924,364,922,209,921,74,916,274,915,276,915,333,915,335,915,154,914,201,913,73,912,207,912,275,912,334,912,54,910,369,910,362,909],"au":[269,961,328,961,165,960,268,954,327,954,271,944,330,944,9,942,157,939,15,938,4,929,37,926,21,924,35,923,218,920,109,916,126,916,197,916,45,915,123,915],"mx":[280,946,339,946,277,944,336,944,278,938,337,938,28,937,69,934,236,931,264,931,279,931,323,931,338,931,17,929,50,927,281,927,340,927,226,924,47,921,225,921],"es":[167,974,8,967,189,967,194,964,184,961,199,960,193,956,5,954,183,954,166,951,197,951,182,948,188,947,192,947,41,946,190,946,209,945,201,944,191,943,159,941],"id":[29,932,30,910,161,902,236,891,12,888,68,888,69,888,163,888,226,888,32,886,248,886,307,886,50,885,279,884,338,884,253,883,312,883,460,883,465,883,245,882],"nl":[218,969,21,965,35,962,170,961,237,957,219,956,268,954,327,954,157,951,4,948,269,948,328,948,165,945,271,944,330,944,11,938,133,937,159,937,181,934,208,933],"sa":[60,940,284,934,343,934,45,919,282,918,341,918,278,908,337,908,46,907,283,906,342,906,61,903,224,903,267,901,326,901,187,899,17,898,168,897,25,894,478,894],"tr":[164,943,224,941,278,940,337,940,46,938,259,936,318,936,28,935,261,933,320,933,258,932,317,932,12,929,256,929,315,929,267,928,326,928,257,927,280,927,316,927],"ch":[35,938,24,932,165,930,157,928,268,927,327,927,124,924,3,922,135,921,158,921,23,920,171,920,126,919,160,919,21,918,170,918,110,917,15,915,26,915,109,915],"pl":[42,965,51,963,238,962,53,959,287,959,346,959,39,958,188,958,186,949,40,947,183,945,176,944,179,943,185,943,55,942,180,942,175,941,187,941,289,941,348,941],"se":[220,960,36,958,211,954,23,941,35,941,158,940,21,934,171,932,271,932,330,932,212,930,182,929,268,927,272,927,327,927,331,927,201,926,213,926,169,925,37,924],"be":[218,968,15,965,4,957,35,954,219,952,237,950,157,949,171,949,159,948,208,948,170,945,268,945,327,945,3,943,5,943,23,942,37,942,169,941,158,940,181,940],"th":[85,949,77,946,484,945,91,944,410,944,434,944,472,943,99,942,446,942,81,941,409,941,473,941,89,940,445,940,422,939,423,939,436,939,448,939,87,938,90,938],"at":[171,966,158,954,160,953,36,951,182,944,35,943,21,942,3,941,20,941,172,941,173,941,159,940,175,940,193,936,167,935,183,935,201,935,209,935,166,933,192,933],"no":[165,939,271,939,330,939,35,935,18,932,268,932,327,932,220,924,213,923,20,922,15,921,37,920,272,918,331,918,109,917,211,917,126,916,150,916,269,916,328,916],"il":[282,920,341,920,21,919,45,919,218,919,73,915,4,913,157,910,147,909,37,907,219,907,269,907,328,907,15,905,237,904,74,903,268,903,273,903,327,903,332,903],"ie":[18,915,185,911,269,911,328,911,15,910,165,909,268,908,327,908,126,907,116,904,130,904,186,904,170,903,270,902,271,902,329,902,330,902,24,901,35,901,21,900],"sg":[156,924,110,912,133,912,116,911,109,909,170,907,268,906,327,906,157,905,165,903,269,901,328,901,126,899,273,899,332,899,147,898,275,898,334,898,15,897,208,897],"my":[280,959,339,959,278,943,337,943,402,942,261,941,320,941,422,941,408,940,384,939,409,939,445,939,277,938,336,938,12,937,259,936,318,936,17,935,69,935,281,935],"ph":[14,932,161,927,30,925,163,916,248,914,307,914,253,913,312,913,32,912,162,911,245,911,304,911,68,908,69,907,236,907,279,907,338,907,292,903,351,903,252,902],"vn":[443,936,463,936,496,936,423,934,442,934,465,933,161,932,439,932,460,932,471,932,489,932,163,929,438,929,492,929,93,928,497,928,22,927,440,927,468,927,475,927],"ng":[296,922,355,922,229,906,62,903,48,901,227,901,65,900,63,897,230,897,232,894,295,888,354,888,231,887,294,886,353,886,300,884,359,884,247,879,306,879,64,877],"eg":[253,944,312,944,161,936,252,935,311,935,245,934,304,934,248,933,307,933,67,927,162,927,163,925,49,924,228,924,246,923,305,923,480,922,59,921,66,921,292,921],"ar":[17,921,234,919,70,918,46,916,224,915,168,909,278,908,337,908,164,906,16,892,28,892,42,891,58,890,259,889,267,889,318,889,326,889,187,887,258,887,317,887],"za":[263,894,322,894,262,889,321,889,292,888,351,888,260,887,319,887,293,886,352,886,66,884,265,880,324,880,32,872,253,872,312,872,279,870,338,870,29,869,59,869],"dk":[15,962,170,955,218,955,21,954,268,952,327,952,271,951,330,951,165,949,241,948,158,947,171,946,237,945,23,943,157,943,169,942,20,941,219,941,4,939,18,938],"fi":[20,958,171,953,23,951,158,949,211,943,21,938,172,937,57,936,160,936,182,934,215,933,291,933,350,933,54,932,200,932,201,932,272,932,331,932,212,931,35,930],"nz":[268,956,327,956,202,952,271,951,330,951,182,949,189,948,184,947,269,947,328,947,5,945,114,945,165,945,209,945,126,944,4,942,21,942,206,942,219,942,272,942],"pt":[41,956,53,953,192,953,287,953,346,953,55,952,289,952,348,952,183,948,184,947,194,946,193,943,8,942,199,940,188,939,189,937,57,936,176,936,190,936,291,936],"cz":[238,963,188,962,175,960,159,959,19,958,179,958,172,957,173,957,176,956,51,953,192,953,54,952,183,952,191,952,42,950,194,950,185,949,186,949,167,948,184,948],"ro":[288,961,347,961,42,960,53,958,287,958,346,958,51,955,52,952,286,951,345,951,55,948,289,948,290,948,348,948,349,948,19,947,56,946,188,934,483,932,183,931],"gr":[38,956,194,953,13,946,199,946,167,944,189,944,184,941,188,940,8,938,183,938,193,938,53,937,287,937,346,937,192,936,55,934,187,934,289,934,348,934,166,933],"hu":[19,965,40,960,51,959,287,959,346,959,53,958,188,957,55,953,238,952,289,951,348,951,39,950,56,949,186,949,288,948,347,948,187,946,52,945,183,945,185,945],"ua":[82,919,459,913,425,911,487,910,81,908,78,907,389,904,453,904,490,903,102,902,288,902,347,902,79,901,486,901,386,900,393,900,40,898,446,897,80,896,196,896],"ru":[52,887,286,887,345,887,40,881,223,879,19,874,42,874,289,872,348,872,55,871,288,871,347,871,386,871,290,869,349,869,56,868,99,868,240,868,28,867,389,867],"ae":[61,934,269,934,328,934,60,933,4,931,37,931,218,931,219,930,283,930,342,930,284,926,343,926,202,925,268,925,327,925,147,924,216,924,276,923,335,923,165,921],"cl":[267,942,326,942,164,941,70,939,71,939,233,939,17,938,234,938,256,936,315,936,195,934,258,933,317,933,168,930,187,930,259,930,318,930,278,929,337,929,261,928],"co":[50,957,226,954,69,951,236,949,257,945,316,945,277,941,336,941,71,940,233,940,264,939,323,939,260,938,319,938,262,937,321,937,72,936,235,936,259,935,318,935],"pk":[251,927,310,927,243,924,302,924,244,921,303,921,295,919,296,919,354,919,355,919,229,918,247,916,306,916,62,915,63,909,230,909,294,907,353,907,250,903,309,903],"bd":[245,956,304,956,246,952,305,952,480,952,161,943,253,938,312,938,479,938,163,937,162,936,244,934,250,934,252,934,303,934,309,934,311,934,248,933,307,933,254,926],"pe":[277,962,336,962,47,957,69,957,225,957,236,954,279,952,338,952,257,950,316,950,264,948,280,948,323,948,339,948,281,947,340,947,68,946,259,943,318,943,72,942],"sk":[19,963,42,959,53,957,287,957,346,957,40,955,39,953,188,951,238,949,183,947,54,945,55,945,289,944,348,944,186,943,176,941,180,939,187,939,184,938,56,937],"bg":[288,958,347,958,40,952,55,949,289,949,348,949,42,945,53,938,287,938,346,938,290,937,349,937,56,935,383,934,459,933,389,932,483,931,386,929,51,928,80,927],"hr":[55,961,289,961,348,961,19,959,290,959,349,959,40,958,42,958,51,957,56,957,176,956,180,955,38,953,183,951,57,950,192,950,291,950,350,950,238,949,184,948],"si":[175,963,183,956,39,952,176,952,193,951,186,949,192,949,173,947,201,946,209,946,51,945,57,945,184,945,188,945,172,944,190,944,191,944,291,944,350,944,179,943],"lt":[56,964,290,963,349,963,53,961,287,961,346,961,42,953,38,952,57,950,52,949,291,949,350,949,40,948,188,948,286,948,345,948,192,946,51,945,184,945,39,944],"lv":[55,964,57,963,291,963,350,963,289,962,348,962,53,957,287,957,346,957,198,950,42,949,40,946,199,945,183,944,200,943,184,942,288,942,347,942,204,940,180,938],"ee":[56,963,183,963,184,962,290,960,349,960,188,959,199,959,193,955,192,953,176,951,189,951,238,951,287,951,346,951,53,950,55,950,200,950,204,950,182,949,289,949],"ir":[293,933,352,933,444,930,67,928,393,928,414,928,447,928,453,928,454,926,433,924,490,923,103,922,456,922,485,922,278,921,337,921,17,920,28,920,394,920,455,920],"iq":[67,932,32,921,293,921,352,921,292,914,351,914,480,913,66,912,479,910,253,901,312,901,285,897,344,897,245,895,304,895,263,892,322,892,161,890,252,887,311,887],"kw":[16,940,282,934,283,934,341,934,342,934,45,933,61,931,478,931,276,917,335,917,46,913,168,911,224,909,205,908,267,908,326,908,219,906,278,906,337,906,206,904],"qa":[45,934,284,934,343,934,282,933,341,933,60,931,147,931,114,924,130,917,142,916,214,916,106,915,269,915,328,915,146,914,109,913,213,913,268,913,327,913,131,912],"et":[232,929,65,923,294,919,353,919,251,917,310,917,296,916,355,916,48,915,227,915,230,910,63,906,31,903,247,903,306,903,295,901,354,901,243,895,302,895,244,894],"ke":[294,943,353,943,231,935,65,930,247,929,306,929,244,928,303,928,64,925,232,924,243,924,302,924,296,920,355,920,254,910,313,910,48,909,227,909,229,909,62,906],"gh":[63,925,299,923,358,923,230,921,295,919,354,919,247,916,306,916,254,910,313,910,65,909,244,906,303,906,232,904,300,904,359,904,250,902,255,902,309,902,314,902],"tz":[294,942,353,942,230,934,63,930,229,926,62,923,231,919,295,914,354,914,296,910,355,910,64,909,247,905,306,905,299,902,358,902,31,900,499,896,255,895,314,895],"ma":[293,940,352,940,253,930,312,930,161,928,248,926,307,926,67,923,32,921,252,920,311,920,263,918,322,918,245,915,304,915,162,914,59,912,163,912,479,911,262,906],"dz":[293,943,352,943,59,932,58,928,32,927,292,924,351,924,66,923,285,920,344,920,103,912,479,910,393,908,279,907,338,907,394,906,50,905,263,904,322,904,487,904],"ve":[50,946,226,943,279,942,338,942,277,940,336,940,265,937,324,937,69,933,260,933,263,933,319,933,322,933,236,930,257,930,316,930,262,929,321,929,264,928,323,928],"ec":[277,962,279,962,336,962,338,962,50,957,226,955,47,951,225,951,280,949,339,949,442,947,462,947,72,945,235,945,264,945,323,945,281,944,340,944,443,942,423,941],"uy":[164,940,46,939,224,935,204,927,258,927,317,927,261,926,320,926,259,922,318,922,256,921,267,921,315,921,326,921,55,920,289,919,348,919,33,918,168,917,278,917],"cr":[258,958,317,958,259,957,318,957,72,951,235,950,257,950,316,950,261,949,320,949,224,943,391,941,47,940,225,940,46,939,256,939,315,939,164,934,264,934,323,934],"pa":[71,951,233,951,69,945,50,942,236,942,281,941,340,941,226,939,47,936,225,936,259,932,264,932,318,932,323,932,391,930,277,929,280,929,336,929,339,929,257,927],"cn-bj":[366,938,74,937,364,927,361,921,189,920,365,919,405,919,167,917,197,916,377,916,13,915,25,915,39,915,222,915,362,915,209,914,238,914,274,914,333,914,75,913],"cn-sh":[366,951,75,946,274,938,333,938,73,937,275,936,334,936,361,936,273,933,332,933,362,932,364,931,377,931,276,930,335,930,369,929,207,928,365,928,405,927,398,923],"cn-tj":[368,959,362,958,365,958,366,958,369,958,373,958,376,956,398,955,400,954,83,952,375,951,364,950,367,950,405,950,361,948,363,948,74,946,374,946,401,946,370,945],"cn-cq":[90,976,421,970,495,968,437,966,91,963,86,962,381,961,422,961,416,960,99,959,409,959,470,959,372,958,426,957,384,956,406,956,382,955,420,955,429,955,418,954],"cn-he":[85,974,78,972,89,972,385,971,81,970,472,969,382,968,99,967,91,966,87,965,80,964,412,964,446,964,411,963,415,963,485,962,90,961,408,961,413,960,448,960],"cn-sx":[425,975,77,972,79,969,81,969,102,968,453,968,412,966,89,965,385,965,415,965,485,965,99,964,85,963,389,963,472,963,433,962,456,962,486,962,411,961,473,961],"cn-nm":[389,973,78,969,425,963,481,962,102,961,386,957,393,957,390,956,397,955,474,955,99,953,453,952,470,952,485,952,433,950,458,950,469,950,472,950,486,950,456,949],"cn-ln":[382,976,81,972,459,971,99,969,383,965,77,964,88,962,90,961,385,961,416,961,85,960,82,959,415,959,483,959,484,959,91,957,417,956,470,956,78,955,472,954],"cn-jl":[82,982,382,976,459,976,80,972,77,970,99,970,78,969,446,969,408,965,434,965,473,965,484,964,85,963,385,963,472,963,410,961,415,960,485,959,91,958,409,958],"cn-hl":[81,982,459,979,446,965,434,964,408,962,382,961,472,961,99,960,473,960,80,959,77,958,78,958,425,958,486,955,385,954,441,954,85,953,453,953,484,952,410,951],"cn-js":[368,976,400,976,376,969,398,968,375,967,84,966,373,966,367,963,401,963,419,960,88,958,399,957,369,956,417,956,428,956,432,956,362,955,365,955,396,954,374,953],"cn-zj":[419,968,83,966,416,965,92,964,376,964,370,963,428,963,86,962,399,958,400,958,365,957,367,957,368,957,418,956,363,955,372,954,373,953,380,953,483,953,364,951],"cn-ah":[385,976,77,974,89,973,448,973,91,971,433,971,415,970,485,970,472,969,412,968,99,967,379,967,456,967,457,967,397,966,453,966,382,965,408,965,455,965,486,965],"cn-fj":[372,978,380,968,419,967,407,966,416,965,428,965,418,964,76,962,84,962,90,961,432,960,92,959,399,959,421,958,426,958,470,958,495,958,384,957,406,956,91,955],"cn-jx":[441,976,91,974,409,974,406,973,422,973,410,972,424,971,429,970,423,967,473,967,408,966,77,965,430,965,488,963,85,961,89,961,426,961,436,961,384,960,418,960],"cn-sd":[415,972,417,967,379,966,457,966,99,964,382,964,397,964,85,963,90,963,396,963,448,963,80,962,401,960,373,959,455,959,77,958,83,958,383,958,486,958,470,957],"cn-ha":[85,973,77,972,411,972,412,970,385,966,78,965,485,965,414,964,433,964,448,963,472,963,490,963,453,962,87,961,456,961,415,960,447,959,454,959,91,958,408,958],"cn-hb":[76,976,421,976,99,971,382,966,470,966,91,965,88,963,416,962,436,962,77,961,80,961,86,961,437,961,85,959,422,959,426,959,409,958,406,956,415,956,432,956],"cn-hn":[422,977,409,976,424,976,87,974,429,973,473,972,85,971,406,970,99,969,421,969,436,968,408,967,410,967,77,966,90,965,441,965,426,964,437,964,472,964,488,964],"cn-gd":[84,964,86,959,370,958,407,955,416,955,372,954,380,954,418,954,419,954,384,953,374,952,406,950,90,949,428,949,426,948,432,948,76,946,83,946,91,946,363,946],"cn-gx":[387,975,467,975,96,973,431,973,491,973,497,972,488,971,435,969,451,969,423,968,439,966,430,965,452,965,489,965,440,964,468,964,424,963,441,963,464,963,438,962],"cn-hi":[391,975,431,971,488,971,387,967,451,967,424,966,429,963,449,963,464,963,491,962,497,961,423,960,93,959,441,959,473,959,409,958,435,958,437,958,452,958,462,958],"cn-sc":[494,958,436,955,437,955,90,954,91,954,420,952,435,951,76,948,77,948,381,948,85,946,99,946,421,946,89,945,78,944,81,943,472,943,93,942,424,941,473,941],"cn-gz":[467,974,93,973,97,971,465,971,100,964,439,964,491,963,387,960,489,960,431,958,452,958,497,958,438,956,460,956,488,956,451,955,435,954,461,954,440,950,466,950],"cn-yn":[96,971,467,958,465,957,93,956,494,956,461,952,466,952,500,951,439,949,431,948,491,948,501,948,387,946,452,946,489,946,100,944,451,943,101,941,438,941,460,941],"cn-xz":[395,971,498,939,499,927,101,912,479,909,248,903,250,903,307,903,309,903,300,901,359,901,162,900,392,900,476,900,480,900,252,899,311,899,500,896,501,895,477,894],"cn-sn":[408,973,382,972,90,971,446,971,81,970,459,970,472,970,484,970,80,969,91,969,397,968,77,967,85,967,409,966,473,966,415,965,421,965,78,964,88,964,385,964],"cn-gs":[96,964,476,963,103,962,477,959,493,955,438,953,102,952,465,952,487,952,492,952,101,951,475,951,93,950,439,950,467,950,469,950,497,950,490,948,491,947,489,946],"cn-qh":[392,968,100,951,103,946,97,941,102,941,476,934,96,932,477,931,395,930,393,929,465,928,95,924,390,923,494,923,467,922,500,919,93,918,466,918,475,918,493,918],"cn-nx":[393,975,78,968,390,964,79,961,103,961,425,961,389,959,433,958,414,955,447,955,453,955,456,954,394,953,412,953,454,953,100,952,411,952,415,952,474,952,490,952],"cn-xj":[100,962,102,961,393,955,390,953,394,953,392,952,477,952,469,947,101,946,425,945,447,945,465,944,490,944,387,943,467,943,492,943,493,943,476,942,487,942,414,941],"us-al":[143,983,120,982,107,981,145,972,127,965,121,959,136,958,128,956,151,954,113,952,125,952,139,948,138,942,117,939,152,939,134,936,141,934,106,930,142,930,149,926],"us-ak":[137,948,153,945,217,945,144,938,129,936,130,932,146,931,111,926,109,925,126,925,214,924,131,922,147,922,114,919,119,918,139,918,128,917,106,916,115,915,134,915],"us-az":[131,971,128,964,142,962,111,958,134,958,112,955,113,955,138,953,145,953,147,953,116,952,136,952,146,952,125,951,117,949,123,949,114,948,139,948,152,947,119,946],"us-ar":[104,981,120,980,127,971,143,971,145,969,121,964,151,954,128,953,139,953,136,950,125,945,113,944,134,940,117,937,138,936,152,933,106,930,129,927,141,927,142,927],"us-ca":[150,940,109,938,124,938,135,933,116,929,133,925,110,923,123,923,126,923,146,917,149,913,18,908,111,908,114,908,147,908,106,907,268,904,327,904,140,903,112,901],"us-co":[126,974,123,965,133,965,149,960,116,957,114,956,147,954,111,950,165,950,110,949,268,948,327,948,146,947,150,946,130,944,152,944,269,944,328,944,106,943,135,943],"us-ct":[133,964,124,963,123,961,135,953,149,952,141,950,109,949,142,949,111,943,116,943,126,941,112,939,150,939,114,931,132,931,152,931,125,928,113,926,21,925,140,924],"us-de":[116,962,112,959,106,958,123,957,133,956,142,954,131,952,109,950,138,950,128,948,141,948,149,948,114,945,152,945,110,943,130,943,126,941,125,938,147,938,113,937],"us-fl":[142,971,133,960,111,959,141,959,106,955,114,955,152,955,123,954,149,953,138,951,128,950,113,949,125,949,136,946,145,945,116,944,131,943,147,942,109,940,146,940],"us-ga":[136,973,145,968,149,966,125,965,128,963,141,961,143,959,152,957,138,956,106,955,104,952,142,952,117,951,121,950,146,950,112,949,134,947,107,944,119,943,147,942],"us-hi":[142,958,109,956,112,955,133,954,123,951,126,950,131,949,106,948,147,946,37,945,111,945,140,945,152,943,149,939,268,938,271,938,327,938,330,938,165,937,129,936],"us-id":[129,949,140,948,119,946,139,945,118,944,216,944,272,942,331,942,128,941,106,940,152,936,122,935,144,935,130,932,134,932,145,931,114,930,126,930,131,930,148,930],"us-il":[111,962,123,959,133,958,109,957,149,955,126,954,141,953,106,952,138,952,130,951,152,945,112,944,131,944,110,943,125,943,146,943,147,943,128,942,119,941,142,941],"us-in":[128,973,138,968,145,960,136,958,119,956,152,956,125,955,113,951,106,949,118,947,120,947,130,947,143,947,139,945,134,944,121,942,131,942,104,939,107,937,116,937],"us-ia":[119,976,144,963,130,958,129,951,152,951,216,949,117,947,140,947,115,944,126,940,139,940,128,939,136,939,138,937,131,936,205,936,146,932,125,931,134,931,137,931],"us-ks":[118,976,130,969,144,966,117,956,216,956,128,952,129,951,131,951,138,951,152,951,134,948,139,948,126,947,106,946,115,946,136,945,146,945,125,944,113,943,140,942],"us-ky":[104,982,107,980,143,975,145,972,121,967,128,959,127,957,136,956,139,954,125,953,151,951,138,949,117,947,152,943,113,941,134,941,129,935,106,934,141,931,142,930],"us-la":[120,967,145,966,107,964,104,959,143,959,128,957,127,951,113,950,125,949,139,947,151,947,136,945,138,945,117,942,106,941,134,940,152,935,141,934,142,931,146,929],"us-me":[148,968,132,938,115,935,129,928,215,928,140,921,136,912,125,911,151,911,104,910,142,910,145,910,272,910,331,910,143,909,118,907,128,907,144,907,152,907,178,907],"us-md":[133,977,149,970,109,965,110,961,116,959,126,959,142,959,111,957,112,954,141,954,114,951,152,950,106,949,124,944,147,944,125,942,135,942,113,940,138,940,128,938],"us-ma":[110,963,135,950,133,947,123,944,149,940,108,938,150,938,109,932,142,931,18,924,116,923,141,923,126,920,220,919,112,918,157,917,111,913,114,913,113,912,268,911],"us-mi":[136,979,152,976,138,972,145,972,141,970,128,968,113,965,142,961,143,960,149,960,117,955,120,953,104,952,106,951,140,951,112,949,121,949,107,945,119,944,116,943],"us-mn":[109,974,149,962,152,961,123,959,133,959,130,958,116,954,147,954,114,950,165,950,268,950,327,950,141,948,119,947,140,947,128,945,37,944,132,944,138,944,144,944],"us-ms":[107,971,104,965,143,958,120,957,151,954,121,951,145,942,136,931,113,929,139,928,128,924,125,922,134,915,138,914,117,912,106,909,152,908,141,905,28,904,51,903],"us-mo":[145,977,138,974,117,973,125,968,136,967,106,964,152,964,113,963,143,961,120,959,121,957,104,956,134,955,139,954,141,954,107,953,119,952,142,952,112,950,111,948],"us-mt":[144,959,139,955,118,951,119,951,216,951,115,949,128,947,134,946,106,945,131,942,130,938,105,936,114,936,152,936,120,935,153,935,111,934,117,932,145,932,126,931],"us-ne":[144,974,119,969,118,958,126,958,116,951,137,951,147,950,152,950,216,949,117,947,128,947,106,944,109,944,111,943,146,943,131,942,149,940,129,938,113,937,138,937],"us-nv":[106,971,134,962,111,952,119,951,114,949,139,946,144,946,142,945,116,944,128,944,112,943,146,943,117,942,129,942,130,942,113,941,138,938,147,938,109,936,118,936],"us-nh":[149,951,126,944,142,944,152,944,136,939,141,939,215,939,122,938,112,936,113,935,114,935,148,934,130,932,133,932,110,931,123,931,125,931,109,930,144,930,111,929],"us-nj":[123,977,109,965,110,964,142,963,149,962,112,960,126,959,116,958,111,956,141,955,114,954,124,947,152,947,106,945,147,943,135,940,125,939,138,939,157,938,15,937],"us-nm":[139,967,131,962,106,958,128,955,119,948,113,947,129,946,138,945,117,944,145,944,143,942,216,942,120,941,107,940,121,940,125,940,146,940,136,937,104,936,130,936],"us-ny":[110,953,124,950,109,943,123,942,133,940,149,939,108,933,150,933,126,929,116,924,141,923,114,922,142,922,18,921,112,920,111,913,165,913,113,910,268,910,327,910],"us-nc":[125,979,145,978,113,973,152,972,143,968,128,967,138,963,141,959,149,959,104,958,117,958,142,957,120,956,106,952,107,950,112,946,119,945,121,945,140,943,146,942],"us-nd":[144,956,217,955,130,951,105,948,153,941,118,931,119,931,129,928,216,923,126,921,109,918,111,915,139,914,116,913,214,912,61,911,131,909,146,909,147,909,152,908],"us-oh":[128,974,125,972,117,968,152,967,141,966,136,963,145,963,113,956,106,953,116,952,112,951,119,951,111,950,120,949,143,949,142,946,121,945,134,945,146,945,126,944],"us-ok":[134,967,129,955,120,954,128,954,107,953,145,952,143,949,104,948,106,948,119,948,121,947,216,947,131,946,115,945,117,945,144,941,118,940,113,935,138,934,130,933],"us-or":[152,961,125,951,150,949,115,948,118,947,126,947,114,945,142,944,136,943,149,943,119,942,141,941,109,940,138,940,123,938,211,938,112,937,133,937,213,937,272,937],"us-pa":[125,970,138,966,149,966,113,961,142,960,112,959,136,959,152,959,133,955,123,954,128,954,116,953,145,951,110,950,111,948,126,948,140,941,143,941,132,939,146,938],"us-ri":[112,971,133,963,106,962,125,961,141,960,123,959,152,959,114,958,149,958,136,957,111,954,145,953,113,952,128,952,110,949,138,946,147,946,131,945,132,944,140,944],"us-sc":[104,983,120,975,145,975,107,971,136,968,128,961,125,960,113,959,121,959,127,958,138,949,139,949,152,948,117,947,151,945,134,942,141,941,106,940,142,938,149,934],"us-sd":[130,974,119,966,118,963,129,959,137,956,131,946,126,944,216,944,139,941,217,941,128,940,106,939,105,938,152,938,153,938,117,937,111,935,115,935,147,935,134,934],"us-tn":[136,978,128,977,143,975,104,972,120,972,125,972,107,969,113,968,121,966,138,963,152,963,117,960,106,953,142,953,139,952,141,951,112,945,134,944,149,944,127,942],"us-tx":[106,952,147,951,113,950,109,947,119,945,138,945,126,944,116,943,130,943,131,943,136,942,128,941,152,941,112,940,134,940,141,938,125,937,117,936,123,936,145,936],"us-ut":[109,954,126,954,106,953,146,951,130,950,152,950,114,946,142,946,123,944,116,943,128,943,133,943,112,942,113,942,149,942,119,941,111,938,131,938,138,938,268,938],"us-vt":[122,968,132,934,115,930,272,927,331,927,215,923,129,922,140,919,212,912,213,912,142,909,203,906,211,904,36,902,114,901,136,901,152,901,210,901,143,900,104,899],"us-va":[123,970,113,966,141,966,126,962,133,962,152,962,109,960,125,960,136,959,142,958,116,955,112,953,110,952,132,951,111,948,106,944,128,944,138,944,145,944,140,943],"us-wa":[140,949,109,946,108,940,110,939,124,938,126,937,149,936,123,933,135,933,133,928,116,925,115,924,213,924,211,920,141,919,114,918,24,916,142,916,152,916,212,916],"us-wv":[104,954,107,954,127,954,120,951,121,947,143,945,145,928,139,921,128,919,113,916,136,914,215,914,134,913,122,911,125,910,132,908,129,907,141,906,138,904,142,903],"us-wi":[125,976,136,972,138,967,128,964,145,963,149,962,126,961,140,961,141,959,142,959,113,957,117,956,112,955,118,951,119,951,123,950,130,950,147,950,143,948,106,947],"us-wy":[217,955,105,945,137,941,144,938,129,935,130,931,131,930,214,930,118,925,117,924,119,924,128,923,111,922,106,921,139,920,152,917,134,915,216,914,126,913,145,912],"jp-tk":[207,944,155,937,208,935,274,931,333,931,209,927,218,925,21,924,273,923,332,923,169,922,4,920,3,919,275,918,334,918,5,917,219,917,157,916,171,915,10,914],"kr-sl":[154,937,274,920,333,920,273,914,332,914,207,909,275,908,334,908,276,905,335,905,218,904,21,899,169,899,208,898,239,897,209,895,219,895,74,894,157,894,237,894],"gb-ln":[157,947,165,946,268,946,327,946,269,940,328,940,206,936,241,936,271,936,330,936,109,932,35,930,126,929,170,929,114,928,133,928,37,927,15,925,27,924,169,924],"fr-pr":[268,964,327,964,165,959,269,956,328,956,15,951,21,949,156,947,35,943,170,943,271,943,330,943,197,942,218,942,4,939,11,939,123,938,133,938,220,934,237,934],"de-by":[160,977,171,964,23,954,3,952,172,951,36,949,35,947,159,947,175,943,20,940,21,940,208,940,173,937,166,936,182,933,201,932,174,931,39,930,179,929,169,928],"de-nw":[172,973,166,967,173,965,179,963,171,962,175,962,191,962,39,959,3,958,209,956,182,954,190,953,167,952,181,952,238,950,194,949,201,949,219,949,21,948,158,947],"de-bw":[158,977,171,966,23,953,3,946,175,945,208,945,172,943,159,942,21,938,35,938,173,938,36,936,166,933,201,932,39,930,179,929,191,927,190,926,192,926,182,925],"in-mh":[163,969,248,964,307,964,245,961,304,961,162,960,253,958,312,958,252,956,311,956,479,948,228,944,49,943,246,938,305,938,250,937,309,937,32,936,475,935,476,935],"in-ka":[248,971,307,971,161,960,245,959,304,959,252,958,311,958,163,957,250,957,309,957,253,953,312,953,479,947,246,942,305,942,475,937,49,936,228,936,480,936,476,933],"in-tn":[161,969,248,959,307,959,162,957,252,956,311,956,245,954,304,954,253,949,312,949,475,945,476,940,479,940,49,937,228,937,477,937,100,936,250,935,309,935,496,933],"br-sp":[258,963,317,963,259,956,318,956,256,949,315,949,261,948,320,948,278,946,337,946,17,943,234,942,46,941,224,941,257,941,316,941,70,940,71,934,233,934,264,934],"au-nsw":[268,979,327,979,269,972,328,972,271,964,330,964,11,960,157,959,109,950,126,950,35,949,156,946,15,945,37,945,24,939,123,938,114,937,170,936,133,934,218,934],"it-lm":[190,980,191,980,179,970,8,967,159,967,193,965,192,963,167,962,194,962,173,960,201,959,175,957,172,955,182,954,176,952,13,951,186,951,189,951,209,951,185,948],"es-ct":[13,974,189,972,194,968,184,966,193,964,182,963,166,962,199,962,8,960,183,960,201,960,188,959,197,959,190,957,191,956,186,954,192,954,209,954,159,952,179,952],"mx-cd":[278,946,337,946,164,933,224,931,46,930,256,930,315,930,394,927,267,923,326,923,17,922,240,920,280,920,339,920,234,919,70,917,371,917,281,916,340,916,206,915],"de-be":[241,968,197,950,237,949,181,948,218,944,35,942,206,942,21,941,170,938,219,937,239,937,4,933,23,932,159,932,171,932,202,932,157,930,182,930,158,928,194,928],"de-hh":[237,964,15,961,35,955,218,946,21,945,157,943,181,942,241,941,268,941,327,941,219,940,169,938,165,936,133,934,269,932,328,932,239,930,156,929,4,927,159,927],"de-he":[23,966,160,966,158,964,159,962,175,962,172,957,173,956,3,955,36,953,21,949,209,949,35,946,179,946,191,946,166,945,193,945,181,943,182,943,183,942,192,942],"de-ni":[173,975,159,973,175,973,174,968,176,963,179,963,182,961,191,959,39,957,171,957,190,956,166,955,192,954,158,951,180,951,209,949,177,948,238,948,219,946,57,945],"de-sn":[176,978,172,975,175,974,179,974,192,969,191,968,190,966,159,965,166,960,182,959,180,958,193,958,39,957,174,957,171,956,177,955,8,951,238,950,185,948,54,947],"de-sh":[172,968,177,960,204,959,173,957,203,957,205,957,175,956,180,956,176,954,178,950,179,950,191,948,186,947,219,945,159,944,182,944,190,944,57,943,185,943,202,943],"de-rp":[179,975,173,974,172,973,176,968,190,965,192,964,54,963,159,962,171,962,191,961,39,960,193,959,166,957,209,957,174,956,201,956,183,954,238,950,184,949,188,949],"de-th":[173,978,192,974,179,973,180,971,175,968,177,966,190,965,172,963,193,960,39,956,53,956,287,956,346,956,191,955,174,954,54,952,166,952,186,952,57,951,178,951],"de-bb":[180,973,178,968,176,966,174,960,173,955,179,954,204,951,192,949,172,948,175,946,193,945,200,945,53,944,57,944,205,944,287,944,291,944,346,944,350,944,183,943],"de-mv":[180,973,177,968,204,955,176,951,174,950,205,947,53,942,287,942,346,942,203,941,192,940,200,940,173,939,186,937,57,936,183,936,184,936,188,936,291,936,350,936],"de-sl":[175,975,173,974,176,973,190,971,166,970,191,966,192,966,159,963,172,963,193,963,39,958,8,957,188,955,177,954,167,952,201,951,174,950,180,950,183,950,185,950],"de-st":[177,973,178,973,176,971,173,958,174,956,53,955,192,955,287,955,346,955,204,953,172,951,179,950,200,949,291,949,350,949,57,948,186,947,188,946,190,946,183,945],"de-hb":[159,952,218,949,169,948,219,948,171,943,170,942,237,941,21,940,172,936,197,935,15,934,191,934,173,933,3,932,166,932,179,932,35,931,239,930,276,928,335,928],"fr-ra":[184,964,167,963,185,962,172,961,186,960,192,960,5,959,173,959,188,957,189,957,183,956,191,956,194,956,159,954,166,954,190,954,193,952,176,950,37,949,57,949],"fr-na":[184,985,188,977,189,974,199,972,186,971,193,971,192,965,57,963,194,963,291,962,350,962,167,960,185,960,190,960,209,957,238,957,54,956,182,956,8,954,13,954],"fr-oc":[183,985,188,977,189,976,199,971,186,969,192,969,167,966,194,965,182,964,193,964,57,962,13,961,185,961,291,961,350,961,187,957,190,955,5,953,8,953,238,953],"fr-pd":[186,984,188,971,191,964,182,962,184,961,187,961,183,960,190,957,189,956,205,956,192,955,194,954,238,954,167,951,179,950,39,949,219,949,166,948,173,948,193,948],"fr-br":[185,984,188,975,183,971,184,969,190,962,191,962,182,960,187,960,189,958,194,958,193,956,192,955,167,954,238,954,205,953,176,952,166,951,179,950,19,949,39,949],"fr-hf":[188,968,185,961,186,960,205,958,184,957,199,954,204,954,183,951,42,946,194,946,189,945,238,945,57,943,182,943,291,942,350,942,19,941,39,941,55,941,195,941],"fr-ge":[183,977,184,977,186,975,185,971,187,968,189,966,238,964,39,962,192,960,199,960,57,959,167,959,194,959,19,958,291,958,350,958,42,957,182,957,193,957,8,955],"fr-paca":[184,976,183,974,194,974,167,972,199,968,13,967,188,966,193,964,186,958,182,957,209,957,185,956,5,955,8,954,192,954,57,951,166,951,197,951,238,951,291,950],"it-vn":[191,982,166,980,192,973,193,973,179,971,8,967,173,966,175,965,176,965,186,962,194,962,183,960,167,957,185,957,172,956,184,955,201,955,182,954,188,954,159,953],"it-er":[190,982,166,980,192,969,173,968,179,966,193,966,8,965,185,964,194,963,159,962,186,962,175,961,172,959,167,956,182,956,176,955,201,954,39,952,188,950,183,949],"it-pm":[193,975,176,974,190,973,173,969,184,969,191,969,179,966,8,965,183,965,175,964,166,963,182,960,188,960,194,960,180,955,185,955,186,955,167,954,172,954,189,954],"it-ts":[192,975,190,973,183,971,8,970,191,966,199,966,166,965,167,964,184,964,189,964,179,963,194,961,176,960,175,959,173,958,188,957,201,957,13,956,186,956,57,955],"it-lz":[189,974,167,968,8,965,184,965,13,964,183,963,191,963,166,962,190,962,197,962,193,961,192,960,188,959,186,958,182,956,199,956,185,954,41,953,5,950,39,950],"it-cm":[196,970,198,962,187,941,224,938,184,937,188,937,199,935,46,934,288,932,347,932,53,931,287,931,346,931,483,930,183,929,40,927,55,927,289,927,348,927,290,926],"it-si":[195,970,198,942,187,930,53,928,287,928,346,928,288,923,347,923,40,920,178,919,204,919,224,919,38,916,46,915,184,915,205,915,290,915,349,915,199,914,42,913],"es-md":[194,962,167,959,13,951,189,951,169,950,182,949,219,948,201,945,166,944,191,944,5,942,157,942,159,942,218,942,37,941,184,941,206,940,209,939,268,938,327,938],"es-an":[195,962,199,958,290,951,349,951,56,950,184,948,57,946,183,945,291,945,350,945,196,942,200,942,189,939,188,936,53,935,287,935,346,935,187,931,38,930,55,930],"es-vc":[183,972,184,971,189,968,193,966,167,962,13,960,188,960,57,959,291,959,350,959,198,958,194,956,200,955,187,954,192,952,186,948,182,947,8,946,41,946,56,945],"es-ga":[199,955,193,953,192,952,57,950,291,950,350,950,180,949,183,948,184,946,177,945,56,943,198,942,210,942,178,940,290,940,349,940,176,939,188,939,204,933,8,932],"es-pv":[167,960,166,959,193,957,175,956,190,955,191,954,209,953,179,951,159,949,192,948,173,947,54,946,197,945,13,944,182,944,194,944,183,943,8,942,172,942,199,942],"gb-en":[4,964,37,952,203,950,216,949,5,947,204,947,205,947,219,947,206,946,174,943,172,942,182,942,218,941,271,938,330,938,159,937,209,936,35,934,185,934,211,934],"gb-sc":[204,961,174,957,202,950,272,947,331,947,205,943,172,941,178,941,182,938,212,936,177,934,206,934,57,932,219,932,37,931,216,931,159,930,186,930,213,930,271,930],"gb-wl":[205,966,203,961,174,959,178,955,187,954,180,953,177,951,57,950,186,949,188,949,291,949,350,949,202,947,184,946,182,945,172,944,185,943,176,942,183,942,238,942],"gb-ni":[204,966,187,958,174,957,185,956,216,956,186,953,188,948,178,947,202,947,184,946,238,945,177,944,182,943,203,943,172,942,180,941,57,940,183,940,206,940,176,939],"gb-mn":[240,951,219,950,202,946,37,942,169,942,239,942,197,940,205,940,204,939,185,937,156,936,274,936,275,936,333,936,334,936,182,934,187,934,203,934,186,933,218,932],"jp-os":[275,963,334,963,274,962,333,962,276,947,335,947,209,946,154,944,273,943,332,943,208,940,159,936,219,932,206,931,239,931,188,929,201,929,74,928,167,928,192,928],"jp-ai":[273,953,332,953,21,948,209,946,160,945,171,942,158,940,207,940,218,939,154,935,3,933,15,933,23,933,159,933,201,931,157,928,219,928,166,927,175,927,275,927],"jp-fk":[175,957,183,957,189,957,159,956,210,955,167,954,193,954,201,953,166,951,5,949,171,949,172,949,188,949,194,949,219,949,184,948,182,947,191,947,54,946,179,946],"jp-hk":[209,955,193,952,215,951,175,945,177,943,200,942,57,941,54,940,183,940,179,939,192,939,291,939,350,939,173,938,189,938,184,937,172,935,199,935,174,934,190,934],"ca-on":[213,961,271,955,330,955,20,954,212,947,272,944,331,944,36,943,37,941,140,938,268,937,327,937,9,935,202,934,220,934,114,933,165,933,215,931,269,930,328,930],"ca-qc":[213,959,272,957,331,957,211,947,203,936,140,935,36,931,20,930,171,930,209,930,271,929,330,929,23,928,182,926,115,925,158,925,9,923,37,923,21,920,202,919],"ca-bc":[211,961,272,960,331,960,212,959,271,947,330,947,140,937,114,933,203,930,268,928,327,928,37,927,20,926,165,926,150,924,220,924,269,924,328,924,24,923,115,921],"ca-ab":[217,942,269,931,328,931,153,930,268,930,327,930,147,925,165,925,37,924,105,924,109,923,126,922,270,922,329,922,271,919,330,919,146,917,61,916,114,916,133,916],"ca-ns":[210,951,132,939,291,937,350,937,57,936,177,935,183,934,272,934,331,934,36,933,184,932,54,931,209,931,211,931,129,930,189,930,216,930,122,928,199,928,200,927],"ca-mb":[119,956,205,956,129,951,118,949,130,949,202,949,217,949,139,947,115,944,144,944,134,942,271,941,330,941,37,939,204,938,131,936,106,935,269,935,328,935,174,933],"ca-sk":[137,955,153,955,216,949,105,945,214,942,144,941,130,932,118,929,119,928,129,924,131,921,269,919,328,919,205,917,139,914,165,912,271,912,330,912,126,911,146,909],"nl-nh":[219,973,15,969,21,968,4,960,35,955,237,951,181,949,170,946,169,944,157,942,159,942,171,942,197,942,268,942,327,942,37,941,202,941,269,941,328,941,208,939],"nl-zh":[218,973,15,956,21,952,206,950,159,949,185,949,209,949,181,948,197,948,202,947,4,946,172,946,186,946,174,945,276,944,335,944,37,942,182,942,35,941,275,941],"se-st":[20,960,35,935,157,934,211,934,271,933,330,933,36,929,268,928,327,928,241,926,24,924,213,924,165,920,124,919,158,918,23,917,169,914,15,913,21,911,272,911],"ru-ms":[223,966,239,948,206,931,240,927,207,920,169,919,197,919,189,918,238,917,142,916,73,915,274,914,333,914,275,913,334,913,39,912,237,912,209,911,57,910,194,910],"ru-sp":[222,966,239,946,238,931,240,930,377,923,206,921,275,920,334,920,39,919,42,919,57,919,55,918,274,918,289,918,291,918,333,918,348,918,350,918,361,918,207,917],"cz-pr":[170,964,15,957,218,951,21,950,169,949,241,946,35,945,181,941,239,940,219,936,157,934,4,930,197,926,208,926,159,924,171,922,268,922,327,922,206,919,23,918],"pl-mz":[188,964,39,963,19,962,183,957,185,954,186,954,184,953,42,952,57,951,189,951,159,950,173,950,175,950,51,949,53,949,179,949,182,949,287,949,346,949,172,948],"hu-bp":[240,949,222,948,223,946,206,942,159,941,237,940,238,939,219,938,169,937,197,937,275,937,334,937,218,934,274,934,333,934,42,931,207,931,170,930,172,930,181,930],"ro-bh":[206,951,239,949,223,930,222,927,42,924,219,923,168,920,188,919,204,919,185,918,186,918,187,918,238,918,189,916,377,916,275,915,334,915,197,913,205,913,274,913],"at-vi":[169,968,35,948,237,946,170,941,156,936,157,933,21,931,15,929,271,929,330,929,23,928,218,928,268,928,327,928,197,926,220,926,181,922,20,920,165,918,206,917],"in-dl":[279,913,338,913,293,912,352,912,168,910,67,901,262,901,263,901,321,901,322,901,50,899,394,899,226,898,292,897,351,897,66,895,161,895,264,895,277,895,323,895],"in-up":[247,970,306,970,244,961,303,961,254,958,313,958,255,956,314,956,251,947,310,947,246,945,305,945,230,927,250,925,309,925,48,924,63,924,227,924,49,922,228,922],"in-rj":[247,969,306,969,243,961,302,961,254,959,313,959,250,956,309,956,246,949,305,949,255,944,314,944,480,943,245,941,304,941,251,937,310,937,49,934,228,933,253,932],"in-gj":[253,966,312,966,161,961,162,959,49,956,228,956,163,954,250,951,309,951,480,950,248,949,307,949,479,949,246,946,305,946,252,944,311,944,244,941,303,941,32,934],"in-wb":[250,956,309,956,254,953,313,953,49,952,228,951,480,951,247,950,306,950,244,949,303,949,245,946,304,946,243,945,302,945,162,942,253,941,312,941,248,939,307,939],"in-mp":[243,970,254,970,302,970,313,970,244,969,303,969,255,966,314,966,246,950,305,950,250,949,309,949,251,938,310,938,230,933,63,929,480,929,231,926,49,920,228,920],"in-tl":[162,971,161,964,163,959,250,959,252,959,253,959,309,959,311,959,312,959,245,949,304,949,479,949,475,948,246,939,305,939,476,938,463,936,480,935,496,934,32,933],"in-ke":[463,959,489,959,471,958,442,956,460,955,440,952,468,952,387,951,438,951,439,951,488,951,431,950,452,950,497,950,443,949,462,949,491,949,423,948,451,948,450,947],"in-ap":[248,959,307,959,162,957,244,956,246,956,303,956,305,956,254,955,313,955,245,951,304,951,247,949,306,949,480,946,253,945,312,945,479,939,161,937,252,936,311,936],"in-br":[243,947,302,947,255,945,314,945,247,938,306,938,244,937,303,937,254,932,313,932,48,927,227,927,246,919,305,919,62,917,229,914,250,901,294,901,309,901,353,901],"in-pb":[253,967,312,967,248,959,307,959,162,958,161,956,163,956,479,950,245,944,304,944,476,944,475,940,480,939,477,938,250,936,309,936,32,935,228,935,49,934,246,934],"in-hr":[252,967,311,967,245,966,304,966,248,959,307,959,161,958,162,953,163,949,479,946,250,945,309,945,32,944,480,944,246,941,305,941,228,939,49,938,244,932,292,932],"in-or":[255,972,314,972,247,970,306,970,244,959,303,959,243,958,302,958,250,955,309,955,246,953,305,953,251,932,310,932,480,932,49,926,228,925,299,925,358,925,245,924],"in-as":[254,972,313,972,247,966,306,966,243,956,302,956,251,945,310,945,244,944,303,944,246,938,305,938,250,931,309,931,480,919,300,913,359,913,231,912,230,910,299,908],"br-rj":[257,950,316,950,164,949,258,949,317,949,259,947,267,947,318,947,326,947,224,940,71,939,233,939,46,936,264,936,323,936,261,933,320,933,278,932,337,932,262,931],"br-mg":[259,979,318,979,258,967,317,967,264,961,323,961,261,954,320,954,50,950,71,950,233,950,256,950,280,950,315,950,339,950,277,948,336,948,226,947,47,945,225,945],"br-rs":[259,985,318,985,261,974,320,974,257,967,316,967,164,963,71,958,233,958,256,949,315,949,264,946,323,946,388,946,381,945,76,937,224,937,280,937,339,937,437,937],"br-pr":[258,985,317,985,257,979,316,979,261,974,320,974,71,957,233,957,164,956,264,956,323,956,388,950,280,949,339,949,256,947,277,947,315,947,336,947,50,943,381,943],"br-ba":[262,973,321,973,263,972,322,972,265,958,324,958,226,939,47,938,225,938,264,937,323,937,50,936,266,936,325,936,68,933,257,930,316,930,279,927,338,927,236,926],"br-sc":[258,974,259,974,317,974,318,974,257,954,316,954,71,949,233,949,164,948,280,943,339,943,381,943,388,943,28,941,278,941,337,941,437,939,277,938,336,938,421,938],"br-pe":[263,980,322,980,260,973,319,973,264,944,265,944,323,944,324,944,279,941,338,941,226,940,47,937,50,937,225,937,293,935,352,935,277,933,336,933,256,931,257,931],"br-ce":[262,980,321,980,260,972,319,972,265,953,324,953,279,939,338,939,264,937,323,937,47,934,225,934,68,933,226,933,293,933,352,933,50,931,236,929,266,929,325,929],"br-go":[257,961,316,961,259,956,318,956,277,950,336,950,50,948,258,946,317,946,69,945,226,945,262,944,321,944,279,943,338,943,388,943,236,942,390,942,47,939,225,939],"br-pa":[266,963,325,963,260,958,319,958,263,953,322,953,262,944,321,944,68,937,226,929,50,926,264,924,323,924,236,923,279,923,338,923,47,921,69,921,225,921,466,921],"br-am":[265,963,324,963,260,936,319,936,263,929,322,929,262,915,321,915,500,906,501,905,68,903,226,903,466,902,50,900,96,900,465,900,236,898,264,898,323,898,461,897],"br-df":[256,947,315,947,46,942,224,940,164,933,17,928,259,926,318,926,258,925,317,925,71,924,233,924,168,923,261,923,320,923,257,922,316,922,70,921,234,921,72,920],"au-vc":[165,979,269,974,328,974,271,969,330,969,157,964,37,956,11,954,15,954,35,952,126,950,109,948,156,946,21,945,218,942,170,941,114,938,147,938,197,938,133,937],"au-ql":[268,974,327,974,165,972,271,963,330,963,11,961,157,956,15,948,37,947,109,944,126,941,218,941,156,940,147,938,4,937,21,937,35,937,116,936,216,935,45,934],"au-wa":[269,933,328,933,214,922,268,917,327,917,165,914,11,906,137,905,26,902,109,902,116,902,271,902,330,902,18,900,157,900,217,899,15,898,126,893,45,892,130,892],"au-sa":[268,969,327,969,165,964,269,963,328,963,211,955,35,951,37,951,213,947,11,944,15,944,157,943,216,941,24,939,272,939,331,939,114,938,202,938,21,937,126,937],"au-ts":[213,960,212,957,203,947,211,944,37,942,115,942,271,939,330,939,140,937,215,934,36,932,216,932,57,930,23,929,174,929,182,929,291,929,350,929,114,928,20,927],"kr-gg":[275,962,334,962,276,960,335,960,274,954,333,954,208,953,366,949,207,943,219,939,10,938,369,938,21,936,362,936,209,935,159,934,218,934,405,934,74,933,75,932],"kr-bs":[275,975,334,975,276,967,335,967,207,962,273,954,332,954,74,938,219,937,206,936,239,934,209,932,154,931,197,930,238,930,218,929,366,929,182,927,21,926,188,926],"kr-dg":[274,975,333,975,276,972,335,972,207,963,273,962,332,962,366,942,219,941,185,940,238,939,377,938,239,937,74,936,206,936,400,935,405,935,182,933,209,933,368,933],"kr-ic":[275,972,334,972,274,967,333,967,273,960,332,960,207,947,219,944,218,935,185,932,74,930,206,930,75,929,366,929,181,928,369,925,45,923,282,923,341,923,4,922],"mx-jl":[280,972,339,972,279,970,338,970,50,962,69,962,236,960,226,959,281,953,340,953,264,950,323,950,257,948,278,948,316,948,337,948,259,947,318,947,12,944,47,941],"mx-nl":[280,962,339,962,277,948,336,948,164,946,168,946,28,943,394,943,259,941,261,941,318,941,320,941,17,940,12,938,258,936,317,936,393,936,481,936,281,934,340,934],"mx-mx":[277,970,336,970,69,962,236,961,50,952,226,952,280,950,339,950,281,945,340,945,264,943,323,943,68,942,262,941,321,941,263,939,322,939,257,932,316,932,12,931],"mx-bc":[277,972,336,972,281,963,340,963,278,962,337,962,28,959,257,950,279,950,316,950,338,950,69,949,259,949,318,949,50,948,236,947,12,946,226,945,261,943,320,943],"mx-qr":[280,963,339,963,277,953,336,953,50,947,279,945,338,945,69,944,226,944,236,942,72,941,235,941,28,935,257,935,316,935,278,934,337,934,259,931,318,931,391,928],"jo":[293,940,352,940,67,920,394,919,279,917,338,917,393,910,278,908,337,908,277,905,336,905,58,901,69,901,103,901,236,901,226,900,292,900,351,900,390,900,50,899],"rs":[40,961,286,959,345,959,52,958,287,949,346,949,42,948,53,948,290,945,349,945,389,944,472,944,55,943,289,943,348,943,446,943,459,943,56,942,486,942,82,941],"tn":[67,943,292,943,351,943,66,940,285,940,344,940,262,935,321,935,58,933,103,933,263,933,322,933,252,927,311,927,414,927,487,927,264,926,323,926,477,926,490,926],"rw":[230,946,63,943,65,942,232,937,229,921,62,919,247,910,306,910,48,907,227,907,244,907,303,907,231,906,243,906,302,906,296,904,355,904,251,901,255,901,310,901],"sn":[296,942,355,942,231,929,299,920,358,920,48,919,64,919,227,919,65,914,232,908,247,905,306,905,229,904,244,904,303,904,300,902,359,902,62,901,254,901,313,901],"ci":[295,942,354,942,230,924,31,922,63,920,48,919,227,919,229,919,62,916,65,910,231,908,232,908,294,904,353,904,64,898,247,898,306,898,244,895,251,895,303,895],"lk":[496,942,438,936,439,935,471,935,489,935,492,934,442,933,463,933,491,931,465,930,497,929,249,927,308,927,452,927,460,926,467,926,443,925,493,925,475,924,435,923],"mm":[299,922,358,922,254,910,313,910,230,907,63,906,247,902,306,902,162,901,250,901,309,901,499,901,49,899,245,899,300,899,304,899,359,899,228,898,246,898,305,898],"kh":[231,928,254,925,313,925,300,924,359,924,64,923,250,923,309,923,245,922,298,922,304,922,357,922,295,920,354,920,162,919,248,917,307,917,247,915,306,915,244,913],"np":[299,924,358,924,250,923,309,923,254,917,313,917,231,914,499,914,247,913,255,913,306,913,314,913,244,907,303,907,63,906,64,904,265,903,324,903,230,902,295,902],"cn-sz":[361,935,377,924,74,922,405,922,362,916,366,915,365,909,404,909,73,907,398,907,367,906,369,904,364,903,378,901,275,900,334,900,273,898,332,898,75,897,363,897],"cn-gz2":[377,976,405,973,365,967,366,961,364,957,370,956,363,952,367,950,376,950,75,948,362,947,368,946,371,944,398,943,373,942,404,942,374,941,369,937,74,936,360,935],"cn-su":[369,984,398,981,367,972,366,964,368,961,75,958,400,958,376,957,399,956,83,955,405,955,365,953,375,951,377,950,364,949,361,947,419,947,428,946,373,945,374,945],"cn-cd":[365,978,370,969,373,966,376,965,368,963,383,963,371,962,377,962,374,960,483,960,405,958,367,956,84,955,364,953,399,953,361,952,400,952,419,952,366,951,398,951],"cn-hz":[365,967,366,965,405,962,370,961,377,961,361,957,363,953,367,953,376,952,84,951,75,950,362,949,368,948,372,943,373,943,419,943,398,940,428,940,369,937,399,937],"cn-wh":[363,978,370,974,376,974,377,973,405,971,368,968,361,967,364,967,366,967,367,966,373,965,374,959,75,958,399,958,84,957,398,957,400,957,371,956,419,956,83,955],"cn-nj":[365,967,377,966,405,966,364,965,362,964,361,961,75,958,369,958,398,958,368,956,376,952,74,951,363,951,367,951,373,950,273,949,332,949,370,948,400,946,374,943],"cn-nb":[399,981,398,980,376,974,362,972,368,972,419,972,428,970,400,969,365,966,369,964,370,964,83,963,375,962,416,960,405,958,84,957,373,957,374,957,377,957,363,956],"cn-qd":[400,987,373,981,376,977,83,976,398,974,401,973,367,972,375,970,370,969,399,969,365,968,374,968,419,967,428,967,432,967,363,963,362,961,371,961,416,961,396,960],"cn-wx":[362,984,398,979,367,964,400,960,368,959,75,958,366,958,375,957,83,956,376,951,399,950,405,948,365,945,401,944,373,943,374,942,377,941,419,941,428,941,404,939],"cn-cs":[365,974,376,970,363,969,368,969,372,968,419,968,373,967,377,965,405,965,367,964,84,963,428,963,374,962,364,961,399,961,416,961,384,960,371,959,92,958,400,958],"cn-zz":[374,981,373,971,432,971,397,965,401,965,470,965,448,963,363,962,368,961,417,961,384,960,370,959,383,959,385,959,396,957,400,957,415,957,365,956,386,955,416,955],"cn-fz":[86,978,384,971,370,968,380,967,407,967,418,966,421,966,429,964,470,964,419,963,422,962,406,961,416,961,428,960,432,959,76,958,409,958,426,958,376,957,399,957],"cn-jn":[368,981,400,975,401,975,374,972,371,971,376,970,375,968,397,968,432,968,370,967,83,966,363,966,365,965,383,964,396,963,399,962,417,962,386,961,470,961,419,960],"cn-hf":[371,981,432,975,373,972,401,971,368,968,396,964,400,964,417,963,370,962,399,962,470,962,397,961,363,960,419,960,365,959,375,959,428,959,448,959,367,957,376,957],"cn-nt":[401,981,400,980,396,974,399,974,368,970,417,970,373,968,398,968,419,968,428,968,83,967,432,967,376,964,367,962,416,961,374,959,483,959,369,957,88,954,379,952],"cn-dl":[368,977,400,977,365,974,367,974,419,974,428,973,399,972,483,972,370,970,373,970,398,970,416,970,83,969,401,966,363,965,84,964,375,964,383,961,432,961,405,960],"cn-xm":[405,984,361,976,365,973,366,966,370,965,363,962,364,961,367,957,376,957,368,954,362,950,398,949,373,946,374,946,404,946,75,944,371,944,400,944,399,942,84,941],"cn-dg":[404,966,403,959,402,946,407,937,399,936,371,934,374,933,432,932,445,930,419,929,367,928,380,927,361,926,428,925,377,924,418,924,370,923,405,923,365,922,416,922],"cn-yc":[457,1000,415,982,455,982,396,975,448,974,456,973,397,972,458,972,454,970,470,969,486,969,417,968,433,968,85,967,485,967,88,966,385,966,401,966,413,964,382,963],"cn-wz":[418,985,426,980,432,973,402,972,419,972,407,970,445,970,86,968,416,968,372,967,428,967,384,965,399,963,406,963,422,961,429,960,409,959,417,959,396,957,401,957],"cn-km":[388,972,437,968,421,963,76,961,435,961,387,958,494,958,384,956,495,956,391,955,420,955,422,954,409,953,491,953,408,952,424,952,488,952,427,951,430,951,436,951],"cn-cc":[459,977,80,976,81,976,99,972,416,971,385,970,426,970,415,969,417,969,77,968,408,967,90,966,446,966,448,966,85,965,445,965,484,965,88,964,397,964,379,963],"cn-sy":[483,969,80,965,459,965,373,964,363,963,382,962,386,962,397,962,416,962,417,962,99,961,376,961,484,961,432,960,371,959,88,958,368,957,401,957,400,956,81,955],"cn-nc":[409,974,422,974,429,974,372,971,406,971,421,967,380,965,418,965,470,964,91,963,407,963,424,963,445,963,402,961,441,961,87,960,370,960,371,960,408,960,426,960],"cn-sjz":[448,981,485,978,397,977,85,976,408,976,415,976,472,975,412,973,453,972,456,972,470,972,77,971,413,971,433,971,486,971,382,970,411,970,455,970,454,969,446,967],"cn-ty":[486,972,389,971,397,971,481,971,485,965,456,963,383,962,373,961,417,961,448,961,455,961,415,960,433,960,458,960,459,959,472,959,78,958,385,958,79,957,446,957],"cn-nn":[491,981,497,981,467,980,488,980,423,978,430,977,435,977,464,977,431,976,93,975,489,975,440,973,468,973,424,971,443,970,469,970,436,969,451,969,438,968,439,968],"cn-gy":[381,972,390,965,435,963,437,963,387,961,391,961,436,957,491,957,462,956,421,955,467,955,472,955,408,954,94,953,393,953,430,953,497,953,424,952,488,952,389,951],"cn-hhht":[79,973,386,971,390,971,393,969,481,965,78,963,425,962,397,960,469,960,472,960,486,960,102,959,433,958,394,957,470,956,474,956,485,956,446,954,448,954,456,954],"cn-lz":[393,974,389,971,394,967,388,965,102,964,469,961,433,957,79,956,386,956,472,954,481,954,103,953,425,953,490,953,453,952,456,952,78,951,414,951,392,950,454,950],"cn-hk2":[94,975,388,961,387,957,462,957,424,956,488,956,381,955,409,953,464,953,422,952,429,952,449,951,384,950,406,950,408,950,421,950,431,950,445,950,473,950,430,949],"cn-xn":[101,968,103,952,390,950,393,950,102,948,394,946,100,940,388,938,389,937,97,935,465,934,381,933,494,933,264,929,323,929,477,929,467,928,79,925,425,925,95,924],"cn-yc2":[102,975,390,974,394,972,389,969,425,964,78,959,79,957,481,957,103,955,386,954,433,954,447,954,490,954,388,953,472,953,414,952,454,952,453,951,392,950,455,950],"cn-wlmq":[393,972,390,967,389,957,102,953,103,953,388,948,392,946,481,945,278,943,337,943,386,943,425,942,79,941,78,938,462,938,447,936,478,936,490,936,391,935,472,935],"cn-ls":[98,971,498,942,101,930,499,926,479,919,392,918,248,916,307,916,476,916,477,915,500,914,480,910,162,909,466,909,252,908,311,908,475,905,100,904,501,904,300,901],"cn-ty2":[401,984,417,982,432,979,379,975,457,975,375,974,397,973,415,973,448,971,455,970,470,968,400,967,416,967,413,966,426,966,428,966,456,965,374,964,486,964,88,963],"cn-xt":[455,985,486,985,456,983,485,983,448,982,415,980,385,977,433,977,417,976,454,975,470,974,396,973,484,973,379,972,457,972,386,971,408,971,432,971,401,969,453,969],"cn-cz":[362,981,367,980,369,979,368,974,400,974,399,971,376,970,83,968,375,968,419,961,428,961,366,958,373,958,401,958,365,957,432,956,75,955,405,955,374,954,416,953],"cn-jx2":[419,989,428,988,367,981,375,974,416,973,376,972,401,972,398,971,400,971,432,971,368,969,483,964,380,963,396,963,418,963,373,962,374,962,426,962,370,961,407,960],"cn-zy":[368,987,401,981,375,980,376,977,83,976,373,975,398,974,419,972,428,972,399,971,367,969,416,969,432,969,396,967,417,965,483,965,374,964,369,960,84,958,362,958],"cn-yz":[396,984,375,981,400,981,432,980,417,977,416,976,373,975,428,974,368,973,399,972,419,972,374,971,397,969,483,967,376,966,379,966,415,966,457,966,371,965,470,965],"cn-hs":[407,978,418,974,380,972,426,970,445,970,384,961,419,960,406,959,429,959,432,959,422,958,399,957,409,957,416,955,372,954,403,954,428,954,86,952,417,952,396,951],"cn-zs":[404,970,378,959,402,954,371,953,374,953,396,953,432,951,401,949,417,949,375,945,399,944,407,944,373,941,380,941,418,941,445,941,448,941,444,940,368,939,397,938],"cn-fs":[403,970,378,966,399,957,374,955,367,951,371,951,419,948,432,948,365,947,398,947,402,947,368,946,370,946,375,946,377,946,405,946,428,946,362,945,373,943,400,943],"cn-zh":[377,984,361,973,365,971,366,966,370,965,364,962,376,960,363,958,367,958,368,956,362,955,398,955,75,950,369,948,373,948,374,948,400,947,404,946,399,945,371,944],"cn-pt":[429,991,422,986,409,985,445,977,424,976,426,975,421,974,87,973,407,973,384,971,418,971,91,970,430,970,408,967,436,967,441,967,470,965,484,965,410,964,380,963],"cn-qz":[402,978,406,973,418,971,426,971,380,970,372,967,422,967,86,966,429,966,445,966,432,965,470,965,409,964,419,964,384,963,416,963,421,962,428,961,399,960,396,957],"cn-ly":[473,982,424,981,472,981,409,979,433,979,385,976,485,976,422,975,446,975,456,975,441,974,484,974,99,973,423,972,397,971,454,971,486,971,412,970,434,970,448,970],"cn-zy2":[422,994,429,986,406,985,424,984,408,979,421,979,91,976,426,975,445,975,473,975,87,974,384,974,436,974,441,973,423,972,430,972,448,972,484,971,472,970,410,969],"cn-xz2":[441,984,473,979,434,978,424,977,423,976,488,975,87,972,464,972,409,969,422,969,429,968,91,967,408,967,446,967,436,966,472,965,406,964,484,964,414,962,430,962],"cn-ha2":[412,980,490,980,414,976,453,976,447,975,433,973,485,973,89,972,385,970,448,970,454,969,456,967,413,964,77,963,425,963,415,962,78,961,85,960,469,960,408,959],"cn-bd":[414,981,447,981,411,980,490,980,485,979,433,975,453,975,385,973,472,972,434,971,456,971,89,970,408,970,454,970,493,970,423,969,448,969,85,968,469,968,487,967],"cn-ts":[417,972,385,971,415,970,448,970,458,968,396,966,397,965,485,965,379,964,411,964,457,964,486,963,432,962,85,961,455,961,456,961,77,960,433,960,453,960,382,959],"cn-ly2":[490,985,447,984,412,981,433,981,453,981,454,979,485,979,411,976,456,976,423,974,434,974,469,973,487,971,444,969,493,969,448,968,472,968,408,966,455,966,473,966],"cn-wf":[448,986,379,982,457,982,486,982,455,981,397,980,456,980,385,976,485,976,433,974,454,974,396,973,417,973,88,972,470,972,484,972,85,970,413,970,382,969,453,968],"cn-yt":[428,981,419,978,401,976,418,976,426,975,483,974,399,973,432,973,382,971,376,970,400,969,380,968,396,967,84,965,86,965,417,964,470,964,407,963,445,963,484,963],"cn-zb":[396,982,401,977,432,977,397,976,415,973,413,972,448,971,375,970,382,969,379,968,457,968,88,967,486,967,470,966,400,965,385,964,416,964,455,964,374,963,458,963],"cn-jh":[426,990,380,985,445,978,416,976,402,974,419,972,406,971,407,971,428,971,422,970,432,969,409,968,429,968,372,966,384,965,484,965,86,964,396,963,399,963,382,962],"cn-sx2":[428,992,399,989,416,978,376,974,432,974,367,972,380,972,400,972,401,972,418,972,426,971,84,968,370,968,375,968,86,967,368,967,483,966,407,964,372,963,396,963],"cn-yc3":[437,963,421,961,427,958,495,958,76,955,381,955,494,955,372,953,95,952,429,952,470,951,86,950,422,950,424,949,91,948,406,948,409,948,435,948,484,948,90,947],"cn-xy":[409,979,422,979,437,978,436,977,470,977,90,976,406,974,429,973,76,970,91,969,430,968,495,968,384,967,408,967,372,966,424,966,426,966,445,966,99,965,448,964],"cn-zz2":[409,994,406,986,429,986,424,985,421,979,91,977,408,975,441,975,384,974,426,974,87,973,436,973,445,973,473,972,470,971,418,970,410,969,430,969,448,969,484,968],"cn-hy":[488,984,473,983,424,982,441,982,387,978,434,977,464,977,410,976,435,976,491,976,497,976,414,974,443,973,408,972,409,972,430,970,440,970,468,970,490,970,493,970],"cn-yy":[422,985,473,985,409,984,423,982,441,982,408,981,488,981,429,978,410,977,436,977,91,976,406,976,435,976,472,976,464,975,433,972,437,972,469,972,87,971,387,971],"cn-dt":[453,977,78,975,490,969,472,968,486,968,447,967,433,966,456,966,485,966,393,964,412,964,414,964,434,964,79,963,411,963,446,963,454,963,487,963,389,962,469,962],"cn-tz":[418,990,445,982,380,980,406,975,409,975,416,975,422,974,484,972,407,971,419,971,382,970,402,970,428,970,432,970,429,968,396,966,421,966,448,966,470,966,415,965],"cn-ls2":[449,965,488,960,420,958,431,958,451,958,437,957,494,957,410,955,464,955,424,954,435,954,441,954,94,953,429,953,387,952,491,952,381,951,473,950,497,950,440,949],"cn-hz2":[419,992,399,988,416,981,401,974,376,973,432,973,400,972,418,971,367,970,426,970,483,970,375,968,368,967,380,967,396,966,86,965,84,963,370,963,398,961,407,961],"cn-zz3":[406,991,409,986,422,986,424,978,384,974,445,974,91,973,421,973,87,970,441,970,488,970,410,968,418,968,426,968,430,968,436,967,464,967,407,966,408,966,423,965],"cn-lz2":[387,977,436,976,435,974,409,972,488,971,406,970,423,970,422,969,424,969,473,969,421,968,429,968,464,967,491,967,87,965,93,965,497,965,437,964,467,963,410,962],"cn-gl":[451,981,491,981,387,976,452,976,488,976,497,976,93,973,440,972,467,972,468,972,489,972,94,971,435,971,464,970,438,968,439,968,423,967,471,966,450,964,460,964],"cn-wh2":[401,980,396,979,417,977,374,975,470,975,419,974,380,973,416,973,428,973,371,971,397,971,399,971,426,970,400,969,418,969,373,968,368,967,375,967,385,965,407,965],"cn-bb":[456,991,454,990,485,988,455,985,414,981,453,981,448,980,486,980,408,979,447,979,397,977,472,977,490,977,412,975,415,974,411,973,469,973,424,972,85,971,385,971],"cn-aq":[446,979,410,978,472,978,423,977,473,977,462,975,414,974,469,974,488,974,490,974,443,973,441,972,447,972,453,972,412,971,408,970,497,970,424,969,433,968,464,968],"cn-yb":[491,983,437,982,494,979,497,978,387,977,436,977,423,976,424,976,430,974,488,974,431,971,473,970,93,969,464,969,467,969,469,968,441,966,408,965,489,965,409,964],"cn-dy":[421,977,424,977,435,977,430,976,469,976,437,975,409,974,422,973,473,970,497,970,387,969,472,969,488,969,91,968,423,968,406,967,429,967,434,967,491,967,408,966],"cn-my":[435,982,421,978,436,975,424,972,381,968,408,967,409,967,473,967,76,966,422,966,491,966,469,965,91,964,387,964,430,964,472,964,488,964,494,964,497,964,388,963],"cn-nch":[439,987,471,987,492,986,489,984,497,984,491,979,496,977,460,976,452,975,442,973,451,973,467,973,493,973,465,971,387,968,431,968,443,967,463,967,423,964,435,964],"cn-dz":[438,987,489,986,471,983,492,983,460,980,491,980,452,979,467,979,465,978,497,978,496,977,463,975,451,970,387,968,431,968,93,966,461,966,96,964,442,964,450,964],"cn-gy2":[468,1000,464,981,451,977,452,976,488,974,387,973,431,972,443,971,489,971,497,971,423,970,460,970,467,970,491,969,450,967,441,965,442,965,93,964,438,962,439,962],"cn-jdz":[410,984,423,982,424,982,473,980,488,980,87,976,422,975,464,975,408,974,409,973,434,972,429,970,406,967,435,966,451,966,472,966,91,965,387,965,414,965,440,965],"cn-zj2":[443,981,462,977,471,975,438,973,492,969,489,968,423,967,497,966,440,965,463,965,468,965,439,964,460,964,487,963,491,963,464,962,434,961,451,961,493,961,387,960],"cn-mm":[442,981,462,977,464,975,497,974,423,973,434,973,491,972,440,971,468,971,387,970,488,969,438,967,489,967,414,964,467,964,471,964,424,963,460,963,490,963,439,962],"cn-st":[414,969,448,969,454,969,485,969,433,968,456,968,397,962,445,962,453,962,455,962,486,962,385,960,412,958,415,958,447,958,469,958,490,958,409,956,371,955,408,955],"cn-jm":[426,982,418,978,406,977,409,975,429,974,422,973,380,970,402,970,484,970,448,967,407,966,421,966,382,965,408,965,470,965,432,964,384,963,416,963,424,963,444,962],"cn-qhd":[472,985,434,979,486,979,484,978,485,976,408,975,473,973,99,971,459,971,424,970,456,970,81,969,433,969,385,967,409,967,410,967,415,967,454,967,462,967,382,966],"cn-cz2":[414,984,453,983,454,982,490,982,412,981,433,979,485,979,456,977,411,975,434,972,455,972,469,969,423,967,425,967,472,966,493,966,473,965,487,965,408,964,448,964],"cn-lf":[415,986,485,984,397,982,456,982,385,981,486,981,433,980,455,980,454,978,379,974,457,974,85,973,409,972,470,972,396,971,417,971,484,971,408,970,411,970,413,970],"cn-hs2":[427,965,94,963,410,962,451,962,431,959,488,959,464,957,441,954,450,953,434,952,440,952,468,952,391,951,424,949,473,949,429,948,462,948,387,947,446,947,469,947],"cn-mz":[460,983,452,978,451,973,440,967,463,967,468,967,471,967,489,967,461,966,431,964,439,964,492,964,438,961,464,960,496,959,488,958,497,958,487,956,423,955,442,955],"cn-sg":[452,983,431,981,488,979,440,977,468,977,464,976,497,975,489,974,438,973,450,973,491,973,460,972,439,970,467,970,93,969,387,969,423,969,471,968,94,967,441,966],"cn-qy":[489,986,451,983,460,981,439,979,450,978,431,976,440,976,468,976,438,975,467,973,471,972,491,972,497,972,463,970,464,970,387,968,461,968,488,968,465,967,492,966],"cn-hb2":[447,983,456,982,414,981,433,981,485,981,490,980,454,979,425,977,411,976,412,975,486,973,385,972,434,972,455,971,448,970,397,969,408,969,472,969,78,968,415,968],"cn-sq":[456,992,433,990,485,988,455,986,447,982,414,979,453,979,448,978,486,978,397,975,415,974,490,972,408,971,379,970,412,970,457,970,472,970,385,969,411,969,444,969],"cn-ha3":[456,988,454,986,397,985,433,985,379,982,457,982,485,982,486,982,415,981,448,980,447,972,453,971,484,971,385,970,396,970,458,970,408,968,472,967,414,966,85,965],"cn-lj":[454,992,433,991,485,989,455,988,486,985,397,983,448,982,453,982,415,980,447,977,414,976,408,975,484,974,379,973,457,973,472,973,385,972,412,971,490,971,446,970],"cn-yz2":[379,1000,415,982,455,982,396,975,448,974,456,973,397,972,458,972,454,970,470,969,486,969,417,968,433,968,85,967,485,967,88,966,385,966,401,966,413,964,382,963],"cn-dq":[379,972,457,972,455,970,413,968,415,968,397,966,456,964,486,964,417,963,396,962,433,962,485,962,385,961,448,961,454,961,481,961,386,960,453,960,78,958,425,958],"cn-hrb":[82,979,382,977,81,976,80,971,446,971,99,970,383,965,408,965,472,964,486,963,434,962,385,961,484,961,397,960,483,960,386,959,485,958,473,956,85,955,415,955],"cn-ly3":[450,983,489,982,452,981,439,980,471,979,463,978,492,977,438,976,497,973,451,972,467,971,491,971,440,970,468,970,423,969,496,969,488,968,465,967,464,965,431,964],"cn-ey":[466,976,500,971,463,970,501,969,452,968,465,967,439,966,450,966,496,964,467,961,431,960,489,960,471,959,460,958,451,957,438,956,96,954,440,954,468,954,492,953],"cn-bh":[442,977,443,977,434,975,464,973,423,969,488,969,387,968,472,968,446,967,414,965,424,965,469,965,441,963,473,963,410,962,471,962,408,961,436,961,490,961,433,960],"cn-yl":[496,979,460,978,471,978,489,977,439,975,452,970,461,970,465,970,492,970,438,967,450,967,442,965,467,965,466,962,475,962,440,961,468,961,387,960,497,960,249,959],"cn-zh2":[488,986,440,981,468,981,387,977,423,977,451,976,424,975,441,975,443,975,462,973,410,972,491,971,431,970,452,970,435,969,467,969,434,968,473,968,497,968,429,967],"cn-qj":[439,978,467,975,489,975,96,971,438,971,463,970,496,970,452,967,460,967,461,967,491,967,492,966,471,965,497,965,466,964,442,959,387,958,97,957,431,956,443,956],"cn-dl2":[500,989,501,985,461,976,465,964,463,962,496,958,475,955,439,953,97,952,96,950,476,950,489,950,452,949,467,948,450,947,460,947,477,945,471,944,438,941,431,940],"cn-zyt":[491,983,387,980,439,979,489,978,497,976,93,975,465,975,96,974,438,973,452,973,431,972,460,971,440,970,451,970,468,970,488,970,435,969,464,969,423,966,463,965],"cn-gs2":[440,1000,464,981,451,977,452,976,488,974,387,973,431,972,443,971,489,971,497,971,423,970,460,970,467,970,491,969,450,967,441,965,442,965,93,964,438,962,439,962],"cn-jz":[472,977,488,977,493,977,436,976,490,976,434,974,414,973,433,973,424,972,485,972,497,972,387,970,423,969,447,969,473,969,412,968,435,968,454,968,453,967,456,967],"cn-ez":[421,977,432,975,397,974,385,972,415,972,448,972,422,971,379,969,457,969,396,968,409,968,484,968,90,966,417,966,426,966,371,965,401,965,406,965,407,965,445,965],"cn-hg":[438,987,492,986,439,983,460,979,489,979,463,978,496,978,497,977,442,975,452,972,491,972,493,971,451,968,487,968,450,967,431,966,465,965,443,964,387,962,423,962],"cn-xf":[446,985,408,981,486,980,473,979,434,978,485,978,433,977,469,977,424,976,385,975,456,973,484,973,412,972,490,971,99,970,409,970,454,970,77,969,85,969,436,969],"cn-bj2":[424,985,423,983,408,982,441,980,410,979,472,979,434,977,488,976,409,975,446,973,91,972,422,972,435,970,436,970,430,969,469,969,387,968,464,968,87,967,437,967],"cn-yl2":[470,961,408,960,472,960,424,959,433,959,409,958,389,956,422,956,469,956,485,956,79,955,99,955,385,955,397,955,421,955,448,955,456,955,484,955,414,954,429,954],"cn-ts2":[476,978,496,971,477,969,463,962,471,962,492,962,439,955,465,955,466,955,487,955,438,954,501,953,100,951,460,951,461,951,248,948,307,948,442,948,479,948,489,948],"cn-ww":[477,982,475,978,100,963,496,963,479,953,463,950,466,950,492,950,439,949,471,949,501,948,438,947,465,947,487,946,252,944,311,944,489,944,103,942,461,942,500,942],"cn-zy3":[476,982,475,969,100,959,496,957,103,952,465,951,487,951,492,951,489,949,463,948,471,948,479,948,438,946,439,946,460,945,466,945,493,942,500,941,450,940,442,939],"cn-klmy":[481,953,386,946,458,944,482,944,397,938,394,936,455,935,389,934,60,931,486,931,373,930,374,930,379,929,390,929,413,929,457,929,284,928,343,928,371,928,396,928],"cn-aks":[480,970,476,953,252,950,311,950,245,949,248,949,304,949,307,949,161,948,475,948,477,948,162,947,253,946,312,946,163,940,250,939,309,939,49,938,228,938,246,931],"cn-ks":[479,970,49,952,228,952,246,951,305,951,245,950,304,950,250,946,309,946,253,944,312,944,244,943,303,943,252,939,311,939,162,936,248,935,307,935,161,932,254,932],"cn-bt":[386,971,389,965,379,963,455,963,457,963,79,962,397,962,458,961,470,959,393,957,415,957,78,955,390,954,456,954,474,954,425,953,478,953,486,953,373,952,433,952],"cn-erds":[478,944,373,931,481,931,389,930,386,927,400,927,374,924,371,923,397,923,368,922,401,922,474,921,432,919,458,919,376,917,470,917,486,917,398,916,483,915,363,914],"cn-wh3":[416,974,376,972,428,970,383,969,401,967,419,966,484,966,400,965,399,964,432,961,470,961,363,960,459,960,80,959,99,959,375,959,382,959,373,958,370,957,397,957],"cn-rz":[446,978,486,978,485,976,408,974,456,974,397,973,472,973,415,972,426,972,409,971,448,971,455,971,99,970,445,970,424,969,433,969,422,968,470,968,434,967,385,966],"cn-jn2":[456,989,433,988,454,988,486,985,448,984,397,983,455,982,453,981,412,979,414,979,447,979,385,978,472,978,408,976,415,976,446,976,484,976,490,974,411,973,469,972],"cn-ta":[397,985,456,985,485,985,415,982,455,982,448,981,433,980,472,980,446,979,454,978,484,978,453,973,386,972,385,971,408,971,379,969,457,969,425,968,490,968,417,967],"cn-yc4":[490,972,414,971,492,971,471,968,493,968,412,967,434,966,447,965,438,964,460,964,425,963,442,963,453,961,469,959,497,958,433,957,439,957,485,957,443,956,450,956],"cn-cz3":[464,986,423,984,424,981,387,980,441,980,451,979,469,977,491,977,431,976,473,976,497,976,410,975,434,974,435,974,440,974,468,974,93,971,94,971,430,971,429,970],"cn-ld":[439,986,452,986,438,984,460,982,497,982,491,980,471,979,467,978,463,977,387,975,465,975,492,975,451,974,431,972,496,972,440,971,468,971,442,968,443,967,450,967],"cn-xx":[414,985,447,982,411,980,412,980,453,980,433,977,469,976,434,974,485,974,454,972,487,972,456,971,472,971,423,970,425,969,486,968,493,968,89,963,443,963,448,963],"cn-ly4":[497,991,435,983,467,983,387,981,431,981,439,980,489,980,438,979,494,978,488,977,423,976,93,973,451,973,443,972,452,972,471,972,460,971,464,971,493,971,440,969],"cn-nc2":[438,986,471,986,439,983,460,977,493,976,489,975,496,974,497,974,487,971,463,970,442,969,491,967,451,966,452,966,465,966,450,964,467,964,469,963,475,962,443,960],"cn-zg":[497,978,469,977,492,976,438,973,471,971,491,971,412,970,423,970,414,969,434,968,487,968,490,968,436,966,447,966,453,965,435,964,451,964,467,964,489,964,387,963],"cn-ls3":[435,979,491,978,497,972,387,968,488,965,437,964,431,963,423,962,467,961,436,960,464,960,430,959,469,959,489,959,95,958,381,958,424,958,427,957,438,957,439,957],"cn-pzh":[76,968,421,968,437,963,422,961,470,961,406,959,86,958,409,958,420,958,430,958,407,957,90,956,381,956,91,955,384,955,426,954,435,953,436,953,372,952,380,952],"cn-gy3":[463,979,471,978,438,977,439,977,492,974,489,972,475,971,465,970,460,969,452,965,461,964,476,963,497,962,442,959,450,959,467,959,466,958,477,957,491,957,487,953],"cn-my2":[491,991,438,984,489,982,387,981,435,978,439,978,493,978,471,977,423,976,431,976,467,976,488,976,451,975,443,974,492,974,460,973,93,972,452,972,469,972,494,972],"cn-ab":[499,967,395,942,98,939,480,930,479,928,501,928,500,924,162,921,466,921,248,916,307,916,250,915,309,915,476,915,246,914,305,914,475,914,49,910,228,909,252,909],"cn-gz3":[498,967,98,927,395,926,501,926,500,921,466,919,250,914,300,914,309,914,359,914,246,911,254,911,305,911,313,911,480,909,162,907,299,904,358,904,479,904,248,901],"cn-lj2":[466,989,501,979,461,971,465,956,463,952,97,951,496,949,475,946,96,945,452,945,439,944,467,942,476,942,450,941,477,941,489,941,431,937,460,937,471,933,438,931],"cn-bs":[466,985,500,979,461,969,465,955,463,953,475,953,496,953,97,948,476,948,96,947,439,943,452,942,450,940,489,940,467,939,460,937,471,934,431,933,438,932,477,932]}}');
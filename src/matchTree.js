@@ -0,0 +1,2 @@
+// Generated by pipeline/match_tree.py from data.js. Do not edit.
+export const TREE = JSON.parse('{"count":502,"leafSize":8,"keys":["population","gdp","gdpPerCapita","area","urbanization","gini","hdi","internetPenetration","lifeExpectancy","co2PerCapita","universityCount","literacyRate","pisaScore","doctorsPer1000","hospitalBeds","healthExpenditure","manufacturingPct","exports","fdiInflow","forestCoverage","airQualityPM25","renewableEnergy","unemployment","inflation","rdExpenditure","militarySpending","populationDensity","medianAge","birthRate","deathRate"],"groups":[{"missing":[],"perm":[40,53,42,56,41,51,39,57,54,36,21,23,24,26,18,55,38,52,70,37,29,22,17,34,50,226,44,221,27,35,20,16,9,13,10,8,5,4,3,2,14,1,11,15,46,224,25,33,28,7,47,225,19,30,12,0]},{"missing":[12],"perm":[285,344,58,278,279,69,236,280,339,281,340,248,338,293,352,286,345,107,127,120,121,151,243,251,302,310,244,303,247,254,313,255,314,250,309,245,304,306,246,305,253,312,242,301,292,351,106,142,136,132,149,123,111,110,124,125,133,143,267,112,275,334,273,332,274,333,276,335,116,138,128,147,152,145,141,113,104,269,328,130,117,282,341,284,343,270,329,153,263,322,262,321,139,134,115,131,119,118,144,295,299,358,265,266,324,325,260,319,122,140,252,311,296,355,64,231,307,354,146,108,135,63,230,65,232,62,229,49,228,48,227,6,297,356,249,308,287,346,289,290,348,291,350,137,129,264,323,288,347,126,272,331,349,148,337,277,336,261,320,258,317,259,318,257,316,256,315,234,326,271,330,114,268,327,109,150]},{"missing":[12,18],"perm":[31,294,300,353,359]},{"missing":[12,19],"perm":[32]},{"missing":[18],"perm":[43]},{"missing":[25],"perm":[45,71,72]},{"missing":[12,24],"perm":[59,68,298,357]},{"missing":[5,12],"perm":[60]},{"missing":[5,18,19,21],"perm":[61]},{"missing":[24],"perm":[66]},{"missing":[12,18,24],"perm":[67]},{"missing":[12,25],"perm":[161,163,442,444,454,89,195,186,188,184,190,167,235,462,440,464,423,87,434,410,183,189,199,193,162,438,491,494,435,100,178,436,469,196,204,164,468,233,391,449,94,198,387,93,431,467,96,427,97,187,433,456,490,414,166,472,446,81,82,443,445,486,408,412,447,484,485,77,179,78,386,411,458,214,203,176,205,174,103,180,102,394,389,79,216,217,213,215,200,429,406,430,409,422,424,473,177,388,210,218,75,185,455,191,74,197,397,482,194,85,364,80,209,459,99,159,383,170,373,363,208,366,73,181,219,481,165,173,474,192,171,175,483,201,91,169,182,172,202,76,158,437,211,220,381,95,420,212,371,379,385,415,448,457,470,401,396,417,413,403,360,404,362,374,368,398,432,369,400,83,88,375,160,361,382,365,376,405,84,377,370,384,372,90,421,416,418,426,92,86,428,380,419,367,399,402,407,378]},{"missing":[12,17,18,25],"perm":[98,499,498,477,395,238,157,237,168,206,156,239,223,222,155,154,207]},{"missing":[12,18,25],"perm":[480,475,479,463,471,492,450,460,487,493,488,425,453,441,393,478,101,392,476,390,496,465,497,439,489,495,466,501,500,451,452,461]},{"missing":[12,26],"perm":[105]},{"missing":[3,12,17,18,25],"perm":[240]},{"missing":[3,12,25],"perm":[241]},{"missing":[12,18,19,21],"perm":[283,342]}]}');
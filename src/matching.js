@@ -1,11 +1,49 @@
 // Smart matching engine - runs entirely in browser
 import { REGIONS, INDICATOR_KEYS, MATCH_PRESETS } from './data';
+import { createSpatialIndex, nearest } from './kdtree';
+
+// Precomputed top-K preset rankings (pipeline/match_index.py), loaded after
+// first render. They index the full REGIONS, so they only apply once every
+// shard is loaded; until then, and for custom weights, findMatches scans
+let PRESET_INDEX = null;
+import('./matchIndex.js').then(index => {
+  PRESET_INDEX = index;
+}).catch(() => {});
+
+function indexedMatches(sourceId, preset, limit) {
+  if (!PRESET_INDEX || PRESET_INDEX.COUNT !== REGIONS.length || limit > PRESET_INDEX.K) return null;
+  const top = PRESET_INDEX.TOP[MATCH_PRESETS[preset] ? preset : 'comprehensive']?.[sourceId];
+  if (!top) return null;
+  const results = [];
+  for (let i = 0; i < top.length && results.length < limit; i += 2) {
+    results.push({ ...REGIONS[top[i]], score: top[i + 1] / 10 });
+  }
+  return results;
+}
 
-// Compute normalization params once (lazy)
+// KD-tree layout for custom weights (pipeline/match_tree.py), also loaded
+// after first render; node boxes are built on the first query that needs it
+let SPATIAL_TREE = null;
+let SPATIAL_INDEX = null;
+import('./matchTree.js').then(({ TREE }) => {
+  SPATIAL_TREE = TREE;
+}).catch(() => {});
+
+function spatialIndex() {
+  if (!SPATIAL_TREE || SPATIAL_TREE.count !== REGIONS.length) return null;
+  if (!SPATIAL_INDEX) {
+    SPATIAL_INDEX = createSpatialIndex(SPATIAL_TREE, REGIONS, computeNormParams());
+  }
+  return SPATIAL_INDEX;
+}
+
+// Compute normalization params once per REGIONS size (lazy; loading
+// shards grows REGIONS)
 let NORM_PARAMS = null;
+let NORM_PARAMS_COUNT = 0;
 
 function computeNormParams() {
-  if (NORM_PARAMS) return NORM_PARAMS;
+  if (NORM_PARAMS && NORM_PARAMS_COUNT === REGIONS.length) return NORM_PARAMS;
   const params = {};
   for (const key of INDICATOR_KEYS) {
     const values = REGIONS.map(r => r[key]).filter(v => v != null && !isNaN(v));
@@ -16,6 +54,7 @@ function computeNormParams() {
     }
   }
   NORM_PARAMS = params;
+  NORM_PARAMS_COUNT = REGIONS.length;
   return params;
 }
 
@@ -54,8 +93,20 @@ export function findMatches(sourceId, preset = 'comprehensive', customWeights =
   const source = REGIONS.find(r => r.id === sourceId);
   if (!source) return [];
 
+  if (!customWeights) {
+    const indexed = indexedMatches(sourceId, preset, limit);
+    if (indexed) return indexed;
+  }
+
   const weights = customWeights || MATCH_PRESETS[preset]?.weights || MATCH_PRESETS.comprehensive.weights;
 
+  const index = spatialIndex();
+  if (index) {
+    const sourceIdx = REGIONS.indexOf(source);
+    return nearest(index, sourceIdx, weights, limit, i => REGIONS[i].id === sourceId)
+      .map(({ i, score }) => ({ ...REGIONS[i], score }));
+  }
+
   const results = [];
   for (const region of REGIONS) {
     if (region.id === sourceId) continue;
@@ -5,7 +5,7 @@ import {
   RadarChart, PolarGrid, PolarAngleAxis, PolarRadiusAxis, Radar, Legend,
   ScatterChart, Scatter, XAxis, YAxis, ZAxis, Tooltip, Cell, ResponsiveContainer,
 } from 'recharts'
-import { REGIONS, INDICATORS, INDICATOR_KEYS, CHART_COLORS, MATCH_PRESETS, TYPE_STYLES, INDICATOR_CATEGORIES } from '../data'
+import { REGIONS, MANIFEST, INDICATORS, INDICATOR_KEYS, CHART_COLORS, MATCH_PRESETS, TYPE_STYLES, INDICATOR_CATEGORIES, loadShards, shardsLoaded } from '../data'
 import { findMatches, getRegion } from '../matching'
 import SearchInput from '../components/SearchInput'
 import IndicatorBar from '../components/IndicatorBar'
@@ -28,18 +28,24 @@ export default function Compare() {
   const [showWeights, setShowWeights] = useState(false)
   const [tab, setTab] = useState('bars')
   const [category, setCategory] = useState('all')
+  const [ready, setReady] = useState(shardsLoaded())
+
+  // Matching ranks every region, so Compare needs all shards
+  useEffect(() => {
+    loadShards().then(() => setReady(true))
+  }, [])
 
   const source = sourceId ? getRegion(sourceId) : null
   
   const matches = useMemo(() => {
-    if (!sourceId) return []
+    if (!sourceId || !ready) return []
     return findMatches(sourceId, preset, customWeights, 20)
-  }, [sourceId, preset, customWeights])
+  }, [sourceId, preset, customWeights, ready])
 
   const compareRegions = useMemo(() => {
     const ids = [sourceId, ...selectedIds].filter(Boolean)
     return ids.map(id => getRegion(id)).filter(Boolean)
-  }, [sourceId, selectedIds])
+  }, [sourceId, selectedIds, ready])
 
   const toggleSelected = (id) => {
     setSelectedIds(prev =>
@@ -72,7 +78,7 @@ export default function Compare() {
     REGIONS.map(r => ({
       name: r.name, x: r.gdpPerCapita, y: r.lifeExpectancy, z: r.population, id: r.id,
     })),
-  [])
+  [ready])
 
   const orderedIndicators = useMemo(() => {
     let keys = INDICATOR_KEYS;
@@ -97,7 +103,7 @@ export default function Compare() {
         <span className="text-xs tracking-[3px] text-indigo-400 font-bold uppercase">🍎 Apples to Apples</span>
         <div className="ml-auto flex items-center gap-3">
           <LanguageSwitcher />
-          <span className="text-xs text-slate-600">{t('compare.region_count', { count: REGIONS.length, indicators: Object.keys(INDICATORS).length })}</span>
+          <span className="text-xs text-slate-600">{t('compare.region_count', { count: MANIFEST.count, indicators: Object.keys(INDICATORS).length })}</span>
         </div>
       </div>
 
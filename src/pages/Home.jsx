@@ -3,7 +3,7 @@ import { useTranslation } from 'react-i18next'
 import { useNavigate } from 'react-router-dom'
 import SearchInput from '../components/SearchInput'
 import IndicatorBar from '../components/IndicatorBar'
-import { REGIONS, INDICATORS, INDICATOR_KEYS, SHOWCASE_GROUPS } from '../data'
+import { REGIONS, MANIFEST, INDICATORS, INDICATOR_KEYS, SHOWCASE_GROUPS, loadShards, shardsFor } from '../data'
 import LanguageSwitcher from '../components/LanguageSwitcher'
 
 export default function Home() {
@@ -14,6 +14,7 @@ export default function Home() {
   const [selectedIndicator, setSelectedIndicator] = useState('all')
   const [showcaseIdx, setShowcaseIdx] = useState(0)
   const [fade, setFade] = useState('in')
+  const [, setShardsLoaded] = useState(0)
 
   useEffect(() => {
     const timer = setInterval(() => {
@@ -27,6 +28,12 @@ export default function Home() {
   }, [])
 
   const currentGroup = SHOWCASE_GROUPS[showcaseIdx]
+
+  // Showcase regions are mostly subnational: pull in just their shards
+  useEffect(() => {
+    loadShards(shardsFor(currentGroup.ids)).then(() => setShardsLoaded(n => n + 1))
+  }, [showcaseIdx])
+
   const showcaseRegions = currentGroup.ids
     .map(id => REGIONS.find(r => r.id === id))
     .filter(Boolean)
@@ -40,10 +47,10 @@ export default function Home() {
   }
 
   const stats = {
-    regions: REGIONS.length,
-    countries: REGIONS.filter(r => r.type === 'country').length,
-    provinces: REGIONS.filter(r => r.type === 'province').length,
-    states: REGIONS.filter(r => r.type === 'state').length,
+    regions: MANIFEST.count,
+    countries: MANIFEST.types.country || 0,
+    provinces: MANIFEST.types.province || 0,
+    states: MANIFEST.types.state || 0,
     indicators: INDICATOR_KEYS.length,
   }
 
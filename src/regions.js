@@ -0,0 +1,48 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export const MANIFEST = JSON.parse('{"count":502,"types":{"country":125,"province":40,"state":166,"city":171},"shards":{"at":{"count":1,"bytes":900,"hash":"75790841cdddf768"},"au":{"count":11,"bytes":3035,"hash":"6d0b5f58f6ab3408"},"br":{"count":25,"bytes":6026,"hash":"0af836fc71f00795"},"ca":{"count":7,"bytes":2195,"hash":"a5dbc1d9bf86ea3c"},"cn":{"count":173,"bytes":36534,"hash":"5a9c2f82d9f216c4"},"cz":{"count":1,"bytes":895,"hash":"0c0780adae580207"},"de":{"count":16,"bytes":4134,"hash":"b0108f4f4040c88a"},"es":{"count":6,"bytes":1957,"hash":"89bef8d8b95f8ea9"},"fr":{"count":9,"bytes":2652,"hash":"e068fdd8d2dea1ff"},"gb":{"count":6,"bytes":1963,"hash":"c46dc17c79add9c4"},"hu":{"count":1,"bytes":896,"hash":"53acae1356ef64b3"},"in":{"count":31,"bytes":7201,"hash":"f48d58fdd761d55b"},"it":{"count":8,"bytes":2374,"hash":"cb6bc9e206762e37"},"jp":{"count":5,"bytes":1747,"hash":"f71ed06f80d0fc84"},"kr":{"count":9,"bytes":2550,"hash":"9d7aa509e29f0832"},"mx":{"count":11,"bytes":3020,"hash":"b80d28b22a1f23e5"},"nl":{"count":2,"bytes":1130,"hash":"90cfeab7506aff68"},"pl":{"count":1,"bytes":906,"hash":"6cdededbf7d3e8cf"},"ro":{"count":1,"bytes":897,"hash":"1bcc45af24cfddf9"},"ru":{"count":2,"bytes":1109,"hash":"b84960320980fe32"},"se":{"count":1,"bytes":909,"hash":"217df6f855f2f135"},"us":{"count":50,"bytes":11234,"hash":"5d24209d5c3798ee"}}}');
+
+export const CORE = JSON.parse('{"count":125,"positions":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,221,224,225,226,227,228,229,230,231,232,233,234,235,236,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359],"strings":{"id":["us","cn","jp","de","gb","fr","in","br","it","ca","kr","au","mx","es","id","nl","sa","tr","ch","pl","se","be","th","at","no","il","ie","sg","my","ph","vn","ng","eg","ar","za","dk","fi","nz","pt","cz","ro","gr","hu","ua","ru","ae","cl","co","pk","bd","pe","sk","bg","hr","si","lt","lv","ee","ir","iq","kw","qa","et","ke","gh","tz","ma","dz","ve","ec","uy","cr","pa","ru","cl","co","pe","pk","bd","et","ke","gh","tz","cr","uy","pa","ec","ae","qa","kw","jo","bg","hr","rs","lt","lv","ee","ma","tn","rw","sn","ci","lk","mm","kh","np","ae","qa","kw","jo","bg","hr","rs","lt","lv","ee","ma","tn","rw","sn","ci","lk","mm","kh","np"],"name":["United States","China","Japan","Germany","United Kingdom","France","India","Brazil","Italy","Canada","South Korea","Australia","Mexico","Spain","Indonesia","Netherlands","Saudi Arabia","Turkey","Switzerland","Poland","Sweden","Belgium","Thailand","Austria","Norway","Israel","Ireland","Singapore","Malaysia","Philippines","Vietnam","Nigeria","Egypt","Argentina","South Africa","Denmark","Finland","New Zealand","Portugal","Czech Republic","Romania","Greece","Hungary","Ukraine","Russia","UAE","Chile","Colombia","Pakistan","Bangladesh","Peru","Slovakia","Bulgaria","Croatia","Slovenia","Lithuania","Latvia","Estonia","Iran","Iraq","Kuwait","Qatar","Ethiopia","Kenya","Ghana","Tanzania","Morocco","Algeria","Venezuela","Ecuador","Uruguay","Costa Rica","Panama","Russia","Chile","Colombia","Peru","Pakistan","Bangladesh","Ethiopia","Kenya","Ghana","Tanzania","Costa Rica","Uruguay","Panama","Ecuador","UAE","Qatar","Kuwait","Jordan","Bulgaria","Croatia","Serbia","Lithuania","Latvia","Estonia","Morocco","Tunisia","Rwanda","Senegal","Côte dIvoire","Sri Lanka","Myanmar","Cambodia","Nepal","UAE","Qatar","Kuwait","Jordan","Bulgaria","Croatia","Serbia","Lithuania","Latvia","Estonia","Morocco","Tunisia","Rwanda","Senegal","Côte dIvoire","Sri Lanka","Myanmar","Cambodia","Nepal"],"type":["country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country","country"],"parent":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null],"flag":["🇺🇸","🇨🇳","🇯🇵","🇩🇪","🇬🇧","🇫🇷","🇮🇳","🇧🇷","🇮🇹","🇨🇦","🇰🇷","🇦🇺","🇲🇽","🇪🇸","🇮🇩","🇳🇱","🇸🇦","🇹🇷","🇨🇭","🇵🇱","🇸🇪","🇧🇪","🇹🇭","🇦🇹","🇳🇴","🇮🇱","🇮🇪","🇸🇬","🇲🇾","🇵🇭","🇻🇳","🇳🇬","🇪🇬","🇦🇷","🇿🇦","🇩🇰","🇫🇮","🇳🇿","🇵🇹","🇨🇿","🇷🇴","🇬🇷","🇭🇺","🇺🇦","🇷🇺","🇦🇪","🇨🇱","🇨🇴","🇵🇰","🇧🇩","🇵🇪","🇸🇰","🇧🇬","🇭🇷","🇸🇮","🇱🇹","🇱🇻","🇪🇪","🇮🇷","🇮🇶","🇰🇼","🇶🇦","🇪🇹","🇰🇪","🇬🇭","🇹🇿","🇲🇦","🇩🇿","🇻🇪","🇪🇨","🇺🇾","🇨🇷","🇵🇦","🇷🇺","🇨🇱","🇨🇴","🇵🇪","🇵🇰","🇧🇩","🇪🇹","🇰🇪","🇬🇭","🇹🇿","🇨🇷","🇺🇾","🇵🇦","🇪🇨","🇦🇪","🇶🇦","🇰🇼","🇯🇴","🇧🇬","🇭🇷","🇷🇸","🇱🇹","🇱🇻","🇪🇪","🇲🇦","🇹🇳","🇷🇼","🇸🇳","🇨🇮","🇱🇰","🇲🇲","🇰🇭","🇳🇵","🇦🇪","🇶🇦","🇰🇼","🇯🇴","🇧🇬","🇭🇷","🇷🇸","🇱🇹","🇱🇻","🇪🇪","🇲🇦","🇹🇳","🇷🇼","🇸🇳","🇨🇮","🇱🇰","🇲🇲","🇰🇭","🇳🇵"]},"columns":{"population":[336800000.0,1409000000.0,123900000.0,84800000.0,68400000.0,66099999.99999999,1441700000.0,212500000.0,59000000.0,41100000.0,51800000.0,27300000.0,132300000.00000001,48400000.0,281600000.0,17900000.0,33500000.0,85800000.0,8900000.0,36600000.0,10600000.0,11800000.0,70300000.0,9100000.0,5600000.0,9900000.0,5400000.0,5900000.0,33500000.0,113200000.0,100800000.0,227700000.0,107300000.0,47200000.0,63200000.0,6000000.0,5600000.0,5400000.0,10300000.0,10900000.0,18900000.0,10400000.0,9600000.0,33400000.0,146100000.0,11000000.0,20100000.0,52700000.0,235900000.0,172000000.0,34100000.0,5400000.0,6400000.0,3800000.0,2100000.0,2900000.0,1900000.0,1400000.0,86600000.0,44400000.0,5000000.0,3100000.0,107400000.0,52400000.0,33700000.0,65200000.0,37400000.0,46600000.0,26500000.0,18000000.0,3600000.0,5300000.0,4500000.0,146100000.0,20100000.0,52700000.0,34100000.0,235900000.0,172000000.0,107400000.0,52400000.0,33700000.0,65200000.0,5300000.0,3600000.0,4500000.0,18000000.0,11000000.0,3100000.0,5000000.0,11400000.0,6400000.0,3800000.0,6600000.0,2900000.0,1900000.0,1400000.0,37400000.0,12300000.0,13900000.0,18700000.0,32000000.0,22400000.0,54500000.0,17200000.0,31600000.0,11000000.0,3100000.0,5000000.0,11400000.0,6400000.0,3800000.0,6600000.0,2900000.0,1900000.0,1400000.0,37400000.0,12300000.0,13900000.0,18700000.0,32000000.0,22400000.0,54500000.0,17200000.0,31600000.0],"gdp":[29168000.0,18273000.0,4070000.0,4710000.0,3588000.0,3174000.0,3889000.0,2188000.0,2377000.0,2215000.0,1870000.0,1802000.0,1848000.0,1731000.0,1403000.0,1218000.0,1101000.0,1344000.0,942000.0,863000.0,609000.0,662000.0,529000.0,536000.0,504000.0,528000.0,561000.0,531000.0,440000.0,470000.0,468000.0,200000.0,380000.0,604000.0,403000.0,412000.0,306000.0,252000.0,303000.0,343000.0,381000.0,253000.0,229000.0,184000.0,2184000.0,545000.0,329000.0,417000.0,375000.0,451000.0,283000.0,143000.0,108000.0,90000.0,73000.0,83000.0,46000.0,43000.0,434000.0,264000.0,162000.0,221000.0,145000.0,116000.0,75000.0,80000.0,157000.0,260000.0,106000.0,121000.0,82000.0,95000.0,87000.0,2184000.0,329000.0,417000.0,283000.0,375000.0,451000.0,145000.0,116000.0,75000.0,80000.0,95000.0,82000.0,87000.0,121000.0,545000.0,221000.0,162000.0,53000.0,108000.0,90000.0,83000.0,83000.0,46000.0,43000.0,157000.0,53000.0,14000.0,34000.0,87000.0,75000.0,64000.0,47000.0,44000.0,545000.0,221000.0,162000.0,53000.0,108000.0,90000.0,83000.0,83000.0,46000.0,43000.0,157000.0,53000.0,14000.0,34000.0,87000.0,75000.0,64000.0,47000.0,44000.0],"gdpPerCapita":[86601.0,12969.0,32859.0,55521.0,52423.0,48012.0,2698.0,10296.0,40287.0,53834.0,36132.0,65966.0,13972.0,35789.0,4981.0,67984.0,32881.0,15666.0,106098.0,23563.0,57213.0,56129.0,7527.0,58669.0,90434.0,53111.0,103500.0,89370.0,13142.0,4154.0,4649.0,877.0,3542.0,12814.0,6377.0,69273.0,54774.0,47072.0,29341.0,31366.0,20089.0,24342.0,23881.0,5505.0,14953.0,49550.0,16365.0,7917.0,1588.0,2625.0,8316.0,26290.0,17069.0,23380.0,34544.0,28713.0,24223.0,31531.0,5013.0,5947.0,32290.0,71568.0,1350.0,2218.0,2232.0,1224.0,4204.0,5579.0,4019.0,6758.0,23053.0,17860.0,19369.0,14953.0,16365.0,7917.0,8316.0,1588.0,2625.0,1350.0,2218.0,2232.0,1224.0,17860.0,23053.0,19369.0,6758.0,49550.0,71568.0,32290.0,4682.0,17069.0,23380.0,12514.0,28713.0,24223.0,31531.0,4204.0,4267.0,986.0,1805.0,2720.0,3330.0,1179.0,2744.0,1381.0,49550.0,71568.0,32290.0,4682.0,17069.0,23380.0,12514.0,28713.0,24223.0,31531.0,4204.0,4267.0,986.0,1805.0,2720.0,3330.0,1179.0,2744.0,1381.0],"area":[9147000.0,9388000.0,364000.0,349000.0,242000.0,539000.0,2973000.0,8358000.0,296000.0,8789000.0,98000.0,7692000.0,1944000.0,500000.0,1893000.0,34000.0,2150000.0,770000.0,40000.0,306000.0,407000.0,30000.0,511000.0,83000.0,364000.0,22000.0,69000.0,1000.0,329000.0,298000.0,313000.0,911000.0,995000.0,2737000.0,1213000.0,40000.0,304000.0,263000.0,92000.0,77000.0,230000.0,129000.0,91000.0,579000.0,16377000.0,71000.0,743000.0,1110000.0,771000.0,130000.0,1280000.0,48000.0,109000.0,56000.0,20000.0,63000.0,62000.0,43000.0,1622000.0,434000.0,18000.0,11000.0,1128000.0,581000.0,228000.0,886000.0,446000.0,2382000.0,882000.0,248000.0,175000.0,51000.0,74000.0,16377000.0,743000.0,1110000.0,1280000.0,771000.0,130000.0,1128000.0,581000.0,228000.0,886000.0,51000.0,175000.0,74000.0,248000.0,71000.0,11000.0,18000.0,89000.0,109000.0,56000.0,84000.0,63000.0,62000.0,43000.0,446000.0,155000.0,25000.0,193000.0,318000.0,62000.0,653000.0,177000.0,143000.0,71000.0,11000.0,18000.0,89000.0,109000.0,56000.0,84000.0,63000.0,62000.0,43000.0,446000.0,155000.0,25000.0,193000.0,318000.0,62000.0,653000.0,177000.0,143000.0],"urbanization":[80.0,65.2,92.0,81.8,83.1,78.8,34.8,87.3,69.5,82.4,81.2,87.3,79.2,80.0,57.5,95.0,84.1,89.0,84.9,59.8,88.4,87.5,59.7,69.0,83.0,91.5,63.9,100.0,76.0,54.8,37.5,61.4,42.6,92.1,63.5,88.4,73.7,83.9,61.1,72.7,52.2,78.6,70.2,69.4,74.9,85.5,88.6,78.0,38.4,31.7,84.4,53.2,73.5,57.0,55.3,68.3,68.3,70.5,76.3,69.9,100.0,99.2,22.7,31.4,57.3,34.8,62.5,74.2,89.2,63.1,95.5,78.4,65.8,74.9,88.6,78.0,84.4,38.4,31.7,22.7,31.4,57.3,34.8,78.4,95.5,65.8,63.1,85.5,99.2,100.0,92.4,73.5,57.0,61.9,68.3,68.3,70.5,62.5,69.7,27.8,53.4,52.8,20.0,30.3,40.4,66.3,85.5,99.2,100.0,92.4,73.5,57.0,61.9,68.3,68.3,70.5,62.5,69.7,27.8,53.4,52.8,20.0,30.3,40.4,66.3],"gini":[41.7,36.0,32.3,32.4,32.4,31.2,25.5,52.0,33.7,31.1,32.9,33.8,43.5,33.6,35.5,25.7,45.9,44.5,33.8,28.9,31.6,26.4,34.3,30.9,26.9,37.9,29.9,45.9,40.7,39.3,36.1,33.9,28.5,40.7,63.0,29.3,27.9,36.0,36.3,25.9,32.3,33.4,30.6,25.6,33.9,32.5,43.0,54.8,29.6,30.9,40.3,24.1,38.2,30.0,24.3,36.6,33.7,32.3,34.8,29.8,null,null,31.1,37.7,43.5,40.5,39.5,27.6,44.8,45.5,40.6,47.2,48.9,33.9,43.0,54.8,40.3,29.6,30.9,31.1,37.7,43.5,40.5,47.2,40.6,48.9,45.5,32.5,41.1,39.5,33.7,38.2,30.0,32.8,36.6,33.7,32.3,39.5,33.7,39.4,36.2,35.3,39.8,30.7,36.1,30.0,32.5,41.1,39.5,33.7,38.2,30.0,32.8,36.6,33.7,32.3,39.5,33.7,39.4,36.2,35.3,39.8,30.7,36.1,30.0],"hdi":[0.927,0.788,0.92,0.95,0.94,0.91,0.644,0.76,0.906,0.935,0.929,0.946,0.781,0.911,0.713,0.946,0.875,0.855,0.967,0.881,0.952,0.942,0.803,0.926,0.966,0.915,0.95,0.949,0.807,0.71,0.726,0.548,0.728,0.849,0.717,0.952,0.942,0.939,0.874,0.895,0.827,0.893,0.851,0.734,0.821,0.937,0.86,0.758,0.54,0.67,0.762,0.855,0.799,0.878,0.926,0.879,0.879,0.899,0.78,0.673,0.847,0.875,0.492,0.601,0.602,0.532,0.698,0.745,0.699,0.765,0.83,0.806,0.82,0.821,0.86,0.758,0.762,0.54,0.67,0.492,0.601,0.602,0.532,0.806,0.83,0.82,0.765,0.937,0.875,0.847,0.736,0.799,0.878,0.805,0.879,0.879,0.899,0.698,0.732,0.548,0.517,0.534,0.78,0.608,0.6,0.601,0.937,0.875,0.847,0.736,0.799,0.878,0.805,0.879,0.879,0.899,0.698,0.732,0.548,0.517,0.534,0.78,0.608,0.6,0.601],"internetPenetration":[92.0,73.0,93.0,93.0,95.0,90.0,47.0,81.0,87.0,97.0,98.0,96.0,76.0,93.0,62.0,98.0,98.0,83.0,96.0,87.0,97.0,94.0,78.0,93.0,98.0,90.0,92.0,96.0,90.0,68.0,74.0,36.0,72.0,87.0,72.0,98.0,96.0,95.0,85.0,88.0,84.0,85.0,89.0,75.0,85.0,99.0,90.0,73.0,36.0,39.0,71.0,87.0,80.0,82.0,89.0,86.0,89.0,92.0,79.0,75.0,98.0,99.0,19.0,40.0,68.0,32.0,88.0,71.0,72.0,70.0,90.0,81.0,73.0,85.0,82.0,73.0,65.0,36.0,40.0,25.0,32.0,48.0,20.0,81.0,87.0,72.0,65.0,99.0,99.0,98.0,67.0,79.0,82.0,78.0,85.0,83.0,90.0,85.0,68.0,32.0,42.0,28.0,52.0,35.0,52.0,42.0,99.0,99.0,98.0,67.0,79.0,82.0,78.0,85.0,83.0,90.0,85.0,68.0,32.0,42.0,28.0,52.0,35.0,52.0,42.0],"lifeExpectancy":[79.3,78.0,84.7,81.4,81.3,83.3,72.0,75.8,83.7,82.6,84.3,83.9,75.1,83.7,71.1,82.2,78.7,77.2,84.0,78.6,83.3,82.1,76.4,82.0,83.3,82.4,82.4,83.7,76.7,69.8,74.6,54.5,71.6,77.4,66.1,81.9,81.9,82.1,82.4,79.8,75.9,81.9,77.0,73.4,73.2,82.9,81.2,77.7,67.6,74.7,77.7,78.3,75.6,78.6,81.6,76.0,76.2,79.2,77.7,72.3,80.4,82.4,67.3,63.6,65.5,67.0,75.3,76.3,72.5,77.4,78.1,80.8,79.6,73.2,81.2,77.7,77.7,67.6,74.7,67.3,63.6,65.5,67.0,80.8,78.1,79.6,77.4,82.9,82.4,80.4,77.8,75.6,78.6,76.8,76.0,76.2,79.2,75.3,76.5,67.8,68.7,61.9,77.5,66.9,70.7,70.4,82.9,82.4,80.4,77.8,75.6,78.6,76.8,76.0,76.2,79.2,75.3,76.5,67.8,68.7,61.9,77.5,66.9,70.7,70.4],"co2PerCapita":[14.4,8.0,8.5,7.9,5.2,4.5,1.9,2.2,5.3,14.3,11.6,15.0,3.6,5.0,2.3,8.3,16.6,5.1,4.0,8.1,3.6,8.1,3.6,6.9,7.5,6.2,7.3,8.9,8.0,1.3,3.5,0.6,2.3,3.9,6.7,4.9,6.7,6.8,4.0,8.5,3.5,5.0,4.6,3.6,12.1,20.8,4.3,1.8,1.0,0.6,1.8,5.5,5.1,3.8,5.8,4.2,3.6,7.2,8.5,4.8,21.6,32.4,0.2,0.4,0.6,0.2,1.8,3.7,3.5,2.3,2.0,1.7,2.9,11.8,4.5,1.8,1.8,0.9,0.5,0.2,0.4,0.6,0.2,1.8,2.1,2.8,2.3,20.8,32.5,25.2,2.5,5.8,4.2,5.5,4.2,3.5,8.5,1.8,2.8,0.1,0.6,0.4,1.2,0.5,0.5,0.5,20.8,32.5,25.2,2.5,5.8,4.2,5.5,4.2,3.5,8.5,1.8,2.8,0.1,0.6,0.4,1.2,0.5,0.5,0.5],"universityCount":[5300.0,2956.0,803.0,423.0,164.0,253.0,1113.0,302.0,98.0,223.0,430.0,43.0,965.0,87.0,4593.0,58.0,43.0,209.0,36.0,397.0,51.0,34.0,310.0,73.0,48.0,63.0,26.0,34.0,146.0,2180.0,445.0,270.0,82.0,131.0,26.0,32.0,38.0,8.0,49.0,72.0,91.0,40.0,66.0,289.0,724.0,78.0,61.0,372.0,228.0,162.0,143.0,37.0,52.0,32.0,8.0,22.0,25.0,19.0,590.0,38.0,15.0,12.0,51.0,74.0,77.0,58.0,96.0,106.0,65.0,62.0,18.0,64.0,43.0,1100.0,62.0,375.0,143.0,235.0,165.0,65.0,82.0,42.0,55.0,65.0,18.0,22.0,62.0,82.0,15.0,12.0,32.0,55.0,28.0,52.0,22.0,18.0,12.0,42.0,28.0,42.0,22.0,12.0,42.0,175.0,55.0,32.0,82.0,15.0,12.0,32.0,55.0,28.0,52.0,22.0,18.0,12.0,42.0,28.0,42.0,22.0,12.0,42.0,175.0,55.0,32.0],"literacyRate":[99.0,96.7,99.0,99.0,99.0,99.0,76.3,94.4,99.0,99.0,99.0,99.0,95.8,99.7,96.0,99.0,97.9,97.3,99.0,99.0,99.0,99.0,91.1,99.0,99.0,98.0,99.0,97.7,95.8,98.5,96.1,63.2,79.5,99.1,90.0,99.0,99.0,99.0,96.0,99.0,99.2,98.0,99.0,100.0,99.9,98.3,97.0,95.3,58.9,79.0,93.7,99.0,98.0,99.0,99.0,99.0,99.0,99.0,88.6,84.1,96.5,93.0,60.5,82.0,76.5,78.2,74.0,81.0,97.0,96.3,98.8,98.0,96.1,99.9,97.0,95.3,93.7,58.9,79.0,60.5,82.0,76.5,78.2,98.0,98.8,96.1,96.3,98.3,97.0,96.5,94.8,98.0,99.0,99.3,100.0,100.0,100.0,74.0,86.2,78.8,50.4,50.0,92.5,93.5,71.9,68.0,98.3,97.0,96.5,94.8,98.0,99.0,99.3,100.0,100.0,100.0,74.0,86.2,78.8,50.4,50.0,92.5,93.5,71.9,68.0],"pisaScore":[495.0,555.0,520.0,500.0,494.0,474.0,null,413.0,477.0,512.0,526.0,494.0,420.0,481.0,382.0,493.0,373.0,454.0,495.0,516.0,478.0,493.0,415.0,490.0,499.0,470.0,496.0,549.0,438.0,353.0,496.0,null,null,402.0,389.0,494.0,507.0,494.0,477.0,497.0,428.0,451.0,481.0,453.0,478.0,432.0,423.0,406.0,null,null,401.0,486.0,420.0,472.0,485.0,476.0,487.0,526.0,null,null,null,407.0,null,null,null,null,359.0,null,null,null,418.0,402.0,365.0,488.0,423.0,412.0,404.0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null],"doctorsPer1000":[3.7,3.1,2.6,4.5,3.1,3.3,0.7,2.4,4.2,2.8,2.6,4.1,2.6,4.3,0.7,3.9,3.5,2.2,4.5,3.4,4.4,3.6,0.5,5.4,4.9,3.7,3.4,2.8,2.3,0.8,1.1,0.4,0.7,5.4,0.8,4.5,3.6,3.6,5.9,4.4,3.6,6.6,3.5,3.5,5.1,2.9,3.2,2.5,1.2,0.7,1.6,3.7,4.3,3.9,3.4,4.5,3.4,3.5,1.8,1.0,2.3,3.0,0.1,0.2,0.1,0.1,0.7,1.7,1.2,2.3,4.7,2.7,1.6,5.1,3.2,2.5,1.6,1.2,0.7,0.1,0.2,0.1,0.1,2.7,4.7,1.6,2.3,2.9,3.0,2.3,2.9,4.3,3.9,3.1,4.5,3.4,3.5,0.7,1.3,0.1,0.1,0.2,1.1,0.7,0.2,1.0,2.9,3.0,2.3,2.9,4.3,3.9,3.1,4.5,3.4,3.5,0.7,1.3,0.1,0.1,0.2,1.1,0.7,0.2,1.0],"hospitalBeds":[2.7,5.4,12.6,7.6,2.4,5.7,1.6,2.5,3.1,2.5,12.8,3.8,1.0,2.9,1.4,2.4,2.4,3.0,4.4,6.0,1.9,5.5,2.4,6.7,3.4,3.1,2.9,2.8,1.9,1.0,2.6,0.5,1.1,3.4,2.3,2.5,2.6,2.6,3.5,6.5,7.2,4.3,6.6,6.1,6.8,1.9,1.9,1.7,0.6,1.0,1.6,5.7,8.0,5.8,4.1,5.7,5.0,4.2,1.6,1.3,2.3,1.2,0.3,1.4,0.9,0.8,0.7,1.9,1.0,1.3,2.5,1.1,2.1,6.8,1.9,1.7,1.6,0.6,1.0,0.3,1.4,0.9,0.8,1.1,2.5,2.1,1.3,1.9,1.2,2.3,1.4,8.0,5.8,5.8,5.7,5.0,4.2,0.7,1.8,0.7,0.3,0.4,3.9,1.1,0.8,0.5,1.9,1.2,2.3,1.4,8.0,5.8,5.8,5.7,5.0,4.2,0.7,1.8,0.7,0.3,0.4,3.9,1.1,0.8,0.5],"healthExpenditure":[16.5,5.9,12.3,12.4,11.1,11.8,3.4,9.4,8.9,11.1,8.9,9.9,5.7,9.7,2.7,10.0,5.3,3.7,11.6,6.5,10.9,10.7,5.4,11.2,7.9,7.1,6.0,4.3,3.9,5.2,4.5,4.2,4.7,10.2,8.7,9.5,9.7,10.6,10.5,8.5,5.8,8.4,6.6,8.2,6.9,4.6,10.0,7.6,2.9,2.2,6.1,7.7,7.6,7.3,9.6,7.2,8.1,6.9,5.6,4.3,4.2,2.2,2.9,4.3,3.7,3.1,5.8,3.6,4.6,7.6,8.9,7.2,9.0,6.9,10.0,7.6,6.1,2.9,2.2,2.9,4.3,3.7,3.1,7.2,8.9,9.0,7.6,4.6,2.2,4.2,7.7,7.6,7.3,8.6,7.2,8.1,6.9,5.8,7.5,5.9,4.0,3.6,4.0,4.5,4.5,6.5,4.6,2.2,4.2,7.7,7.6,7.3,8.6,7.2,8.1,6.9,5.8,7.5,5.9,4.0,3.6,4.0,4.5,4.5,6.5],"manufacturingPct":[10.7,26.4,19.8,18.3,8.0,9.3,13.1,13.1,15.4,9.3,26.5,5.3,21.5,11.0,18.3,10.3,15.1,21.8,18.1,17.7,13.7,12.5,27.0,16.7,4.9,12.2,37.1,19.7,23.3,17.2,24.8,9.1,16.0,16.4,12.4,12.8,15.8,8.9,12.5,19.4,13.8,9.7,16.8,7.6,13.2,8.5,9.5,11.1,13.8,21.8,12.4,17.4,15.2,12.3,19.9,16.4,12.0,12.0,22.2,2.2,7.9,9.3,4.2,7.7,11.5,8.2,16.0,10.2,11.0,12.9,10.5,14.1,5.1,13.2,9.5,11.1,12.4,13.8,21.8,4.2,7.7,11.5,8.2,14.1,10.5,5.1,12.9,8.5,9.3,7.9,17.1,15.2,12.3,14.8,16.4,12.0,12.0,16.0,15.6,9.9,15.6,12.8,19.7,25.6,27.1,4.8,8.5,9.3,7.9,17.1,15.2,12.3,14.8,16.4,12.0,12.0,16.0,15.6,9.9,15.6,12.8,19.7,25.6,27.1,4.8],"exports":[3017000.0,3718000.0,918000.0,1917000.0,1084000.0,1023000.0,778000.0,383000.0,739000.0,743000.0,815000.0,432000.0,630000.0,575000.0,323000.0,1009000.0,446000.0,353000.0,631000.0,434000.0,312000.0,558000.0,324000.0,291000.0,331000.0,165000.0,765000.0,947000.0,313000.0,115000.0,386000.0,65000.0,72000.0,103000.0,137000.0,283000.0,130000.0,60000.0,127000.0,219000.0,129000.0,107000.0,159000.0,57000.0,635000.0,522000.0,107000.0,70000.0,40000.0,59000.0,71000.0,115000.0,63000.0,42000.0,56000.0,62000.0,29000.0,33000.0,108000.0,128000.0,111000.0,162000.0,10000.0,18000.0,26000.0,12000.0,59000.0,69000.0,15000.0,36000.0,24000.0,29000.0,37000.0,635000.0,107000.0,70000.0,71000.0,40000.0,59000.0,10000.0,18000.0,26000.0,12000.0,29000.0,24000.0,37000.0,36000.0,522000.0,162000.0,111000.0,21000.0,63000.0,42000.0,41000.0,62000.0,29000.0,33000.0,59000.0,23000.0,3000.0,7000.0,17000.0,16000.0,12000.0,29000.0,3000.0,522000.0,162000.0,111000.0,21000.0,63000.0,42000.0,41000.0,62000.0,29000.0,33000.0,59000.0,23000.0,3000.0,7000.0,17000.0,16000.0,12000.0,29000.0,3000.0],"fdiInflow":[417000.0,190000.0,48000.0,87000.0,93000.0,112000.0,50000.0,76000.0,62000.0,50000.0,25000.0,69000.0,39000.0,67000.0,25000.0,15000.0,27000.0,14000.0,-12000.0,42000.0,54000.0,13000.0,12000.0,14000.0,14000.0,23000.0,-36000.0,150000.0,15000.0,9000.0,18000.0,null,11000.0,15000.0,9000.0,28000.0,13000.0,10000.0,13000.0,9000.0,11000.0,8000.0,-2000.0,null,-40000.0,23000.0,19000.0,17000.0,1000.0,2000.0,11000.0,5000.0,5000.0,4000.0,2000.0,2000.0,1000.0,2000.0,2000.0,-2000.0,1000.0,null,4000.0,1000.0,1000.0,1000.0,2000.0,null,2000.0,1000.0,9000.0,4000.0,2000.0,-40000.0,19000.0,17000.0,11000.0,1000.0,2000.0,4000.0,1000.0,1000.0,1000.0,4000.0,9000.0,2000.0,1000.0,23000.0,null,1000.0,1000.0,5000.0,4000.0,5000.0,2000.0,1000.0,2000.0,2000.0,1000.0,null,3000.0,2000.0,1000.0,1000.0,4000.0,null,23000.0,null,1000.0,1000.0,5000.0,4000.0,5000.0,2000.0,1000.0,2000.0,2000.0,1000.0,null,3000.0,2000.0,1000.0,1000.0,4000.0,null],"forestCoverage":[33.9,23.8,68.4,32.7,13.3,32.3,24.4,59.1,32.7,39.5,64.2,17.4,33.7,37.2,48.0,11.0,0.5,29.3,32.3,31.1,68.7,22.6,38.8,47.2,33.5,6.5,11.5,21.2,57.9,24.3,47.2,23.4,null,10.4,14.0,15.8,73.7,37.7,36.2,34.7,30.1,30.3,22.5,16.7,49.8,4.5,24.8,52.9,4.7,14.5,56.2,40.1,36.1,34.7,61.3,35.2,54.9,57.1,6.6,1.9,0.4,null,15.0,6.2,35.2,50.6,12.9,0.8,52.3,49.8,11.8,60.1,56.5,49.8,24.8,52.9,56.2,4.7,14.5,15.0,6.2,35.2,50.6,60.1,11.8,56.5,49.8,4.5,null,0.4,1.1,36.1,34.7,32.4,35.2,54.9,57.1,12.9,4.5,11.3,41.5,8.2,34.1,42.8,43.9,41.6,4.5,null,0.4,1.1,36.1,34.7,32.4,35.2,54.9,57.1,12.9,4.5,11.3,41.5,8.2,34.1,42.8,43.9,41.6],"airQualityPM25":[7.8,34.8,12.8,10.3,9.9,9.6,48.4,12.2,14.7,6.6,25.9,8.3,15.0,9.6,17.9,10.9,53.1,21.6,9.1,18.0,5.6,11.2,31.0,10.9,6.1,18.6,8.2,13.9,16.2,20.3,20.8,56.5,54.9,14.9,23.8,9.1,4.9,6.5,8.5,14.1,14.9,14.4,14.1,14.9,11.3,36.3,23.3,14.2,43.0,42.4,27.0,15.4,17.1,16.1,14.3,9.2,11.6,6.1,32.3,38.2,53.7,75.7,27.3,24.4,54.2,25.1,21.3,25.6,15.3,16.7,10.6,14.3,11.5,11.3,23.3,14.2,27.0,43.0,42.4,27.3,24.4,54.2,25.1,14.3,10.6,11.5,16.7,36.3,75.7,53.7,28.8,17.1,16.1,22.5,9.2,11.6,6.1,21.3,24.2,31.3,63.7,49.5,20.0,32.3,24.1,45.7,36.3,75.7,53.7,28.8,17.1,16.1,22.5,9.2,11.6,6.1,21.3,24.2,31.3,63.7,49.5,20.0,32.3,24.1,45.7],"renewableEnergy":[10.9,15.2,8.8,17.6,12.2,16.2,34.9,46.5,17.5,23.8,3.6,12.3,13.0,19.0,20.2,12.2,0.1,12.0,27.7,15.2,57.9,11.7,19.0,36.0,61.4,6.2,12.7,1.1,7.5,28.0,24.2,80.3,6.1,9.2,9.7,39.5,50.2,28.9,32.3,17.2,23.6,21.5,15.3,8.9,3.5,1.0,24.2,29.7,41.6,25.0,30.6,17.9,20.4,34.1,23.4,33.2,44.0,38.0,0.9,1.1,0.1,null,90.6,67.7,39.0,78.3,10.9,0.1,33.7,18.9,57.8,34.2,28.0,3.5,24.2,29.7,30.6,41.6,25.0,90.6,67.7,39.0,78.3,34.2,57.8,28.0,18.9,1.0,null,0.1,11.5,20.4,34.1,27.2,33.2,44.0,38.0,10.9,11.6,79.9,35.4,58.2,48.8,62.9,52.4,73.7,1.0,null,0.1,11.5,20.4,34.1,27.2,33.2,44.0,38.0,10.9,11.6,79.9,35.4,58.2,48.8,62.9,52.4,73.7],"unemployment":[4.1,5.1,2.5,3.4,4.3,7.4,4.8,7.2,7.0,6.2,2.9,4.2,3.0,11.6,5.2,3.9,3.8,9.3,2.4,3.2,8.5,5.7,1.1,5.6,4.3,3.1,4.4,1.9,3.5,4.4,2.1,3.8,7.2,8.2,33.7,2.9,8.3,5.1,6.5,2.8,5.6,10.5,4.4,14.2,2.6,2.9,8.5,10.2,8.0,4.6,6.8,5.6,4.3,5.6,3.5,7.3,6.7,7.5,8.0,15.4,2.1,0.1,3.4,5.6,2.9,1.6,13.4,12.4,5.6,4.2,8.4,8.3,8.4,2.6,8.5,10.2,6.8,8.0,4.6,3.4,5.6,2.9,1.6,8.3,8.4,8.4,4.2,2.9,0.1,2.1,22.0,4.3,5.6,9.1,7.3,6.7,7.5,13.4,16.4,15.1,2.8,2.3,5.2,3.1,0.2,10.7,2.9,0.1,2.1,22.0,4.3,5.6,9.1,7.3,6.7,7.5,13.4,16.4,15.1,2.8,2.3,5.2,3.1,0.2,10.7],"inflation":[3.0,0.4,2.2,2.4,2.6,2.3,4.4,4.3,1.3,2.4,2.5,3.3,4.7,2.8,2.5,3.2,1.7,60.9,1.3,3.9,2.0,4.3,0.5,3.0,3.3,3.1,1.7,2.6,2.8,3.3,4.1,32.5,33.3,229.8,4.7,1.8,1.2,2.7,2.5,2.3,5.3,2.9,3.8,5.8,7.9,2.3,3.9,6.7,23.4,9.7,2.5,2.8,2.8,4.0,2.0,0.9,1.4,3.4,31.7,3.2,3.0,1.0,23.9,5.1,19.5,3.2,1.7,5.3,59.6,1.9,4.9,-0.3,1.3,7.9,3.9,6.7,2.5,23.4,9.7,23.9,5.1,19.5,3.2,-0.3,4.9,1.3,1.9,2.3,1.0,3.0,2.1,2.8,4.0,4.5,0.9,1.4,3.4,1.7,7.1,4.9,1.5,3.8,45.2,22.0,0.7,5.6,2.3,1.0,3.0,2.1,2.8,4.0,4.5,0.9,1.4,3.4,1.7,7.1,4.9,1.5,3.8,45.2,22.0,0.7,5.6],"rdExpenditure":[3.6,2.6,3.4,3.1,2.9,2.2,0.6,1.1,1.4,1.7,5.2,1.9,0.3,1.4,0.3,2.3,0.5,1.3,3.3,1.5,3.4,3.4,1.2,3.2,1.6,6.0,1.0,2.2,1.0,0.3,0.4,0.1,1.0,0.5,0.6,2.9,3.0,1.5,1.7,2.0,0.5,1.5,1.4,0.3,0.9,1.5,0.4,0.3,0.2,0.3,0.2,1.0,0.8,1.4,2.1,1.1,0.8,1.8,0.7,null,0.1,0.7,0.3,0.4,0.4,0.5,null,null,null,0.3,0.6,0.3,0.2,0.9,0.4,0.3,0.2,0.2,0.3,0.3,0.4,0.4,0.5,0.3,0.6,0.2,0.3,1.5,0.7,0.1,0.3,0.8,1.4,1.0,1.1,0.8,1.8,0.2,0.4,0.8,0.1,0.1,0.1,null,0.1,0.2,1.5,0.7,0.1,0.3,0.8,1.4,1.0,1.1,0.8,1.8,0.2,0.4,0.8,0.1,0.1,0.1,null,0.1,0.2],"militarySpending":[3.3,1.6,1.0,1.4,2.1,2.0,2.4,1.1,1.7,1.2,2.6,1.9,0.7,1.4,0.8,1.3,6.4,1.7,0.7,2.2,1.3,1.2,1.2,0.8,1.5,4.4,0.2,2.4,0.9,1.3,2.3,0.7,1.0,0.7,0.8,1.4,1.6,1.2,1.4,1.3,1.8,4.0,1.8,25.6,4.6,null,1.5,2.8,3.2,1.0,1.1,1.8,1.6,1.8,1.3,2.4,2.3,2.1,2.1,1.6,4.5,6.5,1.5,1.0,0.3,1.2,3.8,4.1,0.6,2.2,2.0,null,null,4.6,1.5,2.8,1.1,3.2,1.0,1.5,1.0,0.3,1.2,null,2.0,null,2.2,3.8,6.5,4.5,4.8,1.6,1.8,2.2,2.4,2.3,2.1,3.8,2.6,1.3,1.5,0.9,1.3,4.2,1.5,1.2,3.8,6.5,4.5,4.8,1.6,1.8,2.2,2.4,2.3,2.1,3.8,2.6,1.3,1.5,0.9,1.3,4.2,1.5,1.2],"populationDensity":[38.0,148.0,330.0,243.0,283.0,120.0,484.0,25.0,201.0,4.0,523.0,3.0,66.0,95.0,147.0,537.0,16.0,113.0,222.0,127.0,26.0,387.0,140.0,111.0,18.0,428.0,76.0,8476.0,107.0,383.0,320.0,250.0,115.0,16.0,52.0,140.0,18.0,20.0,113.0,140.0,83.0,78.0,107.0,65.0,9.0,150.0,26.0,47.0,321.0,1317.0,26.0,112.0,63.0,70.0,105.0,46.0,30.0,32.0,56.0,104.0,272.0,257.0,129.0,95.0,148.0,75.0,84.0,19.0,31.0,72.0,20.0,100.0,60.0,9.0,26.0,47.0,26.0,321.0,1317.0,129.0,95.0,148.0,75.0,100.0,20.0,60.0,72.0,150.0,257.0,272.0,129.0,63.0,70.0,88.0,46.0,30.0,32.0,84.0,78.0,576.0,94.0,98.0,366.0,83.0,96.0,202.0,150.0,257.0,272.0,129.0,63.0,70.0,88.0,46.0,30.0,32.0,84.0,78.0,576.0,94.0,98.0,366.0,83.0,96.0,202.0],"medianAge":[38.0,39.1,49.0,45.1,39.8,41.8,28.1,33.9,47.5,40.3,44.5,37.8,28.9,44.9,29.8,41.4,29.2,32.5,42.3,41.3,39.9,41.4,39.7,43.1,39.5,29.1,38.4,35.1,30.1,25.3,32.4,17.8,24.0,32.1,28.2,41.2,42.8,37.3,46.2,42.7,42.6,45.7,43.3,42.0,39.5,31.2,36.0,31.6,20.3,25.3,29.5,41.3,44.3,44.8,43.9,42.1,43.1,41.9,32.9,20.3,34.5,33.2,18.7,19.5,20.9,17.2,29.2,28.2,29.0,28.4,35.8,34.1,29.6,39.5,36.0,31.6,29.5,20.3,25.3,18.7,19.5,20.9,17.2,34.1,35.8,29.6,28.4,31.2,33.2,34.5,24.3,44.3,44.8,43.9,42.1,43.1,41.9,29.2,32.1,19.4,19.1,18.1,32.8,29.5,25.8,24.7,31.2,33.2,34.5,24.3,44.3,44.8,43.9,42.1,43.1,41.9,29.2,32.1,19.4,19.1,18.1,32.8,29.5,25.8,24.7],"birthRate":[11.0,6.8,6.3,8.8,10.1,10.7,16.3,12.6,6.7,9.0,4.9,11.6,16.0,6.9,16.2,9.5,15.2,12.2,9.4,8.3,10.0,9.8,8.4,9.1,9.4,19.0,10.4,7.9,12.4,16.1,14.3,33.2,21.1,10.9,19.1,9.9,8.1,11.5,8.0,9.5,9.4,7.3,9.3,5.7,8.9,9.3,9.7,13.7,28.1,20.6,16.2,9.7,8.8,8.8,8.3,7.8,8.5,8.6,13.3,26.0,10.8,10.1,32.4,27.3,26.6,35.6,17.0,20.5,15.0,15.4,10.0,10.3,16.2,8.9,9.7,13.7,16.2,28.1,20.6,32.4,27.3,26.6,35.6,10.3,10.0,16.2,15.4,9.3,10.1,10.8,20.9,8.8,8.8,9.3,7.8,8.5,8.6,17.0,14.1,28.9,29.5,32.5,12.4,16.9,21.3,19.6,9.3,10.1,10.8,20.9,8.8,8.8,9.3,7.8,8.5,8.6,17.0,14.1,28.9,29.5,32.5,12.4,16.9,21.3,19.6],"deathRate":[9.8,7.4,12.9,12.7,9.5,9.9,6.6,7.5,12.1,8.6,7.3,7.3,6.5,9.7,7.5,9.6,2.6,5.9,8.5,12.2,9.0,10.0,9.2,10.3,8.4,5.4,6.7,6.3,5.5,6.3,6.5,12.0,5.7,8.8,9.4,10.1,11.4,7.5,11.9,11.3,14.3,13.4,14.2,14.2,12.9,1.2,7.6,5.9,6.5,5.0,6.4,11.0,18.4,14.8,10.6,15.1,16.4,12.8,4.9,4.2,1.8,0.9,6.1,7.2,7.1,5.8,5.6,4.6,7.3,5.4,10.8,6.1,4.8,12.9,7.6,5.9,6.4,6.5,5.0,6.1,7.2,7.1,5.8,6.1,10.8,4.8,5.4,1.2,0.9,1.8,3.2,18.4,14.8,16.3,15.1,16.4,12.8,5.6,6.2,6.0,5.9,7.8,8.1,9.2,6.3,6.9,1.2,0.9,1.8,3.2,18.4,14.8,16.3,15.1,16.4,12.8,5.6,6.2,6.0,5.9,7.8,8.1,9.2,6.3,6.9]}}');
+
+export function hydrateRegions({ count, strings: s, columns: c }) {
+  const regions = new Array(count);
+  for (let i = 0; i < count; i++) {
+    regions[i] = {
+      id: s.id[i],
+      name: s.name[i],
+      type: s.type[i],
+      parent: s.parent[i],
+      flag: s.flag[i],
+      population: c.population[i],
+      gdp: c.gdp[i],
+      gdpPerCapita: c.gdpPerCapita[i],
+      area: c.area[i],
+      urbanization: c.urbanization[i],
+      gini: c.gini[i],
+      hdi: c.hdi[i],
+      internetPenetration: c.internetPenetration[i],
+      lifeExpectancy: c.lifeExpectancy[i],
+      co2PerCapita: c.co2PerCapita[i],
+      universityCount: c.universityCount[i],
+      literacyRate: c.literacyRate[i],
+      pisaScore: c.pisaScore[i],
+      doctorsPer1000: c.doctorsPer1000[i],
+      hospitalBeds: c.hospitalBeds[i],
+      healthExpenditure: c.healthExpenditure[i],
+      manufacturingPct: c.manufacturingPct[i],
+      exports: c.exports[i],
+      fdiInflow: c.fdiInflow[i],
+      forestCoverage: c.forestCoverage[i],
+      airQualityPM25: c.airQualityPM25[i],
+      renewableEnergy: c.renewableEnergy[i],
+      unemployment: c.unemployment[i],
+      inflation: c.inflation[i],
+      rdExpenditure: c.rdExpenditure[i],
+      militarySpending: c.militarySpending[i],
+      populationDensity: c.populationDensity[i],
+      medianAge: c.medianAge[i],
+      birthRate: c.birthRate[i],
+      deathRate: c.deathRate[i],
+    };
+  }
+  return regions;
+}
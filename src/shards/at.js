@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":1,"positions":[241],"strings":{"id":["at-vi"],"name":["Vienna"],"type":["city"],"parent":["at"],"flag":["🇦🇹"]},"columns":{"population":[2000000.0],"gdp":[128000.0],"gdpPerCapita":[66542.0],"area":[null],"urbanization":[100.0],"gini":[30.2],"hdi":[0.942],"internetPenetration":[96.0],"lifeExpectancy":[81.5],"co2PerCapita":[5.2],"universityCount":[18.0],"literacyRate":[99.0],"pisaScore":[null],"doctorsPer1000":[5.5],"hospitalBeds":[7.5],"healthExpenditure":[12.0],"manufacturingPct":[8.5],"exports":[25000.0],"fdiInflow":[12000.0],"forestCoverage":[21.5],"airQualityPM25":[12.8],"renewableEnergy":[38.0],"unemployment":[8.5],"inflation":[7.5],"rdExpenditure":[3.8],"militarySpending":[null],"populationDensity":[4600.0],"medianAge":[41.5],"birthRate":[10.8],"deathRate":[9.5]}}');
@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":11,"positions":[165,268,269,270,271,272,327,328,329,330,331],"strings":{"id":["au-nsw","au-vc","au-ql","au-wa","au-sa","au-ts","au-vc","au-ql","au-wa","au-sa","au-ts"],"name":["New South Wales","Victoria","Queensland","Western Australia","South Australia","Tasmania","Victoria","Queensland","Western Australia","South Australia","Tasmania"],"type":["state","state","state","state","state","state","state","state","state","state","state"],"parent":["au","au","au","au","au","au","au","au","au","au","au"],"flag":["🇦🇺","🇦🇺","🇦🇺","🇦🇺","🇦🇺","🇦🇺","🇦🇺","🇦🇺","🇦🇺","🇦🇺","🇦🇺"]},"columns":{"population":[8000000.0,7000000.0,5000000.0,3000000.0,2000000.0,1000000.0,7000000.0,5000000.0,3000000.0,2000000.0,1000000.0],"gdp":[620000.0,480000.0,380000.0,320000.0,125000.0,38000.0,480000.0,380000.0,320000.0,125000.0,38000.0],"gdpPerCapita":[74759.0,70142.0,70542.0,118542.0,67542.0,54542.0,70142.0,70542.0,118542.0,67542.0,54542.0],"area":[801000.0,228000.0,1853000.0,2530000.0,984000.0,68000.0,228000.0,1853000.0,2530000.0,984000.0,68000.0],"urbanization":[87.0,90.0,88.0,88.0,89.0,72.0,90.0,88.0,88.0,89.0,72.0],"gini":[33.8,33.2,34.5,33.8,32.5,32.2,33.2,34.5,33.8,32.5,32.2],"hdi":[0.952,0.948,0.942,0.948,0.94,0.928,0.948,0.942,0.948,0.94,0.928],"internetPenetration":[96.0,96.0,95.0,96.0,94.0,92.0,96.0,95.0,96.0,94.0,92.0],"lifeExpectancy":[83.5,83.2,83.0,82.8,82.5,82.0,83.2,83.0,82.8,82.5,82.0],"co2PerCapita":[14.0,12.5,15.5,48.5,10.8,8.5,12.5,15.5,48.5,10.8,8.5],"universityCount":[12.0,12.0,8.0,5.0,5.0,2.0,12.0,8.0,5.0,5.0,2.0],"literacyRate":[99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0],"pisaScore":[null,null,null,null,null,null,null,null,null,null,null],"doctorsPer1000":[4.0,4.0,3.5,3.2,3.8,3.2,4.0,3.5,3.2,3.8,3.2],"hospitalBeds":[3.8,3.5,3.5,3.2,4.0,3.5,3.5,3.5,3.2,4.0,3.5],"healthExpenditure":[11.0,10.8,10.5,10.2,10.5,10.8,10.8,10.5,10.2,10.5,10.8],"manufacturingPct":[5.2,8.5,6.2,8.5,8.2,5.8,8.5,6.2,8.5,8.2,5.8],"exports":[48000.0,42000.0,85000.0,185000.0,18000.0,3000.0,42000.0,85000.0,185000.0,18000.0,3000.0],"fdiInflow":[18000.0,15000.0,12000.0,15000.0,5000.0,1000.0,15000.0,12000.0,15000.0,5000.0,1000.0],"forestCoverage":[20.5,24.8,12.5,7.8,18.5,49.5,24.8,12.5,7.8,18.5,49.5],"airQualityPM25":[8.2,7.5,6.8,5.2,6.5,5.5,7.5,6.8,5.2,6.5,5.5],"renewableEnergy":[28.0,25.0,18.0,12.0,55.0,88.0,25.0,18.0,12.0,55.0,88.0],"unemployment":[3.5,5.8,5.2,4.8,5.5,6.2,5.8,5.2,4.8,5.5,6.2],"inflation":[5.5,3.2,3.5,3.2,3.2,3.5,3.2,3.5,3.2,3.2,3.5],"rdExpenditure":[2.0,2.2,2.0,2.5,1.8,1.5,2.2,2.0,2.5,1.8,1.5],"militarySpending":[null,1.2,1.2,1.2,1.2,1.2,1.2,1.2,1.2,1.2,1.2],"populationDensity":[10.0,31.0,3.0,1.0,2.0,8.0,31.0,3.0,1.0,2.0,8.0],"medianAge":[38.5,37.2,36.8,36.5,38.2,40.2,37.2,36.8,36.5,38.2,40.2],"birthRate":[11.2,11.5,12.2,12.5,11.2,10.8,11.5,12.2,12.5,11.2,10.8],"deathRate":[6.8,6.8,6.5,6.2,7.2,7.8,6.8,6.5,6.2,7.2,7.8]}}');
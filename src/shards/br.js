@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":25,"positions":[164,256,257,258,259,260,261,262,263,264,265,266,267,315,316,317,318,319,320,321,322,323,324,325,326],"strings":{"id":["br-sp","br-rj","br-mg","br-rs","br-pr","br-ba","br-sc","br-pe","br-ce","br-go","br-pa","br-am","br-df","br-rj","br-mg","br-rs","br-pr","br-ba","br-sc","br-pe","br-ce","br-go","br-pa","br-am","br-df"],"name":["São Paulo State","Rio de Janeiro State","Minas Gerais","Rio Grande do Sul","Paraná","Bahia","Santa Catarina","Pernambuco","Ceará","Goiás","Pará","Amazonas","Federal District (Brasília)","Rio de Janeiro State","Minas Gerais","Rio Grande do Sul","Paraná","Bahia","Santa Catarina","Pernambuco","Ceará","Goiás","Pará","Amazonas","Federal District (Brasília)"],"type":["state","state","state","state","state","state","state","state","state","state","state","state","city","state","state","state","state","state","state","state","state","state","state","state","city"],"parent":["br","br","br","br","br","br","br","br","br","br","br","br","br","br","br","br","br","br","br","br","br","br","br","br","br"],"flag":["🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷","🇧🇷"]},"columns":{"population":[46000000.0,17000000.0,21000000.0,11000000.0,12000000.0,15000000.0,8000000.0,10000000.0,9000000.0,7000000.0,9000000.0,4000000.0,3000000.0,17000000.0,21000000.0,11000000.0,12000000.0,15000000.0,8000000.0,10000000.0,9000000.0,7000000.0,9000000.0,4000000.0,3000000.0],"gdp":[680000.0,310000.0,250000.0,165000.0,175000.0,130000.0,135000.0,82000.0,68000.0,95000.0,65000.0,42000.0,85000.0,310000.0,250000.0,165000.0,175000.0,130000.0,135000.0,82000.0,68000.0,95000.0,65000.0,42000.0,85000.0],"gdpPerCapita":[14692.0,18118.0,11842.0,14682.0,15042.0,8542.0,17342.0,8342.0,7342.0,12842.0,7042.0,9842.0,28182.0,18118.0,11842.0,14682.0,15042.0,8542.0,17342.0,8342.0,7342.0,12842.0,7042.0,9842.0,28182.0],"area":[248000.0,44000.0,587000.0,282000.0,200000.0,565000.0,95000.0,98000.0,149000.0,340000.0,1248000.0,1559000.0,6000.0,44000.0,587000.0,282000.0,200000.0,565000.0,95000.0,98000.0,149000.0,340000.0,1248000.0,1559000.0,6000.0],"urbanization":[96.0,97.0,88.0,86.0,88.0,74.0,86.0,82.0,78.0,74.0,68.0,62.0,97.0,97.0,88.0,86.0,88.0,74.0,86.0,82.0,78.0,74.0,68.0,62.0,97.0],"gini":[46.2,49.8,44.5,46.2,44.2,50.5,42.5,49.2,50.2,44.8,48.5,49.2,45.8,49.8,44.5,46.2,44.2,50.5,42.5,49.2,50.2,44.8,48.5,49.2,45.8],"hdi":[0.826,0.798,0.788,0.805,0.802,0.718,0.818,0.728,0.712,0.768,0.698,0.698,0.852,0.798,0.788,0.805,0.802,0.718,0.818,0.728,0.712,0.768,0.698,0.698,0.852],"internetPenetration":[85.0,82.0,78.0,82.0,80.0,62.0,84.0,65.0,62.0,72.0,55.0,55.0,88.0,82.0,78.0,82.0,80.0,62.0,84.0,65.0,62.0,72.0,55.0,55.0,88.0],"lifeExpectancy":[77.8,76.5,76.2,77.8,77.5,74.2,78.8,74.8,74.5,75.5,73.2,73.5,78.5,76.5,76.2,77.8,77.5,74.2,78.8,74.8,74.5,75.5,73.2,73.5,78.5],"co2PerCapita":[2.5,2.8,2.2,2.5,2.2,1.5,2.0,1.5,1.2,2.5,1.5,1.8,2.2,2.8,2.2,2.5,2.2,1.5,2.0,1.5,1.2,2.5,1.5,1.8,2.2],"universityCount":[68.0,42.0,52.0,28.0,32.0,28.0,28.0,22.0,22.0,22.0,18.0,12.0,28.0,42.0,52.0,28.0,32.0,28.0,28.0,22.0,22.0,22.0,18.0,12.0,28.0],"literacyRate":[96.0,97.0,94.0,96.0,95.0,88.0,97.0,88.0,86.0,93.0,88.0,85.0,97.0,97.0,94.0,96.0,95.0,88.0,97.0,88.0,86.0,93.0,88.0,85.0,97.0],"pisaScore":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null],"doctorsPer1000":[2.8,2.5,2.2,2.5,2.2,1.5,2.2,1.5,1.2,1.8,1.0,1.0,3.2,2.5,2.2,2.5,2.2,1.5,2.2,1.5,1.2,1.8,1.0,1.0,3.2],"hospitalBeds":[2.2,2.5,2.0,2.2,2.0,1.5,2.2,1.5,1.2,2.0,1.2,1.0,2.5,2.5,2.0,2.2,2.0,1.5,2.2,1.5,1.2,2.0,1.2,1.0,2.5],"healthExpenditure":[11.2,10.2,9.8,10.5,10.2,7.8,10.8,7.5,7.2,8.5,6.8,6.5,12.0,10.2,9.8,10.5,10.2,7.8,10.8,7.5,7.2,8.5,6.8,6.5,12.0],"manufacturingPct":[18.5,8.5,14.2,18.5,16.8,10.5,22.5,8.5,10.2,14.5,8.5,12.2,3.5,8.5,14.2,18.5,16.8,10.5,22.5,8.5,10.2,14.5,8.5,12.2,3.5],"exports":[85000.0,35000.0,42000.0,22000.0,28000.0,12000.0,18000.0,8000.0,5000.0,18000.0,5000.0,3000.0,5000.0,35000.0,42000.0,22000.0,28000.0,12000.0,18000.0,8000.0,5000.0,18000.0,5000.0,3000.0,5000.0],"fdiInflow":[25000.0,8000.0,5000.0,3000.0,4000.0,2000.0,3000.0,2000.0,1000.0,3000.0,1000.0,1000.0,5000.0,8000.0,5000.0,3000.0,4000.0,2000.0,3000.0,2000.0,1000.0,3000.0,1000.0,1000.0,5000.0],"forestCoverage":[17.5,28.5,54.5,49.5,49.8,60.5,49.2,38.5,38.8,28.5,55.5,96.8,38.5,28.5,54.5,49.5,49.8,60.5,49.2,38.5,38.8,28.5,55.5,96.8,38.5],"airQualityPM25":[15.2,18.5,12.8,10.2,12.5,15.2,8.5,12.8,15.5,8.2,15.2,8.5,10.2,18.5,12.8,10.2,12.5,15.2,8.5,12.8,15.5,8.2,15.2,8.5,10.2],"renewableEnergy":[45.0,32.0,42.0,52.0,48.0,35.0,55.0,28.0,25.0,42.0,48.0,55.0,22.0,32.0,42.0,52.0,48.0,35.0,55.0,28.0,25.0,42.0,48.0,55.0,22.0],"unemployment":[8.5,14.5,11.2,8.5,8.2,16.5,5.2,15.8,13.8,8.5,10.5,12.2,12.8,14.5,11.2,8.5,8.2,16.5,5.2,15.8,13.8,8.5,10.5,12.2,12.8],"inflation":[4.5,6.2,5.5,5.8,5.5,6.8,5.2,6.5,6.2,5.8,5.8,6.5,5.8,6.2,5.5,5.8,5.5,6.8,5.2,6.5,6.2,5.8,5.8,6.5,5.8],"rdExpenditure":[1.5,1.0,0.8,0.8,0.8,0.5,0.9,0.5,0.4,0.7,0.3,0.2,1.2,1.0,0.8,0.8,0.8,0.5,0.9,0.5,0.4,0.7,0.3,0.2,1.2],"militarySpending":[null,0.5,0.5,0.5,0.5,0.4,0.5,0.4,0.4,0.5,0.4,0.4,0.5,0.5,0.5,0.5,0.5,0.4,0.5,0.4,0.4,0.5,0.4,0.4,0.5],"populationDensity":[185.0,386.0,36.0,39.0,60.0,26.0,84.0,102.0,60.0,21.0,7.0,3.0,500.0,386.0,36.0,39.0,60.0,26.0,84.0,102.0,60.0,21.0,7.0,3.0,500.0],"medianAge":[35.5,35.2,34.5,35.8,34.2,31.2,34.5,31.8,30.5,32.2,28.5,27.5,33.5,35.2,34.5,35.8,34.2,31.2,34.5,31.8,30.5,32.2,28.5,27.5,33.5],"birthRate":[12.8,13.5,14.2,13.2,14.5,16.2,13.8,16.8,17.2,15.5,19.5,21.2,14.8,13.5,14.2,13.2,14.5,16.2,13.8,16.8,17.2,15.5,19.5,21.2,14.8],"deathRate":[6.5,7.2,6.8,7.5,6.8,6.2,6.5,6.8,6.5,6.2,5.8,5.5,5.2,7.2,6.8,7.5,6.8,6.2,6.5,6.8,6.5,6.2,5.8,5.5,5.2]}}');
@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":7,"positions":[211,212,213,214,215,216,217],"strings":{"id":["ca-on","ca-qc","ca-bc","ca-ab","ca-ns","ca-mb","ca-sk"],"name":["Ontario","Quebec","British Columbia","Alberta","Nova Scotia","Manitoba","Saskatchewan"],"type":["province","province","province","province","province","province","province"],"parent":["ca","ca","ca","ca","ca","ca","ca"],"flag":["🇨🇦","🇨🇦","🇨🇦","🇨🇦","🇨🇦","🇨🇦","🇨🇦"]},"columns":{"population":[15000000.0,9000000.0,5000000.0,5000000.0,1000000.0,1000000.0,1000000.0],"gdp":[920000.0,480000.0,360000.0,350000.0,52000.0,82000.0,88000.0],"gdpPerCapita":[60205.0,54782.0,68542.0,75182.0,50842.0,55182.0,72542.0],"area":[1077000.0,1542000.0,945000.0,662000.0,55000.0,650000.0,652000.0],"urbanization":[87.0,82.0,87.0,84.0,58.0,73.0,67.0],"gini":[33.8,31.5,33.2,32.8,32.5,33.2,32.8],"hdi":[0.94,0.932,0.938,0.935,0.918,0.915,0.912],"internetPenetration":[96.0,94.0,95.0,94.0,90.0,89.0,88.0],"lifeExpectancy":[82.5,82.8,83.0,82.0,81.5,80.5,80.0],"co2PerCapita":[12.8,10.5,10.2,62.5,12.8,18.5,55.2],"universityCount":[58.0,48.0,28.0,28.0,12.0,8.0,5.0],"literacyRate":[99.0,99.0,99.0,99.0,99.0,99.0,99.0],"pisaScore":[null,null,null,null,null,null,null],"doctorsPer1000":[2.8,2.6,2.5,2.5,2.5,2.2,2.0],"hospitalBeds":[2.5,3.0,2.2,2.2,2.8,2.5,2.8],"healthExpenditure":[12.5,11.8,12.0,11.8,12.5,12.0,11.5],"manufacturingPct":[11.8,13.5,6.8,8.5,5.8,9.2,5.5],"exports":[235000.0,85000.0,48000.0,115000.0,5000.0,15000.0,28000.0],"fdiInflow":[28000.0,12000.0,8000.0,12000.0,1000.0,2000.0,3000.0],"forestCoverage":[66.5,45.8,57.8,38.5,77.5,14.2,10.5],"airQualityPM25":[6.8,6.2,5.8,7.2,4.8,7.5,6.5],"renewableEnergy":[55.0,98.0,92.0,12.0,35.0,42.0,35.0],"unemployment":[5.5,4.5,5.2,5.8,7.5,4.5,5.2],"inflation":[3.8,4.2,3.5,3.2,4.2,3.8,3.5],"rdExpenditure":[1.8,2.5,1.5,1.2,1.0,1.2,0.8],"militarySpending":[null,null,null,null,null,null,null],"populationDensity":[14.0,6.0,5.0,8.0,18.0,2.0,2.0],"medianAge":[40.5,42.8,41.2,37.5,44.5,36.8,37.2],"birthRate":[10.2,9.5,9.8,11.5,8.5,12.2,12.8],"deathRate":[7.5,8.2,7.5,6.2,9.5,8.5,8.2]}}');
@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":173,"positions":[73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501],"strings":{"id":["cn-bj","cn-sh","cn-tj","cn-cq","cn-he","cn-sx","cn-nm","cn-ln","cn-jl","cn-hl","cn-js","cn-zj","cn-ah","cn-fj","cn-jx","cn-sd","cn-ha","cn-hb","cn-hn","cn-gd","cn-gx","cn-hi","cn-sc","cn-gz","cn-yn","cn-xz","cn-sn","cn-gs","cn-qh","cn-nx","cn-xj","cn-sz","cn-gz2","cn-su","cn-cd","cn-hz","cn-wh","cn-nj","cn-nb","cn-qd","cn-wx","cn-cs","cn-zz","cn-fz","cn-jn","cn-hf","cn-nt","cn-dl","cn-xm","cn-dg","cn-yc","cn-wz","cn-km","cn-cc","cn-sy","cn-nc","cn-sjz","cn-ty","cn-nn","cn-gy","cn-hhht","cn-lz","cn-hk2","cn-xn","cn-yc2","cn-wlmq","cn-ls","cn-ty2","cn-xt","cn-cz","cn-jx2","cn-zy","cn-yz","cn-hs","cn-zs","cn-fs","cn-zh","cn-pt","cn-qz","cn-ly","cn-zy2","cn-xz2","cn-ha2","cn-bd","cn-ts","cn-ly2","cn-wf","cn-yt","cn-zb","cn-jh","cn-sx2","cn-yc3","cn-xy","cn-zz2","cn-hy","cn-yy","cn-dt","cn-tz","cn-ls2","cn-hz2","cn-zz3","cn-lz2","cn-gl","cn-wh2","cn-bb","cn-aq","cn-yb","cn-dy","cn-my","cn-nch","cn-dz","cn-gy2","cn-jdz","cn-zj2","cn-mm","cn-st","cn-jm","cn-qhd","cn-cz2","cn-lf","cn-hs2","cn-mz","cn-sg","cn-qy","cn-hb2","cn-sq","cn-ha3","cn-lj","cn-yz2","cn-dq","cn-hrb","cn-ly3","cn-ey","cn-bh","cn-yl","cn-zh2","cn-qj","cn-dl2","cn-zyt","cn-gs2","cn-jz","cn-ez","cn-hg","cn-xf","cn-bj2","cn-yl2","cn-ts2","cn-ww","cn-zy3","cn-klmy","cn-aks","cn-ks","cn-bt","cn-erds","cn-wh3","cn-rz","cn-jn2","cn-ta","cn-yc4","cn-cz3","cn-ld","cn-xx","cn-ly4","cn-nc2","cn-zg","cn-ls3","cn-pzh","cn-gy3","cn-my2","cn-ab","cn-gz3","cn-lj2","cn-bs"],"name":["Beijing","Shanghai","Tianjin","Chongqing","Hebei","Shanxi","Inner Mongolia","Liaoning","Jilin","Heilongjiang","Jiangsu","Zhejiang","Anhui","Fujian","Jiangxi","Shandong","Henan","Hubei","Hunan","Guangdong","Guangxi","Hainan","Sichuan","Guizhou","Yunnan","Tibet","Shaanxi","Gansu","Qinghai","Ningxia","Xinjiang","Shenzhen","Guangzhou","Suzhou","Chengdu","Hangzhou","Wuhan","Nanjing","Ningbo","Qingdao","Wuxi","Changsha","Zhengzhou","Fuzhou","Jinan","Hefei","Nantong","Dalian","Xiamen","Dongguan","Yancheng","Wenzhou","Kunming","Changchun","Shenyang","Nanchang","Shijiazhuang","Taiyuan","Nanning","Guiyang","Hohhot","Lanzhou","Haikou","Xining","Yinchuan","Urumqi","Lhasa","Taizhou JiangSu","Xuzhou","Changzhou","Jiaxing","Zhenjiang","Yangzhou","Huizhou","Zhongshan","Foshan","Zhuhai","Putian","Quanzhou","Luoyang","Zhuzhou","Xuancheng","Handan","Baoding","Tangshan","Linyi","Weifang","Yantai","Zibo","Jinhua","Shaoxing","Yichang","Xiangyang","Zhuzhou","Hengyang","Yueyang","Datong","Taizhou Zhejiang","Lishui","Huzhou","Zhangzhou","Liuzhou","Guilin","Wuhu","Bengbu","Anqing","Yibin","Deyang","Mianyang","Nanchong","Dazhou","Ganzhou","Jingdezhen","Zhanjiang","Maoming","Shantou","Jiangmen","Qinhuangdao","Cangzhou","Langfang","Huangshan","Meizhou","Shaoguan","Qingyuan","Huaibei","Suqian","Huaian","Lianyungang","Yancheng","Daqing","Harbin","Lianyuan","Enshi","Beihai","Yulin Guangxi","Zhaoqing","Qujing","Dali","Zunyi","Ganzhou2","Jingzhou","Ezhou","Huanggang","Xianyang","Baoji","Yulin Shaanxi","Tianshui","Wuwei","Zhangye","Karamay","Aksu","Kashgar","Baotou","Ordos","Weihai","Rizhao","Jining Shandong","Taian","Yuncheng","Chenzhou","Liuding","Xinxiang","Luzhou","Neijiang","Zigong","Leshan","Panzhihua","Guangan","Meishan","Aba","Ganzi","Lijiang","Baoshan"],"type":["province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","province","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city","city"],"parent":["cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn","cn"],"flag":["🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳","🇨🇳"]},"columns":{"population":[22000000.0,25000000.0,14000000.0,32000000.0,75000000.0,35000000.0,24000000.0,43000000.0,24000000.0,32000000.0,85000000.0,66000000.0,61000000.0,42000000.0,45000000.0,102000000.0,99000000.0,58000000.0,66000000.0,127000000.0,50000000.0,10000000.0,84000000.0,39000000.0,47000000.0,4000000.0,40000000.0,25000000.0,6000000.0,7000000.0,26000000.0,18000000.0,19000000.0,13000000.0,21000000.0,12000000.0,14000000.0,9000000.0,10000000.0,10000000.0,7000000.0,10000000.0,13000000.0,8000000.0,9000000.0,10000000.0,8000000.0,7000000.0,5000000.0,10000000.0,7000000.0,10000000.0,9000000.0,9000000.0,9000000.0,6000000.0,11000000.0,5000000.0,9000000.0,6000000.0,4000000.0,4000000.0,3000000.0,2000000.0,3000000.0,4000000.0,1000000.0,5000000.0,9000000.0,5000000.0,5000000.0,3000000.0,5000000.0,6000000.0,4000000.0,10000000.0,2000000.0,3000000.0,9000000.0,7000000.0,4000000.0,3000000.0,9000000.0,11000000.0,8000000.0,11000000.0,9000000.0,7000000.0,5000000.0,7000000.0,5000000.0,4000000.0,5000000.0,4000000.0,7000000.0,6000000.0,3000000.0,7000000.0,3000000.0,3000000.0,5000000.0,4000000.0,5000000.0,4000000.0,3000000.0,4000000.0,5000000.0,4000000.0,5000000.0,6000000.0,5000000.0,9000000.0,2000000.0,7000000.0,6000000.0,6000000.0,5000000.0,3000000.0,7000000.0,5000000.0,1000000.0,4000000.0,3000000.0,4000000.0,2000000.0,6000000.0,5000000.0,5000000.0,7000000.0,3000000.0,10000000.0,3000000.0,4000000.0,2000000.0,6000000.0,4000000.0,6000000.0,4000000.0,6000000.0,9000000.0,5000000.0,1000000.0,6000000.0,4000000.0,4000000.0,4000000.0,3000000.0,2000000.0,1000000.0,500000.0,3000000.0,5000000.0,3000000.0,2000000.0,3000000.0,3000000.0,8000000.0,5000000.0,5000000.0,5000000.0,3000000.0,6000000.0,4000000.0,3000000.0,3000000.0,3000000.0,1000000.0,3000000.0,3000000.0,1000000.0,1000000.0,1000000.0,3000000.0],"gdp":[660000.0,715000.0,256000.0,460000.0,650000.0,390000.0,380000.0,460000.0,220000.0,270000.0,1950000.0,1280000.0,690000.0,850000.0,520000.0,1410000.0,1010000.0,820000.0,740000.0,2100000.0,440000.0,115000.0,880000.0,330000.0,460000.0,60000.0,530000.0,180000.0,62000.0,80000.0,290000.0,520000.0,460000.0,370000.0,310000.0,285000.0,290000.0,265000.0,240000.0,230000.0,225000.0,210000.0,205000.0,185000.0,180000.0,175000.0,165000.0,155000.0,125000.0,175000.0,110000.0,120000.0,115000.0,105000.0,115000.0,105000.0,105000.0,75000.0,85000.0,72000.0,55000.0,48000.0,35000.0,28000.0,32000.0,55000.0,12000.0,88000.0,118000.0,140000.0,95000.0,72000.0,95000.0,82000.0,58000.0,185000.0,55000.0,42000.0,160000.0,82000.0,52000.0,28000.0,65000.0,62000.0,125000.0,75000.0,98000.0,115000.0,68000.0,82000.0,95000.0,68000.0,75000.0,52000.0,52000.0,58000.0,28000.0,82000.0,25000.0,55000.0,68000.0,52000.0,38000.0,65000.0,35000.0,35000.0,52000.0,38000.0,55000.0,38000.0,35000.0,62000.0,18000.0,52000.0,55000.0,45000.0,55000.0,28000.0,62000.0,52000.0,12000.0,22000.0,22000.0,25000.0,18000.0,55000.0,65000.0,55000.0,110000.0,42000.0,82000.0,18000.0,22000.0,22000.0,28000.0,42000.0,42000.0,22000.0,58000.0,62000.0,42000.0,18000.0,32000.0,42000.0,38000.0,72000.0,15000.0,12000.0,8000.0,12000.0,12000.0,12000.0,55000.0,72000.0,52000.0,32000.0,72000.0,52000.0,28000.0,38000.0,22000.0,42000.0,38000.0,22000.0,25000.0,32000.0,18000.0,18000.0,25000.0,5000.0,5000.0,8000.0,15000.0],"gdpPerCapita":[30136.0,28744.0,18467.0,14352.0,8712.0,11169.0,15801.0,10799.0,9236.0,8478.0,22922.0,19465.0,11261.0,20296.0,11507.0,13887.0,10251.0,14199.0,11138.0,16535.0,8738.0,11026.0,10508.0,8558.0,9701.0,16393.0,13408.0,7231.0,10438.0,11034.0,11203.0,29012.0,24211.0,28462.0,14762.0,23750.0,20714.0,29444.0,24000.0,23000.0,32143.0,21000.0,15769.0,23125.0,20000.0,17500.0,20625.0,22143.0,25000.0,17500.0,15714.0,12000.0,12778.0,11667.0,12778.0,17500.0,9545.0,15000.0,9444.0,12000.0,13750.0,12000.0,11667.0,14000.0,10667.0,13750.0,12000.0,17600.0,13111.0,28000.0,19000.0,24000.0,19000.0,13667.0,14500.0,18500.0,27500.0,14000.0,17778.0,11714.0,13000.0,9333.0,7222.0,5636.0,15625.0,6818.0,10889.0,16429.0,13600.0,11714.0,19000.0,17000.0,15000.0,13000.0,7429.0,9667.0,9333.0,11714.0,8333.0,18333.0,13600.0,13000.0,7600.0,16250.0,11667.0,8750.0,10400.0,9500.0,11000.0,6333.0,7000.0,6889.0,9000.0,7429.0,9167.0,7500.0,11000.0,9333.0,8857.0,10400.0,12000.0,5500.0,7333.0,6250.0,9000.0,9167.0,13000.0,11000.0,15714.0,14000.0,8200.0,6000.0,5500.0,11000.0,4667.0,10500.0,7000.0,5500.0,9667.0,6889.0,8400.0,18000.0,5333.0,10500.0,9500.0,18000.0,5000.0,6000.0,8000.0,24000.0,4000.0,2400.0,18333.0,36000.0,17333.0,10667.0,9000.0,10400.0,5600.0,7600.0,7333.0,7000.0,9500.0,7333.0,8333.0,10667.0,18000.0,6000.0,8333.0,5000.0,5000.0,8000.0,5000.0],"area":[16000.0,6000.0,12000.0,82000.0,188000.0,156000.0,1183000.0,148000.0,191000.0,455000.0,103000.0,106000.0,140000.0,123000.0,167000.0,157000.0,167000.0,186000.0,212000.0,180000.0,238000.0,35000.0,485000.0,176000.0,394000.0,1228000.0,206000.0,426000.0,721000.0,66000.0,1665000.0,2000.0,7000.0,8000.0,14000.0,17000.0,9000.0,7000.0,10000.0,12000.0,5000.0,12000.0,7000.0,12000.0,10000.0,11000.0,8000.0,13000.0,2000.0,2000.0,17000.0,12000.0,21000.0,25000.0,13000.0,7000.0,14000.0,7000.0,22000.0,8000.0,17000.0,13000.0,2000.0,8000.0,9000.0,14000.0,30000.0,6000.0,12000.0,4000.0,4000.0,4000.0,7000.0,11000.0,2000.0,4000.0,2000.0,4000.0,11000.0,15000.0,11000.0,12000.0,12000.0,22000.0,14000.0,17000.0,16000.0,14000.0,6000.0,11000.0,8000.0,21000.0,20000.0,11000.0,15000.0,15000.0,14000.0,10000.0,17000.0,6000.0,13000.0,19000.0,28000.0,6000.0,6000.0,15000.0,13000.0,6000.0,20000.0,13000.0,17000.0,40000.0,5000.0,13000.0,11000.0,2000.0,10000.0,8000.0,14000.0,6000.0,10000.0,16000.0,19000.0,19000.0,3000.0,8000.0,10000.0,8000.0,17000.0,22000.0,53000.0,8000.0,24000.0,4000.0,13000.0,15000.0,29000.0,29000.0,31000.0,40000.0,14000.0,2000.0,18000.0,10000.0,18000.0,43000.0,14000.0,33000.0,42000.0,8000.0,128000.0,162000.0,28000.0,87000.0,6000.0,5000.0,11000.0,8000.0,14000.0,19000.0,17000.0,9000.0,12000.0,5000.0,4000.0,13000.0,7000.0,6000.0,7000.0,84000.0,153000.0,21000.0,20000.0],"urbanization":[87.0,89.0,84.0,70.0,61.0,63.0,68.0,68.0,63.0,65.0,74.0,73.0,60.0,70.0,62.0,64.0,57.0,64.0,60.0,75.0,55.0,60.0,58.0,54.0,52.0,36.0,63.0,53.0,61.0,65.0,57.0,100.0,86.0,80.0,79.0,83.0,84.0,87.0,78.0,77.0,82.0,82.0,79.0,72.0,75.0,82.0,71.0,72.0,90.0,92.0,65.0,71.0,73.0,65.0,82.0,76.0,65.0,85.0,52.0,80.0,72.0,82.0,72.0,72.0,78.0,95.0,48.0,68.0,67.0,77.0,72.0,74.0,70.0,73.0,88.0,95.0,90.0,62.0,69.0,62.0,62.0,55.0,55.0,52.0,62.0,55.0,62.0,68.0,73.0,68.0,72.0,60.0,63.0,65.0,52.0,58.0,62.0,65.0,58.0,68.0,60.0,54.0,50.0,72.0,60.0,52.0,50.0,55.0,54.0,45.0,42.0,50.0,65.0,45.0,45.0,70.0,68.0,58.0,52.0,62.0,55.0,48.0,55.0,48.0,62.0,60.0,64.0,62.0,65.0,68.0,70.0,48.0,42.0,55.0,42.0,52.0,48.0,42.0,52.0,50.0,55.0,68.0,42.0,58.0,55.0,62.0,38.0,42.0,48.0,98.0,38.0,32.0,82.0,75.0,70.0,62.0,58.0,62.0,48.0,55.0,48.0,52.0,48.0,42.0,52.0,48.0,68.0,38.0,48.0,28.0,22.0,42.0,38.0],"gini":[36.5,37.2,33.8,34.2,32.1,31.5,30.8,32.4,31.2,30.5,33.2,34.1,31.8,32.6,31.1,33.4,32.8,33.5,33.8,35.2,32.5,33.2,34.1,33.5,34.2,28.5,32.8,31.2,30.8,30.5,32.1,37.8,35.5,32.5,33.8,34.2,34.5,33.5,32.8,32.5,31.8,33.5,33.2,32.2,32.8,32.5,31.2,32.8,33.5,36.2,30.8,34.8,33.5,31.5,32.5,31.5,31.8,31.2,32.5,33.2,30.5,31.5,33.2,30.5,30.2,32.5,28.5,31.2,31.5,32.2,32.5,31.5,31.2,34.5,35.8,35.2,34.5,32.5,33.2,32.2,33.2,30.8,31.8,31.5,32.2,31.2,32.5,32.2,32.5,33.5,33.2,32.8,33.2,33.2,33.5,33.2,30.8,33.8,32.2,31.8,32.5,32.8,32.5,31.5,31.2,31.0,33.8,33.2,33.5,33.8,33.5,31.5,31.2,34.5,34.2,35.5,34.2,31.5,31.2,32.2,30.2,34.2,33.8,33.5,31.5,30.8,31.2,31.0,30.8,31.2,30.8,33.2,33.2,32.8,32.5,33.8,33.8,33.5,33.5,31.5,33.2,33.5,33.2,32.5,32.2,31.5,31.0,30.5,30.2,31.5,31.5,32.5,30.5,29.8,31.8,31.5,31.5,31.8,30.8,33.5,33.2,32.5,33.5,33.5,33.2,33.5,34.2,33.8,33.2,32.5,32.8,33.5,33.8],"hdi":[0.891,0.883,0.852,0.798,0.765,0.758,0.772,0.782,0.768,0.762,0.845,0.838,0.778,0.825,0.765,0.795,0.758,0.802,0.778,0.818,0.738,0.768,0.758,0.698,0.712,0.628,0.785,0.698,0.695,0.742,0.728,0.882,0.868,0.858,0.842,0.862,0.852,0.872,0.848,0.842,0.855,0.845,0.825,0.832,0.835,0.828,0.835,0.845,0.865,0.822,0.798,0.818,0.802,0.792,0.808,0.798,0.782,0.795,0.762,0.778,0.785,0.778,0.782,0.742,0.758,0.762,0.668,0.808,0.802,0.842,0.832,0.838,0.825,0.808,0.818,0.835,0.858,0.798,0.815,0.785,0.792,0.782,0.768,0.762,0.788,0.772,0.795,0.818,0.802,0.812,0.828,0.808,0.802,0.795,0.768,0.782,0.762,0.808,0.792,0.832,0.798,0.778,0.768,0.818,0.785,0.778,0.778,0.782,0.795,0.758,0.752,0.762,0.778,0.768,0.772,0.788,0.802,0.792,0.772,0.795,0.788,0.748,0.765,0.758,0.778,0.788,0.798,0.792,0.798,0.798,0.788,0.748,0.738,0.778,0.738,0.778,0.728,0.718,0.748,0.762,0.785,0.808,0.758,0.782,0.778,0.788,0.708,0.698,0.712,0.808,0.688,0.668,0.798,0.825,0.828,0.808,0.788,0.798,0.748,0.778,0.758,0.768,0.768,0.748,0.758,0.775,0.798,0.738,0.762,0.658,0.638,0.712,0.698],"internetPenetration":[92.0,91.0,88.0,78.0,72.0,71.0,74.0,76.0,73.0,71.0,82.0,84.0,72.0,80.0,69.0,75.0,70.0,76.0,72.0,82.0,65.0,72.0,70.0,62.0,64.0,52.0,74.0,62.0,65.0,70.0,68.0,95.0,90.0,85.0,82.0,88.0,82.0,86.0,82.0,80.0,84.0,80.0,76.0,78.0,78.0,76.0,78.0,80.0,86.0,82.0,72.0,76.0,72.0,75.0,78.0,72.0,72.0,75.0,68.0,72.0,75.0,70.0,75.0,68.0,72.0,72.0,55.0,75.0,74.0,82.0,80.0,80.0,78.0,78.0,82.0,82.0,88.0,72.0,76.0,70.0,72.0,68.0,68.0,68.0,72.0,68.0,74.0,78.0,75.0,78.0,80.0,74.0,72.0,72.0,68.0,70.0,68.0,76.0,72.0,80.0,72.0,68.0,65.0,76.0,70.0,68.0,68.0,70.0,72.0,62.0,60.0,65.0,68.0,62.0,65.0,72.0,75.0,72.0,68.0,75.0,68.0,58.0,62.0,60.0,68.0,70.0,72.0,70.0,72.0,72.0,74.0,58.0,55.0,68.0,55.0,68.0,58.0,55.0,62.0,65.0,68.0,75.0,60.0,72.0,70.0,68.0,55.0,55.0,58.0,78.0,48.0,42.0,75.0,78.0,80.0,74.0,72.0,74.0,62.0,68.0,62.0,68.0,65.0,60.0,62.0,68.0,72.0,55.0,65.0,35.0,32.0,55.0,48.0],"lifeExpectancy":[82.5,83.7,81.9,78.6,77.4,76.8,76.3,78.9,78.1,77.5,79.9,79.4,77.6,79.1,77.2,79.0,76.5,78.4,77.8,78.9,77.5,79.2,78.1,75.8,75.2,72.5,77.9,75.5,74.8,76.2,75.5,81.5,81.2,82.0,80.5,82.5,80.8,82.8,81.5,81.0,82.2,80.5,78.8,79.5,79.8,79.2,80.5,80.8,81.5,79.5,78.5,79.8,77.8,78.2,79.5,78.2,77.5,77.5,77.8,76.8,76.5,76.2,79.8,75.5,76.5,76.2,72.8,79.5,78.5,81.2,80.8,80.5,80.2,79.5,80.2,80.5,81.8,78.8,79.5,77.5,78.2,78.0,77.0,77.2,77.5,77.2,78.5,80.2,78.8,80.0,80.5,78.8,78.5,78.0,77.5,78.0,76.5,80.0,79.8,80.8,79.2,77.5,77.8,79.5,78.0,77.8,77.5,78.0,78.2,76.5,76.2,77.2,77.5,77.5,77.8,78.2,79.2,78.0,77.2,78.0,79.5,77.5,77.8,77.5,77.0,78.2,78.8,78.5,78.5,78.0,77.8,77.0,76.5,78.2,77.0,78.0,75.8,75.5,76.2,77.2,77.8,78.5,77.0,77.5,77.2,76.8,75.5,75.2,75.8,77.5,74.5,73.8,76.8,77.5,80.8,79.5,78.2,78.8,76.5,77.8,77.2,77.0,77.0,76.5,77.0,77.5,77.2,76.0,77.2,73.5,72.5,75.5,74.8],"co2PerCapita":[7.2,8.4,10.2,5.8,9.8,12.5,15.8,8.9,6.5,5.8,7.6,6.9,5.2,7.1,4.8,8.6,5.4,6.1,5.3,5.9,4.2,4.5,4.9,5.2,4.8,2.8,6.8,5.5,6.2,9.8,8.5,8.2,6.8,9.5,5.5,6.2,7.5,6.8,9.8,8.2,10.5,6.5,6.8,6.5,7.5,5.8,8.5,8.8,5.8,8.5,6.5,5.2,5.2,7.2,8.5,5.5,9.2,12.5,4.5,5.5,12.8,6.8,4.5,6.5,10.2,9.8,3.2,7.5,7.8,9.8,8.2,8.5,6.8,7.5,6.2,8.5,5.5,5.8,7.2,7.8,6.5,4.8,12.5,8.5,18.5,5.5,7.2,8.5,10.2,5.5,7.5,8.5,6.8,6.8,4.8,5.8,15.8,5.8,3.5,6.8,5.5,7.5,3.8,7.2,5.8,4.5,4.5,5.2,4.8,3.8,4.2,3.8,5.2,4.5,5.8,4.2,5.5,6.5,8.5,7.8,3.2,3.2,4.2,4.5,8.5,5.2,5.8,6.2,6.5,22.5,6.8,4.2,3.2,4.5,3.5,4.8,5.2,3.2,4.8,3.8,5.2,8.5,3.8,6.5,6.8,18.5,3.2,4.5,4.2,28.5,5.5,3.2,15.5,38.5,6.5,8.5,8.5,6.5,5.5,5.2,3.5,6.2,4.5,3.5,4.2,4.5,12.5,3.2,4.0,2.5,2.2,2.8,3.2],"universityCount":[92.0,64.0,57.0,68.0,125.0,83.0,53.0,116.0,62.0,82.0,167.0,109.0,121.0,89.0,106.0,153.0,157.0,130.0,125.0,160.0,82.0,21.0,134.0,72.0,83.0,7.0,97.0,50.0,12.0,20.0,55.0,15.0,82.0,28.0,58.0,42.0,82.0,52.0,18.0,28.0,15.0,58.0,62.0,28.0,48.0,52.0,12.0,28.0,18.0,8.0,8.0,12.0,32.0,42.0,48.0,32.0,32.0,28.0,28.0,22.0,18.0,22.0,8.0,5.0,8.0,18.0,3.0,5.0,18.0,12.0,5.0,8.0,8.0,5.0,3.0,12.0,5.0,3.0,8.0,15.0,8.0,3.0,12.0,15.0,12.0,8.0,12.0,12.0,8.0,5.0,5.0,5.0,8.0,8.0,8.0,5.0,8.0,5.0,2.0,3.0,3.0,8.0,8.0,8.0,8.0,5.0,5.0,5.0,8.0,5.0,5.0,8.0,3.0,5.0,3.0,5.0,3.0,5.0,5.0,5.0,2.0,3.0,3.0,2.0,3.0,3.0,5.0,5.0,8.0,5.0,48.0,2.0,3.0,3.0,3.0,3.0,3.0,3.0,5.0,8.0,5.0,3.0,3.0,8.0,5.0,3.0,3.0,2.0,2.0,1.0,2.0,2.0,8.0,3.0,5.0,3.0,8.0,5.0,3.0,3.0,2.0,8.0,5.0,3.0,3.0,3.0,2.0,2.0,3.0,1.0,1.0,1.0,2.0],"literacyRate":[99.0,99.0,98.0,95.0,96.0,97.0,94.0,98.0,97.0,97.0,98.0,97.0,94.0,96.0,94.0,97.0,94.0,96.0,95.0,97.0,93.0,95.0,94.0,90.0,91.0,68.0,96.0,90.0,88.0,92.0,92.0,99.0,99.0,99.0,98.0,99.0,98.0,99.0,98.0,98.0,99.0,97.0,96.0,96.0,97.0,96.0,98.0,98.0,99.0,96.0,96.0,96.0,94.0,97.0,98.0,95.0,96.0,97.0,94.0,94.0,95.0,93.0,96.0,90.0,93.0,94.0,72.0,97.0,96.0,99.0,98.0,98.0,97.0,96.0,97.0,97.0,99.0,95.0,96.0,95.0,95.0,94.0,95.0,95.0,96.0,94.0,97.0,97.0,97.0,97.0,98.0,96.0,96.0,95.0,94.0,95.0,96.0,96.0,95.0,98.0,95.0,94.0,94.0,96.0,95.0,94.0,93.0,94.0,95.0,92.0,92.0,93.0,94.0,93.0,93.0,95.0,96.0,96.0,95.0,96.0,94.0,92.0,93.0,92.0,95.0,96.0,96.0,96.0,96.0,97.0,97.0,92.0,91.0,94.0,91.0,93.0,90.0,88.0,92.0,93.0,95.0,96.0,93.0,95.0,95.0,94.0,88.0,88.0,90.0,96.0,82.0,78.0,96.0,96.0,98.0,97.0,96.0,96.0,94.0,94.0,92.0,94.0,93.0,92.0,93.0,93.0,94.0,91.0,93.0,80.0,75.0,88.0,88.0],"pisaScore":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null],"doctorsPer1000":[4.8,3.9,3.2,2.6,2.8,2.9,3.1,3.0,2.8,2.7,3.2,3.4,2.2,2.6,2.1,3.0,2.4,2.8,2.5,2.8,2.2,2.4,2.8,2.2,2.5,2.8,3.0,2.5,2.8,2.8,2.5,3.5,3.2,3.0,3.5,3.8,3.8,4.2,2.8,3.2,3.0,3.2,2.8,2.5,3.2,2.5,2.5,3.0,3.5,1.8,2.2,2.5,2.8,3.0,3.2,2.5,2.5,3.2,2.2,2.5,3.2,2.8,2.5,2.8,2.8,2.8,2.8,2.2,2.5,3.0,2.5,2.8,2.5,2.2,2.2,2.5,3.2,2.0,2.2,2.5,2.2,2.0,2.2,2.2,2.5,2.0,2.5,2.8,2.5,2.2,2.5,2.5,2.5,2.2,2.0,2.2,2.5,2.2,2.0,2.5,2.0,2.2,2.2,2.5,2.2,2.0,2.2,2.2,2.5,1.8,1.8,1.8,2.0,1.8,1.8,2.0,2.0,2.5,2.0,2.2,2.0,1.5,1.8,1.5,2.0,2.0,2.2,2.0,2.2,2.5,3.0,1.5,1.8,1.8,1.5,1.8,1.8,1.5,2.0,1.8,2.2,2.5,1.8,2.5,2.5,2.2,1.8,1.5,1.5,2.5,1.2,1.0,3.0,2.8,2.8,2.2,2.2,2.5,2.0,2.0,1.5,2.2,2.0,1.8,2.0,2.2,2.5,1.5,2.0,1.5,1.2,1.5,1.5],"hospitalBeds":[6.3,5.8,4.8,6.8,5.2,5.8,6.2,6.5,5.5,5.8,5.2,5.5,5.0,4.8,5.2,6.2,6.5,6.5,5.8,4.5,5.2,4.8,7.2,6.8,6.2,5.2,6.5,5.8,6.2,5.5,6.5,4.2,4.5,4.2,7.5,5.5,6.8,6.2,4.5,5.5,4.2,6.2,5.8,4.5,5.8,4.8,4.2,5.5,4.2,2.8,4.5,4.2,5.8,5.8,6.5,5.2,5.2,5.8,5.0,6.2,5.8,5.5,4.5,5.8,5.2,6.2,5.0,4.2,4.8,4.2,4.0,4.5,4.5,3.2,3.2,3.5,3.8,4.2,3.8,5.5,5.2,4.2,4.8,4.8,5.2,4.5,4.8,4.8,5.0,4.0,4.2,5.5,5.5,5.2,5.0,5.2,5.2,4.0,4.0,4.2,3.8,4.8,5.0,4.5,4.5,4.2,5.8,5.5,5.8,5.5,5.2,4.8,4.8,3.5,3.2,3.2,3.5,5.0,4.5,4.5,4.2,3.0,3.5,3.2,4.5,4.2,4.5,4.5,4.5,5.5,6.0,4.8,5.5,3.8,3.5,3.5,5.2,4.8,5.5,4.8,5.2,5.5,5.2,5.8,5.5,5.2,4.8,4.5,4.5,5.5,5.2,5.0,5.8,5.5,4.8,4.8,5.0,5.2,4.8,5.0,4.5,5.2,5.5,5.2,5.5,5.5,5.8,5.0,5.5,4.5,4.2,4.5,4.8],"healthExpenditure":[8.5,8.2,7.0,5.8,5.2,5.5,5.8,6.2,5.5,5.2,6.5,6.8,5.2,5.8,5.0,5.8,5.0,5.8,5.2,6.5,4.8,5.5,5.5,5.2,5.5,8.5,5.8,5.5,6.2,5.5,5.8,7.5,7.2,6.5,6.2,6.8,6.5,6.8,6.2,6.5,6.2,6.2,5.8,5.8,6.0,5.5,5.8,6.2,6.5,5.5,5.2,5.5,5.5,5.5,6.2,5.5,5.2,5.8,5.0,5.5,5.8,5.5,5.5,6.2,5.5,5.8,8.5,5.5,5.5,6.2,5.8,6.0,5.8,5.2,5.5,5.8,6.2,5.2,5.5,5.2,5.2,4.8,5.0,4.8,5.5,4.8,5.2,5.5,5.5,5.5,5.8,5.5,5.5,5.2,5.0,5.2,5.5,5.5,5.2,5.8,5.2,5.0,4.8,5.5,5.0,4.8,5.0,5.2,5.5,4.8,4.8,4.8,5.0,4.8,4.8,5.0,5.2,5.2,4.8,5.0,5.0,4.5,4.8,4.5,5.0,4.8,5.0,5.0,5.2,5.5,5.5,4.5,5.0,4.8,4.5,4.8,5.0,4.8,5.0,4.8,5.2,5.5,4.8,5.5,5.5,5.2,4.5,4.5,4.8,5.8,5.2,5.0,5.8,5.5,5.5,5.2,5.2,5.2,4.8,5.0,4.5,5.0,5.0,4.8,5.0,5.2,5.5,4.5,5.0,6.5,6.8,5.0,5.0],"manufacturingPct":[11.2,23.5,28.2,27.8,32.5,25.8,22.5,28.5,25.8,18.5,35.8,32.5,28.2,35.2,32.5,28.8,32.2,30.5,28.5,32.8,22.5,8.5,25.5,18.5,15.8,5.2,22.8,18.2,22.5,25.8,15.2,38.5,28.5,42.5,22.5,25.8,28.5,28.2,38.5,32.5,42.8,28.5,28.5,28.5,25.8,32.5,38.2,28.5,28.5,52.5,28.5,35.8,18.5,32.5,22.8,28.5,28.5,18.5,18.5,15.8,15.8,15.2,8.5,15.2,18.5,12.5,3.5,35.2,22.5,38.5,38.5,32.5,32.5,42.5,45.8,48.5,28.5,32.5,42.5,22.5,28.5,25.5,32.5,25.5,38.5,22.5,28.5,32.5,35.8,32.5,35.8,22.5,28.5,28.5,22.5,22.5,18.5,32.5,18.5,35.5,28.5,32.5,12.5,35.8,22.5,18.5,22.5,28.5,22.5,15.5,15.5,18.5,22.5,12.5,18.5,25.5,32.5,15.5,22.5,28.5,8.5,8.5,15.5,15.5,22.5,22.5,22.5,22.5,28.5,25.8,18.5,15.5,8.5,12.5,12.5,18.5,15.5,5.5,18.5,18.5,18.5,28.5,12.5,18.5,22.5,22.5,8.5,8.5,5.5,15.5,5.5,5.5,22.5,12.5,22.5,22.5,22.5,18.5,12.5,18.5,15.5,18.5,18.5,15.5,22.5,18.5,35.8,12.5,18.5,2.5,2.5,3.5,8.5],"exports":[52000.0,185000.0,48000.0,62000.0,42000.0,18000.0,8000.0,48000.0,9000.0,12000.0,420000.0,310000.0,68000.0,145000.0,38000.0,185000.0,58000.0,52000.0,48000.0,580000.0,42000.0,12000.0,68000.0,9000.0,22000.0,null,28000.0,4000.0,1000.0,3000.0,22000.0,285000.0,95000.0,185000.0,48000.0,62000.0,45000.0,52000.0,125000.0,68000.0,85000.0,35000.0,32000.0,42000.0,28000.0,38000.0,55000.0,42000.0,38000.0,155000.0,15000.0,28000.0,12000.0,18000.0,25000.0,18000.0,15000.0,8000.0,12000.0,5000.0,5000.0,3000.0,5000.0,1000.0,2000.0,8000.0,null,28000.0,18000.0,52000.0,35000.0,25000.0,22000.0,32000.0,42000.0,95000.0,18000.0,12000.0,52000.0,12000.0,8000.0,5000.0,12000.0,8000.0,35000.0,12000.0,18000.0,28000.0,18000.0,22000.0,32000.0,12000.0,12000.0,8000.0,8000.0,8000.0,3000.0,22000.0,5000.0,18000.0,15000.0,12000.0,5000.0,25000.0,8000.0,5000.0,8000.0,8000.0,12000.0,5000.0,5000.0,8000.0,3000.0,8000.0,12000.0,12000.0,18000.0,5000.0,12000.0,15000.0,2000.0,3000.0,5000.0,3000.0,3000.0,8000.0,12000.0,12000.0,15000.0,12000.0,12000.0,2000.0,2000.0,5000.0,3000.0,8000.0,5000.0,2000.0,5000.0,8000.0,8000.0,5000.0,3000.0,5000.0,8000.0,12000.0,1000.0,1000.0,null,3000.0,1000.0,1000.0,8000.0,8000.0,12000.0,8000.0,12000.0,8000.0,3000.0,5000.0,3000.0,8000.0,8000.0,3000.0,5000.0,8000.0,5000.0,2000.0,5000.0,null,null,1000.0,2000.0],"fdiInflow":[15000.0,22000.0,9000.0,12000.0,10000.0,3000.0,2000.0,6000.0,2000.0,3000.0,28000.0,18000.0,12000.0,9000.0,13000.0,19000.0,22000.0,15000.0,18000.0,32000.0,6000.0,25000.0,15000.0,5000.0,6000.0,null,9000.0,1000.0,null,1000.0,3000.0,18000.0,12000.0,15000.0,8000.0,12000.0,8000.0,8000.0,8000.0,5000.0,8000.0,8000.0,8000.0,5000.0,5000.0,8000.0,5000.0,5000.0,8000.0,12000.0,2000.0,3000.0,3000.0,2000.0,3000.0,3000.0,2000.0,1000.0,2000.0,2000.0,1000.0,null,8000.0,null,null,1000.0,null,2000.0,3000.0,5000.0,5000.0,3000.0,2000.0,5000.0,3000.0,8000.0,5000.0,2000.0,5000.0,2000.0,1000.0,1000.0,1000.0,2000.0,2000.0,1000.0,2000.0,3000.0,2000.0,3000.0,3000.0,2000.0,2000.0,1000.0,1000.0,1000.0,null,2000.0,1000.0,2000.0,2000.0,1000.0,1000.0,3000.0,1000.0,1000.0,1000.0,1000.0,2000.0,1000.0,null,2000.0,null,1000.0,1000.0,1000.0,2000.0,1000.0,1000.0,3000.0,1000.0,null,null,null,null,2000.0,2000.0,2000.0,2000.0,1000.0,2000.0,null,null,2000.0,null,1000.0,null,null,1000.0,2000.0,1000.0,1000.0,null,1000.0,1000.0,1000.0,null,null,null,null,null,null,1000.0,1000.0,2000.0,1000.0,1000.0,1000.0,null,null,null,1000.0,1000.0,null,null,1000.0,null,null,null,null,null,null,null],"forestCoverage":[44.8,18.5,12.5,54.5,35.8,23.6,23.0,42.2,44.3,47.3,24.5,61.5,30.2,66.8,63.3,18.2,25.2,42.5,59.9,58.7,62.5,62.1,40.0,61.5,65.0,12.1,45.4,13.0,7.5,15.8,5.0,39.5,43.5,32.5,39.8,66.8,42.5,31.5,48.5,25.5,26.8,55.2,28.5,65.2,22.5,28.5,18.5,42.5,43.2,45.5,8.5,68.5,52.5,44.5,35.5,63.5,32.5,22.5,55.5,45.5,22.5,15.5,55.5,8.5,12.5,5.5,12.5,18.5,22.5,33.5,48.5,24.5,22.5,62.5,18.5,35.5,42.5,58.5,58.5,50.5,55.5,65.5,18.5,28.5,22.5,22.5,15.5,52.5,22.5,62.5,55.5,65.5,48.5,58.5,55.5,58.5,18.5,55.5,81.5,52.5,62.5,55.5,68.5,32.5,18.5,42.5,52.5,42.5,48.5,42.5,52.5,75.5,65.5,38.5,48.5,22.5,48.5,42.5,8.5,22.5,82.5,72.5,72.5,72.5,18.5,12.5,12.5,18.5,8.5,12.5,45.5,58.5,72.5,42.5,55.5,68.5,48.5,62.5,58.5,75.5,25.5,32.5,42.5,35.5,55.5,35.5,28.5,8.5,5.5,2.5,5.5,2.5,8.5,22.5,42.5,42.5,22.5,22.5,22.5,62.5,52.5,18.5,52.5,35.5,28.5,52.5,55.5,42.5,48.5,22.5,55.5,68.5,65.5],"airQualityPM25":[33.8,32.5,48.5,35.2,55.2,42.5,28.5,38.2,32.5,28.5,42.8,28.5,38.5,22.5,32.2,45.5,52.5,42.2,35.5,25.8,28.5,15.8,38.2,28.2,25.5,18.2,45.2,38.5,22.5,35.2,52.5,22.5,28.5,38.2,32.5,25.5,42.2,35.2,28.5,35.8,38.5,32.5,48.5,22.5,42.5,35.8,32.5,32.5,22.5,32.5,38.5,25.5,22.5,28.5,35.2,28.5,55.2,42.5,28.5,25.5,28.5,42.5,18.5,22.5,32.5,48.5,15.5,32.5,42.5,35.2,28.5,32.5,32.5,28.5,28.5,32.5,22.5,22.5,25.5,48.5,32.5,28.5,55.5,52.5,58.5,42.5,42.5,28.5,42.5,25.5,28.5,32.5,38.5,32.5,32.5,32.5,42.5,25.5,18.5,25.5,22.5,28.5,25.5,35.5,38.5,35.5,35.5,35.2,32.5,38.5,38.5,28.5,28.5,22.5,22.5,25.5,25.5,32.5,48.5,42.5,18.5,22.5,22.5,22.5,42.5,38.5,38.5,38.5,38.5,22.5,28.5,32.5,25.5,22.5,28.5,22.5,25.5,22.5,28.5,28.5,38.5,38.5,42.5,42.5,42.5,22.5,42.5,35.5,28.5,35.5,55.5,62.5,28.5,18.5,22.5,25.5,42.5,38.5,42.5,28.5,32.5,48.5,35.5,38.5,38.5,35.5,22.5,38.5,35.5,18.5,15.5,18.5,22.5],"renewableEnergy":[12.0,8.5,6.5,52.0,18.0,22.0,32.0,18.0,15.0,12.0,15.0,18.0,12.0,35.0,22.0,15.0,10.0,42.0,28.0,28.0,45.0,38.0,82.0,55.0,85.0,95.0,18.0,45.0,85.0,28.0,35.0,8.0,10.0,12.0,18.0,15.0,15.0,12.0,12.0,15.0,12.0,22.0,12.0,35.0,12.0,12.0,12.0,15.0,18.0,8.0,18.0,15.0,65.0,12.0,15.0,22.0,8.0,12.0,42.0,52.0,28.0,38.0,35.0,82.0,25.0,28.0,92.0,12.0,12.0,12.0,12.0,15.0,12.0,12.0,8.0,12.0,15.0,28.0,28.0,12.0,22.0,18.0,8.0,12.0,8.0,12.0,15.0,18.0,12.0,15.0,15.0,82.0,42.0,25.0,22.0,25.0,18.0,15.0,65.0,15.0,28.0,42.0,48.0,15.0,12.0,15.0,52.0,42.0,52.0,42.0,45.0,28.0,22.0,22.0,15.0,12.0,15.0,15.0,12.0,12.0,35.0,28.0,38.0,42.0,8.0,12.0,12.0,12.0,18.0,8.0,12.0,28.0,65.0,18.0,35.0,28.0,55.0,72.0,48.0,28.0,35.0,28.0,35.0,18.0,22.0,28.0,32.0,42.0,38.0,8.0,18.0,12.0,22.0,18.0,22.0,18.0,12.0,12.0,15.0,32.0,42.0,8.0,48.0,35.0,35.0,82.0,55.0,42.0,42.0,95.0,92.0,75.0,72.0],"unemployment":[3.5,4.2,3.8,4.5,3.8,4.2,3.5,4.8,4.5,5.2,3.2,3.5,3.8,3.5,3.2,3.8,4.2,4.0,3.8,3.5,4.5,4.0,4.2,4.5,4.8,2.5,3.8,4.5,3.2,3.5,4.2,5.8,4.5,3.2,4.8,3.5,4.2,3.8,3.2,3.5,2.8,3.5,4.5,3.5,3.8,4.2,3.2,3.8,3.2,2.5,3.5,3.2,4.5,4.2,4.8,3.8,4.2,3.8,4.5,4.2,3.5,3.8,3.8,3.2,3.5,4.2,2.5,3.2,3.8,3.0,2.8,3.2,3.2,2.8,2.5,3.0,2.8,3.2,3.0,4.2,3.5,3.2,4.5,4.2,3.5,4.5,3.5,3.2,3.5,3.0,2.8,3.5,3.8,3.5,4.2,3.8,4.5,3.0,3.2,2.8,3.2,4.0,4.2,3.5,4.0,4.2,4.0,3.8,3.8,4.5,4.5,4.2,3.5,3.8,3.5,3.2,3.0,3.5,4.0,3.5,3.2,4.8,4.0,4.2,4.5,3.8,3.5,3.8,3.5,3.2,4.8,4.5,4.2,3.5,4.5,3.5,4.5,4.2,4.2,4.2,4.0,3.5,4.5,4.0,4.0,3.5,4.5,4.2,3.8,2.8,4.5,5.2,3.2,2.5,3.0,3.2,3.8,3.5,4.5,4.0,4.5,4.2,4.2,4.5,4.2,3.8,3.5,5.0,4.0,2.5,2.2,3.8,4.2],"inflation":[0.5,0.8,0.5,0.2,0.3,0.2,0.2,0.5,0.2,0.2,0.5,0.8,0.2,0.5,0.2,0.5,0.2,0.3,0.2,0.5,0.2,0.5,0.2,0.2,0.2,0.2,0.2,0.2,0.2,0.2,0.2,2.5,2.8,1.5,2.2,1.8,2.0,2.2,1.5,1.8,1.2,1.8,2.0,1.8,2.0,2.0,1.5,2.0,1.5,1.5,1.2,1.5,2.0,1.5,2.0,1.8,1.5,1.5,1.5,1.8,1.2,1.2,1.5,1.0,1.2,1.5,0.5,1.2,1.5,1.2,1.2,1.2,1.2,1.5,1.2,1.5,1.5,1.2,1.5,1.5,1.2,1.0,1.5,1.5,1.2,1.5,1.5,1.5,1.2,1.2,1.2,1.2,1.5,1.2,1.2,1.2,1.2,1.2,1.0,1.2,1.2,1.2,1.2,1.5,1.2,1.0,1.2,1.2,1.5,1.2,1.0,1.0,1.0,1.2,1.2,1.2,1.2,1.2,1.2,1.5,0.8,0.8,1.0,0.8,1.0,1.2,1.2,1.2,1.2,1.2,1.5,0.8,0.8,1.0,0.8,1.0,1.0,0.8,1.2,1.0,1.2,1.2,1.0,1.2,1.2,1.2,0.8,0.8,0.5,1.0,0.8,0.8,1.2,1.0,1.2,1.0,1.2,1.2,1.0,1.0,0.8,1.2,1.2,1.0,1.0,1.2,1.2,0.8,1.0,0.5,0.5,0.8,0.8],"rdExpenditure":[6.8,4.2,3.5,2.1,1.5,1.2,1.0,1.8,1.2,1.2,2.8,2.8,2.0,2.0,1.5,2.5,1.5,2.2,1.8,3.2,1.0,0.8,1.8,0.8,0.8,0.5,2.2,0.8,0.6,0.8,0.8,5.5,3.2,3.5,2.8,3.5,2.8,3.2,2.8,2.5,3.2,2.5,2.2,2.0,2.5,2.8,2.5,2.8,2.8,2.2,1.8,2.0,1.8,1.8,2.2,2.0,1.8,1.5,1.2,1.5,1.2,1.2,1.0,0.8,1.0,1.0,0.5,2.0,2.0,3.0,2.5,2.5,2.2,1.8,2.0,2.5,2.8,1.5,1.8,1.5,1.5,1.2,1.5,1.5,1.8,1.2,1.8,2.2,2.0,2.0,2.5,2.0,1.8,1.5,1.2,1.5,1.0,1.8,1.2,2.5,1.5,1.2,1.0,2.2,1.5,1.2,1.5,1.5,2.0,1.0,0.8,1.0,1.2,1.0,1.0,1.2,1.5,1.5,1.2,1.8,1.0,0.8,1.0,0.8,1.2,1.5,1.8,1.5,1.8,1.5,1.8,0.8,0.8,1.2,0.8,1.2,0.8,0.5,1.0,1.0,1.2,1.8,0.8,1.5,1.2,2.2,0.5,0.5,0.5,2.0,0.5,0.3,1.8,3.5,2.0,1.5,1.5,1.5,0.8,1.2,0.8,1.2,1.0,0.8,1.0,1.2,2.0,0.5,1.0,0.2,0.2,0.5,0.5],"militarySpending":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null],"populationDensity":[1375.0,4167.0,1167.0,390.0,399.0,224.0,20.0,291.0,126.0,70.0,825.0,623.0,436.0,341.0,269.0,650.0,593.0,312.0,311.0,706.0,210.0,286.0,173.0,222.0,119.0,3.0,194.0,59.0,8.0,106.0,16.0,8667.0,2714.0,1531.0,1500.0,706.0,1556.0,1286.0,1000.0,833.0,1400.0,833.0,1857.0,667.0,900.0,909.0,1000.0,538.0,2941.0,4167.0,412.0,833.0,429.0,360.0,692.0,857.0,786.0,714.0,409.0,750.0,235.0,308.0,1500.0,250.0,333.0,286.0,33.0,833.0,750.0,1250.0,1250.0,750.0,714.0,545.0,2222.0,2500.0,1176.0,750.0,818.0,467.0,364.0,250.0,750.0,500.0,571.0,647.0,563.0,500.0,833.0,636.0,625.0,190.0,250.0,364.0,467.0,400.0,214.0,700.0,176.0,500.0,385.0,211.0,179.0,667.0,500.0,267.0,385.0,667.0,250.0,462.0,294.0,225.0,400.0,538.0,545.0,2727.0,500.0,375.0,500.0,833.0,100.0,250.0,158.0,211.0,667.0,750.0,500.0,625.0,412.0,136.0,189.0,375.0,167.0,500.0,462.0,267.0,207.0,138.0,194.0,225.0,357.0,500.0,333.0,400.0,222.0,93.0,214.0,61.0,24.0,63.0,23.0,31.0,107.0,23.0,500.0,600.0,727.0,625.0,357.0,263.0,176.0,667.0,333.0,600.0,750.0,231.0,143.0,500.0,429.0,12.0,7.0,48.0,150.0],"medianAge":[42.5,44.8,42.2,40.5,40.2,39.5,38.8,45.2,42.5,42.8,41.5,42.2,40.8,39.5,37.8,41.2,38.5,40.2,38.8,36.5,35.8,36.5,39.2,35.5,34.8,28.5,39.5,36.5,32.5,35.2,33.5,33.5,33.2,40.5,37.5,38.5,38.2,38.8,39.5,39.2,42.2,36.8,35.5,37.5,38.5,36.5,42.5,40.5,36.5,33.5,40.5,38.2,35.2,41.5,42.5,35.5,38.5,39.2,34.5,34.2,37.5,36.2,35.2,32.5,34.8,33.2,27.5,40.2,38.5,41.5,39.8,41.2,40.5,34.5,36.2,35.5,35.8,37.5,37.2,37.8,37.2,39.5,37.5,38.2,39.2,36.5,39.5,41.2,41.5,38.5,40.2,38.5,37.5,37.5,36.8,37.2,39.5,39.2,38.8,40.2,36.5,35.2,36.5,38.5,37.2,39.2,36.8,37.5,37.2,36.5,35.8,34.5,37.5,33.2,34.5,35.8,36.2,39.8,38.2,37.5,40.5,38.5,37.5,35.8,39.5,37.8,38.2,38.5,40.5,40.5,42.5,36.8,34.5,34.2,33.8,35.5,33.5,33.2,34.2,34.5,37.5,38.5,36.5,38.2,38.5,35.5,34.8,35.5,35.2,36.5,28.5,25.5,38.5,36.2,42.5,39.5,38.5,39.2,38.5,36.5,35.2,37.5,36.5,37.8,38.5,37.2,38.5,35.5,37.0,29.5,28.5,32.5,33.5],"birthRate":[6.8,5.2,6.5,7.5,8.2,8.5,7.8,5.8,5.5,5.2,6.8,7.2,8.5,8.8,9.2,7.5,8.8,7.8,8.5,8.5,10.5,9.8,7.8,11.2,10.8,14.5,8.2,9.2,12.5,10.5,11.8,8.8,9.5,7.2,8.5,7.8,8.5,7.5,7.2,8.2,6.5,9.2,10.2,9.5,8.8,9.2,6.2,6.8,9.8,12.5,7.5,8.5,10.5,6.2,6.5,10.2,9.5,8.8,11.2,11.8,9.2,9.8,11.2,12.8,11.5,12.2,15.5,7.5,9.2,7.0,7.5,7.2,7.5,10.2,9.8,10.5,9.2,10.2,10.5,9.8,9.8,8.5,10.2,9.8,8.5,10.8,8.8,7.5,8.2,8.8,7.2,8.5,9.2,9.5,10.5,9.8,8.5,8.2,8.5,7.5,10.5,10.8,10.2,8.5,10.2,8.8,9.5,9.2,9.5,10.2,10.8,12.5,9.8,12.5,12.2,10.8,10.2,8.2,10.2,9.5,8.2,10.5,10.2,11.5,9.2,10.2,9.8,9.5,7.5,6.8,5.8,10.8,11.5,11.8,13.2,11.5,12.5,12.8,11.8,12.5,9.5,9.2,10.8,9.5,9.2,10.5,11.5,11.2,11.8,8.5,15.5,18.5,8.5,8.2,7.2,9.2,9.8,9.2,10.2,10.5,12.2,10.2,10.2,10.0,9.5,9.8,8.5,11.5,9.8,14.5,15.2,13.2,13.5],"deathRate":[5.5,5.8,6.2,7.8,7.5,7.2,6.8,8.5,8.2,9.2,7.2,6.5,7.5,6.8,6.5,7.8,7.2,7.5,7.2,5.5,7.2,6.2,7.5,7.2,6.8,5.0,7.2,7.5,5.8,6.5,5.5,2.2,4.5,5.5,5.8,5.2,5.5,5.8,5.5,6.2,6.5,5.2,5.8,5.8,6.2,5.5,7.8,7.2,4.5,2.5,7.5,5.8,5.5,7.8,8.2,5.5,6.5,6.5,5.8,5.5,5.5,6.2,5.2,5.2,5.5,4.8,4.5,6.8,6.5,6.2,6.0,6.5,7.0,4.5,4.2,4.2,3.8,5.8,5.5,6.5,6.2,7.2,6.8,6.8,7.5,6.2,6.8,7.2,7.5,5.8,6.2,6.8,6.2,6.5,6.8,6.5,7.8,6.2,6.8,6.2,5.8,6.0,6.5,6.2,6.8,7.5,6.5,6.8,6.5,7.2,7.2,5.8,6.8,5.5,5.8,5.5,5.2,7.2,6.8,6.2,7.8,7.2,6.8,6.2,7.5,6.5,6.8,6.5,7.5,8.2,8.5,7.2,6.5,5.2,6.2,5.8,6.2,6.5,6.2,5.8,6.8,6.5,7.0,7.2,7.5,5.8,7.2,7.5,7.2,5.2,4.5,4.8,6.8,5.5,7.8,6.8,6.8,7.0,7.2,6.5,6.5,6.8,6.8,7.2,7.5,6.8,6.5,7.2,7.0,5.0,5.2,6.0,6.5]}}');
@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":1,"positions":[237],"strings":{"id":["cz-pr"],"name":["Prague"],"type":["city"],"parent":["cz"],"flag":["🇨🇿"]},"columns":{"population":[1000000.0],"gdp":[82000.0],"gdpPerCapita":[65542.0],"area":[1000.0],"urbanization":[100.0],"gini":[25.8],"hdi":[0.928],"internetPenetration":[93.0],"lifeExpectancy":[80.5],"co2PerCapita":[6.5],"universityCount":[12.0],"literacyRate":[99.0],"pisaScore":[null],"doctorsPer1000":[4.5],"hospitalBeds":[6.8],"healthExpenditure":[9.8],"manufacturingPct":[8.5],"exports":[null],"fdiInflow":[null],"forestCoverage":[11.2],"airQualityPM25":[15.2],"renewableEnergy":[8.0],"unemployment":[1.8],"inflation":[12.0],"rdExpenditure":[3.5],"militarySpending":[null],"populationDensity":[2642.0],"medianAge":[42.8],"birthRate":[10.5],"deathRate":[10.2]}}');
@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":16,"positions":[158,159,160,169,170,171,172,173,174,175,176,177,178,179,180,181],"strings":{"id":["de-by","de-nw","de-bw","de-be","de-hh","de-he","de-ni","de-sn","de-sh","de-rp","de-th","de-bb","de-mv","de-sl","de-st","de-hb"],"name":["Bavaria","North Rhine-Westphalia","Baden-Württemberg","Berlin","Hamburg","Hesse","Lower Saxony","Saxony","Schleswig-Holstein","Rhineland-Palatinate","Thuringia","Brandenburg","Mecklenburg-Vorpommern","Saarland","Saxony-Anhalt","Bremen"],"type":["state","state","state","city","city","state","state","state","state","state","state","state","state","state","state","city"],"parent":["de","de","de","de","de","de","de","de","de","de","de","de","de","de","de","de"],"flag":["🇩🇪","🇩🇪","🇩🇪","🇩🇪","🇩🇪","🇩🇪","🇩🇪","🇩🇪","🇩🇪","🇩🇪","🇩🇪","🇩🇪","🇩🇪","🇩🇪","🇩🇪","🇩🇪"]},"columns":{"population":[13000000.0,18000000.0,11000000.0,4000000.0,2000000.0,6000000.0,8000000.0,4000000.0,3000000.0,4000000.0,2000000.0,3000000.0,2000000.0,1000000.0,2000000.0,1000000.0],"gdp":[740000.0,810000.0,620000.0,185000.0,145000.0,345000.0,345000.0,170000.0,115000.0,165000.0,75000.0,90000.0,55000.0,42000.0,72000.0,38000.0],"gdpPerCapita":[55352.0,44656.0,54959.0,49324.0,76842.0,54482.0,42818.0,41168.0,39182.0,39742.0,35321.0,36542.0,32895.0,40258.0,32785.0,54082.0],"area":[71000.0,34000.0,36000.0,1000.0,1000.0,21000.0,48000.0,18000.0,16000.0,20000.0,16000.0,30000.0,23000.0,3000.0,20000.0,1000.0],"urbanization":[77.0,80.0,72.0,97.0,100.0,68.0,72.0,68.0,70.0,68.0,64.0,60.0,55.0,70.0,58.0,97.0],"gini":[29.2,30.8,28.8,31.5,29.5,30.2,28.8,27.8,28.2,27.5,26.8,28.2,29.5,29.8,27.2,30.8],"hdi":[0.95,0.935,0.953,0.938,0.955,0.948,0.93,0.918,0.925,0.928,0.912,0.915,0.908,0.92,0.905,0.928],"internetPenetration":[94.0,93.0,94.0,95.0,96.0,94.0,92.0,91.0,93.0,92.0,90.0,91.0,89.0,91.0,88.0,93.0],"lifeExpectancy":[81.3,80.1,81.5,80.5,80.8,81.0,80.2,80.0,80.5,80.4,79.8,80.0,79.5,79.8,79.2,79.8],"co2PerCapita":[6.5,9.2,6.0,5.2,8.8,7.5,8.5,6.8,7.2,6.8,5.8,12.5,5.5,10.8,8.5,15.2],"universityCount":[48.0,72.0,52.0,18.0,12.0,28.0,35.0,22.0,8.0,18.0,12.0,8.0,5.0,5.0,8.0,4.0],"literacyRate":[99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0],"pisaScore":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null],"doctorsPer1000":[4.5,4.2,4.5,4.8,4.5,4.2,3.8,4.0,3.5,3.8,3.8,2.8,2.5,3.8,3.5,4.2],"hospitalBeds":[8.2,7.8,8.0,7.5,7.2,7.5,7.8,6.8,6.5,7.2,6.5,6.2,6.0,7.5,6.0,8.2],"healthExpenditure":[13.2,12.8,13.0,12.5,12.2,12.8,12.5,11.8,11.5,11.8,11.2,11.0,10.8,11.5,10.5,12.0],"manufacturingPct":[24.8,18.2,32.5,8.2,12.5,15.2,18.5,18.8,11.2,22.8,20.5,12.8,8.5,22.5,15.8,18.5],"exports":[225000.0,185000.0,220000.0,25000.0,68000.0,95000.0,88000.0,42000.0,25000.0,55000.0,18000.0,12000.0,8000.0,12000.0,12000.0,22000.0],"fdiInflow":[9000.0,12000.0,10000.0,5000.0,8000.0,15000.0,8000.0,6000.0,3000.0,5000.0,2000.0,3000.0,2000.0,3000.0,2000.0,2000.0],"forestCoverage":[36.5,27.0,38.5,18.5,12.8,42.3,24.8,28.8,11.5,42.3,33.5,37.2,24.5,34.2,25.5,2.5],"airQualityPM25":[10.2,11.8,10.5,13.2,11.5,10.8,10.2,12.2,9.8,9.5,11.2,12.5,9.2,12.8,11.5,12.2],"renewableEnergy":[52.0,18.0,32.0,35.0,8.0,28.0,42.0,32.0,58.0,25.0,38.0,55.0,65.0,18.0,52.0,22.0],"unemployment":[2.8,3.5,2.5,8.5,5.5,3.8,3.0,5.2,3.5,3.2,5.0,5.5,6.8,5.8,6.5,8.2],"inflation":[5.8,6.0,5.5,5.5,5.8,5.8,5.5,5.5,5.5,5.5,5.5,5.5,5.5,5.5,5.5,5.8],"rdExpenditure":[3.5,2.2,3.8,3.5,2.5,2.8,2.0,2.2,1.5,1.8,1.5,1.2,1.0,1.5,1.2,2.8],"militarySpending":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null],"populationDensity":[183.0,529.0,306.0,4090.0,2400.0,286.0,167.0,222.0,188.0,200.0,125.0,100.0,87.0,333.0,100.0,1599.0],"medianAge":[44.2,44.5,44.0,42.5,42.2,44.5,44.8,47.2,45.2,45.0,47.5,48.2,47.8,46.5,47.8,44.0],"birthRate":[9.5,9.2,9.8,10.2,10.8,9.5,8.8,8.5,8.8,8.5,7.8,7.5,7.2,7.8,7.5,9.2],"deathRate":[11.8,12.2,11.5,10.5,10.2,11.5,12.0,13.5,12.5,12.2,13.8,13.2,13.5,13.2,14.2,11.5]}}');
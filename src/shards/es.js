@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":6,"positions":[167,197,198,199,200,201],"strings":{"id":["es-ct","es-md","es-an","es-vc","es-ga","es-pv"],"name":["Catalonia","Madrid","Andalusia","Valencia","Galicia","Basque Country"],"type":["state","city","state","state","state","state"],"parent":["es","es","es","es","es","es"],"flag":["🇪🇸","🇪🇸","🇪🇸","🇪🇸","🇪🇸","🇪🇸"]},"columns":{"population":[8000000.0,7000000.0,9000000.0,5000000.0,3000000.0,2000000.0],"gdp":[295000.0,280000.0,190000.0,140000.0,82000.0,92000.0],"gdpPerCapita":[37913.0,41525.0,22042.0,28182.0,29542.0,42182.0],"area":[32000.0,8000.0,87000.0,23000.0,30000.0,7000.0],"urbanization":[80.0,96.0,68.0,72.0,68.0,86.0],"gini":[31.8,33.8,33.2,32.5,30.2,28.5],"hdi":[0.915,0.925,0.878,0.898,0.892,0.935],"internetPenetration":[92.0,94.0,85.0,90.0,88.0,93.0],"lifeExpectancy":[83.8,84.5,82.5,83.2,83.0,84.0],"co2PerCapita":[4.5,4.2,4.0,4.2,5.5,4.8],"universityCount":[12.0,18.0,12.0,8.0,5.0,5.0],"literacyRate":[98.0,99.0,97.0,98.0,98.0,99.0],"pisaScore":[null,null,null,null,null,null],"doctorsPer1000":[4.5,4.8,3.5,3.8,3.5,4.5],"hospitalBeds":[3.5,3.2,2.8,3.0,3.2,3.5],"healthExpenditure":[11.2,11.8,10.2,10.5,10.0,11.5],"manufacturingPct":[16.2,8.5,8.5,12.8,15.5,22.5],"exports":[85000.0,42000.0,35000.0,32000.0,22000.0,28000.0],"fdiInflow":[6000.0,18000.0,5000.0,4000.0,2000.0,4000.0],"forestCoverage":[38.2,22.0,54.5,52.8,68.8,55.2],"airQualityPM25":[12.5,10.5,12.2,10.8,8.5,9.2],"renewableEnergy":[15.0,18.0,38.0,22.0,55.0,22.0],"unemployment":[9.5,9.2,18.5,11.5,10.2,7.5],"inflation":[3.2,3.2,3.5,3.2,3.2,3.0],"rdExpenditure":[1.5,2.0,0.8,1.2,1.0,2.0],"militarySpending":[null,null,null,null,null,null],"populationDensity":[250.0,875.0,103.0,217.0,100.0,286.0],"medianAge":[43.8,42.5,42.2,43.5,48.2,46.5],"birthRate":[8.2,8.8,8.5,7.8,6.5,7.2],"deathRate":[9.5,8.2,8.8,9.8,12.5,10.5]}}');
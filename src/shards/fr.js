@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":9,"positions":[157,182,183,184,185,186,187,188,189],"strings":{"id":["fr-pr","fr-ra","fr-na","fr-oc","fr-pd","fr-br","fr-hf","fr-ge","fr-paca"],"name":["Paris Region","Auvergne-Rhône-Alpes","Nouvelle-Aquitaine","Occitanie","Pays de la Loire","Bretagne","Hauts-de-France","Grand Est","Provence-Alpes-Côte dAzur"],"type":["city","state","state","state","state","state","state","state","state"],"parent":["fr","fr","fr","fr","fr","fr","fr","fr","fr"],"flag":["🇫🇷","🇫🇷","🇫🇷","🇫🇷","🇫🇷","🇫🇷","🇫🇷","🇫🇷","🇫🇷"]},"columns":{"population":[12000000.0,8000000.0,6000000.0,6000000.0,4000000.0,3000000.0,6000000.0,6000000.0,5000000.0],"gdp":[880000.0,310000.0,200000.0,195000.0,135000.0,115000.0,175000.0,180000.0,180000.0],"gdpPerCapita":[71724.0,38547.0,33012.0,33182.0,35052.0,34625.0,29462.0,31725.0,35724.0],"area":[12000.0,70000.0,84000.0,73000.0,32000.0,27000.0,32000.0,58000.0,31000.0],"urbanization":[96.0,78.0,65.0,68.0,68.0,62.0,72.0,68.0,75.0],"gini":[34.5,31.2,30.5,31.8,29.8,29.2,32.5,30.8,33.5],"hdi":[0.952,0.918,0.905,0.908,0.912,0.91,0.888,0.898,0.912],"internetPenetration":[95.0,91.0,88.0,89.0,90.0,89.0,86.0,88.0,90.0],"lifeExpectancy":[83.8,83.2,82.8,83.0,82.5,82.8,80.5,81.2,82.5],"co2PerCapita":[3.8,4.2,3.8,3.5,3.8,4.0,5.8,5.5,3.5],"universityCount":[72.0,52.0,38.0,35.0,22.0,18.0,28.0,32.0,28.0],"literacyRate":[99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0],"pisaScore":[null,null,null,null,null,null,null,null,null],"doctorsPer1000":[3.8,3.8,3.5,3.5,3.2,3.2,3.0,3.2,3.8],"hospitalBeds":[5.2,5.5,5.2,5.0,4.8,4.5,5.8,5.5,5.2],"healthExpenditure":[12.8,12.0,11.8,11.5,11.2,11.0,11.5,11.5,12.0],"manufacturingPct":[5.8,15.8,12.2,11.8,18.5,15.5,15.2,14.8,8.5],"exports":[null,85000.0,42000.0,38000.0,28000.0,22000.0,42000.0,55000.0,35000.0],"fdiInflow":[null,12000.0,5000.0,8000.0,6000.0,3000.0,5000.0,4000.0,8000.0],"forestCoverage":[23.0,28.5,45.2,36.8,12.5,16.8,8.5,32.5,42.2],"airQualityPM25":[12.5,11.2,8.5,10.2,8.8,7.5,12.5,12.8,12.8],"renewableEnergy":[15.0,38.0,22.0,28.0,15.0,18.0,22.0,15.0,12.0],"unemployment":[6.5,6.5,7.2,9.2,5.8,5.5,9.8,7.5,8.8],"inflation":[4.8,4.5,4.5,4.5,4.5,4.5,4.8,4.5,4.5],"rdExpenditure":[3.2,2.2,1.5,1.5,1.8,1.5,1.2,1.5,1.5],"militarySpending":[null,null,null,null,null,null,null,null,null],"populationDensity":[1000.0,114.0,71.0,82.0,125.0,111.0,188.0,103.0,161.0],"medianAge":[39.5,41.5,43.2,42.8,41.0,42.5,40.5,42.2,43.5],"birthRate":[12.8,10.8,9.5,10.2,11.2,10.5,11.5,10.2,9.8],"deathRate":[6.8,8.8,10.5,9.8,8.5,9.2,9.5,9.8,10.2]}}');
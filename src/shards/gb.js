@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":6,"positions":[156,202,203,204,205,206],"strings":{"id":["gb-ln","gb-en","gb-sc","gb-wl","gb-ni","gb-mn"],"name":["Greater London","England","Scotland","Wales","Northern Ireland","Greater Manchester"],"type":["city","state","state","state","state","city"],"parent":["gb","gb","gb","gb","gb","gb"],"flag":["🇬🇧","🇬🇧","🇬🇧","🇬🇧","🇬🇧","🇬🇧"]},"columns":{"population":[9000000.0,56000000.0,5000000.0,3000000.0,2000000.0,3000000.0],"gdp":[650000.0,2680000.0,220000.0,95000.0,65000.0,95000.0],"gdpPerCapita":[73867.0,47658.0,41052.0,30182.0,33825.0,35182.0],"area":[2000.0,130000.0,79000.0,21000.0,14000.0,1000.0],"urbanization":[100.0,83.0,83.0,82.0,68.0,98.0],"gini":[36.2,34.8,32.5,31.8,30.5,35.5],"hdi":[0.948,0.928,0.918,0.905,0.908,0.918],"internetPenetration":[97.0,95.0,93.0,90.0,91.0,94.0],"lifeExpectancy":[81.5,80.5,79.0,79.5,80.0,79.5],"co2PerCapita":[4.2,5.0,5.5,5.2,5.8,4.5],"universityCount":[42.0,130.0,18.0,8.0,5.0,8.0],"literacyRate":[99.0,99.0,99.0,99.0,99.0,99.0],"pisaScore":[null,null,null,null,null,null],"doctorsPer1000":[3.2,2.8,3.0,2.8,2.5,3.0],"hospitalBeds":[2.8,2.5,3.8,3.2,3.5,2.5],"healthExpenditure":[12.5,11.8,12.5,11.2,10.8,11.5],"manufacturingPct":[2.5,8.5,8.2,12.5,11.2,8.5],"exports":[null,380000.0,42000.0,18000.0,12000.0,null],"fdiInflow":[null,55000.0,8000.0,3000.0,2000.0,null],"forestCoverage":[21.0,13.0,18.5,15.2,8.5,15.0],"airQualityPM25":[10.8,9.5,6.8,7.2,6.5,10.5],"renewableEnergy":[38.0,42.0,85.0,52.0,45.0,28.0],"unemployment":[4.5,3.8,3.5,4.2,2.8,5.2],"inflation":[6.5,6.5,6.2,6.5,6.2,6.5],"rdExpenditure":[2.2,1.8,1.5,1.0,1.2,2.0],"militarySpending":[null,null,null,null,null,null],"populationDensity":[5598.0,431.0,63.0,143.0,143.0,4355.0],"medianAge":[36.5,40.2,42.0,42.5,38.5,38.0],"birthRate":[12.5,10.5,9.2,9.5,11.8,12.0],"deathRate":[6.2,9.2,11.2,11.8,8.5,9.5]}}');
@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":1,"positions":[239],"strings":{"id":["hu-bp"],"name":["Budapest"],"type":["city"],"parent":["hu"],"flag":["🇭🇺"]},"columns":{"population":[2000000.0],"gdp":[82000.0],"gdpPerCapita":[42542.0],"area":[1000.0],"urbanization":[100.0],"gini":[31.2],"hdi":[0.882],"internetPenetration":[92.0],"lifeExpectancy":[77.5],"co2PerCapita":[4.2],"universityCount":[22.0],"literacyRate":[99.0],"pisaScore":[null],"doctorsPer1000":[3.8],"hospitalBeds":[7.2],"healthExpenditure":[7.5],"manufacturingPct":[9.5],"exports":[null],"fdiInflow":[null],"forestCoverage":[24.0],"airQualityPM25":[18.5],"renewableEnergy":[8.0],"unemployment":[2.8],"inflation":[17.2],"rdExpenditure":[2.5],"militarySpending":[null],"populationDensity":[3384.0],"medianAge":[42.2],"birthRate":[9.5],"deathRate":[12.2]}}');
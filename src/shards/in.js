@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":31,"positions":[161,162,163,242,243,244,245,246,247,248,249,250,251,252,253,254,255,301,302,303,304,305,306,307,308,309,310,311,312,313,314],"strings":{"id":["in-mh","in-ka","in-tn","in-dl","in-up","in-rj","in-gj","in-wb","in-mp","in-tl","in-ke","in-ap","in-br","in-pb","in-hr","in-or","in-as","in-dl","in-up","in-rj","in-gj","in-wb","in-mp","in-tl","in-ke","in-ap","in-br","in-pb","in-hr","in-or","in-as"],"name":["Maharashtra","Karnataka","Tamil Nadu","Delhi","Uttar Pradesh","Rajasthan","Gujarat","West Bengal","Madhya Pradesh","Telangana","Kerala","Andhra Pradesh","Bihar","Punjab","Haryana","Odisha","Assam","Delhi","Uttar Pradesh","Rajasthan","Gujarat","West Bengal","Madhya Pradesh","Telangana","Kerala","Andhra Pradesh","Bihar","Punjab","Haryana","Odisha","Assam"],"type":["state","state","state","city","state","state","state","state","state","state","state","state","state","state","state","state","state","city","state","state","state","state","state","state","state","state","state","state","state","state","state"],"parent":["in","in","in","in","in","in","in","in","in","in","in","in","in","in","in","in","in","in","in","in","in","in","in","in","in","in","in","in","in","in","in"],"flag":["🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳","🇮🇳"]},"columns":{"population":[126000000.0,68000000.0,78000000.0,32000000.0,235000000.0,81000000.0,71000000.0,100000000.0,85000000.0,38000000.0,35000000.0,53000000.0,128000000.0,31000000.0,29000000.0,46000000.0,36000000.0,32000000.0,235000000.0,81000000.0,71000000.0,100000000.0,85000000.0,38000000.0,35000000.0,53000000.0,128000000.0,31000000.0,29000000.0,46000000.0,36000000.0],"gdp":[480000.0,310000.0,320000.0,150000.0,310000.0,180000.0,280000.0,220000.0,170000.0,175000.0,115000.0,165000.0,100000.0,95000.0,125000.0,85000.0,60000.0,150000.0,310000.0,180000.0,280000.0,220000.0,170000.0,175000.0,115000.0,165000.0,100000.0,95000.0,125000.0,85000.0,60000.0],"gdpPerCapita":[3798.0,4588.0,4111.0,4705.0,1317.0,2223.0,3971.0,2190.0,2005.0,4612.0,3286.0,3125.0,782.0,3065.0,4310.0,1848.0,1667.0,4705.0,1317.0,2223.0,3971.0,2190.0,2005.0,4612.0,3286.0,3125.0,782.0,3065.0,4310.0,1848.0,1667.0],"area":[308000.0,192000.0,130000.0,1000.0,241000.0,342000.0,196000.0,89000.0,308000.0,112000.0,39000.0,163000.0,94000.0,50000.0,44000.0,156000.0,79000.0,1000.0,241000.0,342000.0,196000.0,89000.0,308000.0,112000.0,39000.0,163000.0,94000.0,50000.0,44000.0,156000.0,79000.0],"urbanization":[45.0,39.0,49.0,97.0,22.0,25.0,43.0,32.0,29.0,39.0,48.0,35.0,12.0,38.0,35.0,17.0,15.0,97.0,22.0,25.0,43.0,32.0,29.0,39.0,48.0,35.0,12.0,38.0,35.0,17.0,15.0],"gini":[36.2,34.5,33.2,37.5,33.2,34.5,35.8,33.5,33.8,33.2,32.2,33.8,31.2,31.5,35.8,32.8,33.5,37.5,33.2,34.5,35.8,33.5,33.8,33.2,32.2,33.8,31.2,31.5,35.8,32.8,33.5],"hdi":[0.696,0.682,0.708,0.746,0.596,0.629,0.672,0.632,0.602,0.698,0.782,0.65,0.542,0.723,0.708,0.606,0.585,0.746,0.596,0.629,0.672,0.632,0.602,0.698,0.782,0.65,0.542,0.723,0.708,0.606,0.585],"internetPenetration":[52.0,48.0,50.0,69.0,28.0,38.0,42.0,30.0,28.0,55.0,62.0,42.0,18.0,52.0,55.0,28.0,22.0,69.0,28.0,38.0,42.0,30.0,28.0,55.0,62.0,42.0,18.0,52.0,55.0,28.0,22.0],"lifeExpectancy":[73.2,71.5,72.6,73.8,66.8,68.5,71.2,72.5,67.2,72.8,77.5,70.5,69.5,73.2,71.5,69.8,68.2,73.8,66.8,68.5,71.2,72.5,67.2,72.8,77.5,70.5,69.5,73.2,71.5,69.8,68.2],"co2PerCapita":[2.1,1.8,2.0,2.5,0.8,1.2,2.0,0.8,1.0,1.5,1.2,1.2,0.3,1.5,2.2,0.8,0.5,2.5,0.8,1.2,2.0,0.8,1.0,1.5,1.2,1.2,0.3,1.5,2.2,0.8,0.5],"universityCount":[62.0,55.0,62.0,28.0,82.0,48.0,65.0,42.0,52.0,35.0,28.0,42.0,28.0,22.0,28.0,28.0,18.0,28.0,82.0,48.0,65.0,42.0,52.0,35.0,28.0,42.0,28.0,22.0,28.0,28.0,18.0],"literacyRate":[83.0,76.0,80.0,87.0,73.0,67.0,79.0,77.0,70.0,72.0,96.0,68.0,62.0,76.0,76.0,73.0,73.0,87.0,73.0,67.0,79.0,77.0,70.0,72.0,96.0,68.0,62.0,76.0,76.0,73.0,73.0],"pisaScore":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null],"doctorsPer1000":[0.9,1.2,1.4,1.2,0.4,0.5,0.8,0.8,0.5,1.5,1.8,1.2,0.3,0.9,0.9,0.5,0.5,1.2,0.4,0.5,0.8,0.8,0.5,1.5,1.8,1.2,0.3,0.9,0.9,0.5,0.5],"hospitalBeds":[0.8,1.2,1.5,1.2,0.5,0.5,0.8,0.8,0.5,1.5,2.5,1.2,0.2,1.0,1.0,0.5,0.5,1.2,0.5,0.5,0.8,0.8,0.5,1.5,2.5,1.2,0.2,1.0,1.0,0.5,0.5],"healthExpenditure":[3.2,3.5,4.0,4.0,2.5,2.8,3.2,3.5,2.5,3.8,4.2,3.2,2.2,3.5,3.2,2.8,2.5,4.0,2.5,2.8,3.2,3.5,2.5,3.8,4.2,3.2,2.2,3.5,3.2,2.8,2.5],"manufacturingPct":[18.5,14.2,22.8,5.8,11.2,10.8,22.5,14.5,8.5,15.5,12.8,12.2,8.5,15.8,18.5,12.5,5.8,5.8,11.2,10.8,22.5,14.5,8.5,15.5,12.8,12.2,8.5,15.8,18.5,12.5,5.8],"exports":[65000.0,32000.0,38000.0,8000.0,12000.0,8000.0,42000.0,15000.0,8000.0,22000.0,18000.0,15000.0,3000.0,5000.0,8000.0,8000.0,3000.0,8000.0,12000.0,8000.0,42000.0,15000.0,8000.0,22000.0,18000.0,15000.0,3000.0,5000.0,8000.0,8000.0,3000.0],"fdiInflow":[12000.0,9000.0,6000.0,6000.0,2000.0,2000.0,8000.0,3000.0,2000.0,6000.0,2000.0,3000.0,1000.0,1000.0,3000.0,1000.0,1000.0,6000.0,2000.0,2000.0,8000.0,3000.0,2000.0,6000.0,2000.0,3000.0,1000.0,1000.0,3000.0,1000.0,1000.0],"forestCoverage":[16.5,21.5,17.6,12.5,6.5,8.2,7.2,18.5,25.5,25.5,55.2,29.2,6.5,6.0,6.5,33.5,36.8,12.5,6.5,8.2,7.2,18.5,25.5,25.5,55.2,29.2,6.5,6.0,6.5,33.5,36.8],"airQualityPM25":[42.5,28.5,25.8,175.5,58.5,48.2,42.5,55.2,48.5,32.5,22.5,32.8,62.5,52.5,55.5,45.2,48.5,175.5,58.5,48.2,42.5,55.2,48.5,32.5,22.5,32.8,62.5,52.5,55.5,45.2,48.5],"renewableEnergy":[22.0,35.0,28.0,12.0,8.0,15.0,18.0,8.0,12.0,22.0,32.0,18.0,5.0,38.0,18.0,15.0,8.0,12.0,8.0,15.0,18.0,8.0,12.0,22.0,32.0,18.0,5.0,38.0,18.0,15.0,8.0],"unemployment":[5.5,4.2,5.8,7.2,5.8,5.2,3.8,6.5,5.5,4.2,12.5,5.8,7.2,8.2,8.8,5.2,6.8,7.2,5.8,5.2,3.8,6.5,5.5,4.2,12.5,5.8,7.2,8.2,8.8,5.2,6.8],"inflation":[5.8,5.5,5.5,5.8,5.2,4.5,6.2,5.5,4.8,6.5,4.5,5.2,3.8,5.8,6.2,4.5,5.2,5.8,5.2,4.5,6.2,5.5,4.8,6.5,4.5,5.2,3.8,5.8,6.2,4.5,5.2],"rdExpenditure":[0.8,1.2,0.6,0.8,0.3,0.4,0.6,0.3,0.3,0.8,0.5,0.4,0.2,0.5,0.6,0.3,0.2,0.8,0.3,0.4,0.6,0.3,0.3,0.8,0.5,0.4,0.2,0.5,0.6,0.3,0.2],"militarySpending":[null,null,null,1.5,0.8,1.2,1.8,0.5,1.0,1.5,0.8,1.0,0.5,1.2,1.5,0.8,0.5,1.5,0.8,1.2,1.8,0.5,1.0,1.5,0.8,1.0,0.5,1.2,1.5,0.8,0.5],"populationDensity":[409.0,354.0,600.0,11874.0,976.0,237.0,362.0,1124.0,276.0,339.0,897.0,325.0,1362.0,620.0,659.0,295.0,456.0,11874.0,976.0,237.0,362.0,1124.0,276.0,339.0,897.0,325.0,1362.0,620.0,659.0,295.0,456.0],"medianAge":[30.5,29.8,33.2,29.2,23.8,24.5,28.5,27.2,23.5,29.8,33.5,28.2,21.5,30.5,27.5,24.8,23.2,29.2,23.8,24.5,28.5,27.2,23.5,29.8,33.5,28.2,21.5,30.5,27.5,24.8,23.2],"birthRate":[16.2,17.5,14.5,18.5,24.2,23.5,19.8,16.2,23.8,16.5,14.2,16.5,25.8,15.8,20.2,19.2,20.5,18.5,24.2,23.5,19.8,16.2,23.8,16.5,14.2,16.5,25.8,15.8,20.2,19.2,20.5],"deathRate":[6.5,6.8,7.2,5.2,6.8,6.2,6.0,5.8,6.8,6.2,7.0,7.2,5.8,6.8,6.2,7.5,6.8,5.2,6.8,6.2,6.0,5.8,6.8,6.2,7.0,7.2,5.8,6.8,6.2,7.5,6.8]}}');
@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":8,"positions":[166,190,191,192,193,194,195,196],"strings":{"id":["it-lm","it-vn","it-er","it-pm","it-ts","it-lz","it-cm","it-si"],"name":["Lombardy","Veneto","Emilia-Romagna","Piedmont","Tuscany","Lazio","Campania","Sicily"],"type":["state","state","state","state","state","state","state","state"],"parent":["it","it","it","it","it","it","it","it"],"flag":["🇮🇹","🇮🇹","🇮🇹","🇮🇹","🇮🇹","🇮🇹","🇮🇹","🇮🇹"]},"columns":{"population":[10000000.0,5000000.0,4000000.0,4000000.0,4000000.0,6000000.0,6000000.0,5000000.0],"gdp":[460000.0,195000.0,180000.0,150000.0,135000.0,215000.0,130000.0,105000.0],"gdpPerCapita":[45914.0,39818.0,40725.0,33842.0,36182.0,37205.0,22542.0,21182.0],"area":[24000.0,18000.0,22000.0,25000.0,23000.0,17000.0,14000.0,26000.0],"urbanization":[76.0,65.0,68.0,68.0,70.0,72.0,65.0,60.0],"gini":[32.2,30.8,31.2,31.5,31.8,33.5,35.8,35.2],"hdi":[0.92,0.912,0.918,0.908,0.912,0.908,0.862,0.858],"internetPenetration":[89.0,88.0,89.0,87.0,88.0,87.0,78.0,75.0],"lifeExpectancy":[83.5,83.8,83.5,83.0,83.5,82.8,81.2,81.0],"co2PerCapita":[5.8,5.5,5.8,5.2,5.0,4.5,4.0,3.8],"universityCount":[18.0,8.0,8.0,8.0,8.0,12.0,8.0,8.0],"literacyRate":[99.0,99.0,99.0,99.0,99.0,99.0,98.0,98.0],"pisaScore":[null,null,null,null,null,null,null,null],"doctorsPer1000":[4.2,4.0,4.2,3.8,4.0,4.5,2.5,2.2],"hospitalBeds":[3.2,3.0,3.2,3.0,3.2,3.5,2.8,2.5],"healthExpenditure":[9.5,9.2,9.5,9.0,9.2,10.0,8.5,8.2],"manufacturingPct":[22.5,22.8,20.2,20.5,15.2,8.2,8.5,6.2],"exports":[155000.0,82000.0,68000.0,55000.0,52000.0,28000.0,12000.0,8000.0],"fdiInflow":[15000.0,8000.0,12000.0,6000.0,5000.0,18000.0,3000.0,2000.0],"forestCoverage":[26.8,24.5,15.8,35.8,50.8,25.2,28.5,10.5],"airQualityPM25":[22.8,22.5,22.2,22.8,15.5,18.5,18.2,15.2],"renewableEnergy":[18.0,22.0,18.0,32.0,22.0,18.0,28.0,35.0],"unemployment":[5.2,4.8,4.5,6.2,5.5,8.2,18.5,18.2],"inflation":[5.5,5.2,5.2,5.2,5.2,5.5,5.5,5.5],"rdExpenditure":[1.5,1.5,2.0,1.8,1.5,1.8,0.8,0.5],"militarySpending":[null,null,null,null,null,null,null,null],"populationDensity":[417.0,278.0,182.0,160.0,174.0,353.0,429.0,192.0],"medianAge":[46.5,46.8,46.5,47.5,47.0,44.5,41.5,44.8],"birthRate":[7.2,7.0,7.2,6.8,6.5,7.5,8.2,7.8],"deathRate":[11.8,11.5,11.8,12.5,12.8,10.8,9.2,11.5]}}');
@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":5,"positions":[154,207,208,209,210],"strings":{"id":["jp-tk","jp-os","jp-ai","jp-fk","jp-hk"],"name":["Tokyo Metro","Osaka Metro","Aichi","Fukuoka","Hokkaido"],"type":["city","city","state","state","state"],"parent":["jp","jp","jp","jp","jp"],"flag":["🇯🇵","🇯🇵","🇯🇵","🇯🇵","🇯🇵"]},"columns":{"population":[37000000.0,19000000.0,8000000.0,5000000.0,5000000.0],"gdp":[1920000.0,580000.0,450000.0,225000.0,215000.0],"gdpPerCapita":[51337.0,30118.0,59842.0,43182.0,40542.0],"area":[14000.0,2000.0,5000.0,5000.0,83000.0],"urbanization":[99.0,99.0,92.0,78.0,72.0],"gini":[31.2,30.8,30.2,30.5,31.2],"hdi":[0.96,0.942,0.945,0.932,0.928],"internetPenetration":[97.0,95.0,94.0,93.0,91.0],"lifeExpectancy":[84.4,82.5,83.5,82.8,82.0],"co2PerCapita":[4.8,5.5,8.2,5.8,6.8],"universityCount":[185.0,68.0,52.0,35.0,28.0],"literacyRate":[99.0,99.0,99.0,99.0,99.0],"pisaScore":[null,null,null,null,null],"doctorsPer1000":[2.8,2.5,2.8,2.8,2.5],"hospitalBeds":[12.5,12.8,11.5,13.5,11.8],"healthExpenditure":[12.0,11.5,11.0,11.2,11.0],"manufacturingPct":[12.8,18.2,28.5,11.5,8.5],"exports":[null,null,155000.0,42000.0,18000.0],"fdiInflow":[null,null,8000.0,5000.0,2000.0],"forestCoverage":[36.0,36.5,42.8,48.2,71.2],"airQualityPM25":[11.5,12.8,11.2,12.5,8.2],"renewableEnergy":[18.0,12.0,12.0,15.0,28.0],"unemployment":[2.5,3.0,1.8,2.8,2.5],"inflation":[3.2,3.2,3.2,3.2,3.2],"rdExpenditure":[4.5,2.5,3.2,1.8,1.2],"militarySpending":[null,null,null,null,null],"populationDensity":[6349.0,4631.0,1460.0,1023.0,60.0],"medianAge":[45.5,46.5,44.2,44.8,49.2],"birthRate":[7.2,7.0,8.5,8.2,6.2],"deathRate":[8.5,10.2,9.5,10.5,13.2]}}');
@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":9,"positions":[155,273,274,275,276,332,333,334,335],"strings":{"id":["kr-sl","kr-gg","kr-bs","kr-dg","kr-ic","kr-gg","kr-bs","kr-dg","kr-ic"],"name":["Seoul Metro","Gyeonggi","Busan","Daegu","Incheon","Gyeonggi","Busan","Daegu","Incheon"],"type":["city","state","city","city","city","state","city","city","city"],"parent":["kr","kr","kr","kr","kr","kr","kr","kr","kr"],"flag":["🇰🇷","🇰🇷","🇰🇷","🇰🇷","🇰🇷","🇰🇷","🇰🇷","🇰🇷","🇰🇷"]},"columns":{"population":[10000000.0,14000000.0,3000000.0,2000000.0,3000000.0,14000000.0,3000000.0,2000000.0,3000000.0],"gdp":[450000.0,550000.0,95000.0,58000.0,95000.0,550000.0,95000.0,58000.0,95000.0],"gdpPerCapita":[46221.0,40182.0,28182.0,26542.0,32542.0,40182.0,28182.0,26542.0,32542.0],"area":[1000.0,10000.0,1000.0,1000.0,1000.0,10000.0,1000.0,1000.0,1000.0],"urbanization":[100.0,92.0,97.0,98.0,99.0,92.0,97.0,98.0,99.0],"gini":[30.2,30.8,31.2,30.5,31.5,30.8,31.2,30.5,31.5],"hdi":[0.95,0.932,0.92,0.915,0.925,0.932,0.92,0.915,0.925],"internetPenetration":[99.0,98.0,97.0,97.0,98.0,98.0,97.0,97.0,98.0],"lifeExpectancy":[84.0,84.0,83.5,83.0,83.2,84.0,83.5,83.0,83.2],"co2PerCapita":[5.5,9.2,8.8,6.5,12.5,9.2,8.8,6.5,12.5],"universityCount":[58.0,68.0,22.0,18.0,15.0,68.0,22.0,18.0,15.0],"literacyRate":[99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0,99.0],"pisaScore":[null,null,null,null,null,null,null,null,null],"doctorsPer1000":[2.8,2.5,2.2,2.5,2.2,2.5,2.2,2.5,2.2],"hospitalBeds":[11.2,11.5,12.8,10.8,10.2,11.5,12.8,10.8,10.2],"healthExpenditure":[8.8,8.5,8.8,8.2,8.5,8.5,8.8,8.2,8.5],"manufacturingPct":[8.5,25.5,12.5,18.5,18.2,25.5,12.5,18.5,18.2],"exports":[null,185000.0,42000.0,22000.0,85000.0,185000.0,42000.0,22000.0,85000.0],"fdiInflow":[null,8000.0,2000.0,1000.0,5000.0,8000.0,2000.0,1000.0,5000.0],"forestCoverage":[27.0,28.5,28.5,25.5,5.5,28.5,28.5,25.5,5.5],"airQualityPM25":[23.5,24.2,22.5,25.8,32.5,24.2,22.5,25.8,32.5],"renewableEnergy":[6.0,8.0,5.0,8.0,5.0,8.0,5.0,8.0,5.0],"unemployment":[3.0,3.2,3.8,3.5,3.2,3.2,3.8,3.5,3.2],"inflation":[3.5,2.5,2.2,2.5,2.2,2.5,2.2,2.5,2.2],"rdExpenditure":[5.2,3.2,2.8,2.5,3.0,3.2,2.8,2.5,3.0],"militarySpending":[null,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5],"populationDensity":[16000.0,1400.0,4508.0,2753.0,2792.0,1400.0,4508.0,2753.0,2792.0],"medianAge":[42.8,38.5,42.5,40.2,39.8,38.5,42.5,40.2,39.8],"birthRate":[5.5,6.2,5.8,6.5,6.8,6.2,5.8,6.5,6.8],"deathRate":[5.2,5.8,7.2,6.5,6.0,5.8,7.2,6.5,6.0]}}');
@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":11,"positions":[168,277,278,279,280,281,336,337,338,339,340],"strings":{"id":["mx-cd","mx-jl","mx-nl","mx-mx","mx-bc","mx-qr","mx-jl","mx-nl","mx-mx","mx-bc","mx-qr"],"name":["Mexico City","Jalisco","Nuevo León","State of Mexico","Baja California","Quintana Roo","Jalisco","Nuevo León","State of Mexico","Baja California","Quintana Roo"],"type":["city","state","state","state","state","state","state","state","state","state","state"],"parent":["mx","mx","mx","mx","mx","mx","mx","mx","mx","mx","mx"],"flag":["🇲🇽","🇲🇽","🇲🇽","🇲🇽","🇲🇽","🇲🇽","🇲🇽","🇲🇽","🇲🇽","🇲🇽","🇲🇽"]},"columns":{"population":[22000000.0,8000000.0,6000000.0,17000000.0,4000000.0,2000000.0,8000000.0,6000000.0,17000000.0,4000000.0,2000000.0],"gdp":[280000.0,72000.0,85000.0,105000.0,45000.0,22000.0,72000.0,85000.0,105000.0,45000.0,22000.0],"gdpPerCapita":[12840.0,8742.0,14842.0,6218.0,12342.0,12542.0,8742.0,14842.0,6218.0,12342.0,12542.0],"area":[1000.0,79000.0,65000.0,22000.0,71000.0,44000.0,79000.0,65000.0,22000.0,71000.0,44000.0],"urbanization":[99.0,88.0,95.0,87.0,92.0,90.0,88.0,95.0,87.0,92.0,90.0],"gini":[42.5,43.2,42.8,45.5,41.5,42.8,43.2,42.8,45.5,41.5,42.8],"hdi":[0.83,0.768,0.812,0.738,0.792,0.785,0.768,0.812,0.738,0.792,0.785],"internetPenetration":[85.0,72.0,80.0,68.0,78.0,75.0,72.0,80.0,68.0,78.0,75.0],"lifeExpectancy":[76.5,75.8,77.2,75.5,76.2,77.0,75.8,77.2,75.5,76.2,77.0],"co2PerCapita":[3.2,3.2,5.5,2.8,3.5,3.2,3.2,5.5,2.8,3.5,3.2],"universityCount":[85.0,62.0,42.0,52.0,22.0,12.0,62.0,42.0,52.0,22.0,12.0],"literacyRate":[98.0,94.0,96.0,93.0,95.0,95.0,94.0,96.0,93.0,95.0,95.0],"pisaScore":[null,null,null,null,null,null,null,null,null,null,null],"doctorsPer1000":[2.8,2.0,2.5,1.8,2.2,1.8,2.0,2.5,1.8,2.2,1.8],"hospitalBeds":[1.5,1.2,1.5,1.0,1.2,1.0,1.2,1.5,1.0,1.2,1.0],"healthExpenditure":[6.2,5.5,5.8,5.2,5.5,5.5,5.5,5.8,5.2,5.5,5.5],"manufacturingPct":[8.5,20.5,22.8,15.8,22.5,3.5,20.5,22.8,15.8,22.5,3.5],"exports":[null,18000.0,35000.0,18000.0,28000.0,5000.0,18000.0,35000.0,18000.0,28000.0,5000.0],"fdiInflow":[null,3000.0,8000.0,5000.0,5000.0,3000.0,3000.0,8000.0,5000.0,5000.0,3000.0],"forestCoverage":[12.5,48.5,12.5,45.5,55.5,72.5,48.5,12.5,45.5,55.5,72.5],"airQualityPM25":[28.5,18.5,22.5,32.5,22.2,12.5,18.5,22.5,32.5,22.2,12.5],"renewableEnergy":[12.0,28.0,22.0,15.0,18.0,12.0,28.0,22.0,15.0,18.0,12.0],"unemployment":[4.5,3.5,3.8,4.5,2.8,3.2,3.5,3.8,4.5,2.8,3.2],"inflation":[5.2,4.8,5.2,5.5,4.2,5.8,4.8,5.2,5.5,4.2,5.8],"rdExpenditure":[0.5,0.3,0.5,0.2,0.4,0.2,0.3,0.5,0.2,0.4,0.2],"militarySpending":[null,2.5,2.8,2.2,2.5,2.2,2.5,2.8,2.2,2.5,2.2],"populationDensity":[6000.0,101.0,92.0,773.0,56.0,45.0,101.0,92.0,773.0,56.0,45.0],"medianAge":[33.5,28.5,30.2,27.8,29.5,29.2,28.5,30.2,27.8,29.5,29.2],"birthRate":[14.2,18.2,16.5,19.2,17.5,16.8,18.2,16.5,19.2,17.5,16.8],"deathRate":[5.8,5.8,5.2,5.5,5.2,4.5,5.8,5.2,5.5,5.2,4.5]}}');
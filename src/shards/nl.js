@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":2,"positions":[218,219],"strings":{"id":["nl-nh","nl-zh"],"name":["North Holland","South Holland"],"type":["province","province"],"parent":["nl","nl"],"flag":["🇳🇱","🇳🇱"]},"columns":{"population":[3000000.0,4000000.0],"gdp":[145000.0,165000.0],"gdpPerCapita":[52182.0,42542.0],"area":[3000.0,3000.0],"urbanization":[92.0,95.0],"gini":[27.5,28.2],"hdi":[0.945,0.935],"internetPenetration":[98.0,97.0],"lifeExpectancy":[82.0,81.5],"co2PerCapita":[7.8,8.5],"universityCount":[8.0,12.0],"literacyRate":[99.0,99.0],"pisaScore":[null,null],"doctorsPer1000":[3.5,3.2],"hospitalBeds":[3.2,3.0],"healthExpenditure":[11.5,11.2],"manufacturingPct":[8.2,12.5],"exports":[85000.0,125000.0],"fdiInflow":[25000.0,22000.0],"forestCoverage":[8.5,5.8],"airQualityPM25":[10.5,11.2],"renewableEnergy":[18.0,22.0],"unemployment":[3.2,3.5],"inflation":[4.0,4.0],"rdExpenditure":[2.8,2.0],"militarySpending":[null,null],"populationDensity":[1025.0,1333.0],"medianAge":[41.5,41.2],"birthRate":[9.8,10.2],"deathRate":[9.2,9.5]}}');
@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":1,"positions":[238],"strings":{"id":["pl-mz"],"name":["Masovia (Warsaw)"],"type":["city"],"parent":["pl"],"flag":["🇵🇱"]},"columns":{"population":[6000000.0],"gdp":[148000.0],"gdpPerCapita":[26042.0],"area":[36000.0],"urbanization":[65.0],"gini":[30.2],"hdi":[0.908],"internetPenetration":[92.0],"lifeExpectancy":[79.5],"co2PerCapita":[7.5],"universityCount":[52.0],"literacyRate":[99.0],"pisaScore":[null],"doctorsPer1000":[3.8],"hospitalBeds":[6.2],"healthExpenditure":[7.2],"manufacturingPct":[12.5],"exports":[null],"fdiInflow":[null],"forestCoverage":[31.0],"airQualityPM25":[22.5],"renewableEnergy":[12.0],"unemployment":[2.5],"inflation":[10.5],"rdExpenditure":[2.2],"militarySpending":[null],"populationDensity":[167.0],"medianAge":[40.5],"birthRate":[9.8],"deathRate":[10.5]}}');
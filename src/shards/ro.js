@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":1,"positions":[240],"strings":{"id":["ro-bh"],"name":["Bucharest"],"type":["city"],"parent":["ro"],"flag":["🇷🇴"]},"columns":{"population":[2000000.0],"gdp":[72000.0],"gdpPerCapita":[36542.0],"area":[null],"urbanization":[100.0],"gini":[35.5],"hdi":[0.868],"internetPenetration":[90.0],"lifeExpectancy":[78.0],"co2PerCapita":[3.8],"universityCount":[18.0],"literacyRate":[99.0],"pisaScore":[null],"doctorsPer1000":[3.5],"hospitalBeds":[7.0],"healthExpenditure":[6.5],"manufacturingPct":[12.5],"exports":[null],"fdiInflow":[null],"forestCoverage":[18.0],"airQualityPM25":[18.2],"renewableEnergy":[15.0],"unemployment":[3.5],"inflation":[10.2],"rdExpenditure":[1.5],"militarySpending":[null],"populationDensity":[8250.0],"medianAge":[38.5],"birthRate":[9.8],"deathRate":[10.5]}}');
@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":2,"positions":[222,223],"strings":{"id":["ru-ms","ru-sp"],"name":["Moscow","St Petersburg"],"type":["city","city"],"parent":["ru","ru"],"flag":["🇷🇺","🇷🇺"]},"columns":{"population":[13000000.0,5000000.0],"gdp":[480000.0,120000.0],"gdpPerCapita":[36842.0,23518.0],"area":[3000.0,1000.0],"urbanization":[99.0,100.0],"gini":[38.5,35.2],"hdi":[0.892,0.878],"internetPenetration":[95.0,92.0],"lifeExpectancy":[77.5,76.8],"co2PerCapita":[5.2,5.8],"universityCount":[125.0,82.0],"literacyRate":[100.0,100.0],"pisaScore":[null,null],"doctorsPer1000":[5.5,5.2],"hospitalBeds":[8.5,8.2],"healthExpenditure":[8.2,7.8],"manufacturingPct":[8.5,12.8],"exports":[null,null],"fdiInflow":[null,null],"forestCoverage":[54.0,52.5],"airQualityPM25":[12.5,14.2],"renewableEnergy":[8.0,5.0],"unemployment":[1.5,2.2],"inflation":[5.5,5.5],"rdExpenditure":[2.5,2.2],"militarySpending":[null,null],"populationDensity":[4333.0,3991.0],"medianAge":[40.5,40.2],"birthRate":[10.5,10.2],"deathRate":[10.2,12.5]}}');
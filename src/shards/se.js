@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":1,"positions":[220],"strings":{"id":["se-st"],"name":["Stockholm Region"],"type":["city"],"parent":["se"],"flag":["🇸🇪"]},"columns":{"population":[3000000.0],"gdp":[180000.0],"gdpPerCapita":[68542.0],"area":[7000.0],"urbanization":[96.0],"gini":[30.5],"hdi":[0.955],"internetPenetration":[98.0],"lifeExpectancy":[83.5],"co2PerCapita":[3.2],"universityCount":[12.0],"literacyRate":[99.0],"pisaScore":[null],"doctorsPer1000":[4.5],"hospitalBeds":[2.2],"healthExpenditure":[11.8],"manufacturingPct":[6.5],"exports":[48000.0],"fdiInflow":[12000.0],"forestCoverage":[72.5],"airQualityPM25":[6.8],"renewableEnergy":[55.0],"unemployment":[5.5],"inflation":[5.8],"rdExpenditure":[4.5],"militarySpending":[null],"populationDensity":[371.0],"medianAge":[39.5],"birthRate":[11.5],"deathRate":[7.8]}}');
@@ -0,0 +1,2 @@
+// Generated by pipeline/build_regions.py from RAW in data.js. Do not edit.
+export default JSON.parse('{"count":50,"positions":[104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153],"strings":{"id":["us-al","us-ak","us-az","us-ar","us-ca","us-co","us-ct","us-de","us-fl","us-ga","us-hi","us-id","us-il","us-in","us-ia","us-ks","us-ky","us-la","us-me","us-md","us-ma","us-mi","us-mn","us-ms","us-mo","us-mt","us-ne","us-nv","us-nh","us-nj","us-nm","us-ny","us-nc","us-nd","us-oh","us-ok","us-or","us-pa","us-ri","us-sc","us-sd","us-tn","us-tx","us-ut","us-vt","us-va","us-wa","us-wv","us-wi","us-wy"],"name":["Alabama","Alaska","Arizona","Arkansas","California","Colorado","Connecticut","Delaware","Florida","Georgia US","Hawaii","Idaho","Illinois","Indiana","Iowa","Kansas","Kentucky","Louisiana","Maine","Maryland","Massachusetts","Michigan","Minnesota","Mississippi","Missouri","Montana","Nebraska","Nevada","New Hampshire","New Jersey","New Mexico","New York","North Carolina","North Dakota","Ohio","Oklahoma","Oregon","Pennsylvania","Rhode Island","South Carolina","South Dakota","Tennessee","Texas","Utah","Vermont","Virginia","Washington","West Virginia","Wisconsin","Wyoming"],"type":["state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state","state"],"parent":["us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us","us"],"flag":["🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸","🇺🇸"]},"columns":{"population":[5000000.0,1000000.0,7000000.0,3000000.0,39000000.0,6000000.0,4000000.0,1000000.0,23000000.0,11000000.0,1000000.0,2000000.0,13000000.0,7000000.0,3000000.0,3000000.0,5000000.0,5000000.0,1000000.0,6000000.0,7000000.0,10000000.0,6000000.0,3000000.0,6000000.0,1000000.0,2000000.0,3000000.0,1000000.0,9000000.0,2000000.0,20000000.0,11000000.0,1000000.0,12000000.0,4000000.0,4000000.0,13000000.0,1000000.0,5000000.0,1000000.0,7000000.0,31000000.0,3000000.0,1000000.0,9000000.0,8000000.0,2000000.0,6000000.0,1000000.0],"gdp":[280000.0,58000.0,450000.0,158000.0,3900000.0,480000.0,320000.0,85000.0,1550000.0,760000.0,98000.0,110000.0,1050000.0,450000.0,220000.0,195000.0,250000.0,280000.0,85000.0,470000.0,680000.0,620000.0,440000.0,128000.0,380000.0,65000.0,155000.0,210000.0,105000.0,720000.0,115000.0,2100000.0,700000.0,68000.0,780000.0,220000.0,290000.0,920000.0,70000.0,290000.0,68000.0,450000.0,2200000.0,240000.0,38000.0,660000.0,750000.0,88000.0,400000.0,42000.0],"gdpPerCapita":[54820.0,79110.0,60553.0,51505.0,100084.0,81665.0,88463.0,82370.0,68564.0,68909.0,68049.0,55994.0,83672.0,65578.0,68601.0,66316.0,55239.0,61216.0,60902.0,76052.0,97124.0,61773.0,76663.0,43536.0,61327.0,57387.0,78344.0,65738.0,74890.0,77504.0,54403.0,107266.0,64608.0,86740.0,66178.0,54267.0,68521.0,70993.0,63871.0,53967.0,73967.0,63147.0,72121.0,70224.0,58687.0,76013.0,95997.0,49715.0,67670.0,71909.0],"area":[136000.0,1723000.0,295000.0,138000.0,424000.0,270000.0,14000.0,6000.0,170000.0,154000.0,28000.0,216000.0,150000.0,94000.0,146000.0,213000.0,105000.0,136000.0,92000.0,32000.0,27000.0,250000.0,225000.0,125000.0,181000.0,381000.0,200000.0,286000.0,24000.0,23000.0,315000.0,141000.0,139000.0,183000.0,116000.0,181000.0,255000.0,119000.0,4000.0,83000.0,200000.0,109000.0,696000.0,220000.0,25000.0,111000.0,185000.0,63000.0,170000.0,253000.0],"urbanization":[59.0,66.0,90.0,57.0,95.0,87.0,88.0,84.0,92.0,76.0,92.0,71.0,88.0,72.0,64.0,74.0,57.0,73.0,39.0,87.0,92.0,75.0,74.0,50.0,70.0,56.0,74.0,94.0,60.0,95.0,78.0,88.0,66.0,60.0,78.0,66.0,81.0,80.0,91.0,67.0,57.0,67.0,85.0,91.0,39.0,76.0,84.0,49.0,71.0,65.0],"gini":[40.1,38.2,41.2,40.5,42.6,39.8,43.5,40.8,41.0,41.8,39.2,38.5,41.2,38.8,36.8,38.5,40.2,42.5,38.5,40.8,42.0,39.5,37.8,41.8,39.8,38.2,37.5,40.8,38.5,41.5,41.8,44.8,40.2,36.2,39.2,40.8,39.5,39.5,40.2,40.8,37.2,40.5,41.5,38.2,38.8,40.2,39.8,40.8,37.8,38.5],"hdi":[0.871,0.908,0.912,0.868,0.945,0.938,0.942,0.918,0.92,0.908,0.935,0.908,0.93,0.905,0.915,0.912,0.878,0.872,0.908,0.932,0.955,0.908,0.935,0.858,0.905,0.912,0.918,0.905,0.932,0.938,0.882,0.94,0.912,0.918,0.91,0.882,0.925,0.925,0.918,0.888,0.912,0.898,0.915,0.928,0.922,0.928,0.938,0.865,0.918,0.908],"internetPenetration":[85.0,88.0,90.0,82.0,94.0,93.0,94.0,91.0,91.0,87.0,93.0,88.0,91.0,87.0,88.0,88.0,84.0,83.0,88.0,92.0,95.0,88.0,92.0,80.0,87.0,88.0,89.0,90.0,93.0,93.0,85.0,93.0,88.0,88.0,88.0,85.0,91.0,89.0,92.0,85.0,87.0,86.0,90.0,92.0,90.0,91.0,94.0,82.0,89.0,87.0],"lifeExpectancy":[75.4,78.8,78.5,75.8,79.0,80.5,80.8,78.4,79.7,77.1,82.3,79.5,78.5,77.0,79.1,78.2,75.5,74.8,79.2,78.8,80.4,77.8,80.8,74.5,77.2,78.8,79.5,78.2,79.8,80.5,77.5,80.7,78.0,79.8,76.5,76.1,79.8,77.6,79.5,76.8,79.2,76.3,78.5,79.8,80.2,79.2,79.5,74.8,79.5,78.8],"co2PerCapita":[13.2,42.5,10.8,14.5,9.2,12.8,8.5,12.1,10.8,12.8,8.2,9.8,13.5,17.2,15.8,14.2,18.5,22.8,10.2,8.8,8.9,12.5,12.8,11.8,14.5,18.5,16.8,11.2,9.8,9.2,14.8,8.1,11.5,48.5,15.1,18.2,8.5,14.2,8.2,11.8,14.8,13.2,22.5,13.5,8.8,10.5,10.2,25.8,12.8,68.5],"universityCount":[89.0,8.0,88.0,54.0,482.0,82.0,48.0,11.0,228.0,142.0,20.0,28.0,215.0,108.0,65.0,56.0,76.0,82.0,32.0,62.0,124.0,125.0,108.0,52.0,142.0,24.0,42.0,32.0,28.0,82.0,42.0,312.0,142.0,22.0,225.0,65.0,62.0,282.0,14.0,72.0,24.0,118.0,268.0,38.0,24.0,125.0,82.0,48.0,82.0,9.0],"literacyRate":[87.0,93.0,88.0,86.0,92.0,93.0,93.0,91.0,89.0,87.0,93.0,91.0,90.0,89.0,92.0,91.0,87.0,86.0,92.0,91.0,93.0,90.0,93.0,84.0,89.0,93.0,92.0,87.0,93.0,91.0,86.0,91.0,88.0,93.0,89.0,87.0,92.0,90.0,90.0,87.0,92.0,87.0,88.0,93.0,93.0,91.0,93.0,86.0,92.0,93.0],"pisaScore":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null],"doctorsPer1000":[2.4,2.5,2.6,2.2,2.8,2.8,3.5,2.8,2.8,2.4,2.8,2.2,2.8,2.4,2.2,2.4,2.5,2.6,2.8,3.5,4.2,2.8,3.2,2.0,2.6,2.5,2.5,2.2,3.0,3.2,2.5,3.8,2.6,2.8,2.8,2.2,2.8,3.2,3.2,2.5,2.5,2.6,2.4,2.4,3.2,2.8,3.0,2.5,2.8,2.2],"hospitalBeds":[3.2,2.0,2.0,2.8,1.9,2.0,2.2,2.5,2.6,2.5,2.2,1.8,2.6,2.8,3.0,3.2,3.2,3.5,2.5,1.9,2.5,2.5,2.8,3.5,3.2,3.2,3.5,2.2,2.2,2.5,2.0,2.8,2.2,3.8,2.8,2.8,1.8,2.8,2.2,2.5,3.5,2.8,2.2,1.8,2.0,2.2,1.8,3.5,2.5,3.2],"healthExpenditure":[15.5,18.5,14.8,15.2,16.2,14.5,17.5,16.8,15.5,14.8,16.5,14.2,15.8,15.2,15.2,14.8,15.8,16.2,16.5,15.8,17.8,15.8,15.2,15.5,15.5,15.2,14.8,14.5,15.5,16.5,15.2,18.2,15.2,14.8,15.8,15.2,15.5,16.2,16.5,15.2,14.5,15.5,14.5,13.8,17.2,15.2,14.8,16.5,15.2,15.2],"manufacturingPct":[15.2,2.8,8.5,14.2,10.8,6.2,9.8,5.5,4.5,9.8,1.5,11.2,11.5,25.8,17.2,14.5,17.2,12.8,9.2,4.2,8.2,17.5,11.8,15.8,11.2,4.5,11.2,5.2,10.2,6.8,5.8,4.2,18.5,7.2,16.2,8.5,18.8,10.8,8.2,16.8,9.8,14.8,13.8,10.5,10.2,7.8,11.2,8.5,17.8,4.8],"exports":[22000.0,5000.0,24000.0,7000.0,175000.0,10000.0,18000.0,7000.0,68000.0,42000.0,1000.0,6000.0,68000.0,42000.0,15000.0,12000.0,32000.0,62000.0,3000.0,12000.0,32000.0,58000.0,25000.0,12000.0,15000.0,2000.0,9000.0,9000.0,5000.0,42000.0,4000.0,85000.0,35000.0,6000.0,58000.0,7000.0,25000.0,42000.0,3000.0,35000.0,2000.0,35000.0,375000.0,15000.0,3000.0,22000.0,78000.0,6000.0,25000.0,2000.0],"fdiInflow":[4000.0,1000.0,6000.0,2000.0,85000.0,9000.0,12000.0,18000.0,25000.0,9000.0,1000.0,3000.0,15000.0,9000.0,4000.0,3000.0,6000.0,6000.0,1000.0,9000.0,18000.0,12000.0,9000.0,2000.0,6000.0,1000.0,2000.0,6000.0,2000.0,25000.0,1000.0,55000.0,12000.0,1000.0,15000.0,3000.0,6000.0,18000.0,1000.0,6000.0,1000.0,9000.0,42000.0,6000.0,1000.0,12000.0,15000.0,2000.0,6000.0,1000.0],"forestCoverage":[67.0,35.0,27.5,56.0,33.0,37.0,57.5,30.0,48.0,65.0,42.0,40.5,14.5,21.0,8.5,4.8,50.0,52.0,89.0,40.0,62.0,55.0,34.0,65.0,34.0,27.0,3.5,16.0,84.0,41.0,23.0,63.0,60.0,1.8,31.0,24.0,48.0,59.0,54.0,67.0,4.0,52.0,38.0,34.0,76.0,63.0,52.0,79.0,46.0,18.0],"airQualityPM25":[8.8,5.5,10.2,9.2,12.5,7.5,7.2,8.5,7.5,9.2,5.8,8.5,9.5,10.5,8.2,8.5,10.2,9.5,5.5,8.8,7.2,8.5,7.2,9.2,9.5,7.2,7.5,9.5,5.8,8.8,6.5,7.5,8.5,6.5,10.2,9.2,7.2,9.2,7.5,8.8,6.2,9.5,9.8,9.5,5.5,8.2,8.2,9.2,7.8,5.8],"renewableEnergy":[8.0,32.0,15.0,8.5,36.0,28.0,5.0,5.0,5.0,12.0,32.0,78.0,12.0,8.0,55.0,42.0,8.0,5.0,75.0,12.0,12.0,12.0,28.0,5.0,8.0,45.0,22.0,28.0,22.0,8.0,28.0,28.0,12.0,35.0,5.0,38.0,68.0,5.0,12.0,5.0,32.0,12.0,28.0,15.0,100.0,12.0,75.0,5.0,12.0,18.0],"unemployment":[3.0,5.8,3.8,3.2,4.5,3.0,4.2,4.5,3.0,3.2,3.2,2.8,4.5,3.2,2.5,2.8,4.0,4.5,3.5,3.5,3.5,4.2,2.8,3.8,2.8,2.5,2.0,5.2,2.2,4.0,5.5,4.2,3.5,2.0,4.0,3.0,3.8,4.2,3.8,3.2,2.0,3.2,3.8,2.2,2.5,2.8,3.8,5.2,2.8,3.2],"inflation":[3.5,2.5,3.2,3.5,3.5,3.0,3.2,3.5,3.2,3.5,3.0,3.0,3.5,3.2,3.0,3.2,3.5,3.8,3.0,3.2,3.2,3.5,3.0,3.8,3.5,3.0,3.0,3.5,3.0,3.2,3.5,3.5,3.2,2.8,3.5,3.5,3.2,3.5,3.2,3.5,2.8,3.5,3.5,3.0,3.0,3.2,3.2,3.8,3.0,3.0],"rdExpenditure":[0.9,0.5,0.8,0.7,4.8,2.5,2.8,0.5,1.2,1.5,0.8,0.8,2.2,1.2,1.5,1.5,0.8,0.5,0.5,2.8,4.5,2.0,2.2,0.5,1.2,0.5,1.2,0.5,1.2,2.2,1.5,2.5,1.5,0.8,1.8,0.8,2.0,2.2,1.2,0.8,0.5,1.0,1.5,1.5,0.5,2.5,3.5,0.5,1.8,0.3],"militarySpending":[0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5],"populationDensity":[37.0,null,24.0,22.0,92.0,22.0,286.0,167.0,135.0,71.0,36.0,9.0,87.0,74.0,21.0,14.0,48.0,37.0,11.0,188.0,259.0,40.0,27.0,24.0,33.0,3.0,10.0,10.0,42.0,391.0,6.0,142.0,79.0,4.0,103.0,22.0,16.0,109.0,250.0,60.0,5.0,64.0,45.0,14.0,26.0,81.0,43.0,29.0,35.0,2.0],"medianAge":[39.8,34.5,37.5,38.5,37.0,36.8,41.0,41.2,42.5,37.2,40.2,36.5,38.5,38.0,38.2,37.2,39.5,37.2,44.8,39.2,39.8,39.8,38.2,37.5,39.2,39.8,36.5,38.2,43.2,40.0,38.5,39.0,39.0,35.2,39.5,36.5,39.5,40.8,40.2,39.5,37.2,39.0,35.0,31.2,43.5,38.5,38.2,42.8,39.5,38.2],"birthRate":[11.5,12.8,11.2,11.8,11.2,10.8,9.5,10.8,10.2,11.5,11.2,12.5,11.0,11.5,11.8,12.0,11.2,12.5,8.5,10.8,9.8,10.8,11.2,12.2,11.5,10.5,12.5,11.2,8.8,10.2,11.5,10.5,11.2,12.5,11.0,12.2,10.5,10.5,9.8,11.2,12.2,11.5,12.5,14.5,8.2,10.8,10.8,9.2,10.8,11.2],"deathRate":[11.2,6.5,8.2,10.8,7.5,7.2,9.2,9.5,10.5,8.5,8.5,7.8,9.5,10.2,9.5,9.2,11.5,10.5,11.5,8.5,8.8,10.5,8.2,11.2,10.5,9.2,8.8,8.5,9.5,8.8,8.5,8.2,9.2,8.5,11.2,10.5,9.2,10.8,9.8,10.2,8.5,10.8,7.2,5.8,10.2,8.2,7.8,14.2,9.5,9.2]}}');
@@ -1,8 +1,23 @@
+import { execFileSync } from 'node:child_process'
 import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
 
+// Regenerate regions.js, the shards and the match modules when data.js
+// changes under the dev server (npm's predev/prebuild cover the rest)
+function regionData() {
+  return {
+    name: 'region-data',
+    apply: 'serve',
+    handleHotUpdate({ file }) {
+      if (file.endsWith('/src/data.js')) {
+        execFileSync('npm', ['run', '--silent', 'data'], { stdio: 'inherit' })
+      }
+    },
+  }
+}
+
 export default defineConfig({
-  plugins: [react()],
+  plugins: [react(), regionData()],
   base: '/apples-to-apples/', // Change this to your repo name
   build: {
     outDir: 'dist',